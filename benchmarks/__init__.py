@@ -0,0 +1,31 @@
+#
+# Copyright (c) 2024, NewAE Technology Inc
+# All rights reserved.
+#
+#    This file is part of chipwhisperer.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+# ==========================================================================
+"""Host-side performance benchmarks for chipwhisperer.
+
+Every benchmark runs against :class:`NAEUSB_SimBackend`, so no hardware is needed
+and results only reflect host-side cost (Python overhead, copies, transforms). The
+simulated link can be given a latency/bandwidth to estimate USB time as well.
+
+Run from the repository root::
+
+    python -m benchmarks                        # run everything, print a table
+    python -m benchmarks -o results.json        # save results
+    python -m benchmarks --baseline results.json --fail-on-regression
+    python -m benchmarks -k naeusb.cmdReadMem   # only matching benchmarks
+"""
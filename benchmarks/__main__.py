@@ -0,0 +1,82 @@
+#
+# Copyright (c) 2024, NewAE Technology Inc
+# All rights reserved.
+#
+#    This file is part of chipwhisperer.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+# ==========================================================================
+import argparse
+import sys
+
+from . import harness
+from . import bench_naeusb, bench_targets, bench_algorithms # registers benchmarks
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks",
+                                     description="Run chipwhisperer host-side benchmarks against a simulated device")
+    parser.add_argument('-k', dest='patterns', action='append', metavar='PATTERN',
+                        help="only run benchmarks matching PATTERN (glob or substring), may be repeated")
+    parser.add_argument('-o', '--output', help="save results as JSON to this file")
+    parser.add_argument('--baseline', help="JSON results to compare against")
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help="relative slowdown counted as a regression (default 0.10)")
+    parser.add_argument('--fail-on-regression', action='store_true',
+                        help="exit with status 1 if any benchmark regressed against the baseline")
+    parser.add_argument('--repeat', type=int, default=5, help="timing samples per benchmark (default 5)")
+    parser.add_argument('--min-time', type=float, default=0.1,
+                        help="minimum time in seconds for each timing sample (default 0.1)")
+    parser.add_argument('--slow', action='store_true', help="also run benchmarks marked slow")
+    parser.add_argument('--latency', type=float, default=0.0,
+                        help="simulated USB latency per transfer in seconds (default 0)")
+    parser.add_argument('--bandwidth', type=float, default=None,
+                        help="simulated USB bandwidth in bytes/s (default unlimited)")
+    parser.add_argument('--list', action='store_true', help="list benchmarks and exit")
+    args = parser.parse_args(argv)
+
+    harness.SIM_LINK['latency'] = args.latency
+    harness.SIM_LINK['bandwidth'] = args.bandwidth
+
+    selected = harness.select(args.patterns, include_slow=args.slow)
+    if args.list:
+        for bench in selected:
+            print(bench.name + (" (slow)" if bench.slow else ""))
+        return 0
+    if not selected:
+        print("No benchmarks selected", file=sys.stderr)
+        return 1
+
+    results = {}
+    for bench in selected:
+        sys.stderr.write("{} ... ".format(bench.name))
+        sys.stderr.flush()
+        results[bench.name] = harness.run_one(bench, repeat=args.repeat, min_time=args.min_time)
+        sys.stderr.write(harness.format_time(results[bench.name]['median']) + "\n")
+
+    harness.print_results(results)
+    if args.output:
+        harness.save(args.output, results)
+
+    if args.baseline:
+        baseline = harness.load(args.baseline)
+        # only compare what was actually run this time
+        baseline = {k: v for k, v in baseline.items() if k in results}
+        rows = harness.compare(baseline, results, args.threshold)
+        print()
+        harness.print_comparison(rows)
+        if args.fail_on_regression and any(r[4] == 'regression' for r in rows):
+            return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,81 @@
+#
+# Copyright (c) 2024, NewAE Technology Inc
+# All rights reserved.
+#
+#    This file is part of chipwhisperer.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+# ==========================================================================
+"""Pure host-side computations: PLL divider search, XMODEM CRC, firmware store access,
+CW-Pro stream decoding."""
+from .harness import benchmark, sim_naeusb
+
+# 33.3333MHz has no exact solution
+@benchmark("algorithms.pll.calcMulDiv", freq=[10e6, 7.3728e6, 33.3333e6])
+def pll_calc_mul_div(freq):
+    from chipwhisperer.hardware.naeusb.pll_cdce906 import PLLCDCE906
+    pll = PLLCDCE906(None, 12e6)
+    return lambda: pll.calcMulDiv(freq, 12e6)
+
+@benchmark("algorithms.pll.outfreq_set")
+def pll_outfreq_set():
+    from chipwhisperer.hardware.naeusb.pll_cdce906 import PLLCDCE906
+    usb, sim = sim_naeusb(pid=0xC305)
+    pll = PLLCDCE906(usb, 12e6)
+    return (lambda: pll.pll_outfreq_set(10e6, 1)), sim
+
+@benchmark("algorithms.pll.sweep", planned=[False, True])
+def pll_sweep(planned):
+    from chipwhisperer.hardware.naeusb.pll_cdce906 import PLLCDCE906
+    usb, sim = sim_naeusb(pid=0xC305)
+    pll = PLLCDCE906(usb, 12e6)
+    freqs = range(int(5E6), int(50E6), int(1E6))
+    if planned:
+        sweep = pll.plan_sweep(freqs, 1, cache=None)
+        def run():
+            for _ in sweep:
+                pass
+    else:
+        def run():
+            for freq in freqs:
+                pll.pll_outfreq_set(freq, 1)
+    return run, sim
+
+@benchmark("algorithms.xmodem.crc16", size=[128])
+def xmodem_crc16(size):
+    from chipwhisperer.hardware.naeusb.bootloader_sam3u import XModem
+    xm = XModem()
+    data = bytes(range(size))
+    return lambda: xm.crc16Calc(data)
+
+@benchmark("algorithms.firmware.getsome", hw=["cw305", "cwlite"])
+def firmware_getsome(hw):
+    from chipwhisperer.hardware.firmware.open_fw import getsome_generator
+    name = {"cw305": "SAM3U_CW305.bin", "cwlite": "cwlite_firmware.zip"}[hw]
+    getsome = getsome_generator(hw)
+    return lambda: getsome(name).read()
+
+@benchmark("algorithms.stream.decode_pro", samples=[1 << 20], chunk=[0, 1 << 16])
+def stream_decode_pro(samples, chunk):
+    import numpy as np
+    from chipwhisperer.hardware.naeusb.stream_decode import ProStreamDecoder, encode_pro_stream
+    buf = encode_pro_stream(np.arange(samples) % 1024)
+    view = memoryview(buf)
+    def run():
+        decoder = ProStreamDecoder(samples)
+        if chunk:
+            for i in range(0, len(view), chunk):
+                decoder.feed(view[i:i+chunk])
+        else:
+            decoder.feed(view)
+    return run
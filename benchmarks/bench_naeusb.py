@@ -0,0 +1,137 @@
+#
+# Copyright (c) 2024, NewAE Technology Inc
+# All rights reserved.
+#
+#    This file is part of chipwhisperer.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+# ==========================================================================
+"""NAEUSB transport: ctrl/bulk memory access, USART and streaming."""
+from .harness import benchmark, sim_naeusb
+
+# straddle NAEUSB_CTRL_IO_THRESHOLD (48) and the 128 byte ctrl limit
+MEM_SIZES = [1, 16, 47, 48, 49, 64, 128, 1024, 65536]
+
+@benchmark("naeusb.readCtrl")
+def read_ctrl():
+    usb, sim = sim_naeusb()
+    return (lambda: usb.readCtrl(0x15, dlen=4)), sim
+
+@benchmark("naeusb.sendCtrl")
+def send_ctrl():
+    usb, sim = sim_naeusb()
+    return (lambda: usb.sendCtrl(0x30, data=[1, 0, 0])), sim
+
+@benchmark("naeusb.check_feature")
+def check_feature():
+    usb, sim = sim_naeusb()
+    return (lambda: usb.check_feature("TX_IN_WAITING")), sim
+
+@benchmark("naeusb.cmdReadMem", size=MEM_SIZES)
+def read_mem(size):
+    usb, sim = sim_naeusb()
+    return (lambda: usb.cmdReadMem(0, size)), sim
+
+@benchmark("naeusb.cmdReadMemInto", size=MEM_SIZES)
+def read_mem_into(size):
+    usb, sim = sim_naeusb()
+    buf = bytearray(size)
+    return (lambda: usb.cmdReadMemInto(0, buf)), sim
+
+@benchmark("naeusb.cmdWriteMem", size=MEM_SIZES)
+def write_mem(size):
+    usb, sim = sim_naeusb()
+    data = bytearray(range(256)) * (size // 256 + 1)
+    data = data[:size]
+    return (lambda: usb.cmdWriteMem(0, data)), sim
+
+@benchmark("naeusb.write_many", writes=[2, 64], batched=[False, True])
+def write_many(writes, batched):
+    usb, sim = sim_naeusb()
+    regs = [(i * 4, [i & 0xFF, 0, 0, 0]) for i in range(writes)]
+    if batched:
+        return (lambda: usb.write_many(regs)), sim
+    def run():
+        for addr, data in regs:
+            usb.cmdWriteMem(addr, data)
+    return run, sim
+
+@benchmark("naeusb.sendCtrl.chain", writes=[4, 32], pipelined=[False, True])
+def send_ctrl_chain(writes, pipelined):
+    from contextlib import nullcontext
+    usb, sim = sim_naeusb()
+    def run():
+        with usb.pipelined() if pipelined else nullcontext():
+            for i in range(writes):
+                usb.sendCtrl(0x29, 0x00, [i & 0xFF])
+    return run, sim
+
+@benchmark("naeusb.usart.write", size=[16, 128, 1024])
+def usart_write(size):
+    from chipwhisperer.hardware.naeusb.serial import USART
+    usb, sim = sim_naeusb(pid=0xACE2, usart_handler=lambda num, data: None)
+    usart = USART(usb)
+    usart.init()
+    data = bytearray(size)
+    return (lambda: usart.write(data)), sim
+
+@benchmark("naeusb.usart.read", size=[16, 128])
+def usart_read(size):
+    from chipwhisperer.hardware.naeusb.serial import USART
+    usb, sim = sim_naeusb(pid=0xACE2)
+    usart = USART(usb)
+    usart.init()
+    data = bytes(size)
+    def run():
+        sim.usart_rx.setdefault(0, bytearray())[:] = data
+        usart.read(size)
+    return run, sim
+
+@benchmark("naeusb.usart.readinto", size=[16, 128])
+def usart_readinto(size):
+    from chipwhisperer.hardware.naeusb.serial import USART
+    usb, sim = sim_naeusb(pid=0xACE2)
+    usart = USART(usb)
+    usart.init()
+    data = bytes(size)
+    buf = bytearray(size)
+    def run():
+        sim.usart_rx.setdefault(0, bytearray())[:] = data
+        usart.readinto(buf)
+    return run, sim
+
+@benchmark("naeusb.stream.husky", size=[1 << 16, 1 << 20], direct=[False, True])
+def stream_husky(size, direct):
+    usb, sim = sim_naeusb(pid=0xACE5)
+    buf = bytearray(size)
+    def run():
+        usb.initStreamModeCapture(size, buf, is_husky=True, segment_size=1 << 16, direct=direct)
+        usb.cmdReadStream(is_husky=True)
+    return run, sim
+
+@benchmark("naeusb.stream.chunks", size=[1 << 20])
+def stream_chunks(size):
+    usb, sim = sim_naeusb(pid=0xACE5)
+    def run():
+        for _ in usb.stream_chunks(size, chunk_size=1 << 16):
+            pass
+    return run, sim
+
+@benchmark("naeusb.stream.pro", samples=[1 << 16, 1 << 20])
+def stream_pro(samples):
+    usb, sim = sim_naeusb(pid=0xACE3)
+    buf = bytearray(usb.cmdReadStream_bufferSize(samples))
+    def run():
+        usb.initStreamModeCapture(samples, buf)
+        usb.cmdReadStream()
+    return run, sim
@@ -0,0 +1,173 @@
+#
+# Copyright (c) 2024, NewAE Technology Inc
+# All rights reserved.
+#
+#    This file is part of chipwhisperer.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+# ==========================================================================
+"""Target-level paths: SimpleSerial2 round trips, FPGA bitstream download, CW305 batches."""
+import atexit
+import io
+import os
+import shutil
+import tempfile
+
+from .harness import benchmark, sim_naeusb, SIM_LINK
+
+def _crc(buf):
+    crc = 0
+    for b in buf:
+        crc ^= b
+        for _ in range(8):
+            crc = ((crc << 1) ^ 0x4D) & 0xFF if crc & 0x80 else (crc << 1) & 0xFF
+    return crc
+
+def _cobs_decode(frame):
+    frame = bytearray(frame)
+    n = frame[0]
+    frame[0] = 0
+    while n < len(frame) - 1:
+        step = frame[n]
+        frame[n] = 0
+        n += step
+    return frame
+
+def _cobs_encode(packet):
+    packet = bytearray(packet)
+    last = 0
+    for i in range(1, len(packet)):
+        if packet[i] == 0:
+            packet[last] = i - last
+            last = i
+    return packet
+
+def ss2_packet(cmd, data):
+    packet = bytearray([0, cmd, len(data)]) + bytearray(data)
+    packet += bytearray([_crc(packet[1:]), 0])
+    return _cobs_encode(packet)
+
+class SS2Responder:
+    """usart_handler that answers every SimpleSerial2 command with a 16 byte 'r'
+    response and an 'e' ack, like simpleserial-aes does.
+    """
+    def __init__(self):
+        self._buf = bytearray()
+
+    def __call__(self, num, data):
+        self._buf += data
+        resp = bytearray()
+        while True:
+            # frames are 0x00 terminated, and the first byte of a frame is never 0
+            while self._buf[:1] == b'\x00':
+                del self._buf[0]
+            end = self._buf.find(0)
+            if end < 0:
+                return resp
+            frame = _cobs_decode(self._buf[:end+1])
+            del self._buf[:end+1]
+            if len(frame) < 5:
+                continue
+            resp += ss2_packet(ord('r'), bytes(16))
+            resp += ss2_packet(ord('e'), [0])
+
+class _SimScope:
+    """Just enough of a scope for SimpleSerial_ChipWhispererLite.con()"""
+    def __init__(self, usb):
+        from chipwhisperer.hardware.naeusb.serial import USART
+        self._usart = USART(usb)
+
+    def _get_usart(self):
+        return self._usart
+
+@benchmark("targets.ss2.round_trip")
+def ss2_round_trip():
+    from chipwhisperer.capture.targets.SimpleSerial2 import SimpleSerial2
+    usb, sim = sim_naeusb(pid=0xACE2, usart_handler=SS2Responder())
+    target = SimpleSerial2()
+    target.con(_SimScope(usb))
+    pt = bytearray(range(16))
+    def run():
+        target.simpleserial_write('p', pt)
+        target.simpleserial_read('r', 16)
+    return run, sim
+
+@benchmark("targets.ss2.calc_crc")
+def ss2_calc_crc():
+    from chipwhisperer.capture.targets.SimpleSerial2 import SimpleSerial2
+    buf = bytearray(range(1, 20))
+    return lambda: SimpleSerial2._calc_crc(buf)
+
+@benchmark("targets.ss2.cobs")
+def ss2_cobs():
+    from chipwhisperer.capture.targets.SimpleSerial2 import SimpleSerial2
+    target = SimpleSerial2()
+    packet = bytearray([0, 1, 1, 16]) + bytearray(16) + bytearray([0x55, 0])
+    def run():
+        buf = target._stuff_data(bytearray(packet))
+        target._unstuff_data(buf)
+    return run
+
+def _bitstream(size=1 << 20):
+    return b'\xff' * 0x7C + os.urandom(size)
+
+@benchmark("targets.fpga.download", bitorder=[0, 1, 2])
+def fpga_download(bitorder):
+    from chipwhisperer.hardware.naeusb.fpga import FPGA
+    usb, sim = sim_naeusb()
+    # without the transformed bitstream cache, so parallel modes do the full transform
+    fpga = FPGA(usb, transform_cache=None)
+    data = _bitstream()
+    return (lambda: fpga._FPGADownloadBitstream(io.BytesIO(data), bitorder=bitorder)), sim
+
+@benchmark("targets.fpga.download_cached", bitorder=[1, 2])
+def fpga_download_cached(bitorder):
+    from chipwhisperer.hardware.naeusb.fpga import FPGA
+    from chipwhisperer.hardware.naeusb.bitstream_cache import TransformedBitstreamCache
+    cache_dir = tempfile.mkdtemp(prefix="cw_bench_bitstreams")
+    atexit.register(shutil.rmtree, cache_dir, True)
+    usb, sim = sim_naeusb()
+    fpga = FPGA(usb, transform_cache=TransformedBitstreamCache(cache_dir))
+    data = _bitstream()
+    return (lambda: fpga._FPGADownloadBitstream(io.BytesIO(data), bitorder=bitorder)), sim
+
+@benchmark("targets.fpga.program")
+def fpga_program():
+    from chipwhisperer.hardware.naeusb.fpga import FPGA
+    usb, sim = sim_naeusb()
+    fpga = FPGA(usb)
+    data = _bitstream()
+    return (lambda: fpga.FPGAProgram(io.BytesIO(data), prog_speed=20E6)), sim
+
+@benchmark("targets.cw305.batchRun", batchsize=[1024])
+def cw305_batch_run(batchsize):
+    import chipwhisperer as cw
+    from chipwhisperer.hardware.naeusb.naeusb_sim import NAEUSB_SimBackend
+    backend = NAEUSB_SimBackend(pid=0xC305, **SIM_LINK)
+    target = cw.target(None, cw.targets.CW305, slurp=False, backend=backend)
+    return (lambda: target.batchRun(batchsize, seed=0x1234)), backend.sim
+
+@benchmark("targets.cw305.load_key_and_input", batched=[False, True])
+def cw305_load_key_and_input(batched):
+    import chipwhisperer as cw
+    from chipwhisperer.hardware.naeusb.naeusb_sim import NAEUSB_SimBackend
+    backend = NAEUSB_SimBackend(pid=0xC305, **SIM_LINK)
+    target = cw.target(None, cw.targets.CW305, slurp=False, backend=backend)
+    target.REG_CRYPT_KEY, target.REG_CRYPT_TEXTIN = 0x0A, 0x06
+    key, pt = bytearray(range(16)), bytearray(range(16, 32))
+    if batched:
+        return (lambda: target.load_key_and_input(key, pt)), backend.sim
+    def run():
+        target.loadEncryptionKey(key)
+        target.loadInput(pt)
+    return run, backend.sim
@@ -0,0 +1,238 @@
+#
+# Copyright (c) 2024, NewAE Technology Inc
+# All rights reserved.
+#
+#    This file is part of chipwhisperer.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+# ==========================================================================
+"""Benchmark registry, timing loop and JSON results/baseline handling.
+
+A benchmark is a function registered with :func:`benchmark` that does its setup
+and returns the callable to time. It may instead return ``(callable, link)``
+where link is the :class:`SimLinkModel` of the simulated device, in which case
+the modelled USB time per call is reported next to the host time::
+
+    @benchmark("naeusb.cmdReadMem", size=[16, 64])
+    def readmem(size):
+        usb, link = sim_naeusb()
+        return (lambda: usb.cmdReadMem(0, size)), link
+"""
+import fnmatch
+import itertools
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+RESULTS_FORMAT_VERSION = 1
+
+BENCHMARKS = []
+
+# Link model used for every simulated device created through sim_naeusb()
+SIM_LINK = {'latency': 0.0, 'bandwidth': None}
+
+class Benchmark:
+    def __init__(self, name, func, params, slow):
+        self.name = name
+        self.func = func
+        self.params = params
+        self.slow = slow
+
+def benchmark(name, slow=False, **params):
+    """Register a benchmark. Each keyword is a list of parameter values; one case is
+    created for every combination, named e.g. ``name[size=16]``.
+    """
+    def wrap(func):
+        keys = list(params.keys())
+        for values in itertools.product(*(params[k] for k in keys)):
+            kwargs = dict(zip(keys, values))
+            if kwargs:
+                full = "{}[{}]".format(name, ",".join("{}={}".format(k, v) for k, v in kwargs.items()))
+            else:
+                full = name
+            BENCHMARKS.append(Benchmark(full, func, kwargs, slow))
+        return func
+    return wrap
+
+def sim_naeusb(pid=0xC305, **kwargs):
+    """Connected NAEUSB on a simulated device, along with that device's link model."""
+    from chipwhisperer.hardware.naeusb.naeusb import NAEUSB
+    from chipwhisperer.hardware.naeusb.naeusb_sim import NAEUSB_SimBackend
+    opts = dict(SIM_LINK)
+    opts.update(kwargs)
+    backend = NAEUSB_SimBackend(pid=pid, **opts)
+    usb = NAEUSB(backend=backend)
+    usb.con(idProduct=[pid])
+    return usb, backend.sim
+
+def select(patterns=None, include_slow=False):
+    """Registered benchmarks whose name matches any of the glob patterns
+    (or contains one as a substring).
+    """
+    selected = []
+    for bench in BENCHMARKS:
+        if bench.slow and not include_slow:
+            continue
+        if patterns and not any(fnmatch.fnmatchcase(bench.name, p) or p in bench.name for p in patterns):
+            continue
+        selected.append(bench)
+    return selected
+
+def _calibrate(fn, min_time):
+    """Number of calls needed for one timing sample to take at least min_time."""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or number >= (1 << 24):
+            return number
+        if elapsed <= 0:
+            number *= 10
+        else:
+            number = max(number + 1, int(number * min(10, 1.2 * min_time / elapsed)))
+
+def run_one(bench, repeat=5, min_time=0.1):
+    """Time one benchmark. Returns a result dict, all times in seconds per call."""
+    ret = bench.func(**bench.params)
+    link = None
+    if isinstance(ret, tuple):
+        fn, link = ret
+        link = getattr(link, 'link', link)
+    else:
+        fn = ret
+
+    if bench.slow:
+        number = 1
+        repeat = 1
+    else:
+        fn() # warm up
+        number = _calibrate(fn, min_time)
+
+    if link is not None:
+        link.reset_stats()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - start) / number)
+
+    result = {
+        'min': min(samples),
+        'median': statistics.median(samples),
+        'mean': statistics.mean(samples),
+        'stdev': statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        'number': number,
+        'repeat': repeat,
+    }
+    if link is not None:
+        calls = number * repeat
+        result['usb_time'] = link.stats['usb_time'] / calls
+        result['transfers'] = sum(v for k, v in link.stats.items() if k in
+                                  ('ctrl_out', 'ctrl_in', 'bulk_out', 'bulk_in')) / calls
+    return result
+
+def metadata():
+    """Description of the machine and tree the results were taken on."""
+    meta = {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'timestamp': time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        'sim_link': dict(SIM_LINK),
+    }
+    try:
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        meta['git'] = subprocess.check_output(['git', 'rev-parse', 'HEAD'], cwd=root,
+                                              stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        meta['git'] = None
+    try:
+        import numpy
+        meta['numpy'] = numpy.__version__
+    except ImportError:
+        meta['numpy'] = None
+    return meta
+
+def save(path, results):
+    with open(path, 'w') as f:
+        json.dump({'version': RESULTS_FORMAT_VERSION, 'metadata': metadata(), 'results': results},
+                  f, indent=2, sort_keys=True)
+
+def load(path):
+    with open(path) as f:
+        data = json.load(f)
+    if data.get('version') != RESULTS_FORMAT_VERSION:
+        raise ValueError("Unsupported results format {} in {}".format(data.get('version'), path))
+    return data['results']
+
+def compare(baseline, current, threshold=0.10, stat='median'):
+    """Compare two result dicts.
+
+    Returns:
+        List of (name, baseline time, current time, ratio, status) where status is
+        'regression', 'improvement', 'same', 'new' or 'missing'.
+    """
+    rows = []
+    for name in sorted(set(baseline) | set(current)):
+        old = baseline.get(name)
+        new = current.get(name)
+        if old is None:
+            rows.append((name, None, new[stat], None, 'new'))
+            continue
+        if new is None:
+            rows.append((name, old[stat], None, None, 'missing'))
+            continue
+        ratio = new[stat] / old[stat] if old[stat] else float('inf')
+        if ratio > 1 + threshold:
+            status = 'regression'
+        elif ratio < 1 / (1 + threshold):
+            status = 'improvement'
+        else:
+            status = 'same'
+        rows.append((name, old[stat], new[stat], ratio, status))
+    return rows
+
+def format_time(t):
+    if t is None:
+        return "-"
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if t >= scale:
+            return "{:.3f} {}".format(t / scale, unit)
+    return "{:.1f} ns".format(t / 1e-9)
+
+def print_results(results, out=None):
+    out = out or sys.stdout
+    width = max([len(n) for n in results] + [10])
+    out.write("{:<{w}}  {:>12}  {:>12}  {:>12}  {:>12}\n".format("benchmark", "median", "min", "stdev", "usb (model)", w=width))
+    for name, r in results.items():
+        out.write("{:<{w}}  {:>12}  {:>12}  {:>12}  {:>12}\n".format(
+            name, format_time(r['median']), format_time(r['min']), format_time(r['stdev']),
+            format_time(r.get('usb_time')), w=width))
+
+def print_comparison(rows, out=None):
+    out = out or sys.stdout
+    width = max([len(r[0]) for r in rows] + [10])
+    out.write("{:<{w}}  {:>12}  {:>12}  {:>8}  {}\n".format("benchmark", "baseline", "current", "ratio", "", w=width))
+    for name, old, new, ratio, status in rows:
+        out.write("{:<{w}}  {:>12}  {:>12}  {:>8}  {}\n".format(
+            name, format_time(old), format_time(new),
+            "-" if ratio is None else "{:.2f}x".format(ratio),
+            "" if status == 'same' else status.upper(), w=width))
@@ -34,6 +34,7 @@ from .SimpleSerial2 import SimpleSerial2
 from ...hardware.naeusb.naeusb import NAEUSB,packuint32
 from ...hardware.naeusb.pll_cdce906 import PLLCDCE906
 from ...hardware.naeusb.fpga import FPGA
+from ...hardware.naeusb.bitstream_cache import bitstream_sha256, default_fingerprints
 from ...hardware.naeusb.programmer_targetfpga import CW312T_XC7A35T, LatticeICE40
 from ...common.utils import util
 from ...common.utils.util import camel_case_deprecated
@@ -143,6 +144,8 @@ class CW305(TargetTemplate, ChipWhispererCommonInterface):
         self.fpga = None
         self.ss2 = None
         self.platform = None
+        self._fpga_id = None
+        self._fpga_fingerprint = None
 
         self.hw = None
         self.oa = None
@@ -305,6 +308,25 @@ class CW305(TargetTemplate, ChipWhispererCommonInterface):
             self.ss2.send_cmd(cmd=0x23, scmd=0x57, data=payload)
             self._ss2_check_status()
 
+    def fpga_write_many(self, writes):
+        """Write several addresses on the FPGA, in order.
+
+        Over USB, longer runs of writes are queued together rather than each
+        waiting for the last to finish, which is much faster for runs of
+        register writes.
+
+        Args:
+            writes (list): (addr, data) pairs, as for fpga_write()
+
+        """
+        writes = list(writes)
+        for _, data in writes:
+            if len(data) <= 0:
+                raise ValueError("Invalid data {}".format(data))
+        if self.platform in ['cw305', 'cw310', 'cw340']:
+            return self._naeusb.write_many([(addr << self.bytecount_size, data) for addr, data in writes])
+        for addr, data in writes:
+            self.fpga_write(addr, data)
 
     def fpga_read(self, addr, readlen):
         """Read from an address on the FPGA.
@@ -443,16 +465,20 @@ class CW305(TargetTemplate, ChipWhispererCommonInterface):
             raise NotImplementedError("Not supported for non CW305 boards")
         return self.fpga
 
-    def _con(self, scope=None, bsfile=None, force=False, fpga_id=None, defines_files=None, slurp=True, prog_speed=20E6, hw_location=None, sn=None, platform='cw305', version=None, program=True):
+    def _con(self, scope=None, bsfile=None, force=False, fpga_id=None, defines_files=None, slurp=True, prog_speed=20E6, hw_location=None, sn=None, platform='cw305', version=None, program=True, backend=None):
         """Connect to CW305 board, and download bitstream.
 
         If the target has already been programmed it skips reprogramming
-        unless forced.
+        unless forced. With force='if_changed', the bitstream isn't downloaded
+        again if the host's fingerprint cache shows it's the one already loaded
+        and the REG_BUILDTIME readback confirms it.
 
         Args:
             scope (ScopeTemplate): An instance of a scope object.
             bsfile (path): The path to the bitstream file to program the FPGA with.
-            force (bool): Whether or not to force reprogramming.
+            force (bool or str): If True, reprogram unconditionally. If 'if_changed',
+                reprogram unless the same bitstream is known to be loaded already, which
+                needs REG_BUILDTIME in the Verilog defines.
             fpga_id (string): '100t', '35t', or None. If bsfile is None and fpga_id specified,
                               program with AES firmware for fpga_id
             defines_files (list, optional): list of Verilog define files to parse
@@ -463,6 +489,8 @@ class CW305(TargetTemplate, ChipWhispererCommonInterface):
             version (optional): when required to differentiate from multiple possible bitfiles
                 for a particular target (to be used with fpga_id)
             program (bool, optional): for ss2 platforms, program the FPGA
+            backend (NAEUSB_Backend, optional): USB backend to use instead of libusb,
+                e.g. a NAEUSB_SimBackend for running without hardware
         """
         self.platform = platform
         if bsfile is None:
@@ -470,7 +498,7 @@ class CW305(TargetTemplate, ChipWhispererCommonInterface):
         else:
             custom_bitstream = True
         if platform == 'cw305':
-            self._naeusb = NAEUSB()
+            self._naeusb = NAEUSB(backend=backend)
             self.pll = PLLCDCE906(self._naeusb, ref_freq = 12.0E6, board="CW305")
             self.fpga = FPGA(self._naeusb)
             self._naeusb.con(idProduct=[0xC305], serial_number=sn, hw_location=hw_location)
@@ -479,6 +507,7 @@ class CW305(TargetTemplate, ChipWhispererCommonInterface):
                     raise ValueError(f"Invalid fpga {fpga_id}")
             self._fpga_id = fpga_id
             if self.fpga.isFPGAProgrammed() == False or force:
+                bsdata = None
                 if bsfile is None:
                     if not fpga_id is None:
                         from ...hardware.firmware.open_fw import getsome_generator
@@ -497,25 +526,14 @@ class CW305(TargetTemplate, ChipWhispererCommonInterface):
                             bsdata = getsome(f"Pipelined_AES_{fpga_id}_half{version}.bit")
                         else:
                             raise ValueError('Unknown target!')
-                        starttime = datetime.now()
-                        status = self.fpga.FPGAProgram(bsdata, exceptOnDoneFailure=False, prog_speed=prog_speed)
-                        stoptime = datetime.now()
-                        if status:
-                            target_logger.info('FPGA Config OK, time: %s' % str(stoptime - starttime))
-                        else:
-                            target_logger.error('FPGA Done pin failed to go high, check bitstream is for target device.')
                     else:
                         target_logger.warning("No FPGA Bitstream file specified.")
                 elif not os.path.isfile(bsfile):
                     target_logger.warning(("FPGA Bitstream not configured or '%s' not a file." % str(bsfile)))
                 else:
-                    starttime = datetime.now()
-                    status = self.fpga.FPGAProgram(open(bsfile, "rb"), exceptOnDoneFailure=False, prog_speed=prog_speed)
-                    stoptime = datetime.now()
-                    if status:
-                        target_logger.info('FPGA Config OK, time: %s' % str(stoptime - starttime))
-                    else:
-                        target_logger.warning('FPGA Done pin failed to go high, check bitstream is for target device.')
+                    bsdata = bsfile
+                if bsdata is not None:
+                    self._program_if_changed(bsdata, force, prog_speed)
 
             self.usb_clk_setenabled(True)
             self.pll.cdce906init()
@@ -592,7 +610,73 @@ class CW305(TargetTemplate, ChipWhispererCommonInterface):
             else:
                 verilog_defines = defines_files
             self.slurp_defines(verilog_defines)
+        self._check_fpga_fingerprint(prog_speed)
+
 
+    def _program_if_changed(self, bitstream, force, prog_speed, exceptOnDoneFailure=False):
+        """Program bitstream (a path or file-like object) into the FPGA.
+
+        With force='if_changed', programming is put off if the FPGA is already
+        programmed and the fingerprint cache says it holds this bitstream, with
+        a REG_BUILDTIME readback to check. _check_fpga_fingerprint() checks it
+        once the defines are known, and programs the bitstream after all unless
+        it matches.
+
+        Returns:
+            True/False for programming success, or None if skipped.
+        """
+        fingerprints = default_fingerprints()
+        sn = self._naeusb.snum
+        sha = bitstream_sha256(bitstream)
+        if force == 'if_changed' and self.fpga.isFPGAProgrammed():
+            entry = fingerprints.get(sn, self._fpga_id)
+            if entry and entry["sha256"] == sha and entry.get("buildtime") is not None:
+                target_logger.info("FPGA should already have bitstream {}, checking before reprogramming".format(sha[:16]))
+                # keep the bitstream around in case REG_BUILDTIME disagrees
+                self._fpga_fingerprint = (sha, entry["buildtime"], bitstream)
+                return None
+
+        if isinstance(bitstream, (str, os.PathLike)):
+            bitstream = open(bitstream, "rb")
+        starttime = datetime.now()
+        status = self.fpga.FPGAProgram(bitstream, exceptOnDoneFailure=exceptOnDoneFailure, prog_speed=prog_speed)
+        stoptime = datetime.now()
+        if status:
+            target_logger.info('FPGA Config OK, time: %s' % str(stoptime - starttime))
+            fingerprints.record(sn, self._fpga_id, sha)
+            self._fpga_fingerprint = (sha, None, None)
+        else:
+            target_logger.warning('FPGA Done pin failed to go high, check bitstream is for target device.')
+            fingerprints.forget(sn, self._fpga_id)
+            self._fpga_fingerprint = None
+        return status
+
+    def _check_fpga_fingerprint(self, prog_speed):
+        """Once the defines are known: record REG_BUILDTIME for a freshly programmed
+        bitstream, or, if programming was put off, program it after all unless
+        REG_BUILDTIME matches.
+        """
+        pending = self._fpga_fingerprint
+        self._fpga_fingerprint = None
+        if pending is None:
+            return
+        sha, buildtime, bitstream = pending
+        has_buildtime = getattr(self, "REG_BUILDTIME", None) is not None
+        if bitstream is not None:
+            if not has_buildtime:
+                target_logger.warning("REG_BUILDTIME unset, so the FPGA can't be checked for the cached bitstream, reprogramming")
+            elif bytes(self.fpga_read(self.REG_BUILDTIME, 4)).hex() == buildtime:
+                target_logger.info("FPGA build time matches, not reprogramming")
+                return
+            else:
+                target_logger.warning("FPGA build time doesn't match the cached bitstream fingerprint, reprogramming")
+            status = self._program_if_changed(bitstream, True, prog_speed)
+            self._fpga_fingerprint = None
+            if not status:
+                return
+        if has_buildtime:
+            readback = bytes(self.fpga_read(self.REG_BUILDTIME, 4)).hex()
+            default_fingerprints().record_buildtime(self._naeusb.snum, self._fpga_id, readback)
 
     def dis(self):
         if self._naeusb:
@@ -622,6 +706,16 @@ class CW305(TargetTemplate, ChipWhispererCommonInterface):
         text = inputtext[::-1]
         self.fpga_write(self.REG_CRYPT_TEXTIN, text)
 
+    def load_key_and_input(self, key, inputtext):
+        """Write encryption key and input to FPGA, as loadEncryptionKey() then
+        loadInput() but through fpga_write_many()."""
+        if (self.REG_CRYPT_KEY is None) or (self.REG_CRYPT_TEXTIN is None):
+            target_logger.error("target.REG_CRYPT_KEY or target.REG_CRYPT_TEXTIN unset. Have you given target a verilog defines file?")
+            return
+        self.key = key
+        self.input = inputtext
+        self.fpga_write_many([(self.REG_CRYPT_KEY, key[::-1]), (self.REG_CRYPT_TEXTIN, inputtext[::-1])])
+
     def is_done(self):
         """Check if FPGA is done."""
         if self.check_done:
@@ -861,8 +955,8 @@ class CW305(TargetTemplate, ChipWhispererCommonInterface):
         else:
             bsdata = None
             if self._fpga_id:
-                from chipwhisperer.hardware.firmware.cw305 import getsome
-                bsdata = getsome(f"SPI_flash_{self._fpga_id}.bit")
+                from ...hardware.firmware.open_fw import getsome_generator
+                bsdata = getsome_generator("cw305")(f"SPI_flash_{self._fpga_id}.bit")
             else:
                 bsdata = open(bsfile, "rb")
             starttime = datetime.now()
@@ -954,7 +1048,14 @@ class FPGASPI:
         self.readCtrl = usb.readCtrl
         self._usb = usb
         self._timeout = timeout
+        self._flash_changed = False
         
+    def _note_flash_changed(self):
+        # the FPGA loads from the flash at power up, so the fingerprint cache can't
+        # vouch for what's loaded after that any more
+        if not self._flash_changed:
+            self._flash_changed = True
+            default_fingerprints().forget_board(self._usb.snum)
         
     def enable_interface(self, enable):
         """Enable or disable the SPI interface.
@@ -992,6 +1093,14 @@ class FPGASPI:
         self.sendCtrl(self.REQ_FPGASPI_PROGRAM, 0xA4, data)
         readdata = self.readCtrl(self.REQ_FPGASPI_PROGRAM, dlen=len(data))
         return readdata
+
+    def _spi_tx(self, data):
+        # spi_tx_rx() when the data read back isn't needed: queued, so inside
+        # pipelined() it doesn't wait for the transfer
+        if len(data) > 64:
+            raise ValueError("Data is tooooooo long!")
+        self._usb.sendCtrlAsync(self.REQ_FPGASPI_PROGRAM, 0xA4, data)
+        self._usb.readCtrlAsync(self.REQ_FPGASPI_PROGRAM, dlen=len(data))
     
     def enable_write(self, enable):
         """Enable write/erase commands on the SPI chip.
@@ -999,12 +1108,13 @@ class FPGASPI:
         Args:
             enable (bool): Enable (True) or disable (False) write/erase on the SPI chip
         """
-        self.set_cs_pin(False)
-        if enable:
-            self.spi_tx_rx([self.WRITE_EN])
-        else:
-            self.spi_tx_rx([self.WRITE_DIS])
-        self.set_cs_pin(True)
+        with self._usb.pipelined():
+            self.set_cs_pin(False)
+            if enable:
+                self._spi_tx([self.WRITE_EN])
+            else:
+                self._spi_tx([self.WRITE_DIS])
+            self.set_cs_pin(True)
             
     def erase_chip(self, timeout=None):
         """Erase the whole SPI chip. Slow (~25s).
@@ -1015,10 +1125,12 @@ class FPGASPI:
         Raises:
             IOError: Erase timed out
         """
-        self.enable_write(True)
-        self.set_cs_pin(False)
-        self.spi_tx_rx([self.ERASE_CHIP])
-        self.set_cs_pin(True)
+        self._note_flash_changed()
+        with self._usb.pipelined():
+            self.enable_write(True)
+            self.set_cs_pin(False)
+            self._spi_tx([self.ERASE_CHIP])
+            self.set_cs_pin(True)
         
         self.wait_busy(timeout)
         
@@ -1061,22 +1173,24 @@ class FPGASPI:
         if len(data) > self.PAGE_SIZE:
             raise ValueError(f"Data too long {len(data)} vs {self.PAGE_SIZE}")
             
-        self.enable_write(True)
-        self.set_cs_pin(False)
-        cmd = [self.WRITE, (addr >> 16)&0xFF, (addr >> 8)&0xFF, addr & 0xFF]
-        
-        self.spi_tx_rx(cmd)
-        
-        data_len = len(data)
-        data_written = 0
-        
-        # max USB ctrl transfer 64 bytes
-        while data_len > data_written:
-            cmd = data[data_written:data_written + min(64, data_len-data_written)]
-            self.spi_tx_rx(cmd)
-            data_written += len(cmd)
-            
-        self.set_cs_pin(True)
+        self._note_flash_changed()
+        with self._usb.pipelined():
+            self.enable_write(True)
+            self.set_cs_pin(False)
+            cmd = [self.WRITE, (addr >> 16)&0xFF, (addr >> 8)&0xFF, addr & 0xFF]
+
+            self._spi_tx(cmd)
+
+            data_len = len(data)
+            data_written = 0
+
+            # max USB ctrl transfer 64 bytes
+            while data_len > data_written:
+                cmd = data[data_written:data_written + min(64, data_len-data_written)]
+                self._spi_tx(cmd)
+                data_written += len(cmd)
+
+            self.set_cs_pin(True)
         self.wait_busy(timeout)
         
     def cmd_read_mem(self, length, addr):
@@ -1181,10 +1295,12 @@ class FPGASPI:
         if size not in self.ERASE_BLOCK:
             raise ValueError(f"{size} not in available sizes {self.ERASE_BLOCK}")
             
-        self.enable_write(True)
-        self.set_cs_pin(False)
-        self.spi_tx_rx([self.ERASE_BLOCK[size], (addr >> 16)&0xFF, (addr >> 8)&0xFF, addr&0xFF])
-        self.set_cs_pin(True)
+        self._note_flash_changed()
+        with self._usb.pipelined():
+            self.enable_write(True)
+            self.set_cs_pin(False)
+            self._spi_tx([self.ERASE_BLOCK[size], (addr >> 16)&0xFF, (addr >> 8)&0xFF, addr&0xFF])
+            self.set_cs_pin(True)
         
         self.wait_busy(timeout)
 
@@ -1524,10 +1640,11 @@ class FPGAIO:
         sck = self.pin_name_to_number(sck)
         cs = self.pin_name_to_number(cs)
 
-        self.sendCtrl(self.REQ_FPGAIO_UTIL, self.REQ_IO_CONFIG, [sdo, self.CONFIG_PIN_SPI1_SDO])
-        self.sendCtrl(self.REQ_FPGAIO_UTIL, self.REQ_IO_CONFIG, [sdi, self.CONFIG_PIN_SPI1_SDI])
-        self.sendCtrl(self.REQ_FPGAIO_UTIL, self.REQ_IO_CONFIG, [sck, self.CONFIG_PIN_SPI1_SCK])
-        self.sendCtrl(self.REQ_FPGAIO_UTIL, self.REQ_IO_CONFIG, [cs, self.CONFIG_PIN_SPI1_CS])
+        with self._usb.pipelined():
+            self.sendCtrl(self.REQ_FPGAIO_UTIL, self.REQ_IO_CONFIG, [sdo, self.CONFIG_PIN_SPI1_SDO])
+            self.sendCtrl(self.REQ_FPGAIO_UTIL, self.REQ_IO_CONFIG, [sdi, self.CONFIG_PIN_SPI1_SDI])
+            self.sendCtrl(self.REQ_FPGAIO_UTIL, self.REQ_IO_CONFIG, [sck, self.CONFIG_PIN_SPI1_SCK])
+            self.sendCtrl(self.REQ_FPGAIO_UTIL, self.REQ_IO_CONFIG, [cs, self.CONFIG_PIN_SPI1_CS])
 
         
     def spi1_enable(self, enable, waitcycles=0):
@@ -68,8 +68,8 @@ class CW310(CW305):
         # maybe later can hijack cw305 stuff, but for now don't
         pass
         import chipwhisperer as cw
-        self._naeusb = NAEUSB()
-        self.pll = PLLCDCE906(self._naeusb, ref_freq = 12.0E6, board="CW310")
+        self._naeusb = None
+        self.pll = None
 
         self.hw = None
         self.oa = None
@@ -84,7 +84,9 @@ class CW310(CW305):
         self._clkusbautooff = True
         self.last_key = bytearray([0]*16)
         self.target_name = 'AES'
-        self._io = FPGAIO(self._naeusb, 200)
+        self._io = None
+        self._fpga_id = None
+        self._fpga_fingerprint = None
         self.toggle_user_led = False
         self.check_done = False
 
@@ -119,8 +121,8 @@ class CW310(CW305):
         return self.__repr__()
 
     def _getFWPy(self):
-        from ...hardware.firmware.cwbergen import fwver
-        return fwver
+        from ...hardware.firmware.open_fw import fwver
+        return fwver("cwbergen")
         
     def _get_usart(self, num=0):
         if num == 0:
@@ -133,9 +135,12 @@ class CW310(CW305):
     def _get_fpga_programmer(self):
         return self.fpga
 
-    def _con(self, scope=None, bsfile=None, force=False, fpga_id=None, defines_files=None, slurp=True, prog_speed=20E6, sn=None, hw_location=None, platform='cw310'):
+    def _con(self, scope=None, bsfile=None, force=False, fpga_id=None, defines_files=None, slurp=True, prog_speed=20E6, sn=None, hw_location=None, platform='cw310', backend=None):
         # add more stuff later
         self.platform = platform
+        self._naeusb = NAEUSB(backend=backend)
+        self.pll = PLLCDCE906(self._naeusb, ref_freq = 12.0E6, board="CW310")
+        self._io = FPGAIO(self._naeusb, 200)
         self._naeusb.con(idProduct=[0xC310], serial_number=sn, hw_location=hw_location)
         self._usart0 = USART(self._naeusb, usart_num=0)
         self._usart1 = USART(self._naeusb, usart_num=1)
@@ -156,7 +161,8 @@ class CW310(CW305):
             self.slurp_defines(verilog_defines)
 
         if bsfile and (force or not self.fpga.isFPGAProgrammed()):
-            status = self.fpga.FPGAProgram(open(bsfile, "rb"), prog_speed=prog_speed)
+            self._program_if_changed(bsfile, force, prog_speed, exceptOnDoneFailure=True)
+            self._check_fpga_fingerprint(prog_speed)
 
 
     def _xadc_drp_write(self, addr, data):
@@ -165,8 +171,8 @@ class CW310(CW305):
             addr (int): 6-bit address
             data (int): 16-bit write data
         """
-        self.fpga_write(self.REG_XADC_DRP_DATA, [data  & 0xff, data >> 8])
-        self.fpga_write(self.REG_XADC_DRP_ADDR, [addr + 0x80])
+        self.fpga_write_many([(self.REG_XADC_DRP_DATA, [data  & 0xff, data >> 8]),
+                              (self.REG_XADC_DRP_ADDR, [addr + 0x80])])
 
 
     def _xadc_drp_read(self, addr):
@@ -906,10 +912,11 @@ class FPGAIO:
         sck = self.pin_name_to_number(sck)
         cs = self.pin_name_to_number(cs)
 
-        self.sendCtrl(self.REQ_FPGAIO_UTIL, self.REQ_IO_CONFIG, [sdo, self.CONFIG_PIN_SPI1_SDO])
-        self.sendCtrl(self.REQ_FPGAIO_UTIL, self.REQ_IO_CONFIG, [sdi, self.CONFIG_PIN_SPI1_SDI])
-        self.sendCtrl(self.REQ_FPGAIO_UTIL, self.REQ_IO_CONFIG, [sck, self.CONFIG_PIN_SPI1_SCK])
-        self.sendCtrl(self.REQ_FPGAIO_UTIL, self.REQ_IO_CONFIG, [cs, self.CONFIG_PIN_SPI1_CS])
+        with self._usb.pipelined():
+            self.sendCtrl(self.REQ_FPGAIO_UTIL, self.REQ_IO_CONFIG, [sdo, self.CONFIG_PIN_SPI1_SDO])
+            self.sendCtrl(self.REQ_FPGAIO_UTIL, self.REQ_IO_CONFIG, [sdi, self.CONFIG_PIN_SPI1_SDI])
+            self.sendCtrl(self.REQ_FPGAIO_UTIL, self.REQ_IO_CONFIG, [sck, self.CONFIG_PIN_SPI1_SCK])
+            self.sendCtrl(self.REQ_FPGAIO_UTIL, self.REQ_IO_CONFIG, [cs, self.CONFIG_PIN_SPI1_CS])
 
         
     def spi1_enable(self, enable, waitcycles=0):
@@ -159,11 +159,13 @@ class SimpleSerial2(TargetTemplate):
         l = len(buf)
         ptr = 0
         last = 0
+        trace = tracing(target_logger)
         for i in range(1, l):
             if (buf[i] == self._frame_byte):
                 buf[last] = i - last
                 last = i
-                target_logger.debug("Stuffing byte {}".format(i))
+                if trace:
+                    target_logger.debug("Stuffing byte {}".format(i))
         return buf
 
     def _unstuff_data(self, buf):
@@ -177,8 +179,10 @@ class SimpleSerial2(TargetTemplate):
         buf[0] = 0
         l = len(buf) - 1
         sentinel = 0
+        trace = tracing(target_logger)
         while n < l:
-            target_logger.debug("Unstuff position {}".format(n))
+            if trace:
+                target_logger.debug("Unstuff position {}".format(n))
             tmp = buf[n]
             buf[n] = self._frame_byte
             n += tmp
@@ -499,7 +503,9 @@ class SimpleSerial2(TargetTemplate):
         else:
             recv_len = 5 + pay_len #cmd, len, data, crc
         response = self.read(recv_len, timeout=timeout)
-        target_logger.debug("1st read: {}".format(bytearray(response.encode())))
+        trace = tracing(target_logger)
+        if trace:
+            target_logger.debug("1st read: {}".format(bytearray(response.encode())))
 
         if response is None or len(response) < recv_len:
             self.flush_on_error()
@@ -513,7 +519,8 @@ class SimpleSerial2(TargetTemplate):
             self.flush_on_error()
             return None
         next_frame = self._unstuff_data(response)
-        target_logger.debug("Unstuffed first read: {}".format(next_frame))
+        if trace:
+            target_logger.debug("Unstuffed first read: {}".format(next_frame))
         if cmd and response[1] != cmd:
             target_logger.warning(f"Unexpected start to command {response[1]}")
 
@@ -521,9 +528,11 @@ class SimpleSerial2(TargetTemplate):
 
         if not pay_len:
             # user didn't specify, do second read based on sent length
-            target_logger.debug("Length not specified, reading {} bytes (plus CRC and frame byte) based on packet".format(l))
+            if trace:
+                target_logger.debug("Length not specified, reading {} bytes (plus CRC and frame byte) based on packet".format(l))
             x = self.read(l+2, timeout=timeout)
-            target_logger.debug("2nd read: {}".format(bytearray(x.encode())))
+            if trace:
+                target_logger.debug("2nd read: {}".format(bytearray(x.encode())))
             if x is None:
                 target_logger.warning("Read timed out")
                 self.flush_on_error()
@@ -540,7 +549,8 @@ class SimpleSerial2(TargetTemplate):
                 target_logger.warning(f"Unexpected frame byte in {response}")
                 self.flush_on_error()
             resp_cpy = response[next_frame:]
-            target_logger.debug("Unstuffing {}".format(resp_cpy))
+            if trace:
+                target_logger.debug("Unstuffing {}".format(resp_cpy))
             self._unstuff_data(resp_cpy)
             response[next_frame:] = resp_cpy[:]
         if pay_len and l != pay_len:
@@ -555,12 +565,13 @@ class SimpleSerial2(TargetTemplate):
         if response[-1] != self._frame_byte:
             target_logger.warning(f"Did not receive end of frame, got {response[-1]}")
 
-        target_logger.debug("Correct CRC {}".format(crc))
+        if trace:
+            target_logger.debug("Correct CRC {}".format(crc))
 
         if not flush_on_err is None:
             self._flush_on_err = tmp
 
-        target_logger.info("Received: {}".format(response))
+        target_logger.info("Received: %s", response)
 
         return response
 
@@ -603,9 +614,11 @@ class SimpleSerial2(TargetTemplate):
         buf.append(0x00)
         buf = self._stuff_data(buf)
         self.write(buf)
-        target_logger.debug("Sending: {}".format(bytearray(buf)))
-        self._unstuff_data(buf)
-        target_logger.debug("Unstuffed data: {}".format(bytearray(buf)))
+        if tracing(target_logger):
+            # buf isn't used again, so it's only unstuffed for the trace
+            target_logger.debug("Sending: {}".format(bytearray(buf)))
+            self._unstuff_data(buf)
+            target_logger.debug("Unstuffed data: {}".format(bytearray(buf)))
 
     def reset_comms(self):
         """ Try to reset communication with the target and put it in
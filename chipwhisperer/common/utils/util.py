@@ -25,11 +25,14 @@
 
 import ast
 import collections
+import json
 import os.path
+import sys
 import shutil
 import weakref
 import time
 from functools import wraps
+from contextlib import contextmanager
 import warnings
 from ...logging import *
 from typing import List, Union, Type
@@ -41,6 +44,43 @@ def getRootDir():
     return os.path.normpath(path)
 
 
+def get_cache_dir(*subdirs):
+    """Directory for chipwhisperer's persistent host-side caches, created if needed.
+
+    Uses $CW_CACHE_DIR if set, otherwise the platform's user cache directory.
+    """
+    base = os.environ.get("CW_CACHE_DIR")
+    if not base:
+        if os.name == 'nt':
+            base = os.path.join(os.environ.get("LOCALAPPDATA", os.path.expanduser("~")), "chipwhisperer", "cache")
+        elif sys.platform == 'darwin':
+            base = os.path.join(os.path.expanduser("~"), "Library", "Caches", "chipwhisperer")
+        else:
+            base = os.path.join(os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")), "chipwhisperer")
+    path = os.path.join(base, *subdirs)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def load_json(path, default=None):
+    """Load a JSON file, returning default if it's missing or unreadable"""
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return default
+
+
+def save_json_atomic(path, data):
+    """Write data as JSON to a temporary file and rename it over path, so
+    other processes never see a partially written file.
+    """
+    tmp = "{}.{}.tmp".format(path, os.getpid())
+    with open(tmp, "w") as f:
+        json.dump(data, f, indent=1, sort_keys=True)
+    os.replace(tmp, path)
+
+
 def copyFile(source, destination, keepOriginals = True):
     if keepOriginals:
         shutil.copy2(source, destination)
@@ -204,6 +244,91 @@ def bytes_fast_copy(dst_buf, i : int, src_data):
         src_data = get_bytes(src_data)
     dst_buf[i:i+len(src_data)] = src_data
 
+def get_writable_memview(buf):
+    """Flat, writable memoryview of bytes over buf (bytearray, memoryview, numpy array, ...),
+    for the readinto style functions that fill a caller's buffer.
+
+    Raises:
+        TypeError: buf isn't a writable, contiguous buffer.
+    """
+    view = buf if isinstance(buf, memoryview) else memoryview(buf)
+    if view.readonly:
+        raise TypeError("Buffer to read into is read-only")
+    if not view.c_contiguous:
+        raise TypeError("Buffer to read into must be contiguous")
+    if view.format != 'B' or view.ndim != 1:
+        view = view.cast('B')
+    return view
+
+class BufferPool:
+    """Pool of reusable bytearrays for temporary buffers, in power of two size classes.
+
+    Saves allocating (and garbage collecting) a new buffer for every transfer on hot
+    paths. Reused buffers aren't cleared. Safe to use from several threads::
+
+        with util.buffer_pool.buffer(16) as buf:
+            scope._getNAEUSB().cmdReadMemInto(addr, buf)
+            value = int.from_bytes(buf, "little")
+
+    Args:
+        max_free (int): Spare buffers kept per size class.
+        max_size (int): Buffers bigger than this aren't kept.
+    """
+    MIN_SIZE = 64
+
+    def __init__(self, max_free : int=8, max_size : int=1 << 20):
+        self.max_free = max_free
+        self.max_size = max_size
+        self._free = {}
+
+    @classmethod
+    def size_class(cls, size : int) -> int:
+        return max(cls.MIN_SIZE, 1 << (size - 1).bit_length())
+
+    def acquire(self, size : int) -> bytearray:
+        """A bytearray of at least size bytes. Give it back with release()."""
+        n = self.size_class(size)
+        free = self._free.get(n)
+        if free:
+            try:
+                return free.pop()
+            except IndexError:
+                # emptied by another thread
+                pass
+        return bytearray(n)
+
+    def release(self, buf : bytearray):
+        n = len(buf)
+        if n > self.max_size or n != self.size_class(n):
+            return
+        free = self._free.setdefault(n, [])
+        if len(free) < self.max_free:
+            free.append(buf)
+
+    @contextmanager
+    def buffer(self, size : int):
+        """Context manager giving a memoryview of exactly size bytes from the pool.
+        Nothing may hold on to it after the block.
+        """
+        buf = self.acquire(size)
+        view = memoryview(buf)[:size]
+        try:
+            yield view
+        finally:
+            try:
+                view.release()
+                # slices of view keep buf exported without stopping view.release(), but
+                # they do stop buf being resized
+                buf.append(0)
+            except BufferError:
+                # something still has a view of it, so it can't be reused
+                return
+            del buf[-1]
+            self.release(buf)
+
+#: Shared pool for temporary buffers, see BufferPool
+buffer_pool = BufferPool()
+
 def _make_id(target):
     if hasattr(target, '__func__'):
         return (id(target.__self__))
@@ -577,7 +702,6 @@ def get_cw_type(sn=None, idProduct=None, hw_location=None, **kwargs):
     cwusb = NAEUSB_Backend()
     device = cwusb.find(serial_number=sn, idProduct=possible_ids, hw_location=hw_location)
     name = device.getProduct()
-    cwusb.usb_ctx.close()
 
     if (name == "ChipWhisperer Lite") or (name == "ChipWhisperer CW1200") or (name == "ChipWhisperer Husky") or (name == "ChipWhisperer Husky Plus"):
         return scopes.OpenADC
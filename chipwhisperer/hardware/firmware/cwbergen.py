@@ -1,20 +1,6 @@
-# This file was auto-generated. Do not manually edit or save. What are you doing looking at it? Close it now!
-# Generated on 2022-08-02 14:30:15.266567
-#
-import binascii
-import io
+# Firmware/bitstreams for cwbergen, stored in firmware.cwfw (see fwstore.py)
+from .fwstore import default_store
 
-fwver = [1, 2]
+fwver = list(default_store().fwver("cwbergen"))
 def getsome(item, filelike=True):
-    data = _contents[item].encode('latin-1')
-    data = binascii.a2b_base64(data)
-    if filelike:
-        data = io.BytesIO(data)
-    return data
-
-_contents = {
-
-#Contents from ../../../../hardware/victims/cw310_bergenboard/CW310.bin
-'CW310.bin':'8D8HIEVoCABBaAgAQWgIAEFoCABBaAgAQWgIAAAAAAAAAAAAAAAAAAAAAABBaAgAQWgIAAAAAABBaAgAQWgIAEFoCABBaAgAQWgIAEFoCABBaAgAQWgIAEFoCABBaAgAQWgIAEFoCAAAAAAAKWYIAD1mCABRZggAZWYIAAAAAAAAAAAAxVMIANlTCABBaAgAQWgIAEFoCABBaAgAQWgIAEFoCAAAAAAAQWgIAEFoCACVXwgAQWgIAEFoCABBaAgAQWgIAEFoCABBaAgAQWgIAEFoCABBaAgAQWgIAEFoCAD5IggAQWgIAEFoCABBaAgAQWgIABC1BUwjeDO5BEsTsQRIr/MAgAEjI3AQvTwNByAAAAAArH0IAAxLQ7EMSBC1DEmv8wCADEgDaCO5EL0KSANoM7lwRwlLACv30L3oEEAYRwZLACv10BhHAL8AAAAArH0IAEANByCsfQgAAAAAAAJKE3gBO9uyE3BwR24NByAAIHBHACBwRwNLG3kDKwHQACBwRwEgcEdUIgcgCLUiS5hHIksbeFqyACoH2wAqN9sD8GADICsZ0AAgCL0D8GABICnz0RlJSXghKe/RF0vbiAcrAdAAIAi9wOvAABRLA0QSSpNgByOTgQEgCL0PS1t4ICsD0CIrFdEBIAi9C0vbiAcrAdAAIAi9CEsKShphwOvAAAdKEESYYAcimoEBIAi9ACAIvQAgCL15AQgAVCIHIGANByApAggACLUES5hHwOvAAwNJGUQDS5hHCL15AQgAYA0HIA1ZCAA4tSNLG3jbsgIrAtkAIiBLGnAfSxx45LIAIR5LI/gUEB1IowAjRFoAgxihJYVUICJacFmAASwo0AEgowAjRFkAFUoKRJCAAiPTgAAjE4ETSMTrxAKBGINUb/A9AkpwASKKcMtwC3FLcQgji3EgRgxLmEcgRgtLmEcCRiCxBEkLeAEz27ILcBBGOL0DINXnAL9uDQcghBUHIKAdByBgDQcgDVkIAFlYCABKSxtcA7FwR3C1grAERkhLmEcAKEPQR0sz+BRQRkuYR4VCftDv8xCGcra/81+PACJCSxpwQksdXe2yBetEAkFLM/gSMAArMtAAIj9LGoA/SxtdACtH0bX6hfNbCThKE1UBIjJLGlUmuTRLGnC/81+PYrYuRgXrRAUySzP4FTCz9QB/FL8BJQAlN9ApS5hHACgt0ClLmEcnSyP4FAAx4CVLM/gUUCpLmEeFQrvROeAmShOIATMTgB5LmEcYuSJLG4hjKwjZGkuYRwAovdAeSxuIs/VIf7jSJrsBIhhLGnC/81+PYrYd4LX6hfVtCbjnGEuYRxBLI/gUAAPgACINSyP4FCABLA/QgyAG60QEDUsz+BQwEEoAkhBKAutEIilGD0ygRwKwcL2FIO7nAL+cHQcgDRoIAJgdByBpGggA0QwHIJQdByCMHQcgWg0HIIgVByBZGggAUQQIAIwVByDNHAgACLWFKgLQACMQsQi9ASP75whK0lxZAAAqCL8BMQAiBkgg+BEgBUnKVAVJylQYRgVLmEfq55QdByCMHQcgiBUHIJwdByDxAggAELUGTCB4BkuYRyN4ATPbsiNwASsB2QAiInAQvVgNByDxAggACLUGShN4ATvbshNwEHgES5hHACIDSxpwCL0Av28NByB1WAgAXA0HIO/zEIFytr/zX48AIgtLGnALSzP4EDCbsgpKElwC60AACUoy+BAAgLLAGim5ASIDSxpwv/Nfj2K2cEcAv9EMByB8FQcgeBUHIHAVByAItQNLmEcAMBi/ASAIvQC/5QQIADC1g7Dv8xCDcra/81+PACEmShFwJkoVXCZKElxiue2yJUoy+BAQibIF60ACI0w0+BIgkrKRQgrSACs00QEiG0sacL/zX49itgAgA7AwvQAhGUoi+BAQtfqF8lIJFEkKVAEhFEoRVCO5EEsZcL/zX49itgRGEkuYR3i5ASwR0AQgBetEBA9LAJNP9ABzDkoC60QiASENTKBH1+cgRgxLmEfr5wYg7OcAIM/nAL/RDAcgeBUHIIAVByB8FQcgcBUHIDEFCADNBggAcA0HIM0cCACZWAgAcLUfSxt427ICKwLZACIcSxpwG0sceOSyACUaSx1VGksdVRpLHVUaSyP4JFCmADNEXYAYSyP4FFAgRhdLmEcXSx1VF0sdVRdLI/gkUDNEXYAVSyP4FFAgRhRLmEcBRkCxB0oTeAEz27ITcBN427ICKwHQCEZwvQEiDUsacPnnAL9vDQcgnB0HIIgVByCUHQcgjB0HIJgdByDxAggAgBUHIHgVByBwFQcgfBUHIEUFCABcDQcgMLWDsAYqFtAAJZC5EEYRS1tds/qD81sJebGJsgPrRQMNSiL4ExAAIgxLWlUoRgxLmEcDsDC9ASXn5wPrRQUJSwCTT/QAcwhKAutFIgEhB0ygR+7neBUHIHAVByCAFQcgRQUIAM0GCABwDQcgzRwIAPi1BEYWRg9GIeAD60QCIkgw+BJQrbJtGq5CANI1RgPrRAMB60MhKkYcSxlEOEYcS5hHHEoy+BQwm7IrRJuyIvgUMC9EdhsgRhdLmEcOs+/zEIBytr/zX48AIhRLGnARSzP4FBCJshJLG13bsgPrRAUJSjL4FSCSsii5ASULSAVwv/Nfj2K2kUK/0wpLG3gAK93RMEb4vQC/cBUHIHANByB1aggAfBUHIEUFCADRDAcgeBUHIFwNByAQtO/zEIFytr/zX48AIhVLGnAVSxpc0rIC60AEE0sz+BQws/UAfwrQw/UAcCm5ASIMSxpwv/Nfj2K2ELxwRwxMJFwALPDRC0wkXAAs7NEBJAhLHFSy+oLyUgkDSxpUACPi5wC/0QwHIJQdByCMHQcgnB0HIIgVByAItQNLmEcAMBi/ASAIvQC/9QcIAPi1BUYMRgdGwOvAAhpLE0SeeQkuFL8AJgEmIODv8xCAcra/81+PACIUSxpwFEvbXRRKA+tHAzL4ExAB8QEOIvgT4BFKAutDI1xUKLkBIgtLGnC/81+PYrZesSQSACYoRgpLmEcAKNnRCUsbeAAr9tH4vQEg+L0Av2ANByDRDAcglB0HIIwdByCMFQcgbQgIAFwNByABSxh4cEcAv7QdByAItQVLmEfDeARKE3ALsQEgCL0DS5hHCL0lNwgAtB0HIDlICAAItQNLG3gDsQi9AkuYR/vntB0HIGFICAAItQxLG3hasgAqB9sAKg/bA/BgA0ArCNAAIAi9A/BgAUAp89EES5hHCL0ES5hHCL0AIAi9VCIHILFICABtSAgAELWCsACSC0YCRgAhgSACTKBHArAQvQC/zRwIABC1grAAkgtGAkYAIQIgAkygRwKwEL0Av80cCAAB64EBiwAYRAJncEcB64EBiwAYREJncEcB64EBiwAYRIJncEcB64EBiwAYRMD4gCBwRwAAOLWh8Q4DASsC2E/w/zA4ve/zEIRytr/zX48AJQpLHXASAiLwf0Ii8P8CybIRQ0HwtEEGS5hHACzp0QEiAksacL/zX49itji90QwHIIUAByAQtIkBQxgCJERQT/D/MZliGWpaYBC8cEeJAQUjQ1BwRwDrgRFKYXBHAOuBEcphcEcA64ERSmJwRwDrgREIanBHCCMDYCAjA2AEIwNgcEcAACNLmUJB2KP1elOZQibZELQgTKT7AjSkCwQ8H0sLRJsAsvvz8gQ6ACMB4AEzZAj/LATZBiv52QHgATNSCP8qAdkGK/nZ5LISApKyIkMbBAP04CMTQwNhACAQvHBHSQCy+/HyBDoAIwHgATNSCP8qAdkGK/nZ0bISApKyCkMbBAP04CMTQwNhACBwRwEgcEcAv4AaBgDxGXYFABL9PwpGWbEDeAEpAt1BeEHqAyMCKgTdgnhC6gMjAOAAIxhGcEcAAPi1zGiOaAAsQNAPRgVGACFBYDt8GwR6aBICAvRAcgP0/gMTQ0P0gFNDYMFgeWg4RhpLmEfoYAEsBdABIytgACBH8jBTCeADIytgASD452i5AiMrYAEgCeALRoyxKmoS9IB/FtFZHrOxASzw0BLwAg/y0CtrM3ABPAE2R/IwUevnK2oT8AEP+9AragDgASQgRvi9BST75wkk+ecAv0ULCABwtc1ojmh1swtGBEYAIGBgCnwSBAL0/gJJaAkCAfRAcQpDYmDgYFloGEYSS5hH4GBdsSNqE/SAfxjRE/AED/fQM3hjYwE9ATby5yNqE/SAfw7RE/AED/jQAiMjYCNqE/ABD/vQAOABJShGcL0FJfvnBSX550ULCACAIwNgA2twRzi1BEYNRk/w/zODYgNqCkuYRyBGCUuYRypoaWggRghLmEcBKADQACBregErANA4vUAjI2D75wC/gQwIAJkKCACpCggAA0aouRdKEniSse/zEIBytr/zX48AIRRKEXAUSYp4ATqKcCi5ASEQShFwv/Nfj2K2q7EMShJ4krnv8xCAcra/81+PACEIShFwCEmKeAEyinAouQEhBEoRcL/zX49itgFKE3BwR7YdByDRDAcgTCIHIBhLGmgi8H8CGmAaaELwgAIaYBVJCmgi9MtSIvAcAkLwMAIKYApoQvACAgpg2mlC8AEC2mHv8xCBcra/81+PACAKShBwCkoEIBBgAiAQYE/0gFKaYSm5ASIESxpwv/Nfj2K2cEcAwApAAMEKQNEMByDwwQpA7/MQg3K2v/NfjwAhCkoRcAEhCkoRYCO5B0sZcL/zX49itgIiBksaYAZKACMTYVNhk4EFShNwcEfRDAcgIMIKQGDBCkBUIgcgvB0HIAdLG2gT8AEPA9EGSxt4AysA0HBHT/QAIgNLGmD55wC/MMEKQLwdByDwwQpABSIDSxpwT/QAIgJLGmBwR7wdByDwwQpAAyINSxpw7/MQgHK2v/NfjwAiCksacApJASIKYAlLGmAIIgpgGmAouQEiBEsacL/zX49itnBHAL+8HQcg0QwHIGDBCkDwwQpACLUKSxtoE/ACDwXRCEsbeAErAtAEKwPQCL0GS5hHCL1P9AAiBEsaYPbnAL8wwQpAvB0HIEEOCADwwQpABCILSxpw7/MQgnK2v/NfjwAhCEsZcBAjB0kLYJAxC2AquQEiA0sacL/zX49itnBHvB0HINEMByBgwQpACLUCSxtpA7GYRwi9VCIHIDi17/MQg3K2v/NfjwAhPEoRcAEhO0oRYCO5OUsZcL/zX49itjhLG3gDK0DQN0uciTdLG4jkGqSytLk2ShGIC0SbshOAMUrSiJNCNdAySxt4ACsx0S1LW2kzsZhHILEAIitLGoApS5yJPywo2QAiKksacEAkJUuaaCVLG4gaRO/zEIVytr/zX48AIR1LGXAjSxtoE/ACDzDQLbkBIhhLGnC/81+PYrYEIhdLGnA4vRxLmEccS5hHOL0bS5hHOL0BIhVLGnDW5xB4CHABM9uyATIBMZiyhEL22A1LGogURByAASMSShNgkDITYC25GkYESxpwv/Nfj2K2OL0NSQAj6OfRDAcgIMIKQLwdByBUIgcguB0HILodByC1HQcgMMEKQAEPCACxDQgAxQ4IAGDBCkAAABggOLVASxt4ASsL0AIrBNAEKwLQPUuYRwHgPEuYRzxLmEc4vTxLHGjE8wpUO0ubiTtKFYgqGZNCAdpcG6SyNkuaaCpEN0kAIwXgCHgQcAEz27IBMgExmLKEQvbYJUStsi9LHYBALAvQLEudgVtpC7GYRzizAiIrSxpgK0uYRzi9JkvaiCpLG4grRJpC7N0iS5uJnUIc0CNKAiMTYBAjE2Dv8xCCcra/81+PACAhSQhwIUkLYCq5ASIeSxpwv/Nfj2K2OL0RS5hHAiIWSxpgOL0SS1tpU7GYR3CxFEkQSguIEIgDRAuAACMTgNTnB0uYRwIiDEsaYDi9BEuYRwIiCUsaYDi9AL+8HQcgKQ4IAAEPCACxDQgAMMEKQFQiByC4HQcgAAAYIGDBCkBBDggAuh0HINEMByDwwQpAACMHKxPYELQJSVoA1BjgAARGCEQAfSFEAPD+Am/zggIKdQEz27IHK+7ZELxwR3BHwB0HIAN9E/ABDxPQELUMRgN9b/MAAwN1A2hTsQZJUfgiEBH0gH8B0ELwgAKBaCBGmEcQvXBHAL8AwQpAELUAJAvgI0YBNOSyA+tDA9gAIkYBIQNLGEQDS5hHByzx2RC9wB0HILERCAAQtQDwDwJTHgPrQwPcAAEhAkggRAJLmEcQvQC/wB0HILERCAD4tUMeWgAaRNEAWUwMRCJ9EvABDwDwq4DU+AzgomiWRXjQousOArL1gD8b2BUEUUlR+CBgFvSAfxjQUfggYMbzAhYIIbFAATkRQhfQRfAIBQPrQwHOAEZJMUQOfW/zQQYOdQvgT/SAMgAl4OdR+CBgxvPBJgEuNNBF8BQFPkkB6wARA+tDB/4AOU83RH5odkROYEXwIQXv8xCOcra/81+PACc2TjdwzmgW8BAPItGNYFgAGETEAC5JIUTIaBBEyGAKYU/wAHIC+gPzLUqTYb7xAA9M0QEiKUsacL/zX49itvi9UfggYMbzAhYIIbFAikLE2MHnvvEADwXRASEfShFwv/Nfj2K2WQAZRM0AGEoqRNFokWAXSlL4ICAS9IB/IdAD60MD2gASSxNEG30T8AIPGNABIhNLQ/ggIDA7U/ggMBP0gD8C0BBLQ/ggIAEiD0tD+CAgT/SAUgL6APCj9fhzmGH4vQJGACEgRglLmEf4vcAdByAAwQpAAMMKQNEMByAAwApAYMEKQJDBCkDwwQpAsREIAPi1Rx57ADtE2gA2TBRE4WjDAwPxAFMD9cATM0pS+CAgwvMCEk/wCA4O+gL+omiRQijTIn0S8AIPJNHv8xCCcra/81+PACEpSxlwASEoS0P4IBBP9IBTg0AmSUthKrkBIiJLGnC/81+PYrYCRh1JewDeGfUADUToaKhgACEgRh5LmEf4vQEhHUpC+CAQB/oB8TlEzAATSiJEUWjUaCFElmg2G3ZFKL92RjRE1GAWYQAkBOANeB1wATQBMwExtEL400/0gEIKS0P4ICC2RQjZB+tHB/oAA0sTRBp9b/NBAhp1+L0Av8AdByAAwQpA0QwHICDCCkAAwApAsREIAGDBCkAt6fBBRx57ADtE2gAyThZEsmjxaFIaMUtT+CAww/MCEwglnUDDAwPxAFMD9cATdGghRE/wAg4qTET4IOAwPFT4IEDE8wpUpUIU2E/wAA4ALD7QokIR2SJGT/AADH0APURP6sUIHExEROVoFUTlYCJhACQK4E/wAQ7p50/wAQzt5x14DXABNAExATOiQvjYFUtP9IBCQ/ggILzxAA8C0b7xAA8T0AJGAiFD+CAQT/SAU4NADUlLYQhJewDYGcQADETgaKBgACEwRghLmEe96PCBT/AADNvnAL/AHQcgAMEKQGDBCkAgwgpAAMAKQLERCAAItS5LG3hDuS1LG2jD8wpTCCsH0StKACMQ4CtLmEcrS5hH8ecqS5hHBCIqSxpgCL0QeClJWFQBM9uyATIHK/fZJkuYRzCzBCIiSxpgIkuT+QAwACsk2yBL24gAKyvQACMfShOAH0oTgAEhFEoRcBAiGEkKYO/zEIFytr/zX48aSANwGksaYCG5ASICcL/zX49itgi9DkuYRwQiDksaYAi9ACMPShOAD0oTgAIiA0sacA9LmEcIvQ9LmEcIvbwdByAwwQpAAAAYIAEPCACxDQgAKQ4IAGDBCkBUIgcgKToIALodByC4HQcg0QwHIPDBCkARDwgAQQ4IAAi1I0tbaBP0gF8+0CFLECIaYAgiGmDwOxtoE/AEDxrRHUsbaBPwAQ8E0BxLG2gT8AEPFNEYSxtoE/ACDxPRFksbaBPwCA8S0RNLG2gT8BAPFNEAIAi9EkuYRwEgCL0RS5hHASAIvRBLmEcBIAi9CCIOSxpgDkuYRwEgCL0QIgtLGmAMS5hHASAIvQAgCL0AvwDACkAgwgpAMMEKQMDBCkC9FQgAEQ8IAEUQCABgwQpA/Q0IAIkOCAAQte/zEIRytr/zX48AIkNLGnAoIEJLmEdCS5hHQktQIoP4KCNP9IByWmBP9IAgP0uYRz9L0/gAKCLwgHLD+AAo0/gAKELwAHLD+AAo0/gAKCLwgHLD+AAo0/gAKEL0gFLD+AAo0/gAKEL0AELD+AAoGmgi9IBSGmAaaCL0QGIaYNP4ACgi9IBCw/gAKChL0/gEOBP0gE/50CZLmEckSwIiw/gIKNP4BDgT9ABvAtAgS8P4DCgeS9P4AChC8AICw/gAKNP4AChC9IBCw/gAKBpLG3j7uQEiGEsacAAjF0oTcO/zEIFytr/zX48MShNwFErTeAEz03ApuQEiCEsacL/zX49itiy5ASIESxpwv/Nfj2K2EL0AIAtLmEfz59EMByC9ZwgAaWEIAADhAOAdaAgAAMAKQH0RCAC3HQcgth0HIEwiByDNDAgAcLXv8xCEcra/81+PACIZSxpwASAYS5hHGErS+AA4I/SAQ8L4ADgVS9P4BDgT9IBP+dASSxpoIvSAchpgCCaeYQEhmWEQIpphBCWdYQIgmGGeYJ1gmGDZYJpg0/gAKEL0gELD+AAoJLkCSxlwv/Nfj2K2cL3RDAcgzQwIAADACkAItQpL0/gAKCL0gELD+AAoGmhC9IByGmDT+AAoQvSAQsP4ACgAIAJLmEcIvQDACkDNDAgAELXv8xCEcra/81+PACIeSxpwHkrS+AA4I/SAQ8L4ADgbS5hHG0sbeKOxACMZShNw7/MQgXK2v/NfjxNKE3AWStN4ATvTcCm5ASIPSxpwv/Nfj2K2DUvT+AAoIvQAQsP4ACjT+AAoIvSAUsP4ACgLS5hHKCAKS5hHLLkBIgJLGnC/81+PYrYQvdEMByAAwApANRkIALcdByBMIgcgbWEIAN1nCAADS9P4BAgQ9EBQGL8BIHBHAMAKQAhLGmgi8IACGmAaaCLwfwIA8H8AAkMaYBpoQvCAAhpgcEcAvwDACkACSxhoAPB/AHBHAL8AwApAAksYasDzygBwRwC/AMAKQAJLGGrA8w0AcEcAvwDACkABS5hgmYFwR1QiByAQtQDwDwQILADZEL0NSctpASKiQCPqAgPLYQtKUvgkMCPwAgNC+CQwCEuYRwE8BOtEBOIABksTRBp9b/OCAhp14+cAvwDACkAAwQpAFRIIAMAdByAA8A8AAktT+CAAwPPAQHBHwMEKQADwDwMIK2LYWh43SVH4IxAR9AAvXdEwtALrQgHMADNJIUQJfRHwBA9V0RHwAQ9V0e/zEIVytr/zX48AJCxJDHAQ8IAPGNErSVH4IyAi9AByQfgjIEAhKEpC+CMQT/QAIZAyQvgjEAAtPNEBICBLGHC/81+PYrYv4CBJUfgjEBH0QF/g0ALrQgLRABhKCkQRfUHwBAERdQEhGUpC+CMQFUlR+CMgQvQAckH4IyBP9IBS8DFB+CMgAvoD8xJKk2F9uQEgC0sYcL/zX49itgTgACBwRwEgcEcBIDC8cEcAIPvnASD55wEg9+fAwQpAwB0HINEMByAAwQpAYMEKQDDBCkAgwgpAAMAKQDi1APAPAAgoVdhDHgPrQwLRACtKCkQSfRLwBA9J0ChKCkQRfW/zggERdU/0gFIlSUH4ICCCQKH1CHFKYQEkIkpS+CAgEvQALxvQIEpS+CAgEvBADwjQQCEdSkL4IBBP9IAhkDJC+CAQT/QAIRVKQvggEBhJUfggIEL0AHJB+CAgASTcsQPrQwLRAA1KCkQSfRLwAQ8Q0ApIWQDNGOoAAkQVfW/zAAUVdQtE2gCDWJhHAuAAJMPnACQgRji9AST758AdByAgwgpAwMEKQDDBCkBgwQpAAMEKQPi1APAPAFxOVvggUAgoAPKngAX0gHVHHlhM1Pgc4AEkhEAe6gQPAPCdgFVMVPggQBT0AC9A8JiAB+tHBE/qxA5QTHREJH0U8AQPQPCPgO/zEIxytr/zX49P8AAOSkyE+ADgB+tHBE/qxA5GTHREJH0U8AEPCtC88QAPedEBIkJLGnC/81+PYrYAIPi9B+tHBE/qxA47THRElPgU4E7wAQ6E+BTgvPEADwfRT/ABDjZMhPgA4L/zX49itt/4yMB8ADxET+rEDgzrDgRiYKNgACLiYCJhBppM+A4gEbl7uwEhAOABIQfrRwf6ACZLE0QafWHzQQIadUMe27IFKyzZ7/MQgnK2v/NfjwAhH0sZcE/0gFODQBlJi2GdsVb4IDAj9ABzRvggMAEhGEtD+CAQCrsBIBVLGHC/81+PYrb4vQAh0OdW+CAwI/QAc0b4IDACIQ5LQ/ggEOrnDUuYRwEg+L0AIPi9ACD4vQAg+L0AIPi9ACD4vQEg+L0AwQpAAMAKQMDBCkDAHQcg0QwHIPDBCkA5EggA8LWDsADwDwQILADyCIFP+oD8iEvYaSVGASOjQANAQPACgQHwAwABKA7QACgA8P2AASACLADZASACKDDQAygr0AEoA9AAI+vgAiDy50/wAA6nAHlOVvgkACD0y1Ag8BwAyQIB9MBRvPEADxvbGUOi9YBjm7Kz9XxPBtMIKgTZT+pCDLzxAQ8q0LP1fE8N0wgqI9lSAFMeCuBP8AIO2OdP8AEO1edP9IBz4OdA8v9zs/qD88PxHAMbAQtDQ+qOAyP00GMj8AMD2wTbDANDu1EBIwP6BfWtsggjBuAPI+fnb/A/A+nnATvbsqNCTtlRStFpASKaQBFC9dAVQ62yTUjBaSHqAgLCYUxJUfgjICLwAgJB+CMg5ucG60YC0wBHStVYAC0A8ISA3PgAMBP0gH8B0ETwgAQG60YG8gBASxNEIkbZaAEgqEcAI2rg+1gT9IB/YdBE8IAAOUl3ALoZ0wALRJP4FODT+ATA2mibaD5E9wDJWQCRmxpiRM7zQAEwTrBHA0YAKEzQATTksggsRdhF+gTzE/ABD/bQZh5yADJE0QAmSwtEGn0C8AEAb/MAAhp1pwAhSwfrAwxT+CQgQvACAkP4JCDf+Gzg3vgcIAEhoUAKQ874HCAbSlL4JCAS9IAvmdBT+CQgQvQAckP4JCAAKMnQYh7SsgUqp9n6WBL0gH+j0XEAMUTIAAxKAkQQadFoCRrRYJnnIEad5wEjAOAAIxhGA7DwvQAj+ucAI/jnACP25wC/AMAKQADBCkDAHQcgzRwIADDBCkAQtQDwDwFLHtuyBSsW2U/0gFOLQBhKU2EYSwIiQ/ghIAEiQ/ghIE/0gFOLQBJKU2EQ8IAPGNESS5hHEL1KHk/wAHOTQAxKU2EOSwPrARMAIppg6OdP9ABUC0tD+CFAC0vTWBP0AF/60YoACUtT+CEwE/RAX+7R3ucAwApAIMIKQBUSCAAAwwpA8MEKQMDBCkAwwQpAASIIKgDyu4BwtWPgXUgA6wIQxGgU8AEPQPCvgFpMY2HDaBsMCNBZTUgARhj0ACxE5mjzGuNgo2AQRlVLmEcBIHC9UUscaU/0gFOrQBxCV9CUAFBLU/giYBbwAg8F0E5OVvgiYBbwAg8Z0eZYFvABDwTQSU6mWRbwAQ8V0eZYFvAgDwfR5lgW8AQPA9HjWBPwQA810BBGQUuYRwEgcL0QRj9LmEcBIHC9EEY+S5hHASBwvT1LASTsUDxJbFBP9IBB6VAAITpLmEcgRnC9ATLSsggqUNgVRlEeAetBBOAAK0wgRClMJGlP8ABzi0AcQgPQJUxkaCNCidFTHtuyBSug2CFLHGlP9IBTq0AcQt7QlQAhTFT4ImAW8AEPBdAdTlb4ImAW8AEPxNEoWRD0gF/N0BhIKFgQ9EBfyNFP9IBQGkqoUKL1CHJTYQHrQQHKAA9LE0QafW/zggIadRZKq1gj9ABzq1AUS0/0ACLqUE/0gCLqUAEgcL0AIHC9ASBwvQAgcEcAvwDDCkAAwApAwB0HIDkSCAAwwQpAwMEKQKkgCADNFAgAzRMIACDCCkBgwQpAsREIAADBCkDwwQpACLVXS5hHILlWS1toE/ABDw/QVEtbaBPwBA8U0FFLBCKaYNP4BDgT9EBfCdBOS5hHCL1ytr/zX48AIkxLGnAIvUtLmEfy50dLW2gT8AIPA9FIS5hHMLEIvQIiQkuaYERLmEcIvURLmEcAKPTRPUtbaBPwCA8v0TtLG2kT8AEPBNA4S1toE/ABDzHRNksbaRPwEA9D0DNLW2gT8BAPPtAxStL4ADgj9IBDwvgAOC1L0/gEOBP0gE8E0SpLW2gT8AEP9NAoSxAiWmEBIJhhK0uYRytLmEcIvQgiIkuaYClLmEcpS5hHKUuYRylLmEcIvR1L0/gAKCL0gELD+AAoASJaYRAimmHT+AAoQvSAQsP4ACgAIBpLmEcfS5hHCL0RS9P4BDgT8AIPltAOS9P4ACgi9IBCw/gAKAIiw/gIKNP4AChC9IBCw/gAKNP4BDgT9ABvAtERS5hHfucQS5hHCL0AvzFoCAAAwApAGUgIANEMByDxOQgAtRYIAD0hCADNDAgADUgIAOkRCAA9NwgAPQ0IALENCAABSAgANRkIALUYCAAFShNoI/RAY0P0AGMTYBNoQ/QAUxNgcEcAwApABUoTaCP0QGND9ABjE2ATaEP0gEMTYHBHAMAKQANKE2gj9EBjQ/QAYxNgcEcAwApAMLSOsGxGIE0PzQ/ED80PxA/ND8SV6AMARPgECyFwG0rTaSPwAQPTYRlJC2gj9MtTI/AcA0P0iVND8BADC2ALaEPwAgMLYNNpQ/ABA9NhE2gj9EBjQ/QAYxNgE2hD9ABDE2BpRgtKACMF4Ah4EHABM9uyATEBMjQr99lP9IBCBksaYA6wMLxwR3x8CAAAwApAAMEKQAAAGCAgwgpAAutRArL78fEKH0/2+3OaQgLYAWIAIHBHASBwRzC0susBHxfTECQB+wTxSwgD68ICsvvx8tMIXR5P9v5xjUIQ2AgsCdASBAL04CIaQwJiACAwvHBHCCTm50FoQfQAIUFg8OcBIPTnQCMDYHBHgCMDYHBHiCMDYHBHECMDYHBHICMDYHBHJCMDYHBHgWBwR8FgcEcAaXBHQGlwR0/0gHMDYHBHT/QAIwNgcEdDaRPwAg/70MHzCAHBYQAgcEcBS8D45DBwRwBBU1UQtQRGCUuYRwAjY2BjYqNiIEYHS5hHIEYGS5hHIEYGS5hHIEYFS5hHEL0Avz0mCADzJQgABSYIABsmCAAjJggAcLUFRgxGFkYQS5hHACIQSxpgtLEyRiFoKEYOS5hHAkaIuWNooWgLQyFpC0PhaAtDB0kIaANDC2BpaAtDa2AQRnC9ASL75wEi+ecAv0kmCACAHgcgnSUIAHC1BUYMRhZGJUuYRwAiJUsaYAAsQNCjaAMrAtkBIhBGcL0yRiFoKEYfS5hHAkYAKDTRY2gbSQhoA0PgaANDQ/SAI0PwDgMLYKFoAykJ2N/oAfACDhUcQ/SAcyP0gDMRSQtga2gPSQloC0NrYNfnI/SAMyP0gHMLSQtg8udD9IAzQ/SAcwdJC2Dr5yP0gHND9IAzBEkLYOTnASLA5wEivudJJggAhB4HIIElCABwtYawBUYMRgQjAJMCqw8iDiEMSAxOsEcYsRAiEEYGsHC9AkYELADZBCQTRgfgBqkB64MBUfgQHEX4IxABM5xC9djr5wAKDkANAAcgA0uz+AUAwPFAAACycEcAvxQCByADS7P4AwCz+AEwwBoAsnBHFAIHIC9LW3giKwXQLUqSiAEqDtAAIHBHKkqSeEIq9dEpS5t8KUoTcCZLmmABIJiBcEegKwfQI0pRiKErLdCiKzXQASBwRyBKEXghSxlwsvkBEMmyWXCy+QMQybKZcLL5BRDJstlwsvkHEMmyGXGRellx0vgLEMiymHHB8wcg2HHB8wdAGHIJDllyUnqacg1Kk2ALI5OBASBwRw1KCkQi8AMCCEiCYE/0gHKCgcfnCUsLRCPwAwMDSpNgT/SAc5OBASBwR1QiByAUAgcgbCIHIPA/ByAwQAcg8LWDsC1Lm3hCKwjQK0ubiAE7m7IBKxLZACADsPC9J0tbeCIr8tEmS5hHJkuYRyZLASScdJxyJUuYRyBG7ecfS1t4C7EBIOjnIU5AJSpGACEwRiBMoEd3GSpGACE4RqBHKkYAIQbxkACgRwYgGkygR4UgoEdP8CBRGSAYTKBHT/BAURogoEdP8EBRGyCgR0/wQFEcIKBHDEsBJJx0nHIAIdlyGXNZc5lzGXQNSwCTK0Y6RgYgC02oRyBGrudUIgcgfTcIAOk6CAAUAgcgMTcIAPA/ByCLaggAqSAIAJVkCAC9KQgAzRwIADC1g7DAsSBL23tjuR9LAJNAIx9KACEGIB5MoEcBIhpLmnIDsDC9GUsAk0AjGkoAIQYgGEygR+nnDUYTS9t7A7sRS6P4AxAV4BRLmEcgRBRLGhmS+JAg0rIDRIP4QCABNKSyrELw0w1LmEeAsgVEBkuj+ANQBEsAItpzWnCacJpyz+cAJO3nAL8UAgcgvSkIADBAByDNHAgAgEAHIO0nCADwPwcgELWCsAi5ACMR4BhLs/kFMBdKAJIXSgAhhSAXTKBHGuBaGBRIglzSssJUATObsg9KsvkFIFAag0Ly0wOyC0qi+AUwU7kJSgAjAiFRcZNxCUkLcEtwk3ICsBC9BUoAkgVKACGFIARMoEf15wC/FAIHIGEqCADwPwcgzRwIAAFLmHxwRwC/FAIHIDC1g7AA8AEEDUtbeou5nLEaIAxLmEcAI434BzAbIApNqEcZIAlLmEcEHBi/ASQbIKhHIEYDsDC9GiAFS5hH6ucUAgcgQWQIAHFkCAAlZAgAWWQIADC1g7ASS9P4H0BbfCuxAPABAIixIEYPS5hHACON+AcwC0tbfGOxACUbIAtMoEcbIKBHKEYDsDC9IEYIS5hH7OcgRgdLmEcFHBi/ASXs5wC/FAIHIEFkCABxZAgAWWQIACVkCAAt6fBBB0YORgAkJUYK4Ef6BPAA8AEAHkuYR0XqwBXtsgE05LK0QjDSGksbeBPwCA8O0G0IF0sbfAAr6NBH+gTwAPABABRLmEdF6sAV7bLn5xBLG3xjscTxBwhH+gjwAPABAA1LmEcA+gjwKEPFstfnxPEHCEf6CPAA8AEABEuYRwD6CPAoQ8WyyucoRr3o8IHpKggAFAIHID0rCAAItQghAUuYRwi9AL+hKwgAMLWDsBDwAQ8V0RwgDEuYRwAjjfgHMBwgCk2oRxsgCkygRxkgqEcFHBi/ASUbIKBHKEYDsDC9HCAES5hH6OcAv1lkCAAlZAgAcWQIAEFkCAAt6fBBB0YORsMJCNAaIBpLmEcHLgfQACRP8AAIFOAaIBZLmEf15wEk9ufE8QcFR/oF8ADwAQASS5hHqEBA6ggAX/qA+AE05LK0QhLSDUsbeBPwCA/p0Ef6BPAA8AEACEuYR8TxBwOYQEDqCABf+oD46OdARr3o8IFBZAgAWWQIAE0sCAAUAgcgELWCsFxLs/kHMBO7W0uYRwEoUt1YSrL5AQBDHJuyHLKi+AFAVkkBRJH4QBCi+AcQEHgQ8AIPRNEBM6L4ATBQSxxElPhAMEHqAyEJsgExovgHEEpLmEcAKHndR0sbeBPwEA940ERLs/kBIFEco/gBEENLE0ST+EAAQkuYRz5LG3gT8CAPDNA8SrL5BTAZRgEzovgFMDpLWFQ7S5hHAChe3TVKsvkHMAE7G7Ki+AcwE7kAIjFLGnACsBC9ASIuS9pz+ecBMSxKovgHEBDwQA8n0RDwEAAI0AEzJ0qi+AEwKEscRJT4QADAssmyKEuYRyJLACLacRpyG3gT8CAPDNAeSrL5BTAZRgEzovgFMBxLWFQdS5hHACgO3QAiF0sacMrnATOi+AEwFkscRJT4QADJshdLmEfb5wEiD0uachVLAJNAIw9KACGFIBNMoEfk5wEiCUvac6/nACAKS5hHjucBIgVLmnILSwCTQCMFSgAhhSAJTKBHlOcAvxQCByDtJwgA8D8HID0sCADZJwgAoSsIAJ0sCABhKggAzRwIAHC1grBhSxt4gDsKKwDyuoDf6APwBm9UgZKYq524uLQAW0uYRwEoE91YSLD5ARBLHJuyHLJXShFEkfhAYPayATOg+AEwIkSS+EBQ7bIAJArgASJOS9pzXOBP8GBRTkuYR+yxATTksgcsJNgjHUdKAuuDA9P4AwAAKPPQRfoE8xPwAQ8S0Eb6BPER8AEP5NETfAAr4dBP8EBRP0uYR+HnO0vT+BMAPUuYR9vnT/AgUTpLmEfW5wAiNUsacCrgNEuYRwEoEt0xSAAjA3Cw+QEQSxybshyyL0oRRJH4QBABM6D4ATAiRJL4QDAT4AEiJ0vacw/gJksAIRlwJkqRcAMgWHGZcQEgmHImSwCTAyOFICVMoEcCsHC9HUsAIRlwHUoBIJBwAyRccZlxmHIdSwCTI0aFIBxMoEfs5xRLASJacgAiGnDm5xFLACJachpw4ecPSwEimnIAIRlws/kFMBBKAJIMSoUgD0ygR9PnCEqy+QEwAjOi+AEwACMTcMrnACIDSxpwxucAIgFLGnDC5xQCByDtJwgA8D8HIJVkCABxZAgAYSoIAM0cCAAItQNIA0uYRwNIBEuYRwi91SgIAN1HCAABKAgAuUcIAC5Lm3wAK1jQLEubegArVNEQtYKwKUvbewArPdEoS5hHACg73SVLG3h7uSRLs/kBEEoco/gBICNKCkSS+EAgGnDT+AsgATLD+AsgHEuT+QAwACsv2xxLmEcc4BhLs/kBMCNEGEoTRJP4QDDbsiJEgvhAMAE0pLISS5hHhELt2wEiDkuachFLAJNAIxFKACEGIBBMoEcCsBC9ACTs5wEiB0uacgpLAJNAIwtKACEGIAlMoEfv5wlLmEfs53BHFAIHIO0nCADwPwcgJS0IAL0pCACAQAcgzRwIADBAByDBLggAAEhwR2gHByACSxtoG2hYiBhEcEeQHgcgOLUERg1GCUuYRwJGIHggRJBCB9JDeAQrBtCrQgXQA3gYRPXnACA4vQAgOL1xMQgAOLUUSxt4C7MTSxtoG2gaeYJCHdkNRgRGEEoTYBBLmEcD4Bp4E0QNShNgDEsbaJhCCtlaeAQq9NGaeJRC8dHaeKpC7tEBIDi9ACA4vQAgOL0AIDi9jR4HIJAeByCUHgcgcTEIAAhL24hjuQdLW4gBKwHQACBwRwVKE4gj8AIDE4ABIHBHACBwR1QiByCIHgcgBEvbiCO5BEoCSxphASBwRwAgcEdUIgcgFTYIADi1E0sbeAOzEksceRJLG2gbaBt5nEIB0wAjF+AAISBGDkuYRwNGiLELSxtoW2hT+CRQ62iYRwFGIEYIS5hHA0YgsatomEcDRgDgACMYRji9jR4HIFQiByCQHgcgsTEIADi1EEsbeNOxACQPSxtoGmgSeZRCEdJbaFP4JFDraJhHAUYgRglLmEcDRkixq2iYRwNGKLkBNOSy5+cAIwDgACMYRji9jR4HIJAeByCxMQgAcLUERgAhEUuYRwVGCLkoRnC9D0sbaFtoU/gkYPNomEcBRiBGCUuYRwVGACjv0AlLHGgFISBGCEuYRwRGGLGAeAZLmEf153NomEfg57ExCACQHgcglB4HIIExCACFGggACLUGS9uIAisB0AAgCL0CIQNIBEuYRwEgCL0Av1QiByCIHgcgeRoIABC1GEubeAMrKtjf6APwBQIQCxUgFEwM4AQhFEgUS5hHACAG4BNLmEcERiAgAeAiIBFMCLEAIwjgASAQveFcD0oC60MCUYABM9uyg0L200EcSQDJsglIAXAFS5hHASAQvQAgEL1UIgcgFAQHIBAEByB5GggAaTEIACwEByDIAwcgCLUGS9uIASsB0AAgCL0BIQNIBEuYRwEgCL0Av1QiByCNHgcgeRoIADi1FUvbiAErAtAAJCBGOL0SSxt487EQSx15EUsbaBtoG3mdQgHTACTw5wAhKEYNS5hHBEYAKOnQCUsbaFtoU/glMNtomEcISxhwASEYRgdLmEfb5wAk2edUIgcgjR4HIJAeByCxMQgAjB4HIHkaCAAQtUVLW4jcshsKATsOK3/Y3+gD8AgceH5+QE9+fn5+fn5+cwA9S5hHKLk9S5hoAXg8S5hHM+A6SxpoECGRcAIh0XAYaAF4N0uYRyjgM0uYRwNGkLEyS5toW3ycQgHTACMl4C9LG2lT+DQAQYgtS5hHKUubaAIiWnAR4ClKEmhSfJRCFNImS1toU/g0AEGIJUuYR+3nIkvYaAF4IkuYRx5L2oibiZpCNdIbS5qBASMYRhC9GkuYRwNGgLkZSpJoUnyUQvTSFksbaVP4NABBiBVLmEcRS5toByJacODnEEsbaFt8nEIB0wAj4ecNS1toU/g0AEGIC0uYR+vnISEKSAlLmEfM5wlLmEcDRgAox9HO5wAjzOcBI8rnVCIHIA0aCABYBAcgeRoIAFgCByCVMwgACLUJS9uIAisB0AAgCL0GSxh5BkuYRwZLGIACIRhGBUuYRwEgCL0Av1QiByDZGggAih4HIHkaCAAItQNLWIgA8H8AAkuYRwi9VCIHICEaCAA4tQVGD0uYRwNGwLEOSxxoBSEgRg1LmEcERkCxgojBeIB4C0uYRwNGACjx0QfgCUsbaFtoU/glMBtomEcDRhhGOL0Av7ExCACUHgcggTEIAGEeCACQHgcgOLUMS9uIk7kLSxt4C7kAIw7gCEsceZ14IEYIS5hHA0YwsSlGIEYGS5hHA0YA4AAjGEY4vVQiByCNHgcgDTMIAC02CAAItQdL24hLuQVLW4gLsQAgCL0DSxh5A0uYRwi9ACAIvVQiByD1GwgACUvbiGu5CEtbiAuxACBwRxC1BUwgeQVLmEcgeQRLmEcQvQAgcEcAv1QiByCpIAgA7RoIAAFLGGhwRwC/lB4HIAi1AUuYRwi9bRcIABC1C0sbeGOxACQE4CBGCUuYRwE05LIISxtoG2gbeZxC9NMAIwJKE3AEShOAEL0Av40eByANMwgAkB4HIIgeByAItQJLmEcCS5hHCL1pGQgAPTcIABC1GkvbiAArKNEYS1uIAisn0RdLmEcERgizFEsbeQuxACQc4BNLmEcQS5uIGwoBOwMrGNjf6APwAgYKDg5KC0saYQzgDUoJSxphCOAMSgdLGmEE4AtKBUsaYQDgACQgRhC9ACT75wAk+ecAv1QiByANGggAPTcIAJkkCAC1JAgA0SQIAOUkCAArS9uIE7EAIxhGcEcQtSlLmEcQuQAjGEYQvSdLmEcDRnixI0uaeCVLm2hbfJpCPdwjS5hHHkubeCJKE3BLuQEj6ecbSpF4HUoSaFJ8kULv3eHnGUuYR9ixGEsaaRlLG3gD8QBTATsC68MDF0oTYAAkFUsbaBtoG3mcQhXSACEgRhJLmEcDRgAoxdABNOSy7+cKS1poC0sbeAPxAFMBOwLrwwMJShNg4ucBI7TnACOy51QiByBJGggADRoIAFgEByA9NwgAjR4HIJAeByAtNggACLU0Sxt4E/CADw7RE/AfA0PRMEpSeAE6CCo+2N/oAvA0PTc9MT09PToAKkrSiAAqTtAT8B8DBtEmSlJ4BioL0AgqDNAqsQErDNACKxHQACAIvSFLmEcIvSBLmEcIvSBLmEcIvRtKUngKKu7RHUuYRwi9GEtbeAuxACAIvRpLmEcIvRpLmEcIvRlLmEcIvRlLmEcIvRhLmEcIvQErA9ACKwjQACAIvQtKUngLKvfRE0uYRwi9B0tbeAErA9ADKwTQACAIvQ5LmEcIvQ5LmEcIvQAgCL1UIgcgbTMIAK00CAAVNAgAPTQIAN01CABBMggAFTIIAJE3CAAZOAgAhTYIAMk2CADxNggAC0sbeBOxELUAJALgcEcBNOSyCEsbaBpoEnmUQgfSW2hT+CQwG2kAK/HQmEfv5xC9jR4HIJAeByAItShLACKagRphWmEbiLP14H8W0CNLG3gT8IAPJNET8GAPJ9AfSxt4A/AfAwErJ9kcSxt4A/AfAwIrL9AAIxhGCL0ZS5hHULlNIhhLg/i2IE/0pXEVSBZLmEcBI+/nVyISS4P4tiDz5w5K0ogAKtbRACPk5w9LmEcDRgAo0tDe5whLm4gCKwXQC0uYRwNGACjO0NTnASIDS5qA9ecHS5hHA0bM51QiByDdKggAfAIHIHkaCADpOAgAXTIIAL0yCAAGS1poBkkRYFloBkpKYBlpBUgIYBtpWmBwRwC/WAQHICQFByBQBAcgbAYHIA5K04iSiZNCF9jbsloe0rICO9uyAisQ2BC0CEucaCF4B0sZdAAjBeDhGEh4BEnIVAEz27KTQvfTELxwR1QiByBEBwcgD0tbeEE7AysX2N/oA/ARAgcMDEoKSxphASBwRwpKCEsaYQEgcEcJSgVLGmEBIHBHB0oDSxphASBwRwAgcEcAv1QiByAFPAgAFTsIAK07CADNVggAD0vaiJuJmkIY2A5LG3gbsQEiDUsacHBHELUJS5toC0mLYMpgB0wBIyNwCUgJS5hHwLIFSxhwACMjcBC9cEcAv1QiByCYHgcgIB8HIEQHByAAwAhACQwIAAtLG3gbsQEiCksacHBHELUHTAEjI3AIS5pokvkAEJh4BkuYRwAjI3ACShNwEL0Av5geByAgHwcgVCIHINFaCABwtTRLW3hBOwMrYdjf6APwXQIcNy9LmHgvSxt4M7EvSgEgEHArS5pgmIFwvSxMIUYsS5hHYh4AIwT4ATwlS5pgAiKagQEgcL0nSxp4I0sacCZKEnxacAAjBuCaHCNJyFweSYhUATPbsiBKUmiTQvTTGEsaSZlgAjKagQEgcL0VS9uIGkrTYBZJkWATShJ4SrEBOQEgCHAUShBwDkqRYANEk4FwvQxOASQ0cBBNKUYQSBBLmEcJSwAiGnAycAVKk2DraCNEk4EgRnC9C0uYR3C9ACBwvVQiByCYHgcgbCIHIG0iByCBWggAIB8HIEQHByAAwAhAaQsIAJ1XCABwR3BHwPMIAACxcEcItQMgAUuYRwi9AL9xZAgACLUDSANLmEcDSARLmEcIvUU8CAC5RwgAWTsIAN1HCAAAtYmwjfgHEBNLG3gbsQAgCbBd+AT7ASMPShNwACIDkgeSYPB/AI34DAAEkw3xBwIFkgaTaSON+BwwA6kHSAhLmEcYsQAgBEsYcOHnACICSxpwASDc5wC/mB4HIADACEAJDAgAE0sbeAuxACBwRwC1h7ABIw9KE3AAIgGSBZJg8H8AjfgEAAKTA5EEk2kjjfgUMAGpCEgJS5hHKLEAIAVLGHAHsF34BPsAIgJLGnABIPfnAL+YHgcgAMAIQGkLCAAQtYSwACQDlEzyUDMCk2kjjfgMMA5LAZON+A1AFiANS5hHAakMSA1LmEcEqQH4DU0gRgtLmEcDRjCxnfgDIALwDwIBKgDQI0YYRgSwEL0AvwC9AQW9ZwgAAMAIQIkMCADhPQgAELVP8EBROCAKTKBHT/BAUTQgoEdP8CBRNCCgR0/wYFE1IKBHNSAES5hHOCADS5hHEL0Av5VkCABBZAgAWWQIAAi1NSABS5hHCL0Av1lkCAAItTUgAUuYRwi9AL9BZAgAcLUFRgAmNEYK4DQgFEuYRzggE0uYR20A7bJkAOSyATYHLhDYNCAPS5hHACgYv0TwAQQ4IAxLmEcV8IAP5dE0IAlLmEfk5zQgBkuYRwAoGL9E8AEEOCAES5hHIEZwvQC/QWQIACVkCABZZAgAELUAITggBEygRwAhNCCgRwAhNSCgRxC9lWQIAAi1BEsYaARLmEcESxhoBEuYRwi9WAcHIEFkCABkBwcgWWQIAAi1AksYaAJLmEcIvVgHByBZZAgACLUCSxhoAkuYRwi9WAcHIEFkCABwtQVGACY0RgzgGEsYaBhLmEcYSxhoFkuYR20A7bJkAOSyATYHLhPYE0sYaBNLmEcAKBi/RPABBA5LGGgQS5hHFfCAD+HRCUsYaA1LmEfg5wlLGGgJS5hHACgYv0TwAQQESxhoBkuYRyBGcL1gBwcgQWQIAGQHByBcBwcgJWQIAFlkCABwRwAAcLUERk/wIFExIJpLmEcALEDwq4BP8CBRNiCWTKBHT/AgUQogoEdP8CBRCyCgR0/wIFEMIKBHT/AgUQ0goEdP8CBRQiCgR0/wIFFDIKBHT/AgUUQgoEdP8CBRRSCgR0/wIFFGIKBHT/AgUUcgoEdP8CBRSCCgR0/wIFFJIKBHT/AgUR0goEdP8CBRUiCgR0/wIFEGIKBHT/AgUVUgoEdP8CBRViCgR0/wIFFXIKBHT/AgUVggoEdP8CBRWSCgR0/wIFFaIKBHT/AgUVsgoEdP8CBRXCCgR0/wIFFdIKBHT/AgUV4goEdP8CBRYCCgR0/wIFFhIKBHT/AgUWIgoEdP8CBRYyCgR0/wIFFkIKBHT/AgUWUgoEdP8CBRZiCgR0/wIFFnIKBHT/AgUWggoEdP8CBRaSCgR0/wIFFNIKBHT/AgUTMgoEdP8CBRNSCgR0/wIFE0IKBHT/AgUTggoEdP8CBRMSBDS5hHcL1P8IBRNiBATKBHT/AAYQogoEdP8ABhCyCgR0/wAGEMIKBHT/AAYQ0goEc4TSlGQiCgRylGQyCgRylGRCCgRylGRSCgRylGRiCgRylGRyCgRylGSCCgRylGSSCgRy1OMUYdIKBHKUZSIKBHMUYGIKBHKUZVIKBHKUZWIKBHKUZXIKBHKUZYIKBHKUZZIKBHKUZaIKBHKUZbIKBHKUZcIKBHKUZdIKBHKUZeIKBHKUZgIKBHKUZhIKBHKUZiIKBHKUZjIKBHKUZkIKBHKUZlIKBHKUZmIKBHKUZnIKBHKUZoIKBHKUZpIKBHT/BgUTMgoEczIAhLmEdP8EBRTSCgR0/wYFEzIKBHdecAv5VkCAABAAAIAQAAEEFkCAAAtY+wASENkQqqACMKkwuTrfgwMA0gjfgUAI34FTCN+BYwBpEHkgojCJMoI434JDAeSxt4E7EPsF34BPsbSxlwBakbSBtLmEcIsQAjDZOJI434ADAAI434ATCN+AIwASMBkw2rApMEIwOTKCON+BAwaUYPSA9LmEcIsQAjDZMNmyP0f3Mj8AMDQ/BkAw2TaUYHSAlLmEcIsQAjDZNpRgRIBEuYRwAiAUsacMTnmB4HIADACEBpCwgACQwIADBLG3gDsXBHELWSsAEjLUoTcA0ijfhHIFEijfgwIAAijfgxII34MiANkw3xRwIOkg+TKCON+EAwDKkjSCNLmEcAKDPRJiON+C8wGiON+BgwACON+BkwjfgaMAEjB5MN8S8CCJIJkygijfgoIAWTBqkVSBZLmEf4uYkjjfgAMAAkjfgBQI34AkABIwGTBasCkwQjA5MoI434EDBpRgpIDEuYRwhLHHAFIBKwEL0AIgVLGnBP8P8w9+cAIgJLGnBP8P8w8eeYHgcgAMAIQAkMCABpCwgAcLWGsAAkBZRdSxxwXUtbaAWTBZsFk0/wAHJbS1pgT/BgUTkgWU2oRxAhAahYS5hHCyBYTrBHDCCwRw0gsEcOILBHVUuYRwEiVEsacL/zX49itlNIU0uYR0/wIFE6IKhHT/BgUQMgqEdP8EBRTiCoR04gTUuYRyNGBOAAIUtK0VQBM9uyBCv42QEiSEtacUhLmEdIS5hHSEuYR04gR0uYR0dLmEc+SD9LmEdGS5hHRkuYRwAkC+AGqwPrhANT+BQsQklDSADrxABCS5hHATQDLPHZACQ+S4P4IEAJIC1OsEcBID1LmEc9SD1LmEc9TT5KIUYoRj1LmEc9SiFGKEY9S5hHT/AMEiFGKEY7S5hHAyIhRihGOUuYRzlLBCIaZCBGOEuYRzhLmEcoILBHT/CAUTkgFkygRzVLmEdLIDRLmEc0S5hHNEuYRzRLmEc0S5hHT/BgUTsgoEcyS5hHMkuYRzJLmEcyS5hHMkuYRzJLmEcyS5hHMkuYRzJLmEf45wC/mB4HIAAaDkBQGg5AlWQIAI0nCAC9ZwgAbVoIANEMByDwSQIAAQAHIEFkCABMIgcgeWEIAEViCAD1YAgAWWQIAD0+CADhQggAnUMIALR8CABoBwcgzWoIAF1ACAC8fAgAnWoIAAAADkACAwID1QkIAAYCBgbhCQgA7QkIAPkJCAAABg5A/WcIAKVnCACNXQgA4V0IAClbCADVWwgAFV8IADE3CADRXAgARUoIAFlXCABxUggAXT0IAGkwCAB9WQgAyV4IAIkwCAAAI0NgA2CDYHBHELQEaAE0xywI2ENoo0IH0QAq+tGDaAEzg2AF4AAk9OcDaANEGXMEYBC8cEcCRkNowRgIexFoi0IF0AEzxysA2QAjU2BwR/8gcEcCaEBoEBoYvwEgcEcDaEBoGBoA1HBHyDD85wAAcLWEsARGMyAQS5hHAJTAIwGTACQDlAKUEyANS5hHDU0NSmlGKEYNS5hHT/AAYTQgC06wR0/wAGE4ILBHCUtcYChGCUuYRwSwcL0Av1lkCAC9ZwgAAAAKQAC9AQXhJggAlWQIAAAODkDnJQgACLUzIAFLmEcIvQC/QWQIAAi1AUYBSAJLmEcIvQAACkArJggABksbeA8rB9hZHARKEXAESkL4IwABIHBHACBwR9weByCcHgcgBksbeA8rB9hZHARKEXAESkL4IwABIHBHACBwR90eByDgHgcgCLUBS5hHCL1BPQgACLUBS5hHCL1DPQgACLUESxt4A7kIvQNLmEcDS5hH+eeJBwcgWRoIAEU9CAAQtQEkBEsccARKT/SAYQRIBEuYRyBGEL2JBwcgVU0IAOwiByC5CQgAACIBSxpwcEeJBwcgELUMSwxKmmDaiEAqKL9AIpqBCksceEyxYx4JSlL4IzCYRwNGGLkBPOSy9OcAIxhGEL0Av1QiByCsIgcg3R4HIOAeByAQtQhLHHhMsWMeB0pS+CMwmEcDRhi5ATzksvTnACMYRhC9AL/cHgcgnB4HIAVLW3giKwTRBEoDSxphASBwRwAgcEcAv1QiByD9SAgACLUjS5t4ATsQKz/Y3+gD8AkVGT4+Pj4+Pj4+Pj4+Pi08AD4hACAbS5hHG0uYRwAo+9AQIBlLmEcIvRAgGEuYRwi9ASIMIRdIF0uYRxdLmEcXS1toE/QAP/rRFUoTaEPwJUND8AUDE2D+5xBLmEcQS1toE/QAP/rRDUoTaEPwJUND8AUDE2D+5wpLmEcIvQC/VCIHICFnCAB1ZwgAeWYIAM1mCAAACg5ACQoIADUZCAAAGg5ADVoIAAVLASAYcAIiWnAAIppwA0qTYAMjk4FwR2wiByBUIgcgOLUKTEAiCkkgRgpNqEcgIyNyNyIISQTxCQCoRwdNrGAgRgdLmEeogQEgOL1sIgcg6HwIACVrCADcfAgAVCIHIBVrCAAItQdLW3gXKwPQQCsE0AAgCL0ES5hHCL0DS5hHCL0Av1QiByC1SQgA1UkIAAi1A0gDS5hHA0gES5hHCL0ZSggAuUcIAN1ICADdRwgAACIxSxpwMUtbeBA7JStW2N/oA/AeKCMtVTI3VVVVVVVVVVVVVVUTVVVVVVVVVVVVVVVVVTxBVUZLUCRLm3gEO5uyCys92CJKIEsaYQEgcEcgSh5LGmEBIHBHH0obSxphASBwRx1KGUsaYQEgcEccShZLGmEBIHBHGkoUSxphASBwRxlKEUsaYQEgcEcXSg9LGmEBIHBHFkoMSxphASBwRxRKCksaYQEgcEcTSgdLGmEBIHBHEUoFSxphASBwRwAgcEcAIHBHAL8hHwcgVCIHIB1PCADtSwgAZUsIAM1LCACRSwgAGUwIAP1MCAABUggAgVEIAAlRCABxTwgAkVAIADi1BksdaFxoBSAFS5hHBPHARARLHGAESx1gOL2sIgcg4VkIACwfByAwHwcgOLUKSxxoXWgBIAlLmEcAIwbgWhkHSQloB0gYXIhUATOjQvbTACACS5hHOL2sIgcg4VkIAMwMByC0IgcgCLUEIANLmEcDS1poA0saYAi9AL/hWQgArCIHICQfByA4tQZLHWhcaAIgBUuYRwVKKUYE8cBABEuYRzi9rCIHIOFZCADdTAgAnQkIAHC1KEscaAQ8XmidaAAjBeCZGSVKmFwlSohUATOjQvfTFfABDz3QIUscaAAmK+AD9aBiH0kJaCAOiFQE+wTyQvAFAhREATMPK/HZJeAAI/rnA/XAYhZJCWggDohUBPsE8kLwBQIURAEzDyvx2QAgEUuYR00gEEuYRzIgEEuYR00gD0uYRwE2tusVTwrSASAJS5hHFfACD9nRFfAED+bQACPi53C9rCIHILgiByDsJgcgzAwHIOFZCABBZAgAAQAHIFlkCAAAsXBHCLUES5hHAigA0Ai9ACACS5hH+ucZWggA4VkIAAi1D0tbiKErD9CiKxPQoCsA0Ai9CkvbiAQrA9AJSApLmEcIvQlLGGj55wlLmEcKIghLGnAIvQAiBksacOnnAL9UIgcgQEIPAClHCACsIgcglUcIACEfByA4tTi5DUYbSxt4C7MKKxjRACQo4BhKT/SAYRhIGEuYRzi9GEoQaBhJCmhUHAxgE0nJXIFUATOrQvPTFEuYRwQoCNANSk/0gGEMSA1LmEc4vQAj8OcAIA5LmEfy5wdLGF0MS5hHATSsQvjTOCAKS5hH5+cAvyEfByBVTQgA7CIHILkJCADMDAcgJB8HIBlaCADhWQgApUcIAFlkCAA4tT9LW3gSOyMrctjf6APwEnFxHXFxcXFxcXFxcXFxcXFxcXFxcXFxcXFxcXFxNEFxUGRaMkozSxtok2AySxlokYEAIhpgASA4vTEgL02oRwAwGL8BIC5MIHAyIKhHADAYvwEgYHAAI6Nw43AkS5xgBCKagQEgOL0lSyZKEngacCVKEnhacB5Kk2ACI5OBASA4vR9LIUoSeBpwIUoSiFpwEgqacBZKk2ADI5OBASA4vRNL24hAKx7YEUoaSZFgk4EBIDi9DkvbiEArFtgMShZJkWCTgQEgOL0JTKB4C0uYRwAwGL8BIApLGHCjYAEgoIE4vQAgOL0AIDi9ACA4vQC/VCIHICwfByAwHwcgJWQIAGwiByApHwcgKB8HILQfByCKBwcgNB8HIHQfByAItQ9Lm3gFKwrQBisO0AQrANAIvU/wQFE2IApLmEcIvU/wgFE2IAdLmEcIvU0gBkuYR/ogBUuYR00gBUuYR+jnVCIHIJVkCABBZAgAAQAHIFlkCAA4tT9L24gCKwDQOL08S5toHHhdeGos+Ng5S1uIoStf0KIrYtCgK/DRAT0SLVPY3+gF8AoQUlJSUlJSUlJSUlJSUhYlNEMAT/AgUSBGLUuYRzi9T/BgUSBGKkuYRzi9KksYaAAoAtsAISZLmEdP8EBRIEYkS5hHJEscYDi9I0sYaAAoAtsAIR9LmEdP8CBRIEYcS5hHHUscYDi9HUsYaAAoAtsAIRdLmEdP8EBRIEYVS5hHF0scYDi9FksYaAAoAtsAIRBLmEdP8GBRIEYNS5hHEEscYDi9ACEgRgpLmEc4vQAhIEYHS5hHOL0tsQEtjNEgRglLmEeI5yBGCEuYR/XnVCIHIJVkCABgBwcgXAcHIGQHByBYBwcgQWQIAFlkCAAQtRZLW4igOwQrJdjf6APwAwYJDA8AEkuYRxC9EUuYRxC9EUuYRxC9EEuYRxC9C0vaiJuJmkIP2EAqDdgAJAfgBkubaBhdCkuYRwpLGFUBNAJL24icQvPbEL0Av1QiByCJPwgAWUAIAK0/CADBPwgA1T8IAHQfByAQtRZLW4igOwQrJdjf6APwAwYJDA8AEkuYRxC9EUuYRxC9EUuYRxC9EEuYRxC9C0vaiJuJmkIP2EAqDdgAJAfgBkubaBhdCkuYRwpLGFUBNAJL24icQvPbEL0Av1QiByChPggAbT8IAOE+CADxPggAAT8IADQfByAbS9mIm4mZQjHYELUAIhlLGnAXS5poEHhUeIDqBAOD8K4DkniTQgPQASISSxpwEL0CKQvZQOoEJKT1FnObsrP1Fn8H2QEiC0sacBC9BCIJSxpwEL0DIgdLGnAgRgZLmEcgsQZLHIACIgJLGnAQvXBHVCIHILQfByAFYAgAigcHIAi1FkvaiJuJmkIN2AIqDNkDIhNLGnARS5poE3hLsQErEdABIg5LGnAIvQEiDEsacAi9DElQeAxLmEcAKPTQAiIHSxpwCL2ReFB4CEuYRwAo6tACIgJLGnAIvQC/VCIHICkfByAoHwcg4T0IAH09CAAItQNIA0uYRwNIBEuYRwi98U0IALlHCABlSggA3UcIAAxLW3gbKwXQMSsN0BorBtAAIHBHCEoHSxphASBwRwdKBEsaYQEgcEcFSgJLGmEBIHBHAL9UIgcgwVYIABVXCADNVggACLURIAVLmEcFS0/0ADLD+IAhMCGD+BETGmAIvb1nCAAA4QDgCLUSIAVLmEcFS0/0gCLD+IAhMCGD+BITGmAIvb1nCAAA4QDgCLXQ+JgyE7EBKwPQCL0DS5hHCL0CS5hH+OcAv9VSCAD5UggAcLUERgBoGUuYRwVGEPABDwPRFfACDxXRcL0gRlD4HDueafayACIxRhFLmEeU+JwyE/AED+3QACIxRgT14nAMS5hH5ucE8fAFKEYKS5hHILkCISBoCEuYR97nJGgoRgdLmEcBRiBGBkuYR3C9FyYIAMNGCAANRwgADyYIAO9GCAArJggACLUCSAJLmEcIvQC/jAcHIEFTCAAItQJIAkuYRwi9AL8sCgcgQVMIADi1BEad+BAAYWABKg7QIrECKg/QACIiYQHgACIiYQQrJ9jf6APwCxcbHiIAT/SAUiJh9OdP9ABSImHw50/0AGPjYAYoNtAHKDfQBSgV0MAjo2AU4E/0AHPjYPLnACPjYO/nT/TAY+Ng6+dP9IBj42Dn50/0AGPjYOPnACOjYAAjY2EgRg5LmEeU+JwyQ/ACA4T4nDIE8fAACk2oRwTxHACoRwT14nCoRwdKIR0gaAdLmEc4vUAjo2Dh54Ajo2De5x1TCAC5RggAAL0BBYkmCABwtQRGAPHwBQAiKEYOS5hHIGgOS5hHEPACDwDQcL0gaAtLmEcQ8AIPBNECISBoCUuYR/PnJmgoRgdLmEcBRjBGBkuYR/HnAL/DRggAEyYIABcmCAALJggA70YIACsmCAAItRwwAUuYRwi9AL/vRggAGLEBKAPRA0hwRwNIcEcAIHBHAL8sCgcgjAcHIDi1BUYAJAHgATTksgMsCNggRgZLmEcDRgAo9dANsQE98ucNuRhGOL0AI/vnLVUIABC1grAjS1yIIAojS5hHACg90OOyFCsI0BgrH9AQKwHQACAA4AEgArAQvRpL24gDKwHYACD35xdLGEycYAQhmYEcMBdLmEcgcMDzByNjcMDzB0OjcAAO4HABIOTnDUvbiAMrAdgAIN7nCksMTJxgBCGZgfAwCkuYRyBwwPMHI2NwwPMHQ6NwAA7gcAEgy+cAIMnnAL9UIgcgSVUIAGwiByAZRwgAcLWCsB1LXIggCh1LmEc4sQVG47IRKxjQEisj0BArAdACsHC9FUvbiAcr+dETTKNoHmgUS5hHoWhLeQp5iXkAkTFGKEYQTKBH6ucOS5hHKGgOS5hHKGgOS5hHASEoaA1LmEfd5wBoDEuYRyhoC0uYRwMhKGgKS5hH0ucAv1QiByBJVQgAHVMIAO1TCAD5JQgA5yUIAAsmCAD/JQgA7SUIAA8mCAAItQFLmEcIvR1WCAAQtQAkB+CQ+Jwyb/PDA4D4nDIBNOSyAywR2CBGCEuYRwAo9tAHS1uII0ET8AEP6tCQ+JwyQ/AIA4D4nDLp5xC9SVUIAFQiByA4tQ1LWIgACgxLmEeQsQVGCUvaiJuJmkIM2AAkBuAGS5toGV0oRgZLmEcBNAJL24icQvTbOL0Av1QiByBJVQgAvVQIABC1ACQB4AE05LIDLAfYIEYGS5hHACj20AVLmEfz5wVIBUuYRwVIBkuYRxC9SVUIAB1TCADpVwgAuUcIAJFSCADdRwgAELUAJAHgATTksgMsDtggRgtLmEcAIgtLGlUAKPPQkPicMsPzwAMHShNV7OcGSwVKmmDaiAQqKL8EIpqBASAQvUlVCABsIgcgVCIHIDi1FUtbeBsrBdAxKx/QGisE0AAgOL0RS5hHOL0OS1iIAAoPS5hHBUagsQAkBeAoRgxLmEcMSxhVATQHS9uInEL10wVLCEqaYJyBASA4vQdLmEc4vQAgOL1UIgcgeVUIAElVCAAdVQgAbCIHIJ1XCAAItQVLmEeQ+JwyQ/AEA4D4nDIBIAi9AL9JVQgACLUGS5hHkPicMm/zggOA+JwyACICSxpwCL0Av0lVCAC1Hwcg+LUHRhVLmEcBIhVLGnCQ+JwyA/AGAwYrAND4vQZGOEYQS5hHC+AQSxldMEYPS5hHATSksqVC9tg4RgpLmEcAKOvQsPUAfyi/T/QAcAVGAkYFSThGBkuYRwAk6+dJVQgAtR8HIOUECAC4HwcgvVQIAD0HCAAwtYOwDEYUS5hHkPicMhPwBA8J0AVGIWijeQU727KbAduyYnkEKgHZA7AwvQCTACMaRgpMoEcoRglLmEcQ8AEP8tEoaAdLmEcoaAdLmEcBIShoBkuYR+fnSVUIAO1TCAATJggA+SUIAOclCAALJggAcLUAJA/gMEYRS5hHAUYgRhBLmEcF9eJ2MEYPS5hHACjx0QE05LIDLBHYIEYLS5hHBUYAKPXQkPicMgPwBgMGK+/RIEYGS5hHACjj0enncL3vRggAgQgIAA1HCABJVQgAbQgIABC1BEYGS5hHBksbeDO5BUsccAEkBEuYRyBGEL0AJPnn3WEIALghByAZYggAACIBSxpwcEe4IQcgAUsYeHBHAL+4IQcgCLVP9MgST/AgUQtIC0uYR7D1yB8F0ApKE3gBM9uyE3AIvU/0AGJP8CBRBkgDS5hHACjw0PTnAL8AEg5AUWIIALohByAAEA5ACLVP8EBRBCABS5hHACAIvZVkCAAQtYawjfgEAAAjjfgFMI34BjABIwKTA5EEkxgjjfgUMAhLG3hTuQdMASMjcAGpBkgGS5hHACMjcAawEL1P8P8w+ucAv5geByAAwAhAaQsIABC1iLCN+AcQjfgMAAAjjfgNMI34DjABIwSTDfEHAgWSBpMYI434HDAISxt4U7kHTAEjI3ADqQZIBkuYRwAjI3AIsBC9T/D/MPrnAL+YHgcgAMAIQAkMCAAt6fBDg7ANICBMoEcMIKBH3/iQkB5MSkZP9MgRIEbf+IiAwEcbTwCXUCNP9MgSDSEgRhlOsEdP9MgRIEYXTahHpPUAdEpGT/QAYSBGwEcAl1AjT/QAYgwhIEawR0/0AGEgRqhHDktP9ABSw/iAIL/zT4+/82+Pw/iAIZAhg/gNExpgACADsL3o8IMAv71nCAAAEg5AJVoIAMFlCADfYggAAOEA4AoAAChxYwgA8LWDsAchCiAjS5hHA0YQsRhGA7DwvVAhDSAfS5hHA0YAKPXRT/AgURcgHEygRxxNHEsAk1AjT/QAAgshKEYaT7hHT/QAAShGGE2oRxhJNyCgRxhOGEsAkwAjT/QAAgwhMEa4R0/0AAEwRqhHE0tP9ABiGmBP9IBSGmBP8EBRACCgR0/wYFEBIKBHT/BAUTsgoEcBI7znAL/RWggAlWQIAAAODkAZXQgAwWUIAN9iCAALAAAoABAOQFVdCAAA4QDgALWDsAKpACMB+AE9ASADS5hHnfkHAAOwXfgE+4FaCAAItQRLG3gLuQAgCL0AIAJLmEf557khByBxZAgACLU7IARLmEcBIARLmEcAIgNLGnAIvQC/QWQIAF1ACAC5IQcgCLU7IARLmEcAIARLmEcBIgNLGnAIvQC/WWQIAF1ACAC5IQcgCygA0HBHsfWAP/vRCLVP9IAyT/AgUQVIBUuYRwCxCL0BIgRLGnAES5hH+OcADg5AUWIIALkhByD1XAgACLVP9AACT/AgUQZIBkuYRxCxBkuYRwi9ACIFSxpwBUuYRwi9ABAOQFFiCADRXAgAuSEHIPVcCAAQtRsgDUuYRw1MT/QcIgAhIEYMS5hHT/QkcgAhIEYKS5hHT/SkcgAhIEYIS5hHACEgRgdLmEcAIBC9AL+9ZwgAAAAIQFkKCACBCggAeQoIAHEKCAA4tcDxZARP9CRyAvsE9AhIoPsENGQJB00AIShGBkuYRyJGACEoRgVLmEcAIDi9AL8fhetRAAAIQIEKCAB5CggAELUfS5hHBEYIuW/wNwRALCTcNiwt3RtLG3gBIBpLmEcAIBpLmEcyLKi/MiRksiMsuL8jJCM8ZCAA+wTwFEyk+wAwwAhjKCi/YyAQsV4oANhfIMCyD0uYRwAgEL0OS5hHASAISxhwCEuYRwAgB0uYR9nnASAFS5hHACADS5hH0ueVXAgAuSEHIFlkCABBZAgAiYiIiOFdCAD1XAgAACABSxhwcEe6IQcgCLU6IA5LmEcAMBi/ASANSxt4mEIO0DogCUuYR1ixASAJS5hHOiAGS5hHADAYvwEgBEsYcAi9ACADS5hH8ucAvyVkCADQDAcgXUAIABC1HCAVS5hHFUxP9EBCASEgRhRLmEcUSgEhIEYTS5hHASEgRhJLmEcBISBGEUuYRxFLT/CAUsP4gCC/80+Pv/Nvj8P4gCGAIYP4HBMaYBAiASEgRglLmEcAIBC9vWcIAAAACEBZCggAoDegAIEKCABxCggAkQoIAADhAOCJCggACLUBIQ1IDkuYRxDwEA8A0Qi9DEuYRwxLGmgBMhpgG2gT8AcPB9AISxtoE/APD+/RBkuYR+znBkuYR/TnAAAIQJEKCAC1XAgAvCEHIL1eCAAhXggAAwlD6gATW7JYQMCygOqQAIDqUAAA8AEAcEcAADVLG3gAK2LRASIzSxpwoPUWc5uys/WWb1rYsPWWb1nYELWMsKD1FnAsS4P7ACPEF8TrowTkso34L0AgRihLmEcYuWTwfwSN+C9AACON+BgwjfgZMI34GjABIweTDfEvAgiSCZM0I434KDAGqR1IHkuYRyCxACAYSxhwDLAQvQAjjfgAMI34ATCN+AIwASMBkw3xFwICkgOTNCON+BAwaUYQSBJLmEdIuZ34FyCd+C8wmkIH0AAgCEsYcN7nACAGSxhw2ucAIgRLGnABINXncEcAIHBHACBwR5geByBnZmZm6V8IAADACEAJDAgAaQsIADC1hbAUTSlGESAUTKBHKUYSIKBHACMDk0zyUDICkjQijfgMIA5KAZKN+A0wFiANS5hHAakMSA1LmEcDJAAsB91A8kxACkuYRwNGELkBPPXnACMYRgWwML0BAAAIlWQIAAC9AQW9ZwgAAMAIQIkMCAAFYAgAcEcAAAi1AUuYRwi9EWgIAAi1DkgOS5hHPiEAIA1LmEcNS5hHACj70AxLmEcMSg1LmmINS5hHACj70BAgC0uYRwtLmEcBSAJLmEcIvQC9AQVFAQcgIWcIAHVnCACFZwgAAT8NIAAGDkCVZwgAzWYIAMFoCAALSxtoK7nv8xCDO7EAIglLGnAHShNoATMTYHBHcra/81+PACIESxpwASICSxpw8OfAIQcgxCEHINEMByAHSxpoAToaYBtoQ7kFSxt4K7EBIgRLGnC/81+PYrZwR8AhByDEIQcg0QwHIHBHCrkBZnBHQWZwR7HxQF8H0LHxYF8E0MNrE0ID0AEgcEeDa/nnACBwR0JksfGAXxbQC9hJsbHxAG8F0QFvA28h6gIBC0ADZ0JgcEex8UBf+9Cx8WBf+NCx8SBf9NFwRwNvE0MDZ+/nEvAQDxLQwPiwEBLwIA8H0MD41BAS8EAPBdDA+MAQcEfA+NAQ9ufA+MQQcEfA+LQQcEcBZHBHQWRwRwAAcLUERg1GFkYNS5hHBvABAilGIEYLS5hHFvAKDwnQJWIW8AIPB9EW8AgPBtDE+IRQA+BlYvTnxPiAUGVhJWBwveNiCABHYggA+LUERg1GFkYfRglLmEcGmilGIEYHS5hHL7ElZS65ZWMlYSVg+L1lZfjnJWP45wC/42IIAEdiCADAbHBHgGxwR3C1grAFRg5GFEYC8PBDs/EgXynQEtiz8QBvF9Cz8YBfEtEKRk/wgFEaS5hHBPABAjFGKEYYS5hHASAT4LPxQF8W0LPxYF8T0AAgC+AKRk/wAGEQS5hHBPABAjFGKEYOS5hHASACsHC9DEuYRwEg+ecE8GBSBPABAwCTxPOAA7LxYF8UvwAiASIxRihGBEygRwEg5+dvYggAR2IIAOliCAAxYwgAQAkA9QAQAPIHcEACcEcAABC1BEYES5hHwGsE8B8E4EAA8AEAEL0AvxVkCAAQtQRGA0uYRwTwHwQBI6NAA2MQvRVkCAAQtQRGA0uYRwTwHwQBI6NAQ2MQvRVkCAAQtQRGBkuYR4JrBPAfBAEjo0AaQgHRA2MQvUNjEL0AvxVkCADwtYOwBEYNRi1LmEcGRgXw8EOz8SBfM9AX2LPxAG8c0LPxgF8X0QTwHwQBJwf6BPQiRk/wgFEjS5hHBeoHAiFGMEYhS5hHOEYY4LPxQF8h0LPxYF8e0AAgEOAE8B8EAScH+gT0IkZP8ABhFkuYRwXqBwIhRjBGFEuYRzhGA7DwvQTwHwEBJCpGBPoB8Q9LmEcgRvPnBPAfAQEkBfBgUgXqBAMAk8XzgAOy8WBfFL8AIgEiBPoB8TBGBU2oRyBG3ecVZAgAb2IIAEdiCADpYggAMWMIAPi1BEYORhFLmEcFRiBGEEuYRwVAAdAAJAPg+L0BNAYsEdiNsSMBC0rQWLBC9tEC6wQTWWgNQvHQH0bbaJhHe2gl6gMF6uf4vfi9AL9pYwgAbWMIAMghByD4tRZMJ2gGLybYACQB4AE05LKkRqdCCtMRTiUBBusFDnVZjULz0d74BFCVQu/RzvgAEM74BCDO+AgwBpnO+AwQATe8RQXQEUYaRgZLmEcAIPi9AkkPYPbnASD4vTgiByDIIQcgrWIIAAi1CyEBSAJLmEcIvQAODkBpZQgACLUMIQFIAkuYRwi9ABAOQGllCAAItQ0hAUgCS5hHCL0AEg5AaWUIAAi1DiEBSAJLmEcIvQAUDkBpZQgAE0oTayPwAwND8AEDE2NP9ABjD0qSbhLwCA8C0ZuxATv35wtKE2sj8HADGEMQY0/0AGMHSpJuEvAIDwLRK7EBO/fnACBwRwEgcEcBIHBHAL8ABg5AE0oTayPwcAMYQxBjT/QAYw9Kkm4S8AgPAtGjsQE79+cLShNrI/ADA0PwAgMTY0/0AGMHSpJuEvAIDwLRK7EBO/fnACBwRwEgcEcBIHBHAL8ABg5A0LkRShNqI/RcEyPwAwMJAomyC0ND9FwTQ/ABAxNiCkubbhPwAQ/60AdKE2pD8JtzQ/SAMxNicEcDSQtqA0oaQANLE0MLYnBHAAYOQPz/yP4CADcBAkuYbgD0gDBwRwC/AAYOQE/wAFIBS5picEcAvwAGDkACS5huAPACAHBHAL8ABg5AT/REEgNL2mECS5tuE/BAD/rQcEcABg5AAPB/AAVLw/gMAdP4DCFC8BAiw/gMIQAgcEcAvwAGDkAA8H8ABUvD+AwB0/gMIUL0gFLD+AwhACBwRwC/AAYOQE/0gHMD+gDwAUsYYHBHAL8ABg5AICIBS1pgcEcABg5AwPMSAAJLGm8QQxhncEcAvwAGDkACSxh4gPABAHBHAL88Igcg/ucAAAi1FUsVSppCCdATSxNKA+ARaBlgBDMEMhFJi0L40xFLAuAAIhpgBDMPSpNC+dMPSyPwYEIi8H8CDUmKYAPxYEOz9YAfA9KLaEPwAFOLYAlLmEcJS5hH/ucAAAcgrH0IADwNByA8DQcg8CoHIAAACAAA7QDgLWoIAHFECAA+SxtrA/ADAwMrP9jf6APwAhEtLTpLW2kT8IAPBNBP9ABCOEsaYDHgT/T6QjVLGmAs4DJLG2oT8IB/A9AySjFLGmAj4DFKL0saYCxLG2oD8HADECsF0CArGNErSilLGmAU4CtKJ0saYBDgJEsbahPwgH8a0CRKI0saYCBLG2sD8AMDAisk0CNKHksaYBtLG2sD8HADcCsp0BhLGmvC8wISGEkLaNNAC2BwRxhKFUsaYBJLG2oD8HADECsF0CAr3NERShBLGmDY5xFKDksaYNTnCkiCasLzCkIKSQtoAvsDM4Jq0rKz+/LzC2DP5wVKE2gJSaH7AxNbCBNgcEcABg5AEBoOQNQMByAAG7cAAAk9AAASegAAHE4Oq6qqqgpLG2hTsQlLG2gaGAhJkUII2xBGBUoQYBhGcEcFSgNLGmDw50/w/zBwRwC/QCIHIPx/CCDAQAcgT/D/MHBHT/QAU0tgACBwRwEgcEcAIHBHcLUAJQxODUykG6QQpUIJ0QHwpvkAJQpOCkykG6QQpUIF0XC9VvglMJhHATXu51b4JTCYRwE18ueYfQgAmH0IAJh9CACcfQgAELVDHgpEkUIA0RC9EfgBSwP4AU/35wNGAkSTQgDRcEcD+AEb+ecAAA+0CksTtRxoJLGjaRO5IEYA8JD4BasEmqFoIEYBkwDw6foCsL3oEEAEsHBH2AwHIA60T/QCcQC1nLCt+BQQb/AAQQSRB5FP9v9xHasCkAaQCEhT+AQrrfgWEABoAqkBkwDwrPkAIgKbGnAcsF34BOsDsHBH2AwHIANGE/gBKwAq+9EYGgE4cEdwtQRGArlwvSNGEfgBW1YeA/gBWx25FESjQgPRcL0cRjJG7+cD+AFb9ucAAAFJAPCpuAC/aXkIAAAjELUERgNgQ2CDYIGBQ2bCgQNhQ2GDYRlGCCJcMP/3hv8FSyRiY2IES6NiBEvjYgRLI2MQvQC/DXYIAC92CABndggAi3YIAHC1aCVKHlVDDkYF8XQBAPCX+ARGQLEAIYDoQgAMMKBgBfFoAv/3X/8gRnC9g2kQtQRGM7uDZMNkA2USSxJKG2iCYphCBL8BI4NhAPAf+GBgIEYA8Bv4oGAgRgDwF/gAIuBgBCFgaP/3p/8BIgkhoGj/96L/AiISIeBo//ed/wEjo2EQvfR8CABRawgA+LUcSwdGHmizaRO5MEb/98f/SDa0aHNoATsD1TNoM7E2aPfntPkMUG2xaDT05wQhOEb/95//MGAAKPHRDCMERjtgIEb4vU/2/3PjgQEjZWajgSVgpWBlYCVhZWGlYQgiKUYE8VwA//f4/mVjpWOlZOVk5uf0fAgALen4Q4BGiUYAJgDxSAQUuTBGvej4g6VoZ2gBPwHVJGj156uJASsH2bX5DjABMwPQKUZARshHBkNoNe7ncLXNHCXwAwUINQwtOL8MJQAtBkYB26lCA9kMIzNgACBwvQDw9/4jShRoIUaRuSJMI2gbuTBGAPBn/CBgKUYwRgDwYvxDHCbRDCMwRjNgAPDi/uTnC2hbGxrUCysP2QtgzBjNUDBGAPDW/gTxCwAjHSDwBwDDGhvQWkLiUHC9jEILv2NoS2gTYGNgGL8MRunnDEZJaMrnxBwk8AMEoEIF0CEaMEYA8DD8ATDN0CVg2edwvQC/RCIHIEgiByAt6fBHjmiCRp5CDEaRRphGNdiKiRL0kG8x0AIjJWgJaW8aZWkF60UFlfvz9QjxAQM7RJ1COL8dRlMFMdUpRv/3gf8GRlC5DCPK+AAwo4lP8P8wQ/BAA6OBvejwhzpGIWn/9zj+o4kj9JBjQ/CAA6OBJmE+RCZgRkZlYe0bpWBGRSi/RkZJRjJGIGgA8Ev+o2gAIJsbo2AjaB5EJmC96PCHKkYA8Kf+BkYAKOHRIWlQRgDwVP7H5wAALenwT52wA5OLiYBGHAYNRhZGD9ULaWu5QCH/9zf/KGAoYSi5DCPI+AAwT/D/MMTgQCNrYQAjCZMgI434KTAwI0/wAQuN+CowN0Y8RhT4ATsAKzzRt+sGCgvQU0YyRilGQEb/93H/ATAA8KKACZtTRAmTO3gAKwDwm4AAI0/w/zIEkweTBZIGk434UzAakwUiIXhQSADw3P1nHASb2LnZBkS/ICKN+FMgGgdEvysijfhTICJ4KioW0AAhCiAHmidGO3gBNDA7CStQ2cmxEeAlK8DQJ0a55z9KPEaAGgv6APAYQwSQ0+cDmhEdEmgDkQAqAdsHkgTgUkJD8AIDB5IEkzt4LisN0Xt4eRwqKzLRA5sCNxodG2gDkgAruL9P8P8zBZMtTAMiOXggRgDwkf04sUAjABsD+gDwBJsBNwNDBJM5eAYiJUh+HI34KBAA8ID9ACg10CJL+7kDmwczI/AHAwgzA5MJm0tECZNt5wD7AjIBIaTnACMKJBhGBZMPRjp4ATEwOgkqA9kAK8rQBZDI5wT7ACABI/HnA6sAkypGEUsEqUBGr/MAgLDx/z+BRtnRq4lbBj/1Oa8JmB2wvejwjwOrAJMqRgdLBKlARgDwwvnq5wC/WH0IAF59CABifQgAAAAAAKFtCACTaBC0ATsAK5NgCNqUaaNCAtvLsgorAtEQvADwG7sTaFgcEGAZcMiyELxwR/i1BkYPRhRG1RisQgHRACAH4DpGFPgBGzBG//fb/0Mc89H4vS3p8E+dsAxGF0YDkwZGGLGDaQu5//eU/XxLnEJX0XRoo4kYB13VI2kAK1rQACMJkyAjjfgpMDAjT/ABC434KjC4RkVGFfgBOwArVdG46wcKC9BTRjpGIUYwRv/3v/8BMADwxIAJm1NECZOY+AAwACsA8LyAACNP8P8yBJMHkwWSBpON+FMwGpMFIil4YEgA8MP8BfEBCASbACgx0dkGRL8gIo34UyAaB0S/KyKN+FMgKngqKizQACEKIAeaqEaY+AAwATUwOwkrbdlxsybgUUucQgHRtGij509LnEIIv/RonuchRjBGAPDx+gAontBP8P8wHbC96PCPJSun0KhGoOdDSkVGgBoL+gDwGEMEkLvnA5oRHRJoA5EAKgHbB5IE4FJCQ/ACAweSBJOY+AAwLisQ0Zj4ATAI8QEBKis30QObCPECCBodG2gDkgAruL9P8P8zBZMxTQMimPgAEChGAPBb/ECxQCNAGwP6APAEmwjxAQgDQwSTmPgAEAYiKEgI8QEHjfgoEADwR/wAKDTQJUsDuwObBzMj8AcDCDMDkwmbS0QJk0znAPsCMgEhhucAIwolGEYFk4hGmPgAIAExMDoJKgPZACvF0AWQw+cF+wAgASPw5wOrAJMiRhNLBKkwRq/zAICw8f8/gUbY0aOJWwY/9X2vCZh85wOrAJMiRgpLBKkwRgDwivjs5wC/GH0IAFh9CAA4fQgA+HwIAF59CABifQgAAAAAAG1wCAAt6fBHkUYfRopoC2kGRpNCuL8TRsn4ADCR+EMgDEbd+CCAErEBM8n4ADAjaJkGQr/Z+AAwAjPJ+AAwJWgV8AYFB9EE8RkK42jZ+AAgmxqdQirblPhDMCJoADMYvwEjkgYv1ATxQwI5RjBGwEcBMCLQI2jlaAPwBgMEKxi/ACXZ+AAgT/AACQi/rRqjaCJpCL8l6uV1k0LEv5sa7RgaNE1FG9EAIL3o8IcBI1JGOUYwRsBHATAD0U/w/zC96PCHATXB5zAg4RiB+EMAWhyU+EUQIkQCM4L4QxDD5wEjIkY5RjBGwEcBMObQCfEBCdfnAAAt6fBDF0YKfoWwbiqYRgZGDEYMmwHxQw4A8LyAGthjKi7QCtgAKgDwyIBYKgDwioAE8UIFhPhCICrgZCoB0Gkq9tEhaBpoEfCADyPQER0ZYBNoJ+BzKgDwtIAI2G8qKtBwKuXRCmhC8CACCmAD4HUqIdB4KtzReCJvSYT4RSBk4BpoAfFCBREdGWATaIT4QjABI6PgEfBADwLxBAEZYNfQsvkAMAArA9otIltChPhDIGJJCiIX4CBoGWgQ8IAPA9AIHRhgC2gG4BDwQA8B8QQAGGD30AuIbyoUvwoiCCJXSQAghPhDAGVoAC2lYMDynIAgaCDwBAAgYAArP9EALUDwlYB1RggqC9EjaNoHCNUjaWJomkLevzAjBfgBPAXx/zWu6wUDI2HN+ACAO0YDqiFGMEb/9+3+ATBV0U/w/zAFsL3o8IOB+EUgPEkiaBhoEvCADwDxBAUdYAHQA2gC4FUG+9UDiNAHRL9C8CACImAbuSJoIvAgAiJgECKx53VGs/vy8AL7EDPLXAX4AT0DRgAo9dG35whoGmgQ8IAPSWkE0BAdGGATaBlgB+AQ8EAPAvEEABhgE2j20BmAACN1RiNhsecaaBEdGWAVaAAhYmgoRgDwlPoIsUAbYGBjaCNhACOE+EMwn+cjaSpGOUYwRsBHATCi0CNomwcH1QAlBPEZCeNoA5qbGp1CBdvgaAObmEK4vxhGk+cBI0pGOUYwRsBHATCK0AE16+cAK6fRC3gE8UIFhPhCMGXnen0IAGl9CAA4tQAjBUwFRghGI2D/9/D5QxwC0SNoA7ErYDi97CoHIBC1DEax+Q4QAPDk+gAoq79jbaOJGxgj9IBTrL9jZaOBEL0t6fBBH0aLiQVG2wUMRhZGBdUCIwAisfkOEADwuPmjiTJGI/SAU6OBtPkOEDtGKEa96PBBAPBpuBC1DEax+Q4QAPCl+UMco4kVv2BlI/SAU0P0gFOjgRi/o4EQvbH5DhAA8NO4AAD4tQ5GFEYFRhixg2kLuf/3lfohS5xCKtFsaKNpo2CjiRoHLtUjaWOzI2kgaPaywBpjaTdGmEIE2yFGKEYA8Er5KLujaAEwATujYCNoWhwiYB5wY2mYQgTQo4nbBxnVCi4X0SFGKEYA8DX5kLEP4AtLnEIB0axo0OcJS5xCCL/saMvnIUYoRgDwH/gAKMzQT/D/NzhG+L0Avxh9CAA4fQgA+HwIADi1BUYIRhFGACIFTCJgGkYA8JD6QxwC0SNoA7ErYDi97CoHIDJLcLUdaAZGDEYlsatpE7koRv/3L/ouS5xCD9FsaLT5DDCashUHLNTQBhHUCSIyYEPwQAOjgU/w/zBwvSVLnEIB0axo6+ckS5xCCL/saObnUQcS1WFrQbEE8UQDmUIC0DBGAPCd+QAjY2OjiSPwJAOjgQAjY2AjaSNgo4lD8AgDo4EjaUu5o4kD9CBzs/UAfwPQIUYwRgDwGfmiiRLwAQMM0AAjo2BjaVtCo2EjaVO5tPkMMBPwgAC60XC9kgdYv2Npo2Dy5wAg9+cAv9gMByAYfQgAOH0IAPh8CAA4tQAjBUwFRghGI2D/9+b4QxwC0SNoA7ErYDi97CoHIIqJLenwQQVGEAcMRlrUS2gAKwXcC2wAKwLcACC96PCB5moALvnQACMS9IBSL2grYDPQYG2jiVoHBdVjaMAaY2sLsSNswBoAIwJG5mohaihGsEdDHKOJBtEpaB0pS9grSspA1gdH1QAiYmAiadkEImAE1UIcAdEraAO5YGVhay9gACnK0ATxRAOZQgLQKEYA8An5ACBgY73o8IEhagEjKEawR0EcxtEraAArw9AdKwHQFisB0S9gsOejiUPwQAOjgb3o8IEPaQAvp9CTBxi/ACMOaAi/S2mm6wcID2CLYLjxAA+a3UNGOkYhaihGpmqwRwAoB9yjiUPwQAOjgU/w/zC96PCBB0So6wAI6OcBAEAgOLULaQVGDEbbsRixg2kLuf/3KvkMS5xCCdFsaLT5DDB7sSFGKEa96DhA//dhvwdLnEIB0axo8ecFS5xCCL/saOznACA4vQC/GH0IADh9CAD4fAgAOLUFRghGEUYAIgVMImAaRv/3LPhDHALRI2gDsStgOL3sKgcgcLUORrH5DhCQsAApFEYdRgfaACMrYLOJGgYQ1E/0gGMO4AGqAPD++AAo8tsCmgL0cEKi9QBTWkJaQSpg7udAIwAgI2AQsHC9i4lztZ0HBkYMRgfVBPFHAyNgI2EBI2NhArBwvQGrakb/98r/AJkFRjBG//dH+Ui5tPkMMJoF79Qj8AMDQ/ACA6OB4+cNS7Nio4kgYEPwgAOjgQCbIGFjYQGbW7G0+Q4QMEYA8M34KLGjiSPwAwND8AEDo4GjiR1DpYHN51FrCAAQtcmyAkSQQgNGAdEAIBC9HHgBMIxC9tEYRhC9iEIQtQHrAgMD2EIemUIM0RC9mEL50oEY0hrTQgDREL0T+AFNAfgBTffnEfgBSwL4AU/r53BHcEc4tQVGAClD0FH4BDwMHwAruL/kGP/38v8eShNoEEYzuWNgFGAoRr3oOED/9+i/o0IL2SFoYhiTQgG/GmhbaFIYImBjYARg7ecTRlpoCrGiQvrZGWhYGKBCC9EgaAFEWBiCQhlg3tEQaFJoAUQZYFpg2OcC2QwjK2DU5yBoIRiKQgG/EWhSaAkYIWBiYFxgyec4vQC/RCIHIPi1B0YURg5GIbkRRr3o+ED/9564Irn/96f/JUYoRvi9APBI+IRCD9khRjhG//eQ+AVGACjy0DFGIkb+91H/MUY4Rv/3kf/p5zVG5+c4tQVGCEYRRgAiBUwiYBpGAPA0+EMcAtEjaAOxK2A4vewqByA4tQAjBkwFRghGEUYjYP73Av9DHALRI2gDsStgOL0Av+wqByA4tQAjBUwFRghGI2D+9/b+QxwC0SNoA7ErYDi97CoHIFH4BAwAKKDxBAC8vwtYwBhwRwAAWCICS0/w/zAaYHBH7CoHIFgiAktP8P8wGmBwR+wqByAAAAAAAAAAAACqqqqqqqqqqu7u7u7u7u7u/v//////////////f7/f7/f7/fx+v9/v9/v9fgAAACUwOHgAAAAAU2V0dGluZyB1cCBGUEdBIENvbW11bmljYXRpb24KAABNYXIgMzAgMjAyMgAwMjo0ODo0MQAAAADcDAcgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAIy0wKyAAaGxMAGVmZ0VGRwAwMTIzNDU2Nzg5QUJDREVGADAxMjM0NTY3ODlhYmNkZWYAAPi1AL/4vAi8nkZwRxkBCAD4tQC/+LwIvJ5GcEf1AAgAv/NfjwE4+9FwRwAAcLSDsAadGkygQhLQT/RAJluzBGhE9IA0BGDJskHwtEFBYIFoAZEBmRHwAQ/50QAhB+BP9AAm6+dW+CFAQ/ghQAExqUL409KyQvC0QkJgg2gBkwGbE/ABD/nQA2gj9IAzA2AAIAOwcLxwRwIg+ucAvwAKDkABYHBHgrBBYINoAZMBmxPwAQ/50AGYAPAGAAKwcEcAv0/0gGMgShNgAvUAchNgH0sbahPwgH8H0R1KHEsaYhtLm24T8AEP+tAaShhLGmIXS5tuE/SAP/rQFEoTayPwAwND8AEDE2MRS5tuE/AID/rQEUoOS5piDUubbhPwAg/60BEiCksaYwlLm24T8AgP+tASIgZLGmMFS5tuE/AID/rQBkoHSxpgcEcACg5AAAYOQAkINwAJCDcBAT8NIAC9AQXUDAcgHkuYQhPZHkuYQhfZHUuYQhzZHUuYQiHZHEuYQibZT/SgYxtKE2AC9QByE2BwRwAjF0oTYAL1AHITYHBHT/SAcxNKE2AC9QByE2BwR0/0AHMPShNgAvUAchNgcEdP9EBzC0oTYAL1AHITYHBHT/SAYwdKE2AC9QByE2BwR7/qIQF/8PoC/4/QA/+zxAR/Sl0FAAoOQEkCCABhAQgAjQEIAHUBCAAAAAAAGQYIAL0ECABxAQgAdQEIAJkECAAhCQgARQkIAF0JCAAVCQgAAAAAAAAAAAAAAgAAAAAAAAAAAAAAAAAbAAAAGgAAABkAAAAcAAAAZwAAAGgAAABpAAAAZgAAAAAAAAAAAAAAAAAAAAAAAAAABQ8hAAEcEAUA32Dd2IlFx0yc0mWdnmSKnwAAAwZKAQEAAAAACgAAAAAAAwZKAQgAAgAAAKAAFAADAFdJTlVTQgAAAAAAAAAAAACEAAQABwAqAEQAZQB2AGkAYwBlAEkAbgB0AGUAcgBmAGEAYwBlAEcAVQBJAEQAcwAAAFAAewAwAEEAQwBFADIAQgAzAEUALQAyAEIAMwBFAC0AMgBCADMARQAtADIAQgAzAEUALQA0ADMAMQAwADAAQQBDAEUAMgBCADMARQB9AAAAAAAIAAIAAQCgABQAAwBXSU5VU0IAAAAAAAAAAAAAhAAEAAcAKgBEAGUAdgBpAGMAZQBJAG4AdABlAHIAZgBhAGMAZQBHAFUASQBEAHMAAABQAHsAMQBBAEMARQAyAEIAMwBFAC0AMgBCADMARQAtADIAQgAzAEUALQAyAEIAMwBFAC0ANAAzADEAMAAxAEEAQwBFADIAQgAzAEUAfQAAAAAAAAAAAwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAEAwkETmV3QUUgVGVjaG5vbG9neSBJbmMuAAAAQ2hpcFdoaXNwZXJlciBDVzMxMCAtIEJlcmdlbiBCb2FyZAAAAAIHIAACByAQBwcgeAQHIBAHByAkBwcgcAQHIAAAAADIBQcgMAcHIIAEByAwBwcgCQKkAAUBAID6CQQAAAL///8ABwWBAkAAAAcFAgJAAAAICwECAgIAAAkEAQABAgIAAAUkABABBCQCAgUkBgECBSQBAwIHBYcDQAAQCQQCAAIKAAAABwWDAkAAAAcFBAJAAAAICwMCAgIAAAkEAwABAgIAAAUkABABBCQCAgUkBgMEBSQBAwQHBYgDQAAQCQQEAAIKAAAABwWFAkAAAAcFBgJAAAAJAjcAAgEAgPoJBAAAAv///wAHBYECQAAABwUCAkAAAAkEAQAC////AAcFhQIAAgAHBQYCAAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAkCpAAFAQCA+gkEAAAC////AAcFgQIAAgAHBQICAAIACAsBAgICAAAJBAEAAQICAAAFJAAQAQQkAgIFJAYBAgUkAQMCBwWHA0AAEAkEAgACCgAAAAcFgwIAAgAHBQQCAAIACAsDAgICAAAJBAMAAQICAAAFJAAQAQQkAgIFJAYDBAUkAQMEBwWIA0AAEAkEBAACCgAAAAcFhQIAAgAHBQYCAAIACQI3AAIBAID6CQQAAAL///8ABwWBAgACAAcFAgIAAgAJBAEAAv///wAHBYUCAAIABwUGAgACAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAASAQACAAAAQD4rEMMACQECAwEAAAoGAAIAAABAAQAAAAACByDYAQcg7AEHINgBByDsAQcgAAAAAAEAAAAAAAAAAAAAAAAAAAD/////////////////////MDAwMDAwMDAwMDAwREVBREJFRUYAAAAAAAAAAAAAAAAAAegDAIAJQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAJAAAAAMAJQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAEAAAAJAAAAAAAAYAEBAAAACT0A3AwHIAAAAAAYfQgAOH0IAPh8CAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA==',
-
-}
+    return default_store().getsome("cwbergen", item, filelike)
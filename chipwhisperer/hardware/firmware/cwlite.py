@@ -1,24 +1,6 @@
-# This file was auto-generated. Do not manually edit or save. What are you doing looking at it? Close it now!
-# Generated on 2023-04-18 17:45:14.669034
-#
-import binascii
-import io
+# Firmware/bitstreams for cwlite, stored in firmware.cwfw (see fwstore.py)
+from .fwstore import default_store
 
-fwver = 0, 65
+fwver = list(default_store().fwver("cwlite"))
 def getsome(item, filelike=True):
-    data = _contents[item].encode('latin-1')
-    data = binascii.a2b_base64(data)
-    if filelike:
-        data = io.BytesIO(data)
-    return data
-
-_contents = {
-
-#Contents from ../../../../hardware/capture/chipwhisperer-lite/cwlite_firmware.zip
-'cwlite_firmware.zip':'UEsDBBQAAAAIAAcZj1Q3tkrrCSUAANp8AAAVABwAY3dsaXRlLWdsaXRjaG9mZnNldC5wVVQJAAOd4VhiondWYnV4CwABBOkDAAAE6QMAAO1dza4mOVLd36dg1725jMMO/61BQrVALPoBRkVNTTOixRRTBZrHx44Tzjj+qiV+RmwQi1Z1+ubncNqRx47j48gff/clvf30w5ePf/r2w9sXWf/bvv7y5/ntX38W1VWS377+9MO/f/zl3z5/XVfl7cfffdG3D+ntx1++1LcfP+T89kGy6nz79qW9fVwF5e1DWRfdLtatQ2Ze18Ou63M97bo915KsoEeBWMHY9eeZdkm2kvn2YVuTsq9KevugKlagViDRIKlWspu4myTWwFLChDWyRCPFWlmilWLNLNHMbM0s0cxszSwjCqyVZUaBNVRTFFhDVaLA2qk5CqylGi3N1lKNlmZrqUZLs7VUo6XFWqrR0mIt1Wjp6piPXz/IHsrVKWiirIrXX6yF0lZBsTsrrleT80jrahU1FK3ntEtroPRdxSz40djVZ6t+nurTevhvXzQ99bd9q8pTf0tiJTmq7/u6PPXr6PiR7vrLrl/rqV+q/ak99av9uj/119Tz9g0dj4HV2+t6PgZ66bukpl2/mqeL15+T7v6pOeq3Wwu1H85aNerfj1xrdNAoYre0baCagX4MCGyP6KDtunU+BqQmK2opesjePnkM1NHabmazAW7bQDsDXNbz7z/RCFttMcLS1FrcYoR3H7YYYS1pN7LZAHer/gxwyWk/Wo8Btg7rMcClZ90e02OEy66t0wjXNuxXNsJjG+jPCLcydut6DLF1Zo8h1p6mQVAMsZiFGOI8miHEsDGe28KQx0I1FxwxyHl3wIhBzi1bL44Y5OUi6zoGueZqrjdskMUAc5xRlq5pP+CIYd5dMmKUe7ZBnjHIsu+YMciiy8Quwltsr/F8XuNerVNnDHPevTRjmGtWc9QZw6y7Y2eMc5lqzzBtoMVe5fm8ykMLgDvGOosVxGDXXlO1shhte2Mk0XBP7YbPycZb7JWW9Iz4qM3gP9Fbbdcx5JK7eYwkGnPUSYNea7dpQWzUxV5tkWfc5/I7+zMNPApi5Bdyij2kxNBjrpEY++Wh6AnB4FcYekZ/VnNhkRh+rzQcoMwq9kSZXAAF5AOlJnvKDCewV13y867n3vCTcINu1/S262g2Qjn8AI3J4Qh5AjT37LDtdNiJl35M66hCrmC+URjYs80tUsgVbFxLuELVme2BClzB3v31lMdQ6ZiWS7gC6gxXKH1BnJURwsNOuMJM3e5ReIIBgKg8ZiZ+oeQJ1klKntAanlEJBHATeULJCkPmCTnB0PGEosOQSTQ8wbBXNDwh94nXoxLio4Agv05D1T3/bUMGB1IfT1jvmNVbwxOwQgpPWG3xe8IT8ISVICF1PGTF7J5h5/GE5dnWc408AWsvAoU0DVClkSeYoRaeUFoR3GSekAEK7fGEOuHaLTzBerJ18rhuz9PCEeyZW/jBepkMuPfFtgJI6McRdGI9IT0cAVjUyRHy6nsrC0doqDQcoWUZqAmOAEjo/TG01lX253AEjGcPR6gdcCwjHKHYr0Y4Qk4VKDbgCICEcRyhJiwwZIQjoAdGeMLCHr8pPKHYIw5aBGQFHg14AjBhzMdQSfaTGZ6AOmZ4woJcTA8zPMEaM8MRxF+RCT8AIszjB2uqtgWHzPCDgirDEdZ0LTAdnmBOOWlyWA63K9rVbTsGCTnJY6cYeuUUnlBxf3iCtjGnlYUnFEQN5Alr2kaZeUJJMHQ8oeZsCJATeQIKyBNysxkkS3gCmifkCUMRoJgjFEOELI8j5IJmSDiCeW2WcIReMorCD2xZkoUXg2qvfBbzg5JhZ/vBDoKsmZl8oFkBrQfXa1qtjHwAgRShQZWKH2LRb2iQ91tERhA0PUFM9gnMhspanUe4RJkTN83AoP1yZZ/DzPXWpIgITsyqoUPeTxhWyxPdeWyTKXhSM0vR01os2WohU/gkKIgeXatfeA0iqFJh9upRRFAU8uQTQ9n63wpyIGGeNkHnM39NX5dnn7ysj9ebibqrmTXkyGviYrP9mPVIKNPMZWFIppmrtmyTReaZy3yFZq7VbfAJzFzFcCTbzPWYxaxF8VE+81byqSOfSQsTJn7Vo49taD2qsodVKbhpmlWDlbyqI6uYsihoyo1efhRQTDCaRR250crQnr7Fy58H5sfc8PIDZVq/zI7HLLAt+4Rlr489yAmvNuYIZo58Qqz9tFaPz1nmUQUhc97T1tdd9za75isyi8mKQ6xMMVYxHKAgq2hvsBuYCr+jMKvMYe1FmKWAIAu0HrOIsjjuyifQSudJzly1ezmLLYbyma6mL82yz1UGSQuTUNbNLiBpzVNsdz52PRjLNFPZlJN5plpLTtAsFLbas9FUtRAno8xQSoFS80KpGSjlMVqegVPWyzNgqumw5VOeAVP7NyUFSjXdQc4uM5RSQ6mSGKVKCpTysK2kgKlk1xQaFk34GcWGdk2wL9lguyQDKa2wyiBVJEDKY7gigVL2ThYJlNKKksCoYs8lgVHTgroihlBqCFWkXTYfhDrxXOEwy5rMYdZaEYMLo5nUmkFh1loZDJQZRKlBVMkMUSVr2EV4V3JglC0tSg6M0tIM90sOkEJrc4DU8vUkVmYgpQNUHYNUKQFSHu2VEiglKGDmAiNbaIViXVqYurAAsBTDKJ2w2i+rhFGI/UohkNrXGhhV215d7rLAKOt0DYhaayc0RA2iqkFUUYaoog9EnUCwENNnEWohqk93eGxlAVENv6IIoO+QYVOchlEVdGhljCo1h11EhqUSRoEhJYwaY9ijVMIoa1wNjKq9W9xdqmFUBU9ax2X3wagTKBaKq/AqUFy1lghgbymuMtwuFFdpHzZPF8RV1TCqNMao0lrYRdxYWmCU2wiQWq3G8DYCKeulTiiVMbzdQKoCpPoFUv0BqRNGlk78lV0HSK34cFiX9AAp/CZAqqUBCOkGUhUg1S+QGimsIqYsg0DKfj4CpCSJlxFM2dOPgKkVJdjkUIYBVQVQjQuoxgNUJ8osRAeqjdtgFsBKiBC0iaEQI7h6B9AOSrACpuYFU1PDKhYOZQZMAYFmwFQt+1XfZQRTsBEwJbkAQ6fBVDWY0sQwpemBqROBKkVSZkM5klr+Va0scAr3EEylZo+rCKTqhNl+mR1hFvGopsApW5yqBFCt2cO8WyWAytbwKoFUa4HX7AHEkKoZUqkwUqk8SHUCVJVAqop7KEDNYpyVSiCVeYAKIVVV3xoxpGqGVJtoJLs5h10ErJoDqexd0BxItRC143eBVMama6bVVGpG92s2pGoZdsdl90GqE78qcYG+g0NcYE22ZFHiAtEpxAWu9alxugousGGnpzBSaWlhF/GslkAqwxAtgVQiik4pgVQW4aoGUtW1ELWb1KCqGVSpHqjCn6JTbbWgGp1am07sT0Wn2jykSp3atcIwOrXCyLiMxBIVra4E/lZhpTC6GqOplaJoFESPdrE4WCs6tGHrrLLNGstT36qrhPwwSsiftKOMomh7qRohf5p4hxr602BJ29WfLdanZweP+Cm7JqIyg8dX2qGyQEFpj0pmw8hil6oBlNpkq/2Bfo9mtQfyW4U9UwcjKtcewI/3sQfwN7EJV7vhfgMk9XYZjRDagZA4PzSZOL9css3zSpwftjSJ81udZTGQgvPrQKRR2Ox4gN+DWR2B+7be0xG4PzJwYVAIjV1Tgv1W4cLDYL8Dj2Ziq5NWp4DBSZQ69l1p73TVaw87KYRGPQT7fQXaVmaw3wFHs19mH9g/saxOWp7ux6+J1qdVbMFWE8G+XWd62jxQZqjfDY1qUjJbE4XQiGVrij5d8R4qiD41QK4p+nRNithQTuhT333mPq3y9OmJXCvtWJlzVNqxWnPaECujHWncRLxEG9ilxo5Vx6a09MtudKpHrlWiU21hXTMRE6o24jVHp9r6omYiJmRgKzyjVw2Sar56NUeveuxaM5H+NnCZiIkM0qHmF2KiZiImuthLUIvNpd0wqRZhuyWYCY9eawnY931/WvWvGBG/e2EmagnYX5OyIVUtBvt9wO647AbsewRbSS8B/YEyMyGGGlVfmIlKmonldPBeiCa6AVNVhv6qAf0ewVYN7LfVe1WmJhKcQG9qotaA/lxHsm6uBv0DsqHK0F9rrPo9gK20SWWzSaVdqlwELk67VIa5lXapZoHrYZNqCMwy9tcWy36PYGsL8MdwN0b/hhFvgf5+EzGoWuFpzeB/GDTV1i67D/yfGLa2wH/jJGsL/F+R8zCQ6IH/ZrYT0T/BwNdu8D8ATZ3hv/aAfw9ha6d1v3VgJ/wvXiNhlY1ED6xafm2TxJ6Mt1lg1biwagT+ewRbx8sGSiVdRdnhzC56YScqCStWVD3wO4OqAagaF1SNoCc8gK2D8N+eZDI/oTYX1XnzE3US/qfi9xhSDSDVvJBqBj/hAWylbSnbXam0LbWMwr3nCz9RaV9qOYw9QMO+1IDcJjFStRT8hIewLRFS4ee06k/NYKWlF36ipUCqkqvgh4ZUY8DuuOw+SHVC2CaBVBkFxE+kYdNVk0Aqi3KaED8hIMaaQPxjSNWEkapJC7sIYpsEUplYSWiRujfQrSyAyiadlmnRb3dkg6lpMLV398lmqPhOANtIVWFA30hWsTwq4ybSyVl/kqyi5YlnhaxiCuwyTrWSwi4i2FYCp3ALsRMi9ga1EjCVUUDsRC4DZQZTM0Mg1i6zD0ydALaVgClrdAmUko2CW1T2wk40JXYCS+OmBlLTQKopg1RTDaOIXpsGSEGUpkROVBFYeSEnmtKKam/KWpmh1DSUapVRqtUgJzx6baTws2Ekhd9a2FjQ0+rNTTSS+OWiFtA3aPxmhdV+WQ1uwmPXVgOk0H+NuYlpFFBrL9xEa4FSa1DwRjVDqQntXzsoZWvS1mjhD6Ff9OnChIYKok9dDUjIX6uxM62hT4FJPV1WeixTMZSkoYAnsIZizRT4FYlpbNhIQ1GkZSgR0amApN5vs7FKRQDbenSqmR3RpzKyTQZtRJ+ahRFdWppavNEGuhSANO4uHbFGdSAcAfwCsSQtUUcFAI0A/oKbiO4RtXVsm9AoJaDSlMvwfKDfQ9g2iZnG7wP5VxSJZ6F4as0GtsnQpisVgULz7taIqDxqbRRQQfEZ3Zo7ULlTPGWST4qn1uLTlu4d8dQWCG6ZZ7r6tUdE5VFrJxFggQ2eUO2l6yQCrCiIbh1qmNFdA5gMh7pcvdolJlTXswr1qj2KUK9OEIJdaD5FAc2npZg2pEuHYYXhcRuOtf/RuZJ2wtibTtqJtRgR3PQir+yknchabaHVoZ0wYeWy/IgnYJnUEx67dtJPQKFL+gnRVKHipUnVmkf6iYXDtvjo0E9sAee2/AgoYIYUFB7PdpJQVBSQhGIqnIskFKap6CShyJh9OxQUm1w1w/MyTBoKD2g7iSgMWzuJKFZsbi9PJxGFQKYcc6uWikeGiGLrUbflR0XhlmOT0kPaTjoKRUFMr1qzbXV00lFA0Uw6irUEsuV4h45i7wmbbrpclkNJcYLaTlIKg9zOUoq12BEroykWBbxNqR2tmZAiG1L1ds0HPdQUJ6ztJKewiLWTnGIhjvUtqSnw4pGaQnPNqBvQBRF0b/02HDOCx7WdBBWG1p0EFVU6GkOCCgwpCSp8TdShpxBIo3u/wSsUFSey7aSoQBeQomKhJp6GFRXmhKSoWK+ILSM7JBUCsXQfN34Nwi8Et51EFbZC6CSq0D5sL7+zqAIV0YblTF45AAzy6T5uAAtZxQlvO8kqABkkq9DZ4IQkq4D7k6xCJ7wfqgqBnLrPG79CV3EC3E66Cttg6iSs0NzQloAvnAcI9FqwafUM6CoE6uqRLvQaoaw4Ee4gZUVBpYReey/cyl7k1oO0FSvWK7gJ8AW99UgXfI1QV5wgd5C6oqKANGAJWvFB+gqLUQfpKxYc2as8oLAQCLCHtNtycBge5w7SWHgBaSxGNe8frLGwm0hjoQMq2uFSdmiyR77ga4TK4kS6g1QWNtkPUlmsx7HAdrDKwk5akMpiDY89MkQWAo32KBd6jZBZnFB3kMzC+pVVFmtAzC7LLOy6sldPHCsBeEGyPUq/7Y6wi0XVIKEFXImUFlrTQFmAV8FJFdrA1GaT24DUQiDiHnqh1wixxQl4B4kt/B46VyXTltKDD1ahKUS7jmJ8zoDYQqDqHvVCrxFyixPyDpJbYEBJbrEWidYvpLZoMEK8qwqcH2oLgdB71HEbjl1MB/jBOnZ7GtJbSBnwONJbWPA0SG+Re7d10YDeQqD8Hu1CrxGKixP5DlJceAWBXnVCQzxIcWGr4UGKi5oRMA5ILgRS8NFv/ArRxYl9B4kujJ4YpLrQVAoqfZGGD5JdSBUjREb3g0PAr37jVwgvTvw7SHiBa2I2Zus4MkWrL7sm/nUWW8EMyC7e8UaZ7MKmf1vjjREda9PrGNGxRxY8RnQsjnHN72XBYwrM+PPNu2cn9WyxWW7wcSwzTeexTnw/+EAWbqKZweP7gSNZ72dQ59W1M1HX5oIiIrftmha2TmjMFF077Jo4Iyc0ZvKuhR/P1G7DRBsVnEAjHbu512QduzM4k3Ts5gmTdOyHwZkQsr/7yzvlmhqmEHmULYyYElMDKqCZAYzVFKI50BLSCIOx2hwd7Bpa7cUF282kbCleFDODtSMT0eEE3cwxM2QUEHvkBN3MzS3j6F3ut2USt4gtbGcmAskOB5aYGw4lOQtF5farQgSSU5KzFDftBwuvyWGWZ3LY05I9JB3JMkfhI1nOwE46kmUEyKQjWQalU5ObtVl46jUzTM1hVuyVmqzEwD3XlhwcgZQY9vpMVmI44TyhxHj3lcfUcZuOhW2dNh1OkmPg5CTLMZxjn6THsJlrkh7jcOwTgox3X27Nek0OMzQZe7llD0SiDJtxZr2WtratMEmUYXg1SZRxthVmcwzDGnO2C8Nmo9XtxJvJJ4fNDCkzzkbKJGUGfkSTg2+kzOYQhnX1bDeEdVrdYm96kjjDZvzJ6gzsHE0SZ9hKY5I44+wcze4Yhkhi9hvDQqBRXFA5SaFRYSYwzLfKJh/Ksn4hgcbZKpvDIQzB0xw3hJFGo4yEWklDjBqIq/W9wUkqDfyIYnPfG5zDQQwB45w3iLFOY9qSa5JQA28aCTXObugkoYbfRMSi74bO6Sh2DhDfKBbM4oIJvFhELeIQXGJy0TeAVyGtcXHwmPhF3wJeZQ5kIAf2ARw2v66Dup3VU1EwyYhTxMQyno3vVUj7dijgw8bY+pYkDmmgRbZ+9G5AkI0yteFkM9GNinPNxDeeHf9VGLhW0CfEOJ49/1XoyAZKaF2PlxYE6+ihmiSiHf3ANvGOR+uwCgne/KA3Hd1ztYMx8WgBju+lm3xc18E+DjjsKiOMwyAQ/3hUHqswUK6iTcRAHp3HKnScAxW4QehuAbOQoPBWGR2N87toJez6FkmcCsPPttNhLle4SCqOd2BB1/W8W8B0pOLMY2I+Eo9LhORR9qxC2u3z22jp5tqeVei4BwZ4XbeXFgQt2cB9SCLFhwuYJJHiwwgOSaT5OBKmVXi6HKdqU33p8lB+SCv+5pH0w7MLkPbj6LQkkfgDTSLxx1FqrcLT4yejwEuPswYkwXdIA4Kz/4lEIEefJolUIP5+kgzkKNRW4elwHJNO7aXDSQyShuc4eM0JkEgN4rK85cREBMMU6UGOME9S9+kmOfb1ctsPVUgW7zNShTjIkCzkqBElkTDEHZOUIUePuAp91kmOfSPdDQh9SE7+7pA+BC1ifYhrMFch0cJeQkdsxecDSETep+Pe6C/WgxnGanIVETNsBSQTObrTVfhy1m6VEDfsylNJkIq8Twe9+TLzhFzE4MiK6DgLGkR6kaO2XYUkE/dmxsxz9LYikIy8Y39WJN0Tj4RsBJGxCKlGAFrCshEojEVINiJeErOOa4xFoBt5xxa0SBovxp85x94fYeEIKiXlyJFUy5ObY/oaUIS1Iy6qFoF45H165o1LPiIS+pETmYuQgMQtEfA59yDCEhIrIAnJYR9sdjbrnmDkEpKIZGZcMO6coEO8ju85F+EcHThLz0k6DusinqXjHRoLkUtQIkKKEo/RRUhSghdcSFRy2CYRUpUg8YCQrOTwTSLQlbxDWLJPTt72L2mJlxFJ4CWkLnGeTYT0Jc2zsJAMzpk2EUhM3qGnEblEJiKkMvGAXYRlJuh/0pk4wShCOpPmlkgO7RSjCJQm75ARiVxaExESm3jUbpKBp/vRINKbHGZVhHNKeWWcdAbcqgg0J++QTolcqhORejHKXvZCKRscPu7nnLJIeyGVRdr3rLIItCfvkIyJNL3sN6IOHHU5iYdXQdtizqUL5/HwuwL0Dpsu+8qsO+h1uax3lsohycWTy+OQEPJk8qAtBDnZPJ49BJEesOebCLJTeph5h70+bvPEIiCUlyebR/KtEznpPHjvRGTQSttv45xonoPE8nps+45840a+wSf7/KVmPtTrIJWv7xqJMCMK+0yJ+r6RsVtm37Fv3tg3iU/wVakQKYrVpBArevbLRObLhpkI86K+YybixOhw7JsX9uUgRk9sL5mY0eIlxI1mz45E3CgyIRE5enYKJTs7CuWv5NRu68QsIL4XTvNR3RJt/Pv2qHCiD6TK4UwfvkEqnurjHYJnyXIBXw6G9AT5kokiVWR9IpL07AtLZprUzZMczHeGJTtTCp235HwhX85EMiDSl0xUafUS2kbzHXHJxJZWT3hF+fR8T1yy86WQt0vO/bbPQoDpFb8oASQTY3qkAJKJMkVsmIkzPSlosnOmUPXvU5GX+UJEg8f5mUjTY4mIBkggJDNtivEg3vSIICQ7d9o9O5deyJeDO32C/EzkKZYumdlT135I5oNsXhLId9Qfkp1A7Z6F7DrMJplOs50QPzODimcgCvWoXiTzmTYvCeg7uhfJzqLi8Irk62CbZDrZdgL8TDQq5q7MPKrrfSQTkeop2IhJPYofyU6l4tCO7RGxfTridsL7zIfc/K7vhU6SiU3FVJiJT3Wpk2TnU3EySXK7kS/41Ce2z0SoYh2YiVE9Ci/JfOANvcQn3lzjZekgzL5jX7+xrxO34MF+ZlrVK6a9Ide2WX6T5/HRTM535eo2yc6tdge/cYMfcau+6Mx8AA5PSuTqEfVJJnbVe5r41SPrk+wEa3fsmzf2EcHqkX4mgrV4CYmMIWWUTAxr9ZJAPhczSnaKtTnwzRv4WLyJFWd+UW9K+RX5ppQX/aaUXxFwSnGGtXmyvutMnJTgV0+IX4heRQBZWMTpGlUpdC7uiFSl4GDcO06RSrmOxkmhs3G+tnwSjKQDHoUPx7kSVwqdjit+G80wrsWVIt7Rzc332zyJj7FCLnREDg9AR+SO/FgKnZGDHTojdwTIUrJ3NACu5Luj6ZycPwEdkytunFJmuuRaCh+Uc0Mk2XDRtRQclXvHeWgp12E5KXFazq9fkvhIobNyR2UuhQ/L+W3EYLvOXAqOy73jDLiUwofPpcSJuSeef9KPpBMqFjoz53nNpNCZOXdmTjTsmc2k4NTcO46+S9F6mVeiEzygL3RyTv0ukm94+jYpxKR6ckw+PYcEblKcSG1AtlLzZT5o1CeeL0SjAh0LJ3r0NHVS+Aydm6I1tSeqk+I8aktuf172G/EJDq1PVpLkm2FSiEZ90vEVolHR+8SinoR8UpxFRYIHKa3d5oNOOOF8eT1RJ09qEsyrSDp40pM8bE5hEtXTDhbnUKujWy+X9U5kgmNreT1YJ4Uo1Ce3YuGzdf5DolBPdsXiFGp1wBvpsh8E6hPNF2ZQ8aBEoT5JJAsfskNHE4X6pJEszqFWR7zRb/vEJhzEJQ7VS4hEfbJlFiJR/Q0lEvXJl1mcRK0OelMv+3zkzuP5wmfuUPB9TtBCFCreBWJQn6yg6gwq0tWIJk62Icrn7jyaV6JQkfhUiUJ9Mp8qcah4yZXP3p3cp+okKrL0iKZx26f8QB7NK/GoSIpPNOqT4VWJRvUktkSjPjle1WlUJCcSlQv3VIhM8GBemUb1ElJXnUy2SjwqVn7KZ/FOLlt1IhVJmUTzBXwaROoTzOvrmTxRznX8pOzlU3l+G+W4fZL2OpFaPW1vvoBPC5EJHs7ry9k8UeJRn8zEyqfz/HeU4+zkJnYaVT07cWm39SATTjSvTKPiQYlGfRIwn2QnQeUo0ahPCmZ1GhVpx0T1Qj5VWlB7NK9Eo+IRiEV9Ek0r0agIMJVo1CfVtDqNimxrovUCPg0a9QnmlWlUVEw06pNQW4lGPSW01DsptdVpVGSZE639tk9kgkfzysf30CFEoz6Zw5VoVIRzSjTqkztcnUZFZj3RdgGfBo36hPNKNKrf9CsZ0pVoVEQPSjzqkyNdnUdVh75+Q18nNsFXSUo8qj8C8ahPJnglHhXhnBKP+uSCVydS1aGv39AXROoTzSsRqf5WEZF60t2LEpF6fkjY5ynvRZ1IVce+cWPfIDZBTw5vIlJRENDn+fxFiUZF0KlMo3pOf1GnUdWRb97IFzTqE8wra0vxBESjng8WiBKN6nMc0ajnowWiTqOqI9+8kK8mIhM8mK9EoyKkqkyj+icZpBKPim6rrDL1zzJIdSK1APtqard9wj6sOCunS/YSOoHg35yQSjwqlsqVeVT/7oRUJ1KRFlaqXNBXiUj1YL4Sj1o8NztBn39RQyrxqB0FtOTDVzWkOouKTLhS8wV8NVjUE8xXIlHhZZUVp/69EKlMoqKXiUQ93wyR6iQq8v9Kzf02H1yCh/OVOFS80JVVp/49FKnEoXpvMIfq30SR6iQqsh5LLRfsVSJRfblZiUOF81biUM/nXqTy5wC8ld998kWqc6hI9bwzrl3WiUP1+L4Shdq8hONc8TJiUNFGVqD6B22kOoOK9NZSddzWA/Pcd4k/9eYQf3q+1COV+FMvII2Wf61HqtOnxVP61wvwatCn8JLqTfUPDdhJiisCrzQbYoKoPBt6JjapNBti1qg0G55cbFJ9NkS6dFNvv4TclY61ex/zuXbPOCeVDrZj16DSyfaTc04sB8uylx2ANq13x9iV2VNUzXpUz6wnldlTdAOxpye3nlRnTz2/fe3t7SWmfnKxpKfhnZbWnkFQao8JBjs6ddAE4zkExTKzbHsOMnvH6g6iK50YPJ98IDGIZ0qUSmcGwaFXOjR4ciVKxanBd/8eQR2Pv5yw+crQgqpZe+MJIYVztPhd5C6eElI8S8u7f2cBeVquKLm+pr2U+it5L6W+Jr6U+iuZL6VOdxfgRkvp7SUqbjQ/YlwazY/I7imNZkf/bAbNjie/pzSfHc9HMdJxlicGbimcBYKSlsJZTg5TaSmcBVhxEriAA0AWU7EkLtseoGHnb3kJexsJVtFE0queTK3SSK+KTiG56snVKs3lqv4NkybHVZ4gtxGpCi9sxKqedLTSiFX1QcjMMGCibs6q+rdZWta3l6C20RFD/5AcnTE8WXel0SFD0K2NThmevLvSsmvigCytHFd5glhO8IJ3kVO8nOzCcuV4QdWsxvH8wuJZXt79WzrI83IFrY1SZp6KaBvMsyjLk/Blnqnu5HvBJizyKEtTl30CWZo+znLC1EZzJp7kyp4pPno0Z7o1mjI9W7S0c2qjubXHWU5Q2pQYePRvpb2O5m2q4StecyVc8dDN0sBsa4CVnQHmJQZtdJoerFqj4/Qn67c0Pk+PZl4H6pH3W1p1X3FYaentJeZ8ssGkE080zlrm2c2lEdPq394hqvXkN5d2BKsOLO05OndizMbHEv035CvVi14Fwo3OJU5/h/o5PQdbPb+9BJSNAkovID/xHPXSOJ5EAR/uQZZ6af2c7nFrx0+e8PE1T4xwopiTh184UwzGjVLFnEz84rli3l3yj2wxV7DYePPRSyhg8K8NSKPNR8diPtzh3xuQ5puPDinzcZMTHbZJboLHnQQp/lEFeZLHzEOfnewxOIiHzyqIpY/ZOg8393jJCQYbH71HZ9LZ+/PpCGl0+h7LvE7n7/3jEfYu2M6qWesp8CT5bwhO/BeU20DOl5VYtqoooa0m/0KGdKdcm1t78CSdal4VI50SSJ+PgEjnDNL4kBOnkPbPgEgXZ7dhTY6fnNCusz7HrX33oRPpFFbipex8jNE/dSLdA0v/yFU+XnICuSezTDoB4pNXxoAZH3ORk1smNLg9UwYB/5yL7AQztmJ3a4+T+IKI08v44NP5jvPFGuEEM1hrcIaZ880a8RQz7wATpJjhOK1z6k6MEO1Hns/ySKf9SPESchL/MI/Jgj5+/frTD7/88dPHb3/447/sT+fuZDM//fCnzz//9tMq/ueff/nDt0//9JufP/3mb//m73/7+c/frPS3P3/2m+f+sO4/fvz62S6daNkJaFasYmHu//jfNcts5NxOtOcC/xzuxw+rzfj06y6y1+GDHTbeV3vCR8asj3vvqVipLQ9Ngoe7bGpfwKCowjapP+xb9og8ZuyeZNkkP1i5/fW/8x/SpayGmB6eisupvg80reEBqk3863Hslf6ApyjGDHxoJvjdCQzX/WP3+74BzVtv/Y7Z/kuN2ofUm9drT7unh12TWkW7+monlNaK0M7ynOaridatjhV9WFciYcdu9/6LRtdbj3qLXxuAjFDo213HNEHsd7f9pd7z///+3/jX3kUdRRkCtuc6BPzqP/jU9scPcOdps3+82P/Zr/8X/lkY+elPn0oGSOa9EFxFv/v89RNKyoLcvzOk/at/+P3vv37+hmJ9+/rX/wFQSwMEFAAAAAgAcQ2PVNRCGvBJJAAAMIAAABQAHABjd2xpdGUtZ2xpdGNod2lkdGgucFVUCQADxc1YYqJ3VmJ1eAsAAQTpAwAABOkDAADtXbuuLTdyzc9XOJOSbbNYfMY2YJzAkQKHg2tJ0AwszMhzZWM+3+xaxa7V3AL8ghPDwUBzeHt3sRfZVcV6rP72h1/Sx3ff/PLlz79+8/GLrP/bvv78l/nrv/wkpayR/PH1u2/+7cvP//rj1/WXfnz7wy/l4zN9fPvzL/Xj288xPz5zKuPj11/ax5dvP2e6/vHXX/r1h7T1l8z158Cf8vGpqec1MDGwfq11/SnJ/u7r+ialXyPy8eXrp1xyJN+Carv+SVmSlBBl/1pvWVm0yDXUQprdu9/SSm7DLhmXuGziZjzXNfecWFyWW1y1f823OKkj6TWkt7h63TuXeLhUUrmG6iVOL3G5fdDdAzd71BzA5apywZwDunpJ04Auy9DrEjXsynV3zc9F0hs7zb3ZSOCXL5Ea+NU+bHU08MNNAr+aRG0Whl81kfO5XCWdIktgmK/7l8CwjJGv/VEIwwuwEhhqFrlgLYZhu0SW9lyy0t9EjgD2ArrMeErVfF1SU+ySawpVbpGS1WZV8yWy2+bXj6eEWmKPt5avGdYak27VFn4hsu4w7A79uTR17EmXNC/g6oydfc25pdhq01Bvck9Zro3dcggc7YK26SVvXvJaea5Lq4e81m55F4itx97LXe2KccvLJn/Gi1RLvwSu/3+9t6YgujyXpedDYtdbol7o9MBQdPQLlV7jEa8/W7xLS6Cpmm4STVWsnzwFBIQG2AgIc5vjwmwEhvZnQLjGxiVgGIZiymGU56KNG0Rto13PMAJFkxgotpTSNalBKF5/Boi1lH4BNQGi6Ycpz2Wb+ZQ4A8VrujNALE3ntSgzQLQfBIi5Z9MiEyCazpjjuWxznhIlpVtkURuQeJ9aHtDpOZZu2IAGtmlpQhsrJtg0h6T6cQoKNP36wFN1ZowRoBgISNc104QLMDV9cSmQxzKK3KjeI4Fqs0cUwnXWkm0sgK34VUBbsdoigLZD8DhsmcxTcA5smz1NDmxLas0sWA5s/aLAthQFVhnYDhjR+lxVye1Nclgfe72FzE+TpeptLOwPMCADVHsxrSOwQGJ6R8wGsRwNaLFeStCWMWHkac/aVlDatSWb8RU1bHOCnHEsqsbGLQPOQQlwza5ICXDXknd77BLgwn8oAW5doNjNi4Gb4aGUeixrae+iybZDDBn3WfyuhK4tdA10NRXTklIN3QxvpeZjXau+ia5h49UAr2HkezOfQWoY+QrJYeWXkI57w01SSJ4fh5wW6Ga7vhG6PcHVa7R1DYcW6K6N2/BDoGv6SNrhaUq70W2CzdECXDxOC3CrdGznFuDaNT2wXW+pbeYOaKGO+ul4dj3ldkIWrmUgqyMD7R7QCn5FDmhfzoKNAVrop374oDLSKXmEE4WbjvCi2lIBdtMRblTGReSLqipcX3OkMhTU2O7oLYdceUNxBLIl54xbkD9vjzwJ2jGTLfwEtlBH83BMZca2HVNs9jPAxcswA9xlXRJ+F+BmXETeaRe85RPgQh/Nw0HNKZ2icwp0DYacAl1NM+FgQOhiINDNNZnzsGSYq28qKqd2ni36u+hwVbv9Ta4qNnKWcFXNFc5Cvupat2pj5qyqKagst7u6xdC5yR6Qzk1rE0yM0caF4MB26coJ2YatZsiZz2XNcXrKAJsOUIoraN8ud8UmR0coXMPAascYgMUhKrdjTXM/5Qas9qbmPGkfN4wpAWsIaABbW7dzwjoLmGDTTfmS/1hR2DISvA1Zuu/ZSDWt87CN9eeLmnUQ0qnjommCTTnlZckeYuhQhbWiU9Xype0EkelYpRgotHGGOcQZByttENOOBaWzlSbMlQ5XBXegLStmOTKdruw1zXS8Kl1xb5yv1DRRrnosaS1vkmtgi9e0BrZLoyTbTJWwxVwC23UlfgdoB07k6VhTmLGH5G3F9lvqRuwSPJejb0PleEtbnAeX/kOsoNmBUCcE949TDEFrfweyurwOu0WnTYuBgLZlKN/cDdoCNdT1WNR+Q1sUb2APZBtuGsi29TPcNJCtuE8gm2f3Oxm0BXpopGNRh5ySRyBrrm0eAW0p8L7yCGz9osC2LiuHOxm2BZpp9GNRx3iTHKdF6NkZx8Xl/dppM884L0LKpEP3sua2G6YdGQt00ywfTzkzsM24Z2BbkrjswBZbe9KuLR0WaAJbhHpSeq6qpti2XUySpgDXLKOmAHeI4GeBrbm/mgLbUhNCTAnYIuKT+nNVNY13yQEu4lZC4YzWLEyoQuB2Gwhwl09j9xZga+pJpTxXVaW+SRY6kWMgzpDL7xv4XZwhKyTHGXKpcFPAmu0MWToia/JxCMoBrikazQHu2kvmr2imnWs4ZNq5IwGHDHQHBB2BIs03ulktqqT5CBWpErjrnIzQ3xEtUg1wl+qZJlmBrukj1SNkpFpPyfoMGqlS1KgX03GqR9hIlUMewxTUdWS9IoimoK6w7XNZSz4FlyN2pIWCRxUPWJ7BIy1xhNS5w592hKwCuTt+dEs5AkhaKYKkWRAxfYaQrrd8i5kN2FeDtZoq0noEkbTGpq2Ij2t9hpG0Bq51HbPtceozkKSVw3GzIHQLWE0TaTtiSdrym+D2jCZpo7hmqeYBaXvGk7QRrhVL3AArNFM7Ikra5pvcfoSUtFNIafoW7kdISTuFlFpFALvb2bFCNfU7pHQLOkJK2gPa0pYkGztCStoD27buZIIGsIUmGkdISceNbSvmEOgIaPGaD9qyTaHxRmCL4PsgcJf9R7Qd6EIRjSOmpGOekmeAiy07A9zl0UFnzADXvGGdFFOaBes6AS400zxiSjrbm2SKeuASygW1gWsopWGR/URBjzoTsgh2eqymmEraISUXU1JA60mHgHYdsma3MYrWqQ0EtMsRt2UryaBtCXKOkFIhK2abrZAVq2tDIL1BVgwDZMXW+c5kw4w10ztFDkVbhFwES5FII9hywhi5X5YkkXAR2ugQYx5CM8VT8uHYFs5mGY50GKsjYzXoMGZRhcKnsVwyfohsjELOdWhYt/qUdcCAIJvqupNpswILtu6znI6Jexqw6y73CEzYulWM2GzXrWLEprvutiRd3to1ZLNdtzN7VHAcU/MfBCMGrQrNDkZMszvQBUZs3SkE2YSVJgwbpjRhxBaVJowzmdKEYcfW3WLE5quTRmzK624xYlMuQiM243W3GLE5F5ozjmWF5gxrVmjOMGeF5gxjVmjOMGeF5gxr1ky5l9OalbBmkjHw9BEK2bKmCOMUtmWQQQo3DbwzMGatIud3GLMSxszlkikzDVfIlq2NYQaykC0T3IbizKJQFLBmzZONhzUrYc1cMNky8xoK2zJJdgAuZMtMLpmy3jEVWLJmar7clmwLIQ/B3n6yY8sEQD2RHTMEyIwtNSVIjQJVU+nlNGMlzNjyOy00X8bTRShkxtoUQ5WsGP5mTTvMOy4wYg0a/TRiJYzYLZesmKE6Obpc7bBf2IjZ3xRcrsmCLQU2rEPFnzashA0LwWHECrLHYcQkTcVFYcWQ/SUrVlPrlv6FFeum9ettxbagSmbMnKBKZmwd5wbuSzt22gB5CFLtPFxhxnqGoMOM1XSDW7IFGqocHkKVALet5TNBQuDiokC3lWwJoipA1yxBlSMxUqW9ST5qRapQgFngcVahALP9KlOAucPnrBngmlqq+ciL1Kyn5BwhUEwuU+1DvnTsNUZ5EdQARAw0X57vNWQh0F4heKdFthgNaM0FqhrQLufTToFVA1qzxFXJ+fJEdFVA21CAcGRFqsbGbdMUddXA1tyIqhy8V/yMvC+7pgS0A/noWoAsKh/KkRapRd8El4A24xoqy0lFIYjqSiCG8iLJ91wBtiiZKEdepNb0JroGugM5y1pp3+JnlNDT/TuAa+qo1shE738OdYsFIiu2Dvp468iKmeKvZMVy7xZ+qLBiAzVU7dC3NaxYFjtmVDJj5pfXxifdLKgrIaVg4JIZq2NC+8CMDWifdmjcGmZsS2Y7ZpMjO5aXSAOX7JhhS3Ys545bw5ANaKN+aNza25vgI+lUe+zbC0cbIpVgExmkb6sZ9zps3w7oonHnoV0Kn8cMHzJkWVwlkyXDK0SmbDmKE2MAFppnnNqWTNmyPSaJTJkPkIewDJutM9kyaEEyZlIRXq0wZgO6Z57qlozZLZqMGcTQiawivlrZmFnlDx/J9MLgGgO6po5aOvRtS3qKbim0Av4mfTvFjvgthVKwRFVLlM/Lw7RlS6YURofkyEO7HDJmVhZFtmy5XQmlUxRKsOoqsmULBFM+DbZsmPJpchY8hi1r2WILjWxZw03JUcjV3sxGtqxdG7eRLVt3sMKXBls2ULmVD43bwpZtyWTLABHZsoVaws/IltnzsS1LxfJqDcZsJkg+FG7TdErWOEPaUbApJZ6wHhonyIKqNEpDWxaxqZ0fp6mmpncSess4KlMa2bHsNQONDJk5T40M2fJrTXc2WLKZURF3JKEbWbKJAqVGlqzirrRp26UyrjGyZIY0WTJJAzsblmwqRB9J6EaWbIuudDo3MZWQVUWBXyVs8SsqlezTFEerQNf0U6tHErrV/i468k4Z10Tiab22pvXaLve4NrItU6NsaW2Aq1niaZp+au1OQ29BLeBVDAS867zn96V9i0pF2retYgc1wAtt1I48dOuU4zcse4CLV7UHuCPjkoAWL2onaEez9E/rgBaqqB9p6Nb7KTaAxXvaA9jlRQCzEcDiPR2U308KvTgALHTTONLQbZRD8DiSTm1EREnyNBPaRkSU8KIOSugtrY+LLKQ0oZrmTkO7mEnaACWiAWseAmMyac/iogB2OUDmhrZZUUkKRTSPPHSblIcWM4VtBrbAcdKmFTHXr6fA1l7Vngjb5SdZ0WnKkI2i0nRkonsqp+yeAl57V3sKeEstPkbwWulqooCdHyauzJ7JziihPUJ2XeRNthx5p75rF61kBDGbvus99svahbJ6Y5gvd4UdTLZCdqSjtyQqorAHkEB4HWLt3Nsz7V57osy714qEs+NrCukqanmsbc+Rji528uk54DU93nPAmzOeOge6AilUQ6HZ5+Lomj66HPLnyqqckjXANR+4q5JkVHV3DXBtKkqZ/pYFN3JsGyQf6eiu400yJfWu7dxLxJqlwKT3ErFme4V7oaTezACioII5mZLq5c5Hu6AS4ArKsAncJhP3oCoKDAS662xtWdReHF1TSld59nNdKyWksw8FvOYr9Ep7d3TBRQFvxkDgm1Us8tOr4zsh+0hJ9yivD9kBsHnCnSrsS0dKulONvSmvTkX263Bg6YeOMnvxsvd2JKV7lNrfsqnY3h6bqu2XtkiodY/TpKn8zvX2ilLb7gX3Xv/eIyntgnoAbM/YA1+tyIH2Hvhir/bAd3n+tvk64EUZfO9HTrr3yEmj9rBT7b1FlDoV39eM+GSn6nvFAKVKkmIJvAAf9fB9HLmSHjX4WzTV4Psd6KzekWjrVIaP5gMqxJ9iRQDdC/FRF9/n2c8QtfhbMtXiY3JUjb/cNyuM71SOD7XKBfkje+eCtzVAUc07Mb0FUTmFdVgl2rvizQkp0LWYxUi0dxWF8VfPkgkyvTTS2eCQKDedE+4S8JoqGFSUP1EaNKgmv2Ig0JX1rzZnr8lHbfyQI6A/oij/Fk1V+RnXUIBUcCQeVJVfIIe6Rq48sI05vgOyj5j+iLr8W3YmhIf5DiPT9rWfZdq+rSh+5wCbYrpcy/O+5DpggIvYhnm3g4wbOlnYuCVTncNtG8rhhx7ad4Rta4iqDrJtNnsybcuwWc5lkGmzxMwg26a1ZPwQygHV8EMP3TvCtt2Sj4KVQbZNZ7UXcpBtMw0yyLZdmRnbV27bsrfnHKp3lHqKLrF7gWSJ3btOyFiTEtsXkqmjRARAVOxeVMNfDtRTDlk2PA5ZtqITbwBZNpNLhq2mOfA7B7dAzqF5Bxm2Cd0xyLDZXcmuLdWANSG7ZjiSWcsJWZzhZg3l8ONsIBtk1rZkMmuGLZk1TdXS8IPMGq6hTJ/IRNeUYwuldDaSjegkuyVTL5n51oOayVqZ+BnF8uytonayItV/B8WAevhxd5SFIPIabK5k12QpatsbZNfQAEt2rRfsH5i1F96ZsGooJhth1fAnmTQMUNWK5zIHmTS8MGTSdi5zwKa99gOGURNgMt+xnT5TX44ZcxXc8n0jzCNcPiY5OF5ZMCbtBLTC0Xy9smCmPV/bhTPJE6iZ3uY7KY1mBmpyGs2rJyZXg1hXHKXRvHpiIov28ndvRh5NzCGbkUe7ZVPsMWOAIrteITIp+FgwQNkerxCZCD6+XMHMCD9ioSaFH6FyJoUf0StI4cddBTMp/IjWP06leRXMRPjx5Wp1RgASKz4pAOmyOZlmXYMUgPRCn8nxR3sEij/uQp+J+OPLjcmMCKSvN0UgXTRFIG3bT4pA7uqmSTFIO0FOikHu6qaJKOTLTejUdqy39jfZcSK2F31qnIh3TdcscSI2ozVLnIh3TdcsGbLhJ8yix3KXCDq45zDp4FYwQEEHL2WbfHDDRRR08FK2iYPby92hGSc3X286uW3hfHLDNeQ9eMHeJPsmGOCTMQr2Jgzcy/3AGRbOV5ws3C38aeEmWbhdpTjJwqHrlQq1kTGezRUbnN/ZyrHe7c35nYeFm3xw88LMyX3S9vd7Yebsrtbg4M9+qOHZz7PF5G5p9OxSusprUSeZONt6ZOG8FnV2V2re7dvHsdZ9npJH6DRzZeYInea1tnOESrP5Dyq88Frby5+BZGi0UY+FHu1Ncmg028zUfLbLiyc1n2FVqflslxfP6QoN59c587HS0X62RVP3GTQId595TfWk7jPAMDkyjZrqOV2j4Yw+53wutSRqQPNj+xqjQOrECGk1ryaXRD1o6KZM1IS268nXoCs2RCgkpfZcdEnUiRZzOMJ9a4S0m5fOS6J2NLSOJupH28Xza9AVHCI06299Lv8aKe9zoErI6q3mdDzyxoE1SKFVFxdqzlsHJImrOQSorh7C5zZYI28hqjV2NE2skbeuCUlU2I+u4USV/btvYg26skMwzorBjt2Qz0jgGqKyU4xQgf9uGbkyAzEFTJRK/HfTyBp0rYdQ5Pq7nJsh6vzvKVCh/5ZGms+7YyRRrT/awxMV++/+GEnFtV/yxv8i516Iiv97ClTy33yEG8e9MTtR1f++jGohvDloDboaRBDaQibHXijzbQo1NKG/blRusvui1iBV82BSVHGyO6PWoOtDxNvX3/XcCzXy9x6DX2OUwMcAJfC9KWwNhlb0RW2UZva2sDXoehHpBrkSbsdeaPo+BcraYT0pa+ftb2uMdCOehtJ2uwFuDbp2RLJFUpvnVqDc3T0DSt/5Vqf83W79W4NHi+4aoY5HNP+tMdeOybVjb+dW6G/ZpjV2tD2ukbe+R0mUy0N/cqJk3u58XINQjtN149BzJ5wJvTVCYXtASSm93fK5Bily5CPUSeZNn1eSGhNwzTjTuQ+mnBOYoRcdyEkuoLe2rkGKIPllFELy5la5CFtsAq4XZz+3wRxvE6DuHJBGcRTUm3pFKAyKeQrHQb2tVwSB0Nd0ipB0OIMiFAodfh9yBv0mXNuMbmZhghK/is653s8szlDyQqpciKPEtwCRlOz0uTBNCaZEAdHdxy3MU4LVZKKS3cktTlXyQp2AEFmJ7F/N9xkQXwngJr4Sb1gX5iuBLmDCkt2yLs5Y8kKNhBBnie8BIi2hCZA+xOMSb8lu1hcmLoEqYOaS3a4vTl3yQoWIiOZzFxCF1j0FItFy9jKi0bqpCoSItLJf9htkBQIyrReKYSxvfWyEoNTyAhmRs/1bhFm1Nk+DnA3gItwBvpkaBC3gLxQBiZTTW5ToAo8Z0EkYz0Ft4DcjhXAjOC6jTvCbk0LQCv5CAZRIPX1FiW7wewbUDe5vfmWF6GwcQv3gPlFqCL/5OAQt4S8Uf8l112MjNHmbAXWFuz5orBH320Cd4X4VnYpl3wv6cDhxUDv9RKc44cI3kUaOIjZ55+ikU7BID43o5Eadu5idhMX4Tq4puEbsp5/obCfPKXBfAgCnxoTNNiPUmIAzg1Brws03I+hNeA3XieN0E4XaE+4ZUF0nnCHhws5NtSNU2ekvLbfabbIdQW3na7hSHKebKO/lnbL5T+LIINyssImGhCo8cWYQKvG8qYYENZ6v4Wpxnm6iRJmn17aKUJmnQ0V1njfLklChJ6aeqdLz5lnKKPV8oYJXcjq9xBzVnnsGmao9nU6K6j2DT4oKPuGZZ6743IxSGSWfr+GUkOn0Ep0U5TEDCaXY/CJSijeXltAZ2i+j2ODNpiVQiijclive8twIzo7ynMFR7iWZKmZuGrHMJTOg4qKamU0kllE180KJuuR8+og56mZ22brkfMQIJVN68aZQy/mIEkrmBOMmUctIMb66c4rp6SXmSDLGFPSIFErmROOmi8t6xAolcxnNJozLyDW+0IwgWU8/MUe2kabwjBdKpnzjZsmTXJ4RQ8lcTONMeZKRcXyhDePqITz3QeQcYwLlGTaUzFnHtFe4PAOHkinvuMkBJSPx+EK/yVVWfO6DGmdn9KBIrkfwUDIRVm4uRLkJVTx8KJtQBccltKGIMapcEyg+gdNPzPXsL5Lcjhii5EYa0dkeJbdnGFEysYNtxkfJoAd7oclIcjv9xBwMYTGBZyhRMlGEbYJLuQlW5q20OlURO8mlZPCEvbrrw356iTmowu4J9COgKJnIwpzRU3I/IoqSiS3MWT0lgy3s1V0b9tNFzEEYtpvLJFPUdlOUSqbE5CYpleypye6qbpyGPxPvZdz+SPlJphzlZlmVzHU3wIqylJtpVbKnKZsru3la/kx5ynsKVH6TARSzYTq3rGQuwMEDUwXO5peVjBKcV3NlN0/Ln4kZc09BiRoz+wifh8CoK0rkmE5WSOyYm1VXFPSYL7SAiqbT8mu6NzraQu3UfS+DT+CdRVhuPpadBhQlEubNJCwKHuYXWl9F5TT8GmzMewLELOYsjcwt5iTJokQuVvEsxC62iZJFQS/2QtOvqJx2X4NhbE+AutrBS6jU1n6TQiv3tXeMkNnfxNCKzvYXup1F82n2NajG7gkcSUFRIhtzBmxRIhvzTUFsY5sGW8E29kJnvaieRl/57Alk+ezpBQmidPb0OdHZ00sSRP3oCb6AK8txLjcRaMIeKzFoep2FKDFo+iyJQnNXWogW393QYlpONa6n1VSymrueRJSspl/1XlEi6lazOVkoWU1fR0poQjolNHfZjChlNLFoXIvqhTOintKszoBaz8ObRk7TKSxEKaepznhKTopXDIlSWhO/44JUrxkS9cwmiDpE26nBNVKb9wQ4tekXvZdGiVJ2E5BQenMXR4l6frO65uqn/tZIcN4ToAyn+AgVbnhZmChzQmMGlOXchWGinuesrrr6qb41Ep33DCjTCbTJZu6SOFHKdfrTcrbTi+JEPd1ZXXWNN+Ud+c7NTiNKGc/qc6IeMi8HFKWkp68VZT29IFDUs57Vddd8097EunnP4GEyCwAmi6l4OLKYu9JR1C1mdWVFFtMXnSzmllfeLGYhi7mLOqWwxZwYIdfQyzqluMUE1ZIUspji93kHvZDNhN9QyGZ6SasUNpkYIZO5i1qluMmsTg1MJhPLXsJkOs2UlDebWchm7npeKWwzE0borOwVvVLcZoJMS4qcWrwQK+eeAVPBYBWYmNNLl4XJYHxdmA3Gi5fF6WBe4BGTQkYTG6EQP+c9g9NqFraaXrYthc0mfkhm0wu3pbjZBIWaFDKbvg2Ip3NPgJk68RhM1ekl61KIq1N9hOKHXrQuBWydL7DFSSnp3AbljZ5PSgkbhOcoYYN2ub6UQidl/91bwb4YR8w1geYT6OcuKG8sfVKI8AygEOHZbkyQQoxnDidxnu3WBHGemBdYAoWYYrY0Ij67Z0CN9r7i1Gm/2zLkQRiDVaBe+92YIU4Z8wJFohBpzN4HRIF2T4E67qFImTlmd6UIU8dkH6FCfu9LESePeYENUog+Zm+EFqdl9Zeqh05EjJopZHZPjjCHjOst6r7fXTniPDKv4jqx13MnRAd+zODkfS7Ug7/bj6ScXfhSqA1/NyBJQSP+q7hOHPncCUPfZjBCJ+IwcrPKUOuVbGqZ3XslZVCW2Zuv5Ir52gRcJY557oOZ3iZAvYw4IBRuZkTXmRRqZvSHpW7G3XcmBe2ML3WNONu5C7ihEeyvUqijERa2UEvjbriTSj2NkFa5qRE5nYqexhc4bqUmPTZB5a5Gn0CltkY8bqW+xt1bKJUaG5uPkEr07kKpaG18geBXqqRjF1RubtxToO7G6iNUSO+tlVKpv7H4zUgnenOlVHQ4vsBubLVrz33g7DPHFA7uUtn0M9xZKpW6QeA2VWoH2b2lUtEP8gKPs9Rcjp3gNDRmmnw5c+jE7BMgnk1vqzWunHsCfhnpRG+sFSOkuSYAnXjR0Rw7QfM5gbdPNlT6ZsNuH5bKH21wWaQRvYFYKj7b8FL/joCebmKNLzfsCdC5E4H0SufO3TgtlQ6e8KMqHTx367RUP3iqf0KhnE5ije833BM4qB2k0vcbhm8U+nyDPyp/v8FbxqXiAw4vcLNLraeHWOkbDpsMv/7GRxzeW+Xl5qkJXUAfctjN8lLxJYcXeOml1tNFrO2NFF9qC4Xo2qCRj+i0AHIT1oQ2aFSTWPdaNWhEZ+W/CGuOXdDeyPGlEiG2v/iNNKKTIsjNXBPagEixNy2CVLBiv/ybBLWfXmINYuyYAlFj+5MQN/amhJBK5NiuDYgde5NCSAU99ss/v1DH6SbWYMjen2SoRJHt6oA4sjcfhlQiyXZ1QCzZmxFDKmiyX/7piTpOP7EGU3bM4CxIvBltrAIbFzFVNpaFuLKbb0TvLfFPbtR5+og1mktu6dRc4spgsjp036RSe4krA+4vcb4Tad5gsj82kk4XsUWHyf25EeowgTZoifUhmF6kUY8J9EHjJhPnepHmbSb+XZWWTg+xUZ/J/a2Vg+RGfovlRt5obuS3eG7EiW5e/k0ZorrxPUBcNzSDoxCR2W42n48w3Y3jSQ0nm9FHnPDm5R/UIcob3wfEeRMzoKYTnBWY9maTGQnz3mT/IeVUnM5InPnm5Z8TIu6bvRGi9SSmQM0nvjeo+2RTOQlT4ED3MAfOJnOSthtQoBObnl5iiw6U+2M43ILiMyBOEeexkkZNKDgrNOpC2UxW0nYbClRiK6eb2KIP5Z4BEwj4RcQgAL4uadSIAnehMYUAGLuk7U4U6MNWTx+xRSvKLZ9bLX2E9KETlUmj0C12PYdunapM2u5GaT6B00NsEbqNCZyFiDc3jgRHm2x+nDgqtAeZAFjapO2uFKjE1k4HsVFbyv5QWqPgLUJDjXsvnaBOGjdfYlkoersp6qTt7hTXif10ERt1YN5TIGoBZ96TRtQC8JIbcQts7j1p3UF3DdjPpH4LfgGSd5AxS6NWzM0yKI16MRE4bA+Sga0Cdzumq8BxpvXb+7f+pFHO018q7svM+1tURzO8NEp5OseitN2Y6RrwbMyUFhlP/7yhNOYb8LtQxNzJJaVxwhN4PsK3ntdvc5fE+wzOvH6L8O2eQaforX8ki/OdzqIpnaK3UHWdorf7dNY9eAvt19OZD+oRuw35B32odArdbv5Q6RS7RdSwc+zWGUSle+wWyq/LmdbvEbq9J/D2AdpOodtNnSqdP0Lrl1G608lTpXvotvsEzrx+j8jt/vCodArdws/rFLrdtLFWfHhrH8yJQrebOFb6zndiBvks/ewRuaUZUCm834UahZwhVzqFbv1x+PtKzpEr3WO3/hE2PUs/e4RuYwYUu8U0KXS7yYGlc+gWA1Tk5PTA0nfkFvLLWfjZKXB7y6fALSZJgVsnRZZOcVsfoAInp0WW7nFbdfFn6rBH2NYlnXnDTjHbzQQtnWK2+B2HbJ0LWrqHbKEEez3Thj0itn6TM2fY+UsVznUtnaK1PptQgM52LUa/8/Xrd9/8/Kfvv/z6hz/98fog9cW/8903f/7xp999v4b/+aef//Dr97//m5++/5u/+9t/+N2Pf/nVRn/3049/zLjavlf9T1++/og/HcSlrT+Xtb82yX/7v0XNwF0e1WW1nT3+y3K+v4AY/RoyHrBP636//rq21ydaw5Y1uLbExWlw6aLP6zSNq8wPW+aj4BZWrPB5XXK9LrcYuybZUfPTxu1f/yv/w2b9As3Fw7pv3wem1vAAFR7a5zC9+4mnUAvp4CT05aLGXNcPe2XWBZheVWMd+k9NaineawvZfe1pLxN+3anYja7bV+uIszRNiukXa4ewe5RpX6rz8ttr3te/lIDeEPUZnxO4/Ofi2F73mFZX/XbZ/3T3/P9//2/8197FMrSwCrh2rquA3/wPPk7x5RPbeZqPFi/2f/Tr/4X/LB35/Z+/V9eZ9VLma+iHH79+j5G2dO7fm6r9q3/8ww+//h6j/ePrX/87UEsDBBQAAAAIADECj1SAQfa5a8QAAPIyBQAUABwAY3dsaXRlX2ludGVyZmFjZS5iaXRVVAkAA565WGK8uVhidXgLAAEE6QMAAATpAwAA7D1tiCTHda+7q0/V0p6mWuy/YLlGiHA/5GjvTlZO0p6vWpGNDA4S2IfzI8F3kXXBIOTEEkQEE9X19ECP88Pdzp/ol3ohhnBgBEK/QiTVyH8McqKEIPTzIhtCQJBsFBSL6O4671V1z87Ofs3uzOxK9r697uqqrun36tWrqvfqve6DqLPu/gC8y3DuqT9/5jvPP/2t7zz7/NPfu3L5qad/59mnvv3I49/81je++vtffuLiN85/Jfna17/8yMXnnv7eVx87v/LCVxqAP4alB5975oWHnv+zPzn9wAPwFNxxZuXMmftXHrj/9Bfh2xCtrDx8+ncfPnMOnobwzPfrCbj20sUrK2twm4TTa4E+nZyH05ej/zz9FgPx1yvvwzsrQ7gqYa+/s1dXf3b6Kr/6QBfgjAefP/1+XZ/tQng2AXbW8+DMZSy/iscaHkM83gc4u/Zbvzj7FiDQE1buoSukxHvyEvh/8xOYHRI81Byec2BgvjuODjgeHhIx63P+dqpaik7SXYudq4kTPJiaIrlLidzj/tZ8Pi3aX0vYufWut4S2ArMz7H537/u71NDu7JO4HsMMoCYLXK9bxu84F5nJAr1/xGIinRFmmLOKfdbn2+TUwdGPIBlddQ/wa23Pew+p3eHTMuOJsfNnEo5+XlJHTQAER4daHR3qTWCOmoBFwJHqqJ8xCF1y6cTRknE0YAUFZ0IfJ3J9JDNiI6pq+7unD4kKYclQXByPnKMHBlwfWT/gIEgRuUr2rroA4JFLo2g6nfdTqn+NE9/25Mx7FgeAg+GMti+ehtebt6gUjNsMs4Oe47N+c+Coxgj1fCv8Qo2K1TZV5w7bC/5RDEHYv/l+uHA4K40fWjkk/SIG3shkgGnyaTHoj+EYjh6O9e/POqRHTcBRQ2tTHy0crZ/yGAj4rJv9vyZw5IPhGLYAn0gdCOtgUnS5MX+oQyBHjq6Y/Qs2F84OYgfjh3AoPLoTQuo8fGY/jd/D0Nzn/qpswiEUtIzgTflCQG65WhCi3YGQdo2VAsFspItuzFZt5aKFBUwpTfd51k6rEMMaeJIwMTwqAJsubCqrbPcayGyHK/sHmMNDGqRNkeHYmPACNvFioXAQT/d+YcscBNTyzLae8kFDRkoBJc3unO/26Ras5bS7dxKpaBxFTBya75La70E5FDJf88J0KKIM/G4x9LLUzxWYSgLP5aKwE2s1tjqAoBQ5D5KCl92iL5kMyqCnKshjfThbklonOhdlUQiuCllCzmUSABLVw5sVEuGoWCAtpsh55gVy6EHUR2EcrnE5gKgwfgG5ScEoW20hY7Kdcnzpy24AwxLFMijCIQgPR0UxrDhTMnOObLMIAkajADuhG/Z5Ecq4yKUpoRIi4ElJPUR9RONEL4QCaHo3j8o4zCpe+FWcoFwWUKIw9AOtQGoSAxJauSAKDO1kGhGC183EsEoHabFmhkUvk17mGS8HZRY6HZ2gdSGnWaHC3NVLLo1zlzZwdeRwuHoQHGk8RaWL76Wn1L9evffCEpy9/Xb48S9MfM+7795zD+UvLJmVgyDeJyTJMlGwtHQWbn/lx0AUKBXHlF+FYOngD57OE17XS8H6jZ/DCiyfugbh7esfPZZ733ws/6tgaQU6SwHMQAH2stzLer92ra5XDKL/eb2SpG+cerKCJ1sKArN0YcV0LsxCwe4Q2jF21z/DLwHl/kewJbV7QD9YHAEjqOGmdw1hFQH8+laNJdQ783h2tIMfcJKCGnvj2qt3EwWIGSniRMk8KJgObGtrixp4k4JjxKyg6bS3ynu9xkFT85s3a9TkfoUUXEeVrvYXxAO5x/0t7ia1zwdMBa3OiirY6IHKbL53OGC2Fk3qIdNM6geG9uGyScPN2d1hQc5Z45SWSRrmrp9R2wWeFaWGWk5+vjDHMl+lPE8koKKe4H2aMxcTUzLGwm4je0kbw2B2jGaYLwWiQU9WUpgmlgvEB0i5Wy3aQSmDBW8sOJuR9CSQiCimhdRv2HIokQCFGwG0gRUCy2LiBAtYWAhmbUiy3H21AMTZ7rf9BUsC33Tpx0JUaCmn2HqTZFYeqoRTt3xKY5aO4RiO4RiO4RjmBHIi34R6tQrzpFbebvq76zkAbx7DoV2eSQMVNuX2jyBcrHnggMG49i2blHb1kzzEfDQiomrustHrwLvshfhjZ/vgRgvZ4u3jZMaSj8+1m08ateMmW7iNyav2NOoatabdO9ppD6ktrpDs3M8lQ6lIURas2hhm1JaYQ4b057HNzU1f2gjEJotEIroIUzIVJFADbQcgPaKw2vok/fLgmGk7aIN9OaChJDPgoUJiCJlhoFM8qrZKCOWmB8zB6yag5WTinMsenivZ+vZQVYc+HhkRG2SC2utvedlyhu1dx4MU3Ea92zMwOrN52ljGK5QHn9MQrfy0lfzFvYYg23NrFsTORuON/a5Cb1E+xmws7WPrJfa21IMBQ55zWVG7fWBJ1MQCsJHszWl7PRgNKpIEhqKpGUoBk6wrXZsdQkPeYG9hPlCPmsNy7PyikGzY7Smu/H5Xcl/IVBSeUHGeqbIsTY/LBeCXvlABBLrZ5xuUnPeDuF8K1jND6BWyGwQCKhMXQqWLsNql9e3aruCuUxBtHPaLPKjiNOgZzU3q5z2sJUojFxEpXdDUYqcXjxbLQuDI9AoTiXxYhrlR/mCoisT0iqLbD/giItk9moA8koOU5CAVXmoKrzvkQd+YXrnW7RnTZXFUhiUvenIBFIggGYJQmuRARzQr9ioZxkkgiipIebJW8GptKIaCBzyPNyiYm7Ory0lT4bgEafv0gvXKIFJx0I0lH+a5jKVOIeWFjpUEJXd/2kHABn1gLxQehd0IZmLZ9wxUrIgGVRb1SznIkjz2SjXIpVzQCw2VPcdu/+gS5u8CeDS15Y8/6qo8/mieQBXCk7Nhar1823r7avgv+StR0wVIxfxTAKcolUzhdWL9DfNxL+wEdfNH/4TmHi6CCaWCo1aFJNQvgrrlz0JB6+U7uvdeN7x8O3j7RiwOlpYBlukA6nrIH8OZYvnznU4HavHiAgms2XV3YVZQClM6GvxEANxmKViIIFy2yinBOTrdYf2Kgsrb9ASc5JQ+ZGbsvSjanDqo6zvZ+vqtkQerQ23V9ZvO2/f31z5pP7cFN/k6wmw0bAeOgg8/bPNfIArItSaIgh9cI+S3LAU1IAGvzoBK08nbztvnjRfQuF//j/X1H3ZOduSLUDc8uO68feoQPJ43a4/aut5pJG8DYM5Tkmfn4BycWjCAgfZc8B+mXTQdOPQcY5xqqEc/VNZumAOwkZZMIZCClFMX9Nem9tyaB4GE+cfpNtq/ovY58027w65/PqXpuH9Jo9Wmx2NR5uXq0YTNa/cQQgacu9C4MXDWa/PHodFOdjSf9rLm1east1GC7U25F7jthNBHidCeQuLQSkmBa6bX8Gh6Sc7uC25bwMApyUFFVnuQWjcSZ0VWcp/5mMsqBUNuuNSS4QEeKnNmHmubwUNFyPSusTKHampPJBCbBNuWMCJwpEaMaUYbo2BO66tuzpQmcmTCZbq533K6K7ehYQ7geoAhXhQ+KSxfKpJ+an1i58++nSOyjQbPN2BYEwWMBmMIgedY75MJlwcmKhhar1yyigk623dMmWrminBuNNhJIabtNNFuIaK1zvwMFHE7ZL2KpCKCqFqMv9HXzX6mslmy4CNP9gaBRZdFzuW7qDhEUzgRHwaloM7FvN1LHHpFhYmHqe1+0wyFyXR2aGNuh71CC+S8oShUCKJc9VASpV+wjAQkbOpNpnMjQpNDeaDSHu0mpmFV+ChxBeQDZdNe3tbbLp0dMmQ98TTzTElpH4YFWfMZpcpz99t626RzgAJ7Fa33vLQbRQClNwSy50u0HDHrlU1oTuFSUWzOzwGoT7nflSWqIxAE4RouQQFjoVEVGvRRaKL+qN526YzI3fw6LHHRwYG/VvbI8a/yuMCVQakCVwiB1o1urPqxVM2OnaDtyGEkvY0UB2W369lBOXDlxtuSzocAtM8B7qIU1wD7wdvEWu122eZ0c1Pqyu8Z3Z8PNNrvwY/PPAUzoa7nES169BQEfnBuCX5kgl8GX1o6adPzS9GmvEvTpt6mNDWzU9BC/dFPf2rtwnp5Fer/q2/+438PzY0PPrj77vrajRunPpgfpp0paO3CZczcXp8/edozN06duvvui2DMYVBw8aK1Tq/bKVIBXHjvwnL10RtvvPfeO0s/e/vjTxZPwbvvQmsZWwjeC5CCZYR3lvgd5x5ZJO4Kxr5T2mzwQ9i64Krmhp29RRM8uOHklBMPW4APKnHWGWNEgrKT8TiWeVgNcu8qGx9K8OfZSrVXhcYWmOHbzg1M7ZjOm5VajCwCYnFq/aFcUT7tOm6olivz4YeEKtj0kVMXlWnR+4ISCc7A9S1G4+qo+VEwFpVZgEPXsi11KKLDiBcnt3Kch/ZlobiNxWAWeTFGEm1fuXZvMwb2pHIHefD5Nqycn0E6BbSN6QI3kAVoFSOYGMtDIauoiOx2G3ddVU38eC5yMPEQJ5JJw7E29qXdReku7gXTKEOVnL461bxaK7MYVB5lsZV/mbd9qA7xDeNjOIZjOIZj+M0EDzxGB11bq6Er21t0IRunjlAuGi5q/WBglykzBwrweR4dGyV6gzggT0oBQ6ahWccL7TbQPJifz006i4G+cAFB5oNOdQ+LSBsuxj+phnpTV7cE7tO3oHe9uxH1SpR4kXVfaSJp835pbt0KDSs2qQh7KYj5tNxqqsUevUKEkEqrL2bAMi3pVbqAKzZA9a2SFBTGprG2pgWnmmlwrl1Je/z5SLGN6RU37VlFzbO7mWHjYZuTmyfFP8m4TANucwK4JvaPuoCnxHI/E6Mo6dYdHG6QvxHbbWzgMj21cj/HJni7e6WyTe3BpjsLrcG2AWvgWRwe96C09Xd6Ac1ROrLDChBW3J3rfGtsZYX9aySHkpsgpZhgQfTTy5XUKkQSSWGwHzjDWhJ8n4K+4xF50tbjrvUbwEe51IaYy72EpnX5+u4apbcaawyQ10m3Dr4ROzXAlLKg99yE90IuORksnCcKOwH7UmASVF3rg+6S3GfIiQzsR1pcDPP49y82jcc2k9p4Yxd7KfTOJjyZ6sylVN0FKgOFvsUQ5da9l+IsAcmaqx86DN70AcuWA1w3Hu6t/xWJyKGMo8CHfmUg94qg6POIZYHx/ErmqYyLJOgXoqzI9SRNygJVDA2KQ6UE5MU+wuYNtVBunZ20kIXMhtTyAHrBoOwX/XQIRaUGKfS0KCOR9RItKvvpETyVYRWEuieb7HTYkW9qp7pDEH6WpWUBJpDDKu1hvkwLoaDH+rqKkRgZxIVATkriZ6n7Yal7PU2PXZuKAKUa5yDNZ1t/wYsB9H2/SHLlFYNhodQAwiL0ShVDpSrm+zhND6OyQtFTOLYpFqHP/IJMSZFM9zFQmt0M/p5qb/XOGZzpy4jzAnyPhmEZ4WKdDZJK4gpV4SzAPI4sKCUSUEiT4+oUlqzsFRwKznMzzXh0gxw1jIIVzEze1YL1xNoQO4kJgYKaGBFGYRxrn/dkro0eiF6idOzcm/jXD3tFL24lUE9DgQ5pDFjB2cZH2i1To3WfFaWESvvY4WE50L1kGPb8HAyLdC/ugU8xvCF1Yt/Ea4VmmNe5fdw0c5KifzrcXnAHifQ5TqsmwnnIeLLH8h7zA8/PmJdI5hnul2FhXZ4yR5Eu+NAELKFZi0vfn3aFlCQJTPq4zG+BE7Q0XLILBlL46CW7V5NadxuWN9/FSU6QGCEzb79k67vA2am3m6qNy0tbblKI2RWC/3X5Bx+sO6+9Vl9xTdNQP7P+zOqV9bquKUpt/eP6lgerDl6o/7L+i2mJAFhZMv9zKvmXLWPhFkcK/v3Kb8O629l/8MF1eO21l0b3O88AUQDr65aGf6Na51cfWF29d/Ve2Fc4lglgfTsKNoGWC/7+2rZQqxepK/izL1kevPXhP926Alfq+797/3ehXq1/74nnXrz39XtfJ7Z7YAMk7S/Yiesvw331P0yLptOJouXlt9+m0NtJCqCWb1oKLOv9M3d+abWz2uk80XliqV6q1df+9PsnTrz88jP2mzD0URrPUsxOXn9i6d4br0+Lf339c59LU89Lt06jl+E8Lc3CRsJCExmLOulluNPlFeVJnM819R9q8nzqSJTbYOmuEzt9y6euLy7fV99Xv/HK8ivr9Xq92nz/5mJntT75Rz+52WniVcdYBvuNlF1d3a1+XScga1m/ES6HjoI/XBXwJlEA/A/+7uNO5wsdUG+OUfCifHWuFLTw0YXwQn1t1calMmzoFxHWV+trnc4PTzq+tBSD9vYZp7oHBW7qYR+thCtAFNzfuQ0+QUQdnANW4RpRtPrwGAUUL35rnhQY4GE1mliYdFfOJJH2yO23OHDlTqD1LuCKJZv74KESr9rfb4Gp1EkxVq1oHqVpLcQ5OVHNDcep7RQSN4epbe7MBnvvn+s98pP31J5PdK8YQvPxTG9kCI5/7nf8PaqN91qd9Sa3+TBw1tR02MXolxOYJZ2dhy+EsLHJnFrfBT/vwpqNp0ZFhmKUsCzJffBR90ZjwlAtM7GDsHNrd/p/C5lC8wBaPx72tW98vyUarSfGsYz7EeqP2pOO7GxMeJLd9jAIKXcvqu0A9OOquSZB8zSjbRVNoctmVGcSxZhIbmw+jL2z7X6T2pza9EsDWyCDtr/sY5lPAdkCl2k9qtI01xIa8xH6jZWcT+/ZHQM1WUADrnT2hUSSuiqQQcFkwFAzT2JsqySs3Gdd6acxSstUSlpqRYyPc01ursEVmiAoXoHi9qZS2vdDIkHT3TVV5JLjrIProAdZl9FWBn1IlNtxMc278O3ADiDYRRqahyERrEvk2KqB6eLYoDz4SnRZ15biWKDv83jIK69tzx67aRMDefJFeDf4bAVyLw5okJHvt4p9QOu9RCTE8tEr101KFhanrpubXkdSYAM8hqIYcCH+n72rC5XkuM6nf0buVkbc7vgqXoICNWYRi5Fh4L7oYcxWb/SgQIRX4MFhwUR6WTAElLe8yGzdvnOhJwTUY4Jg45eeEMFlDFGegiGOtpr7EAILMgGTh7zkLcF60AUhy3hXmtSp6t/57Znp6bGi+w3Tf1Xddbr+uk6dU+egpixqCpuGTnUr9Ed2aJMgdHH9LUj5o0xazirIfF7PQiLrGPlL88uR69xF6cd6LJhjpsdGfCZe3vSMoBUy347jgJ8hnwSJZiQeqIKVR/FaClhy7xLoIk+HEDNsWLo7MmxmQyzY+IDZNBjG1GcRDUKPkPOO7uYLKkjhFdYnry8ggOaH+CkYhYZkdLmUMIcuD4aOyDrP0yxKnPGZoeFk3sLZQczAFd8z2XVrdP1svNTPDHAyztFEZjjccTUXvE7sOGLAatg8ktHmqvPqRyrgF8qf594z2PgdEr2Mbrjx0D1rDW18/TMYutzpjIKW77rWeJRYHmCF7Tqo4iHJ2Yp5n6GgsANu7J/xMXO9eDTiru22huMx0Vmg+yOXD5lrxSCthpGlz5mHK95DpMv0NdNOWJcN0GJqC25+qMVj4uiapvHY0QPLAM655YmiEMWhxm3VoSnFGa6ZOo3oqpiCKw+SvVSejVrZ9cHMXuK/v5ny4oPfW0PTRmolPTiZTPoTmDwbdbu8+7Pey71ff/HFFxf/eDF5+ujpFNC+6lb45LLdvfywvf5uQYHcJxTcEBRgQ7r4+4uJrHpiEL8dBVx8aMCQY6GlQCag3e0B6gS27val0uKf3/3B6z9/4YPj1157rf/Oc++3+gKbp4733Dx13j72Jh+sjjmVFNy6lVPwufaD16fwtH30jdf6U/iwffnhNrZ0Rbn2kYJbPtxaGulNOALbQc3Yo7YmNWSPoOPr0ZuCgxZ8fWH/zGYVS4oqYDnvXIRz9eRKsIjftiZPJsjBHv9mOv3+9/7z2HnU671z+/3pxU+j919KmPh6MPsxcciTz3rHvWOLPPm41+6J3P7oa3/1yhScR+TBc0YLrCfk43opmO1XL351MenDpyIf/qn7uWCQP5q+/1Osedgaxe61f55+oDjWnvejGhJf8Fm5+BZSMJ32ek73AX1Ab0F08fzzf4Su+qB/3D8mSTz+lD+tgYKVYEkJaX8M2l+M78C/82/qcGPi3AD4sz85eQP+Y0F7eDxwtRbY7+p/+PV/uIffDvEITgOGAy3x2f6DG1lMwfDZ+Xxh4Usvx09yyJz0scvEeTm/pJP0aHtVsbQ2zo6jFzW4uWsRq2uBHYO4ymhjJjG26OKW0BfUy3Tsy5N9AFL8q8qKZBt1ewnrZfGzMMBMhXilq4FfHIJ3KK577SRGggZgEuYHztKqUgavEinCjaWeDlJZkXi6XHLpOyi6RWlcZIIULZFOC1qCye6wpf1zWq8q6NhK1o/KGzLlR0Nd5TOMIUpRC7J3hott03pQ6S0XA0vFZPPXxVvbkcqZjiJPmokqxDB1UuUVK4NC1twi+eNJPoxF/nAbTKpHghYOIZr3PR+icWOmReuG7BVITKNIlgLF32pdZ/K2QQcdngSdqIVjzMiMwJe8HeqqiDucRJ1gXqtgC0rEY0KwWqEy6WujzwkutlS8cyjLIHI1QpCDdzm2HtEaxNC9VmXuvNJZ8p1U9pqBLsqbDL3INs0x8vDyfdE0Aerm1NAfYbcaLQpAN0XIpWua7LkjKxQ/XzZTbJCjOBLjf324OwXespkVlvw8yzwXrD1jFqOS6RnK7ngUWw6L2dnuFCDDqNZYz8GVDLf4upqu54TihKKkHmcaRPxIdEsxxDXkgYK2qHfV1LJ8eaiZ0gb5CFKDHTo5F5VxOFpw38aJy25mrkY56VbTVGURvJ8+klYaNIzv20CHI6MOCgh4bJVNDcu1O6IN6jaMYWzjomSUxBtge9H5eLS2R6oAJrdzFUHw2rKKdoZ2xwbHlR8FpqwBiD9y+XTAzrY2rlnoSNTXeq4UOBA5bMB1x1gOFuWRMwi0NH7sETPg4db9QX6jL6vBL76+KFZLjVMiULJ2ybX7ydfpVJ0/s136VYQ/06eflUbkt3snMLWmWefRFVz45/Dr7QioiPLoFyn4DHKiBAXtz29uRYGTbQ4ES6+mMyBl6wW0BQMPzrRgnardJv9D9mg0DGXrsxR04XaWoqa129CrZb3zG/AMf27+cpQ22dR6lZxfkPtnpFk97a7FtrWJ4dyYveItbx7vvP9cC/7tZfWuUzWH5PQe9QR/+0n39svf2ZIGeFw+/cVH/7Is5m1sgN/434QC8peSAvLoweVHqCRwvGZWqCqmU5gsC8N5g59NLmT49KOJ3P/qC/r2p58eHcFvt5pXo8ars5eurlZQcNw/DlIKLtU1X+DT6euvTz6YzGuV7AiSD3vT3s+EsRrApNL4EvJua/lweR1jnzwU+ygXFkjPNDCZPGDZpVZeccdrnl4d60bdbE14BlLxgTMYoKp2cowu2uYnz80aVtyuKI3irVIBjpiFc1M3x2Yqp1L8fHVF3WqI5q5oLDs0fJG0yXyldt3yDWjxRBG5JuQ67wo++OmwBDDjOkwzpTQ+IStVgspIqEmDP8Vs9jIYEFNjUsxJzE5pBkYa/q4BKx9iYNkTuc5zjCaSdOwlgl3rAVsdnHUsiosnEDKdjCHUg1FClCqAZWsBKoAuvpyWr5+YEg8TcVLoRsqErVtoC/MVcSeuYXYyqtysO+D6SosB88OgeKCUA7D3tEv31DOZEHHqgOnnen8xhGPRZQ9jGGm1zBesg5JK5qJJOuqMdQqExsD1eH/rnUswc9E6mipEnZwoAsxktmIhRG3AT4KuFloD1kdcVzMA9KLKtcx13F5hBmCGeit7V8sSXGqo8YBrkVZuBKVVLfWCgc2y4wE1KHcjkOo/BitEo7AXv3VynYNKR2rKD0a0FYFBx+Cc28UE92ahgANtmYPk64xyGs9x0E5fDFqobSZz3wGtwt4ryeBznC76qtcC6wlMfzv5ILMZ2+22u9Brd28JdLs3b+4n1RKewtNnJ37Wz+cU+H4zFPR6b7/0oHf7R+oY4OhqCse3eoJpPIJnn201YCHjBQHS695K6cEtUgBHTVEQwd2CvqmUxduPlSz+Ofh2XjrIQ/Pt7Ulu0Lv3er2fSxvDHx/NjbavrurxLLuWghdQT/3RI22uB26GAgH9O4KM7/+y/8tGUluIlwUF33u+//w+0/Dnx4+z53uDYtLN0ndWeaZJvsRRMlRoiKLVQ95VodtL/zPkIuYBDAyQWuz+TIjC+iEx2SjlzsxDi0yItBOFqrPoJkmN1DObvkSnG6WzCZQiOUeGzkqyV64HH6sa4qCpaZCK5bWAg5LyJr6xDHxproJyd62uUrBUJtPQoSvJi6a+kSLND3HlhiGXNi+SBDLYYFKnMvxypWvl8wgZ72ArwR7BjSyZiEZ1TmQU2Xh5lJuFUlc6Az3CM6mWrHK+tvxHD0S4T94/eWe9Ax2LSkMQHiQ1IKAUHJ1KqWeEM0zotynHTrafZ6ck9GzvoQmGIH88g2xSq4SVWvkbwULtcj1f56hxZOT0jJd2Be8EkROU7oiA0ho6RYWEa2bpucNKpzBgRscsNYbZO3ZKPVmOkueyPOrkzLw4p2DjSpP0HJbpo28MzFZdWrFAb1lcTR9KhX9RB6Wqty7PQ81HLeak5ajrVNtJFycFjh3NNEmKpW8lJDgJCRLUJxCIeHlT1AXRSlGoBhSzP7/CilYG8ICxlmBvoRw1i7FT+kUinOR8ZlzN7IGix4WEx5aryetIH8tAl2vDncCRvRORvDOEqaJ8hBuutUK0lSF6RE99S8QdOlUW/5pClB7Uz0D1LnFtOMBNtawdTk7UcZfncbrtNty8UZQXdtuXn9y88V+XdVHARfd64zSnAI/bhS6XG7d7d07/tVe8AvzO6WkdBPxu4D3RtI9F3ifZ3Er8It2Q8wa2/e67cGm0f/KTV15R4ffvAzztGm1dr4urFgRICu4kmYozmUjB6Z2UAuND3tW0IFDp40r1HvDud78r5zx3R/RjKOm3z54r/fevQfuvc334mRhNYAoNccwrKDg0pgcnom4KcFU5qfOB65GOytNxXXGitplJ23TQW3W0z7ItK1zdr7HhMu9C5BGBMk++FbdCi6zhIix+L7Q5x2TqqQZxrdbiZmGAFVlFxWmwOmhYSPz9TiuZW8jXLNQi9YVkbXgKC/zypAm1UEudKp/YadKFQtiZe1y1Jj5JQf7UfEXagPZgOmauDtAsRCM4YSLOGaEhWo5CfQyyx7SVvTj8q8LQ9KEVmSj5JyzNjXrdQyGWZCoFkGu+NcaZSRwDWoTIyZ6ilWd1765em2b6wszZva86AdOyLSZVMEZaWi92THETxDC20DlOJIhxiTPi4lrIGySAxroeeSKbAhiKvBqOWGL2qzEwGNqorw5nom8S+cCseU5uv8AFA7oeQ2LKwTI1dNnUlOQTQXwN2TPescANHcfhphWBPtpDl7QUNrHh3BparBPY7By55HNgIWuOgJgypjNdH7sjtXoAv5SsRbMIe8+NGD0pDjQt1kgyrYIOxPadahGCJZUS70FH7dX5G1vqqyfIvCpXUV/oT/r9KVxe3n+Iv4f38dpDwa7tRMFGmPQnE5j2ephqmnJKyXbIvCo7FSefpldXP3w3T/2ewG4UQMG7ciUC4Ojo3R+qHFAUvPdes6XgACHMA+u9N+Ama+O44e6LbIuV79vj5OTevbQOKItf1ayfrULqVXlekr2MApX+w/t1UbAZJv2ro6urST/PA/S2vNMjGW60yrOwKQV5HuxMwVIo9iMqbBeBSNET2Q8JM1jBR0R7SZDu5akHASlsd4Vf47OqofitNJI/pt/ahxLgHCgs12Igdeg3VMVMUkVmbG8TNw2+XmXMz4zglcBCJdqBK1Uy6po9WYOsCMK5KwXBdN2JQWqPLg+R62skEVvpyV/jGte4xjWu8aUEgfkRaeq0gy4IU+EkO8pjbP253svcFNltnG0qPSCzrEhc/5hu2fDTAmVl2sQZn8I0spaFrwOtSMHSOQRnJlCJ+FQpRxUfvhsYlOqfk1of3z/CgsGkgcoJU4mWlkhyKqhGrigysjxIaW0y8Xc03axoOGIt1FPXEZ2u/VVpcvSiZQ1M6V5okXpoRczkwzJGtNQr5ImJQnBl46agDD43Co11Bq7VQUtR2BkQmO32NpS6LakTQTmOrHK+tD7vO9RvRdqglRRBbVI+mZNkZRRR/VVPFCouUZN667X03qsTTmF4dpJhLDlv7dzRbwblY80DEkNqRg8o82pQjGZqt/ZJqWq6ZgP6YEKJWwjhBg7ClsIpJrCeCEHCYDBOBM1GPd9wUrEmuLbl2eBREw1DedAywDo/N+Z1APcma/Nc1NAnaKIM+y/m2QbqQNSnIL8WiYjfkofRwJKyANpc+rLhywnN01OUzZ26wR3wa1LDlJ1RtMHDcJUlzuujRuhhlPJqp0AOOpwmZedzIJbSbqomMEs9EymPRXslbAUFiF5vdbz9gIn/8/CtF8//FC7Enpx7cFHLg8NkjnRlz3zZuzp6eP/kMdpowve/7F1e1iZrFbXgb9ZGQgruP3x8klPQ6+0qb94Mk35/8vjxlayHqj2enPQu792rL4V1zXHSn/QVBcnq86O6KUhBEm1dUjgnM+E8OdYXhKdX9OR4UYwvNVhhu980ctDSmbIdTFbcv7vtKgt0XhRddDhuW1FOg6KyUWmUIfnLxNaO6LU8U3CS2u6SNuT3Fj+Fr7qNFbZbwky2q9r/ivczC9sdgCmwwjmdWQvFs22ZluRMaefWAitZ17wCxbWbYHGMq6ZQOgOsHbty7ix79gxhnTThKJMtyjjIrlviNsvCctCTXxlreR+r5EGsCgrTG5qcvTD3o5vr4TuFy9lAzjXOTcuBKEAD4zXOuVZeOCEN+zLmMsah1p65qpqtD2NcuchEs6Gt2ixJK7BKsdBTvGDcUYtd0/x6p1GrsQrcgbHFbSeQlWDWDMROIH618UMMATOHQwbMZlBrMUiNb7o2mtcSbDujLujMW1ly23BfLVy4vQ5aoAUwEIy7ForaW9V1bAVg0lqVYlVc+51kf7c+CkB07xaFu89WiVvUjj0MUs3Imh8ruqRj7W/X1p+Txyr1+vPA0kF09tRZx70/PlE50CynVsKbd19Ua5igTt3cDdZenJycPFbv3+/Xrhkb/p3ar/xMIgWqDuyBAvOlWRvTS6AoOOS6VlUKtVPADMvhufvNQP5JsoAx56RJxgdD6Sz7ddQVWB5jC+JIYfuVhGqpqX/coHQ1x+68ctUeYeEgOqp481aIFtE29zo7a2YuXlFadQxItkiv6G0Z7RlFyXm08bPqR4PCmgzWkn2GRRq6fP/0LMC8noM5xzSSTdNK06PJFWufL/elggmaXy87thlwmeJit0zN4qACL0QjNqPXkFCLn63t0fIO2iwpeMSwzw9IgRitd2oxc7YLfh9ercRD//+Etm+bKte4xjU2xvQadcxNUPSoWMNztgau4z/wEkXSfJLnY7EZzw4tzk+lV4ZasU7ARuR2vgR4KQZZch8sDDsI9lyJ5jXg5qZK5mdW/Zk9Yuv5Iza35oKtfdRXD8VC4Ns8oBLjt+rJzv6cy2wCN9jbuJVWjbg3CtimNzRgAWu++Tft25UsvrwHLY8N0XBG0PlLu9q92wGH9PBbRI3S/a8iDj4hWBeqaUTUiU1WUOwbmfWyJlMMm0kxqaJ0fUxqNb2io/kUvwQwwWKHzBV0wUYbFbYw3BQbg23v7bu05JtvbzIW+B2ss3scT4yLfqUbRcIptAhouKS1wM2vc5Vrzux3hXLherjxIl1wjczs1+JAY85tv3Kzud2M7a9VcEO1WOlAoOnBoXg3pZRClkz+NQctWeMt0eSXygqpA06A5vZDsALaYNIJWL5jzaee4Dz3QXUIIggEnJg+lz0aOQQHa0RgccfBDtUSNYE2T0Es1xMwdcKaTz8HO9h4KIQwCAO082HZlB6GBsSrd3Au/zDs7C3R/RHTsaZvwRvTo8OoRt/yqM40pODq0E6HDgb0yxW8Ah92p7b91lsHSx+QgkNZOEDIIfnLh0r9GtdIQbMjsjCcrAlfH2P9Ew4Ktbg3USQni2Lsm63fZFxgkfQop6qscbyYfa2SBg6URtInmPotVXBfAlox3jwGYMoCSFMeQ9Pej9JMTJe0V1nazvZESnU4sw7NUmwzytLgjKzJdLo0pDALYW49zjUj9ZNLS8IDih0Xlv9czrAF95Ui8W1SLs/flNqeNVvWeVuPZkJm2uxGlhp4Iu6c3TeGVsKyGSnrtoOlyu3BEudjs/vmMAAeLto3iDCpxLP75jBbBxqtC8xl5T1tLm0FrpHyvvl1d14ySEr3p9X8d9WK6ZL/V4aChUnXo8f8paHA8I1uG37My3uc4bzGNQ6BUPFhmRw1O1nCMxJYwGOWLIstilHUQ1fhdGNKc+xybxGW7hBqoXI3tUxddyydUIdSkFZ1dXSr7BDdsixdehy0qAoH3XEcaurmCjErigxMM2d1FwEDmSZ+thguWsxmI/GX59K0ufSkK6/YYu/Lo6H4aewcznEr/tK9pfwPYGbcLe/Wlmoe8fQg7EBHsK7ov9p2OqB+iA4ALDo35JGyWpaHteT8gym2ttiieSlLXi8bo1iVH3nYVtyX/J6rarbFbIev+yyhAu+2fEOyHw5QTgZOIdzymQ8ROrmFxMYdXk/mXviiR9OK0vhRUq1LMk81i2CpK3pyxcxiZTblkF9uLeOZq81C2OjgXGSAW9S5CC0wMFlLviGXhue4CvcEufqgEymy3bTY1EtQVQapHHkD2IWnbIQtbpnDvMFCBhbHjFVmA1R4J/fKAKpdpN7fjZRN9dOQbZFzSTsoc1S3LUEKx7GoMbGPb6f5sc01jqvRfQ3f1uCFcAc0M26l4TI3vDB/whneoXmxy/E8iaGd8fXEeLEHRjwCj3neKD5jju+hENTzWIecFcPB89yYpuEY3/g/9q7mR5Lbuj+yqiS2PMqwjBXggw4sIwgEnVYwkMDBCMsSfMzHAsFecrEFA7oGCJBTIIiqrgmqb9X+C2puxh4sQCcfDKsaSnJSsLn5lggwkKsnkBIY1iqd9x5Zn93T3TPeFXxYDqbrg6zHVySLfL/3HsloRKHNiUJVLRtd5WzJpuulO84AucUh05g95hHl9Ubi9RLvX+HRLSbxmxiZTDl+AxuKV2MKNR6jPNlEG8iJQpfiaBD0PAgrYCWE2ugF5YDjkgBbTOOX0MfjmIX3CzGjEIGQm3oJy2WlxikOBQtEkMOmkJQ1bGzH2p74dohv91DAmquGFJsTCgC/vTw8n29WQMWbb/yDmcr3xOdDfJPvUKjUJMXmBHeSTetyR7UoXS6xBjc5NiK8Npx7Et0Un3O8jUYUaLk/TgG87iSmwLTH9yvA4UcUXGZG6I3Y2JVq7cbvuWssqJ34zMdTFdmW+qshhRQRpVjULS8ugSOIbcVJFcGW73D8sKD19fvrY/Hv7KHwyv4UL8LN4R/+8VDsf/zsWPxxCsc4+NH/dqOJfOvzcHZmw0n7dy8diwd4918PpfjxPx3joIWaFfMW2phGnxbod/iETH80EIZNAxMRvD+PzPhqIm/a/qwbeKfipPOHb9Sy48YXmmStXqwe92LB3DBSsNr+mnSOc7l4z73dnZ1an2cIFS0+zZJor8QsQzzvEzaRoBTvH1bwfSrGGPvoQf9f8v2Y5Vm5V2ZXHU8wLW8NmYywFGJeyDbrU/oz22OUjpfIx00McjbU+viFT8cNWQCxnhxTyJu4DG83wmHGs0ESQYNXhaFemyqkoGcHA2Xg4mQOBDeKprt0TCiFkczZCatxEjObcfhLMOs4HomGbkxXzc6K/sqf+cG04UqdSNyIm7qVtcY4xA/Tvpk5fJrOS4zfiNHL3gqv+WrL/ClxkAp68yzuP+iu/duOdemV/qrPqAhaDyoPHK6y8AaLm7lR+yIog5KY4Ix9rTegU3Pzezkk5TXPC0J8/iuqUkKuvBxkArbmZSD9SxxfH3tAB3G/tNm8Esc9nCuyIjDaYNYQWVPY5mg2Y2KzuYSCii+iqQMi8HHYdmtg3upv3ZvOgFWD/1V7HCe1NTVj2pDCdykbqbTPO9gH63ydKGmOrn8mW9YM2O7aOPrln8N2BRdcOX1S2vG5SPKAM/neeq2apD5uH2rcjjEv4ytqw3Y3/YiF8CCz4TQK1UXqlh0DDgsi36j0KAOeVjRwShq9pjb+4mB9qmAFpGJua4GVUop23U29aCGqi2WxPq4EojWrcRDpG2NreBFrfUzhYNiXt26B16qXbSVAyXqAJAUg2kPZuj66/pm1tLz/us/O9Qd37FE3WAOxNjQUUUP9QRe50UobcOubHp9Qmk6gsFy9J+rQXBpawnqNnY1SbCdc0J1EqjUOsqeYycz4dWswxhand+mtkNLScUFL0RCuaUUl6I5Jbba2J5mL1e6ckXcK/BQP7wRWhK/1JX8sC2jC64Y7FfctJwDFlPu88cxac+J2VXC959//0ho/30XSb5w482G7/fpOlqzDHMBtWPgDC0+fvvPeO0fXE0cASjsl0T+mfQnrng2Dfhev97bbzz6zZAxoTnFJevpUfzC2qZ6dyRM4gF0OunuBA6eFOoUBgxxg/j0Hzh8EvAt/Bq8eMrz/zdQu+evorc/ET1pvsQT49ktIQbQnjdMPn4lXML9E/NWoLM//+vyP4vibs9Z+Ij4RuxwAfPXVN8XB+ZPz8y+vvxytxL79YQPTO8+Zg7Pz88+vPx9zgOUxvXNqqEa/Df+2POIASg0kc7EUJU3Cjcz5Ecx36x3aNeBXSmc63FVbT1qOfjl+Kjgf3duC0FAaKIhA9cgIerxD3COQ6ktNY3UbQ45v7lSuyFQIAa1p/M2l9kf6PbAUrybL0z41shnhjtkGvkBRtlB+t05SwtJZCbFjQQo8JgfX2X8Uj6tk6RtbFysfkxCThtGVGqWm4J+g+7GVBDdRQolHsd5agpi1rkwEak2bcvWFVUNPL9gXa3+9qOkeXXM3WGco9iDosPRPNxZ7ZY4B5w6FtUAsjlh9YWCdcqOLJ1DN1+yor1Xh4VFxR0VuM/LvFKwFUPuRmmIGRlaY0KY8Eoc8RbCoY43tAf8wcRH7v10qA3lLbeKQYScedocaMRw2b6ZAFjtXLOEKTxtvZ1ZA+6Id3b73JrPFIUOXvvlR2kYtLkmZEhtDdlWtpG55jfYWo9sMYVZGG4btCvTj70IsBAh5TOQe16AnxyZrtqaWsII11SQJ5XtfMh86EATOWQn1UAUJsh/bWJFSkY3H1c2LGtCedKPK81oqsrvGBUq6Ek+XXpECvhdqYWpVHhMObUJaSmluynE3zF7Q4/YlhG63QS5u9Bo4FO6oEW0zaeFKRkrZWli1qAXTqiWKO3FEcBT/PW062pspFdTN38GxxOXO4uCzVAxoF5p2Y1IaouUSCke1o7XztWSWR5Z3c8da4Y3PEZKWBvs31zKNxrtJqqsNRCnNR8aWsdYuwrjmgH7CjVyObxXoM43J0yCGsq2wmdUleSTIeo0VQUGsaQtYIQmQ1QdwqYYKadS3tlpLrDnbFEUrWlvTzmRhuq2lnj0isyd+hGvfSR3KH7+LCizmb2/LgeOvMwUcDRFBG/BfQ0IYWbkrSNIoknhMUwUJHg+/4VQ3c2JIFvT9Y/bSZfSdbjIdY/6QJZG7dLRAh6Y+IrnigWTPTuNDSMnP9/Y84KfIatVaFCibkQGZEDl+eKZGDKRIRWHpY1wfLd5KUIXewRUnA9ZR5wUtHJUXD4vdBaSS2fGGcNe5uqRHopd8+NH24fXvrh8/vrh4/Bjg/vb+Fq4f/44k4Ovz63MShS8+vfj0ZkL3H8D2+vr649syoLxQCCRt4/MsazMHGIgDvn8SBwSj7sIBtp2Pw+P49+Ss20d4u90+2H6w/YByfvz40SPM/OL6utvx+gYGYPvk/u0ZgJ99Qb9PzrYB0PYcnG/f375/OgdM4S6o8V34U8TMFB60WAJavPn9f/lL+Cnef4nu//jd6KWzV3Ub8fHIrII7YeKLi24PcX+2DSoB0sv8wi8C/eAZrwg9C2/POICBgyRwcH69fUrHe/efCwePtp0mzXNwdubrent2doZte/v220nCXyVev/HGb3/7HDiAOQf+ijmA6+vnz8E4tCxkWmn7Hnim+tQQe8Rs5vGdwyoj53EKEzbnJumyo7oT7tCV74QZpt7pnSfxBC7NXjKVrvZQ68Pz0lXqhPipGNnWO7mXo2NnCfeWXl9ynbwQzLL5IIgXMIZreu/eY3SuR2oO47HwJCg90KfQxQfaakjPaRBJWs+iPbjkkvGxDFuUJetZhs9ZhO6R6jDuwCSdL6gUmhGJcN4V2U4FndK2xqWSkpGxIT1DwuZ0hkwW5thmF8qZm6gf0fYMBoYJzX0471ktvjWW8vdwp++8vrK63XP7wX33lmUMUaxMColKGlrnMYoXMQnsVKcR/Vdhvzdfx9htTZQXlmOs9VUTd4RPKUQm2HUhKnRcN7/b89tojXcSV9woKZjnltGL8CK8CC/Ci/AiHAnOePWPHE/vM6MEppe5TB/jfztnTbKrDIKZAY8rxrII7VjcUTcs1tH0KeNHWgk7csupgrkLWswWdnVYKdNNR5SdHKei50h0ip2kmVcOrKDX8JIaYyOe3kesWWB5JPyNw+x6tpSLHf1SiDn7iQwrauEWysWOLVmKpsDETLWzFHk5peQ73V+Xr083hJimEsZxPOQwno3kGTTgNfCd7Y6S071MYLpKipAEFMux2WzS5yDj2RF3OyGeWcpGKXNSW4Zzrn8hO9mMSSIbsnJwyxCoj52Q7DTF9DIeI0ojQwpqlOQR7Bu04bs6NPAZud0M/JyncfX6UlgyDG9HCckyXcAlttpWNZTOFUu2VhcapCAHVQRGFfv91nGAXIjBb/bxnAnBbjgj9z+UvP1GxiRfRyUXeukg+LcxdccQ35mSF15hVfLQbtJTUNdhB9Rmz1WLZD1WahMCMUaV3qFS8BuYOY20r92enVM1DTu0uuCmV+xr7RF0QaxVoEQbPoDOde6EpXraydX0E5nsWeugKpwA9khNmDSZ3fETUQifIYsqBM7CWM8Tglglb4HI1PzST3Qgo67vRpoIFDVQE/cFZIJ1ToiK+0axEDbM0L1tOHFlnTyDtZKdOyi+aA51qbRN8+WC7GvpZkHzwe6ww2xn3krC0d5g7tKprNuRd3+bZldt7awlk168KVWd5WZh9j16ILj+d/ChHY7TYNwGR6tgPgPqIq+y1bq21BsDbFYiB3HaRLhx8MXtfWd3jzMOsNVFIPv7Fq/VYq2pr9rQIIWtbyX0HS23p6ysIw3ktRw8ZFsrtFF1joWTrxZ57qQLFtc7BddXyPQ4TmLkspG9Tz64KNKL1SLN6+ySTH2r9ZVawOJ0Q1HfK++srHOD17SG1MqRJ+2l03YB0UKsYE0V16bN7WqgT90Ks/e484AREx+KWmptbUXNpklibJgZ2dgens7BhwDf8md5OJsfZ6HKp1a8knMcRpctnOIkuS/cZlGb67+/7v3WyFbx3n+9N8r2G+HgeuDg/7YK3vuT9+6a7TMO3/lO8Pe9dQjPbMk6Nz6S7XKe1mxhe/5Xg7XO4rWAD7aeg4uL7far58wB/CdycD6yF34C3Tq634UzSHRmL26Z/X0EFK33lH09+NAOx6LdSf8ufH/iSdtf57mMkBMel2/LxG0C2VPHLTFYF/E2cYD3FV09Xw4+0dfXH/cc/OLi9QsDvyGrNtbOF188eLB98ByzB35b6z4ZPlRqARcXf37BpmTmoH0mJq8DHHwCMPbV3n4NgmrCNqKBxjSWbjq7zOKY1ncpDTDiZlg3Fn4nXTuJgLJLITCqMd6xzcbsjBEh1ovkDoVxwNhc85+jy/gqRultwX/7gtlzr0fnDDyvZFgvxsm99sVmlyAlj600shE2W9Ab6pj+OEE0+j0aaMajNNOaFPuWatlBW067JYrxuVVt4wq8XvM1pfTTIQs/AzBYajoTUQleHJOdyciVBbiV63CN98Mt9pTb8LwKK/rkfumX2IqFXLO/ZAJ5zIAiTmMFWUwzH70HIYWMvWfHFhs/6OZU7sGzlghnQYOQhVV9vP5BBmw4kYV863II51c9x270ezAcm4VUsD9k2VVlJgKzMOiKDL1sxkjNRCc6GbbhqLiq61EDK0C73qIJ5PY4nbDcBcvPEJ2UVEieO0xe+GZS+zR2BpCTQ2bUIUgYWQ7j+sZCYnYQNTiSEQtalyeFJl5yK8hKPynXDTR77vP9RvyxQVHR2j38WNtNoIuaQKcg73N28e5SGwWdkzW+dmp9Jj7qkLlrBjDn+GRPZWbg9Rl9aP2HXqRLxV78nqdLSGjCwGR9qt1gR1yMe4tsxByXpcjYFp6E6pT0mkXOr5h7JiT2QVorhPS6sW0OjN69xa8a1vnt1UkHPDR3AwGDOLxrCFwyic9jelcwZqxJh9AnbAtzco6zMrc80w5hGWI37hVL8i9N2lijRLPrZYkwRllQ6TJxG+frUxP77sTcKUz67XSB6E9jTfI+MznE2M1SkUcrHHSyPe57yJ+N4DIBldnSNFRT0hf/JZ6fwodvuI4yAz8k4UkecY+fcfYRfnJuka9Wl5t2GVrBQFmG1Q4sVsVUHWpBnLS2rK8DGp49JW50Qkg+JUyOeFC2FjbaRulmEZ6xEMZaCUIS1y2sAnL0Q1fNxXPSuqbWp8YORHYv0LI+IHwBDU89aeuiWGZLahm2VzBTWNBnj91AFjWlimPLN4NK3sHqFA5Y75GHDiyjFbelXpByx78hE3K5y+OVba/yy5yhfdw3iAxoGouGKkPxABQ+nYXcyXPWncJB0nHhW+RiZTMNEWH4S7/jjuNMr+LEYpOw88cFInr6GKO8hLaRAyZHmac47r+gmUQ9MYnkXjJBuXPTlhXNjroCI9uNXidNIbocxp1qN1+V5rl+CKN+59v++qTwz1x06cwH6FtQBAqbl/2xDP1sNfS35AmLMvz1l2M0wa/Qnpp7IBQodeHsLDgakt/rF/C97UcPm+VvPvzj3QfDc/emz8Odli6/gYM3vth+D85fSV7ZywHz/ujR9jxgqBDOk0M+qfvDtkOugZtrkIgPLj7dfvqDHzx9ehY9iZKHyaP9zz56dA0XE8h2niR3cn8e840cfOA5qKqf//x+u/30leaHOwj9tR+9eZb8Bfz08l3zckIesgAvk89kA39rX9td2f1AeA3eVDju9T62NDS8Bvrffcv+CcCv6f7uYPf1f7/9FjCCI+boE9n+nmsb37t3cfHo60d7Bc59epJ/27wqvObhUaihZ8DB6+//T75bh450R7scPDl7ctbl+PRp8xHX5O/nkXv/Zp3Qvvu/+tW9ez7HPD87eyYcYPjl9pfv77nt9pXBH0aYtU/G4zNBOeYBzQHhEZeVYhpr9xAlEOt66x0ld5y0vOmBI0F05lyHvzrT81i/IIfkNJ3jqZ/tKBidXoIXW0uvF2BmOjRE3HUENQTBuPHSDil+7QwaVDzbqZnco9IxfDbWOxAy3meU7EFUQUMZzd/wd4h7kmpjQu2JYtu/5gnBVvqZqyWn9Ng66S3x3pxLmIDmxo6Hab/C7cBP947cU2Qev1fQoWu/zlQsFkwdn63oGDPWjsByCgXORLyGbjZxpyUb3XJ4ezv0BMO6KwRxTahJA4NTd+9tvFA8q5fXQeOBu+FC8lQbpYIOQzJBA1OEgKTBdHWVjF3Nu2nYpP0oYv8MikRRSu1DQd8EbAFl2lgu1hhCZv4DUTREz8Gvm3hadCXhZqlAhVdu2B275RRin+BHM8nKvIDaNa52wfotm8H2H7LgqwWgOGx4HZo5krchWx+QpvN+2rpnT4E3wc5WblJSoYgs9RJrXuZcMKY0VB3xFU/hUryC1YJcqz22KEcy3szPPetyxMdz8o6PEbhZjbgBmW5VE1tFWj7rW4MNhYfPt6uywRtyRchVJDRhVvCXH5qyYXHYDbU/w9RZB4Q5ceesTu/tqDcQoeBFRH9difQVSZwqqzI8akLOKmszbBdRqdqMGizi78T6HPF7qywSDfmrrgWYcIz4i7E9ZcX8xxBJ4k1aKE1W9gXW27jTuGkqmjZYr1nhEvM7WTm8fyQtjJSAekeC95h8frczOXq9oPd6F+0e3eR6WeuiKesiE1FsarkmSKU2Rl9dIszj+ZKCvyMRMzmhEQLkBMnKvijLvU7futERyKKwENcVQcqrKCuxd7GmTBBHNl26Wl8tpMYGcxlVTlFTJ9ZzkGVZryrq+5KooFXQcofNIbcLxOSq6mrTv1Jn7Z6GlXNxinHd8n5mUxOSq5PItEjtsucAIp24pjCxzFXDpcSID9tA1ELS0vyKBVirHWmfNCneaq1nGe5mz4WgMu9NgSByRfOo0zyN8vUK4qhOh8nakdWRKeJ0tUa0lyr8chpR4vdYxbm4MjoFnn6M2F5jDZC7hIBCZDNDQAv7qoEAWmjxgmAZjkFiJUhdIhK1vuqSmRQuk0Vdm3Kh5Qo7AhqTTG4QRRexLmpyHfNkLCNpUu206byb3IcvpTS6kKuqxi6xyWtVkQKH/K6kwE/f9r4WiUqWiTba/T95VxNjt3WdDy9JgVRHGbIY1w3a2mSqJoIBAdM6C6d49lzaaOEGCaouBgVaBJYadIqgCwUu0k1r+ZrvTcDZ8WUnoAH4CsSLQZGF0W0U0oK7CupVkF1ToAsvtOi0ghTAUsWec+69JN/vjMZVUaDnafQeeS8vz/3jPd89PyylK9PY9I4PqkjKpikPITikaSWpqWfsE0t74UOZZr2xDEWuT6gbGjVV2ViO0ywqElVkbjTAAcgnDjS3mZWpwjEhsLvZKsR1S1yiD4tY+X4EfplBhBBGYplRsNTxxIQCsA8u/a1oFcdxhnenk3F2NMMTMY0PP1Dd0wQXvjTCPpjGMvCiCh+eTpkIgcOtGMtEyoZCVWO2HMcBz8magkktRRVhuUX3em6/a4hw2ERQi4qNc8KjnM2+gqNUhKJvOe3fSpGmqF0mjNfxOH2TBSSI3+Tz1ynr6/j3nsk/3C/I6YrXlzZ8JheMrt3o3LXuPdN38K7Z6EJwc+/63q1b93fbt+++/Xjr4cN/RDppRwf0ufn4+uPFch8iLUIa1nUvI5F2d/fXE4CDC5cv//5BL/n+HH/8+2Ds3ty9vvv66/d3R28DcnDhQntwGxHn6KA9gZObW9eXImg9/PLDL6/iYJlYmweag0UN+/8t0HBwtb164QK2LILsg3Z79Maf/sW7Pwp/dPPy3id7lz/5+OPF/Ah6FuMPrXkPrPdn2qTh5vZNRvSXL1/+gkkKbt0atMrV21d393b3voR0ANsj5/O/9erl8PLNy+4n7uVPtpZ6YQXyO6VJD1bYVtz6654D/8ZXv/KRA5W6AdYiT/vL2phT/XeeXAL4AXx176OvDfHCc/DSK7xvsECY5Uvku1vdgC9SyT6ZZYVc0heNby/Tgwe+/7tIew/2/N3d+/e7io2ef/541OK0ICU5tNv+pUtdlc84kEYju69ELRfDH+Fzqkp0K+52jtGPtx5vwcl2u/tg179y78o9e/4uEAdwsr+9v31ycnz82TgAXoBoOauq9uX25WGuFtH63faDD2gvZefBnQf2/J675965s3v/hfaF4zt36sFz4ezovh3urSUjOKbYVlskfX3n9/oi9vexjUcffEB7KTvVncqef+edLMtz5GD/Bcjz+vE2++A65+dAB3gzViA/fe6nz9nzHpjlMIQwFyg90bMr6g2FE5PLyI1CP9uSLoVGmCf97kgOUoykSdGuJGO7QdqQzFqfk1zN7LB8rebyKFiUsXuaoPhcs3yS6lyLejd6AI/Xq1IZiAy2Kywik/qdL6qryjw7A+Jk5ScmZVlYcR2qklwXngExRURA0EXsmgZCg9oCcpy5tGtBiFaLmhpn28jTgXkiFHzbSZTUdhejWLKYJ/SYDNS/VvttlngndcLD1NG6RR9hVQAZx58i/EEQx8O0gtFqxi3VcNRpg8Ed3XYJyu+SflT2Hil0kiNDpp6jbhWfmF9JkUj88/wq9dJ8VqRVkmcVCzBkRRFA49WEbwjqBUdgLV1pxOCnQ+TIKNdqXnTJSYzwEhIr49KnwS7m98vJ6D33KV5ZwLE+apDGTbnigTkeyr+Kt5D0R+kNl5zq7NbK7EiYcdNfpH/5ir+k7o8h6RcXERfY5BECwtKo5ANVBFwXacdvyS0ilNlQU57SlZ2YsjmIidnPWqKJbTUDtV3LDraOp08EAYrK2Ocyx8Un13pwCW7l0yZTfuhoo2uFQGLmcG29pMZrPdeTOeZFUA50jGI3Vxl40ge9HJesmohV31JBUgkvjYKJEEEUhVCFjHOCQnoBGXkTo9LHUZimMqF+T5zZjIwGFEXZpsLJjidUy4hlQnsFonKdgKwHah9hUiKgdIOAUEmXv85FUxczqDwazfh0yEoT30dHE6/dQPtXJLzFk0JYxPweMVlJEHiJk4tcGC2hJq1b7/cYsmEbFMvKbKki8n6PQThdJK6Z7h5TrB3vE2WvoQlG9Y9Myvp3YXElh+NvfsORqXFSjhaGGJ1GXs0nK0Z9NKziGfaCH9BbUKYlna0RSnC53dO3+7XkQ2PTk1XW9LIqS8jLMsyjuo6whaOIAv/1RVAMQVxwpo2awaGahrS1IiEJVapYE9svHWP80MrjTgPe11wgT/XLypCUAf0C6+t6VYyPNRiLcU6IjS6RvNXkpkrx9JlmZFUupmXIuCfPDRNK+3pM8TEulQRYcAQ3VMIi3rd0RFsjIY23Cb1yaAJNWThCO3NVnMMp6sopEswZ8Jtm2X7hEBr+Nm+elY7+pdtv1Ygg5Fev5GDMDkaeNwvrbrwlNfDjEfTULgNHZEJahTydd8TUqQfHtISV6+3+G2ZhmQEcBfgpCkjcIopmhyjHUfiFyHSYwsaOZ9Tkil6+Rt0iPZd21enwMNS2HGYsZLTtUuIiH8bu8jjIYN0mi04opmPXU76IVYSPTyH762gpFEkDCL4xYzmLQzwTlxyLSgiFsF7nrKdj/OVHLriS/lbcZCUPSr9lDrF1lM5kiVPPoSFOfcH77GzAgJPPhWlQ4YwuzVpax/ohWzsJdGe6UlcPgvl3i/TnS17Qcqt7v6iX7usg6J02bD5Dpydg7NtzPS60vTsMY1Kl9GuDzT3HlF7xdhy9TwD3TxCl3K3rYdK9e8edNHx8cnyiMUa73kD9lDfA9uhkSO3P24+h9R6t4uD4uOcARfn2yWfiYPX9LQf2usremr+Gi/zzSNuXti9tvv2mN8C210YrzaAROvyavn5/vwv7bTiYu/7uqLvPeTn48co0i16qG9fCj6YIiW/Aa4hoA/hzuKC+D4RwL9Tk30Sr1W/gSvlN97WtS9+r3/i38as/+c0PPnwjH7+ylXzvQwA889rW1fxDq3NfpB/86p8kPvjV4nk8cYW+f/bxzseffrpz590//ss3Fngf0e2P93XDtC+++KKp7EKN7rV2pLY6tNhT0s+2drauXdu589qvvCTMK0w1+dqInXqJv3d2dlCwqdt2NJqf9QMO3n3r7/ae2vb8zs5bb125f+/+u3/1t9/O615+2dvTZT3yuqjRyeoSHuGtP/zPf37y+PED/8mTp2+DOzsXL17Zvbf7h298TQ7jBptxkrTDdnHmvgxRC4jf+dxrW1vn44Ce8ZHHNm3xUNTP2SF0MkZJlUy41Nwl2qoVbLMkq4olNZ9CCc0kCoIzahHSSH2t1UTNJYY9ZE/W3WQFEc4sjURGNrVpYiwi1VpW6UV7g3Zd3ihfOFPBmd1d6aaSfmhMyRWu5xX/tE1AIAECVtFFjHu1z/uENZMk1UsAowEHPqMpMu9xssxox36jsWcqucas5+rQpYOrWNyVQHVB+dKr60KoKmCRNq28Am9ZGJZBJoDiiwQdsUcaK0xqB90yGhcF+oZWNukrScX3SkExww/iAuHnY3Eo3Jl02O+1QLSugtDJPBN9q6LQWCnfBm9bgQmflNm4QZWpYd235dy2urUl6Ea1nV8qQWG2UmSEgULtDAWSJKRu8L20TqVbVASDGmnQcwFdcN/NFC94Nwxs+l0ppMsSgG5T7ISk97MlxXaCQEeo0pnEE2eS8m4Ia/ejSg+KLib1oLZz91pFUQ9JJ4ikJlZBPmE8M6e0V+RzCUrmXjDxQp6QJBqyWbdtNzIaOJuJnr5PPfgfifB0wFLyDP/UOLGax4pN/pvK98lzIo0RLyNsJlP2QFDgVuDB5MLA2oRHE7ZoZYaZvUl3s26TqhoMRPuc4d0ykIKmfSd7CJBphWMBgXmQgyCEThYfIjVc5rCq7pt97ReJG1xDWsbSTlAnkPKrjTKz2wWi8LRNclMRrOgUmXo4xVxvqDOP3oO9WH7Q13soUkVdBfRp2T+9PNrWqwZye8H6QOyOgJTajhbT5+rA7HuVFyFMXLE7cypVZMcTRIyvqM6Mn0u2jqZQuUcNhfXGU43yEGV4FJJCDa9PXL3LQ+B0PebZQDFvOSl8DMBgU7ZzBlc5ckChyVnNHcL0sEY8mlW9Npgfqtol6Dz3ZxIa13XXR4aPMUSKKKY/0PFFEhnnOIObDn+a101LNpXZEIziFJJdQDpqfCxGarsvwOWoKJ0C/8jeR8z4uUo2DnPCh6P35wSUOIrX0dr9GwlaKggERFLraUUQmFcXEh+VU4TySHcQvR7Vx4ekO1jB/QT8lF64NNeOT8FBtx6Ath3nLlDau0AnuHCkjqCJvZT00Txlldclp7yH4uMaorwN99/AgbKaM6GXLnzmJ3YYEluzuKgbVUFD87qegFORWtsZjAMwl4sjmW8YB2s5wN7t9xLI5ggfwWVknhMRb6ElxYT3pAgLM2z6gtZuW6rsD/8pfWgMGWxMzesPjw1ZL3REBQebgO+Tx7dG9HcODlrSamrZ+WWkkxPta8ve5rcPbv9Yvv8+wPsHp3Hw8OSA/87BQNvrVYmD7W2CNaT7whTkoAVKX9CJ04L9v05tG4abUIZ3qSWN+DlwSPAL3Q/f+tY2E2lu6X4/QaLv27dvH+iWCjfGfSEOhh66T0Gt5eCEiezSqa7EAX0zB177KILkl8hyfgl73wDfzOfzRGkB0ojDFa0Rn+AiE4k3YXJF4Lekh0GCK36aXD38OuHDLKMafuMb77yjhhVo263RM7WwHo2+wjNsv+Ngf863gTjYtDPyP8GB2d0Zae8NQ7LjAGgPqqqeHQf77X67goM+HT/PloO2NbtWLhzSDvfEd0L9MBAm3jCMPf3i1zG/nkTntdecNaqqB3MvEdLGxJPlXCyOIQytF6+e+zsrDaTVsxILImQYSi7PUtKpoVuwNDysqreWu5TJ2VNiWLbPmhQ2EtUdi4nCiJy/leYgZwXixLOaXdsWBTej9WXlu5Eezu1VCNHg/2Jw7TLvTGUw9QtE1AiZ3IIgY6ptCfCILyct+CGe1TIr799Ilv40jLI1TLTPuSmTVWTQbaYsUa8NJdklH+xUubxZEUVVZA5NcMF8qM1f1CszLcspc55zcymTwfmAdxDdMiMpUh5JwbUIeRglXGd691gMou/jpQFGsqW2we5rdQoNu6QgBT21qsxIveiQPSsbX+SQ6KaS2o2f8VZQddWztaL6dBYAREL3cGlqWoSFBOisWgZU2x9JinAySdiVsXb5VR70ZqqUDQXCWmPPmLW6fbzHRTqEZMnG41TXSEs0lSqnix0VKJ5AvaEEzitE8YfD2TkgM9nIX6VaKnqBh7R3buyJdjYyD4LE8zyX9hVy3+Dq1OebmR6L2c9D1zJbNbcdPW4kLI8DdqWX8+fMbNMH2AIT8JXD/dZlFLaxk9BmXniU8o3yQWQ9hwep7I4XKDGsxeUgnX/HjVNWccGDi7zxNFzUn0rXD2k9KgCCZDjuinNDy0ns5jEbQ0es8JeZtjWgv5AMvuNASrFy/BmqzwfuO2rIJn1a16TAPIKaRSgywUjITh0ZwJZREsTGaHbkl3x+LoJJ40TZNJSCzGDqrieNZpn2nQNHuw6sIcLFZOl/Xg4QNkd1U5MFlpPN5vTXPA68scN+JeuDfuBiKrzJZGnRPyspGUWZHE8higM/CJoO22VAFuRwFCTuNBVyfTOvO39WqusoxhEQuiXMXAWxz73vQyo9jejryPXxob2hDkvT/elo2kRVU7PFR2GnqQP9Yuc0DmSbJiOtwVPv/J1AhBj62kV60v3ywnkgffZ7Z4kldy7HZEMCPrd9DD/k36vAAWHd1VrbIeV5fp4dBkPbyMHfWw6WmDidgwgetXn9WTjoabTbPlg+q+NZbbquFWPHPfdbEd6l0G2/0GNwtLuuQzdz8F/guufnADFyyEOdNN/fx6loMTRh588jAr7x0qv+HyzbhM/ROdF1TwKeYFtfvAjV3bsWq+q3I9H7kbBl2r1niGC3t7e/rgcgcgDEwW41z8EWHuw+Qw5orL86att/QKKjra2WUfwe9etod7d9tfVHdx4/eYYcfFvBK8jBFr2PyTn5j0UO+P1MxyefPjsOgLTc5PQj2Q4X0ZCjdKTtxC46Qa3lL2H0rDVoZVzQWe4Oyc4mqy0PuuOO5n5iCW6IpTuuY2Uz4XXigC7f4SVK62zp22fbcpu/q4cpOjcSZblqhixNWVuCWmwVXu1sCapDx+THvpj3s5Iuj4SPytRCe3dPuv8Llhq1Tltor2i2jTYe0qacifm/7ozA2J2r05l30b/miA4jmcJM24h7Uqp6GqVBynVF1JSRzDLDdLITd70xngskWc2Opc96ghlbtLpdPCvC1KKAMi5S6gRS0XlhecoOiGLEk5J/slAeiqUTZd6Mo9hXWmk5eUKaOTbE5Bj0itEVeJuwmWLfPnUG+bFi+ccubaSCD8xxBTolN8e9NnRA7rx+tOAc9qgG3ZlnWjhNW0kOGyh6/X4usb6x6UHZiauDJSxYHOGu3aIIOiY3UO+sSNbhub4mrWYhYWaLELNaZ9VxAmj/JNDv3GQFzaA0RNwxs5fm2vNfOXFlakh1iBa6jaaiCsimGzhGElRBpV8NhoOI1GElVGTpHYjFyxJdqLltslgti+AC7QG+nrgEl1k3dpaF7gAa8fPxCe1v5o/cLEC/HdzrYhrO3yqTWTKYAaVWPK4YQ4aNEthsiLbgUoNZpK4e/98DcrlSaI6XHn8bhPsV1JBInrNRcd74/EgRdc5g3MtXp8uajyGrBiWQEt+RdcgKO6FzOOPapo85PavnSuD0rMnAbaaQqSw7alwV5Rnpq7MMMrdRXXo8TCfNJR77uhV1jjKjHBPyYi+4BC5x3JUw1unjsZJHXQmUnoGfEZNZNqV7ZkGTN9BQWLWGzocZ4SVOn+G3m4kmHqTjMwz6HBMswcviZjzMIfv0Gr+TrERmKb0x6cAmIfQ/9nHmONMmwMRxJKnPG27lPt11nLIRlC50em730WyOxnFEk8QQk/MQ5xikZ7iuIg5uxin4btKVgDw00oyIPKLI991xbcwimvHq9H7QdjnGuHqIhRzD9MNxtJSOHWF0/llTHlHj9ceuSR/bdDVMT/XzfC4H+V8NcjTZQvo48/C2c+lNo3wsFzJB592moVFEvUbQWflxU6uMj2PsSEpvlE7nsikWYpcD/4W2hJpzZEq5h126wLnVRJiOJZRdeiMbD7QXfO1MGqeRcVRL7jWcfDUUsk6cXOp0QelhYNPJrfuIJpbNIZyIchyVtax1CZJeXF1LJ2cpq3IyHH4yE90dZKdrtzbdb77+Xk6biv3x2dLnclw8pYSV6f+/6Tt/syn1X354WvpnL+H6w86C8bf/1fzakuZHffPCaekIcf9pU45vfvfGBVeuSxf19e+S+yeC/8BKY0T0ethEKy7s+totfqyYo7hFUZEACwpJVEQJm43VoEWDYoVwaNLpC8XMhL+tLSh+ynrpirXUS71mw0uxT5danWeRHMPO4iqvGTj7oj4n+BnwZFHN01MEwUB8s/KOxiK6mSZgorIC+yGD1gUWfQEJ68d6ETDRpXZHyQp4OUyHXgz0ELdQkG3fCxGupPQBNo1kbhCfBKnjsmKFHP/0x7LBBkgLoKgLbLuC1KAN+gOHcUauyMMtUFFR99l03C6la2NDBM8POArt3Fsjl6E+GPS4DwMpvxeaZTJXjB1e9DtBzJKYWKkVYgWNRGYqVBXnzWkBcrWHsm7HHGzArJyBqMcOZWTCTnPulO2mgO1SKy+nWajbjnhLPJ6kPAropIssC/aDTq3QTm6n3rAgjhucULCkGuxGgmeuZg+wPus8Uz4ZZPKmAkckSwiWyipNPM/GCw/IvzcX4OZ+7gcejhO+8wSsHI4VcLGlstrTEGz46jJdA2Og+t/sPUuM5MZ1j0X2qijNaoqBhECHAKSyQAQhgSaAoQTGIFst2TkP4OzNgXZjYIFcLOUS6KKols0O2DqxfdtczEZyCPZiIMhJgGS2OkAuAaxD7omRgy8BPIgTyTDG6NR7VcVfkzM9O7Na2dYbTBeLr1h89eV7Va/eGwKsWFpPULlCDQTdqqZmVXOC04SosEh2dgB2xjXF4xwWpR4tKDIpi3BmY0xP4B2F/JgyhWmhy5lj50nQBwDDUoeApQxwM1BfJWlSJWxeBpVuCR7DZI775bgjTKdxUS1W94OE00noNPZo94Vea+YKNbMbcj2owIi3gaMUDLWBa+ZpvYSi31rOAixnQlYCROlnKNXQPgTVQNKyrB6Acc+nWaF4ilnFARsYmrxce2GWoREkYwmBi6qYi4CnvpDeqkz5uuQwF5NqynT7SwGracHDgvPQK7iPFp3KWM4hY5nuNgXgBolrnaosMlPGAlqhRB1eJmtiVK55tFQJPPCJzJpSaGtayxNrSAPdJvM1LKZL8DWnxyQaZ1/7i/lMqQWGBX6CNBExGcjTT8glLLkWECYRTCZqjqO19hjlQqVaK1NY76pC8gueJxBFeGwxmSyjxSxUhR8t01mkM15Ei4XOWiyjlEmxjjA+U2GiWdY1OQonFc9IF2MyCUOJ9qj0eIgUTqYoNCnzXte+QKc0a2Apmv0TBYobngc5kzrDSbHIOfeWEY+yLAXucU0hh8mCe3KaemVUcIHWpvgyxLrLIJaFE2sz7JMeFF5Os16VNx6jCtvtOquAmhfwCi+snF1DzdrCvGATznKP5axgkHm63eYYL5YsEFKT42kBssq96dKv0Ex8XmQiEynOfjl9GLzauIImhF7Z9hyFu4Nx0fQDCH08ypLqmsGpNUJDUYotFwqw/rHSUPd6oSsxUjFGq2g5WURLtYiK+Wq+dKN8hinstQ1RiWRm7V41K5Kq3w+WUZgt9Jw/VTi/R1Kz+6sYlpNVFgFTjCWTaBUufb4iZZBUruRS9xEerZbLaqbJwIaEBWqcr1Sk2TEpExVpQcafrpcFk7pF3YlYHTJLhGwRABVjK6k7vSeoebylEIHP9HdtukoFT8HL9Ow311In8xljQsuOof72z7TEnehHcSkpQ+tmGdeiiLFs4Jn+4K3X6GvBa3uOIgTOd33X9vaLWdpoOTGWoVtxh0878Qnkv0UWrN5oUuZklSpCu1cUpjQt0Xd62ny825tJZ2eoArjrx+fsJ9VPbn92m6xZbfQfWqzavvvwXdhsHsKh/7NDNN98qv/g9tu3776+ff1wa4wD1zB6JvPYv30Iz9WfJ02Bvv/RR/Vzn0NwfPzPx2e3qltHnx0RBW96moKDuwf334V3t5qC063/s+fh0IMfIwVHbx/dff30ddiXgs0WKbi0+egnCA9he9g+tykewkMPXnr4tT/638/v/83b729ONw9932efHekm+f6N75tUmw01DcHB22dv3/jsxmdKP9nk604G0z7htvHbpENquxYFWzj8vbbfpgXm8/Bh8My//CscH962FMxuHN24fevWRx+pLbyvYPOm+gQ2DPAM7cHds7sHB2dn8NJ+FKhTeKdNQXnv5Hm7v/iM3Xc8JD7lnuWE753cNKGJl/d06iXFb9az+zPVTYsxKf8AJqLy/8t/7cAjj1GvHIAL/9YcV2vB7bdun3z44YfbR6ebU7MHvaE6egRGh/MV/kpntxPvM9issSoZHJJ+sanBXuXCqc6yqsyS9Hlw9NbRydHRkaHAO7z5aLtB9ea/ehUeKaJAA4bvw5bi/wiPGPaDT+E0du82v+/AqWqnNBR0T5MPwbc1HJ99bPYTUT3WhY90kdaweaQ7gi38Kd7X+UK1riod6Py/9S1Ebam1MenBAT/AUKf8M8To6I69sz5sD0+RXNpP9F50FATf3D7anrKNoeD0x6enGIc78pt4EL9SSMF286Mf7VJw01LgUU46eiEF+nukYntkCyWP3Ep5mnUMMrSxauW+rPNMDYGTC40IZLbGcsoBrVf5pL5If9J8sXMnR0qzPhCbFw9DnxM/N43aQaH1qmZ/p+b43TjYJ/frgIYv2Afa52SHIbdMUHZhSrApYitND0nQok7V12WctDBtMJLbFNxaxxoX5vHCa+/P1hDUnFBC/9IIbOR/CqY0m+H5hMSWqLA2Uas6A9f1SmhxCkAsAi46oesqbiXPuHlt61JJp55qspghoQN6ho54WqsYhYqyKqkIFQTtnUcfzYUnlLHsPMOINzabSGaMkQEZV4wLwW9RJ3s4Ze8Z+awEZY9Xd59WJi3tY6NCgRp6jXmF6lZMSb9V736JKxDK7dAiFx3DGhcboDlh2+5udE8ZYzeVpqj0cQm7CkqLN7XAeQlxFeLyQ9MXawE/Nsf23SNoMCewWZfoiTdHA1ie0WH1qX1sKTOw+/Z+7AYBZkK52UIN78Jy0TtlTzEt09Ner6RbOVjlBC0cyCnZUGKt1HHnaWRLtWiCT3qyiNFQLy5qUE5J1d5EdJVHhmdGhznrHPXtjN+6E+/Oc7bv27PWPZf0BkiWDqrdGaO/QmJz4FXFIa2CJcn7BRg1YRQMpFmH6hZBi/zrqtCDMGRaymUesIiZ1syDCqU0JtXYWugUWBh141omN+m15LUM40QGyrfrXbjqY/LZyS3VqZlmq5ZrWMn67CvAspHdIhg41RUqPKzA6s8gLtZgXIGZ7DG+1N9P83rbKv2clKNI+ahPoVCY7xJqYsN+nateI6SmCY3xwhRm6ZoWTRza/nY065j90rAy9apqCbke0FVuVDwqM2HyCqg1ioF+oLNb9OLYFbXUXRaFlug9TzMAZp/KLtLo6a4oG//kSBQ+4SGPwbxqmks/R++n5LCRlrt0WvSGSu06UAmy5/Q7cpWqKxKdeUktHlufZz6YEdrJypESU6tN0DFjjKFbWXP/urnZ0PuDVRBNW7ZQ5CrScd/oDWFcypihNpW+pNGosyYNmQaYzRnFflxnMI7aanBpKzumdqCnoEt+wM2tGdLgrbx1V5Mbq7WTk/WxoEMf9UjQVZvt2PRpq2iLwFA12VHTJSh7DqJKd2HTWyk+b53P7XTEB2bay6d4yuANjKZDFgwOkTPfeEOjYRyslPl/k7YEjDl9u+UV15xorTVM/xLgWV2Gl1822PCupu9ljB/e2d5ppND9wPuho2DbEpMwp+MeBQiGAk0ATE6g9vPtKIgiJ53tDZtN/db1ps24n2joJiVntYfHunSTZwFeeIV8bwHGb93S/w+MDa0P4FF8GQK2moIfGrEMZfgWiJNPRyk4KcmqeU3BgwcNBeXY59DJzjvxE27jYe2H8Bmy5NzL6UV4lc65vvidv3ttfvN7pRabfXXwARi399+zTMoH55T2zr+3Y06Cbcc/sXLp0DrUEOybrqagc+71lbJHgY7LJ0qB7qGncNicPyZ5dNNM1DR8NvAJXh8fD5g5GyCgPlu7HwVbpIDVA95QIOu+9yZslJ5HNtdFQV6foYotsxfbf2I7RX1/qNeauZmb1BkYy7dklaolcec2x8zJ0vbv0seghiRebxTTIfFLD9nFSQh4LxxPMVa9I08Kx+pf/IYLYS+d1B1QmRpD7dRO0vq9FLRLVV1URpw3y1a8XS7ejfuun8lOpmO9z3lt+jJBM4hSOHdI9dq3vYNdXYmCuBPb+3hshxZ/rFEr6JCXuAc6j7coCA22uwNUP2RkeVSevjScrzjuKLD0jTfDk17/83rhFw/7zkTjR+jkFSmQvXAHlMGOv+exz3TZfue5cCydlX4G8OXjvno3fxgeB20Yx1/05L6gHht/0ZNPEM49jX3tMPzh9UYx+wHJvaW1U1WOp6O5sBwajQ9GMb8qIOzCixhey+mkGx6r45i9gPXCi9JdBrMvSN4Nx9OJEdZmHPMV7A0BcNKSceFouoMx/DhmH0ADlbgH4MJz010Ssyd4xsB9HY6mezCGH8fsA9uv4BpOUhcSrs6jXQkCRbrkX+Q3epCMq2fxD5dI+xz9Dk3iL2n54z+fE889B//99Pj+r2AUxD4rP+7anZ8YkqOG8EMpsk6KjHhpz13XiyBXth1xCfB3YnQnuIKs9SWCvWei7nGfpwGxnbUeZ53mmiDo1Rf2gMdYkbkCeOPqX0/8xZ0QvvD+L6xU2W//tpnFL4gOgqf3wVI2lE+bj3iq8Btd+CcNX1Xu/oDrTPF1rX/+SoJn9aOeypT45eiqxmSz5MGXg5zfbAi+UAmhB55VMp4+lbdzqzcZhuoST8leTA6mQqguSc+XGy7gGvvrJIGd5blnj9caKJsUpt/NPbPtGuv6ih1q74mh+1Y+rKsRk+Yspc0GzCjgkjny5x39YwVWvt5X+6PObSDeVYZIyLqauefT6eOpTYdaZQycfTtXti9qVb77RYrNziW9XHYw/bP4u8oeu3FGGQU8aC1XAAopqL6FqND0jFAnicnrufFWRDaoBrXFL4Jy5w6Wb7X73cWs8VXSvk6B8ubYLdE2nXvyXNvR54MpcdGOyh4F5tA+qUiQGY0IwiIuQIbGVbvlmJ5oP1At6wMWvPpsB/1e+8c6afcT192ptoQ3yYw+cQhpikcrNBFpUl1GLWf8q1bC4KjuHKbyJKWggenjuRYw9X+FftCAWEHO4l1lE4GOopkQUpY8TkUheFGADqIKkpxzXiQQizKWV6egXDK2GFDHUeZXybT0IVU+nRtQaI0nEtEaVB6FIRfXsZoxBZEUER9qJYZa9r6uCL7wUaed9nVRczGCiSpgOhNL/9IKirvAma7cMN65j1qXIivQE6XnTbEjFV7MCjIUEUJR+SKv5DSvrk5BHKPPm3LnHEhO/YDhZLmEKo8rsr8Ts0B/N6rYS8KZN6nicjGU5yVhir1MjazLFQo9k025yOd2cKgEZmrKo6nwZ7n/OBpWOwSkReRbm0ttUHYFK50XaEmGaQKovEke6vQTwaIo8tGH5pWhkHwZDkxuunekaK+gqvDAA7a/0JCDt4IlegosxHJRZFdR3mhBOXg3bStQ3bXxFK8w/RsPKLwee2kF/O7AailaEfju/b+4jwPe7Szev/9d8ssVi4DHQqo4ENckQQxSQG+8rykwKhrbn0J8X1OEOKmYF3Dm6d7xa7Ijdnx8V5zuMNpY/gB+ibu6VO7t9qfWX/nRgYjRrlH+jcnVzNVb+H3URhfFAAV/+tfmjYdW2z3WE+PnW/S6oqTH8m9QVyyvTgHck2Pf2D/GnxLtp/9OE4fvFJMKTY/cQ0eB17OyffjbrHeipA1vvXV2AKdlk/oYT5dsyQkbiOvxBIY5rkcpODk5O2hXNlIQw+fbLf8caIQ8cbjtv/de+YOzs5oC/Pkl227/I4bT059f6lzJMGw/54D2S8YpmE7LHzRWCIiCrfHEdnr6KRpyGATHOFT0Wwyq4petlJW9Jy84E+HBrtm+Jw1uwBs22h0KvSTg1B5MjNEE49O5xd2RmTBWje5fleZ+1JZVRVtSyWrSsjqF/guRu+qdHtRzeMMJme8xJ66c9dTf27D75YnqffBgMH1TEtm6b67bnFiTri/NOtvQONlM6xQ1B+EJT3rcClPnem48HzhlH7YI5aWuxbKdJtR/U0hKKBPgEtlD3XySqtgPNLsI+N8RPftvaIfeNPDRFpeptMrcxBKiCc64+6ybae1ZiQjtMep31nJchV6jnCusseW9kjdyGDcuoVU66iBoaHiVRm5TQGGm6lg/1RjYDkLGAdEKISWNyV+WBmY5XEm/gcHRwBN115I2ZFSGiq4rUsOs3OKCQoMh4zQMwG5ZSYmigknQwjUNiuIy8Aw9hIc0YJN4mjLhS9/ztQCNfzK+6KVZa5Q3L6no3DdVYpdLbh30CcAtWmFnBDzXSBbSY2Owdb+V0LLbQ88T9bs9GbuXMjZH+9WMPoK9tWujSzDrIoCCxWKAodAy64KFA5iezUAXeutomZIZswuOl/RAVbxQg74rueRcFbvKzrxZwuiE0VpWhRa4/YGhcR5oIXQqF+XAUS6h5okEvhqk26ph16GvlNBtVEXGkK66QE27DSiee1ExMPLDIAWfTZe7GBoMRT/ELOZetWzf3wuEZkcHP+1MwqII/eGDbtZmIGvZDsS1o1nfpuA+UPFkwgdXSioh1stqmOl1Enu7L4iJLwvjPW9omhyDLOG6uw+pE68msV+oYmQdCdBmYDdcVhGu7Lj4vlAt4iSytqS6sIzzBeeTnfZxDVx5cTecJuQI0MX3hhvnCViDmKlVeEpsGNmP4Q2yLdixJbgPbH/x9a8/ejR4qjg4fL595r/1zJjxvh1zgnvBs5qC40eDPPnh4dfgT544BVv/DIYlrE93rA7YJ67z9ZaCjz9+4YVdjNAUHL52+MyTpkCgJ7Gbg6h78PwQxmf+kbXY1w3/3v/Df/Oa+L4U3Lnz3ntoUG8Xs0UrEtP9LZWj33Od0T/tm75FwZ/r5/5niIJX9Uz1ySf75nSshefhspwPLwL6Dxz2IHgCx7/Y36wAen4fLstFFAC8AC/cGcYen+xPwR1DwTs7CGLBSrqU9BvXKAHWZROUTDZP4JfAcixxc4e+DxXAuXqQTd5lfSU7Kfo+hJ4khGREDl1wRbRdG9KvJAE5IZz+DxA/oe1NxEcWb4yDcJhwHzhjlJaJKTlQkmiqa4J+eTmLGDDMQWimngktEwdCf2SFvh2wQFTEMBrhIYNcX6cUx6ssyIOcdsgQXwgULxCfcoMv0eiyvld5FUePWFlQavk6Fzn5xyowXab/5pmWufWdQDHNT4bVDDwVkhzF1VzNRysnoT9e7+AlViY2O9sNXrMukKDFCe52vAVVgusVaMEcBdRYGhe1DO9kvi5tUmpMMWpEwPUDY+LPmPuvhRD69Oveyfye5X1rUA2hxJ+OOGNkA95KXUDemGAziltuA9C+361ScIfnAs2c15kg3icfSti2yHWgkSqeSvJDoHOZxalw5gYBhwDlWJFpKhpiCkzWxN9IeknHioHhe9aaSXZ4T7a3mJsV0ZUwdId4Mj4gbz/YVLFbdfFiXXP+BMIkgEwYk1tea2UHevXjwHiZD3V35q5iWM3WZBE4L/Q6BfKwxkoXm4CdC1hSuBS2DmrbztSDJINhP/bDkE/SIBe28DH9RvT4pJTgF07jrFmWSVrX/cLJYYWU7pkMv+XJolkXauMN1semKlr3hbtKWjmuUmc8z0fH5DRGJru1Hreu3eukLa35lyBF/wmJ85IbJW2wXSPIJrZ7SfsGdK8WIS4wy4NraHkCm5MfL16l1q+Xw886eOHwpgo7ORhPYLFLkffxYeOLDIeJqP18kd+uYu2rMCU/X1zHOaqStPEziweHV1CnWNQp/CaFnPXw1Xqm4rT2RRat0VNYaP14FeQpjK1Z249XNIBft/HQzWG9k4OvX4945XyRFR281VRa468kT2D5WkwQL3b8fNV48iTWwrdTRJRi1c3BQ7xwOfAOvqCu1ngKCxDReAqzXbHjSayPvzgFs27nCc86eCQc2p7C0AVDy49XMd0Df26KhckhGcPPpgI9hWlpFv14Kd2CvvHjRa0KgVJ+cA5e6N4moJND2k2BiyZidm4OvpBrbsd4bPx8tTyB8cqL2niO+IS3PInh4dx2igBTTJscggp0z5U1XvbwWeWsR16rp7DHzOE3GX4dPIVdNYeK9OT6i3pVkNFXK6DrKhCaX5e8svaBAJdyRWDZN1l/MWOjcwfNqvXA0ltkvqjxBLWT9Gx1DoeiwOmUAbnhsr8dbEG/Vd9AcifV8N2VIXnwObO5MgmCRTAHW6oYLaKCsaqeScxkjunMWBY22xAs69xVk5PE43rSRhOaCEL6NvuN7ycw9j2z5uHSm8cK/fza0i54XCjD3SDdqNDGfFPJGOc1i5taipAx+H/2ribUkuM6V1dXP6rHV7rVzgi8CFI1niRCJHAXmqCYZ6ta2WQRgSB+u8QeERA2CJxNgha2ptS3X+i765dFiMGBuiaLMAgkvAzOqC8PEkMWEzBBS0VkkZDNPDyJhKUndc45Vf3z7s9IIotkMXVn3r39V3Wq6lT1+c45VYfEB9sKVP0KPJNVvqghALUOsuq0L6a2TEXXOcZNKhMt6qShfYQbQCaRQNOZbx+suUSx0ATpDOFcpvxG2ZIQDOQictQLRwj70EhH6EbE4qq9z6+/rXv5yvkGC0A2CNY+spnUmXYTsU5bLyfjP98GbVg2MZiw12hrG21lFcUoG6DE6GdbBlIkA1gHrQ5UoDAOmFACDsSdwnurHUYFA+riftlwj/BLb14aHH9pcTJvshLNj3hPivH5St8NxZRZM6I1AL5gINIUGlnXWS3WG5ElOW6XTLY7Am8lgSbZGw3ttBtHibbpWyIh8Vn1d+kcjdL7pPWAJbGJGy0zNECvkxI3+uVR3CRVWqo2UWjdqZCEkkvc4Bee4sDhZUljPGVJmZVa4oj34cQUnNGsAFZMnaJSUmhWHe2Wj8lRjfAM+bJpyUOjanKl49jwtcBOoHYz/R1khQ9dwTLnx4VvE9orOmI9JKBV3yuEmwfdFciN1YdaVk3c5FAedkEtCCbJtEVleo63VZJip6ECAxUXhOGBgBxmyszlMq/ZAJuhw4wGLhYOxkKEpug+ovR2qpizGG6MxbV3dc6wJeHY4KbvbOwlrFVBfJBh/aI46luATe7Lh0GT4BMOmwDyYiHG1oHE40ZBvUocCLEz69PsLAcAu2zQzU8K3iRRxusSmt2ktaoA48gEWEaXO0ZJmE0KsxJxqxoMf14yl+YFV8KoJGmX++yHPqlszc4U8MEZa2rAiNkmlfUmbKhPkcRiVZF7qj0lO+AKhEbEmsvtnKSWwp7a2npnXSvLsqlXtjlbF46dPiwWOtB5ZmGqUSuMAbYC3JHltbfZQ05ZW6aJRf4qrMiWKjNJs+SndifsOMwNNWutXlu08+DO55aDSM9VatdnZ2ZzkAKaBk8bh3Nb5NCilrFoHfuBj5NPixHpaeM/sWI6rku2gumw3FULxeWarVWFgaWAa2XTcAwFaSLORWM2Z3uthIEE03C9JrVcmaXKAcqLawxAbhoppTEYXK0B1mpcxLWQDbw9FSDRHX9ROHMGhcUKSYBHDRAa5SXmlEQNP+yrqyBrVDJCz6omq22aqZVMyW6He8jbMl+uSoU1MMBiGPRkaTJ1lu3m2Io4U9yRxQ95AV71SZ6dWocRzuxBc7rMGi5ZrBuoKs5/ha1h5lsiCxj4z/jqzGqM3snqcgl8Esu8XSfK5jt8kGi9SSxwI8ZBQwCVloAwauOgy4BvDi4gyFZaxDTRrWEAZ9GqXcUCQG3D6qjSEgcLVMHAnanRnCsVJUo2cbVrPePoi2owJoaEG9HZR2etzliTJQJ9dw8lQBK0BVpBc/QtnJhcv6n4GDlsv7Z/N9ET5KtLOTjUFvvjwzl8cNSxi19cvA0/b10s0G4m5Q8xAtSHMEv/VdPoVrdHHxz9A3q3HR//zY1KvP76g8XFQuz06+sv4NMfXHzacXSIY93lxUW36I7RbtY9xNKE1wIFrzJPAfvl39+6gY80FigAhjr67aMj9AbtmNOWvfDCg0XLDlHwZwss8b7u2IMLooB92AnI7L7+nM34f5COj189Rtr/ZOGPXziP4K1zdKTfCZbMG+zfGXnhzl/BKGm3bn3l9e99j6VHO35et8NOTMe/efxTbNpzeH4OH/TlZQdsmD0FWt+/31PA3ogigfE8wxMzhi6P2AtAAVqlj77yepqSeXorzedd9+uvdH6H6U588rtQ6uNACRDwG4J9eJgRXma/0+K79uVFRN8g6AJm8pI5BsvKTRLwxsvmCO2NdvTJvZLsaI98LuTsY4wdtmCGNphTL9w2uEP4Ty6O591J9+l4fRIX7CX2PGqVKVrXYjcmFfJ0ObEuQof80QmcfPf6vXuLuw/uPowCze5PKGAnU2PUBftnQDMYrw0oWGCXzOfzx9hiN6eOPYXS44QCxr5JFMxmi/LBQY8k78cK4wa+5Sesm590x9Ph2x3fvv0Nb/Ofs7l+Wn8XSlcvvaSf2c7p3r13ry+e/+ij8cmO3fnPv/uou3PCTk5mB82El5ez2cWdizv3ulmgAIrr2ssxn+9//9megsc0hm0lCX2XgtkMKbh2bXhy7in4LUgnJ2yhSY6LwkQrE/+i4Cwil5OM+TW2YUMkgDwUNYIXwRID0ztJgZzkvoLpsKs5zfYpYno9teqEUrT/qg2cqsgxqmF9SJ7RZcYQUuds6jJjo168p4Cl4d5xEjTTqvMRu+urjVJb3d/h30soFNeil6kRkSUI1hmtDdTCljbhGKM5CdHQZZh5Aw6BoyRQ0ofXCniNAxw/jZTAdVsN5VxgZek6yDkl88Y3SqfQqCPor6HAU6Q/Rt0FF1ytQMgioE2fgEkIeBsfej32SzaVqJgMLYEon4qaNAMqZmRaA2SsqPoVmsWIEBTuULJYO4rrTPgaw4DmAl/nNtgaY1YIv64UmCMqQIjxCoREx8w7AwV4NJp3Io6SZITPW6LMI7gQYVgbxkeCKdGylkJqsuzSAtYqL2PavIG1UFwrJaEyx2njzIqKBDmwiiuBf+uiIudJjFKkC5BaVVSQ/Q6gJAA7WebluswAQBK50F65g4rqUqcsOpXY9yDDtZprgoXab4AtgZgyNdbzjElRJ4MUOcBfSqKRC2bnLPOGUWqkkhaRSoYGGKFNIW0LYm4LmB3DXBFgFDKNOBBA3Ifxy6AwTWtlUbO0DFqpYIWsPV8NDF/jT0egAYV4SNaxMGJDG4dOx3MYCgcPNVmp8mjMRyuSv3CoYb9j8wOdMmGJwydRa4M7ZwDyjgoyzeN90L8gV4KYz7jLxNiriUkEdGcUe8KbJU4D4rQg1VSb+CnFCCAGEC/A6bjkJVR8CXk5tFr3WrupXo3UGIDEgJsNdsmalXHdGsCzfhxAA4MUy3O2KtHnpuQb0VSCZXWMDauJEO0dgTmqfUDK3/imgfaSDS52BRZcAhLE/EAQVzmwCGI+43Li9dytJQvzBdnYKcBO2sDDIkdOnngJeju8H5YYES/nALBrOfRMskEfBEBzjqm0pEFfQj6SvIB7yGZZ6PlJK9jJQb/Xen8v/i+GM17h07sDiYERPH4L6roeFZi+icf8U78OUlHoKC7lqoXZXJWqaFlVAtQx+VnGTrmMatZsGphg2qgxEdm2esTXqrPGW7vOKC5f74O7yRsquAXEj7UL55UT5syUnK+h/daQP1KRsTD1W7smjA2QfYn6NuDzIm8TZ1mG8daFbbJl3ljcV3oDnRRTnXD0o+YReAWuyP7lkmyatUU3kNN6CWez/rxray6dbdsNunEwbnMobk1w8MyDMjgCMlLA26VqgEJlXFrDG6zKMyuMhkIaWTdEL8NpAt0qSu6Wmhykm7XvK8SWCgrYwHlU3i5df34Fo6H1RuQcjrWMeKsLDoNCtUrwFt6+rVq1bQu3ObWJDFtHTmU5auHipiTPgoptzrAzYQLEJqzwxQJnysh/s+CTq/2dkX9i8NWFno2SsimNAX6sZZRyV0NpqgAw2Uolcii35TX0XVRvTuFSFsF0Wp81EoZeucIIYQDfvU47Ch63ETL1Br+ysys+uUxNj8M3F0BT3EYGVaIKRjJ1z9oWxAVnzB9Dp6Qmrd0SgKrGWmXQCTGrMlzFHYtT0taxxJJiK5UydTh5KnzTef5EZ5uUZZtVCi+PWCnn9aWU+RLeZDnGmoMJEJnOwD14gUMHEcT3mrBGrI2wlSx4DuUowMlnuQC0XlpoRWRiQPde2w+ZA2FGrbM2y1lSWAz0jkOByxjIEi7PY1wHBOdpwNa5AhmrVmvWwCsF5SulFak3Ss0lhlFTK85rtN8qFMti3jq02RqVrZ1TfgdZzD/q9TWbXPvvNRksAF14SWqzwpBuMEgz3039+TRaRYJjmHrhmpoUHq63/u37roKG9fd6F7IyeNi+MHjaZld8cr883JEHn9z+zmv4Tc3gWNhdnTKE9F8XFAmo8wtiZ9e67k1ajXl5WWBILHdZXt5t3wYc3S4We/xfDzqAkg/iJMaz///WW7NLp5y6BiDj5PpLQIFd/itR8GYnu48xYjRQhxRcv3t56RdqtGV7t7UX1vPz/5YC52aXg+sdUPBtSLTa8V8AlUH65OuEc4+7UNC9H8x+sAAw0p2/+CLqpz938fu9YiHbOz8uf4wLITp/2L33FFLwSXT7BChg76lPvu59GG/e7Nj77wMFxax49lkhjhlSUO7xtP2iFDwNEhSiy47d9s47UTyfPaZwtZWcwbz4K+yrcmbUz+L3v/r47K/ZzzD6duuRLmHo+I/jb8we+wuMoU3fcObfrp6Jy/g58sk933e+bAFrJx47e8x9yGcYOmEBshsh0ba9vES9y3+gf+tb6OP54OLkpI/jdUxBoeVz5LN7nf1ln4NmbyHOvDuP5/GCsG2fc9fdhc+v/elw5hAFCimISQbpunssUJAgBb+4OHnipHeXp0WbSAFBxgELa8zjU6IA54EJBbfZT4ECPXiqzveGn3+ye/LOc+zjcxi31xAzv6c69hJ8P8V+lUHLXAQfC0zw+/zn//iugR75JvvWNJM5jnb2NPx6Ez4h3f42DI2fwIf30c8OUHDyJAyYnwcKJFHA3goNhn2zGCj4Q/gocd0wlJAeH7NogQIOFFwLZO5QEE4kXpKqWDPE2qb/Qa72LxQt6qlBluEs3R9VjKcsoOaKnjCskszDOeYFNKTOw6KK+UWevdav2lriOF0JUfSPU4rZFAewqwu8qsn5naSnBxOrUn//51/Mc0gJ7j7P0vUtHd9QMc2mEb32LbKcKp7NFTV4zcrQLSDbJOMTlMghDlu0nPgY0l4gbDtIlRzE7n6m3jaS9EZSInjgBB74g1QrqPcHiUvWPUgYPDrpamhnGazznqAhJzOU1A52e4eNBjJ7JT3KJrApBV139OFZEzutPPG574aGSi6ZpGjLrc+HIH/pM4kNV6hOkNorC3If39cN0cOHKrMJjf5vMzqW7daBBffh0HbN1ftC1CkyrdLYqAsSrkMS4wT22Ul7vDs8q1Br4+MxZ8P+3ZkOlz3A98n4x2NPliex9ZcmVR/TrrFsTEFjN7aU23+f16UUew26+Ugi86Rhqpj3SJhQjgqMTJKlB2GqSxr4UjEZHGOsiQIpk9PwaAIEleQz7Po65jBVeW+KwICGCOCpEGjNrQAuO+O2nFYwv11D0Z6qqEPzT8DM9bS+1OvNkJGMpxmWY0fo/VlOk94+JA2G95POzP4ZK/PEKv+0kUN0NDH5+yg9So/So/QoPUpD8l6gYV9J+hWxxArbi6iCFTYhWxpuvKK8ipKc3zCAPPmOiQyEQX3KQy51WpN2qA6q7IhscKQ8txpf7iHOXnuAIosuMMLK8diYwaOToVsZC7Y9E/TQKqoZkCz83XaSl3/xhXi5Gq0x06tj4mwatY2HYz4Rofjk7zQJ4ws0XlGd+GKGp6x/KgJpJ2ICBITCaDGVvbfLH0vwhiW+cx+KX1fojbjBoxJkhGCAq8cc0yDSgkSfiLqUunJtOd2AF6WjPV5pke23wA0J1W20VUAoN49yjd8+f1xItGHrikuUx2KyMBTkG+tXM9E+7yWqfYMFCGU5538ptnfBPKfruj+UscF70dHa0gkBcHhgEh4cVGXvH7tXNo3IWBXSAN98EaOwLtDEoo3H0c57VJNDuGzRRoRdjS5qTvndYdyYZYxei2hGMcwZkkuFMIY8fTlaZ9EqazT6Dxs07yn0J8NcUuUtUMZjOChfEB8DTyNX81GC43zg76tCXc8NaBDKWREhIFIA5wS5bkqmG4+3uauRDZmScRWzDYqKTjrtihJwU48fyPO3YtUwgvuzvmX7xnboqapaDmK2RRsZ2spQ2s2p+YcGzXuP35ZMqADObN/6tKUyQTqfMzmChmQnf4dRUI3XMjetP4xDTJGmWlKf6DzkupXgObS1663Tk/a06HgfUU7TNcbtUCc0oGKBqPDTeVlAnXL4wPkGQVpM+xpbQCuJIQu28/wdI7BFJwaa3pCATMqoSAhJlr2XO1YSChBooQdirbL7vEbFaBmbzgaTy8i+EQIGjSUpKXRVIDdDfujfV8g4Kxq0ZatKc8BYQktppNEeT33W7jRRIypoJGBfhchHNOQWoQHNaeE0zBbiNI02NWKfegcJO6xwDdM2cHoUkYtBtFPC1alch5qOXoaKHJuz3gDZN0iNm0jTbkNZsTJuidZYdyUrE0DbitZmw5xSpGhZMbuVxKesJV8FvCqZne5tCTNQgy7vQOjaUgEWLXJ2aQ28aHDRbmKL2BtwsYuLyZM45RUW2EC2K0sTpuontisJW67FnWe9ySqC6X7C0lFN7YGTjpAS7b68hJlLcFUbeKzFFdd1JPP4bGs783AUOZnX0alpqmDO3+8SSZYwyfwNut5aXhIVDTnOCOA1JXBy4E0JON1UHCcdE0ciEau1LyCakkBEyFrClIT8e9A5euQFRctn4+m9iTaiSP09ZAijO7W1pyzj5EFtjVimm8yvywCmHx5Fg5jmwhtzoQkMiDpyx3WPXd2dRiMb5tP5Q0gc+xn64tpAgsYsN2nd1hbXAeDsCjJTEgbCjv4Bys2xjMKSkm17yrJtpLcfuTJ/RQlZ/nFnYg2cgDOV4mgAbxJe0DKmYoX+603fwzujrWE1bZ4bib3bbcrBMjZRDm2/tBO85ct7lRzXqGAHv/I3DqiVqhxy9JPwXsXZ7r4oaJ+a7tThPVp/NPvRDLVHDTs/1zeAlvT83HPda91rP1zfWO/LfHzedObg9c+kwN/16qvkeQjNHiiA7zfIc+y1V15j/sz+9MvuFnsHPv+vU9d1Y5273j44nEB/YH8eV2vjb1vaSY/G8Y0be9xTh/TKMTxj3nnYFjhXKMC0lwJGMjyM//nz+GOxOEqFoHfh9hPbFLzycAr8/jhlCz//HK1RT7Bn5snvs7/trz/x8jOPJy/i8be+A0wwc978NnMvL9BWN/NgCB9nt9hRO80aPWe9J+zzLfJQ5B3NDif05fXf0xaZHdiCikyyir3N2Mkxeh9/7Wt49sHHuz7buKcO3T2fsz946HZED6FgNzIE625PKIDB01OwdZvxFNBv2k734RT4kntKfLrZ3ZzP5L1/2qGgm88cCQQ3b3YX3Z0L4oT/hnQ1U3be5xjH57Qz0Rem4OImzJbnOxTMZ/OZ1p4CyDRQsNj2Ft6i4EuzL+2lwLDxtR02DAkzMP4F7A5CyUp4S572th6hWRvYqvc1Ra9ZFPgQ3vROeBq/rJeXouCMhaXhZMrF51JmU94WxEsd5DYbzuY9zGbhjToky4YVnF7ap2sUPhILNv56SNUX2sTxUDJsIlDseftNr9grdxwem5INb8qJPmEcEZPrrBfHqpTuEP5NS15/CN4Sb9mAukrceN6E4fE/5F1fiCTHea+urt5Ur1eaGnuVCGFIDazNxXB4IouLSSba6nMCNuScJXjBL9KeIBx5UDhhRyGErK6vtxd69dRDTMCEmFojiDhiyxxYkGCterSBOCjRQSDoyfjBBiUoDxvd7Uqc9zSp76vqPzPTs7sXKdJDvrudme6u7vqqurrr+33/KsUyKZlcBcPWENUNKy9laUbGEi6q1JKcOlpai5gLuIO3in2zBIqiZy3DlEbU3iFAS10CAYuliFNKU3HNFJRS9rZJWOwAHFFRzI1syE+DYWvPKwngcVRxrdxImRfV12w7uAUXTuwApz9gK8fOqwJqnQktIalUHNgBbMpC3QWvbrgBSQje5PBp5Ctzvh4xm2MJDJfdWbikSCvlVSc3ClDLmGt1OCIujBj7zUikQQFuqQGxfuAQZMyYSEM2KqzZXmSCgBKhoqmcazkOCmUvRzw78FT17JTGWAn/EzS/oactMBtZV22O7UTnZKUQyQvOM7qdoPGOm9oS0zGFzQ8Er5i8HJSBkf6DSt3nS0YNMIVLumTRPvpT9wpzNnc21az2W21MIA2zLHgUg31YycaAnrTzkdp8OtHLE0SrGoC9BHsHXK/tSwbuKf6KSM9ac4seOGFav2gVJekWOBBz7rMAzdCQ2Ks3HY6oZmo9gUTjV25ZpzLSUUZdEiTMQWRui68hvSuJJCRENdUPqW9EnQB85jPzRMKwFMkJgAoon+0QS1mlcmJ2VGvIf5sQlVX40ABflkodjIpcSo+yJCMpL4pyOqn9Fk+mecf96mA1qPV0WdrNzXSU7AxFLmA9FAErNNWF4nIN7Plk+6c7sVVS/TD5bhKEa/aa1/NjyqmQUR6LwLxhqIr9YKcoHMAAIKwTkbZqIpGcZ8HkLNCkcnsbXvqJl+C7iup6xuO88FImol3zxgIEmKuheTzLdVg8M1oACpqBPIesjuskBuuqUP0Fvp3MYOZa8brj6YLlGfe9jOdkRAsvz3VYocxo+ppTNL93gCaweNz81diQPqWjUBgRY9Qt5Fasooh0QctG3L07dRjOGQctZ9koWxHz5rG0m4DaWwxZLphhR6si2439Ui3XNe9szQp9Mg+t1CLbgKcMyGtDWj+MRIU8FHlGipG/q6n2WNrz/ZRPqnxOIRjw112V1xtVJyVczxfcY42PxsUpiNHF7U9++Tp4zibu+I8bDbhuYB9ZmVc7Yu/7SXtKwK+2f7t/u9ox2B/vmT1jcjw+IK8lTz37s3fBW7auH9t1/X7qOJE88Ks9d+7tt8sd/2EoSYCDX/zigCSJfOy7L6O3rCPmCbVwoloVUOlJyHSaNjej6Kffef35cnu8fv78ZrQZwSWWDf309Se+snG8UXlMcipjciIL98mBWvVX/Sc+/ZXqMb5Bzp+/dQv0HwNcH+k7z3+arx2vzURiziODpXmgDHY2SLgAJFx+t1FZ6xcn9rpoUv3UWq8YMq/cjs2L65uf4v915rb9r2lzNVpdOr5799L40j7it3VwrS3VA8O5z8CHyIEf+UvHi4uXBpfIwcGNG6b+h2oOPhIy92b5cO/w+HDp8Gt3nnx/fEiC/f3YHfwo+gAEmGW9p4+DpYC98OD3gYNT5AGC1md8Y3pfIt6XY0r+uYCJ/Hkh/lL8SfSFy+TfWs75l7TrBST8K/rIp174A/IwEcu/QwoF4T0YkvnLD1clL5PpB6EUwRIMCqJ2hicQ3Qm2dmVN3vjeRYs3Wr4L3COJW4+FWCv+DoGEph6xGMFGU0n03q31A+a4oLgPhHbZ0pZq8kN75IRIZFkFJhVgkNo8rUiJ2i0vTMU8n+rpuq5S1xST+XdjWpSfS8hEOcWhZSSe2mN5ntwDDNuXB2Trso0o4KMWiO3cVlvWIOKT8tLv1rZGpihtWxUdssy48kCHjZCcu9aCxbtwaT8ZalUUonSQISwsqxCD19uGiFQ/K81vpe28YZhRZQ/Zt58FUTVQxraiPYB71v4OF7BpiUNMY2wmAZ8j7LLAFi3VZZdT4dQyrsKGQ6sll/LGfoJBgaS1+oGBtOtZMzaTOMISqF+7cxgJ0gBUT5wBkCogHhWTitakyBTRap8tV7o+c2d9p6gkgZuD4VsQhol1aUS68B0qyG8V4pqyYIdRXXSQliTs4VV2ZdHV5VBnpOx3R3hzQukO9rCVRFOmNKKwydNMX0jNcJtDmhgh4UqaCQmaKg2aESMuZyLtoYkXut2ARikhUKuOTI7B/swaI63hYM3r0VKqPuBAtzqeADoPhA9XlyFV3HR4Ig1eF4WkNgVXmHMO7rc8N7IpBGcYMC+5XwtrTAFz8ZR+K0Q3j9ms25JbH9wKape94vkyzrqwXT/QENeqIXjVIAPPXDH3pYFJdbK+Wp2D7ZkcfXaLsjoUi8+MGHi8WNcz8JCCk7h5JGUkGO/xraRHfdHTEAbdS7rbuz4XcSJ5KMF2LzNGGWP5RE11E+tKJNYo7Yaa6oscDsRgkc3t+zeCVXu5GXMw6BiyLaiwntqQxsPcAK8LEdJZTn2Fnk1T7WlcHD39CznveKOfQOFlUPEIgnpzadBZ0GVZsZPlIJMlKheROZiEKaORipItyQyk26KhKFRPZtnc/EjCWllPZ8BRDAlwc7xbfKTMg24Gyc4wpHEY+/l2IuJM6l0epuY26B1Necz4yMDb7sQ9nR5uu6fP4li3Y5eAzljGsY797k4MTuYBpHMyr8DMT7pdLsguk/G2r2POtuMc3NF7w9yvxiG3MFSW2zl4GOScTdc3S5ykHlhhzavOE9s884VBieb53NFmO9/2zFNJ/F5BQtMxVCUe45lnxolHEvOWYPWDAJGTTZxcgEPb/PRJTQ5gxKRFxmkqOOvmLPMM76OMg9fGjtwybz01CkTCxVD4Q8ol81SRFz0z0naKbjjlxD/RtzEmoz0LxfZzx5wxMn0paNTNBOkKSLZp6uGmdkgjNcq26dC8FOl2BOIMVWrUa13ixV7OJ3l8ppFoyoRolKcxOk8pvRXCc69pTrdJwHO5K7YgsCQbhuZFFgrRo3m8FewOM+VDKsM5VJBsi/NTVGxIZo4Rgiu4+xkzklHKt/go9Q0+opnZ73VzteXnkef7Svgw/w6FgnET0WS4M1XFbIuvn8UAklgxIr3ugdU+ihKw3l/85PXrzTxX5lq4nRB7HAn2f6K+0Ky99xvkG2dg4Hjp6Gj87Svk4MrBlXt/88cPHD2XP3e7/9Zbq/2jI8gsM7gyPnj/jccffGXl6Gh1td9/9eW//8GfGbryp0SM79y5M3m1mgMzeZ1Ra3C8tLAAVxyMB+TOt/6QHT2cP3y7v7Ky2l9YuHr56uWBYe6d1x6lr6zkOWx//rO/JoFjtCWvrHwUiOWMNHMPrg4gMOZkVRrS6urKW1/96v74lVfCq6bHO4/89eOv9vurq52nx09fvPXcrePLx1eXjq9effTxd96/cKEzHgyuXFldWYUcV/TK+OpET09wALmnSH6GwDvfBw7IYGUFOCAduvXZv104WjgiTx88fXHpuaWly0uGg8uX6YOvvXHhAjnodMjYX/HfMm2mmCjI0UPkc+QhVUPa0sZ+Ogek1Bf8LvnNuCMb+a3Kb+UVXdKyf419kPUb59PeS8svgfZqfbxOvvWjf78HdumDwcFgvbPeSfaSvXGHmO/bt9/9p9/4pR+//t60rfzD4CBYDkB7BavfxC+O/hPs0jfIjbF5VAYQNbw+WB8ke/3+nX98jPFPfPG3PryaFxdt1O+lS+N9aPPG5uLm/s3xzWvf/P0v6UN9eP686ZTOwXh93Yy3/cF4dXVjbXzQvubUB+VggIH8G+cWz5Gbg5t/8czvqXPnNjfPn79B/s7QmHQ60Ef9/sYaQQ6yafMvOpfAIhlR7MXMWdvBQpk6sxgch2TFSljjF7iMgaY65UwWeHQbz/IQv1vUD7G8ZuIw872MeVg6hKSiVQhCeAu+4GYGkWWBmDhD/kxJB/usYdurbe8MYSFQgGdC8mOAJSMBqW415Gom5MxxZbMqaG/S5q7mnScQz2syxT5DtCBaVdsNu7psnABkpW/MtwziGzSizJ66De0M7ZlZGW/pGCtbSSf8WUQXwhQQjwm0EDY5oBHM304ExX3KKmng/J5F9EZ+i/K44hm/q5XzMH905q7ZYzpN/Qz8NkIweGbAFiCBnoTFbmyeKT1pB49N07axC2Le9OqEUt2qDJmQrmHRFkGh0m4aFeDG7xcBpP6meocHEfXTKISkA2HmF720x31qQJXys56VQEI2Kar36mzrmthjicPo1mUB/grbeJ+rXKU9uwywsojewHOFRidoruk8nqA3vnURwHvpozHdF3MHYtjQMsXV3nmlSwQbF2V52ThaWpGkhuSnQaUbAvf12sJUVJ8+DNMY7jBmBp+tGXIiE2Kt8aoaK42g78T1n4DADtPKIO51wc+9iGHMcZLQxGBW6DC9zanu1Re2V8BnGyRqiLXVsqxmhhySUDDSevZxM1BEMDPWdKZ9nWRBELJuxhPNtAHrwFKoFVXUyLA+3zIyvJLSIMjGQvFi4tqTIwOFUZsE1T5RNCUiUoS4LFX2vZdy8KtXZZ/BClawTlZkmtvlXS8ygw8Xjk6oTdxThB4f+bOoKCY2YdNZKcIeVBNXmPxttyWJnRYWKMzMC1zIdmsqc+o0PEhh2S5e6ByWDNa1P7lB5Ym11e4U5l6xBDTPoCVLaOhLlSQaPHPNiPeGkNI6pZr6pkySMFVQEvhchCFLyRbdbeGgaoIoNSwWO8WkAedVVQ4W/apLgHKN7aSjuKvMi810EBvGxJpAI9AexloXSVeJmHVHcc8M+jZJ1F6sSzM3FAJXF2uCuBgt7G7HbuMAGcUykJHmQQzgV4WmVkksBxTOMPOVnwwzGSvzmOhWYAhDA1weIOsTRy07Zzgy07RG82Z/Yd5SKSrAzfBUFboCDU5hblE1u3jmJigDpT3IQW1ulZJeJJME9Ouc0VZPeqeiwxc4hfXEtIHc8EpP60ziGUrRED2QwXzB0qIgdiZiu2bG2e5WaraCmjGXGtFAb6stw7apcygyX/Ryyah2KsuZ2nEAmD6buEkxaQ7zeOLT3RAsYl5FYRCB9iCIBMNhQjBSzC1QoBTfDaMthcVPsP2LwI6C0NmZw0lTd4we9hVTcc28YjTaJjoSHDIA+TAOUstEPAR9QEE1pAgEdTuLyRyC3NFOeIDsaIXANelEnhVVESN98QTfZwUKeqw+Q2qRZoFHtuyO3OAeiTm1eCCUIMVIqt0cFtQpMsXawbnjzGDsy2iRBsu5+67pYjVTlz71i3aPQ+3u4GUoabZTl1X6ustWTRbSix74jM3chsGgtreD3+renj4kN9bHgI4N4qowVp/0+/tgwST7+6bsZ+orHB8v3l0z/8rtQzD1mb+1tbt3H/z+k++PX10npLO+kSR7e/3V/mobByUBB8vL+hBrX78xBlm7UdRwAGvc7u+Tiel4aWnxLkjn5bYGU5/5O7d5bpO98LU7YwMbBqub14rj4nhxsc52W5PNHmW/BwPQQbz6Dz/8gQE663sbyxtlKZul1noi7+2BHXd823bQ8cbx2ptvrlZiF2Cne+9978XV/uHhvf/+7V8fj/f3IbvS8dLGxptv3mpBpuPG92Cwsbax9quPPCQ6Bu7tLS5XOcbgGTse34NCam8PMgmNb9kzlzaW1paXaw5Mk9ef+PoDfLUfBP86esC7dg05+JXjpTVTbpaDEkM3/NdLS/qERT0g/XNmmAcwrJ78I5Ejyu7jWK0xsvVbf4qs4ndPgdXe00+tWSxdYu25NJ6JozgbQW6n5bt7d9fXx+Tmzf0ZXdDe3sbiubdv324790PiwNyR5bW9tcGg07l5c3bZ5eVl4GDGu7uFJj3oz073vvfei999+Wfvjjvj8Wee/fy1cv9PrAe/6YOXggcff+P9A3Ao/z/h4IkHvs7lY089C1nl5TOf+/Oag5/gk7O8/FJAH33tnZIDhii2lNUwaa95vdq4ZuVwMti7o5hGLFYGS++QHUTUyp1lSihp9llUnTk7t407xytCokBCrYebma1knGQMBDYD0nfkbPA5Rcu6dLhXVfiXGQEgRTM8RUMlitulZ5zXc/uCyg5vWyfdVSENKAq4aBVH92goCEFWNV78AFS50J9IHtifYw9ETfBJiN3uGV2WbJoZZmU4RNaBdfZt5IGKp0o0zjWTJsP0wAa+dDPBw9i61tpz08rm17O5yDLuuqWuWzadEGnFdRNNaHczNZi88HcWpD1cIImj17cRtzJc3CUhVJnZXmFss/ncVmVOypLgRjeUmAnYKQmYhp1fa5xzN6FH1UKeDn9zC9pDSIcvhAZfqzAxI5gFhYGLicHLlPNI+2B6TLuqhyCX8bBFZ1qjpdIY3URRDOuFbihsV1VruqJlnOvqLBs+kLhfCZjrFRzLiKyRaHcqLHUOOdDQ+KSN/WemCZUNVpfNiTltgmog2TxkEL+RtBhKQAXmZ24eK4Mgimobd0VuYPmombE3jOTFUIm20a4xdwLvgbMLA7nT52iSZ5AfwCl3zJ95HtIgdedwRHPMuiYEHBIY0NSMipRSanC0Uj0ic2XGk7myCpjUvuCa98CvxCVDaLRSNLlvoXIhMF2a2ykGeXPeoroy7zUfjti9TjPlK9+eVUQgEZdla4f5uFFbzRhrPX7fpKa2h6Q1YZqGj1ZFHymfygmzg0InKnr6a7GwSQIKUEAJA/m0gpjRed19FjOfozg+Y8fE9k+VWDt2Z0/TZKRQk8qGy5ZzWMuVZhmQDuAxUmoD27ifa9eBqDG8C/kMj7vYt6cQ6qgw6zzMva64aBsHsvV8T87rBIXZsk93upbgNJfpIskJBPqAR1JquJrlXLZzwae+pyk+jYHJgqb3R7FVy8wp11bRHCbiMzJQFonLRzuMwxNObHsavepbNncXLVy1kRkBGoSjAhJ1KxgA0st064kX510jmPp2ZLHz4nTpUwjLd+/LWby0yrZ5si8cLZwQ8ezO3//5z5cgqzEmTgY5Of92p3M/3uBA7eXH4wsLF07lYEAsB53O/j7nwEF8/f780T9uAl4hThdDhifuwVmtlp3OlbHnmdYP+kUZxX4/cQlNDqbI73/hLFdaWCg5AK3HtVefmWcec9Hn01R60Fee9BVp0od49B+exoGGdckM3i+/Ed2oNvdxtMp+rPTxczAYgH7q/zMHDN2LJeZ7sCIF/pJwrMAS+NNiswmMDKJD5vxcS2t64a4KeYgmxC67FqYl5T6VDXQFoSVpzli2Eg9Srzr/JqzTYFfOUFqHPSC3R6QRLIsMwHpGXdKuvZau5qDkQlWHYjKNWEqalh2b09oJKvI5JHjMC1p207abebllzpnLJifOauGnaovZxFt4w9LWEqXMmSL/aeO42YolxkHiiiDYFQCFMZVSYdCRZQyMG0MCqzhQH4wuOZmUrct46RL8JajPgepSyDfdUA7kdtEkgTqCgPTgylkvwxzVpS+4dFobUq1KZAmz4uFNEZiObr4oHWFzapVIKUX4OrQrJbnfTOOCt7CMspV5VfOel5itmeCnbnYpXnHXyYXl12JzUrrg187SbIrXZGIbWIBlZ2x6xWlipRe2PqHRTcb0WeS0WaVR5aQubdJwjeOAy+rZsAoTyJzVOKHxw+nB2iFG7kqmLcfS/2Hval4kR7J7hKQcQuUeSmrmsAfDhoaxMWYNbczC2hRMqPGwc7BhDm4MZmBnYN17HF/25O1xTFYWZPpilcE+qzEDSx88/gPMtHLm6sP+BR6DLwYfpuwG2zS9K8eLDymklFIfqcys7s5fVWYoFKGIl/GlePFevChIR4U5qyLdJMIzPCtbghIpC+4wlKbx5dHFxX75kjIjOS/FpGWhuKqYYVd2GoMt64xmsDIjTd+Bkg9XKwqE1HTYK+UfIKtFWJttyoW89kWYkhazwkPMUocgPTajolWPVDaasLqRdLNRESv+ZgqAtPCR0meFSyyzpMK7BdDJlxu8OEOTIwBZeZB52vxWAc5bxuTpwZFhuOSZx5WgdYWG/dHDIGMpThZVYQcsVpVaz9CQQxJ6Q3T6K49ksEWEJYtSmJokGZ0nV3Y7WO4hewG2QDRbCBLkikpZC7JZSM5aoddQNworOQu45DyUwokColWIv71lW81JvlQznEo9A4MMU5xguxJYm72/HZFhNqOOUfMoEUcO9fD7FQ6eg/x6eryh1zHzm5vf+s/yjNJ5fv43NzY/l2/ab5sIIucHD1AqZuZ5nYJfHISCB/nFxaNHKIWjYl/c+f73zf0//TlwCzYjalYtpgasZPzwhyKr8wfIpuDBkyYK9oL066/few89C2Bywqy38Mcf/CY//42Co61rk0+Hz7/zZz9QsvMTTlC8Zij5IrD/ihEcuof5Su4vjvgVh4YCUkiMAnG9ZJGIs5LbeAPucSnNRpiA8htYal8JVkxMe0EnDlwEcnJpms2RM7MldmjCxPR5wdCVFGN5KAD15kzKFAXz5xExQUtRwGBHORdTWi+AtfgUQRKpky4QHKUoJamCB2NcG37xQCYuXSoV2B0wwusEFHTDBYeEOdWMQuRh8TN9L5RG4yXxrdKcLlRf2hy+sHVdg32vfJJtTb3pbViurRN9io05OEvy0Q6SjFyg59FEnnJDrCcVj634aE/zAktFe1kQYIlMH7QcrQQHvCAkCiMMErsIDEyJuNFKMCdLJXSWu7oTeQIuniESREyelIwjUcozOAWWRkT8sQjz9cyJEE8eI5dEcj8s7AMHA1aR1HXUhIIqe2yx+IZ0EAfFWv0u0DsOyyULyUVBxuIHPZZxKHKZSo/rP4dIFX4Hdno/LhX5HnMH1RnCAsbmlCoZm3mhhV8yLa55XsWYFwxVXYA0r7HIEG6Zzds6C+I1n+XPumJvkBPUWdlyPmZblkbM8JCOEsrIdkMh8Rkp/EgWLYZMFeO6LEiQZypRdS3fPSTST5mYBHNgGe3OyDWJSBX+ErSaIa0V8RU3v0SOqa7ihUYr3KsaH7RAnesfSDRtYPOt6E7AukKLWnhKjSWUaZRlMHPUbyz1ZKJKOOy7ED2AwrU8bYmZ+yUbH2kbpIHSK1+EhNTWx2ZwhABpXoUrdtjWVXVK9p6bX2ldjcVaVMZ6Do0KX65duYIKcmlw5TGwVvhchy90+HpZT2G+9u0Y2EoBq/CZDJ/rcDhaLl7HyF0nYryO4+X6kgfzGBgnD/zwk+3wVUP4RoxrHQP87LIIv5ZPJDoFpFLwLmFk8WMgMo6vhevGZC3C15fivnhuzYOWcG7CaynErvgZ87UVg9RT8FW4yQHaBpbnBGOGkY+xuyYyPIWzRtayG5fhYREesDLcjnGFsb8WPW99SXQMXAmPMXbW5NJKQZ6WvGa6RcxF2LL0Z/BVD3dq4bUYTjUFXA8PKuFAGAz567Wuz4RD4Rh/tIgbwte18FoMZKcQr9ztOVyKF8VaMOqwuRz2GsRrd72GViRrDVY4WLI9HCxttMaArXnc9UW4zy8bU/AgnK2JNu2QiRrCazYLMiZrTXSdDJON8FUlXIRsxAh1DKj5TEylIPyyIRxDpzUrbIZXfv/+Z2doPrP8G+HzpvBBKTSGv9746V9uC/3Xf+wK3z2Fj/7HvG2c3/03fXWH6Yvskze6whHaNQVPchrlPAG4ENCrhUko5tb8gevZiAZtEktU1AWlzs8WBRqq04CEbSPHnDn6jocc6lQf2LJ+/jJjVs646vKcqnzRlt2ZlX3jzot5I7JCFOej7jFpRCzYCIc5lJ4GYdkePFmXRbuQsTN56USOjKERyzrvUpMybIWWZdTCahJUuUM55eqaOEZOifRvTiXnkcp2kWr67WVPQ0Na+NW5USRsom9ZhrfSvj9s6h2mhyeiBbU1LeBDiOZBEsnDUTMlVuve9fLbvTxVCgtz5aQRg2wLgZZmCwhsNFXbj5tTAKTW96IS6lkhpWJ2VfHZlZHs9f2SmW5C3zWQ/voBYLy6f0LdZc86YxgRftdJUYC9yBkczYz7h5LxVXOX35AxyJmM26opzNGeJH/QqEHaZ1w5elLrY5BtoW5XJHrwh02PcuOqrPKlnT3kzfaUPSoXZrg83E2C1qLYCkQTZ65PiKqeFNWAfZU/SPcqroTpdZalaISX+6Ih1gNgXLMwgTZLfT9Sv7z2KXe4gnypclIU2o/MaZMCwCEpuBXItf6rPKfJ6EPX9aIhBtjW2j8FbZH2R4E7d+kd9LeZcueZtdO2Imfcn9zxhBMAM80n6z85Z6c6TPLXXPwhGihem6pwzbpTPYUwe2MNP77UOrvIulv+ORbnD1ed/HjTQkG3lBDvldOn+0sadc++IRzX/NtTsA3v1NcHGuFVN8xsxr9qkaDuDFeuHEXoUrutaGoXVc4MFQ2xHt6IrDeN7Wg40m60QHs6tPQEtvUhU/S88qfvwG9abOerJmoTUX0YAVB1+Jzyb2kjTWie36a2B85rVeOhXleUE1as+wTWFtqwHi+LxbfQWvMw/H+1FDY1/FpKabPQJV0bLkcTglnXBffuVLn4drdjTy3GdFhXsFrbILcVYcyjoa2SF2autMtq/ha3I9EBWCiuvXRxzd/ibkXDDtp2BBb3PshtxWpI9giVe6anawtDcq9x74WrNztw3fILf7cV2IF2YjNMm1353Vz86bAsunAfobe1exfcUI9Cn3W4rfisptLSA3X2WX8kn9zgSs5uWr3VI1PQkv3WD8qn1N09PgVV3rmvO8+2JPnnyLl68xZJTl5L7EfNfhgFuzVTr2PEa5R494nBjWvCHdR0WukeYQbq6TOdKsW2V0mXZJk0XPVPAXiJrTzlPjBugX7KquMTprUbpALqsYk4BDZb3+g9I1GL24r5VG08aXEHoF7Zasjdm9zshK3Yy3kX/cDhK0KeNsg9xlbCjmD1G0da6Dt+4+fHJuCEBnx1bAJeMzhVlx2LjhOODg8RfsxpKRjVYOyIBAhgPbtrnCPkJ0yxJsbQkccZD72qGvUnvFwws2Aj2Ylq/v2DazfVblLzt6CXPsZOmNV8hfGyveZ6HNzexaBj7A8pUV8t2txtcVz6DoOZ3iXu1ha93Ff519e7xP4W8zthJOTHo8C8Do6Q9fHXaRSOWP8a/PBZ3t73wuGh3wX372rXHOX9+lihwmCOCCk1Rsu9BaqaB0MgewQjze4JB4W1XnT4dSPR6OewXhQrV1kMQofqDOZcel8fdeT7gXYPkv0rjOOvy/DNW1VJsm0JrRldMbyt4bMe8/rut95xRsTs4Dm+WusB+5nNvFyjkmn9TLtmL0/9MJyqi607AzdXtGLXl8kgjXUbNa6rex9DUos5NfrrrndqsfeC4XhdkyjasErQ5tpXu0APoLoNQLHWrRK0ufbV5Oi/j6FzR8NI9GkLTuXOLqi9x1r3NWxYK+i0WzASGaa93JrdgjGQ9spSue0g1P7ZENe+mhS9tehrVgNGQA6FgVO4h6dAHQKC5B7iW4Rc/zBlE6DD7bAa8FJQEOi3YqAH1nvi8it37t7TOya2unIPxr2OPRU9wOHLuw3aY+zYBJywJ9R3zBrsxeDUDqhLr0eifiTUAHDtZm0Ruq0MKLsE7ZYJiF+PvX/ZNxSpJ8sFXt6R/nid+U+7q0OVykSNri5H0qxR8T7Heq6fcSSrVe+UVxuUPDh+Z9+g5sJWDxJkRRjhLbY7Uu1O0iIClXPkKEv8V4IoIj8ANkUOXeA21wuWmzHahQ8eXypwcN4MUY8ihilSls/5jmkOA5a9TtZ9YErgMMuTWP1IP4O6XyKcySMmxQVGy/FnTQxBHDrXYuBbcXn0lxOCC502DAjZonXBpyOA+2LojX3Bxfoc7EC6KCKJWhwN5Vn1zZiwggJZ+dgJlqISMnVvqSzJ4kMJGmTvYwFYJ1pkS8H+JNIOAcbqs3f4zEWOH8v1FX6tzoCD+TcJXELCA/TEmMPyJQFe/loQIFrYSvL1shUUcph9Ass3IBadMFuScAlLbMsEBuNEVs5h2kFqXFvsHR/ccu6LF2fPn1yg/M6L58+PY+nvzh1JAbrz4uzsOBTcoB/96OLBef7hh/kNnNV8DAo++EBQgD78EBjrA1Mg23uA6Tn6YxiG6fnsj9DP0cfiJbW9J2Cu3B1lEbko9w+ef/ll+btz/Z+j/7jZur4w0avh/BwoeOutOgXfBDm62U4BmmYSlz9A5/Mvnz0rrW0KV1uiDJ62L3ZNt9dHUXDvXp2Cb3KiquIWgh2bgBMML3kcvVVo9kznz/aTRc3aflqcq3ZMHG4zgcTLJWyeEBkyC1EL1dId2NJG4LyxMDmSpZ7NythqnnIytGifzNT99AAUnHDCCSeccMJeUC4JO1p24FnW1Gy7auX9JmtrlNCNs1zFlMGDmNlWCkxavKJ6w627qDGGgVOJWd7X6Lmy5WkRgS0kKa9ry9WsmqixDbeqiRmU0eTIkNTH8rcRFBV3qmVeTki8zH5S/vbMxPIq9zlaUDZcj9ZQC0cJu5UTXiPrG+Aav9rGkajyIGrGThlyDqcOzZGWgKXVe7pSpuHYXKVKQ5BDVZIO9ZBXtBQFb1Fpivb1ELRRjG2XIIJXiEtRKwjc4gVU2eUsFvQV2puevKJb0kSoaGvIo+qyPsuORCUXUguZUJTJ60wmP0fzInVqN0QXMWpaCmvPHxX9u8c5A01Y2L+Op+HKZhv5iAQlp0Eqbd6UibtxB04BF5g/lpXBpdVyuAqVIKxIkw4hYIxxrVh0QRdUvTziEUpmIo2EgMyrJx+/hAPGwUbw2k+UQLtTV7furoULe71WyFkug1LS1bNWpYwGvtarxFXHQ3EV0KqrW3fXSoOTkciBA4pNyn4YBU7Qa0toIM1fc/GDwjUIrOBYM85LzVzpL948vCmGkjgRZ46CQgcBDkQOwj6KtYGsCsLmcD70tTqNPktIoZnraJvj9TvGv5RvjMwh3gotkuV1kS6IHnE3BXBOroiVgYRKRF+DcRvQyJUSK+Eav95LZN0p/R48mZEVdtAyubJTd3u0Bq4+Umbnr9QxyEgVcq3G63dK/yXywE9iR7TDogyghc+CoHNdicOwJhJbX3NRuy7hobIyLlyHK9fsra7d4T4PdQqytREuCAjdouUJAuIAuZ0tMYOplGg+61UAgyfOMFX3sfRXdHWrdzI94GfIkSW9ChwnCCsZ9usJqNDATU2BtbnNIe/rJ+M5SP3KMU35uwFWez799Ouvz3OUfw0WfMQH3HPtGj9C9h10oa8vSv9PHj58OMYC0MOHFxeffgrpKwryGgX5JgWoSkGu3R8LCv43P9ikaEKoX/vJJ6p4nz3TxXxT9yvD43l+755yz2t+13348CcPN2UsPepFUHB+LinIdY65pqDiN6eaQY5IU2D7gYIfCwq8X9qJU/r0aRcBAUz/GCL/4Li+1s0lTa7U1W0Mcf/dPfuXN7/K0Mfo9yvyxrq/qyjyR4+e7GTM6uLDiwtqlTr4sz61YOJfAAU7ECBSANnbNxUKEHq3d5rQAZ8/H1MI5hmg4OKfSyl8nmfo4g/6S+VFIxYUjNEJPz9XsteL3xEU/HqZI/z6IRTsjuKInxn2bUvo+GCsGy/+aIW7n/icnQZYHc4PrAlyIvmX7u44YotqjQPz6rtbSiLwvg8868AMRRiagLtht6cZhvIpOO25lDwKUFEKcVr6d0LrTtul/GMwXYGJyowVT8DEPeWSke4+SGAiWCIvxTekuiv24Ys52rnZUGXheUZn0o3EOy8GTW6vcuD9tscH8u9FzZr+lKYizyuYvSNjGCGFSz4o2daW2NJtGWLFRBYj5iGlsxuxmZY5ErkidgjpI5LF+Hj800s5/R+zgTMA/h9RL7n25vMlXYQRmWcpcIOB5CwVy9A98l0rzmwEBeYlwEMfdHj9MJz7oQNqoyvJwvVNk0N/5qMoAIZNPBqjVeaE/nWI/MeCBbz0BXPnOPI8Ts6jbkKAdU6N5u0geCjFBHlZugzWaZhlbL7MZslqbVbQBHfPCHY6k1b6pWNIoAFKMpoGl8Jd08fuWrCX2TyQXLgDaqOgR+zgzoagKmBsNYjHeOz4zpVPruPQ8ReO4KtFJYhPGMvgYo29PQ2fj3x3mKSXqWiGXDREOhd9wPWFT/y5sWhfqz7NUXTGkbtQMujEMPD6SZYwkc51wlhAkfVGCPrqAo3fRyuGxftKV/f9wl2oMfmuSnlxvyuNHD0R82vQexxJw9uMB/RthN7+CKGPHMKpHeqhP+mhRfpEzPjHUZDnocgaOx4RZRGKN7SPPVZbPenWYwX29NGjfMTs/u/F5w3x74lO7wWYeZg478C26kry6JeND1dozNE4CoAE8T5JAso4oQ4PGOVog4Tu2Z/hoYcT8Gtz9bzS1TUuAXeWyQX3M8Fji/fX3vHgpw/eo+jb/EKwrBw9zX92Abz0twfUGn3wAFpbniseOs+/p93DUZDnFPjnn+U5Q+gpUzkHh6TgG3nm38X3nqpd3Drn/Nux6dkyWCbvzLVvbsUwoNo1YQt5r5TBUnRIbF/IrelNT4v2nnx8y4Z71tNNm2/bYjtbej4hlBRaJSwY9NRdKraESH3dSC1mLDbJmQbQJ2hnnAqmJ+KlwX7M6FRBFmqmT4i4WpDMV6Kf1GqiacujO4IWV7rG5fKFnO5GstbNugk00F1awW0x5HvCCSeccMJrim65GG25P9fcgue+jBoA+8FoE5P9QRrnDlnl6hU+ieL2AiOlPYv1NxZVsd1YTS9UJ9xki0/KmLmkgmte30VVPexD4KiNz+obYcO9HTF2yYGPznGaM3UCqUUrRvKDDtXturaHQruu7QGyRh12cfeNbru4B0B5THfW6O4fvHB5o3sYIlrt4h4KGaaN7gEw12Nxm3sQ5HpRvdkq7etBwW1Ah1XaV5+Ce3fQ3S12cU84YRiGcRdOyyTW3FWykGxgmlOCV2a8Qc3dT54bsKR9vOZ2oHu+rmIsUMXyTfmYQ4rf1vYj22SRtIGOMmG3Q2KxySdFR1HaHanfZHhtTGt9YlAHYWi8YSTDa9MJtJ3Ht2/5ZERjqSHstEqq9iiB4tb3QJi6N7K+0l+F6QFlFW1qssLvn2Flsxn2vg4rUpkeU8ejE+GO1pSlRxAXMyI4rKX4zTibKEW1Tz/tHX9ltkGEYeiHk5ih4pbTIz2RecRXwGu7oSBgkpOpFAlM+7oaFAzvixWRPDCexEZtBuNLMGCAhNXiJNBW1acwjpqAHJ4NWOjmeg+ri9yYhRO0Az40fohiIOD68jpeo9UE4x4fSEaGHcxEJSSBj0cpC26miByzj6If5jBk3te7VDvVW3tiGPd+c8N+ZexiToE8z584nNDeD7z1T/8lKbjzbEIKMOtvDD9Hf8VylGfT5K4oECNz0L8MFAXvTkeABGZyu3gviML6gbwYuEe0HYUmbWnV1rhbATXRbSF2ILya20HBu+jes6nPASrfT2xLHE1BRdt0CgzVzszfRe7Z89dsEaxH6dCRKfedG/CR6Q+DGRoPMQOGCR4MKIzbd41nUoGH/QpnTmkpiKl62+H85ab5EWm5bsUkwyoAGlM65sEJxYw9yrJaKNJ2mTf++B3B683ZYJPENpkUgU32wpv2eZ7aOYZ6anUcUXobz314NPHcvcsEi0lvr4nABorRag5LQQzBZ4ykiopPMKYrgKSc0gk4lVjwG/LIjKpBv25w63snXMc8koUXCwakt40emTGdRkS7FAQk4ao3/0/lt7I45Ah2d3esEhc9xtfDh+VAtPbFJCTAQUVLtaw/mAwe8AkoED/FlxXqDFoMmk5MH4sXtdxJ0D97OahncNTlkk5AAV7iBCfTvZ6H4zN9Vs1niKVDnvtcfH5vMireGbMCMSkJD8Xfy4bPRQks/1DU3UTLN0Hw3e+Oo+A770xDAbo5t/k+0y+29M+7b6iVx7+eIvcIOfzvpPsGf3OKBIfi8/SLL46Rb4nzs/Mz2z/dmTR98YVoAr/I/u8FQmdn3bH3gRuU53/B/vtXFxe/3UFBGyti7tPa/ZKLUCFBI1evpkRmqruda+ED73eg8oMWG9OzPmwstq5wS8h26Al9sO1Vv40SmGAzeVWUt9f9VAPwOEVpXM6WpbXcrZGJFArtyB4z7fpiYs3ENy1P0iGCnB24xkGEQT5mVk0xxQxTJfGTUnhlXWmw1C2QhoJSmSYasnCEqfxTGtO02pbTvrwsk99Dq0f22RlliIQemmEvRFL2WkJZEC/9XjWbzfwIl98D6VhjH6cYLShOoXGMmWcaUgihPhlBA2ee4DUy+fvh1GSOXcw1F97rrBul8J79f3tnDxu5ccXx4cfaXOVs7QLnwAjgYNYxHMVplKRJIcDk4QoXMXAIoOaa2I2Aq1IFCZAgHnFX8SpIsWoMqKOKAwwFiFs3SbhQe727OOkCuDgBgeHCCDbzZsjdIXcpDlf7cTn/f5J2RHI483ZmOJw3j5w32+GyBhdyh6b/HNZzKS+t8/qc1vQvfQ2rZkUvIQ+6aW28jDQNOAtGsUOlT2sKOXod/XY6ZI6xZrFeCrniZlAgDM4uRv00sZVglC1P1I1Etx0xrxud9kIyf8v9gSjMSgpmddMQbtKNraZO8wQFrTXFTkWbjP6njHQ+b9x2Q9ETXBRiU2XVixAI1/VOe7XzBvq1KJo46TghhR12Kks/HA0dlzljWRsBi42nIVK17tPQ5kk3eU04/UYX01AOrlOHDTu0rBR5EnBkhzgK5LU5PDMyHJF+byFCyllyNkqb3c5kNfA2FfCYkevqdtChRu8ykYhCrNnnTYm1Weuk41lPqea38u6o7bdYEEVnXS8QHq0nfRYXchOWpsOL4VmvzTrWZUALvw3dJPcbzJxT2QRCWmNn1OsH2RNe9IwMzfR0Ohaua8fjaIkp0Xvs+Fjr3LRy9K09bsmUGs1rS415JyErX8HKeOfO/iW7u1eO2X6vLrnDL9n1fkKeJhsIwFoP6D9TgoO3vfRve1Fcjlkvgfwu13qdoHqePGHsjWMZqi1aY0ifd3BwdXX//qefPmY7mf5FxyhWqUwWsvvSy9baYi6BFmEmwdWV7CSGshwf51rP5aWOVSyTxfyigQSmzvxK760fntxnH7eoWw5+TPtfZHf+uCBmHcn77KVlVsShNcOoBJ52nj7Vxufd3eXs3xP2X+fy36rUGvF1JsFEdtHa8L2sBB+EH4RSgMYSPHkyYfxzNvls77PJJ5/QWwe27bkMrSD+8d6fv1hGArL6f7a3xx48uJUEsuQE/3vlKlXF2/b8QIJXpsyzpVaqY9SlcFvEWl4RW1L1a9UOxDsbe5+tSpKxH954fA5f0GdCH+LGihQL817yWcKCJ50814HM3xziTW+y3Mx34csTCy2Dg+b3eL9srdycnWDUTulTMDec7qsaESWWad44UqOeIHPGa3GR0XrWapZF511jilVyN2kbvMVbQ6nnDWb+gVsDNqIJDBmSmywlMlcLnHctRqAnDZRmnWGhVxDyLuwWpmL1Vs+ZdUmrXrd5phTQ0LjwMIIJKdMtXp1MEGcvrBfOt1hmm8yto/m3ksf0tDFPzRwtF1SQOnbIYjetj5khph9FyeZ30Uq5NnbsxrcPUdaGRHYX6hRfGe8Kj3mdjp0tvcENh6uGVmjgKf2SXzYWpub+kOyYjl0rbNKPubK+R85U5vzUlFrloPwyg00BpIn8AmED3VnVWlvkm9F0N9OTG1NoanNsnWqhAm2kmN/Fy7t7XY93mVc/x8ob5U2UPRSoxyFSlvphoT05Fyt7saBIV/UaM3uMen79nWzjgRHxnXvKv5stjWxMh5eXc6sgP2IvsMfs3tLPq/6u0YOIl4eH8/rFo4kSYbn8+7/c5Kq2t+XJTw6uyrVwfn50lP5n/86rr7aWWpO12fcnCeZr4fycXafea68lyRICiA8a1sADbm61Xt3hi3X11vs7/MSqTB7UR1kKWTXna0rakiPZPLYrAZtc725XionUy1dXE7pzd0uGmFh5SeZZDHKHOHv1Qf/Hfc6Kww/aVjbaVji11fLS8UXoXIVq8MI84OdDrIq32hfcl8K57ewdT31kYOZYiZ2deIkJhPlkKyRxuo6FaZWW8A4bCWAOcIoZyh9uDL7VQFUt3CxHgb7a35PF0s7eOOasrWzAqqh8P9FGDs/l/jB7tDIjpv6qlZI3msDJ/dEs7MPI/fJYfSVdSlPdXRlo9JvXRoE72hc4aTYiEXlLGAhHhJltMMMsR+tHbkWec5LtSIX8MWN4uj2T3uoIXw1sA1UKqWiLPqN12MnSXRi7KPEdq4d1fV0II2HsypvPrBXRUfmdAl9Z5aZ5hTSMo2NuQssa00/W8knzi1W5LWiLvvBVmaaB1IoCqZqdUCQZt5XIrTQ7R/YMwhep9ihNzyj4WtaOqtZU1be8XgPGaUX6WL8+0Yu9wCN7a26r9RfquCLMLipH6Pka3nOiwkUmlM7S43nrINe5sSMcMgiPB3GS13dW1KRbFSuhJ8a6tZipztAaEpWDbLN+Erg9X00UsOzlf9+QOsiK1Ffn8dzvEqE8AbvcJbOx7ChjzryEDWmWTx6RIVeLCATKhlkug+mPvhzLncx0KzbPMNTRWZJcmeajSJbPbC+JFg0ix2u71MmHbpVFInDJiBq6rjK2mQ+6k5vWlMJYnhuri2qonsdPx7KkxqmhNrlDtbi3y0aySXRU3xB0AtlzxORnd6jWjBtWmbxEXxWEiD1RPpK1X5F/dOVnmwlPjDuJ8WCWWUL0mxWVEN1xeBJEUyfIZsKFbkJEcVv4am+LneRanlA3GtlaadvLzgplIP9kkYxO/FkRiFmVyaaq/lVXqyu8k67bPpXKfksY+qMhOukSQ1/2fa78U4UUpZ3pIVmjA0/NqTgDlu3nlEDsJq7HWtNbS6BbpY4RUKUmMr1UFqFDPXuP3G0PhvOzMw7TulfghqOO3/cDvyPPNuzZMqdRquZgBqxDIfmlUw9Ax47fTpMLIyVtv6f2JPMJExU1DdUkw5mjvTDPe34KWO5gWxIPqbJEdm8yCndaKzLU7wHIr34Wir47exAk0pHzKZfp+YL1vFP3LOpn2ZQlmJ0yOtONReTRVPmKrl7PRnSze6srhRYtqbaP3d5JVxg3+GzqTJ5/NhVD0BzDWRSzblemVHklUunJi/BCdvR08fluoFq/6shTh3tpSmHsZF5+HHnZOZRyJxmaAwxHCzhivku1QKsNJG7IxuGFE8iakCkNF4xIWlo7z30gH7NBb+YLmcKYFbcZ2cS5uld02f3X2XuztI7JCdM9pf/7hoor48n4kZFCEbJekRWPLFs08j0/evj46spY0etyJ9nfT/evr3evGf2o2MouvjspaC2555lP2OTB0wl5wbmzT38yvtLavvjiYEJ/hewdUwI2ofyPzh8+PjgwLIuZBOr/a7Y7s4df7+ozTAkIZZ1Uj7F5Kf1dX+tM9/bYFf2ZAujOl848PDw/mkwof/lVrx890n6cpAJ7+Zgdqp+7e3fv5kowBXQG/Zn6woRl/mQP6HwqAe8Oxf56ovM5PHzbe/fdxfVAaWk97Hp3d/fRo5mFlCQgI7iSwEBLUNSZtARv7x8c0PlUAlR2yvO0OiqPLZDgFfYWl8rFxx3G3xRS4s77Mnw3czDCOuSxePdPL2kPxnL84aoz3jz5mTpDDmoKKe1RSlTgprbdcXZ+ILWdZIHnp1LnMLFe2m93V7We3YcPr64OrupifxV89VXFe+ulIdsyEsgqr5VgwoJACmCxXl7hCqiJSfV8JFvh5eFHH9XFfrz75cTuvfXmEpwf2UmwIwuCf26Xdk7VQGZ2lNekwBemEjYTYw2IreTqlH40jdYgKE8eD6fLf1XFMMd/Q+oHyGlhRz3QaTMtYIXtlDbdEutn/Mqp6e30xicPTVV4LqaXj/IK+1dmlFxQcWH2uXhtNlX3YRbybXjXUcuLOdNwA7b7pLTNGZsutL2oG+HUtqUioLqPtCbRrIvpUbPOuxuzyNNS9mYLCayWj4zYDa28cAkaSyPOHw+VRhGXI4QWEjw3SF3SGfepEpx+2koduR2msarkk3QTAkTjSOozfRaJKEoG/VMeK8252xHtdn8jAjA3omKIojRikReNxpHc7stdcrsvwk3IIK95Uuqd0GFdx2mNEyVByHoO68cXtWffnpBRhopxHPdplnOsn1tfg4F2IUK2BC1BND5hfbXmW19pbSGPVrIAXw3jWESC2gETkTeWTVIqr7Tdjpgv+sHp+iUI09CJ1Vf2nXgsK6CfjGPVLmSnGjs3DwBXyDv38jA+Zsnrs+1NCfAN51e/venoP/6yfgne+64X6v/cH/0z23cn35P+5oXlUl1gZJiix+BcZGPxQkjTWXl4wshwsI4+KfN1wxeFNKduhmJ1o3U7wo3kUqc52GoWVVpFwxcCOX2UFQM7RWENo3jjHjQwckhXn1POM+mKa9tCNXluZ/26HNkw7O7L9e3WZsqhOBCapWnUSmUy3CL9Z48qT1Cb8xCV23Sy0M3Cdmm7YPuZsZLrhRKmKWLbUJO1hJXcLElLvskjVDlcC1WeoDbnIapc13XhajPPKrTKI9T6PUTlFZs63CpcA8fZSxz3sjCqCO+ty0PUZLLYD9Pm/DNtX4Jngio/TJvzz7S0BKvpID3X45kHKKvQONXfltUlQ/Vk4TYlADlCB7lG23DlI2vyefY+m5vWXVeWFWzWp+2KsPUNdZsUnk/S9SVdWaSi/ty6Nrisu5NMRbTQfcWSOWhyQ/DtWFgKG22pYpOZLQ+3iRTVR3k22bx/5zJi9rwvPUec7d1wn0nPf4b0z+wpgA2Z33IGm/PvXMXm/DtXsRbt3TrzrQ9Ott0AmNLyt10Mk62rz9uWYOsF8AxIkOvY9H92XQRbeERMY2jt4oZoayPX2jesr1USbivj6gLQxiA+9yBoJdvXyjY8wrgtt2x82fP8xlYZ862+qtqx1bW3X7tbwLrtP69oFXyzdT8ohdujVwotCLLPb+Tl8twibnumn4VLd/nNR2pJFvrFcGv3yG1rQf8382MArJFnReUBK6J5x2rcEkS2yIm4pRDhMme4Lptp4c1TMBHLnuHkc4RN5gon4Dl+HAcAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABsghcd+fEG+1a+LRz2hL3MXlDhr1l3wXHGvseCPCynUw6XlUfl/1PmLojCbdJR8snv0TT/Oqq+p+33rzv+YVb+eXjb8rT9Pt8vy++tJr/y97E6ic+fv6r2VaYq3bLcq6qPqvPy9loV5vWx7vZQJVfePqby3DL/VdVn3XVuW67Gfvt2aiFPvv1hRf7L5nND/k/M/FZVvmX5P6yQv2n8Z4Dv/P4PnDX72b9gO/LPK2239v/FJvtjdrzvsm//9edyz0s3pfI/UEsBAh4DFAAAAAgABxmPVDe2SusJJQAA2nwAABUAGAAAAAAAAQAAALSBAAAAAGN3bGl0ZS1nbGl0Y2hvZmZzZXQucFVUBQADneFYYnV4CwABBOkDAAAE6QMAAFBLAQIeAxQAAAAIAHENj1TUQhrwSSQAADCAAAAUABgAAAAAAAEAAAC0gVglAABjd2xpdGUtZ2xpdGNod2lkdGgucFVUBQADxc1YYnV4CwABBOkDAAAE6QMAAFBLAQIeAxQAAAAIADECj1SAQfa5a8QAAPIyBQAUABgAAAAAAAAAAAC0ge9JAABjd2xpdGVfaW50ZXJmYWNlLmJpdFVUBQADnrlYYnV4CwABBOkDAAAE6QMAAFBLBQYAAAAAAwADAA8BAACoDgEAAAA=',
-
-
-#Contents from ../../../../hardware/capture/chipwhisperer-lite/sam3u_fw/SAM3U_VendorExample/src/ChipWhisperer-Lite.bin
-'SAM3U_CW1173.bin':'0BUIIL1cCAD5YwgA+WMIAPljCAD5YwgA+WMIAAAAAAAAAAAAAAAAAAAAAAD5YwgA+WMIAAAAAAD5YwgA+WMIAPljCAD5YwgA+WMIAPljCAD5YwgA+WMIAPljCAD5YwgA+WMIAPljCAAdRwgALUcIAPljCADFMQgA+WMIAPljCAD5YwgA+WMIAPljCAD5YwgA+WMIAPljCACBHggA+WMIAPljCAD5YwgA+WMIAPljCAD5YwgAzUoIAPljCAAQtQVMI3gzuQRLE7EESK/zAIABIyNwEL0gFQAgAAAAAFTgCAAItQNLG7EDSQNIr/MAgAi9AAAAACQVACBU4AgALenwQ4WwECFoRj5LmEcBIT1LGXC/81+PYrYAIjtLPEhZcRpwWnCacNpwGnGAR9/45IA5S5hHOUtsRkVGOE85Tg3xEAmYR1T4BCsoRjFGuEdMRQXxCAX20QAnM0sJIIj4IHCYRzFOMkkpILBHMEkqILBHL0krILBHLUksILBHLEktILBHKkkuILBHKUkvILBHJ0kwILBHJkkzILBHJEk3ILBHI0k0ILBHOUYiSiJII0uYRzlGIkogSCJLmEc5RiJKHUgiS5hHAyI5RhtIIEuYRyBLmEcgS5hHHSAgS5hHBCEfSjhGEWQfS5hHH0uYRx9LmEcfS5hHH0sfTSBMmEeoR6BH/OeNRAgAWAkAIMQkACBxXggAlAEAIBVlCADpEAgALXMIAIDbCABBYAgAPWIIAAEAAAgAAQEBAAAOQJFGCAABAQMBnUYIAAIABACpRggAtUYIAC0HCACVIAgA4WEIAAAEDkCJYAgAeSoIAC01CAApLggAhUMIAAU4CACpQwgAOLUISwRGmEcHSxp4KrkBJRxwBkuYRyhGOL0AJQNLmEcoRji9PWUIADwVACB9ZQgAACIBSxpwcEc8FQAgAUsYeHBHAL88FQAgELUBRgVLBkiYRzUgBUuYR73oEEA1IARLGEcAv7lhCAAADg5A/WEIAOFhCADIuS3p8EENRmmxBEbf+CiACk8LTgAjGPgEEDBGGkYBNLhHpUL20b3o8EFP9IBhBUoBSAVLGEdwR0AVACCRXQgAAIAAQPECCABFYQgALenwQRpMBUYaSyBGmEeAIwAiI2BjaCBGQ/ABA2NgY2gRRkPwEANjYGNoE08j8IADY2C4RwEiIEYAIRBLmEcoRg9JEEuYRwJGACEgRg5L0rKYRwEjDU4jYE/wAGEOILBHM0a96PBBT/AAYQ8gGEcAvwCAAEBJXQgAzV0IAOVdCAAA2LgF/V0IABVeCAA9YggAACMQtANMAUakRhpGAkgQvGBHAL+RXQgAAIAAQC3p8EEbTAVGG0sIIJhHIEYaS5hHgCMAIiNgY2ggRkPwAQNjYGNoEUZD8BADY2BjaBNPI/CAA2NguEcBIiBGACEQS5hHKEYQSRBLmEcCRgAhIEYPS9KymEcBIw5OI2BP8ABhDiCwRzNGvejwQU/wAGEPIBhHAIAAQP1hCABJXQgAzV0IAOVdCAAA2LgF/V0IABVeCAA9YggAELUIIAZLmEcCIAZLmEe96BBAT/SAYQRKBEgFSxhHAL/hYQgAlVoIAPECCABAFQAgRWEIAAAjELQDTAFGpEYaRgJIELxgRwC/kV0IAACAAEAQtQIgBEuYR73oEEBP9IBhAkoDSANLGEeVWggAJS0IACwcACBFYQgAcLVfTV9OrHhfSzRwmEdjHiErEtjf6APwcS8vERFAERERRhERERERh2ODIykjKR4ZHhkZGUgREVpnTMkkAiJTSVNLTHAagAEgcL0gRlFLmEcBIHC9IEZQS5hHASBwvSBGTklPS5hHASBwvSBGS0lNS5hHASBwvatoAiwdeGLQAiJDTElLKEYigJhHwwdr1MAiPksBIFpwcL2raERKG2gAKxNgS9sAJMnnQUuYRwEgcL1riOqIGQoC6xMjs/WAfxrcNkuqgQtEq2ABIHC9ACIwSy5IGYioYKmBGoABIHC9NUuYRwEgcL1riOqIGAoC6xMjs/WAfxvdACBwvQAhDSIQIC1LLkyogXFwsnAHyxt4xvgDAK5gYWCiYCNzASBwvShLmEcBIHC9J0uYRwEgcL0bTKloJUsgRJhHASBwvQEiI0sacK/nEkpeeChGF0sUgJhHggec1QAkDUooRjFGHEtUcJhHASBwvQAiCE4oRnJwGUuYRwJGASAjiLJwA0QjgHC9kCQAIGwaACApHggASBoAIGgaACC1GQgAURoIAEgZACBZFQgA0RcIANEGCABAGQAgrRoIAMEUCACI2wgAbxoAIAEZCAD5EggAnXEIAEQZACARBwgA8QYIAAZLA/EeARp4gkIE0AMzi0L50QAgcEdYeHBHAL+8AQAgBksD8R4BGniCQgTQAzOLQvnRACBwR5h4cEcAv7wBACAFSwPxHgwaeIJCA9ADM2NF+dFwR5lwcEe8AQAgELUETAYgoEcjRr3oEEAHIBhHAL9NXAgAELUGIARMoEcHIKBHvegQQB0gAksYRwC/TVwIAP1hCAAQtQYgA0uYR73oEEAdIAJLGEcAv2FcCADhYQgAwPMJAHC18LGw9QB/DtAVSxt4ASsB0AIrANBwvRJLByAbiNu5vehwQBBLGEcGIA9MDE2gRwcgoEcreAEr69EHIKBHK3jn5wdMBiAJTahHI3gBK+DRByCoRyN43OcES73ocEAYRzIhACAwIQAgTVwIAGFcCAD4tWsgD0ygRw9LEE4faBBNR/APB/iyoEfH8wcgoEfH8wdAoEc4DqBHAeADBgfVICCgR7BHK2gAK/fRGEb4vQEg+L0Av2kRCADcAQAglREIAJgbACAt6fBHI0uCsJhHI03BIKhHWSCoR8IgqEcCIKhH4CCoR0/wEgpP8IkJT/CrCG9GDfEHBE/wRQzNINghiCL/IyZGjfgAoI34AZCN+AKAjfgDwI34BACN+AUQjfgGII34BzAgeKhHvkIE8f804tELTgxMAeCDBwnUgCCoR7BHI2gAK/fRGEYCsL3o8IcBIAKwvejwhwC/ZRIIAGkRCACVEQgAmBsAIHC1DkwOTQ9OAeCDBwjUgCCgR6hHM2gAK/fRAeAzaEOxwSCgRwAgoEeBIKBHqEcAKPTRBUu96HBAGEcAv2kRCACVEQgAmBsAIOkQCAAt6fhP3/jsoDtMgUZrIA9GkEagR9r4ADA4TkPwDwtf+ovwoEfL8wcgoEfL8wdAoEdP6htgMk2gRwHgAwYI1SAgoEewRytoACv30RhGvej4j0wgoEfa+AAwQ/AKCl/6ivCgR8rzByCgR8rzB0CgR0/qGmCgR0MgoEe48QEPJNlrIKBHX/qJ8KBHyfMHIKBHyfMHQKBHT+oZYKBHoCCgRwjx/zDAsqBHJCC4RKBHBOCwRwf4AQtHRRfQKGgAKPfRADgYvwEgvej4jwwgoEdf+onwoEfJ8wcgoEfJ8wdAoEdP6hlgoEewRzhwKGgAOBi/ASDo5wC/3AEAIGkRCACVEQgAmBsAIC3p+E/f+JCgJEyBRmsgD0aQRqBH2vgAMCFOQ/APC1/6i/CgR8vzByCgR8vzB0CgR0/qG2AbTaBHAeADBgjVICCgR7BHK2gAK/fRGEa96PiPTCCgR9r4AFBF8AoF6LKgR8XzByCgR8XzB0CgRygOoEdIRqBHTCCgR/iyoEfH8wcgoEfH8wdAoEc4DqBHQEagRwEgvej4jwC/3AEAIGkRCACVEQgAmBsAIC3p+E+QRtoHHEaBRgudvfgwYAfUAC470aMHDNQBJCBGvej4j0pLD0aYRwAoZ9EAJCBGvej4j0ZLmEcERgAo9tBETUwgqEdESx5oRvAKBvCyqEfG8wcgqEfG8wdAqEcwDqhHQEaoR0wgqEcKm9iyqEcKm8PzByCoRwqbw/MHQKhHCpsYDqhHACCoRyBGvej4jy9LmEcAKMrQLk9MILhHLksbaEPwCgpf+orwuEfK8wcguEfK8wdAuEdP6hpguEdIRrhHayC4Rwqb2LK4Rwqbw/MHILhHCpvD8wdAuEcKmxgOuEegILhHcB7AsrhHZCAuRLhHFfgBC7hHtUL60Yzn3/hUoEwg0EcUSxpoQvAKC1/6i/DQR8vzByDQR8vzB0DQR0/qG2DQRzhG0EdMINBHCksfaEfwCwf4stBHx/MHINBHx/MHQNBHOA7QRwEg0Edh5/UHCABpEQgA3AEAIC3p+EPf+LiBBkYNRsBHACgz0EAuB0YA8LiAMC5pTDDQTCCgR2hLG2hD8AoIX/qI8KBHyPMHIKBHyPMHQKBHT+oYYKBHMEagR0wgoEfosqBHxfMHIKBHxfMHQKBHKA6gRwAgoEdZTlpNAeCDBwbUgCCgR7BHK2gAK/fRACc4Rr3o+INRTkwgoEczaEPwCglf+onwoEfJ8wcgoEfJ8wdAoEdP6hlgoEc2IKBHTCCgRzNoQ/ALCV/6ifCgR8nzByCgR8nzB0CgR0/qGWCgRwEgoEfARwAo0dBMIKBHM2hD8AoIX/qI8KBHyPMHIKBHyPMHQKBHT+oYYKBHMyCgR2sgoEfosqBHxfMHIKBHxfMHQKBH3/jAgCgOoEegIKBHuPgAAAE4wLKgR2QgoEe4+AAwS7EAJQAgoEdrHLj4ABDaspFCFUb22EwgoEc1aEXwCgXosqBHxfMHIKBHxfMHQKBHKA6gRzAgoEdMIKBHNWhF8AsF6LKgR8XzByCgR8XzB0CgRygOoEcBIKBHbOff+DyADUxMIKBH2PgAUEXwCgXosqBHxfMHIKBHxfMHQKBHKA6gRzBGoEdMIKBH2PgAUNbnAL/1BwgAaREIANwBACCVEQgAmBsAINoBACDwtX9Mf01hiIWwyrJTHipwISsp2N/oA/A3QEhfEYeKKCgoKCgoKCgoKCgoKCgoKCgoKCgoKCgonastc0uYR0/wAAyjaHFNs/gFINP4AQCy9YB/KL9P9IBybUluS4X4AMCYRwi5AyMrcGtLmEcAIAWw8L3iiAsKAusRIbH1gH9A85qAACDz52BLmEdkS5hHX0uA8AEAGHDn51tLmEdgS5hHACJaSxpw3+dXS5hHACCjiVZNBCsocGfZomgTeNL4ARABO9uyByucv1ZK0FxWS5hHACjJ0cbnTEuYR+OIACIHK5i/ASNJTaRoKnCYvytwI3jU+AJgATvbsgUrSNkuIiYhIyC0+AbAY3i89YB/ZEYov0/0gHQClD5MAJYBlENMoEcAKKHRnuc4S5hHnec2S5hHACOiiTVNASorcCXZoWgLeAE7Bysg2N/oA/BTTEhEHx8fPTdLAyIbaCxJs/qD8wl4WwkBIKVgaXCigatwf+fjiA0KA+sRIbH1gH+C3CRKASAqRKJgo4Fy5wEjK3Bs5ylJKUrPXClJ0lzIXClJyVwAL6/RG0sQRjFGGngmS5hHACh/9FqvVucWSKFoGEQiTKBHASBU5wQq39nR+AEAH0uYR0rnH0tKeBpwRuceS0p4GnBC5wIq0NCx+AEgG0sagDvnBCrJ2dH4ASAYSxpgNOcAv5AkACCQGgAgKR4IAIwaACCUGgAgOQkIAHEeCABJCAgA7QgIAKDbCABBDAgA5QoIAJgbACCY2wgAqNsIALDbCAC42wgAPQoIAJ1xCAC5HQgA4QEAIOABACDaAQAg3AEAIDi1FEwUTQHgK2gbsRggoEcAKPnREE0B4CtoG7EYIKBHACj50AxNAeAraBuxGCCgRwAo+dEJSApLmEcISAlLmEcJS0/wAGEUIJhHASIHSxpwOL0Av8VhCACYGwAgAEAJQElGCAAxRggAPWIIAJQbACBwtRdOM3i7uRZNF0wXSxhImEcXSKhHT/AgURggoEdP8CBRFSCgR0/wIFEUIKBHvehwQA4gD0sYRw9NDUwgRqhHACj70ApIB02oRwxLCEiYRwVMT/AgURQgoEcAIzNw1eeUGwAgOUYIAD1iCABJRggAAEAJQGVgCABhRggAQUYIABC1BksERht4K7EhRr3oEEADSARLGEcES5hH9ueUGwAgAEAJQGlGCAB5EAgAcLUTToKwM3hzuRJNEkwTTgHgM2gjsSBGAamoRwEo+NCd+AQAArBwvQ1NC0wgRqhHACj70AhIC0uYRwdICkuYRwpLT/AgURQgmEcAIzNw3OeUGwAgeUYIAABACUCYGwAgYUYIADlGCABBRggAPWIIAHC1E0sbeAOzDCYSTBJNAeAraEOxGCCgRwAo+dEYIKBHULkraEOxGCCgRwAo+dAYIKBHKLEraBuxGCCgRwAo+dEBPhbw/wbl0XC9BEuYR9vnlBsAIMVhCACYGwAgeRAIAPC1ACUZSoewGUsOIBVwGUyYR0/wQFEUIKBHT/AgURUgoEdP8EBRGCCgRxNPQPJXELhHEksUIJhHRSC4R8AjT/QAVw9KaUaN6CwAzekEVQ1KDUsOSA5OA5eYR0/wgFEYIKBHsEewRwew8L0Av5QbACBBYAgAPWIIAJEAACDhYQgAIKEHAACwcQutRQgAAEAJQAUSCABkS5qJCypA8JGALenwT42wDfEkCUpGT/AADpto3/h4wRhoWWhceAPCH4meep14k/gEgAKUF4DceJZwWnmbecz4AOAEkgOTAC1A8JOAU0uYR1NLASCYRwKbACt40WMeX/qD+wAsV9BD8q9lTkxD8rBiqPsEMVgZTE5P8AADQfEAAbBHA0YCmgGTovsEQWAZQ/KwYk/wAANB8QABsEff+AyhBZBDSxtoACs10EJPQkwIrQ3xKwa48QAPOdEAIyBGGkYW+AEb0EcjaZsF/NUgRg3xHQIN8R4BuEed+B4wBfgBO6lF59EDmwArL9AwM2tEE/gRPASak0Io0ClLACCYRwKby7kBICZLmEcL8f87X/qL+7vx/w/F0cAkECACISdLKEpccBhwEYANsL3o8I9wRwGYJEuYR8HnBZ0iTChGoEcBIBdLmEcoRqBH3ucAJOTnQ/KvYAKaE0sUTaL7AzEYGEPysGJP8AADQfEAAahHFUuYR3TnQ/KvYAtLQ/KwYqX7A1MoGEPxAAEITQAjqEcNS5hHXOcAv5AkACBAGQAg6RoIAK0bCAAA2LgFJW4IAJFdCACYGwAgYV0IAACAAEBIGgAgaBoAIJEAACA4tR1LmokCKhPRm2gciBTw/wEg0QAgGUuYRxlLmEckCgjRESQAIAIhFksXShxwWHARgDi9Q/KvYBRJQ/KwYqT7AUEgGE/wAAMRTUHxAAGoRxBLmEfl50Pyr2MMSEPysGKh+wABwBgKTU/wAANB8QABqEcIS5hHzeeQJAAgrRsIAJkbCABIGgAgaBoAIADYuAUlbggAkQAAIJRLmokJKgDQcEct6fBPmmiPsIBGi0YQaFFoC6sDw734LBASibH1gH8EkRqAAPLOgLjxEw8Mv534MzCd+DQwhk8FkztoCZMEmwArAPD6gAAkzfgMsKNGnfguMIBOA/ABAgiTf01bsgeSBpMDmn1LEvgBqxt4A5IAK3TRACOd+DCQGkZJRihGsEcAI3l4GkYoRrBHACM5eBpGKEawRwAjUUYoRhpGsEe48RMPBL+J8AgJjfgwkLvxAA8y0QWbU0Vs0BTwAQOd+DIgAtC48RMPUNAHmALw9wI5iI34MiAAKGfQi0bd+BiQACsw0DtouPETDwPxAQM7YEnQBJsBNKSyo0Kz0V5GACC58QAPY9sCIVZLVkqD+ACAWHARgA+wvejwjweb07nd+BiQCJid+DIgAJJZRgWanfgvMN/4NKHQRwAoRtEE8AEDg0YAK87RuPEVD9LRO2gBMztgzufd+BiQBPABA8DnQ0uYR0/wAAI9Sxpwg+c7aAeYQvAIAo34MiCZsrCxi0YBM934GJA7YJuyACuy0QEjM0oTcK7nB5sAK9zRnfgyIAiYAQcJ1d34GJC+5wAp99CLRt34GJAImLfnBpsD8PkAmUZA8AIAsOfAIJ3nXkaY5wAjIUwaRp34MRAgSKBHACMJnRpGxfMHIRxIoEcAI+myGkYaSKBHACMYSBpGGUagRwibmwYF1Sa5CfDPCUnwEAMIk534MjAxRgCTBZoImJ34LzASTKBHuPETD3/0ba87iAArf/RprwEiCUsacGTnBJid+C4wBkad+S6QCJNZ5wC/kCQAIEAZACCRXQgAAIAAQEQZACBIGgAgaBoAIK0cCABpHAgAQkuaiQMqctEt6fBPg0bAIAIim2g+TBtohbADk2Bwm7I8SLP1gH+E+ACwAZMCgFvYACtT0E/wAAg3TcFGN044TE8eFeAZ8AEPUtAzaLvxFg8D8QEDM2AE0JuyE7kBIzFKE3ABmwjxAQgf+oj5mUU10ixLG3gAK0LRACOd+A6gGkZRRiBGqEcAI3F4GkYgRqhHACMxeBpGIEaoRwAjIEYaRhlGqEcjaZsF/NUfSyBGDfEJAg3xCgGYR534CjC78RQPB/gBP77RivAIChnwAQ+N+A6gxtAzaAEzM2C95wAiAiMLSUpwC0oTgAWwvejwj3BHu/EWD7XRM2gBMzNgsecLS5hHT/AAAgdLGnC155AkACBIGgAgaBoAIJFdCABAGQAgAIAAQEQZACBhXQgAaRwIACNLmokGKivRLenwQ5tog7AYaJqIk/gAgJP4AZAdTx5ODfECBACQrfgEIA3xBgUAIxT4ARswRhpGuEesQvfRufEADw7RuPEADw/REiACIRNLE0qD+AGAGHARgAOwvejwg3BHEEuYR4BG7+dD8q9jDkhD8rBiqPsAAcAYDExP8AADQfEAAaBHCkvIRphH3ecAv5AkACCRXQgAAIAAQEgaACBoGgAg8RsIAADYuAUlbggAkQAAICBLmokFKjzRLenwT5tohbAHRhp5GGgN8QgIk/gAsN/4aKDf+GiQGkwCkA3xCQaI+AQgAa0AIyBGGkYW+AEb0EcjaZsF/NUgRg3xAQIN8QIByEed+AIwBfgBO0VF6tEAIgQgC/EQAw3rAwsb+A0cCUuZcAlJH3BacNpwCIAFsL3o8I9wR5AkACCRXQgAYV0IAACAAEBIGgAgaBoAIBFLmokEKh3RLenwQYBGm2iCsBtoDU4OTQKvAZMBrAAjFPgBGyhGGkawR7xC99EAIAIhCEsISoP4AIBYcBGAArC96PCBcEcAv5AkACCRXQgAAIAAQEgaACBoGgAgcEcAvwC5cEdD8q9sCEkQtaD7AQEQ6wwAT/AAAwVMQ/KwYkHxAAGgR73oEEACSxhHANi4BSVuCACRAAAgcLUhS5ggmEcBRiBMIEogRiBLUvghUJhHgCMjYGNoKEZD8AEDY2BjaBtJQ/AQA2NgY2gaSiPwgANjYJBHBUYAIgAtuL//JSBGEUYVS5hHIEYBIgAhE0uYR+qyIEYAIRJLmEcBIxFOI2BP8ABhDiCwR0/wAGENILBHM0a96HBAT/AAYQ8gGEcAv/EGCAAAgABA5AEAIEldCAAA2LgF/V0IAM1dCADlXQgAFV4IAD1iCAACIgJIAksCYBhHAL8AgABAVV0IAHCxELULS0/wYFERIJhHniAJS5hHSLm96BBAESAHSxhHT/AgUREgA0sYRxEgvegQQANLGEc9YggA8QYIAOFhCAD9YQgA8LUZTRlPGk4aTIOwAOA7swAj8CEaRiBGqEcAIyBGGkYZRqhHACMgRhpGGUaoRwAjIEYaRhlGqEcjaZsF/NUgRg3xBQIN8QYBuEed+AYAM2gQ8AEA29EAKwi/gSADsPC9gSADsPC9AL+RXQgAYV0IAJgbACAAgABAACNwtQxNDUwaRk0hKEagRwAjKEYaRhlGoEcAIwhKKEaReBpGoEcAIyhGpEa96HBAGkYZRmBHAL8AgABAkV0IAEAZACAt6fBPAPB+BIOwICyd+DCQHtwBLBXdAjyQRh4sEdjf6ATwWRAhEBAQGRAQEBAQEBBZEBAQEBAQEBAQEBAQEBAQIQAAIGQjK087YAOwvejwj0As9tEoS5hHZCMmTztgA7C96PCPJU3f+JigIk8lTE/qESvOsh/6ifkB4AArNNAAI0lGGkYgRqhHACNZRhpGIEaoRwAjMUYaRiBGqEcAIyBGGkYZRqhHI2mbBfzVIEYN8QUCDfEGAdBHnfgGMJhFO2jb0AArFL8AIIAgZCM7YAOwvejwjxhGDEuYRwAgZCMFTztgA7C96PCPgCBkIztgA7C96PCPmBsAIPEbCACRXQgAYV0IAACAAECxGggAAUsYYHBHAL90BAAg+LUQJU/0gAYPSxYgmEcPTA9LTPIBAsP4gGEAIYP4FlMgRh5gC0+4RwAhIEZP9JZSCUuYRypGCUsAISBGmEcBIgdLGnD4vQC/QWAIAAAACEAA4QDgdVwIAKVcCACtXAgAnBsAIBC1CksbeGuxACEJSAlLmEcJSwpKG2gAIRNgBUgIS73oEEAYRwdLmEfu5wC/nBsAIAAACECdXAgAdAQAIJgbACCVXAgAxR0IAAAhAUgBSxhHAAAIQJ1cCAAEShNoC7EBOxNgACECSANLGEcAv5gbACAAAAhAtVwIAAAjQ2ADYINgcEcAvxC0BGgBNMgsKL8AJADgQrFDaKNC+9ADaANEGXMEYBC8cEeDaBC8ATODYHBHQ2gBaAJGmUIYRAB7BdABM8grKL8AI1NgcEf/IHBHAL8DaEBowBoYvwEgcEcDaEBoGBpIv8gwcEcCSgNLUIgA8H8AGEeQJAAgEVUIABVLG2gbaBp5gkIi2TC0E0wjYLP4AsCcRGNFF9IAJQTgGngBJRNEnEUM2Vp4BCr30Zp4gkL00dp4ikLx0QWxI2ABIAHgACAjYDC8cEcAIDC8cEcAIHBHAL+kGwAgqBsAIC3p8EEcTCN4e7MAIRtOBUawR1Cz3/hogNj4ADBbaFP4JXD7aJhHI3gBRvOxKEawRwVG0LETSxROHGjY+AAgI3gSaBxEU4gaRKJCBtgI4AUrD9AjeBxEokIC2WN4BCv20XtomEcoRr3o8IEAJShGvejwgaB4sEfg56MbACAlHwgApBsAIKgbACB1VQgAGEsbeFuzLenwQRdLBUaYRxCzFksWThxoFk8xaCN4CmgcRFOIGkSiQgbYCOAFKw3QI3gcRKJCAtljeAQr9tFLaFP4JTC96PBBG2gYR6KI4XigeLhHACjg0QAgvejwgQAgcEcAv6MbACAlHwgAqBsAIKQbACBFWAgAAUsYaHBHAL+oGwAgAEsYR8lTCAD4tQ1PDUuYRzt4e7EMTStoG2gbeVOxACQgRgpOsEcraAE0G2jgsht5g0L32AAjBko7cBOA+L0Av6MbACBdUggApBsAIIUfCACeGwAg+LUMTzt4e7ELTStoG2gbeVOxACQgRglOsEcraAE0G2jgsht5g0L32AAjBUo7cBOA+L0Av6MbACCkGwAghR8IAJ4bACA4tQxLG3ibsQtNK2gaaBJ5crEAJCJGW2gBNFP4IjAbaQOxmEcraOKyGWgJeZFC8tg4vQC/oxsAIKQbACAAIy3p8EeRTCKIxOkEM7L14H+jgQDw0oCU+QAgI3gAKg7bE/BgD3nQE/AeD0DQA/AfAwIrAPC4gAAlKEa96PCH5YgALfjQE/BgD+3RE/AfAgDwc4EBKkDwxYBieAoqJNEBLSLRekoSePqxekomeRdoOmgSebJCGNkAITBGdkuYRwVGACgA8NGAe2hT+CYw22iYRwJGcUgBIXFLAnCYR8znASoA8FuBAipu0BPwHg/D0aOIZ04CKwS/ASOjgDN4ACu60GRPlPgEgD1oK2gbeZhFQNMieALwHwICKq3RACur0AAkoEbf+HCRa2gBNFP4KFDraJhHM3gBRgArndBARl/6hPjIRwAol9CraJhHACg50T1oK2gbeUNF5tiN5xPwHwK+0WJ4AToIKr/YAaFR+CLwlyMIABMiCABzIwgAEyIIAJMkCAATIggAEyIIABMiCADlIwgAACFARj9PuEcAKD/Qa2hT+ChQ62iYRzN4AUYAKz/0Yq9ARrhHACgx0KtomEcAKC3QASVY52J4ASoA8AOBAyoG0eKIYYgKQ5KyACoA8M2BE/AeD4PQKU4zeAArP/RDryhPPWgraBt5j+cpS5hHAkYAKgy/TSJXIgElJkhP9KVxgPi2ICJLmEcoRr3o8IcjeCTnAip/9GCvYngAKtjRAi3W0SB5HUuYRwJGHEgpRhdLASUCgJhHF+fiiAAqf/RMr2KIAip/9EivFkuYRwVGGLEjeQArAPC+gSN4/ObiiAAqf/Q6r2WIAS1/9DavDkoTiCPwAgMTgPfmAL+QJAAgoxsAIKQbACAlHwgAohsAIGlVCACROwgAnAQAIMVVCACgGwAgAVUIAJ4bACDiiAAqf/QTr5xLmEcAKM7Q3/hskshH3/hsoqN4ACgA8CWB2vgIIFJ8mkLA05ZOM3iDsZZPO2gbaBt5W7EAJShG3/hMgsBHO2gBNRto6LIbeYNC99gAIo9LGoCjeDNwACs/9FKvyEcyeAAoAPAzgdr4EDAC8QBSAToD68IDGmiDTxJ5O2AAKj/0P68AJYJOK0YF4DpoEmgSeZpCf/Y1rxhGACGwRwE167IAKPLRf+fiiAAqf/S8rnlLASUjYX/mYngGKkDQCCo20AAqf/SwrgItf/StrilGb0hxS5hHASVu5mJ4Cyp/9KOu4ogAKn/0n65lShJ4ACo/9JquJXlkSyhGZoiYRwAoP/RSryhGYkvxsphHACh/9PiuSefiiGGICkOSsgAqf/T/riB5XkuYRwAof/TqrjvnAS1/9HmuKUZSSFdLmEc75mGICgoBOs2yDio/9iyuAaFR+CLwAL/1JQgAyyUIAAkmCACRIQgAkSEIAL8lCACVJQgAkSEIAJEhCACRIQgAkSEIAJEhCACRIQgAkSEIAH0lCAAhIUNIQEuYR+OIoomaQn/2r64BJaOBBuYzS5hHM0sAKEDwlICaaFJ8qkJ/9vSuGmk1S1L4NQBBiJhHByKjaFpw4ucqSjBL0GgBeJhH3OcmS5hHJksAKADwkICaaFJ8qkJ/9tmuGmkoS1L4NQBBiJhHAiKjaFpwx+cbS5hHAChx0RpKIUuQaAF4mEe95wMtP/bBrd/oBfAaFxQCICEdSx5OXRgyRhP4AQurQiL4Ag/50UkAAjEYSBRLMXCYR6TnEiEWS+znFSEWS+nnBCEVSA5LmEeZ59r4ACBSfJpCv/TarpnmAL85VQgAAVUIAJAJACCjGwAgpBsAIIUfCACeGwAgESAIABEfCABpVQgAoVYIAHgEACCUAQAg6AUAIEgGACAwBgAgLAYAICB5MkuYRyB5MUuYRwAof/Qbrmzm2vgEMALxAFIBOgPrwgPL5hpoUnyqQn/2YK5aaChLUvg1AEGImEdq5xAgAiElSyRNGmiQcNFwGGgBeKhHRucaaFJ8qkJ/9kmuWmgdS1L4NQBBiJhHbuccTjJ4krEbTzpoEmgSeWqxmUYYRt/4ZIDARztoCfEBCRtoX/qJ8Bt5g0L12AAio4gTSRsKATsKgDJwAys/9iKu3+gD8AsIBQIOSyNhIuUNSyNhH+UNSyNhHOUMSyNhGeUAv5VaCAD5VQgAaVUIAJAJACCjGwAgpBsAIIUfCACeGwAgYVsIAElbCAAlWwgAAVsIAAdJCngPKgHZACBwRwNGELRQHARMCHBE+CIwASAQvHBHbCAAICwgACAHSQp4DyoB2QAgcEcDRhC0UBwETAhwRPgiMAEgELxwR20gACBwIAAgAEsYR0UHCAAASxhHZQcIAAVLG3gDuXBHELUES5hHvegQQANLGEcAv1sGACBJVQgAgQcIADi1ASQETU/0gGEESgRLBUgscJhHIEY4vVsGACAlLQgARWEIACwcACAAIgFLGnBwR1sGACA4tQ9LD0rZiA9IgCkov4AhEniYYJmBirEMTFUe7bJTGyUfBeuDBQTrggQB4KxCBdBU+AQ9mEcAKPjQOL0AIDi9kCQAIG0gACCsGwAgcCAAIDi1C0saeIqxCkxVHu2yUxslHwXrgwUE64IEAeCsQgXQVPgEPZhHACj40Di9ACA4vWwgACAsIAAgBEtaeCIqA78DSgEgGmEAIHBHAL+QJAAg/SgIABC1K0taiNOyATsSKw7Y3+gD8A4aHw0NDQ0NDQ0NDQ0NDTRBRQoAACIiSxqAEL0+ICFLmEchTKBHACj80L3oEEAQIB9LGEcQIL3oEEAdSxhHHSAdS5hHASIMIRxLHEiYRxxLmEccSlNomQP81BNoQ/AlQ0PwBQMTYP7nFkuYRxZKU2ibA/zUE2hD8CVDQ/AFAxNg/ucRS73oEEAYRxBLEgoacAAqwtG96BBAByANSxhHkCQAIDAhACClXwgAyV8IAO1eCABJXwgA/WEIAGVhCAAACA5AjVQIAAASDkCtAggAMiEAIE1cCAA4tRxMY3giKwXQQCsa0BcrDdAAIDi9AyIXSBhJGEsAiAl4GICZcAEgo2CigTi9T/SCRQAhAyISSwEgHYCZcKNgooE4vU/wIAwNTQ5LNyKT6AMAhfgIwIXoAwALSwtJBfEJAJhHKEYKS6VgmEcDRgEgo4E4vZAkACAwIQAgMiEAILAgACDM2wgAzXMIAMDbCABxcwgAELUESwRImEe96BBAA0gESxhHAL+hJwgA5SkIAOEoCADJJwgAHEqTeKA7EisO2N/oA/AOFhgNDQ0NDQ0NDQ0NDQ0NGi4KAAAiFEsacHBH04gEKwq/EksTSBhoE0sYRxNLGEcTSxhHELXTiE/wYFEEKwq/C0sLTBxoESAOS5hHESANS5hHIEa96BBADEsYRxQiAksacHBHAL+QJAAgMyEAIKwbACCAlpgA6QMIAIEECADRBAgAPWIIAOFhCAA9AwgAACEQtRtMHEpjeBFwEDsGKwXY3+gD8AoTHCUEBAYAACAQvRZLASAjYRC9BiAUS5hHACj00BNLASAjYRC9BiAQS5hHACjr0BBLASAjYRC9BiALS5hHACji0AxLASAjYRC9BiAHS5hHACjZ0AlLASAjYRC9AL+QJAAgMyEAIJ0qCAB9AggAZSwIAKksCADNKwgAESwIAHC1CksKStPpAFaQRwlMBSCgRwAo+9AISzBGmEdP8MBCBksHSRpgDWBwvQC/rBsAIK0CCAB9AggAxQIIADQhACA4IQAgLenwQQ1LDk7T6QBHsEcNTQEgqEcAKPvQOEYLS5hHTLEAIwpKCk0paBL4AQ/IVAEznEL40TNGvejwQRhHrBsAIK0CCAB9AggAxQIIALMbACC4AQAgcLUKSwpK0+kAVpBHCUwCIKBHACj70DBGB0uYRylGvehwQE/wwEAFSgVLGEesGwAgrQIIAH0CCADFAggA+SwIACVhCABwtQtKC0tVaJhHC0wEIKBHACj70ChGCUuYRwIgCEuYR73ocEBP9IBhBkoHSAdLGEesGwAgrQIIAH0CCADFAggAlVoIACUtCAAsHAAgRWEIABC1BEYGS5hHBLEQvQVLmEcCKPrRIEa96BBAA0sYRwC/rQIIALkCCAB9AggAcLUFRhxODEawRz27G0sbeKu5RLEaShtNKWgS+AELyFQBM5xC+NEYS5hHBCgi0L3ocEBP9IBhFUoRSBVLGEcKKw3QFCvz0QAs8dANTRFOLEQV+AELsEelQvrR6OdwvQAs5dAHTQxOLEQV+AELsEelQvrR3OewR9rnrQIIADMhACAsHAAguAEAILkCCAAlLQgARWEIAM0DCAC1BAgAELUTTGN4EisW0BUrEtERSwogmEcAIQJGUhoYvwEiT/AEDA1LASBZcFmAGnCjYKT4DMAQvQAgEL0AIQhLCEgaaABoooEHSqBgGWCQRwEgEL2QJAAgxWEIALAgACA4IQAgNCEAIK0CCAAQtQVLmEcFSwVImEe96BBABEgFSxhHAL+tAggAoScIAMEtCAA5KwgAyScIABdKU3gaOxsrD9jf6APwFBgODg4OHCAODg4ODg4ODg4ODg4ODg4kDg4OEAAgcEcNSwEgE2FwRwxLASATYXBHC0sBIBNhcEcKSwEgE2FwRwlLASATYXBHCEsBIBNhcEcAv5AkACAdMAgA3TQIAHk0CADRLggA2S4IAOEuCAAASxhHGQ4IAABLGEf5BAgABEsFSZP4nCJJiGHzwwKD+JwicEdcBgAgkCQAIC3p8EEGRg4gYbMbT7hH3/hsgE/wYFEOIMBHGU0PIKhHdB5P8EBRDyDAR+SyfrESTxRODyCoRwEgsEcPILhHATwBILBH5LIPIKhH/yzx0U/wAGEOIMBHQ0a96PBBT/AAYQ8gGEcGTahH3/gQgE/wQFEOIMBH0ucAv+FhCAA9YggA/WEIAJEAACAt6fBBHEwGRhxLIEaYR4AjACIjYGNoIEZD8AEDY2BjaBFGQ/AQA2NgY2gVTyPwgANjYLhHASIgRgAhEkuYRzBGEUkSS5hHAkYAISBG0rIQS5hHASMPTSNgT/AAYQ4gqEdP8ABhDyCoRytGvejwQU/wAGENIBhHAL8AgABASV0IAM1dCADlXQgAANi4Bf1dCAAVXggAPWIIAC3p8EM1TIOwY4igOwgrCdjf6APwCwgICBY7RlEFAOOIAitQ0AOwvejwg+OIBCsKvytLLEgYaCxLA7C96PBDGEfjiKKJmkLt0wE7Pyvq2AAlJk/f+JyQ3/icgCdOACOiaDBGUV0aRq34BhDIRzBGDfEFAg3xBgHAR534BjABNQf4ATvjiKtC6dzM50/wQFEbSxEgmEcRIBpLA7C96PBDGEdP8GBRFUsRIJhHESAVSwOwvejwQxhHT/AgUREgD0sDsL3o8EMYR6NoD0pZeBh4ADkYvwEhA7C96PBDEEeQJAAgrBsAIKCGAQCFLwgAQCEAIJFdCABhXQgAAIAAQD1iCAD9YQgA4WEIAP0uCAAt6fBBHksERgBomEfBBwVGA9SrBxjUvejwgSBGUPgcOwAinmkXT/ayMUa4R5T4nDJaBx/UY2oAK+vQE0oTiEPwAQMTgKsH5tUE8fAFKEYPS5hHSLEoRg5LJGiYRw1LAUYgRr3o8EEYRyBoAiG96PBBCUsYRwAiMUYE9eJwuEfZ511GCACtHggAMCEAIPkeCADZHggAaUYIAFVGCAABSAJLGEcAv1wGACApMQgAcLUfS1iIBAoB0AAgcL0UKAfQGCgb0KDxEACw+oDwQAlwvdqIAyrw2QQhFk4WTRdKBvEcAJ1gmYGQRwFGFEoBIBOIdGIj8AEDE4ApYHC92ogDKgHYIEZwvQQhCk4KTQtKBvHwAJ1gmYGQRwFGCEoBIBOIxvj4QCPwAgMTgClgcL2QJAAgXAYAILAgACAFHwgAMCEAIDi1ASoERp34EFBBYA7QAioI0AAiAmEBOwMrY9jf6APwMlVYCk/0AFICYfTnT/SAUgJh8OdP9IBj42AGLSfQBy1N0AUtSNDAI6NgACLU+JgyYmEjs5T4nDIkTUPwAgOE+JwyBPHwAKhHBPEcAKhHBPXicKhHIUYeSh5LUfgEC5hHASA4vU/0AHMGLeNg19FAIwAio2DU+JgyYmEAK9rRFksNIJhHFU1P8ABhEyCoR0/wAGESIKhHT/QAUjAhEEvD+IAhg/gNExpgxOcAI+NgtOdP9MBj42Cw5wAjo2C154Ajo2Cy50/0AGPjYKbnoR4IAADYuAU1RQgAQWAIAD1iCAAA4QDgcLU2TIKwY4gaCgHQArBwvRErJdASKxXQECv30eOIByv00S9LoWjT+JgyDWgAKz7QiHlLeQp5K0wAkClGKEigRwKwcL0mTChLIGiYRyBoJ0uYRwMhIGgmSwKwvehwQBhHH0zU+JgyY7EgaCJLmEcgaCFLmEcBISBoIEsCsL3ocEAYRx9LDSCYRx5NT/AAYRMgqEdP8ABhEiCoR0/0AFIwIRlLw/iAIYP4DRMaYNznFEsNIJhHE05P8ABhEyCwR0/wAGESILBHT/QAUjAgDkuhaMP4gCGD+A0DGmCp55AkACBcBgAgaTIIAElGCAA5RggAVUYIAEFGCAAxRggAUUYIAEFgCAA9YggAAOEA4ABLGEdtMwgAcLUERgDx8AUAIihGDUuYRyBoDUuYR4IHANVwvQtLIGiYR4MHBdQgaAIhvehwQAhLGEcoRgdLJWiYRwdLAUYoRphH8OetHggAWUYIAF1GCABRRggA2R4IAGlGCAD4tQ9NbIgkCgDQ+L3riKqJmkL600uxC08LTqtoMEYZXbhH64gBNKNC99wHS9P4+DAAK+rQBUoTiEPwAgMTgPi9kCQAIIE0CABcBgAgMCEAIC3p8EEBJBRNFE8VTgEsCdAELArRE0sUSJhHvejwQRNIE0sYR9X4mDITsQE05LLt5w0guEdP8ABhEyCwR0/wAGESILBHT/QAUjAhCkvD+IAhg/gNExpg6OdcBgAgQWAIAD1iCAChJwgA3TUIAFUuCADJJwgAAOEA4ApKT/AADNGICUsEKSi/BCGT+JwCB0vA88AAGHCTYAEgg/gBwKP4AsCRgXBHkCQAIFwGACCwIAAgLenwRyhNa3gaOxsrEtjf6APwDhwRERERKCAREREREREREREREREREREkERERFGuIGwoa0AAgvejwh+uIQCv52BpKASCqYKuB9ecZS73o8EcYRxhLvejwRxhHF0u96PBHGEcWS73o8EcYR+uIgCuZRii/T/CACZux3/hEgBFPREYRTgjrCQowRrhHBPgBC1RF+dEBIMX4CICl+AyQvejwh5lG3/gcgPTnkCQAIEAhACDVMQgA+QQIAKU1CAAZDggAsCAAINkeCAB4BgAgQLkISgEgkvicMkPwBAOC+JwycEcAIpL4nDJi84IDgvicMv/eXAYAIEi5CUsJSZP4nCIIcGDzggKD+JwicEcAIpL4nDJi84IDgvicMv/eAL9cBgAgPCEAIIC7ASEt6fBH3/hogBpKmPicMhFwA/AGAwYrAdC96PCH3/hYkMhHBUYAKPfQ3/hQoBROFU+19QB/KL9P9AB1ACAxRipGBEbQRzFdATRARqSyuEesQvjTACDIRwVGACjp0b3o8IcBIQAjA0oRcJP4nDL/3gC/XAYAIDwhACCVawgA3WsIAIAhACCBNAgAACgo0TC1FkyDsJT4nDJaBwLVS3kEKwHZA7AwvQNGinkQTVAfgAHAshpGCWgAkCBGqEcNSyBomEfDB+3UIGgLS5hHIGgKS5hHASEgaAlLA7C96DBAGEcAI5P4nDL/3gC/XAYAIGkyCABZRggAQUYIADFGCABRRggALenwRwEkE03f+EyAE08UTgEsA9AELAfRvejwh5X4nDID8AYDBisC0AE05LLw5wAgwEcAKPjQ3/gsoN/4LJAE4EhGuEcBRgAgsEdIRtBHACj20ennXAYAII1sCADZHggA/WwIAPkeCAAgCAAgOUtaeCIqFdCYiAEoENGgKiXQoSpZiBfQoiof0U/0gHwySqP4DMAKRCLwAwKaYHBHACBwR5p4QipM0JiIoPEBALD6gPBACXBHT/SAfChKo/gMwApEIvADAppgcEdwRwC1JEkjSpH4AOCx+QHAgvgA4E/wCw5f+oz8gvgBwLH5A8Bf+oz8gvgCwLH5BcCaYF/6jPyC+APAsfkHwF/6jPyC+ATAkfgKwIL4BcDR+AvAo/gM4F/6jPOTcUl6zPMHI9NxzPMHQ0/qHGwTcoL4CcCRcl34BPsBIgdIB0mAfJlgCHCagRBGcEcAv5AkACBAAAggAAAIIPwIACCwIAAgcLUxSoKwk3hCKxHQQysJ0JOIATubsgErB9hVeOWxASACsHC9U3giK/LRACACsHC9U3giK+zRASQkS5hHJEuYRyRLJUqcdJxykEdP8EBRESAiS5hHIEbj5yFMKUZAIiFIoEcpRkAiIEigR0AiKUYfSKBHH0wGIKBHhSCgRwEkF05P8CBRDSCwR0/wQFEOILBHT/BAUQ8gsEdP8EBRFCCwRwxKFElAIwCRBiApRtVyFXNVc5VzFXSUdJRyD00KSqhHIEYCsHC9AL+QJAAgnSAIAPltCAD8CAAglSAIAD1iCACJcggAAAAIIEAACCCQAAgglVoIAGk6CABtVwgAcLUlTIKw43s4u+uxACk50LT5A8C0+QEwIE2s6wMMH/qM/g/6jPwrGJP4kCAA6wwDATCAstKyK0SBQoP4QCDy2HFEpPgDEAHgpPgDEAAj43NjcKNwo3ICsHC9EU5TuRFNQCMAIRBKAJYGIKhHASOjcgKwcL1AIwAhDEoKTQCWBiCoR+3ntPkD4LT5ATCu6wMOH/qO/tTnAL/8CAAgAAAIIGk6CABtVwgAQAAIIJAACCAwtYOwSLsYTbX5BUC06wEODNADRhVKC0TTXADxAQzbshNUH/qM8HBFA0b002EaC7Kl+AUQQ7kCIQxKq3ETcKtyU3BpcQOwML0AIQlIAJAHSghMhSCgRwOwML0DSwAhBEiz+QUw8ucAv/wIACAAAAggGTsIAG1XCAABS5h8cEcAv/wIACBwtShMYnzU+CNQACo90ShGJUuYRwUeGL8BJQAjI0wjcCN4ASsG2CN4ATPbsiNwI3gBK/jZDyAeTrBHACMjcCN4ASsG2CN4ATPbsiNwI3gBK/jZACMjcCN4ASsG2CN4ATPbsiNwI3gBK/jZDyCwRwAjI3AjeAErBtgjeAEz27IjcCN4ASv42ShGcL0DRtsHTL8ISwlLKEaYR2N8ACu30AAlu+cAv/wIACDFYQgAgCMAIBliCADhYQgA/WEIAC3p8E+DsAApAPDfgE4e9rIHRk/wBwpP8AALbk1uTN/4vIHf+LyRxvEGBhLgT+pbC1OzyvEHAEf6APBqSwDwAQCYR0vqwBtf+ov7CvH/OlZFFtAreBPwCA8rfOfRACtg0Ef6CvBfSwDwAQCYRwD6CvAK8f86QOoLC1ZFX/qL++jRWEYDsL3o8I/K8QcCa3pH+gLyAvABAgArQNEOIAAqAPCRgFFLmEcAIyNwI3gBKwbYI3gBM9uyI3AjeAEr+NkPIMBHACMjcCN4ASsG2CN4ATPbsiNwI3gBK/jZDSDIRwAjI3DCGiN4GL8BIgErBtgjeAEz27IjcCN4ASv42Q8gAZLARwAjI3AjeAGaASsG2CN4ATPbsiNwI3gBK/jZS+rCG5Pna3pH+gryAvABAgArP9EOIAAqQ9AsS5hHACMjcCN4ASsG2CN4ATPbsiNwI3gBK/jZDyDARwAjI3AjeAErBtgjeAEz27IjcCN4ASv42Q0gyEcAIyNwwhojeBi/ASIBKwbYI3gBM9uyI3AjeAEr+NkPIAGSwEcAIyNwI3gBmgErBtgjeAEz27IjcCN4ASv42QL6CvJC6gsLX/qL+0XnC0uYR7rnCUuYR23ni0ZYRgOwvejwj/wIACCAIwAgGWIIAMVhCACdOwgA4WEIAP1hCAAt6fBPDEak8QcFtfqF9cMJFL9xS3FLgEaDsA4gbQmYR6xCQPLUgGMeACRbG8XxBgnbst/4rKFrT9/4rLFrTsXxBwWp6wMJmvgAIBEHZdXF8QcCSPoC8tIHTL9fS19LFCCYRxQguEcAIov4ACCb+AAgZAgBKgnYm/gAIAEy0rKL+AAgm/gAIAEq9dkPILBHACKL+AAgm/gAIAEqCdib+AAgATLSsov4ACCb+AAgASr12Q0guEcAIov4ACCBGpv4ACAYvwEhASoJ2Jv4ACABMtKyi/gAIJv4ACABKvXZDyABkbBHACKL+AAgm/gAIAGZASoJ2Jv4ACABMtKyi/gAIJv4ACABKvXZqUABPQxDqUXkspnRIEYDsL3o8I9I+gXy0wdMvy1LLUsUIJhHFCC4RwAii/gAIJv4ACABKgnYm/gAIAEy0rKL+AAgm/gAIAEq9dkPILBHACKL+AAgm/gAIAEqCdib+AAgATLSsov4ACCb+AAgASr12Q0guEcAIov4ACCBGpv4ACAYvwEhASoJ2Jv4ACABMtKyi/gAIJv4ACABKvXZDyABkbBHACKL+AAgm/gAIAGZASqm2Jv4ACABMtKyi/gAIJv4ACABKvXZm+cAJCBGA7C96PCP4WEIAP1hCAD8CAAgxWEIAIAjACAZYggAMLVXTIOwtPkHMLT5ARBbu7T4AzCKspgaALIBKAmyH91QTVAcpPgBAA/6gPwpRCB4kfhAEBDwAg/JsknRBesMAJD4QAACMkHqACEBMaT4BxCRslsaG7IAK6T4ASASsgvcASPjcwOwML20+AMwCrKJslsaG7IAK/PdIHgQ8BAAHNEIITlLmEcjeJsGC9W0+QUQNEpLHKT4BTDD8UADG7IAK1BUPd20+QcwATsasqT4BzAKuQAjI3ADsDC9KkhLHAJECCGS+EAAKEqk+AEwkEfa5wExQwak+AcQN9QQ8BAAK9EhS8mymEcAISN44XGaBiFy39W0+QUw6FQBM8PxQAKk+AUwE7KLQtTcT/ABDBdKQCMAkhdNE0qFIIT4CsCoR8jnT/ABDBFJQCMAkRFNACGFIIT4CsCoR7XnBesMAJD4QAACMqT4ASDAssrnBesMAAIyCEvJsqT4ASCQ+EAAmEfC5/wIACAAAAggWTwIABk7CABtVwgAST4IAC3p8EdtTIKwI3iAOwcrAPK8gN/oA/ATfo9WZ250BAAhASZnSoUgAJK0+QUwZUpmTSFwpnKoRwKwvejwh7T5ASC0+QMQk7LJGgmyASkSskDzo4BcSZgcATMbsgpEC0SS+ECAk/hAcAEmACXf+GCR3/hgoV/6iPik+AEA/7IQ4NMHA9QjfAArQPCDgE/wYFHIRwAtAPCGgAgud9ABNgE19rIrHQTrgwPT+AcASPoF8kf6BfMAKO/Q2Qfh1E/wIFHIR+nnASUAIQMjPko9SD5OAJCVcIUgIXBjcaVyoXGwRwKwvejwhwEiACNiciNwArC96PCHACNjciNwArC96PCHACK0+QEwInACM6T4ATACsL3o8IcAIQMjASYqSilIKk0AkJFwhSAhcKZyY3GhcahHArC96PCHtPkBMLT5AyCZslIaErIBKhuyJ90AJR5KSBwTRJP4QDAAsgJEkvhAIAIx2rIT8AEDpPgBECVwGNABIxLwAgUjdBnQT/BgUdT4IwATSmN0ArC96PBHEEcAIyNwUudP8EBRyEd+5wEj43NL5yN0SefU+BcA0Ed350/wIFHU+CMABkuYR2V0PecAv/wIACAZOwgAAAAIIG1XCAA9YggAGWIIABC1BEsESJhHvegQQANIBEsYRwC/yScIAG05CABxOAgAoScIADC1MEyDsKN8ACtN0KN6ACtK0eF7Cbu0+QEgtPkDMJCyGxobsgArErJA3SN4a7kmS9T4CxAaRJL4QDABMNuyShyk+AEAI3DE+AsgGwZMvx9LH0sDsL3oMEAYR7T5AeC0+QPArOsODA/6jPy88QAPD90aRhVIDusCAQFEkfhAEAEzm7ICRMmyY0WC+EAQGkbx20/wAQwPSUAjAJEGIAAhDkoOTYT4CsCoRwOwML1P8AEMCEpAIwCSCU0JSgYghPgKwKhH8ef8CAAgAAAIILFBCAA5QAgAaToIAJAACCBtVwgAQAAIIPC1BCaHsARGDUYPIg4hDEgMTwKrAJa4R3C5BC0mRipGBEYovwQiJbEwRgdLAqmSAJhHIEYHsPC9ECQgRgew8L0ACA5AAQAAIJ1xCACy6wEfhEZP6gEQEtNDCAPrwgKy+/DyT/b+cdMIWB6IQhPYEgQC9OAiGkMAIMz4ICBwR8kASwgD68ICsvvx8k/2/nHTCFgeiEIB2QEgcEfc+AQQQfQAIcz4BBDi5y3p8EcAI0/wiAlP8CQIT/SAfk/0ACxP9AA33/hQoBROwPjkoDNgQ2BDYoNiwPgAkMD4AIDA+ADgwPgAwAdgkbENRgxLCWgERphHYLnV6QEyE0MqaRND6mgTQ2JoM2ATQ2NgvejwhwEgvejwhwBBU1WEIwAg2UQIAC3p8EFP8CQMACVP8IgOT/SAd0/0ACZP9AA03/hkgMD45IBFYEVihWLA+ADgwPgAwAdgBmAEYPmxDGgDRgLrVAKy+/TyT/b+cFQehEIU2BpiWmgoRiL0mHI6Q1pgXGjR6QElKkMiQwxpyWgiQwpDQvSAIlpgvejwgQEgvejwgQC/AEFTVUAjA2BwRwC/gCMDYHBHAL8QIwNgcEcAvyAjA2BwRwC/gWBwR8FgcEcAaXBHQGlwR0BpwPNAIHBHQ2mbB/zVwfMIAcFhACBwR0Np2wcF1YNpACDD8wgDC2BwRwEgcEcAvwHrgQEA64EBCmdwRwHrgQEA64EBSmdwRwHrgQEA64EBimdwRwHrgQEA64EBwfiAIHBHAL/4tRJLBEYORphHEUsFRiBGmEcFQBnQD0wE8WAHI2izQgXQvEIR0CNpEDSzQvnRYWgpQvbQ42gwRphHY2i8QiXqAwUC0BA0AC3o0fi9vWEIAMFhCACIIwAgCiEBSAFLGEcADA5AxUYIAAshAUgBSxhHAA4OQMVGCACQ+BTAA0Yc8AEPFtAwtARob/MADID4FMBssQhNCEYC8QgBSQFpWAkHSL9C8IACmWgjRjC8GEcwvHBHcEcAQApALenwQ0MeZkwD60MBBOvBAZH4FMAc8AEPOdACRtHpAlCoQk/qQwY00C0atfWAP0/qQhxH2AzxQC4O9SAu3vgAgS8EGPAID3LQ3vgAgU/wCA4I8AcIDvoI/g7x/z4e6gUPAPCagJH4FOBH8CkHb/NBDoH4FOAz4E/0AGRP9IBzSUjB+ARBA/oC8gNpGkMCYb3o8INP6kIcDPFAIQH1ICHR+AABAAcF1fAYBOvAAAB9hwfh1D1N8BgE68AAK0a96PBDACEYRwzxQCEB9SAh0fgAUS0HNdUhJ0/0gDXR+AARBusDDgTrzg7e+AQQCEQvSQHrAhFIYO/zEIhytr/zX49P8AAJK0iA+ACQ0fgMkBnwEA8g0LjxAA8E0QEhAXC/81+PYrbxGATrwQHIaIhgs+fe+AARwfMBEQEpJdBH8DUHzufR+ABRxfMBFQEtw9A1J0/0gDXE50/wAHKPYAL6A/Pe+AwgzvgQUBVEDkrO+AxQEWkLQxNhuPEAD4nRASMDcL/zX49itoPn3vgAEQHwBw4IIQH6DvGpQtDSR/AhB5/nAL8AJAAgAEAKQD1HCAAAQwpAWAkAIC3p8Efv8xCDcra/81+PACBP9IBhWU1aSihwwvgIESO5ASMrcL/zX49itt/4WIGY+AAwAytj0FRPVE46iLSJpBqksgAsONATRt/4RJE/LIa/ACJAJAEiifgAILJo7/MQhnK2v/NfjwAhKXBFSdH4HBGJBTnUVLEaREZLGEYBMxL4AcvZsqFCgPgAwPbTT/SAYk/0AGE7iBxEOUs8gMP4GCHD+BQRw/gEISa5ASMrcL/zX49itr3o8Ic3SfCIC4gTRJuymEILgEDQ3/jEkJn4AKC68QAPOdFzaQArM9CYRwAoR9EBIjuItucmuQEjK3C/81+PYrYEI4j4ADC96PCHI04zaQOxmEfv8xCDcra/81+PACBP9IBhGkoocML4CBEjuQEjK3C/81+PYrYAI0/0AHETSsL4GBHG6QQzs4GI+AAwvejwhxNGASKF5wQjiPgAMO/zEIFytr/zX49P9IBCACAHSyhww/gYIcP4BCEAKaHRm+c8gFNGtIlo5wC/WAkAIABACkD+IwAg+iMAIJAkACD4IwAgAAAYIPwjACAt6fBBpksdIJhHpkuYRyi5pUtbaRPwAgMA8JqAoktaaRIHAPGGgFppVgcA8YuA0/gcIVlpzQUh1U/0gEBP9ABB1ATD+AgBw/gIEQDxroBQBQTV0/gMMVkFAPEJgpMFAPHugJcEBNVP9ABRj0vD+BgRFgQA8S2BVAQA8cyAASNP8AB3T/SAeIhMJWkD8f8+B/oO8Q1C2rIE60MWA9BgaQFCQPAigiFpCPoD8AFCGdDW+AwRT+pDHBH0AG+kRAXQ1vgcERH0AGEA8GWC3PgMIVIDB9Xc+BwhEvRAL8LzgUEA8ImCATMHK8/Rb01saRTwEARA8DuBK2mZBzTVa2maBzHVICMCIathK2loSiPwAgMrYStpHSBD8CADK2GpYZBHZEuYR2RKE3gAK0DwyoIAIxNwE+AIIpphW2nfBxDVvejwQV1LGEcEIZlhXEq96PBBEEdytr/zX49aShNwvejwgVdLmEfr51BLW2mbBvbVUUoTeAArAPCGggIkASUgIEpLFXCcYZhhGmlPSSLwIAIaYRppIkMaYRppQvAIAhphGmlC8AQCGmG96PBBCEdHTSt4A7NGTCNpA7GYR+/zEIJytr/zX48AIU/0gGA9SxlwNknB+AgBIrkBIhpwv/Nfj2K2ACNP9ABxMErC+BgRxOkEM6OBK3AtStL4HDHD8wpTCCt60AUgICFP9IBTKHDC+BQRwvgYMaLnT/SAQyNKwvgYMdL4HDET9ABzmNEnSAF4ASkA8FuCBCmR0SAjwvgUMY3nIk0reAErAPAXgQIrAPBpgQQrAPBmgQUhICITSxxMKXDD+BQh7/MQgnK2v/NfjwAhT/SAYBNLGXAMScH4CAEiuQEiGnC/81+PYrYAI0/0AHEGSsL4GBHE6QQzo4ErcF3nAL9BYAgA/WMIAABACkBlYAgA8ScIAPkjACABKAgALSEIAFgJACD5JwgA/iMAIJAkACBP9ABCt0vD+Bgh0/gcIVUFP/U7r7RKEngDKn/0Nq8gIsP4FCEx57FKsUuySBlGATMJeINCAvgBH/jRr0uYRwAoAPANgU/0gFGmS6xKw/gYEZL5ABAAKcDywIHSiAAqAPD8gQAiASRP9IBBpUgscAKApEgCgMP4GBHv8xCFcra/81+PoUgCcMP4BBEALX/0/a4EcL/zX49itvfmnE8QIz5GASSrYWMeA+tDAwfrwwMYfQTxCAEQ8AEP4rJP6kERBPEBBAzQb/MAABh1M2g7sWlYCAdIv0LwgAIBILFomEcHLAbxGAbe0YpLmEcBIH1LGmgi8H8CGmAaaELwgAIaYNP4ACEi9H9yIvADAkLwQwLD+AAhw/gEAe/zEIRytr/zX49P9IBRACV4ShVww/gEEU/0AHHD+AQRGWlB9IBxGWEcuRBwv/Nfj2K27/MQg3K2v/NfjwAkT/SAYGJJFHDB+AgBI7kBIxNwv/Nfj2K2ACJP9AB0XEthSFxJAmHD+BhBCnAZaUJhQfAIARlhGWmCgUHwBAEZYRppQvACAhphdeZdS73o8EEYR09LVk/T+BxhU0w7iLT4DMDG8wpWmhmURay/H/qC/KzrAwaiaLi/trIaRAAuAPBUgUZLGEYBMwB42bKxQgL4AQv300Aup/gAwADwuYBjaaT4DMAAKzvQmEcAKDjRBSAgIU/0AHI2Syhww/gUEcP4GCE45j9IAOsDE9howAc/9TKuIGkg6gEBIWHbaBsMCNA1SQ7rTg4B684ByGjDGsHpAjO96PBBEEYzSxhHKkwjaQArP/ScrphHmeYFICAhT/SAUh9LKHDD+BQRw/gYIQrmT/QAcQMiGkvD+BgRKnDv8xCEcra/81+PACUeSE/0gGEFcE/0AEJP9ABlw/gYEcP4FFHD+AQRw/gYIcP4BCEALH/06a0BIwNwv/Nfj2K24uVP9ABjFUwQSMb4CDEO604OxvgUMQDrzgAjRr3o8EEYRwBACkD+IwAgjyQAIAAAGCAIABggaSEIAJAkACD8IwAg+iMAIFgJACAAJAAg6SAIADFJCAAAQwpAfUcIAD1HCABP9IAjICVAIsz4CDEjaQ7rTg4j6gAAWksgYQPrzg6e+BQwYfOCA474FDDc+AgxI/ACA8z4CDHM+BRRzPgYIZLlUE7iiDOIY0SaQn/3QK+jiWNFAPCFgE/0AHFP9IBCSkvD+BgRw/gYIe/zEIBytr/zX48AJEVJDHDD+AQhACh/9HKtASMLcL/zX49itmvl7/MQhHK2v/NfjzxIPUkDcIt4ATOLcAAsf/RsrQEjA3C/81+PYrZl5QAjAiEyTDVII4ADgClwNEq96PBBEEfv8xCFcra/81+PLUgtSQRwi3gBO4twAC1/9CitASMDcL/zX49itiHlAyQEcO/zEIVytr/zX48iTE/0gGAjcE/0AGZP9ABDwvgYAcL4FGHC+AQBwvgYMcL4BDEALX/0Ha0hcL/zX49ithflAyEpcO/zEIRytr/zX49P9IBhEEhP9ABlAnBP9ABCw/gYERHnp/gAwLbmY2kAKz/0u66YRwAoP/S3rgAiM4g5iDqAC0QzgGvnAL8AJAAg/CMAIABACkBYCQAgxCQAIPojACAxSQgAcLXv8xCGcra/81+PACUdTB1KJXATaB1JI/SAcxNgiEcbSx0gmEcbSQt4w7kaSgAjC3Dv8xCBcra/81+PI3DTeAE703AhuQEjI3C/81+PYrYmuQEjI3C/81+PYrZwve/zEIBytr/zX48LSiVwk3gBO5NwACjb0QEjI3C/81+PYrbV5wC/WAkAIABACkBhXggAZWAIAPkjACDEJAAgLenwQe/zEIZytr/zX48AISlLKkwaeCFwACo70AElKEodIB1wT/AICJBHAidP8AQOT/AQDCAhI0sdIBpoQvQAYhpgGmgi9AByGmAaaULwEAIaYRppQvACAhphGmlC8CACGmEaaULwCAIaYRppQvAEAhphw/gYgBRKw/gY4MP4GMCfYZlhkEceuSVwv/Nfj2K2vejwge/zEIBytr/zX48LSSJwingBMopwACi30QEiInC/81+PYrax5/kjACBYCQAgQWAIAABACkBlYAgAxCQAIPi1JkuYRyZLHSCYR+/zEIRytr/zX48AI0/wUAxP8ABXIE0hTitwMmggSUL0gHIgSDJggfgdww9gA+tDAgDrwgIRfQEzIfAFAQYrEXX00RZKT/SAINL44DAj8AMDwvjgMBRLmEcAIxRKE3Dv8xCBcra/81+PEUorcNN4ATPTcCG5ASMrcL/zX49itg1LmEckuQEjK3C/81+PYrb4vS1eCABBYAgAWAkAIABACkAA4QDgACQAIJlgCAD5IwAgxCQAIPlSCAAQtRZLHSCYRxVLHSAaaBVJQvQAchpgGmgi9ABiGmCIRxFLGngSuQAiGnAQve/zEIRytr/zX49P8AAMDEkMSIp4ATqKcID4AMAALOzRASICcL/zX49itgAiGnAQvUFgCAAAQApAZWAIAPkjACDEJAAgWAkAIAJLWGkA8AEAcEcAvwBACkAISwDwfwAaaCLwgAIaYBpoIvB/AgJDGmAaaELwgAIaYHBHAL8AQApAAksYaADwfwBwRwC/AEAKQAJLWGjA88oAcEcAvwBACkACS1hoAPAHAHBHAL8AQApAAUuYYJmBcEeQJAAgAPAPAgYqANlwRwEhOLVTAQPxQCUF9SAlK0ZUHsX4CBHV+ABRBOtEAAdMJfDABQTrwATD+ABRIEYES5hHI31v84IDI3U4vQC/ACQAID1HCAAA8A8AQwED8UAjA/UgI9P4HDGbBgnUBksBOADrQAAD68AAAH3A84AAcEcBIHBHAL8AJAAgAPAPAwYrLNgwtSVNWQEF60Me3vgcIZIGIdQiTFoeAutCAgTrwgyc+BRAFPAEAhbR5AcY1AIGGNRP9ABVICQB8UAjA/UgI9P4CCEBICLwAgLD+Aghw/gYUcP4FEEwvQEgML0AIHBHEEYwvd74HCES9EAv4dBP9IAkT/SAcpz4FBABIEHwBAGM+BQQA/EIAQXrQRFMYClpAvoD8wtDK2EwvQBACkAAJAAgAPAPAAYoWthwtQDx/zwtTAzrTAEE68EBC31P6kwCXQcm1U/0gCZP9IB+C30O+gD+b/OCAwt1JElDAQHrQBXF+AhhCGkg6g4ACGHV+BwRjQYX1ALrDAME68MCEX3bAMgHBNVv8wAB41gRdZhHASBwvUMBA/FAIQH1ICHR+BwRiQb01QPxQCEB9SAh0fgcAYYEBtVP9ABQwfgYAUAgwfgYASAgA/FAIQH1ICELRsH4GAHR+AQRQfACAcP4BBHJ5wAgcEcAvwAkACAAQApAAPAPAAYoV9gt6fBBT+pAHAzxQCwM9SAs3PgMQeUHSNXc+BxBpAZE1EUeKE4F60UMBuvMDJz4FEBvABTwBA440e/zEIRytr/zX4/f+ISAiPgA4Jz4FOAe8AEPKdGc+BTgTvABDoz4FOAsuQEkiPgAQL/zX49itk/wAAzd+BjgfBlG+DTgBuvEBMTpASPE6QPMEbmz+oPxSQl7GQbrwwMafWHzQQIadQtJiEcBIL3o8IEksQAgvejwgQAgcEcBI4j4ADC/81+PYrYgRvPnACQAIFgJACB9RwgALenwTwDwDwQGLIWwAPLngGYBBvFAIwP1ICOGRtP4DAEQ8AEAQPDbgAHwAwUCLQDw54ADLQDw4IABLUDw0YAALADw0YDjHgErQPLNgAL0wFOz9QBvAPDcgLP1gF8IvwMlT/CADAEnIvTAUpKyBvFAJgb1ICbW+AAxHvCADyP0f3NP6gEeDvAwDhS/CCEAISPwAwOy9YBvQ+oODoDwr4AIKji/CCJTAAE7s/qD88PxHANO6gwCCkMHsSgCE0MDQ8b4ADHW+AAxACuA8omAT/ABDAYjACVbT8b4BMEH60MQ0PgMEV4eyQdP6kMSFNUC8UAiAvUgItL4ABFbAMD4CMHB84ERAfoD89L4ABErQyHwwAGdssL4ABHzspxC3tlKTwTrRAbgsoZGB+vGBgfgATRf+oT+vvEGDwbxGAZn2ATx/zhiAAjrSAxF+gLyB+vMDE/qSAMS8AMC80YM8RAJA5Pl0GMBA/FAIwP1ICPT+AARnPgUACHwwAFB6oISw/gAIQEigkbD+AQh0/gAIW/zAAoAKgDwAQCJ+ASgPNrT+AQhQvACAsP4BCEAKMDQVukDMlb4EBxW+BTMEUSaGkb4DCzLGmJEmfgEEFb4GMxwRs34AMDB80AB3/h0wOBHACim0QAgBbC96PCPAiUS9MBT99FP6oUcH0YdRjnnASX15wcjV+cFLBzQBiwYvwEl7ecBIOfnAiUl59z4ADAAK+DQCUoINGQBElkBIBIHA5pIv07wgAtCRAfrwgf5aFpGmEfP5wMl0ucAvwBACkAAJAAgbVcIAAAhF0sA8A8CA+sCEwAGELSZYArUE0wUSFMeA+tDAwDrwwABISNGELwYR1MBA/FAIwP1ICPT+BwREfRAL+rQT/QAdAP1inzM+ABA0/gcEYkF+9TT+BwREfRAL/TR2ucAvwBDCkA9RwgAACQAIAdK0vjgMCPwAwND8AIDwvjgMNL44DBD8AQDwvjgMHBHAEAKQAdK0vjgMCPwAwND8AIDwvjgMNL44DBD8AgDwvjgMHBHAEAKQARK0vjgMCPwAwND8AIDwvjgMHBHAEAKQC3p8EOPsG5GT/ABCexGIk/f+IiAD88Pxg/PD8YPzw/Gl+gDAEb4BAsxcMj4CJHY+AAxzPEAVCP0f3Mj8AMDQ/BrA8j4ADHI+ASR2PjgME/wAA4j8AMDQ/ACA8j44DDY+OAwDa1D8BADBPXAFMj44DAB4Bz4Ae+sRQT4DOD50U/0gGFP9ABiBUvD+BgRw/gUIQ+wvejwgwC/2NsIAABACkABOAIoGtjasS3p8EENRhRGDE/f+DSAVhwB4AE8C9A4aNj4ADAV+AEbmEcAKKbrBALz2k/w/zIQRr3o8IFP8P8yEEZwR6wkACCoJAAgBigC0AcoANBwRwFLGEcAv/1hCAAGKALQBygA0HBHAUsYRwC/4WEIABC0T/D/MwIkT+qBHADrgRFA+AxAi2ILakpgELxwRwC/BSOJAUNQcEcCI4kBQ1BwRwDrgRDCYXBHAOuBEEJicEcA64EQAGpwRxdJGEgItYFCCdAXSpBCBtIBOhIaIvADAhRLBDKYRxRIFEqQQgfSAToSGiLwAwIAIRFLBDKYRxFLEUkj8GBCA/FgQyLwfwKz9QBPimAD0otoQ/AAU4tgC0uYRwtLmEf+51TgCAAAAAAgIBUAIJ1xCAAgFQAgWC0AIIlyCAAAAAgAAO0A4C1xCAD9AAgAFCABSxhHAL9BYAgAFCABSxhHAL9lYAgAQ/aZIxC0AeABOw3QBGnkB/rVg2hAaBC8gAdEv8PzA0AQcAAgC4BwRwEgELxwRwC/ELVD9pkshkYC4LzxAQwS0N74EECkB/jV3vgEAIAHBtUSBAL0cCIRQwuxQfCAcc74DBAAIBC9ASAQvQC/AOuBAANrGrFD8AEDA2NwRyPwAQMDY3BHAOuBAANrGrFD8AIDA2NwRyPwAgMDY3BHQx4LRLP78PBDHv4rlL8Ask/w/zBwRwC/AOuBAQhrIPR/QAhjC2tD6gIjC2NwRwC/ELU+IAdLmEcHTKBHACj80E/0cQIFSwZM2mGgRwAo/NAQvQC/pV8IAMlfCAAABA5AMWAIAAJK02kj9IAz02FwRwAEDkBwtRJIEk2oRz4gEkuYRxJMoEcAKPzQT/CAcBBLmEcQTKBHACj80A9LmEcPSw9KEEyaYqBHACj80A5LECCYRw5LmEcrRr3ocEAASBhHANi4BSkBACClXwgAyV8IAOlfCADZXwgAEWAIAAAEDkABPw8gIWAIAElfCADpZQgAFUkLayPwAwND8AEDC2OLbhsHWL9P9ABjAtUE4AE7FtCKbhIH+tUMSQtrI/BwAwNDC2OIbhDwCAAIv0/0AGMC0AfgATsD0IpuEgf61XBHASBwRwAgcEcAvwAEDkAVSQtrI/BwAwNDC2OLbhsHWL9P9ABjAtUE4AE7F9CKbhAH+tUMSQtrI/ADA0PwAgMLY4huEPAIAAi/T/QAYwLQB+ABOwPQim4SB/rVcEcBIHBHACBwRwC/AAQOQAdKAwIRapuyIfADAQtDQ/RcE0PwAQMTYpNu2wf81XBHAAQOQAJLmG4A8AEAcEcAvwAEDkACS5huAPSAMHBHAL8ABA5ACEsbajCxB0pD8IBzQ/RcExNicEcDSiPwgHND9FwTE2JwRwC/AAQOQE/wAFIBS5picEcAvwAEDkACS5huAPACAHBHAL8ABA5AAkuYbgDwQABwRwC/AAQOQB0oCtgBIwZKg0CRaQAgM+oBAQHQE2FwR3BHASBwRwC/AAQOQB0oCtgBIwZKg0CRaQAgM+oBAQDQcEdTYXBHASBwRwC/AAQOQE/0gHMBSoNAE2BwRwAEDkADS8DzEgAabxBDGGdwRwC/AAQOQAFLGHhwRwC/sCQAIAJLG3gDsXBHAUsYR7AkACBNKAgACEuT+QAgG3gAKgPwYAMD20ArBdAAIHBHQCv70QJLGEcCSxhHkCQAIKkoCABZKAgABksQtZhHBkrDeBNwC7EBIBC9BEu96BBAGEcAv4kgCACwJAAgJSgIADC1hEYVRoOwC0ZiRgAhA0wAlYEgoEcDsDC9AL9tVwgAMLWERhVGg7ALRmJGACEDTACVAiCgRwOwML0Av21XCAA4taHxDgMBKxfZ7/MQhXK2v/NfjwAjCkzJsiNwCUsD6gIiEUMIS0HwtEGYRyW5ASMjcL/zX49itji9T/D/MDi9WAkAIAD//wB5AAAgwPigEHBHAL+BY3BHwGxwR4BscEdDCQP1ABMD8gZzWwLbawDwHwAj+gDwAPABAHBHASJDCQP1ABMD8gZzAPAfAFsCAvoA8BhjcEcAvwEiQwkD9QATA/IGcwDwHwBbAgL6APBYY3BHAL8BIkMJA/UAEwPyBnNbAplrAPAfAAL6APABQhS/WGMYY3BHAL9DCQP1ABMB8PBCA/IGc7LxIF9P6kMjNdAQtBbYsvEAbxvQsvGAXxXRT/ABDADwHwAM+gDyWmQYbxBDGGcR6gwAWmAb0FpmELxwRwHw4EKy8UBfL9AAIBC8cEdP8AEMAPAfAAz6APJaZBhvHG8gQCDqAgAYZxHqDABaYOPRGmZgRhC8cEcBIgDwHwCCQMgHWmRMv1pmGmYR8AoPFL8aYlpiiAci1AgHSL/D+IQgASBaYRpgcEcBIgDwHwCCQAHwYFzB84AEyQdaZEy/WmYaZlS5WmW88WBfDL8aY1pjGmEaYAEgELxwRxpl8+fD+IAgASBaYRpgcEcAvwNGAvDwQLDxIF8p0BC0ENiw8QBvFdCw8YBfD9FZZBhvCEMYZxLwAQBZYBXQWWYQvHBHAvDgQLDxQF8l0AAgELxwR1lkGG8cbyBAIOoBABhnEvABAFlg6dEZZgEgELxwR9AHWWRMv1lmGWYS8AoPFL8ZYllikAce1BAHSL/D+IQQASBZYRlgcEcC8GBQwvOABNIHWWRMv1lmGWZUuVllsPFgXwy/GWNZYxlhGWABIBC8cEcZZfPnw/iAEAEgWWEZYHBHAL/+5wC/AksYeIDwAQBwRwC/sSQAIAxKA0YQaAxJMLEDRItCzL9P8P8wE2BwRxC0CEwjRItCFGDYvxNgIEbIv0/w/zAQvHBHAL+0JAAg/P8HINAVCCBP8P8wcEcAv0/0AFMAIEtgcEcAvwEgcEcAIHBHAUYItQFIAkuYR/7nENwIAHVxCABwRwC/T/D/MHBHAL8t6fBBT/BgURlMBiCgR0/wYFEHIKBHT/BAUR0goEcVSx0gmEcUT0/wYFEIIKBHE04IILBHEk1P8EBS/yE4RqhHEEs4Rv8hmEdP8GBRNSCgRzUgsEdP9MBRT/AAYgpIqEcjRr3o8EFP8IBRGyAYRwC/PWIIAP1hCAAADg5A4WEIADVjCACxYQgAAAwOQE/0AEIQtQVLBUxaZQogoEcLIKBHvegQQAJLGEcAEg5AQWAIAIlkCAAMSxpoIrnv8xCBKbEKSQpwGmgBMhpgcEcQtHK2v/NfjwEgBkwESiFwEHAaaAEyGmAQvHBHuCQAILwkACBYCQAgB0saaAE6GmAbaEO5BUsbeCuxASIESxpwv/Nfj2K2cEe4JAAgvCQAIFgJACAt6fBBoLkAKpBGDd0MRgpPCk6NGCFGOGgzaAE0mEesQvjRQEa96PCBgEZARr3o8IFP8P849ecAv6wkACDAJAAgMUoTawPwAwMBKyzQAjsBKx7YE2rZATjVLEgtSwNgKkoTawPwAwMCKzzQKksmSQprAvBwAnAqBdAKa8LzAhLTQANgcEckSqL7AyNbCANgcEciSx5IW2oT8IAPFL9P9ABDT/T6Q+LnE2rbAQvUEmoC8HACECoh0BZLGUkUSCAqGL8LRtPnEksRSNDnFUsPSANgE2oD8HADECsS0CArv9EMSwNgvOeRagNowfMKQQH7AzOSatKys/vy87jnCksDSLXnCEsDYKvnAL8ABA5AXAkAIAAbtwAAHE4Oq6qqqgASDkAACT0AABJ6AAJKE3gBO9uyE3BwR9ckACAAIHBHACBwRwAgAUkBSxhH0CQAII03CAAItQZKBkkTeAE727ITcBB4iEcAIgNLGnAIvQC/2CQAINE2CADMJAAgFkqS+QAQE3gAKQPwYAMD2yArDtAAIHBHICv70VN4ISv40dOIByv10Q1JASCRYJOBcEdQeCAoBdCg8SIAsPqA8EAJcEfTiAcr5NEQtARJBUyRYBRhk4EBIBC8cEeQJAAg0CQAIOlmCAAIInC1ACRP9OEwQvKhBgxJDE2KcQxKDUsscBSADEoeYAhgHIEgRlpgjIAKS5hHIEYJS5hHGLEreAEz27IrcHC90CQAINckACDsKAAgBC0AIAEAAgCNNwgAqTYIAC3p8E+DsO/zEIpytr/zX48AI9/42IDf+NiQiPgAMJn4AEA0T+SyN/gUMCZGMk0AKzrQACMrgDFLG3hbs7T6hPZ2CQEjLkoTcLrxAA8E0Yj4ADC/81+PYrY3+BYws/UAfxS/ASQAJBvQJkuYRwAoNtAlS5hHJUo3+BYwEIAkSCVKIUYAkCRMhSAC60YioEcDsL3o8I+0+oT0ZAmJ+ABA0OcAIRpKEYDp5yuI3/hYsAEzK4DYRxC5K4hjKwbZ2EcAKLfQK4iz9Uh/s9K68QAP3tEBI4j4ADC/81+PYrbX5w9LmEcKSjf4FjAQgMfnWAkAIPgsACD0LAAgyiQAIPAoACAALQAgAVUIAFlVCAD8LAAgTWkIAPQoACBtVwgASVUIAAtLG3gDsXBHELUKS5hHCkpAsQpLFIiYR4RCCNC96BBAB0sYRwdLFIiYR4RC9tEQvQAtACABVQgA/CwAIFlVCADlZwgASVUIAACxcEcQtAdLB0wbeAdKs/qD8wdJWwkgcCH4EwAQcBC8BEoQR/gsACDwKAAgAC0AIPQsACAFaQgAC0sbeAOxcEcQtQpLmEcKSkCxCksUiJhHhEII0L3oEEAHSxhHB0sUiJhHhEL20RC9AC0AIAFVCAD8LAAgWVUIAOVnCABJVQgA8LWDsO/zEIBytr/zX48AIitLLEksTRpwDHgqeAAqQNEqTitP5LK2+ADAAvD/Djf4FCAf+oz8krKURTLTtPqE8k/wAQxSCab4AOAKcIX4AMAguYP4AMC/81+PYrbv8xCFcra/81+PACIacDKICHiRssKyN/gSIJKyJbkBIBhwv/Nfj2K2kUIX0RJIE0oAkALrRCJP9ABzASEQTAYgoEcDsPC9MLkBIhpwv/Nfj2K2A7DwvQAgA7DwvQAgCUuYR+PnWAkAIOAoACDoKAAg5CgAINwoACA1awgA3CQAIG1XCAABNwgAOLUAJBJKE00TSSxwE0sUcBNIFEoccBSAE0sMcARgmEcSSRNLDHATShNJFHAcgBNKXIAMgJBHSLEreAEz27IrcCt4ASvasgS/DUsacDi9AL8ALQAg2CQAIPgsACDwKAAg9CwAIPwsACAFaQgA6CgAINwoACDgKAAg5CgAIM1pCADMJAAg+LkDRg9IkPgAwLz6jPxP6lwcObEMSg1IibIi+BwQDEoDcBBHELULSQtMgrAAlE/0AHMQRglMAetMIgEhoEcCsBC9cEfgKAAg3CgAIOgoACDNaQgA3CQAIDVrCABtVwgAMLTv8xCEcra/81+PACAKSQpKC0sIcBCIGngKTdKyg7I1+BIAgLLAGiS5ASMLcL/zX49itjC8cEdYCQAg5CgAIOAoACDcKAAgLen4T4hGFkYhTSJM3/iIkCJP3/iMsO/zEIBytr/zX48AIytwIoiZ+AAQkrLJsjf4ETCbsiC5ASAocL/zX49itpNCGEgF2AN4ACvk0TBGvej4jzf4EaAC60EhH/qK+qrrAgqyRSi/skZARg9LUkZZRJhHI4im6woGU0SbsiOAC0vQRJhHAC7G0TBGvej4jwC/WAkAIOQoACDgKAAg3CgAINwkACDMJAAgnXEIAM1pCABwtO/zEIVytr/zX48AIRNKE0wRcBNII3gw+BMAsPUAfwjQASAluQEjE3C/81+PYrZwvHBHDEgGeAbw/wBeuQtJDngALu7R27Kz+oPzASBbCQhwI3Dm5whG5OcAv1gJACD4LAAg9CwAIAAtACDwKAAgLenwTzVLT/AADJp5T/ABDqLxCQKy+oLyMUgyTTJMM07f+MyAM09SCe/zEIlytr/zX4+A+ADAK3g0+BOg27K69QB/J9C58QAPBNGA+ADgv/Nfj2K27/MQinK2v/Nfj4D4AMAreDT4E5DbsgnxAQsk+BOwB+tDIwP4CRC68QAPA9BSswAiCRLP54D4AOC/81+PYrb155b4AKC68QAPBNGY+ACguvEADwfQufEADw7QACARSxt4vejwj7P6g/NbCYj4AOArcLnxAA+/0MPnASMDcL/zX49iturnASDr59AkACBYCQAg+CwAIPQsACAALQAg8CgAIPQoACDMJAAgBksHSFloB0oIYFloBkhKYBlpCGAbaVpgcEcAv5AJACAcCgAgiAkAIOQKACBTuUq5ACkIvwAoHL9P8P8xT/D/MADwdrmt8QgMbekEzgDwBvjd+ATg3ekCIwSwcEct6fBHCJ4NRgRGiEYAK03RikKURmjZsvqC8lKxAfoC88LxIAEg+gHxDPoC/EHqAwiUQE/qHEG4+/H3H/qM/gH7F4gH+w7wIwxD6ghDmEIK2RzrAwMH8f81gPAegZhCQPIbgQI/Y0QbGrP78fAB+xAzAPsO/qSyROoDRKZFCtkc6wQEAPH/M4DwCYGmRUDyBoFkRAI4ACGk6w4EQOoHQB6xACPUQMbpAEO96PCHi0II2QAuAPDugAAhxukABQhGvejwh7P6g/EAKUrRq0IC04JCAPL8gIQaZesDAwEgmEYALuLQxukASN/nArn/3rL6gvIAKkDwkYCh6wwAASFP6hxHH/qM/rD79/MH+xMAJQxF6gBFDvsD8KhCCNkc6wUFA/H/OALSqEIA8s6AQ0YtGrX79/AH+xBVDvsA/qSyROoFRKZFCNkc6wQEAPH/NQLSpkUA8raAKEak6w4EQOoDQJ7nwfEgB4tAIvoH/EzqAwwl+gf6T+ocSbr7+fgg+gfzCfsYqo1AH/qM/h1DAPoB8wj7DvAsDETqCkSgQgL6AfIL2RzrBAQI8f86gPCIgKBCQPKFgKjxAghkRCQatPv58An7EEQA+w7+rbJF6gREpkUI2RzrBAQA8f81bNKmRWrZAjhkREDqCECg+wKVpOsOBKxCyEauRlbTU9AALmnQs+sIAmTrDgQi+gHzBPoH9x9DzEDG6QB0ACFH5wz6AvzC8SABJfoB80/qHEcg+gHxlUANQ7P79/EH+xEzH/qM/igMQOoDQAH7DvODQgT6AvQI2RzrAAAB8f84L9KDQi3ZAjlgRMAasPv38wf7EwCtskXqAEUD+w7wqEII2RzrBQUD8f84FtKoQhTZAjtlRCgaQ+oBQTjnMUYwRgfnL0bk5hhG+eZLRanSuesCCGXrDA4BOKPnQ0bq5yhGlOdBRtHn0EZ752REAjhH5wI7ZUQv5whGBucxRunmcEcAv3C1DU4NTXYbthAG0AAkVfgEOwE0mEemQvnRCU4JTQbwbf92G7YQBtAAJFX4BDsBNJhHpkL50XC9NOAIADTgCAA84AgANOAIAA+0ALUHSoOwBKsQaFP4BCuBaAGTAfDi/gOwXfgE6wSwcEcAv3QLACCERkHqAAMT8AMDSdFAOiPTC2gDYEtoQ2CLaINgy2jDYAtpA2FLaUNhi2mDYctpw2ELagNiS2pDYotqg2LLasNiC2sDY0trQ2OLa4Njy2vDY0AwQDFAOtvSMDIL0wtoA2BLaENgi2iDYMtow2AQMBAxEDrz0gwyBdNR+AQ7QPgEOwQ6+dIEMgjQ0gccvxH4ATsA+AE7AdMLiAOAYEZwRwC/CCoT04sHsdAQ8AMDrtDD8QQD0hrbBxy/EfgBOwD4ATuk0zH4Ajsg+AI7n+cEOtnTAToR+AE7APgBO/nSC3gDcEt4Q3CLeINwYEZwR4MHMLVI0FQeACo/0ANGyrIB4AE8OtMD+AErnQf50QMsLdnNskXqBSUPLEXqBUU22aTxEAIi8A8MA/EgDuZET+oSHAPxEAJC6QRVQukCVRAyckX40QzxAQIU8AwPA+sCEgTwDwwT0KzxBAMj8AMDBDMTREL4BFuTQvvRDPADBCyxyrIcRAP4ASucQvvRML1kRhNGACz00fnnA0YURr/nGkakRuDnDrQwtQRGb/AARZywC0ofqwtJBZJT+AQrCGgCqc3pATQHlQSVBpQA8G/4ACICmxpwHLC96DBAA7BwRwC/CAL//3QLACAg8AMBEPADAMDxAABR+AQ7APEEDE/qzAxv8AACHL8i+gzyE0NP8AEMTOoMLEzqDEyj6wwCIuoDAhLqzBIEv1H4BDsEMPTQwvEAAQLqAQKy+oLywvEfAgDr0gBwRzC1QOoBBKMHItEDKiDZC0aERhlGU/gEW6XxATQk6gUEFPCAPxXRBDoDKhlGTPgEW+/YAfH/PlKxY0Ye+AEfVB4D+AEbQbEiRpxGACr00TC9hEYB8f8+7udiRAAs99AD+AEbk0L70TC9LenwT9WwDEYMkZFGDpMKkATw7vkDaBhGF5P/94//o4kWkBkGA9UjaQArAPCPhwAkK6siRphGTUbN6SlEKJMSlAAjACTN6RQ0K3jN6RkizekbIhiSCJIAKwDwzoGqRgTgGvgBPwArAPAJgSUr+NG66wUGQPAHgZr4ADAAKwDwvIEAI0/w/zJP8CsJICQfRpr4AWAHkgrxAQqN+IMwCZMK8QEKpvEgA1orAPIggd/oE/DKAh4BHgHFAh4BHgEeAaMCHgEeAWoA8wIeAUcC2QIeAdQCWwBbAFsAWwBbAFsAWwBbAFsAHgEeAR4BHgEeAR4BHgGwAR4BCwJ6ALABsAGwAR4BHgEeAR4BngIeAR4BtgAeAR4BHgEZAh4BTAIeAR4BPwceAR4BHgEeAR4BHgEeAR4BsAEeAQsCfACwAbABsAGRAnwAdQAeAYQCHgFwArgAXgJ1AB4BGQJyABwHHgEeAR8HHgFyAAAipvEwAxr4AWsC64ICA+tCAqbxMAMJK/XZCZKO5w6bU/gEKwAqCZIOk8Dy0oGa+ABggeea+ABgR/AgB3znR/AQB7oGDptA8X2BBzMj8AcDGkZbaFL4CEuZRg6SACvA8n+FB5sBMwHwOYBU6gkDJ/CACwDwBYUKLHnxAAOA8JOHASNfRjA0jfhPQQuTDfJPFQeaC5kAI4pCuL8KRgaSnfiDIA2TD5MTkxCTACp80AabATMGk3jgR/AQBxfwIAkA8DKBDpsHMyPwBwPT+ASQU/gISw6TACMn9IBrACKN+IMgB5pRHADwKoJU6gkBK/CAB0DwI4IAKkHwK4AAK0DwxYQb8AEDC5MA8FSFMCMN8k8VjfhPMbznuusFBgDwuoAqm8jpAFYzRCqTKZsBMwcrKZMF3AjxCAgImzNECJPo5gyZCpgoqgXw0fqAuQ3xrAjy5wyZCpgoqgXwyPoAKADwioANmxuxDZkKmAPw7f0Mm5uJE/BADwibGL9P8P8zCJMImFWwvejwjwAuAPCDgAEjACKN+OxgBpM7rY34gyALkw2SB5IPkhOSEJIX8AIDAtAGmQIxBpEX8IQLB9EJmQaYoesACbnxAA8A8zaDKpyCsQEiyPgEICmaATQBMg3xgwEHKiqUKZLI+AAQAPNpgwjxCAh7sQIjyPgEMCmbAjQBMyGqBysqlCmTyPgAIADzbIMI8QgIu/GADwDwLoIHmwuao+sCC7vxAA8A83GC+wUA8cWBC5vI+ABQHETI+AQwKZsqlAEzByspkwDz6oII8QgIewcF1QmbBpqdGgAtAPNQg93pCDIGmYpCrL+bGFsYCJMALH/0bq8AIymTDZsbsQ2ZCpgD8GH9VUYN8awIK3gAK3/0Mq4qmwArP/RprwycCpghRiiqBfAi+qOJYucOmwczI/AHAvLoAjTN6RQ03ekUNCTwAESZRhhGDpIhRk/w/zK2SwbwS/kAKEDwloRIRiFGT/D/MrFLBvAj+QAoQPCMhN3pFAEAIgAjBvAQ+QAoQPCmh534gyAAIQMgqU2pSyfwgAcNkQaQRy7Ivx1GB5ELkA+RE5EQkcHmF/AQA0DwYoQX8EACAPB7hw6amUZS+ARLDpKkssfmU/gESw6T+wYA8UGEfQZA8TuERPPAOUtGJLJ95gEgACIOmwaQU/gEGzutjfiDII347BAOkwuQEOdP8AAJDpwHm1T4BFuN+IOQAC0A8O6GWhwA8GCFGkZJRihGBPCy+g2QACgB8J6ADZud+IMgWxsLkyPq43PN+ByQDpQGk834NJDN+DyQzfhMkM34QJBr5gmbW0IJk5r4AGBH8AQHquVH8BALG/AgCQDwqoMOmwczI/AHAxpGUvgIS9P4BJAOkgEjaeYwIngmDpuN+IQgU/gES2hKDpNP8AAJAiNH8AILjfiFYBiSV+a9BgDx1oP8BgDxk4Z4BgDxXYe5BUDxjYYOmwiZU/gEK1VGEXAOkxvnmvgAYGwuA7+a+AFgR/AgBwrxAQpH8BAHZeWa+ABgaC4Dv5r4AWBH9AB3CvEBCkfwQAdY5Zr4AGBH8AgHU+UKnjBGA/D5/kNoGEYbk//3mvwDRjBGHJMeRgPw7v6DaBmTAC4/9LutGZsAKz/0t60Zmxt4ACs/9LKtmvgAYEf0gGcx5Zr4AGBH8AEHLOWd+IMwACt/9KOtmvgAYI34g0Ai5Zr4AGBH8IAHHeVSRhL4AWsqLgHw64Gm8TADCSuSRpi/ACIB8gOAGvgBawLrggID60ICpvEwAwkr9dkHkgXlmvgAYI34g5D+5LtGASs/9JqtAitUrRLRGJoE8A8D01wkCUTqCXRP6hkZBfgBPVTqCQPy0VSrWxtfRguTkOUE8AcD5AhE6kl0T+rZCTAzVOoJASpGBfgBPfHRG/ABD+nQMCvn0DAjAjoF+AE8VKubGl9GFUYLk3PlAL///+9/MNwIADTcCABA3AgAZS5A8+mA3ekUAQAiACMF8J3/ACgA8NKBASPI+AQwKZu/SgEzATQHKyqUKZPI+AAgAPN6hQjxCAgimxKak0KA8teCFpsXmhxEyOkAIymbKpQBMwcrKZMA892DCPEICBKbXR4ALX/3Fq4QLUHzQYHf+LSSIkZJRhAmuUYpmw9G3fgosAycBeAI8QgIED0QLUDzWIUBMxAyByvI6QB2zekpMvHdIUZYRiiqBfBC+AAof/R6rd3pKTIN8awI5ucJmwaao+sCC7vxAA9/98qtu/EQD0HzBYDf+EySQUYgRqhGTEYQIymaDJ3d+CiQBuCr8RALu/EQDwHxCAEZ3QEyEDAHKsHpAEPN6Skg8N0pRkhGKKoF8A74ACh/9Eat3ekpIKvxEAu78RAPT/AQAyup5dxFRqFGiEYERgEyXEQHKs3pKSTI+ACQyPgEsADzGIUI8QgIhuW78RAPQPOXhd/4yJFBRiBGqEZMRhAjKZoMnd34KJAG4KvxEAu78RAPAfEIARndATIQMAcqwekAQ83pKSDw3SlGSEYoqgTwy/8AKH/0A63d6Skgq/EQC7vxEA9P8BADK6nl3EVGoUaIRgRGATJcRAcqzekpJMj4AJDI+ASwAPPOgQjxCAhL5RKbAStA836BASMpngE0HkQHLsj4AFAqlMj4BDAplgDz4YEI8QgIFpsBNheaHEQHLsjpACPN6SlkAPPhgQjxCAgAIt3pFAEAIwXwlP4AKEDwdoESmwE2ATsBNRxEBy7I+ABQKZbI+AQwKpQA81uBCPEICBqbATYcRMj4BDAHLiSrzekpZMj4ADB/9xatDJkKmCiqBPBh/wAof/SZrCqcDfGsCAvlufEQD0DzUIbd6SkhQEbN6R02uEYQJE9GDJ6pRgqdBOAQPxAvAPEIABbdATIfSxAxByrA6QA0zekpIfHdMUYoRiiqBPA3/wAof/RvrN3pKSEQPxAvK6jo3E1G3ekdNrlGR0aARgnrAQQBMhBJByrN6SkkyPgEkMj4ABAA88ODnfiDIAjxCAiG5AyZCpgoqh2TBPAQ/wAof/RIrCqcHZsN8awIiuRw3AgAhNwIAHTcCAAMmQqYKKoE8P3+ACh/9DWsKpwN8awIieQQLUDzxIYQJimbCp/d+DCQBOAQPRAtCPEICBfdATO4ShA0ByvI6QAmzekpNPHdSUY4RiiqBPDa/gAof/QSrN3pKTQQPRAtDfGsCOfcATOsSixEByvN6Sk0yPgEUMj4ACB/936sDJkKmCiqBPC//gAof/T3qyqcc+QimQApQPNvg934QJASm5lFqL+ZRrnxAA8L3SmbTEQBMwcryOkAWSqUKZMA8x2FCPEICBCeufEAD6i/pusJBgAuAPMlgt34QLB4BatEAPFfgiKbEpqTQgLb+QdA8XaEFpoXmRREyOkAEimaKpQBMgcqKZIA8xOFCPEICBKarhim6wsG1RquQqi/LkYALg3dKZs0RAEzByvI+ACwyPgEYCqUKZMA83GFCPEICAAuqL+tGwAtf/cRrBAtQPM8h9/4zJEiRklGECa5RimbD0bd+CiwDJwF4AjxCAgQPRAtQPNTgwEzEDIHK8jpAHbN6Sky8d0hRlhGKKoE8D3+ACh/9HWr3ekpMg3xrAjm5webACt/9PyqX0YAI1StB5MLk//3/br6Bz/1f64BIymeATQeRAcuyPgAUCqUyPgEMCmWf/elrgyZCpgoqgTwFf4AKH/0Tavd6SlkDfGsCJnmEptdHgAtf/eVrhAtQPPfhiJGB5dP8BAL3/gYkQqcDJ8F4AjxCAgQPRAtQPN/gwE2EDIHLsjpAJvN6Sli8d05RiBGKKoE8On9ACh/9CGr3ekpYg3xrAjm5wyZCpgoqgTw3P0AKH/0FKsqnA3xrAj/93S7G/AQAw6aOtEb8EABM9BS+ARLmUYOkgEjpLL/9726LSNkQo34gzC7Rk/wAQNp60kJ//e1ugyZCpgoqgTwtf0AKH/07ard6SlkDfGsCBPmDJkKmCiqBPCo/QAof/Tgqt3pKWQN8awIE+b9B3/1T6sk5VSt//dsuhv0AHlA8IqDUvgESwEjDpL/94e6uAUA8ZuDT+rkeUtG//dAug6bCJhT+AQbwhdVRsHpAAIOk//3TLsOm1P4BEsOk//3a7p03AgAhNwIAN3pFAECRgtGBfCs/AAoQPDphWEuAPB9hUEuAPCLhAebATMA8I+DJvAgA0crBpMA8I+F3ekUEkf0gHMPkxNGACvA8rCFC5MAI4tGHZMNkwabRisA8OmDRSsA8EaFB5kLmwGRAiEAkSapBJEjqQORIqlaRgqYApEB8Lv+BpsFRkcrQPA6hhfwAQ+5Rg+fQPD+hCabWxsSkwabRysA8G6DBptGKwDw8IMimxCTEJsGmgE7QSoikwDwu4UAIfKyACuN+JAgtr8tIisiEJuN+JEguL/D8QEDCStA85uFDfGfDGJGtk8cRhBGh/sDEtkXweuiAQHrgQKj60ICMDJjLAD4ASwLRgDx/zLs3DAzgR7bsoxFAvgBPEDy+YUN8ZIBAeAS+AE7lEUB+AE7+dEN8aEDDfGSAhsaE0QkqpsaGpMSmxqaASsaRAuSQPOBhQubFpoTRAuTACMLmin0gGci6uJyR/SAdw+TBpITkxCTHZsAK0DwLIOd+IMgB5P/95S5u0b/9y+7j0sYkxfwIAkA8PWADpsHMyPwBwPT+ASQU/gISw6T+AcJ1VTqCQMG0DAjjfiFYEfwAgeN+IQwAiMn9IBr//eJuYBLGJPe5wyZCpgoqgTwifwAKH/0wakqnA3xrAgY5EAhCpgD8Mr6DJsYYBhhACgA8JeFQCMMmlNh//diuBAuQPN2hd/4wJFCRkhGIUaoRrlGT/AQCwdGKZsKnAydBOAIMhA+EC5A8xOCATMQMQcrwukAe83pKTHy3SlGIEYoqgTwUPwAKH/0iKnd6SkxK6rn5yhGzfgckA6U/ve5/yDq4HOd+IMgC5DN+DSQzfg8kM34TJDN+ECQBpP/9xO5EptCRt34TIDrGF5GB5PN+CygEJchRhmf3fhwkN34KKDd+DCwD5sTlbjxAA8u0IO7AT8I8f84G5tJRMLpADkpmyqRATMHKymTYNwIMgebOHibG4NCqL8DRgArHEYL3SmYGUQBMAcowukAYyqRKZAA8xSBOHgIMgAstL8FRgUbAC0L3AZED5u48QAP0NEAKwDwJoIPmwE7D5PN5xAtQPOdhBAkKZgE4BA9EC0C8QgCFt0BMCVLEDEHKMLpADTN6SkB8d1ZRlBGKKoE8M37ACh/9AWp3ekpARA9EC0rqujcATAaSylEByjN6SkBVWATYADzQYI4eAgyBkTE5xfwEAMA8KCADptT+ARLDpMK51lGUEYoqgTwqPsAKH/04KgqmSuqlOcAIwv0gGIGls34LKDN+DSAkkYeRt34ZIBUrxTgZ2ZmZkDcCABU3AgAhNwIAAAjIEZJRgoi/vdW/AosefEAAxvTBEaJRi9GIEYKIgAjSUb+90n8MDJ9HgE2B/gBLLrxAA/k0Jj4ADCeQuDR/y7e0AosefEAA4DwMIFUq1sb3fgsoM34ZIASll9GBp7d+DSAC5P/9yu4DJkKmCiqHZME8FL7ACh/9IqonfiDICqcHZsN8awI//e4uAEjyPgEMCmbvEoBMwE0BysqlCmTyPgAIADzF4EI8QgIAClA8IaAEpoH8AEDE0M/9OCoFpsXmRoZyOkAEymbKpIBMwcrKZMA8zeBCPEICBKZATOMGAcrzekpNMj4AFDI+AQQf/fEqP/3rLsX8EACAPClgA6amUZS+ARLDpKksmTmu0b+98q/DJkKmCiqBPD/+gAof/Q3qCqcDfGsCP/3e7oURjpGT0aRRgEzLEQHK8j4AJDI+ARQzekpNH/3mKj/94C7WUZQRiiqBPDh+gAof/QZqDh4KpkrquHmDJkKmCiqBPDV+gAof/QNqCqcDfGsCP/3ZbgBK7tGf/T1qf73kr8OmwiZU/gEK1VGEWAOk//3jrgGKylGKL8GIypGB5UNlQaTdk0OlAuTD5ETkRCR/veOvxabF5gaGcjpAAMpmyqSATMHKymTAPO3gAjxCAgAKb/2fa9OQhAxgPKpg0FGECSoRt/4nJHd+CiwDJ0E4AgxED4QLkDzp4IBMxAyByvB6QCUzekpMvLdKUZYRiiqBPB++gAofvS2r93pKTIrqefnFEYHnwE2LEQHLs3pKWTI+ACQyPgEUH/39apO5Bf0AHkOm2bQU/gES5FGDpPksrzlF/QAeQ6bV9BT+ARLkUYOk+Sy/vdJvyma3/gYkf/3lbotIo34gyD/91e4RUaQRjpGDEZPRpFGATM0RAcrzekpNMj4AJDI+ARgXNwI8QgI//eeuxybG5ntGhpGKEb+99P9mPgBMAuxCPEBCCBGSUYKIgAjACb+9/P6n+YMmQqYKKoE8B36ACh+9FWvIpkqnA3xrAjd5hKarhim6wsG1RquQqi/Lkb/96a7UvgES4lGASMOkuSy/vf7vlP4BEsOk/73875T+ARLDpNX5Q6bCJlT+AQrVUYRgA6T/vfBv0TzwBlLRmSy/vekvgyZCpgoqgTw5vkAKH70Hq/d6SkyIpkN8awIPOcMmQqYKKoE8Nj5ACh+9BCvKpwN8awI//c4uwYjB5Mm8CADBpNw5HDcCABo3AgAhNwIAN3pEjXrGJ5Cs0YZl5BGDEYov5tG3fgsoBCf//cjuyKb2hwQkwLbB5qTQgTdAj4m8CADBpOL5BCbEpqTQsDywoAZ8AEPAPAdghaaE0QLkxn0gG8A8BSCEJtnJgArdtwLmyPq43MGkwAjD5MTk8/kLSIAI434gyAHk/73aL4MmQqYKKoE8IH5ACh+9LmuKpwN8awI//fYullGUEYoqgTwdPkAKH70rK44eCqZK6oGRHrlDJkKmCiqBPBn+QAofvSfriKbKpwN8awI//fhugeZC5sBkQMhAJEmqQSRI6kDkSKpWkYKmAKRAfDV+gN4BUYwKwDwFoIimweauUYTRA+f7BhYRgAiACMLmQXwTPgIsSNGEeQmm6NCv/QOrDAhWhwmkhlwJpucQvnYBeQimgAqEJJA8w6CB5kJ8AEDC0NA8H6BZiYQmwuTGfSAb4jQGZkLeP8rAPAlggAkEJogRgTgATABMf8rAPBZgZNCgPJWgdIaS3gAK/PRC3gBNPLn3ekpIf/32rkHm534gyAOlAaTC5MHkA+QE5AQkP731r0MmQqYKKoE8PH4ACh+9CmuIp0SmyqcDfGsCF0b//eBugAjB5P+9wu9EpsWmpoYEJsLkgArQPOFgWcmtucwI434hDBYI434hTAHm0fwAgRjKwDzxIAAIzutDZNH9IFzD5Pd6RQSE0YAKydGwPKEgAuTACOLRh2TJvAgAwaTYS4A8BiBQS5/9GerIqpYRguZBPAd+AAiT/B/UwTwTv0CRgtGzekQIwAiACME8K7/CLEBIyKTrUsLkwebzekSps3pHnjd6RBnq0bd+CygA/H/ORCVBuAAIgAjCfH/OQTwlf/ouQAiokswRjlGBPAm/Q9GBkYE8NL/BEYE8LX8C0YCRjlGMEYE8GH7GvgEMLnx/z/YRk1GBkYPRgv4ATva0TBGOUYAIpNLqUbd+EigEJ3N+EiAzekQAd34fIATnh6fBPCM/4C73ekQAQAiiUsE8F3/CLHhByfUS0YAKwbbMCIBM1tEC/gBK1tF+9Gr6wUDuUYSkw+f//cUuybwIAMGky0i3ekUNJtGBPEAQx2SC5N25ymb//dcuQeb7Bjk5ima3/jUkf/3J7gSmyaTC5sb+AEs2XtbRopCCdEwIAP4AQwmm1oeJpIT+AEskUL20DkqC78LmgEyknrSsgP4ASzF5wqYWRwC8FD+BUYAKADwF4ENkDTnAiEAkQeZWkZMHCapBJEjqQORIqkLmwqYAZQCkQHwdPkFRrlGLEQPn6TmMCON+IQweCMP50VGiEYBMzJEByvN6SkyyPgAkMj4BGB/97WsDJkKmCiqA/DS/wAofvQKrd3pKTIN8awIqeQHmwArCL8BIweTR/SAcw+TFZsAK8DytoDd+FCwDZALkx2Q//dzuhmREJITkA+UD5oTmxyZE0QLmgH7AyMLkyPq43MGk//36boWm2Ym0xgZRAuRfuYAIw2TZOciqlhGC5kD8Aj/ACJP8H9TBPA5/AJGC0bN6RAjACIAIwTwmf4IsQEjIpMmSwuT6eZnJu3lEJsLk+LlFZsDIAAruL8tIk/wAAOov534gyAZRg2THU0eS7i/jfiDICfwgAcGkP73f70AKUTRMCKN+JIgDfGTAjAzAvgBOySr0xoak//3h7oG8Q8CASHSsv/3QbrD8QEDGkQi6uJzZyYLkgaTuuUZ8AEPP/R/qv/3ebopmP/3f7sAv1TcCAAAADBAAADgP4TcCABA3AgAONwIADzcCABYRgAiACMLmQTwPP4AKH/04a0Hm8PxAQMik9zl3/iYkK3kDfGSArznKZvf+IyQKOQHmgnwAQlZ6gIDBNEBI2YmBpMLk3/lFptmJgEzGkQi6uJzC5IGk3blDZDN5g6bmvgBYJJGU/gEKw6TQuricweT/vchuymb3/hAkLHkB5wG5wAjD5MTkzzn3/gskArnAiMak//3FboMmYuJQ/BAAhNGioH+9yS8T/D/MgwjCJIKmhNg/vcjvAC/hNwIAC3p+E9LbpBGnAQt1ZNoEmhDs4tGBkYC8QgJWekCWl/qmgcV0AAkBD0B4KdCDtBaRjBGVfgEHwLwY/lDHATxAQTz0QAjyOkBM73o+I/Y+AgwKvADCqPrCgPI+AgwCfEICQAr2tEAIOznAvDO+gAjyOkBM73o+I8Avy3p8E+9sBxGF0bN6QUwApEYsYNrACsA8HeCAppTbt4HQPGEgbL5DBCKspAECNRB9ABSAplLboqBI/QAU5KyS2YRB0Dx7IACmxtpACsA8OeAAvAaAworAPDwgBOrEJMAI83pETPN6QkzzekLMw3xTAkEkzt4ACsA8EaBPEYE4BT4AT8AKwDwIYElK/jR5RtA8B6BI3gAKwDwNoFP8AADACVP8P87T/ArCI34OzBjeAOVZxwBN6PxIAJaKgDyRoHf6BLwoQJEAUQBnQJEAUQBRAF8AkQBRAFqAFMCRAEpAq8CRAGrAlsAWwBbAFsAWwBbAFsAWwBbAEQBRAFEAUQBRAFEAUQBRAFEARMCeABEAUQBRAFEAUQBRAFEAUQBRAFEAdEARAFEAUQB9wFEAUECRAFEASEFRAFEAUQBRAFEAUQBRAFEAUQBRAETAnoARAFEAUQBNwJ6AHQARAEtAkQBaQLTAFcCdABEAfcBcgBBBUQBRAFDBUQBcgAAIaPxMAIX+AE7AeuBAQLrQQGj8TACCSr12QORjucFm1P4BCsAKgOSBZPA8rSBO3iD5zt4RfAgBX/nRfAQBawGBZ5A8WuBBzYm8AcGMkZzaFL4CGuYRgWSACvA8kmEu/H/PwDwMYVW6ggDJfCACgDwJYQKLnjxAAOA8OGEASNVRjA2jfjvYAGTDfHvBN34BICd+Dsw2EW4v9hGACsA8KiACPEBCKTgAp0GmClGAPD6/QAoQPCUhaqJAvAaAworf/QQrwKZsfkOMAAr//YKr0tu3gcC1JUFQPFihSNGOkYCmQaYPbC96PBPAPCavUXwEAUV8CAIAPADgQWeBzYm8AcGM0bW+ASAU/gIawWTACMl9IBqT/AAAo34OyC78f8/APDdgVbqCAIq8IAFQPDWgbvxAA9A8MyEACtA8MWDGvABAwGTAPDsgzAjDfHvBI347zCc5+UbG9ARmxKaATMqRAcryekAdRKSEZMF3AnxCAkEmytEBJPR5gAqAPCcgwKZBpgQqv/3Rf5AuQ3xTAnv5xKbACtA8BWFACMRkwKaU27ZB0DxooCTiVsGAPElhQSYPbC96PCPApuz+QwQjQWKsj/1eK4dRphtAvDR+rX5DBCKsm/mACvb0E/wAQiN+IwwT/AAAyOsjfg7MM34BIBP8AALFfACAweTGL8I8QIIFfCEAwiTBdEDm6PrCAYALgDzioLd6RESSByd+DtgdrEBIQEyDfE7BgcozekRAsnpAGEA81iCAUYJ8QgJATAHm9OxAiMCMsn4BDAHKA+rzekRAsn4ADBA82KCACoA8CeDApkGmBCq//fV/QAol9Hd6RESDfFMCUgcCJuAKwDwcYEBm6vrAwYALgDzz4EBmwcoGkTN6RECyfgAQMn4BDBA812BACoA8JOCApkGmBCq//ex/QAof/RzrxKaDfFMCWgHBdUDm6PrCAQALADzioLd6QMTQUWsv1sYQ0QEkwAqQPDzgQAjDfFMCRGTCOYCm5uJmgU/9VqvApygbQLwO/qjiVPnFfAQA0DwGIMV8EACAPAQgwWemEZW+AQ7BZaesvfmVvgEO+gGBZYA8RCDaQZA8QqDQ/PAOB6yQ0aP5k/wAAMFno34OzBW+ARLACwA8M+Du/H/PwDwQYNaRgAhIEYC8D39ACgA8CKEAxtP8AALBZYBk43mT/AAA0/wAQgFno34OzBW+AQ7I6yN+IwwBZbN+ASALecB8Mb9heUDm1tCA5M7eEXwBAXK5Tt4bCsDv3t4RfAgBQE3RfAQBcDlO3hoKwO/e3hF9AB1ATdF8EAFtuVF8BAKGvAgCADwfoIFngEjBzYm8AcGMkbW+ASAUvgIawWSkOY7eI34O4Cg5TAijfg8IHgiBZuN+D0gU/gEa75KBZNP8AAIAiNF8AIKCZJ65q4GAPGkguwGAPFZg2gGAPGwg6kFQPFTgwWeBJpW+AQ7GnAFllvlBpwgRgLwiflDaBhGC5P99yr/A0YgRgyTHEYC8H75g2gKkwAsP/TirQqbACs/9N6tCpsbeAArP/TZrTt4RfSAZVrlO3hF8AEFVuWd+DswACt/9MytICON+DswO3hM5Tt4RfCABUjlOUYR+AE7KisA8KaDo/EwAgkqD0ZP8AALP/Y8rRf4ATsL64sLAutLC6PxMAIJKvXZMOWqRgErP/TIrQIrPKwS0QmaBvAPA9NcNglG6gh2T+oYGAT4AT1W6ggD8tE8qxsbVUYBk77lBvAHA/YIRupIdk/q2AgwM1bqCAEiRgT4AT3x0RrwAQ/p0DAr59AwIwI6BPgBPDyrmxpVRhRGAZOh5QEjAZoTlBGTFJISkg3xTAkJ8QgJreYDm6PrCAYALn/3ia4QLt/4mKE43VNGzEa6RsFGB5SoRh9GBpwCnQfgAfECDgFGDPEIDBA+EC4e3RAjSBwQMgcozekRAsz4AHDM+AQw7N0AKgDwkoApRiBGEKr/9yr8ACh/9Oyt3ekREhA+EC4N8UwMAfEBDuDcO0ZFRldGyEZwRuFGmkYHnDJEByjN6RECyfgAoMn4BGBA85aBACoA8JqCApkGmBCq//cE/AAof/TGrd3pERIBmw3xTAmr6wMGAC4B8QEAf/cxrhAuQPNrgt/42KDMRlNGwUa6RqhGB5RP8BALH0YGnAKdB+AB8QIOAUYM8QgMED4QLhndSBwQMgcozOkAe83pEQLv3TKzKUYgRhCq//fO+wAof/SQrd3pERIQPhAuDfFMDAHxAQ7l3DtGRUZXRshGcEbhRppGB5wyRAcozekRAsn4AKDJ+ARgAPPpgAnxCAkBMOflT/ABDhFGDfFMDMbnApkGmBCq//eh+wAoP/QFrmHlT/ABDhFGDfFMDFbnACoA8N6AApkGmBCq//eP+wAof/RRrd3pERIN8UwJSBya5UDcCACk3AgAAiIBIA+rE5MN8UwJFJIBRgnxCAlIHKflEC5A80WC3ekRMt/48KIZRlNGzEa6RsFGDZSoRh9GBpwCnQfgAfECDgFGDPEIDBA+EC4c3RAjSBwQMgcozekRAsz4AHDM+AQw7N0ysylGIEYQqv/3S/sAKH/0Da3d6RESED4QLg3xTAwB8QEO4tw7RkVGV0bIRnFG4UaaRg2cMkQHKc3pERLJ+ACgyfgEYADzp4AJ8QgJSBwr5RFGT/ABDg3xTAzD52wHEZJQ1QObo+sIBAAsS90N8UwJECxA8/iB3/g4ohAlU0YRmbpGBp4fRt34CLAG4IgcGUYJ8QgJEDwQLBndSxwQMgcryekAdc3pETLw3TKzWUYwRhCq//f2+gAof/S4rN3pERIQPBAsDfFMCQHxAQDl3DtGV0aaRiJEByjJ6QCkzekRAn/3PK1ysQKZBpgQqv/32foAKH/0m6wSmjDlASARRg3xTAnH593pAyNCRay/mxhDRASTLeUAKj/0YK4CmQaYEKr/97/6ACh/9IGsEZgSmg3xTAkBMPHkB5sAK2nRASARRg3xTAnf5BGSDfFMCVjku/EAD3/03KtVRk/wAAs8rM34BLD/99y7GvAQA0DRGvBAAjnQBZ6YRlb4BCsBIwWWlrIQ5C0jdkKN+DswqkZP8AEDaOtICArkACpv0AKZBpgQqv/3f/oAKH/0QawN8UwJeOQ8rP/3tLsBRgnxCAkBMKbkFfQAeEDwHYEFm1P4BGsFk//35buqBQDxDoFP6uN4HkZDRv/3grsa9AB4QPD7gAWaASNS+ARrBZL/99S73ekEFlb4BCvLF8LpABMFlv/3vroCIg+rE5MN8UwJFJLH5iVKCZIV8CAINtAFngc2JvAHBjJG1vgEgFL4CGsFkuoHCdVW6ggCBtCN+D0wMCNF8AIFjfg8MAIjJfSAav/3o7uqRv/kFUoJktznIEYFlv33ZfxP8AALAZD/91K7nfg7EAApAPCmgAEgDfE7AhOSDfFMCQJGFJAW5BXwEAIU0RXwQAEN0AWekEZW+AQrBZaWssXnAL+U3AgAVNwIAEDcCAAV9AB4QPCmgAWaUvgEawWStecAIwr0gGLN+ASwzfgcoLtGzfggkJpGF0bd+CiQPK0M4AAjMEZBRgoi/fd5+QouePEAAxvTBkaIRiVGMEZBRgoiACP992z5MDJsHgrxAQoF+AEsAC/k0Jn4ADBTReDRuvH/D93QCi548QADLtLd+BygPKsbG19GzfgokN34BLBVRt34IJABk//34rqqRv/30roBK6pGf/QGrf/30boFngSaVvgEOxpgBZb/9wi6u/EGD9hGKL9P8AYIR0zN+ASABZb/93W73/gUocnlDJsLmeQaGkYgRv339/uZ+AEwC7EJ8QEJMEZBRgoiACNP8AAK/fcW+Z/nASARRg3xTAn/95+7B5sAK3/0460RRgEgDfFMCf/3lbsFnpBGVvgEKwEjBZbWsv/317pD88AYXrJDRv/3dLoFnpBGVvgEOwWW3rL/98a6BZ6IRlb4BCsFltayDecFngSaVvgEOxqABZb/9665iG0B8Ob9//eZus34BLAFloNG//dsuhGZEprf+GCgATHw5QKZBpgQqv/3I/kAKD/046r/9+O6EZjf+ESgATAx5gKbW27bBwfUApubiZ8FA9QCm5htAfC9/U/w/zMEk//31roFmnt4D0ZS+AQbBZJB6uF7//eTuWjcCACk3AgAlNwIAPC1T/SAbBVGACQGRh9GrfJsTRqrAJMEk4uJFqgj8AIDrfgMMEtuBpQZk8uJDEat+A4wy2nN+AjAB5NLas34FMAJkwHwf/0qRjtGaUYwRv/3C/kFHgfbaUYwRgHwHfkAKBi/T/D/Nb34DDBbBgPVo4lD8EADo4EWmAHwZv0oRg3ybE3wvTi1M0sFRhtoDEYLsZprErO0+QwwGAeasiXVIWkAKS3QEvABAAfQACVgaaVgQEKgYTmxACA4vZUHWL9gaaBgACn30RIGWL8IRvTVQ/BAA0/w/zCjgTi9GEYB8BD5tPkMMBgHmrLZ1NEGKtVSBxTUIWlD8AgDo4GasgAp0dEC9CBwsPUAf8zQIUYoRgHwIf20+QwwIWmassPnIWtRsQTxQAKRQgTQKEYB8GX6tPkMMAAiImMAIiFpI/AkA8TpABLX5wkiQ/BAAypgT/D/MKOBOL10CwAgAksTsQJIAPAFuHBHAAAAAA2xCAAAIwFGGkYYRgPwKrgt6fBPA2kMaYWwo0LA8omAATwB8RQFowAA8RQIAZNV+CQwWPgkIAEzikaaQgjrhAGBRrL78/YF64QHApE60wAhrkZARgpGo0YDlV74BFsEaKuyBvsDEy0MGQwG+wURm7LSGh/6hPyURIqywusUQgLrLEIf+oz8TOoCQ3dFQPgEO0/qEUFP6iJC39IBm1xGWPgDMAOdc7kCmwQ7mEUE0wfgmEUE8f80A9JT+AQpACr30Mn4EEBRRkhGAvAO+wAoLNtARgAjATZV+AQb0PgAwIqymhof+oz+CwxyRMPrHEMD6yJDkrJC6gNCr0JA+AQrT+ojQ+jSWPgkIAjrhANquQQ7mEUE0wfgmEUE8f80A9JT+AQpACr30Mn4EEAwRgWwvejwjwAgBbC96PCPAL8AAAAALenwT5BGmUYBbJmwBEbN6QSJJZ1BsQEjQmyTQItgSmAC8Gz4ACMjZLnxAAq0vwEjACMrYHZLvL8q8ABKzfgUoDPqCgMA8KqA3ekEIxBGGUYAIgAjzekKAQPwWv0HRnCxASMkmhNgJpsAKwDw5oJpSBhgQx4DkwOYGbC96PCPFqsBkxerAJMgRt3pCiMC8FL7X+oaVgVGQPCXgN3pFnY+RAbyMkAgKEDzt4PA8UAACvoA+gbyEkAo+gDwSuoAAAPwRfoBIwE+D5Oh8fhxACJSSwPw/vhIo9PpACMD8LH6SKPT6QAjA/D2+IBGMEaJRgPwPfpFo9PpACMD8KL6AkYLRkBGSUYD8Ob4gEaJRgPwSP0AIoNGACNARklGA/AD/QAoQPB+grvxFg8A8m2C3ekKATpLA+vLA9PpACMD8PP8AChy0AAjvhsOk3MeC/H/OwaTAPFgggAjCZO78QAPa9oJm834HLCj6wsDCZPL8QADDZMim0/wAAsJK2bYBStA80qDACYEOyKTIpsCOwMrAPJsht/oE/BhBF4EVQQ4BELyD3MkmsrzEwoTYFrqCAMa0SabACsA8GiGGksDkwgzJpoDmBNgGbC96PCP3ekKEsLzEwMIRkPwf1EPl6by/zYWn0H0QBFz5yabACtA8O+DDUsDk0HnAL+v8wCAYUNvY6eH0j+zyGCLKIrGP/t5n1ATRNM/AADwf3HcCAAAAPg/EN4IALjcCAC03AgAvhtzHgaTAPGKhA6QCZAGm1tEzekGOwAjDZMimwkrmNkAIyKTT/D/MwEmCJMAIwyWI5MAIQibYWQSkyBGAfAk/wOQACgA8ASGA5sjZAibDisA8hSBAC4A8BGBB5kAKUDzYISvSwHwDwID68IDCkbT6QBnT+ohGNEFQPEXhN3pCgGoS0/wAwrT6QgjA/Dv+s3pEAEI8A8IuPEADxPQ3/iEkhjwAQ8J0NnpACMwRjlGA/Cz+QZGD0YK8QEKX+poCAnxCAnt0d3pEAEyRjtGA/DO+oBGiUYOm0OxACJARklGkksD8Az8AChA8DWFUEYD8Cr5QkZLRgPwkPmMSwAiAvDW/6HxUHPN6RABEZMImwArAPCXgAebFJMImxOTDJsAKwDwqYQTmn5LACAD68IDU+kCI39JA/Cb+t3pECMC8LX/zekQAUlGQEYD8Bf8B0YD8Pr4AkYLRkBGSUYC8Kb/3ekQIwOeMDcG+AF7gEaJRgPwxvsAKEDwLoXN+FSwACfd6RCrEJUTnROUKuABN69CgPIuhVBGWUYAImdLA/A++QAiZUuCRotGQEZJRgPwNvmJRoBGA/Di+wRGA/DF+AJGC0ZARklGAvBx/zA0UkZbRgb4AUuARolGA/CS+wAoQPD4hEJGS0YAIFBJAvBf/1JGW0YD8IX7ACjI0N3pE0MQnQOaB5MC4JZCAPDNhLJGFvgBPTkr99ABM9uyM3AHmwEzB5PI4VBGA/CP+EJGS0YD8PX4P0sAIgLwO/+h8VBzzekQARGTQEZJRgAiPEsC8C7/3ekQiUtGQkYGRg9GA/Bu+4FGAChA8K+E3ekQAQJGAfEAQzBGOUYD8EP7AChA8EiDF5sAK8DyjIAHmg4qAPOIgCRLA+vCA9PpAKsjmwArG9oImwArGNxA8DGDACIjS1BGWUYD8LP4AkYLRt3pCgED8Cn73fggkE5GACgA8MqCI5vd+AyA30PM4lJG3ekKeFtGOEZBRgPwxPkD8Ej7gUYJkAPwKvhSRltGA/CQ+AOeC0YCRkFGOEYC8NH+CfEwAwb4ATsImwErAPBfgwaUASccRgSVKuAQ3ggA6N0IAAAA8D8AABxAAADgPwAAJEAAABRAUkZbRkBGSUYD8JL5A/AW+wVGAvD5/1JGW0YD8F/4ATcLRgJGSUZARgLwoP4F8TADp0IG+AE7APAsgwAiq0sD8E34ACIAI4BGiUYD8K/6ACjW0ASdBpwHm7JGATMHkwrhDJoAKj3QIpoBKkDzn4IImwPx/zgNm0NFwPJwgqPrCAgImwArwPJAgwaaGkQGkgmaF0YaRAmSASEgRgHwJf4GRiPgASO+Gw6Tcx4Gk3/1oK3G8QEDCZMAIwaTm+VYRgLwo/9CRktGA/Bx+gAof/R4rQvx/zt05YZLA5MDmBmwvejwj934NIAJnwyeAC8M3QaZACkLRgjduUKovztGCZr/GtIayxoJkgaTDZvjsQybACsA8GCCuPEADxDdMUZCRiBGAfC+/gZGKkYxRiBGAfAK/gNGKUYgRh1GAfAu/Q2bs+sIAkDw24IBISBGAfDN/bvxAA+BRgDzs4AimwErQPOIgU/wAAoBILvxAA9A8LSABpoQRBDwHwAA8JKAwPEgAwQrQPPTgwmbwPEcAANEAkQJkwdEBpIJmwArBd0pRhpGIEYB8Nr+BUYGmwArBd1JRhpGIEYB8NH+gUYOmwArQPA4gQibACtA8x6BDJsAK0Dwn4AHmwEzB5MBJ934DIDd+CCgB+ApRgAjCiIgRgHw3/wFRgE3SUYoRv/3uftXRQDxMAMI+AE77dsImgAnACrMv5NGT/ABCwOak0QpRgEiIEYEkwHwmv5JRgVGAfAM/wAoQPOrgRv4ATwDmgvx/zsE4FpFAPCtgRv4AT05KwvxAQr20AEzi/gAMElGIEYB8J38VrEvsbdCA9A5RiBGAfCV/DFGIEYB8JH8KUYgRgHwjfwAIweaivgAMCSbGmAmmwArP/RArAOYw/gAoBmwvejwjxwgCZsHRANECZMGmwNEBpNx5wEmtuTA8SAACPoA8E3kAUZaRiBGAfDs/SKbgUYBK0DztoFP8AAK2fgQMAnrgwMYaQHwtvzA8SAAQecAvwAAJEBw3AgAMUYAIwoiIEYB8Fb8EpsGRgArQPPpgs3pB4MALwDzHYG68QAPQPDZgbBGBJsImQPwAQIDmwqSH0YBOxlEIpsIkRNDCZNJRihG//cW+zFGg0YoRgHwff5CRklGgkYgRgHwl/7CaAFGC/EwAwAqQ9EEkChGBpMB8Gz+AkYEmSBGBJIB8BD8BJoGmxq5CZkAKQDwm4K68QAPwPJkgSKZSuoBCgqZUeoKAQDwXIEAKgDztoEImgfxAQqXQtNGO3AA8LSBKUYAIwoiIEYB8Pb7RkUFRjFGT/AAA0/wCgIgRhLQAfDr+0FGBkYAIwoiIEYB8OT7V0aARqbnIEYEkwHw0/sBIgSbxucB8Nj7V0YGRoBGmecimwIretwMmwArf/R+rwebSUYBMyhGB5P/96b63fgMsADxMAMAJwv4ATvz5klGKEYB8Ab+ACi/9sGuKUYAIwoiIEYB8LH7B5sFRgPx/zgMmwArf/RNrxKbACtA8zSCCJO35rBLA5MDM//39Lvd6QQSACl/9HOuwvMTAwArf/RurqlLE0AAKwDwAIIJm0/wAQoBMwmTBpsBMwaTYeYBIwyTI5sHmhNEEpMBMwErH0a4vwEnCJMAIRcvYWR/9x6sASIEI1sAA/EUALhCEUYC8QEC99lhZBHkASMMkyObACtM3R9GEpMIk+XnACMMk9jnACMMk/LnEpvN+ByACJMImwArf/RDrUlGBSIgRgHwTfuBRihGSUYB8JT9ACh/9zatMSMDmAefgEYA+AE7ATcDkElGIEYB8C/7exzd+AygB5PN+AyAAC5/9JGuk+YxRjpGIEYB8AD9Bkbb5g2bzfg0gKjrAwObRE/wAAiI5d3pCiNP8AIKzekQI//37rsBIyOTCJP/97e7A9EEm9gHP/VQrtpGG/gBPTAr+tBb5gebA5oBMweTMSMTcFTmD5oAKgDwKIED8jNDBprd+DSAGkQGkgmaF0YaRAmSZOVP8AAJTkbc5ClGIEYNmgHwYfwFRrHlDpBk5QDwEYHd6QoBB5pPS1ZCBvAPAgPrwgPT6QAjAvBs/TYRgEaJRgDwcIEAI0/wAgpHT/IHBtXX6QAjAvBd/QEjCvEBCnYQB/EIB/LRACs/9LGrgEaJRv/3rbsEmwArf/RGrt3pBBLC8xMDACs/9BivPeYAKhLdKUYBIiBGBJMB8Hn8SUYFRgHw6/wAKASbQPMXgTkrAPD7gAvxMQO6RgeaN0YBMkZGB5IK+AE74eUJlQacBJ0CRgtGAvBo+1JGW0aARolGAvCo/2C5UkZbRkBGSUYC8Hn/ACg/9MusCZvZB3/1x6wDmv/3/7sgRnFoAfA7+gdGACgA8AyBM2kG8QwBAjOaAAww/Pfd+jlGASIgRgHwMPyARhDmKUYgRgHwzvsFRh7l3ekII58awuQ5KwDwroC6RgEzsucHmjdGATJGRgeSd+W03AgAAADwfxDeCADo3QgA3fhMoINJ3ekQIwHrygFR6QIBAvDH/M3pEAFJRkBGAvBx/wZGAvBU/AtGAkZJRkBGAvAA+1NGA58wNgErgEaJRgf4AWsA8KyAE54Dmx5EACJxS0BGSUYC8KX8iUaARgLwUf+CRgLwNPwCRgtGQEZJRgLw4PoK8TAKB/gBq7dCgEaJRuTR3ekQAQAiZEsC8NT6QkZLRgLw+P4AKGLR3ekQIwAgXkkC8Mb6QkZLRgLwCv8AKD/0qasW+AE8skYwKwbx/zb40BSbATMHkzjlFpvD8TYD1eZP8AIK3ekKif/3wLoImwArP/RiqxKbACt/94yrE5MHmwAiATtARklGFJNGSwLwUPyARolGCvEBAALw4PtCRktGAvBG/EFLACIC8Iz6ofFQc83pEAERk//3vLoHmwEzB5MxI//3NLsHm7tGATMHkzkjN0YL+AE7RkbX5E/wAAlORknmmkZo5BCdE5yyRrDnFJsDmgeT//cUu3/07K7aB3/16a7i5t34VLAQnROc//dCuzkr2NC68QAPP/fartrmIpsCKz/3E67N+ByAnOU+Rm/nIpsCKz/3Cq4Sm834HIAIkw/lT/ACCv/3UboCRkDy6iEXSxhIAvCk+AAmIEYxRmZkAfAe+QOQeLkAIk/01XEQSxBIAvCV+BBLA5P/9/S4P/QzrMDxPAC15AObASIjZE/w/zMjlhKTDJIIk//3+7oAvxDeCAAAACRAAADgPwAAHEDE3AgA2NwIALjcCACx+Qwg+LUMRhEHB0ZD1GNoQvQAYgArooFb3aVqAC1W0AAjPmg7YJOyEvSAUlXRASM4RuFpqEdCHGXQo4mlalsHBdVjaMAaI2sLseNrwBoCRuFpACM4RqhHQRxA0TtoACs90B0rAdAWK1TRACKjiSP0AGOjgSNpxOkAMiFrPmAxswTxQAOZQgLQOEYA8Pv5ACMYRiNj+L0mac6xk7KaBxi/ACMlaAi/Y2kmYK0bo2AM4CtGMkbU+CTAOEbhaeBHsPEADKXrDAVmRBbdAC3w3AAg+L3jawAroNz55yBtr+cAIrT5DDBiYCP0AGMiaaOB2wQiYMLVIGXA56OJT/D/MEPwQAOjgfi9O2gAK5bQHSsG0BYrBNCjiUPwQAOjgfi9ACA+YPi9OLUFRgxGCLGDa6OxtPkMALixY27bBwHUgQUV1ShGIUb/91z/Y24FRtoHAtSjiZsFDtUoRji9APAX+LT5DAAAKOfRBUYoRji9oG0A8DP85eegbQDwMfwoRji9AL8BSQDw97sAvynQCAAt6fBHgkY5SADwIPza+DhAACxm0QQjAyI1Sdr4BFDK+DwQ3/jQkN/40IA0TzROCvU7ccrpuSHK+OBCIUbrYAgixekARMXpBERsZqxgrGEF8VwA/Pcl+cXpB1nF6QmH7mIF8VgAAPDu+9r4CFAlSyFG62AIIsXpAETF6QREbGasYKxhBfFcAPz3C/nF6QdZxekJh+5iBfFYAADw1Pva+AxQGUshRutgCCLF6QBExekERGxmrGCsYQXxXAD89/H4BfFYAMXpB1nF6Qp2xfgkgADwufsBIwVIyvg4ML3o8EcA8Le7Aki96PBHAPCyuxwtACDdrwgA+csIAB3MCABdzAgAfcwIAAkAAQASAAIAAUgA8J27AL8YLQAgAUgA8Jm7AL8YLQAgOLUISwhNWxucEAfQBDsdRAE8VfgEOZhHACz50b3oOEAC8Ia/TOAIAEjgCAAt6fBDg7AHRohGFEYA8Gj7ASgD0Qjx/zP+KzPZQkY4RgTxXAMBqQHwZ/5CHAZGL9AYs534BBAAJQ3xBQkI4CNoWhwiYBlwATW1QhbSGfgBG6NoATsAK6Ng8dqiaZNCAdsKKezRIkY4RgHw7v1DHOrRBkYwRgOwvejwg0ZGMEYDsL3o8INf+ojxBkaN+AQQ0ucwRqOJQ/BAA6OBA7C96PCDMLVTbhRGE/ABD7L5DDAFRoOwmrIB0ZgFHNWQBAbUYm5D9ABTQvQAUqOBYmYiRihG//eW/2NuBUbaBwLUo4mbBQLVKEYDsDC9oG0A8An7KEYDsDC9oG0BkQDwAPu0+QwwAZmastnnAL/4tQxGI08GRgDw7v67aF1oxPV+YyXwAwUPMytEI/R/YyPwDwOj9YBUtPWAXwfbACEwRgHwr/y7aCtEmEIE0DBGAPDY/gAg+L0wRmFCAfCi/AEwDdAQSrtoLRtF8AEFXWATaDBGGxsTYADwxP4BIPi9ACEwRgHwjvy6aIMaDyve3UPwAQNTYAVLA0kbaMAaCGDV5wC/EBEAICAtACAYFQAgACle0Pi1DEYGRgDwnf5U+AQseE+k8QgFIvABAWgY1/gIwENohEUj8AMDAPCHgNIHQ2A01FT4CCwH8QgErRoRRKpookJo0ADrAwzc+ATg1fgMwB7wAQ/C+AzAzPgIIADwkYBB8AEDa2ABYLH1AH8x0koJywgBIZFAemgBMxFDeWAH68MCV/gzEAg6xekCEkf4M1DNYDBGvej4QADwW77CGFJo0gcO1BlEB/EIBINoo0Jw0MJo2mCTYEHwAQNrYGlQ0+dwR0HwAQOx9QB/RPgEPAFgzdOx9SBvT+pRI0fSiwkD8TkAA/E4AsMA+Bj7WAg4mEJY0FpoIvADAopCAtmbaJhC99HYaMXpAjCFYDBG3WC96PhAAPAevsIYUmjSB2PUC0TQ6QISymCRYEPwAQJqYDBG61C96PhAAPAMvgtE0QcH1FT4CCytGhNE1ekCEspgkWBD8AECamAnSr1gEmiaQpjYJkswRhlo//f6/pLnFCsK2VQrH9gLCwPxbwAD8W4CwwCy5xlEkecD8VwAA/FbAsMAqudB8AEDx+kEVcXpAkRrYGlQducBIZIQAfoC8nloCkN6YKfns/WqfwbYywsD8XgAA/F3AsMAj+dA8lRSk0IG2IsMA/F9AAPxfALDAITnT/R+c34igOdB8AEDa2ABYFDnAL8QEQAgHBUAIFAtACCTaAArAPC3gC3p8E+x+QwwDEYZB4BGF0aDsJiyJdUjaRuzEPACAz1oLdBP8AALXkbf+LiiAC4A8IuAVkUzRlpGKL9TRkBG4WnU+CTA4EcAKEDzh4C7aINEGxo2GrtgACvo0QAgA7C96PCPIUZARv73DfwAKEDwNoG0+QwwPWiYshDwAgPR0RDwAQl20U5GAC5a0IIF1PgIsEDxtYCzRVpGAPLNgBD0kG8A8MuAI2ghaaPrAQtjaQPrQwoK69p6C/EBA0/qagozRFNFUkaEv5pGUkZDBUDx6oARRkBGAPCu+QAoAPD5gFpGIWkBkPv35v2iiQGbIvSQYkLwgAKigQPrCwAjYTJGqusLA7NGxPgUoKNgIGCyRgAmSUYBkgDwmPyjaCFoAZqj6wsDCkSjYCJguGjRRKDrCgC4YAAokdC0+QwAgLIALqTR1ekAlgg1nufV6QC2CDVt5yFGQEb/96D8gLO0+QwwT/D/MEPwQAOjgQOwvejwjwAgcEceRqpGmUYYRh1GVrMAKDLQSkYgaCFpskIovzJGiEJjaQTZoWgD6wELWkV03JNCZdwqRkBG4WnU+CTA4Eew8QAL0t256wsJytABILtoXUSj6wsDpusLBrtgACs/9EWvAC7U0QrxCANT+ARsmkZT+AhcCDMALvfQMkYKIShGAPDj+wAoadABMKDrBQnB5yBoI2mYQhvYY2mzQhjYb/AATLRFKL+0Rpz78/xKRgP7DPNARuFp1PgkwOBHsPEACpTdpusKBnjns0YyRiBoZuezRdpGKL+yRklGUkYA8P37o2giaKPrCgNSRKNgImAAK+fRIUZARv/3GPwAKOHQdecpRpNGAZIA8Oj7o2gBmpsao2AjaBpEImCV5ylGWkYA8Nz7I2ghRltEQEYjYP/3/fsAKIjQWudARgDw+/8DRgAof/Qir0BGIWn/95/9DCK0+QwwyPgAICPwgANJ53IckUZZ5wwitPkMMMj4ACBA50/w/zC85gC/APz/fy3p+ENP8AAJB0aIRgD1OHbW6QFUAT0Q1KOJAT0BKwjZtPkOMAEzBNAhRjhGwEdJ6gAJaxwE8WgE7tE2aAAu59FIRr3o+IMAvwFLk/goAXBHpA8AIABIcEeUEAAgcEcAv3BHAL9wRwC/cEcAvy3p8EGLiQxGmQeWsAjVASIE8UMDxOkEMiNgFrC96PCBtPkOEAZGACkn22pGAfBY/AAoIdsBnU/0gGgF9HBFpfUAVbX6hfVP9ABnbQlBRjBGAPBG+LT5DDDwsSBKQ/CAA/JjxPgUgKOBIGAgYTW7O0OjgRawvejwgaOJE/CABRnQT/BACDBGQUYAJQDwKfgvRrT5DDAAKODRmgW+1AEhI/ADAwTxQwJD8AIDxOkEIaOBImCy50/0gGgvRsfnMEa0+Q4QAfAh/BC5tPkMMM/no4kj8AMDQ/ABAxuyyOfdrwgALenwTwHxCwUWLQZGg7Al2BApAPK4gADwefsQJRgiT/ACDLVPOkRTaKLxCAGLQgDwt4BaaNloIvADAhpEnGgwRuFgjGBRaAPxCARB8AEBUWAA8GL7IEYDsL3o8I818AcFAPGRgKlCAPKOgADwT/u19fx/wPCUgWsKAPCMgAQrAPJqgasJA/E5DAPxOARP6swAmU84RENoCDiYQgbRDOAAKYDyJoHbaJhCBtBaaCLwAwJRGw8p892kRjxp3/hA4nRFetBiaCLwAwJTGw8rAPN2gQArx+kE7oDyZ4Gy9QB/gPAZgQEh0whSCQtEkUB6aFf4MwAKQwfrwwEIOaBg4WB6YEf4M0DEYAEhT+qsA5lAkUJZ2BFCBtEs8AMMSQARQgzxBAz60AfrzAlIRmRG0PgMgEBFCNEc4QArgPIhgdj4DIBARQDwFYHY+AQgIvADAlMbDyvw3QjrBQFF8AEFyPgEUDBG2OkCZPRgpmBD8AEEx+kEEUxgwekC7kj4AjAA8Mz6CPEIBALgDCMAJDNgIEYDsL3o8I9P9ABwT/BADD8kd+fTaJpCCL8M8QIMf/RCrzxp3/hI4XRFhNEBIXpoT+qsA5lAkUKl2bxoY2gj8AMJTUUD2KnrBQMPK3rc3/gksUlL2/gAIBtoATIrRATrCQoA8C+BA/WAUw8zI/R/aCjwDwhBRjBGAfBY+EEcAkYA8O+AgkUA8uqAPEsZaEFECEYZYADwSYHb+AAQAZMBMRu/ousKClBEy/gAIBhgEvAHCwDwEYHL8QgBCkTL9YBRkEQIMaHrCAHB8wsKUUYwRgCSAfAr+EIc3ekAIwDwS4GAGgDrCggZaEjwAQBRRLxCumAZYFBgAPAkgbnxDw9A8iKBT/AFDmBoqfEMDCzwBwwA8AEAQOoMAGBgvPEPDwTrDADA6QHuAPIugRRGUGgUSxpoikI4vxlgEksaaIpCOL8ZYJDgYhlD8AEDRfABBWVgMEa6YAg0U2AA8Bj6IEYDsL3o8I/ZaBpEouYAvxARACAYEQAgGBUAIFAtACAgLQAgSC0AIEwtACCy9SBvT+pSI1/TFCsA8rGAA/FcAckAWzN4GHlYCDiIQgDwj4BLaCPwAwOTQgLZiWiIQvfRyGh6aMTpAhCEYMxg1+YUK1nZVCsA8puAKwsD8W8MA/FuBE/qzACP5gE0owcA8QgAf/TYrlPgREZCRFNo2PgMEEPwAQNTYFT4CD8wRtlgi2AA8L759uZP6tUMBfEIAjzmIkRTaDBGQ/ABA1NgAPCw+Qg05+ZhGUXwAQVlYEPwAQXH6QQRMEbB6QLuTWCjUADwn/kINNbmkwkD8TkByQA4M6DnvEJe0LxoYGgg8AMIRUWo6wUDAtgPKz/3Zq8wRgDwh/kAJL7mA/FcDAPxWwRP6swAOeZZ+Ag5S0VA8JWAHPADDwzx/zz10XtoI+oBA3tgSQCZQj/2w64RucDmSQAENBlC+9CkRmnmA/EQCNTmASKbEJpAe2gaQ3pgc+cC6wgBSULB8wsKUUYwRgCSAPAg/0Mc3ekAI3/09a7aRvXmVCsm2BMLA/FvAckAbjNK57P1qn8m2OsLA/F4DAPxdwRP6swA8eUpSxhoQEQYYLbmyvMLDLzxAA9/9LGuvGjIREjwAQBgYPXmFEbz5gEjU2CV57P1qn8k2NMLA/F4AckAdzMg50DyVFKTQiTYqwwD8X0MA/F8BE/qzADG5avxCAvYRE/wAAqo6wIIr+YE8QgBMEYAk//3U/q8aACbYGgZaMjmQPJUUYtCC9iTDAPxfQHJAHwz9+ZP9H5wT/B/DH4ko+VP9H5xfiPt5ntocecgLQAggrBJsVqxa7ETeAtgEngQHhi/ASACsHBHAakAKvPREEYCsHBHb/ABAPTnAL9f+oH8gQcQ0ANGUR4quQrgmgcYRgrQATkF0xhGE/gBK2JF9dFwRwAgcEcRRgMpDNgAKfjQA0YBRAHgi0Lz0BhGE/gBK2JF+NHs5wJGELVM6gwkROoERBBGA2gEMmNAo/EBPi7qAwMT8IA/BNEEOQMpEEbw2FGxA0YBRAHgi0IF0BhGE/gBK2JF+NEQvQAgEL2IQg3ZixiDQgrZAOsCDLqxYkYT+AHNmUIC+AHN+dFwRw8qDtgDRgLx/zxKsQzxAQwBO4xEEfgBK2FFA/gBL/nRcEdA6gEDmwdP0aLxEANwtQHxIAwj8A8FAfEQDgDxEASsRBsJXvgQXA7xEA5E+BBcXvgcXBA0RPgcXF74GFxE+BhcXvgUXOZFRPgUXOrRATMS8AwPAesDEQLwDwQA6wMTJ9CORgQ8JPADBk/qlAweRBwfXvgEW0T4BF+0QvnRDPEBBALwAwID64QDAeuEAQLx/zxKsQzxAQwBO4xEEfgBK2FFA/gBL/nRcL0DRgLx/zyc5yJG6+cAvwFI//cDvAC/FC0AIAFI//f/uwC/FC0AIDi1w2wFRgxGS7FT+CQAgLECaEP4JCAAI8DpAzM4vSEiBCEA8I3/A0boZAAo7dEAIDi9ASEoRgH6BPVqHZIAAPB//wAo89DA6QFF5OcxscNsSmhT+CIACGBD+CIQcEcAvy3p8EFP8AAODkYcRg1pB0YB8RQAAWgO8QEOi7IC+wNDCQxP6hNMAvsBzJuyA+sMQ3VFQPgEO0/qHETr3Dyxs2irQgfdBuuFAwE1XGE1YTBGvejwgXFoOEYBMf/3of+ARqixMmkG8QwBAjKSAAww+/dF+PtscmhT+CIQMWBD+CJgRkYG64UDATVcYTVh3+cCRrUhAksCSADwA/8Av8TcCABo3QgAAgwSBANGyrkQIINAE/B/TwS/GwIIMBPwcE8EvxsBBDAT8EBPBL+bAAIwACsF2xPwgE8A8QEACL8gIHBHACDl5wNoAkYT8AcACdDZBx/UmAdLv1sImwgBIAIgE2BwR5myCbkQIMNA2bIJuQgwGwoZBwS/GwkEMJkHBL+bCAIw2QcD1FsIAPEBAAPQE2BwRwAgcEcgIHBHAL84tcNsBEYNRkuxWGiwsQJoWmAAIgEjRWHA6QMjOL0hIgQhAPC//gNG4GQAKO3RACJP9KBxB0sISADwlP4cIgEhIEYA8K/+ACjx0AEiAiPA6QEj3ufE3AgAaN0IAC3p8E8OaRVpiEauQhRGhbAF2ypGI0Y1RgxGFkaYRqNoYWivGbtCuL8BMf/37f4BkAAoAPCHgAGbA/EUCQnrhwrRRQXSS0YAIkP4BCuaRfvYCPEUCAjrhgsE8RQD2EUaRgPrhQVf0isbFTsj8AMDBDMVNKVCOL8EI83pAqesRh9GkkYF4AAMKdHDRQnxBAlI2Vj4BAuFsgAt9NBWRkxGACNW+AQLIWiCsh/6gf4F+wLuAAwKDAX7ACJzRALrE0KbskPqAkO0RUT4BDtP6hJD59hJ+AcwWPgEDAAM1dDZ+AAwVEYZRk1GACImiAkMAPsGEZuyCkRD6gJDRfgEO1T4BGspaDYMi7IA+wYzpEUD6xJDT+oTQujYw0VJ+AcwCfEECbbY3ekCpwAvAtwF4AE/A9Ba+AQ9ACv50AGbGEYfYQWwvejwjwJGQPJdEQJLAkgA8Nv9AL/E3AgAaN0IABLwAwMt6fBBFEYHRi7RDkakEBzQvWyVs+MHT/AACAbUZBAU0ChoqLEFRuMH+NUqRjFGOEb/9zb/trFxaPtsZBBT+CEgMmBD+CFgBkbq0TBGvejwgSpGKUY4Rv/3I/8oYAVGwPgAgODnBkbZ5w9KATtS+CMgACP/90n+BkbI5wEhOEb/9xP+BUZAsUDycSMBIsDpBCMAI7hkA2C95wJGT/SgcQNLA0gA8IH9AL/Y3ggAxNwIAGjdCAAt6fBHDEYmaaNoButiFnUcnUKQRgdGSWhP6mIZBN1bAJ1CAfEBAfrcOEb/9+P9AChR0LnxAA8A8RQBD90LRk/wAAwJ8QUCT+qCDgDrggJD+ATLk0L70a7xFAMZRCJpBPEUAxjwHwgD64IMLNCORk/wAArI8SAJGmgC+gjyQuoKAk74BCtT+AQrnEUi+gn68tis6wQDFTsj8AMDBDME8RUClEU4vwQjuvEADxi/LkZB+AOg+2xiaAZhU/giECFgQ/giQL3o8IcEOVP4BCucRUH4BC/52O3nAkZA8tkRAUsCSADwCP3E3AgAaN0IAIRGC2kAacAaFdEM8RQMFDEM64MCELQB64MDAeCURQjSUvgETVP4BB2MQvfQBNJP8P8wELxwR3BHASAQvHBHAL8t6fhPDGkTaYlG5BoALBdGfdEB8RQGFDIC64MCBuuDAwHgnkJ20lP4BF1S+AQdjUL30GfT2fgEEP/3Rv0AKHPQ2fgQUMRgAPEUBCZGT/AACjtpCfEUCAfxFA4J8RAMCOuFAg7rgwlc+AS/XvgEGx/6i/NTRB/6gfoJDKPrCgPB6xtBAesjQZuyQ+oBQ/FFRvgEO0/qIUrm2KnrBwEVORU3uUUh8AMGBvEEBji/BCYh8AMBOL8AIbBEQkUmRAxEGNk3RkRGVPgEG4uyU0RP6iNKCusRQZuyQ+oBQ6JCR/gEO0/qIUru2FQepOsIBCTwAwQ0RCO5VPgEPQE9ACv60AVhvej4j0tGASS5Rh9Gkuf52wAkj+cAIf/31/xgsQEiACPA6QQjvej4jwJGT/QQcQVLBUgA8En8AkZA8jIhAUsCSADwQvzE3AgAaN0IAHC1ASGCsBZGHUb/97f8BEYAKEzQK0bF8wpVw/MTAw2xQ/SAEwAuAZMi0GhGAJb/90f9ACg30AGbAJnA8SACA/oC8gpDw0ABk2JhACsUvwIhASGjYSFhtbEGm6XyM0UFRB1gB5vA8TUAGGAgRgKwcL0BqP/3Jf0BIwGaGUZiYSAwI2EALejRBOuBAqDyMkMQaQaaE2D/9/T8wOtBESBGB5sZYAKwcL3d6QAjYmHN5wJGQPIKMQFLAkgA8OD7xNwIAGjdCAAt6fhPFkYAKQDwmIAG8QsFgEYMRv/3RPwWLV3YECUqRq5CXthU+AQcpPEICSHwAweXQmLavEsJ6wcA0/gIwIRFAPCXgND4BMAs8AEDA0RbaNsHaNQs8AMMB+sMA5NCR9rLBxDUVPgIPKnrAwra+AQwI/ADAYxEvESURYDyEYF7GJNCgPLogDFGQEb/94P4BkbgsVT4BDyg8QgCI/ABA0tEk0IA8NKAOh8kKgDy9YATKgDyrIADRiJGEWgZYFFoWWCSaJpgIUZARv73Rv1ARv/37fswRr3o+I8l8AcFAC0qRp7aDCMAJsj4ADAwRr3o+I8fRtDpAiPTYJpgexsPKyLY2fgEMAPwAQM7Q8n4BDBPRHtoQ/ABA3tgJkZARv/3xvswRr3o+I/JB63UVPgIPKnrAwra+AQQIfADAaDnEUa96PhP//cnuNn4BBBD8AEDAfABASlDyfgEEAnrBQFLYE9Ee2hARkPwAQMIMXtg/vf0/NLn3PgEACDwAwsH6wsMBfEQAIRFTdrJBz/1fa9U+AgcqesBCtr4BBAh8AMBi0S7RFhFP/dsr1ZG2vgMEFb4CA86HyQqwWCIYADy24ATKkDy1oAhaBsqyvgIEGFoyvgMEADy4IAINArxEAIhaBFgYWhRYKFokWCr6wUCCusFAULwAQKZYEpg2vgEMEBGA/ABAx1DyvgEUP/3Uftu5yNoGyoDYGNoQ2Bo2ATxCAIA8QgDSucJ6wUCrOsFDJpgTPABA1NgVPgEPEBGA/ABAx1DRPgEXP/3M/smRk/nUPgEPCPwAwMfRFHnVkba+AwQVvgIDzofJCrBYIhgTNgTKkjZIWgbKsr4CBBhaMr4DBBW2Ag0CvEQAh9GI2jRRhNgY2hTYKNoNEaTYDDnIUb/94X6EedWRtDpAhPLYJlgVvgIH9r4DDA6HyQqy2CZYC3YEyop2SNoGyrK+AgwY2jK+AwwQtgINArxEAMiaGdGGmBiaNFGWmCiaDRGmmAH56NoJCqDYONow2Am0ATxEAIA8RAD2+YyRr/nIUYwRh9G0Ub/90z6NEby5jNG3uchRjBGZ0bRRv/3Qvo0RujmEBEAIKFoJCrK+BAQ4WjK+BQQINAQNArxGAKf5yNpBPEYAgNhY2lDYQDxGAOw5qNoJCrK+BAw42jK+BQwItAQNArxGAOz5zJGM+chRjBG//cX+hdLM+ciaRg0yvgYIFT4BCzK+BwgCvEgAnfnoWgkKsr4EBDhaMr4FBAO0BA0CvEYAhbnI2kYNMr4GDBU+AQ8yvgcMArxIAOJ5yJpGDTK+BggVPgELMr4HCAK8SACAOcQEQAg+LUAJ9/4XMAh8ABDY0UERg1GF2Aj3IRGU+oMDB/Q3/hIwBZGAeoMDApGvPEADwnRACIOSwDwGv1v8DUHBEYKRiHwAEMi8P9CGxUi9OACo/L+MztEQvB/VTNgRfQAFSBGKUb4vf//738AAPB/AABQQwAiOLUGTQRGCEYqYPn3FPxDHADQOL0raAAr+9AjYDi9VC0AIBC1DEax+Q4QAPDI+gAoA9sjbQNEI2UQvaOJI/SAU6OBEL0Avy3p8EEMRrH5DBAfRssFBUYWRgvUIfSAUaGBO0YyRihGtPkOEL3o8EEA8CC5tPkOEAIjACIA8Ir6tPkMEOrnAL8QtQxGsfkOEADwgPqjiUIcDr8j9IBTQ/SAUyBlo4EQvbH5DhAA8Lq5LenwT5NokUaDsAArbtAXaIBGDEYIaI1oCDdE4LT4DMAc9JBvLtDU6QQTRRoD60MDA+vTc6oZT+pjClMcU0VSRoS/mkZSRhz0gG820BFGQEb+9yL+ACg60CpGIWkBkPr3W/qiiQGbIvSQYkLwgAKigVgZqusFBaVgxPgUoDVGskYjYSBgWUZSRv/3EPnZ+AgwoWggaE0bUESeG6VgIGDJ+AhgHrMIN1fpArYALvrQtUKqRrPZNUayRuTnQEb/9yL9A0YAKNTRQEYhaf73x/oMIwAiT/D/MMj4ADCjiUPwQAOjgcnpASIDsL3o8I8AIxhGyfgEMAOwvejwjwC/+LUGRg1GFEYQsYNrACtD0LT5DCCjaRAHo2CRshvVI2nLse2yiQQvRiLVImhhadMamUIp3QEzoWgBOaFgURwhYBVwYmmaQirQo4nbBwHVCi0l0DhG+L0hRjBG/PfH/yC7tPkMIO2ykbKJBC9GI2nc1EL0AFKigWJuYWki9ABSYmYiaNMamULV3CFGMEb+97j4WLkBIyJozuf+9+b4uOchRjBG/vet+AAo09BP8P830OdwtQVGHEaEsDmxC07W+OBgsEdDHAnQBLBwvQpGBknR+OBgAamwR0Mc9dEAIoojImArYASwcL0Av6QPACADRkmx/yoC2AEgCnBwR4oiT/D/MBpgcEcIRnBHOLUMRhFGACKERgdNIEYqYBpGZEb497D+QxwA0Di9K2gAK/vQI2A4vVQtACAt6fBH3/h8oAZG2vgAAJhGD0aRRv73tPwbSxto0/hIQSSzZWgfLSbcXrlrHAI12vgAAGNgRPglcP73pPwAIL3o8IcBIwTrhQHB+IiQ1PiIIatAGkMCLsT4iCHB+AiB5NHU+IwhE0PE+Iwx3ucD9aZ0w/hIQdXn2vgAAP73g/xP8P8w3OegDwAgLNwIABRGALUaRgpLDUYbaIWw3mgDRkyxB0kBkTBGB0kClACVAPDI+ADwLPkESQxG8+cAv3QLACDk3ggA9N4IACjcCAA4taH7AhSEu/73yPwFRtixUPgELCLwAwIEOiQqFtgTKhnZGyrA6QBEHNkAIyQqFL8A8RACAPEYAsDpAkQEvwRhRGHC6QAzk2AoRji9IUb691v5KEY4vQJGACMoRsLpADOTYDi9APEIAvbnAPAX+AwjACUDYOjnAL8AIji1Bk0ERghGKmD59yL6QxwA0Di9K2gAK/vQI2A4vVQtACABSxhocEcAv3QLACBwtQApS9AGRgxGELGDawArSNBjbtgHNNW0+QwwACs+0CFGMEb99wb/42oFRjOxMEbhaZhHACi4v0/w/zWjiRoGO9Qha0GxBPFAA5lCAtAwRv73MvkAIyNjYWwhsTBG/vcr+QAjY2T+9zH4ACJjbqKB2wcn1aBt/vfH+/73LfgoRnC9o4mZBcvUoG3+97/7tPkMMAArxNFlbhXwAQUI0AAlKEZwvf33jP9jbtgHtNTo56Bt/vet+yhGcL0wRiFp/vf7+L7noG3+96P70+cOtAC1B0qCsAOrAUYQaFP4BCsBk/v3Iv8CsF34BOsDsHBHAL90CwAgcLUAJgdNBEYIRhFGLmD595P5QxwA0HC9K2gAK/vQI2BwvQC/VC0AIAAiOLUGTQRGCEYqYPn3hvlDHADQOL0raAAr+9AjYDi9VC0AIDi1DEYRRgAihEYHTSBGKmAaRmRG+fdy+UMcANA4vStoACv70CNgOL1ULQAgOLUMRhFGACKERgdNIEYqYBpGZEb59/75QxwA0Di9K2gAK/vQI2A4vVQtACAGIAi1APAE+AEg+fdN+QC/OLUVSx8oHWgg2NX43CIERmKxUvggMEuxASsV0FkcD9AAJUL4IFCYRyhGOL0oRgDwKfgiRgFGKEa96DhAAPAOuBYjASArYDi9ACA4vRYjT/D/MCtgOL0Av3QLACBwtQAmB00ERghGEUYuYPn3H/lDHADQcL0raAAr+9AjYHC9AL9ULQAg+fcUuYHwAEEC4AC/g/AAQzC1T+pBBE/qQwWU6gUPCL+Q6gIPH79U6gAMVeoCDH/qZFx/6mVcAPDigE/qVFTU61VVuL9tQgzdLESA6gICgeoDA4LqAACD6gEBgOoCAoHqAwM2LYi/ML0R8ABPT+oBMU/0gBxM6hExAtBAQmHrQQET8ABPT+oDM0zqEzMC0FJCY+tDA5TqBQ8A8KeApPEBBNXxIA4N2wL6Dvwi+gXygBhB8QABA/oO8oAYQ/oF81lBDuCl8SAFDvEgDgEqA/oO/Ci/TPACDEP6BfPAGFHr43EB8ABFB9VP8AAO3PEADH7rAABu6wEBsfWAHxvTsfUAHwzTSQhf6jAAT+o8DATxAQRP6kRSEvWAD4DwmoC88QBPCL9f6lAMUPEAAEHrBFFB6gUBML1f6kwMQEFB6wEBATwov7H1gB/p0pHwAA8EvwFGACCx+oHzCL8gM6PxCwOz8SACDNoMMgjdAvEUDMLxDAIB+gzwIfoC8QzgAvEUAti/wvEgDAH6AvEg+gz83L9B6gwBkEDkGqK/AesEUSlDML1v6gQEHzwc2gw0DtwE8RQExPEgAiD6BPAB+gLzQOoDACH6BPNF6gMBML3E8QwExPEgAiD6AvAB+gTzQOoDAClGML0h+gTwKUYwvZTwAA+D9IATBr+B9IARATQBPU7nf+pkXBi/f+plXCnQlOoFDwi/kOoCDwXQVOoADAS/GUYQRjC9keoDDx6/ACEAIDC9X+pUXAXRQABJQSi/QfAAQTC9FPWABDy/AfWAETC9AfAARUXw/kFB9HABT/AAADC9f+pkXBq/GUYQRn/qZVwcvwtGAkZQ6gE0Br9S6gM1keoDD0H0ACEwvQC/kPAADwS/ACFwRzC1T/SAZATxMgRP8AAFT/AAAVDnAL+Q8AAPBL8AIXBHMLVP9IBkBPEyBBDwAEVIv0BCT/AAAT7nAL9CAE/q4gFP6jEBT+oCcB+/EvB/Q5Pwf0+B8GBRcEcy8H9CCL9wR5Pwf08Ev0H0ACFwRzC1T/RgdAHwAEUh8ABBHOcAv1DqAQIIv3BHMLVP8AAFCuBQ6gECCL9wRzC1EfAARQLVQEJh60EBT/SAZATxMgRf6pFcP/TYrk/wAwJf6twMGL8DMl/q3AwYvwMyAuvcAsLxIAMA+gP8IPoC8AH6A/5A6g4AIfoC8RREveYAv3C1T/D/DEz04Gwc6hFUHb8c6hNVlOoMD5XqDA8A8N74LESB6gMGIepMUSPqTFNQ6gE1GL9S6gM1QfSAEUP0gBM40KD7As5P8AAF4fsC5QbwAELg+wPlT/AABuH7A1ac8AAPGL9O8AEOpPH/BLb1AH9k9UB0BNJf6k4ObUFG6wYGQurGIUHqVVFP6sUgQOpeUE/qzi608f0MiL+89eBvHti+8QBPCL9f6lAOUPEAAEHrBFFwvQbwAEZG6gEBQOoCAIHqAwG061wEwr/U6wwFQeoEUXC9QfSAEU/wAA4BPADzq4AU8TYP3r8AIAHwAEFwvcTxAAQgPDXaDDQb3ATxFATE8SAFAPoF8yD6BPAB+gXyQOoCAAHwAEIh8ABBEOvTcCH6BPZC6wYBXupDDgi/IOrTcHC9xPEMBMTxIAUA+gTzIPoF8AH6BPJA6gIAAfAAQRDr03BB8QABXupDDgi/IOrTcHC9xPEgBQD6BfJO6gIOIPoE8wH6BfJD6gIDIfoE8AHwAEEh+gTyIOoCAADr03Be6kMOCL8g6tNwcL2U8AAPD9EB8ABGQABB6wEBEfSAHwi/ATz30EHqBgGV8AAPGL9wRwPwAEZSAEPrAwMT9IAfCL8BPffQQ+oGA3BHlOoMDwzqE1UYv5XqDA8M0FDqQQYYv1LqQwbR0YHqAwEB8ABBT/AAAHC9UOpBBga/EEYZRlLqQwYZ0JTqDA8C0VDqATYT0ZXqDA8F0VLqAzYcvxBGGUYK0YHqAwEB8ABBQfD+QUH0cAFP8AAAcL1B8P5BQfR4AXC9cLVP8P8MTPTgbBzqEVQdvxzqE1WU6gwPleoMDwDwp/ik6wUEgeoDDlLqAzVP6gExAPCIgE/qAzNP8IBVReoTE0PqEmNP6gIiReoRFUXqEGVP6gAmDvAAQZ1CCL+WQkTx/QQE9UB0AtJbCE/qMgK2GmXrAwVbCE/qMgJP9IAQT/QALLbrAg516wMOIr+2GnVGQOoMAFsIT+oyArbrAg516wMOIr+2GnVGQOpcAFsIT+oyArbrAg516wMOIr+2GnVGQOqcAFsIT+oyArbrAg516wMOIr+2GnVGQOrcAFXqBg4Y0E/qBRVF6hZ1T+oGFk/qwwND6lJzT+rCAl/qHBzA0RH0gB8L0UHqAAFP8AAAT/AATLbnEfSAHwS/AUMAILTx/QyIv7z14G8/9q+utesDDAS/tusCDF/qUAxQ8QAAQesEUXC9DvAATk7qETEU61wEwr/U6wwFQeoEUXC9QfSAEU/wAA4BPJDmReoGDo3mDOoTVZTqDA8Iv5XqDA8/9DuvlOoMDwrRUOoBNH/0NK+V6gwPf/QlrxBGGUYs55XqDA8G0VLqAzU/9P2uEEYZRiLnUOpBBhi/UupDBn/0xa5Q6kEEf/QNr1LqQwV/9OuuEudP8P88BuAAv0/wAQwC4AC/T/ABDE34BM1P6kEMf+psXE/qQwwYv3/qbFwb0AGwUOpBDAy/UupDDJHqAw8Cv5DqAg8AIHBHEPEAD5HqAw9Yv5lCCL+QQiy/2Bdv6uNwQPABAHBHT+pBDH/qbFwC0VDqATwH0U/qQwx/6mxc1tFS6gM809Bd+AQLcEcAv4RGEEZiRoxGGUZjRgDgAL8Btf/3t/8AKEi/EPEADwG9TfgI7f/39P8MvwEgACBd+Aj7AL9N+Ajt//fq/zS/ASAAIF34CPsAv034CO3/9+D/lL8BIAAgXfgI+wC/TfgI7f/3zv+UvwEgACBd+Aj7AL9N+Ajt//fE/zS/ASAAIF34CPsAv0/qQQx/6mxcAtFQ6gE8CtFP6kMMf+psXALRUuoDPALRT/AAAHBHT/ABAHBHT+pBAhL1ABIV0hHVb/R4c7PrYlIS2U/qwSND8ABDQ+pQUxHwAE8j+gLwGL9AQnBHT/AAAHBHUOoBMAXREfAAQAi/b/AAQHBHT/AAAHBHAL8lMDh4AAAAAENXTElURV9BVlJJU1AAAAABAQEAAAEAAEAgaDAiKjIYJCw1TAgaAAAjIzMjIyMAACYmNiYmJgAAQXByICA0IDIwMjMAMTU6MzY6NTAAAAAAAAAAAAAAAAAAqqqqqqqqqqru7u7u7u7u7v7//////////////3+/3+/3+/38fr/f7/f7/X4AAABFeGl0aW5nIHdpdGggc3RhdHVzICVkLgoAAAAAeAsAIElORgBpbmYATkFOAG5hbgAwMTIzNDU2Nzg5YWJjZGVmAAAAADAxMjM0NTY3ODlBQkNERUYAAAAAKG51bGwpAAAwAAAAICAgICAgICAgICAgICAgIDAwMDAwMDAwMDAwMDAwMDAgICAgICAgICAgICAgICAgMDAwMDAwMDAwMDAwMDAwME5hTgBJbmZpbml0eQAAAABCYWxsb2Mgc3VjY2VlZGVkAAAAAC9tbnQvd29ya3NwYWNlL3dvcmtzcGFjZS9HQ0MtMTAtcGlwZWxpbmUvamVua2lucy1HQ0MtMTAtcGlwZWxpbmUtMzM4XzIwMjExMDE4XzE2MzQ1MTYyMDMvc3JjL25ld2xpYi9uZXdsaWIvbGliYy9zdGRsaWIvZHRvYS5jAAAAQwAAAFBPU0lYAAAALgAAAC9tbnQvd29ya3NwYWNlL3dvcmtzcGFjZS9HQ0MtMTAtcGlwZWxpbmUvamVua2lucy1HQ0MtMTAtcGlwZWxpbmUtMzM4XzIwMjExMDE4XzE2MzQ1MTYyMDMvc3JjL25ld2xpYi9uZXdsaWIvbGliYy9zdGRsaWIvbXByZWMuYwAAAIDgN3nDQUMXbgW1tbiTRvX5P+kDTzhNMh0w+Uh3glo8v3N/3U8VdQAAAAAAAPA/AAAAAAAAJEAAAAAAAABZQAAAAAAAQI9AAAAAAACIw0AAAAAAAGr4QAAAAACAhC5BAAAAANASY0EAAAAAhNeXQQAAAABlzc1BAAAAIF+gAkIAAADodkg3QgAAAKKUGm1CAABA5ZwwokIAAJAexLzWQgAANCb1awxDAIDgN3nDQUMAoNiFVzR2QwDITmdtwatDAD2RYORY4UNAjLV4Ha8VRFDv4tbkGktEktVNBs/wgET2SuHHAi21RLSd2XlDeOpEBQAAABkAAAB9AAAALCBmdW5jdGlvbjogAAAAAGFzc2VydGlvbiAiJXMiIGZhaWxlZDogZmlsZSAiJXMiLCBsaW5lICVkJXMlcwoAAAAgICAgICAgICAoKCgoKCAgICAgICAgICAgICAgICAgIIgQEBAQEBAQEBAQEBAQEBAEBAQEBAQEBAQEEBAQEBAQEEFBQUFBQQEBAQEBAQEBAQEBAQEBAQEBAQEBEBAQEBAQQkJCQkJCAgICAgICAgICAgICAgICAgICAgIQEBAQIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA+LUAv/i8CLyeRnBHQZ4IAOEACAD4tQC/+LwIvJ5GcEe9AAgACI7/fwEAAAAQtYKwBJyTs4RGAGjJskHwtEFA9IAwzPgAAMz4BBDc+AgQAZEBmBDwAQD40WSxA+uEDsP1ACSu8QQOBDsENOFYQ/gEH3NF+tHSskLwtELM+AQg3PgIMAGTAZvbB/nV3PgAMCP0gDPM+AAwArAQvQIgArAQvQFgcEeCsEFgg2gBkwGb2wf61QGYAPAGAAKwcEe/81+PATj70XBHAABP9IBjGUgaSRpKA2ALYBNq2wEE1BhLE2KTbtgH/NUVShZLE2KTbtkD/NUTaxFII/ADA0PwAQMTY4NuGwf81RBLDEmDYotumAf81REjCUoLY5NuGQf81RIjBkkTY4tuGwf81QhLCEoaYHBHAL8ACA5AAAoOQAAEDkAJCDcACQg3AQE/DyBcCQAgANi4BRRLmEIF0gAjE0kUSgtgE2BwRxNLmEIG0k/0gHMOSQ9KC2ATYHBHD0uYQgbYT/QAcwlJCkoLYBNgcEcLSwZJmEKUv0/0QHNP9IBjBEoLYBNgcEcAvwA2bgEACA5AAAoOQABaYgL/oUoE/7wBBTAwMDAwMDAwMDAwMERFQURCRUVGAAAAAAAAAAAAAAAAAAAAAAAAAGCAAQCBAQCQAQCRAQGSAReUASGYAwaeAwGhAQCkAwAgAMABAAEzMgAAABJ6AAAJPQCAhB4AQEIPACChBwCQ0AMASOgBAIJ4AQAgXwEA80gBAGg1AQAPJAEAjRQBAJsGAQAA+gAAje4AABvkAACJ2gAAnckAABrCAAAhuwAAo7QAAOyoAACdowAA8ZkAAIaVAABojQAAH4YAAI5/AACZeQAALHQAADZvAACoagAAfGQAAMBgAAClWwAADVcAAOVSAAAeTwAAq0sAAIJIAACvRAAAEkIAAOE+AAD8OwAAuDgAAFo2AACoMwAANzEAAP8uAAD3LAAAwCoAAL8oAADrJgAA/CQAAHkjAACkIQAALyAAAKseAABKHQAA4RsAAJkaAABOGQAAIhgAAPcWAADnFQAA7xQAAOUTAAAGEwAAGRIAAEIRAABxEAAAsw8AAO8OAAA9DgAAkg0AAO4MAABZDAAAwwsAADULAACuCgAAMwoAALQJAABBCQAA0QgAAGgIAAAECAAApAcAAEoHAADzBgAAnwYAAE8GAAADBgAAvAUAAHYFAAA1BQAA9wQAALwEAACDBAAATQQAABkEAADoAwAAuQMAAI0DAABiAwAAOgMAABMDAADuAgAAywIAAKoCAACKAgAAawIAAE4CAAAzAgAAGAIAAP8BAADnAQAA0QEAALsBAACmAQAAkgEAAIABAABuAQAAXQEAAEwBAAA9AQAALgEAACABAAASAQAABQEAAPkAAADuAAAA4gAAANgAAADOAAAAxAAAALsAAACyAAAAqgAAAKIAAACaAAAAkwAAAIwAAACGAAAAgAAAAHoAAAB0AAAAbwAAAGkAAABkAAAAXwAAAFsAAABXAAAAUwAAAE8AAABLAAAARwAAAEQAAABBAAAAPgAAADsAAAA4AAAANgAAADMAAAD0AQAABQ8hAAEcEAUA32Dd2IlFx0yc0mWdnmSKnwAAAwZKAQEAAAAACgAAAAAAAwZKAQgAAgAAAKAAFAADAFdJTlVTQgAAAAAAAAAAAACEAAQABwAqAEQAZQB2AGkAYwBlAEkAbgB0AGUAcgBmAGEAYwBlAEcAVQBJAEQAcwAAAFAAewAwAEEAQwBFADIAQgAzAEUALQAyAEIAMwBFAC0AMgBCADMARQAtADIAQgAzAEUALQAyADQANgAyADAAQQBDAEUAMgBCADMARQB9AAAAAAAIAAIAAQCgABQAAwBXSU5VU0IAAAAAAAAAAAAAhAAEAAcAKgBEAGUAdgBpAGMAZQBJAG4AdABlAHIAZgBhAGMAZQBHAFUASQBEAHMAAABQAHsAMQBBAEMARQAyAEIAMwBFAC0AMgBCADMARQAtADIAQgAzAEUALQAyAEIAMwBFAC0AMgA0ADYAMgAxAEEAQwBFADIAQgAzAEUAfQAAAAAAAAAAAwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAQDCQROZXdBRSBUZWNobm9sb2d5IEluYy4AAABDaGlwV2hpc3BlcmVyIExpdGUAAQAACUAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACQAAAAAAAAAAAgAAAAAAAAAAAAAAAAAAAAAADwAAAA4AAAANAAAAFAAAABEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAP1gCAC5YAgAzWAIAK1gCAAAAAAAAQAAAAAJPQCJZwgA0WYIACFnCADlZggAAAAAALFqCAD5ZggA4WYIAOVmCACFaQgARAkAIEQJACBICwAgsAkAIEgLACBcCwAgqAkAIAAAAACACgAgaAsAILgJACBoCwAgCQJiAAMBAID6CQQAAAL///8ABwWBAkAAAAcFAgJAAAAICwECAgIBAAkEAQABAgIBAAUkABABBCQCAgUkBgECBSQBAwIHBYMDQAAQCQQCAAIKAAAABwWFAkAAAAcFBgJAAAAAAAkCNwACAQCA+gkEAAAC////AAcFgQJAAAAHBQICQAAACQQBAAL///8ABwWFAgACAAcFBgIAAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAJAmIAAwEAgPoJBAAAAv///wAHBYECAAIABwUCAgACAAgLAQICAgEACQQBAAECAgEABSQAEAEEJAICBSQGAQIFJAEDAgcFgwNAABAJBAIAAgoAAAAHBYUCAAIABwUGAgACAAAACQI3AAIBAID6CQQAAAL///8ABwWBAgACAAcFAgIAAgAJBAEAAv///wAHBYUCAAIABwUGAgACAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABIBAAIAAABAPivirAAJAQIDAQAACgYAAgAAAEABAAAARAkAIGAJACB0CQAgeAsAIAAAAABkDgAgzA4AIDQPACAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAEAAAAAAAAADjPNqzQSbebs3gUACwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAEC0AIEMAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAQwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABDAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAEMAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAQwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABDAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAEMAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAbc4IAHW+CAAAAAAAJN8IAGTdCAAo3AgAKNwIACjcCAAo3AgAKNwIACjcCAAo3AgAKNwIACjcCAD//////////////////wAAAQBBU0NJSQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAEFTQ0lJAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABARACAQEQAgGBEAIBgRACAgEQAgIBEAICgRACAoEQAgMBEAIDARACA4EQAgOBEAIEARACBAEQAgSBEAIEgRACBQEQAgUBEAIFgRACBYEQAgYBEAIGARACBoEQAgaBEAIHARACBwEQAgeBEAIHgRACCAEQAggBEAIIgRACCIEQAgkBEAIJARACCYEQAgmBEAIKARACCgEQAgqBEAIKgRACCwEQAgsBEAILgRACC4EQAgwBEAIMARACDIEQAgyBEAINARACDQEQAg2BEAINgRACDgEQAg4BEAIOgRACDoEQAg8BEAIPARACD4EQAg+BEAIAASACAAEgAgCBIAIAgSACAQEgAgEBIAIBgSACAYEgAgIBIAICASACAoEgAgKBIAIDASACAwEgAgOBIAIDgSACBAEgAgQBIAIEgSACBIEgAgUBIAIFASACBYEgAgWBIAIGASACBgEgAgaBIAIGgSACBwEgAgcBIAIHgSACB4EgAggBIAIIASACCIEgAgiBIAIJASACCQEgAgmBIAIJgSACCgEgAgoBIAIKgSACCoEgAgsBIAILASACC4EgAguBIAIMASACDAEgAgyBIAIMgSACDQEgAg0BIAINgSACDYEgAg4BIAIOASACDoEgAg6BIAIPASACDwEgAg+BIAIPgSACAAEwAgABMAIAgTACAIEwAgEBMAIBATACAYEwAgGBMAICATACAgEwAgKBMAICgTACAwEwAgMBMAIDgTACA4EwAgQBMAIEATACBIEwAgSBMAIFATACBQEwAgWBMAIFgTACBgEwAgYBMAIGgTACBoEwAgcBMAIHATACB4EwAgeBMAIIATACCAEwAgiBMAIIgTACCQEwAgkBMAIJgTACCYEwAgoBMAIKATACCoEwAgqBMAILATACCwEwAguBMAILgTACDAEwAgwBMAIMgTACDIEwAg0BMAINATACDYEwAg2BMAIOATACDgEwAg6BMAIOgTACDwEwAg8BMAIPgTACD4EwAgABQAIAAUACAIFAAgCBQAIBAUACAQFAAgGBQAIBgUACAgFAAgIBQAICgUACAoFAAgMBQAIDAUACA4FAAgOBQAIEAUACBAFAAgSBQAIEgUACBQFAAgUBQAIFgUACBYFAAgYBQAIGAUACBoFAAgaBQAIHAUACBwFAAgeBQAIHgUACCAFAAggBQAIIgUACCIFAAgkBQAIJAUACCYFAAgmBQAIKAUACCgFAAgqBQAIKgUACCwFAAgsBQAILgUACC4FAAgwBQAIMAUACDIFAAgyBQAINAUACDQFAAg2BQAINgUACDgFAAg4BQAIOgUACDoFAAg8BQAIPAUACD4FAAg+BQAIAAVACAAFQAgCBUAIAgVACD/////AAACAA==',
-
-}
+    return default_store().getsome("cwlite", item, filelike)
@@ -0,0 +1,289 @@
+#
+# Copyright (c) 2024, NewAE Technology Inc
+# All rights reserved.
+#
+#    This file is part of chipwhisperer.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+# ==========================================================================
+"""Binary store for the firmware and bitstreams bundled with chipwhisperer.
+
+All blobs live in a single container file (firmware.cwfw next to this module)
+that is memory mapped, so a blob is only paged in when it's actually read and
+is handed out as a memoryview into the mapping instead of a fresh copy.
+
+Container layout (all integers little endian)::
+
+    8 bytes    magic, b"CWFWSTOR"
+    u32        format version (1)
+    u32        index length in bytes
+    ...        index, UTF-8 JSON
+    ...        blobs, each starting on a 64 byte boundary
+
+The index is::
+
+    {"modules": {"cw305": {"fwver": [0, 11],
+                           "items": {"SAM3U_CW305.bin": {"offset": ..., "length": ...,
+                                                         "sha256": "..."}}}}}
+
+To add or replace a module's blobs::
+
+    python -m chipwhisperer.hardware.firmware.fwstore cw305 0.11 SAM3U_CW305.bin AES_100t.bit
+"""
+import hashlib
+import io
+import json
+import mmap
+import os
+import struct
+import threading
+from typing import Dict, Optional, Tuple
+
+STORE_MAGIC = b"CWFWSTOR"
+STORE_VERSION = 1
+STORE_ALIGN = 64
+_HEADER = struct.Struct("<8sII")
+
+DEFAULT_STORE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "firmware.cwfw")
+
+class BlobReader(io.BufferedIOBase):
+    """Read-only file-like view of a blob in the store.
+
+    Behaves like io.BytesIO, except getbuffer() returns a memoryview into the
+    memory mapped store, so nothing is copied until the data is read.
+    """
+    def __init__(self, buf : memoryview, name : str="", sha256 : Optional[str]=None):
+        super().__init__()
+        self._buf = buf
+        self._pos = 0
+        self.name = name
+        self.sha256 = sha256
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def getbuffer(self) -> memoryview:
+        """Zero copy view of the whole blob"""
+        return self._buf
+
+    def __len__(self):
+        return len(self._buf)
+
+    def tell(self):
+        return self._pos
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            pos = offset
+        elif whence == io.SEEK_CUR:
+            pos = self._pos + offset
+        elif whence == io.SEEK_END:
+            pos = len(self._buf) + offset
+        else:
+            raise ValueError("Invalid whence {}".format(whence))
+        if pos < 0:
+            raise ValueError("Negative seek position {}".format(pos))
+        self._pos = pos
+        return pos
+
+    def read(self, size=-1):
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+        if size is None or size < 0:
+            end = len(self._buf)
+        else:
+            end = min(self._pos + size, len(self._buf))
+        data = bytes(self._buf[self._pos:end])
+        self._pos = max(self._pos, end)
+        return data
+
+    read1 = read
+
+    def readinto(self, b):
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+        dst = memoryview(b).cast('B')
+        n = max(0, min(len(dst), len(self._buf) - self._pos))
+        dst[:n] = self._buf[self._pos:self._pos+n]
+        self._pos += n
+        return n
+
+    readinto1 = readinto
+
+class FirmwareStore:
+    """Memory mapped firmware/bitstream container.
+
+    Args:
+        path (str): Container file to open.
+    """
+    def __init__(self, path : str=DEFAULT_STORE_PATH):
+        self.path = path
+        with open(path, "rb") as f:
+            try:
+                self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                # some filesystems can't be mapped
+                self._data = f.read()
+        self._view = memoryview(self._data)
+        magic, version, index_len = _HEADER.unpack_from(self._data, 0)
+        if magic != STORE_MAGIC:
+            raise IOError("{} is not a firmware store".format(path))
+        if version != STORE_VERSION:
+            raise IOError("Unsupported firmware store version {} in {}".format(version, path))
+        start = _HEADER.size
+        self.index = json.loads(bytes(self._view[start:start+index_len]).decode("utf-8"))
+        self.modules = self.index["modules"]
+
+        self._by_sha256 = {}
+        for module, info in self.modules.items():
+            for name, item in info["items"].items():
+                self._by_sha256[item["sha256"]] = (module, name)
+
+    def _item(self, module : str, name : str) -> dict:
+        try:
+            return self.modules[module]["items"][name]
+        except KeyError:
+            raise KeyError("{} not found in firmware for {}".format(name, module)) from None
+
+    def fwver(self, module : str) -> Optional[Tuple[int, int]]:
+        """Firmware version recorded for module, without touching any blobs"""
+        if module not in self.modules:
+            return None
+        ver = self.modules[module].get("fwver")
+        return None if ver is None else tuple(ver)
+
+    def names(self, module : str):
+        """Names of all blobs stored for module"""
+        return list(self.modules[module]["items"].keys())
+
+    def sha256(self, module : str, name : str) -> str:
+        """SHA-256 of a blob (hex), from the index"""
+        return self._item(module, name)["sha256"]
+
+    def find_sha256(self, digest : str) -> Optional[Tuple[str, str]]:
+        """(module, name) of the blob with this SHA-256 or None"""
+        return self._by_sha256.get(digest)
+
+    def get(self, module : str, name : str) -> memoryview:
+        """Zero copy memoryview of a blob"""
+        item = self._item(module, name)
+        return self._view[item["offset"]:item["offset"]+item["length"]]
+
+    def open(self, module : str, name : str) -> BlobReader:
+        """File-like object for a blob"""
+        return BlobReader(self.get(module, name), name, self.sha256(module, name))
+
+    def getsome(self, module : str, name : str, filelike : bool=True):
+        """Same interface as the old generated getsome(): a file-like object if
+        filelike, otherwise the blob as bytes.
+        """
+        if filelike:
+            return self.open(module, name)
+        return bytes(self.get(module, name))
+
+    def verify(self) -> bool:
+        """Check every blob against its SHA-256. Reads the whole store."""
+        for module, info in self.modules.items():
+            for name, item in info["items"].items():
+                if hashlib.sha256(self.get(module, name)).hexdigest() != item["sha256"]:
+                    return False
+        return True
+
+_default_store = None
+_default_store_lock = threading.Lock()
+
+def default_store() -> FirmwareStore:
+    """The store shipped with chipwhisperer, opened on first use"""
+    global _default_store
+    if _default_store is None:
+        with _default_store_lock:
+            if _default_store is None:
+                _default_store = FirmwareStore(DEFAULT_STORE_PATH)
+    return _default_store
+
+def write_store(path : str, modules : Dict[str, dict]):
+    """Write a container.
+
+    Args:
+        path (str): File to write. Written to a temporary file then renamed, so
+            an open mapping of the old file stays valid.
+        modules (dict): {module: {"fwver": [major, minor], "items": {name: bytes}}}
+    """
+    names = []
+    index = {"modules": {}}
+    for module, info in sorted(modules.items()):
+        index["modules"][module] = {"fwver": info.get("fwver"), "items": {}}
+        for name, data in sorted(info["items"].items()):
+            names.append((module, name, data))
+            index["modules"][module]["items"][name] = {
+                "offset": 0, "length": len(data), "sha256": hashlib.sha256(data).hexdigest()
+            }
+
+    def align(x):
+        return (x + STORE_ALIGN - 1) // STORE_ALIGN * STORE_ALIGN
+
+    # offsets are part of the index, so lay out with a worst case index size
+    # and repeat until the index length stops changing
+    index_len = 0
+    while True:
+        offset = align(_HEADER.size + index_len)
+        for module, name, data in names:
+            index["modules"][module]["items"][name]["offset"] = offset
+            offset = align(offset + len(data))
+        encoded = json.dumps(index, sort_keys=True).encode("utf-8")
+        if len(encoded) <= index_len:
+            break
+        index_len = len(encoded) + 16
+    encoded = encoded.ljust(index_len, b" ")
+
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(_HEADER.pack(STORE_MAGIC, STORE_VERSION, index_len))
+        f.write(encoded)
+        for module, name, data in names:
+            f.write(b"\x00" * (index["modules"][module]["items"][name]["offset"] - f.tell()))
+            f.write(data)
+    os.replace(tmp, path)
+
+def read_modules(path : str) -> Dict[str, dict]:
+    """Everything in a container, in the form write_store() takes"""
+    store = FirmwareStore(path)
+    return {module: {"fwver": info.get("fwver"),
+                     "items": {name: bytes(store.get(module, name)) for name in info["items"]}}
+            for module, info in store.modules.items()}
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="Add or replace a module's blobs in the firmware store")
+    parser.add_argument("module", help="store module, e.g. cw305")
+    parser.add_argument("fwver", help="firmware version, major.minor")
+    parser.add_argument("files", nargs="+", help="files to store, under their base name")
+    parser.add_argument("--store", default=DEFAULT_STORE_PATH, help="container to update")
+    parser.add_argument("--replace", action="store_true", help="drop the module's existing blobs first")
+    args = parser.parse_args(argv)
+
+    modules = read_modules(args.store) if os.path.exists(args.store) else {}
+    info = modules.setdefault(args.module, {"items": {}})
+    if args.replace:
+        info["items"] = {}
+    info["fwver"] = [int(x) for x in args.fwver.split(".")[:2]]
+    for fname in args.files:
+        with open(fname, "rb") as f:
+            info["items"][os.path.basename(fname)] = f.read()
+    write_store(args.store, modules)
+
+if __name__ == "__main__":
+    main()
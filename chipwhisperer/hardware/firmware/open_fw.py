@@ -0,0 +1,87 @@
+#
+# Copyright (c) 2024, NewAE Technology Inc
+# All rights reserved.
+#
+#    This file is part of chipwhisperer.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+# ==========================================================================
+"""Access to the firmware and bitstreams bundled with chipwhisperer.
+
+The blobs are kept in a memory mapped binary store (see fwstore.py), opened
+the first time anything here is used. Version information comes from the
+store's index, so it doesn't touch any blob data.
+"""
+import os
+
+from .fwstore import default_store
+
+# hardware type -> module in the firmware store holding its blobs
+_FW_MODULES = {
+    'cwlite': 'cwlite',
+    'cw1200': 'cw1200',
+    'cw305': 'cw305',
+    'cwbergen': 'cwbergen',
+    'cw310': 'cwbergen',
+    'cwnano': 'cwnano',
+    'cwhusky': 'cwhusky',
+}
+
+# hardware type -> SAM3U firmware image inside its module
+_MCUFW = {
+    'cwlite': 'SAM3U_CW1173.bin',
+    'cwhusky': 'Husky.bin',
+    'cw305': 'SAM3U_CW305.bin',
+    'cwbergen': 'CW310.bin',
+    'cw310': 'CW310.bin',
+    'cwnano': 'SAM3U_CWNANO.bin',
+}
+
+def _module_name(hw_type):
+    try:
+        return _FW_MODULES[hw_type]
+    except KeyError:
+        raise ValueError("No firmware bundled for hardware type {}".format(hw_type)) from None
+
+def fwver(hw_type):
+    """Latest bundled firmware version for hw_type as a 'major.minor.0' string,
+    or None if there's no firmware for it.
+    """
+    if hw_type not in _FW_MODULES:
+        return None
+    ver = default_store().fwver(_FW_MODULES[hw_type])
+    if ver is None:
+        return None
+    return "{}.{}.0".format(ver[0], ver[1])
+
+def getsome_generator(hw_type):
+    """Returns a getsome(item, filelike=True) function for the blobs bundled for hw_type.
+
+    getsome returns a file-like object whose getbuffer() is a zero copy view of
+    the blob, or the blob as bytes if not filelike.
+    """
+    module = _module_name(hw_type)
+    def getsome(item, filelike=True):
+        return default_store().getsome(module, item, filelike)
+    return getsome
+
+def mcufw(hw_type, filelike=True):
+    """SAM3U firmware image for hw_type, file-like if filelike, else as bytes."""
+    if hw_type not in _MCUFW:
+        raise ValueError("No SAM3U firmware bundled for hardware type {}".format(hw_type))
+    return getsome_generator(hw_type)(_MCUFW[hw_type], filelike)
+
+def registers(hw_type):
+    """Path to the Verilog register defines for the bundled hw_type bitstreams"""
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), hw_type,
+                        "{}_aes_defines.v".format(hw_type))
@@ -0,0 +1,316 @@
+#
+# Copyright (c) 2024, NewAE Technology Inc
+# All rights reserved.
+#
+#    This file is part of chipwhisperer.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+# ==========================================================================
+"""Host-side caches for FPGA bitstreams.
+
+:class:`BitstreamFingerprints` remembers which bitstream was last programmed
+into each board, so connecting with force='if_changed' can skip re-downloading
+a bitstream that's already loaded.
+
+:class:`TransformedBitstreamCache` keeps bit reversed copies of bitstreams for
+the parallel programming modes, so they don't have to be transformed again
+every time they're programmed.
+"""
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from typing import Optional
+
+from ...common.utils import util
+from ...logging import *
+
+def bitstream_sha256(bitstream) -> str:
+    """SHA-256 (hex) of a bitstream given as a path, bytes-like or file-like object.
+
+    File-like objects from the firmware store carry their hash already; other
+    file-like objects are hashed and rewound to where they were.
+    """
+    sha = getattr(bitstream, "sha256", None)
+    if isinstance(sha, str):
+        return sha
+    h = hashlib.sha256()
+    if isinstance(bitstream, (str, os.PathLike)):
+        with open(bitstream, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+    elif isinstance(bitstream, util.BYTE_ARRAY_TYPES):
+        h.update(bitstream)
+    elif hasattr(bitstream, "getbuffer"):
+        h.update(bitstream.getbuffer())
+    else:
+        pos = bitstream.tell()
+        for chunk in iter(lambda: bitstream.read(1 << 20), b""):
+            h.update(chunk)
+        bitstream.seek(pos)
+    return h.hexdigest()
+
+class BitstreamFingerprints:
+    """Record of the last bitstream programmed per board serial number and FPGA id.
+
+    Stored as JSON in the chipwhisperer cache directory so it's shared between
+    processes. Each entry holds the bitstream's SHA-256 and, when the design
+    exposes one, the raw REG_BUILDTIME readback, which is used to catch the FPGA
+    having been reprogrammed behind the cache's back.
+
+    If the cache directory can't be used, the record is treated as empty, so
+    bitstreams are just programmed every time.
+
+    Args:
+        path (str, optional): JSON file to use. Defaults to
+            <cache dir>/fpga_fingerprints.json.
+    """
+    def __init__(self, path : Optional[str]=None):
+        self._path = path
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> str:
+        if self._path is None:
+            self._path = os.path.join(util.get_cache_dir(), "fpga_fingerprints.json")
+        return self._path
+
+    def _load(self) -> Optional[dict]:
+        # None if there's nowhere to keep the record
+        try:
+            return util.load_json(self.path, {})
+        except OSError as e:
+            naeusb_logger.info("Could not use the FPGA fingerprint cache: {}".format(e))
+            return None
+
+    @staticmethod
+    def _key(serial, fpga_id):
+        return "{}/{}".format(serial, fpga_id or "default")
+
+    def get(self, serial : str, fpga_id : Optional[str]=None) -> Optional[dict]:
+        """Entry for this board/FPGA ({'sha256', 'buildtime', 'time'}) or None"""
+        data = self._load()
+        if data is None:
+            return None
+        return data.get(self._key(serial, fpga_id))
+
+    def record(self, serial : str, fpga_id : Optional[str], sha256 : str, buildtime : Optional[str]=None):
+        """Note that bitstream sha256 was just programmed into this board"""
+        entry = {"sha256": sha256, "buildtime": buildtime, "time": time.time()}
+        self._update(self._key(serial, fpga_id), entry)
+
+    def record_buildtime(self, serial : str, fpga_id : Optional[str], buildtime : str):
+        """Attach the REG_BUILDTIME readback to the board's existing entry"""
+        key = self._key(serial, fpga_id)
+        with self._lock:
+            data = self._load()
+            if data and key in data:
+                data[key]["buildtime"] = buildtime
+                self._save(data)
+
+    def forget(self, serial : str, fpga_id : Optional[str]=None):
+        """Drop the entry for this board/FPGA, e.g. after a failed programming attempt"""
+        self._update(self._key(serial, fpga_id), None)
+
+    def forget_board(self, serial : str):
+        """Drop every entry for this board, when its FPGA (or the flash it boots
+        from) is programmed some other way"""
+        prefix = self._key(serial, None)[:-len("default")]
+        with self._lock:
+            data = self._load()
+            if not data:
+                return
+            keys = [key for key in data if key.startswith(prefix)]
+            for key in keys:
+                del data[key]
+            if keys:
+                self._save(data)
+
+    def _update(self, key, entry):
+        with self._lock:
+            data = self._load()
+            if data is None:
+                return
+            if entry is None:
+                if data.pop(key, None) is None:
+                    return
+            else:
+                data[key] = entry
+            self._save(data)
+
+    def _save(self, data):
+        try:
+            util.save_json_atomic(self.path, data)
+        except OSError as e:
+            naeusb_logger.warning("Could not save FPGA fingerprints to {}: {}".format(self.path, e))
+
+class _CacheEntryWriter:
+    """Collects a transformed bitstream as it's being sent and adds it to the
+    cache on commit(). Write errors just abandon the entry.
+    """
+    def __init__(self, cache, key):
+        self._cache = cache
+        self._key = key
+        self._f = None
+        self._tmp = None
+        try:
+            fd, self._tmp = tempfile.mkstemp(prefix=key + ".", suffix=".tmp", dir=cache.path)
+            self._f = os.fdopen(fd, "wb")
+        except OSError as e:
+            naeusb_logger.info("Not caching transformed bitstream: {}".format(e))
+            self.abort()
+
+    def write(self, data):
+        if self._f is None:
+            return
+        try:
+            self._f.write(data)
+        except OSError as e:
+            naeusb_logger.info("Not caching transformed bitstream: {}".format(e))
+            self.abort()
+
+    def commit(self):
+        """Move the completed entry into the cache, then trim it to size"""
+        if self._f is None:
+            return
+        try:
+            self._f.close()
+            self._f = None
+            if os.path.getsize(self._tmp) > self._cache.max_size:
+                raise OSError("bitstream larger than the cache")
+            os.replace(self._tmp, self._cache._entry_path(self._key))
+            self._tmp = None
+        except OSError as e:
+            naeusb_logger.info("Not caching transformed bitstream: {}".format(e))
+        self.abort()
+        self._cache.evict()
+
+    def abort(self):
+        """Discard the entry, if it hasn't been committed"""
+        if self._f is not None:
+            self._f.close()
+            self._f = None
+        if self._tmp is not None:
+            try:
+                os.remove(self._tmp)
+            except OSError:
+                pass
+            self._tmp = None
+
+class TransformedBitstreamCache:
+    """Content addressed on-disk cache of bitstreams transformed for parallel programming.
+
+    Entries are the exact data sent to the FPGA (bit reversed, 16 bit swapped
+    for BITORDER_REVERSE16, with the trailing clock bytes) and are keyed by the
+    source bitstream's SHA-256, the bit order, the starting offset and the
+    number of trailing clock bytes. A hit updates the entry's mtime, and the
+    least recently used entries are removed once the cache grows past max_size.
+
+    Args:
+        path (str, optional): Cache directory. Defaults to <cache dir>/bitstreams.
+        max_size (int, optional): Size limit in bytes. Defaults to DEFAULT_MAX_SIZE.
+    """
+    DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+
+    def __init__(self, path : Optional[str]=None, max_size : Optional[int]=None):
+        self._path = path
+        self.max_size = self.DEFAULT_MAX_SIZE if max_size is None else max_size
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> str:
+        if self._path is None:
+            self._path = util.get_cache_dir("bitstreams")
+        else:
+            os.makedirs(self._path, exist_ok=True)
+        return self._path
+
+    @staticmethod
+    def key(sha256 : str, bitorder : int, starting_offset : int, ending_clock_bytes : int) -> str:
+        return "{}-{}-{:x}-{}".format(sha256, bitorder, starting_offset, ending_clock_bytes)
+
+    def _entry_path(self, key):
+        return os.path.join(self.path, key + ".bin")
+
+    def open(self, key : str):
+        """Open the cached entry for key for reading, or return None on a miss"""
+        try:
+            path = self._entry_path(key)
+            f = open(path, "rb")
+        except OSError:
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        naeusb_logger.debug("Using cached transformed bitstream {}".format(key))
+        return f
+
+    def writer(self, key : str) -> _CacheEntryWriter:
+        """Writer for a new entry; call commit() once all data has been written"""
+        return _CacheEntryWriter(self, key)
+
+    def entries(self):
+        """(path, size, mtime) of every entry, least recently used first"""
+        entries = []
+        try:
+            with os.scandir(self.path) as it:
+                for e in it:
+                    if e.name.endswith(".bin"):
+                        try:
+                            st = e.stat()
+                        except OSError:
+                            continue
+                        entries.append((e.path, st.st_size, st.st_mtime))
+        except OSError:
+            return []
+        entries.sort(key=lambda x: x[2])
+        return entries
+
+    def evict(self):
+        """Remove least recently used entries until the cache fits in max_size"""
+        with self._lock:
+            entries = self.entries()
+            total = sum(e[1] for e in entries)
+            for path, size, _ in entries:
+                if total <= self.max_size:
+                    break
+                try:
+                    os.remove(path)
+                    total -= size
+                except OSError:
+                    pass
+
+    def clear(self):
+        """Remove every entry"""
+        for path, _, _ in self.entries():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+_fingerprints = None
+_transform_cache = None
+
+def default_fingerprints() -> BitstreamFingerprints:
+    global _fingerprints
+    if _fingerprints is None:
+        _fingerprints = BitstreamFingerprints()
+    return _fingerprints
+
+def default_transform_cache() -> TransformedBitstreamCache:
+    global _transform_cache
+    if _transform_cache is None:
+        _transform_cache = TransformedBitstreamCache()
+    return _transform_cache
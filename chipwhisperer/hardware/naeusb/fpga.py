@@ -23,18 +23,159 @@
 #==========================================================================
 
 
+import io
 import time
 import logging
+import mmap
+import queue
+import threading
+from contextlib import nullcontext
 from .naeusb import packuint32, NAEUSB
+from .bitstream_cache import bitstream_sha256, default_fingerprints, default_transform_cache
 import usb1  # type: ignore
 from ...logging import *
 
 try:
     import numpy as np
 except:
-    naeusb_logger.info("numpy is required for parallel CW340 programming")
     np = None # type: ignore
 
+# byte with its bit order reversed, for the parallel programming modes
+_BIT_REVERSE = bytes(int("{:08b}".format(i)[::-1], 2) for i in range(256))
+
+def _transform_bitorder(chunk, bitorder):
+    """Bit reverse every byte of chunk and, for BITORDER_REVERSE16, swap each pair of bytes.
+    Returns a new bytearray.
+    """
+    out = bytearray(chunk).translate(_BIT_REVERSE)
+    if bitorder == FPGA.BITORDER_REVERSE16:
+        if len(out) % 2:
+            # only the 0xFF tail can be odd length
+            out.append(0xff)
+        if np is not None:
+            np.frombuffer(out, dtype=np.uint16).byteswap(inplace=True)
+        else:
+            out[0::2], out[1::2] = out[1::2], out[0::2]
+    return out
+
+def _prefetch(iterable, depth=2):
+    """Iterate over iterable in a background thread, keeping up to depth items ready"""
+    q = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+    done = object()
+
+    def put(entry):
+        # give up if the consumer has gone away, rather than block on a full queue
+        while not stop.is_set():
+            try:
+                q.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def worker():
+        try:
+            for item in iterable:
+                if not put((item, None)):
+                    return
+            put((done, None))
+        except Exception as e:
+            put((done, e))
+
+    thread = threading.Thread(target=worker, daemon=True)
+    thread.start()
+    try:
+        while True:
+            item, err = q.get()
+            if item is done:
+                if err is not None:
+                    raise err
+                return
+            yield item
+    finally:
+        stop.set()
+        thread.join()
+        if hasattr(iterable, "close"):
+            iterable.close()
+
+class _BitstreamSource:
+    """Context manager giving zero-copy access to a bitstream from a file-like or
+    buffer object, closing file-like objects on exit like the old f.read() did.
+    """
+    def __init__(self, src):
+        self._src = src
+        self._buf = None
+        self._mmap = None
+
+    def __enter__(self):
+        src = self._src
+        if isinstance(src, (bytes, bytearray, memoryview)) or not hasattr(src, "read"):
+            self._ctx = nullcontext(src)
+            self._buf = memoryview(src).cast("B")
+            return self
+        self._ctx = src
+        src.__enter__()
+        if hasattr(src, "getbuffer"):
+            self._buf = src.getbuffer()
+        else:
+            try:
+                # private mapping, so slices are writable and libusb won't copy them
+                self._mmap = mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_COPY)
+                self._buf = memoryview(self._mmap)
+            except (AttributeError, OSError, ValueError, io.UnsupportedOperation):
+                self._buf = None
+        return self
+
+    def __exit__(self, *args):
+        if self._buf is not None:
+            try:
+                self._buf.release()
+            except BufferError:
+                pass
+            self._buf = None
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                pass
+        try:
+            return self._ctx.__exit__(*args)
+        except BufferError:
+            # a chunk is still referenced somewhere, it'll be closed when collected
+            return False
+
+    def sha256(self):
+        """SHA-256 of the whole source, rewinding file-like sources afterwards"""
+        sha = getattr(self._src, "sha256", None)
+        if isinstance(sha, str):
+            return sha
+        return bitstream_sha256(self._buf if self._buf is not None else self._src)
+
+    def chunks(self, starting_offset, tail, chunk_size):
+        """Yield the bitstream from starting_offset on, followed by tail, in chunks
+        of about chunk_size. Only the last chunk (which has tail added) is copied.
+        """
+        if self._buf is not None:
+            data = self._buf[starting_offset:]
+            pos = 0
+            while len(data) - pos > chunk_size:
+                yield data[pos:pos+chunk_size]
+                pos += chunk_size
+            yield bytearray(data[pos:]) + tail
+            return
+
+        f = self._src
+        f.read(starting_offset)
+        cur = f.read(chunk_size)
+        while True:
+            nxt = f.read(chunk_size)
+            if not nxt:
+                yield bytearray(cur) + tail
+                return
+            yield cur
+            cur = nxt
+
 class FPGA(object):
 
     CMD_FPGA_STATUS = 0x15
@@ -44,11 +185,22 @@ class FPGA(object):
     BITORDER_REVERSE = 0x01
     BITORDER_REVERSE16 = 0x02
 
+    # bitstreams are sent to the SAM3U this many bytes at a time
+    PROG_CHUNK_SIZE = 1 << 16
+
     PROG_MODE_SERIAL = 0x00
     PROG_MODE_PARALLEL = 0x01
     PROG_MODE_PARALLEL16 = 0x02
 
-    def __init__(self, usb: NAEUSB, timeout=200, prog_mask=0xA0):
+    def __init__(self, usb: NAEUSB, timeout=200, prog_mask=0xA0, transform_cache=True):
+        """
+        transform_cache is the TransformedBitstreamCache used to keep bitstreams
+        already transformed for the parallel programming modes, True for the
+        default one in the chipwhisperer cache directory, or None to disable it.
+        """
+        if transform_cache is True:
+            transform_cache = default_transform_cache()
+        self.transform_cache = transform_cache
         self.sendCtrl = usb.sendCtrl
         self.readCtrl = usb.readCtrl
         self._usb = usb
@@ -76,7 +228,14 @@ class FPGA(object):
         else:
             return False
 
+    def _forget_fingerprints(self):
+        # whatever the fingerprint cache says is loaded won't be any more
+        sn = getattr(self._usb, "snum", None)
+        if sn is not None:
+            default_fingerprints().forget_board(sn)
+
     def eraseFPGA(self):
+        self._forget_fingerprints()
         self.sendCtrl(self.CMD_FPGA_PROGRAM, self._prog_mask | 0x00)
         time.sleep(0.001)
         self.sendCtrl(self.CMD_FPGA_PROGRAM, self._prog_mask | 0x01)
@@ -86,6 +245,7 @@ class FPGA(object):
         """
         Program FPGA with a bitstream, or if not bitstream passed just erases FPGA
         """
+        self._forget_fingerprints()
 
         # Erase the FPGA by toggling PROGRAM pin, setup
         # NAEUSB chip for FPGA programming
@@ -134,59 +294,72 @@ class FPGA(object):
             self.sendCtrl(self.CMD_FPGA_PROGRAM, self._prog_mask | 0x02)
             return False
 
+    def _transformed_chunks(self, src, starting_offset, tail, bitorder):
+        """Chunks of src transformed for bitorder, from transform_cache if it's there"""
+        cache = self.transform_cache
+        key = None
+        if cache is not None:
+            try:
+                key = cache.key(src.sha256(), bitorder, starting_offset, len(tail))
+            except (OSError, ValueError) as e:
+                # e.g. a stream that can't be rewound after hashing
+                naeusb_logger.debug("Not using transformed bitstream cache: {}".format(e))
+            if key is not None:
+                cached = cache.open(key)
+                if cached is not None:
+                    with _BitstreamSource(cached) as csrc:
+                        yield from csrc.chunks(0, b"", self.PROG_CHUNK_SIZE)
+                    return
+
+        chunks = _prefetch(_transform_bitorder(chunk, bitorder)
+                           for chunk in src.chunks(starting_offset, tail, self.PROG_CHUNK_SIZE))
+        entry = cache.writer(key) if key is not None else None
+        try:
+            for chunk in chunks:
+                if entry is not None:
+                    entry.write(chunk)
+                yield chunk
+            if entry is not None:
+                entry.commit()
+        finally:
+            if entry is not None:
+                entry.abort()
+            chunks.close()
+
     def _FPGADownloadBitstream(self, fwFileLike, starting_offset=0x7C, ending_clock_bytes=32, bitorder=0x00):
         """
         Performs actual bitstream download, do not call directly, call FPGAProgram
-        """
-
-        if np is None and bitorder != 0x00:
-            raise ValueError("numpy not installed and parallel programming selected. Install numpy or use serial programming")
-
-        # reverse bitwise endianness
-        def reverse_bits(x):
-            x = np.array(x)
-            a = np.unpackbits(x)
-            return np.packbits(a, bitorder='little')
-
-        # swap every two bytes
-        def swap_16_bit(x):
-            a = x[::2]
-            b = x[1::2]
-            c = np.empty(a.size + b.size, dtype=a.dtype)
-            c[0::2] = b
-            c[1::2] = a
-            return c
-
-        # Read entire thing in
-        with fwFileLike as f:
-            inputStream = f.read()
-
-        # Might need a few extra CCLKs at end to finish off, and as written elsewhere this is done with DO=1
-        # Perhaps micro should add these instead? For now this should be reliable enough (things worked even w/o this it seemed, so this is
-        # a just in case item)
-        inputStream += bytes([0xff] * ending_clock_bytes)
 
-        inputStream = bytearray(inputStream[starting_offset:])
-
-        # swap bit order if needed for 8x and 16x parallel modes
-        if (bitorder != self.BITORDER_DEFAULT):
+        fwFileLike can be a file-like object or anything supporting the buffer
+        protocol. It's sent PROG_CHUNK_SIZE bytes at a time, as memoryview slices
+        of the source where possible (buffers, BytesIO-style getbuffer(), or
+        mmap for real files). For the parallel modes, the next chunk is read and
+        bit reversed in a background thread while the current one is being sent,
+        and the result is kept in transform_cache so the next download of the
+        same bitstream can be sent as is.
+        """
+        if bitorder != self.BITORDER_DEFAULT:
             naeusb_logger.info("Using parallel mode")
-            # quick endianness reversal
-            inputStream = np.unpackbits(np.array(inputStream, dtype='uint8'))
-            inputStream = np.packbits(inputStream, bitorder='little')
             if bitorder == self.BITORDER_REVERSE16:
-                inputStream = swap_16_bit(inputStream)
                 naeusb_logger.info("Using 16 bit parallel mode")
         else:
             naeusb_logger.info("Using serial mode")
 
-        # do write, 16KiB at a time to avoid USB timeout on longer bitstreams
-        packet_size = int(2**16)
-        cur_byte = 0
-        while cur_byte < len(inputStream):
-            end_byte = min(cur_byte+packet_size, len(inputStream))
-            self._usb.writeBulkEP(inputStream[cur_byte:end_byte])
-            cur_byte = end_byte
+        # Might need a few extra CCLKs at end to finish off, and as written elsewhere this is done with DO=1
+        # Perhaps micro should add these instead? For now this should be reliable enough (things worked even w/o this it seemed, so this is
+        # a just in case item)
+        tail = bytes([0xff] * ending_clock_bytes)
+        with _BitstreamSource(fwFileLike) as src:
+            if bitorder != self.BITORDER_DEFAULT:
+                chunks = self._transformed_chunks(src, starting_offset, tail, bitorder)
+            else:
+                chunks = src.chunks(starting_offset, tail, self.PROG_CHUNK_SIZE)
+            try:
+                for chunk in chunks:
+                    self._usb.writeBulkEP(chunk)
+            finally:
+                chunk = None
+                chunks.close()
 
         # legacy code was deleted on April 6, 2023
         # check git history if you want to see it
@@ -20,21 +20,21 @@ import time
 import warnings
 import math
 from threading import Thread
+from contextlib import contextmanager
 import usb1  # type: ignore
 import os
 import sys
 import array
+import ctypes
+import queue
+import struct
+import threading
 from typing import Optional, Union, List, Tuple, Dict, cast
 from ...common.utils import util
 from ...common.utils.util import CWByteArray # type: ignore
 
-from ..firmware import cwlite as fw_cwlite
-from ..firmware import cw1200 as fw_cw1200
-from ..firmware import cw305  as fw_cw305
-from ..firmware import cwnano  as fw_nano
-from ..firmware import cwhusky as fw_cwhusky
-
 from ..firmware.open_fw import fwver
+from .usb_context import shared_usb_context
 
 from ...logging import *
 
@@ -197,6 +197,17 @@ def quick_firmware_erase(product_id, serial_number=None):
     naeusb.enterBootloader(True)
 
 
+def parse_fw_version(version) -> Tuple[int, ...]:
+    """Firmware version as a tuple of ints for comparison, from a "major.minor[.debug]"
+    string or a sequence of numbers such as readFwVersion()'s. Missing parts are 0.
+    """
+    if isinstance(version, str):
+        parts = [int(x) for x in version.strip().split('.')]
+    else:
+        parts = [int(x) for x in version]
+    parts += [0] * (3 - len(parts))
+    return tuple(parts)
+
 def _check_sam_feature(feature, fw_version, prod_id):
     if prod_id not in SAM_FW_FEATURE_BY_DEVICE:
         naeusb_logger.debug("Features for ProdID {:04X} not stored, skipping...".format(prod_id))
@@ -208,11 +219,59 @@ def _check_sam_feature(feature, fw_version, prod_id):
     if feature not in feature_set:
         return False
 
-    if feature_set[feature] > fw_version:
+    if parse_fw_version(feature_set[feature]) > parse_fw_version(fw_version):
         return False
 
     return True
 
+class FeatureSet:
+    """Which SAM_FW_FEATURES a device's firmware supports, worked out once.
+
+    Each feature is a bool attribute (features.TX_IN_WAITING), and bitmap has bit
+    n set if SAM_FW_FEATURES[n] is available. Read only.
+
+    Args:
+        prod_id (int): USB product ID.
+        fw_version: Firmware version, as parse_fw_version() takes.
+    """
+    __slots__ = ("prod_id", "fw_version", "known", "bitmap") + tuple(SAM_FW_FEATURES)
+
+    def __init__(self, prod_id : int, fw_version):
+        set_ = object.__setattr__
+        set_(self, "prod_id", prod_id)
+        set_(self, "fw_version", parse_fw_version(fw_version))
+        set_(self, "known", prod_id in SAM_FW_FEATURE_BY_DEVICE)
+        required = SAM_FW_FEATURE_BY_DEVICE.get(prod_id, {})
+        bitmap = 0
+        for i, feature in enumerate(SAM_FW_FEATURES):
+            ok = feature in required and parse_fw_version(required[feature]) <= self.fw_version
+            set_(self, feature, ok)
+            bitmap |= ok << i
+        set_(self, "bitmap", bitmap)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("FeatureSet is read only")
+
+    def __getitem__(self, feature : str) -> bool:
+        if feature not in SAM_FW_FEATURES:
+            raise ValueError("Unknown feature {}".format(feature))
+        return getattr(self, feature)
+
+    def __contains__(self, feature : str) -> bool:
+        return feature in SAM_FW_FEATURES and getattr(self, feature)
+
+    def __iter__(self):
+        """Names of the available features, in SAM_FW_FEATURES order"""
+        return (f for f in SAM_FW_FEATURES if getattr(self, f))
+
+    def required(self, feature : str) -> Optional[str]:
+        """Firmware version feature needs on this device, or None if it never has it"""
+        return SAM_FW_FEATURE_BY_DEVICE.get(self.prod_id, {}).get(feature)
+
+    def __repr__(self):
+        return "FeatureSet(0x{:04X}, {}: {})".format(self.prod_id, ".".join(str(x) for x in self.fw_version),
+                                                   ", ".join(self))
+
 def _WINDOWS_USB_CHECK_DRIVER(device) -> Optional[str]:
     """Checks which driver device is using
 
@@ -330,14 +389,20 @@ def packuint16(data):
 
     return [data & 0xff, (data >> 8) & 0xff, (data >> 16) & 0xff, (data >> 24) & 0xff]
 
+def _c_buffer(view):
+    """ctypes array over the memory of view (a writable memoryview of bytes), for the
+    libusb transfer calls behind usb1's controlRead()/bulkRead(), so they read straight
+    into it instead of into a buffer of their own."""
+    return (ctypes.c_char * len(view)).from_buffer(view)
+
 LEN_ADDR_HDR_SIZE = 8
+_LEN_ADDR = struct.Struct("<II")
     
 def set_len_addr(buf, dlen, addr):
     """Populates a buffer with the command header.
     """
     # Little endian
-    util.pack_u32_into(buf, 0, dlen)
-    util.pack_u32_into(buf, 4, addr)
+    _LEN_ADDR.pack_into(buf, 0, dlen & 0xFFFFFFFF, addr & 0xFFFFFFFF)
 
 def make_len_addr(dlen, addr):
     """Creates a command header buffer.
@@ -351,6 +416,158 @@ def make_len_addr(dlen, addr):
 
 NAEUSB_CTRL_IO_MAX = 128
 NAEUSB_CTRL_IO_THRESHOLD = 48
+# largest memory reads/writes that fit in one control transfer (writes carry the header)
+NAEUSB_CTRL_READ_MAX = NAEUSB_CTRL_IO_MAX
+NAEUSB_CTRL_WRITE_MAX = NAEUSB_CTRL_IO_MAX - LEN_ADDR_HDR_SIZE
+
+# status of a failed async transfer -> what the synchronous call would have raised
+_TRANSFER_ERRORS = {
+    usb1.TRANSFER_STALL: usb1.USBErrorPipe,
+    usb1.TRANSFER_TIMED_OUT: usb1.USBErrorTimeout,
+    usb1.TRANSFER_NO_DEVICE: usb1.USBErrorNoDevice,
+    usb1.TRANSFER_OVERFLOW: usb1.USBErrorOverflow,
+    usb1.TRANSFER_CANCELLED: usb1.USBErrorInterrupted,
+}
+
+class ControlFuture:
+    """Result of a control transfer queued on a :class:`ControlTransferQueue`.
+
+    result() waits for the transfer (and everything queued before it) and returns
+    the data read, or None for a write. A failed transfer raises the usb1 exception
+    the synchronous call would have.
+    """
+    # one of these per queued transfer, so only what differs is set per instance
+    _done = False
+    _result = None
+    _exception = None
+    _reported = False
+
+    def __init__(self, queue, is_read : bool):
+        self._queue = queue
+        self._is_read = is_read
+
+    def done(self) -> bool:
+        return self._done
+
+    def exception(self) -> Optional[Exception]:
+        """Wait for the transfer, then return its exception (None if it worked)"""
+        if not self._done:
+            self._queue.wait_for(self)
+        self._reported = True
+        return self._exception
+
+    def result(self):
+        exc = self.exception()
+        if exc is not None:
+            raise exc
+        return self._result
+
+class ControlTransferQueue:
+    """Control transfers submitted through libusb's async API, so they go out back to
+    back instead of each waiting for the last one's round trip.
+
+    The device handles control transfers in the order they're submitted, so queued
+    writes and reads stay in order with each other. Up to depth transfers are in flight
+    at once; submitting more waits for the oldest. Errors are given to each transfer's
+    :class:`ControlFuture`, and flush() raises the first one that nobody looked at.
+
+    handle_events(timeout, since) waits for transfers to complete, and
+    events_generation() gives the since to pass it (see NAEUSB_Backend._handle_events()).
+    """
+    def __init__(self, handle, handle_events, depth : int=16, timeout : int=500,
+                 events_generation=lambda: None):
+        self.handle = handle
+        self.handle_events = handle_events
+        self.events_generation = events_generation
+        self.timeout = timeout
+        self._free = [handle.getTransfer() for _ in range(depth)]
+        self._in_flight = []
+        self._failed = []
+
+    def __len__(self):
+        return len(self._in_flight)
+
+    def submit(self, request_type : int, request : int, value : int, data_or_len) -> ControlFuture:
+        """Queue a control transfer. data_or_len is the data to write for an OUT
+        request_type, or the number of bytes to read for an IN one.
+        """
+        if not self._free:
+            self._wait(len(self._in_flight) - 1)
+        future = ControlFuture(self, request_type & usb1.ENDPOINT_IN != 0)
+        if not isinstance(data_or_len, (int, memoryview)):
+            data_or_len = util.get_bytes_memview(data_or_len)
+        transfer = self._free.pop()
+        transfer.setControl(request_type, request, value, 0, data_or_len, None, future, self.timeout)
+        try:
+            transfer.submit()
+        except:
+            self._free.append(transfer)
+            raise
+        self._in_flight.append(transfer)
+        return future
+
+    def wait_for(self, future : ControlFuture):
+        """Handle events until future is done"""
+        while not future._done:
+            self._wait(len(self._in_flight) - 1)
+
+    def wait(self):
+        """Wait for every queued transfer"""
+        self._wait(0)
+
+    def flush(self):
+        """Wait for every queued transfer. Raises the error of the first one that
+        failed since the last flush(), unless its future already reported it.
+        """
+        self._wait(0)
+        failed = [f for f in self._failed if not f._reported]
+        self._failed = []
+        if failed:
+            failed[0]._reported = True
+            raise failed[0]._exception
+
+    def _wait(self, left : int):
+        # handle events until at most left transfers are still in flight
+        in_flight = self._in_flight
+        while len(in_flight) > left:
+            since = self.events_generation()
+            if in_flight[0].isSubmitted():
+                try:
+                    self.handle_events(0.001, since)
+                except usb1.USBErrorInterrupted:
+                    pass
+                continue
+            # take everything that's finished, so a full queue isn't waited on
+            # again for each transfer submitted
+            done = 0
+            for transfer in in_flight:
+                if transfer.isSubmitted():
+                    break
+                done += 1
+                future = transfer.getUserData()
+                status = transfer.getStatus()
+                if status == usb1.TRANSFER_COMPLETED:
+                    if future._is_read:
+                        future._result = bytearray(transfer.getBuffer()[:transfer.getActualLength()])
+                else:
+                    future._exception = _TRANSFER_ERRORS.get(status, usb1.USBErrorIO)()
+                    self._failed.append(future)
+                future._done = True
+            self._free.extend(in_flight[:done])
+            del in_flight[:done]
+
+    def close(self):
+        """Cancel anything still in flight and free the transfers"""
+        for transfer in self._in_flight + self._free:
+            try:
+                if transfer.isSubmitted():
+                    transfer.cancel()
+                else:
+                    transfer.close()
+            except (usb1.USBError, ValueError):
+                pass
+        self._in_flight = []
+        self._free = []
 
 #List of all NewAE PID's
 NEWAE_VID = 0x2B3E
@@ -367,6 +584,61 @@ NEWAE_PIDS = {
     0xC610: {'name': "PhyWhisperer-USB",   'fwver': None},
 }
 
+class TransferThresholdCache:
+    """Control/bulk crossover points found by NAEUSB_Backend.calibrate_transfer_thresholds(),
+    per board serial number, so they're used again the next time the board connects.
+
+    Stored as JSON in the chipwhisperer cache directory, which is per user and so
+    per host.
+
+    Args:
+        path (str, optional): JSON file to use. Defaults to
+            <cache dir>/naeusb_thresholds.json.
+    """
+    def __init__(self, path : Optional[str]=None):
+        self._path = path
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> str:
+        if self._path is None:
+            self._path = os.path.join(util.get_cache_dir(), "naeusb_thresholds.json")
+        return self._path
+
+    def get(self, serial : str) -> Optional[dict]:
+        """Entry for this board ({'read', 'write', 'pid', 'time'}) or None"""
+        return util.load_json(self.path, {}).get(serial)
+
+    def record(self, serial : str, pid : int, read : int, write : int):
+        entry = {"read": read, "write": write, "pid": pid, "time": time.time()}
+        self._update(serial, entry)
+
+    def forget(self, serial : str):
+        self._update(serial, None)
+
+    def _update(self, serial, entry):
+        with self._lock:
+            try:
+                # the path too: the cache directory may not be creatable
+                path = self.path
+                data = util.load_json(path, {})
+                if entry is None:
+                    if data.pop(serial, None) is None:
+                        return
+                else:
+                    data[serial] = entry
+                util.save_json_atomic(path, data)
+            except OSError as e:
+                naeusb_logger.warning("Could not save transfer thresholds: {}".format(e))
+
+_threshold_cache = None
+
+def default_threshold_cache() -> TransferThresholdCache:
+    global _threshold_cache
+    if _threshold_cache is None:
+        _threshold_cache = TransferThresholdCache()
+    return _threshold_cache
+
 class NAEUSB_Backend:
     """
     Backend to talk to the USB device.
@@ -378,21 +650,53 @@ class NAEUSB_Backend:
     CMD_WRITEMEM_CTRL = 0x13
     CMD_MEMSTREAM = 0x14
 
+    # drain(): per read, and the most it throws away before giving up
+    DRAIN_CHUNK_SIZE = 4096
+    DRAIN_MAX_BYTES = 1 << 20
+    DRAIN_TIMEOUT_MS = 2
+
+    # async control transfers (sendCtrlAsync(), pipelined(), write_many()) kept in flight at once
+    CTRL_QUEUE_DEPTH = 16
+    # write_many() sends shorter runs as plain writes: setting up the queue costs a few us
+    # of host time, more than overlapping one or two round trips saves on a fast link
+    WRITE_MANY_MIN_BATCH = 4
+    CALIBRATION_SIZES = (8, 16, 24, 32, 48, 64, 80, 96, 120)
+
     def __init__(self):
         self._usbdev = None
         self._timeout = 500
         self.device = None
         self.handle = None
 
+        # transfer reused by drain()
+        self._drain_transfer = None
+        self._drain_handle = None
+        self._ctrl_queue = None
+        self._pipelined = 0
+        self._write_many_buf = bytearray(0)
+        #: Total bytes thrown away by drain()
+        self.drained_bytes = 0
+        #: Memory reads/writes shorter than these go over the control endpoint, longer
+        #: ones over bulk. See calibrate_transfer_thresholds().
+        self.read_threshold = NAEUSB_CTRL_IO_THRESHOLD
+        self.write_threshold = NAEUSB_CTRL_IO_THRESHOLD
+        # the shared context's event thread, if this backend uses it
+        self._events = None
+        self._events_device = False
+
+        self.usb_ctx = None
+        self.usb_ctx = self._open_context()
+
+    def _open_context(self):
+        """Get the libusb context to find and open devices with: the process's shared
+        one (see usb_context.py). The simulated backend replaces this.
+        """
         try:
-            self.usb_ctx = usb1.USBContext()
-            self.usb_ctx.open()
+            self._events = shared_usb_context()
+            return self._events.context
         except OSError as e:
             # naeusb_logger.error("Could not import libusb dll. Try pip uninstall libusb1, then pip install libusb1")
-            self.usb_ctx = None
             raise OSError("Could not import libusb dll. Try \npip uninstall libusb1\npip install libusb1") from e
-        self.handle = None
-        self.device = None
 
     def usbdev(self) -> usb1.USBDeviceHandle:
         """Safely get USB device, throwing error if not connected"""
@@ -457,6 +761,9 @@ class NAEUSB_Backend:
                 naeusb_logger.error("Or that you have the proper permissions to access it")
             raise
         self._usbdev = self.handle
+        if self._events is not None and not self._events_device:
+            self._events.device_opened()
+            self._events_device = True
         if os.name == "nt" or sys.platform == "darwin":
             self.handle.claimInterface(0)
 
@@ -473,6 +780,7 @@ class NAEUSB_Backend:
             self.rep = 0x81
             self.wep = 0x02
         self._timeout = 20000
+        self._load_transfer_thresholds()
 
         return self.handle
 
@@ -482,6 +790,8 @@ class NAEUSB_Backend:
 
     def close(self):
         # """Close the USB connection"""
+        self._drain_close()
+        self._ctrl_queue_close()
         if self.device:
             del self.device
             self.device = None
@@ -490,6 +800,27 @@ class NAEUSB_Backend:
             self._usbdev = None
             del self.handle
             self.handle = None
+        if self._events_device:
+            self._events_device = False
+            self._events.device_closed()
+
+    def _events_generation(self) -> Optional[int]:
+        """Read before checking whether a transfer is done, for _handle_events()"""
+        if self._events is not None:
+            return self._events.generation
+        return None
+
+    def _handle_events(self, timeout : float, since : Optional[int]=None):
+        """Give libusb up to timeout seconds to complete async transfers. With the shared
+        event thread running, this waits for it instead of handling them here.
+
+        since is _events_generation() from before the caller last checked its
+        transfers, so a completion in between isn't missed.
+        """
+        if self._events is not None:
+            self._events.handle_events(timeout, since)
+        else:
+            self.usb_ctx.handleEventsTimeout(timeout)
 
     def get_possible_devices(self, idProduct : Optional[List[int]]=None, dictonly : bool=True, 
         attempt_access : bool=False) -> List[usb1.USBDevice]:
@@ -543,11 +874,16 @@ class NAEUSB_Backend:
         Send data over control endpoint
         """
         # Vendor-specific, OUT, interface control transfer
-        naeusb_logger.debug("WRITE_CTRL: bmRequestType: {:02X}, \
-                    bRequest: {:02X}, wValue: {:04X}, wIndex: {:04X}, data: {}".format(0x41, cmd, \
-                        value, 0, data))
+        if tracing(naeusb_logger):
+            naeusb_logger.debug("WRITE_CTRL: bmRequestType: {:02X}, \
+                        bRequest: {:02X}, wValue: {:04X}, wIndex: {:04X}, data: {}".format(0x41, cmd, \
+                            value, 0, data))
         if len(data) > NAEUSB_CTRL_IO_MAX:
             naeusb_logger.error("The naeusb fw ctrl buffer is 128 bytes, but len(data) > 128. If you get a pipe error, this is why.")
+        if self._pipelined:
+            self.ctrl_queue().submit(0x41, cmd, value, data)
+            return
+        self._ctrl_sync()
         self.handle.controlWrite(0x41, cmd, value, 0, data, timeout=self._timeout)
         #return self.usbdev().ctrl_transfer(0x41, cmd, value, 0, data, timeout=self._timeout)
 
@@ -558,12 +894,105 @@ class NAEUSB_Backend:
         # Vendor-specific, IN, interface control transfer
         if dlen > NAEUSB_CTRL_IO_MAX:
             naeusb_logger.error("The naeusb fw ctrl buffer is 128 bytes, but len(data) > 128. If you get a pipe error, this is why.")
+        self._ctrl_sync()
         response = self.handle.controlRead(0xC1, cmd, value, 0, dlen, timeout=self._timeout)
-        naeusb_logger.debug("READ_CTRL: bmRequestType: {:02X}, \
-                    bRequest: {:02X}, wValue: {:04X}, wIndex: {:04X}, data_len: {:04X}, response: {}".format(0xC1, cmd, \
-                        value, 0, dlen, response))
+        if tracing(naeusb_logger):
+            naeusb_logger.debug("READ_CTRL: bmRequestType: {:02X}, \
+                        bRequest: {:02X}, wValue: {:04X}, wIndex: {:04X}, data_len: {:04X}, response: {}".format(0xC1, cmd, \
+                            value, 0, dlen, response))
         return response
 
+    def readCtrlInto(self, cmd : int, value : int, buf) -> int:
+        """
+        Read len(buf) bytes from the control endpoint straight into buf. Returns the
+        number of bytes read.
+        """
+        view = util.get_writable_memview(buf)
+        dlen = len(view)
+        if dlen > NAEUSB_CTRL_IO_MAX:
+            naeusb_logger.error("The naeusb fw ctrl buffer is 128 bytes, but len(data) > 128. If you get a pipe error, this is why.")
+        self._ctrl_sync()
+        n = self.handle._controlTransfer(0xC1, cmd, value, 0, _c_buffer(view), dlen, self._timeout)
+        if tracing(naeusb_logger):
+            naeusb_logger.debug("READ_CTRL: bmRequestType: {:02X}, \
+                        bRequest: {:02X}, wValue: {:04X}, wIndex: {:04X}, data_len: {:04X}, response: {}".format(0xC1, cmd, \
+                            value, 0, dlen, bytes(view[:n])))
+        return n
+
+    def sendCtrlAsync(self, cmd : int, value : int=0, data : bytearray=bytearray()) -> ControlFuture:
+        """
+        Queue a write to the control endpoint without waiting for it. Queued transfers
+        go out in order, back to back. Errors are raised by the future's result() or
+        by flush().
+        """
+        if tracing(naeusb_logger):
+            naeusb_logger.debug("WRITE_CTRL (async): bRequest: {:02X}, wValue: {:04X}, data: {}".format(cmd, value, data))
+        if len(data) > NAEUSB_CTRL_IO_MAX:
+            naeusb_logger.error("The naeusb fw ctrl buffer is 128 bytes, but len(data) > 128. If you get a pipe error, this is why.")
+        return self.ctrl_queue().submit(0x41, cmd, value, data)
+
+    def readCtrlAsync(self, cmd : int, value : int=0, dlen : int=0) -> ControlFuture:
+        """
+        Queue a read from the control endpoint, after everything already queued. The
+        future's result() is the data read.
+        """
+        if dlen > NAEUSB_CTRL_IO_MAX:
+            naeusb_logger.error("The naeusb fw ctrl buffer is 128 bytes, but len(data) > 128. If you get a pipe error, this is why.")
+        return self.ctrl_queue().submit(0xC1, cmd, value, dlen)
+
+    def flush(self):
+        """
+        Wait for every queued control transfer to finish, raising the first error
+        that hasn't been seen through its future.
+        """
+        if self._ctrl_queue is not None:
+            self._ctrl_queue.flush()
+
+    @contextmanager
+    def pipelined(self):
+        """
+        Context manager queueing sendCtrl() calls instead of waiting for each one,
+        so a run of control writes costs about one round trip. Anything else (reads,
+        bulk transfers) waits for the queue first, so the order is kept. Leaving the
+        block flushes the queue, which is where any write errors are raised.
+        """
+        self._pipelined += 1
+        ok = False
+        try:
+            yield self
+            ok = True
+        finally:
+            self._pipelined -= 1
+            if self._pipelined == 0 and self._ctrl_queue is not None:
+                if ok:
+                    self._ctrl_queue.flush()
+                else:
+                    # don't hide the exception with one from the queue
+                    self._ctrl_queue.wait()
+
+    def ctrl_queue(self) -> ControlTransferQueue:
+        """Queue for async control transfers on the open device"""
+        queue = self._ctrl_queue
+        if queue is None or queue.handle is not self.handle:
+            self._ctrl_queue_close()
+            if self.handle is None:
+                raise OSError("USB Device not found. Did you connect it first?")
+            queue = ControlTransferQueue(self.handle, self._handle_events, self.CTRL_QUEUE_DEPTH, self._timeout,
+                                         self._events_generation)
+            self._ctrl_queue = queue
+        return queue
+
+    def _ctrl_sync(self):
+        # synchronous transfers wait for the queued ones, and report their errors
+        queue = self._ctrl_queue
+        if queue is not None and (queue._in_flight or queue._failed):
+            queue.flush()
+
+    def _ctrl_queue_close(self):
+        if self._ctrl_queue is not None:
+            self._ctrl_queue.close()
+            self._ctrl_queue = None
+
     def _get_timeout(self, timeout):
         """Gets the default timeout if the operation caller did not specify one.
 
@@ -581,12 +1010,25 @@ class NAEUSB_Backend:
             The received data.
         """
         timeout = self._get_timeout(timeout)
+        self._ctrl_sync()
         return self.handle.bulkRead(self.rep, data, timeout)
 
+    def _bulk_read_into(self, view, timeout) -> int:
+        """Reads over the bulk-transfer endpoint straight into view (a writable
+        memoryview of bytes).
+
+        Returns:
+            The number of bytes received.
+        """
+        timeout = self._get_timeout(timeout)
+        self._ctrl_sync()
+        return self.handle._bulkTransfer(self.rep, _c_buffer(view), len(view), timeout)
+
     def _bulk_write(self, data, timeout):
         """Writes data over the bulk-transfer endpoint.
         """
         timeout = self._get_timeout(timeout)
+        self._ctrl_sync()
         self.handle.bulkWrite(self.wep, data, timeout)
 
     def _cmd_ctrl_send_data(self, pload, cmd : int):
@@ -631,15 +1073,39 @@ class NAEUSB_Backend:
         decides to use control-transfer or bulk-endpoint transfer based on data length.
         """
         dlen = int(dlen)
-        if dlen < NAEUSB_CTRL_IO_THRESHOLD:
+        if dlen < self.read_threshold:
             data = self._cmd_readmem_ctrl(addr, dlen)
         else:
             data = self._cmd_readmem_bulk(addr, dlen)
 
-        naeusb_logger.debug("FPGA_READ: bulk: {}, addr: {:08X}, dlen: {:08X}, response: {}"\
-            .format("yes" if dlen >= NAEUSB_CTRL_IO_THRESHOLD else "no", addr, dlen, data))
+        if tracing(naeusb_logger):
+            naeusb_logger.debug("FPGA_READ: bulk: {}, addr: {:08X}, dlen: {:08X}, response: {}"\
+                .format("yes" if dlen >= self.read_threshold else "no", addr, dlen, data))
         return data
 
+    def cmdReadMemInto(self, addr : int, buf) -> int:
+        """
+        cmdReadMem() into a buffer of the caller's (bytearray, memoryview, numpy array...)
+        instead of a new one, reading len(buf) bytes. Both control and bulk reads go
+        straight into buf.
+
+        Returns:
+            The number of bytes read.
+        """
+        view = util.get_writable_memview(buf)
+        dlen = len(view)
+        if dlen < self.read_threshold:
+            self._cmd_ctrl_send_header(addr, dlen, self.CMD_READMEM_CTRL)
+            n = self.readCtrlInto(self.CMD_READMEM_CTRL, 0, view)
+        else:
+            self._cmd_ctrl_send_header(addr, dlen, self.CMD_READMEM_BULK)
+            n = self._bulk_read_into(view, None)
+
+        if tracing(naeusb_logger):
+            naeusb_logger.debug("FPGA_READ: bulk: {}, addr: {:08X}, dlen: {:08X}, response: {}"\
+                .format("yes" if dlen >= self.read_threshold else "no", addr, dlen, bytes(view[:n])))
+        return n
+
     def _cmd_writemem_ctrl(self, addr : int, data):
         """Writes data to the external memory interface via the control-transfer endpoint.
         """
@@ -662,38 +1128,257 @@ class NAEUSB_Backend:
         decides to use control-transfer or bulk-endpoint transfer based on data length.
         """
         pload = util.get_bytes_memview(data)
-        if len(pload) < NAEUSB_CTRL_IO_THRESHOLD:
+        if len(pload) < self.write_threshold:
             self._cmd_writemem_ctrl(addr, pload)
         else:
             self._cmd_writemem_bulk(addr, pload)
 
-        naeusb_logger.debug("FPGA_WRITE: bulk: {}, addr: {:08X}, dlen: {:08X}, response: {}"\
-            .format("yes" if len(pload) >= NAEUSB_CTRL_IO_THRESHOLD else "no", addr, len(pload), data))
+        if tracing(naeusb_logger):
+            naeusb_logger.debug("FPGA_WRITE: bulk: {}, addr: {:08X}, dlen: {:08X}, response: {}"\
+                .format("yes" if len(pload) >= self.write_threshold else "no", addr, len(pload), data))
 
         return None
 
+    def write_many(self, writes):
+        """Write each (addr, data) in writes to the external memory interface, in order.
+
+        Same as calling cmdWriteMem() for each, except that the control transfer writes
+        are built in one buffer and queued together on the ctrl_queue() instead of each
+        waiting for the last. Writes large enough to go over the bulk endpoint wait for
+        the ones before them. Fewer than WRITE_MANY_MIN_BATCH writes go out one at a
+        time.
+
+        If a queued write stalls, it and every write queued after it are sent again,
+        in order, so a later write to the same address isn't undone by a retried one.
+        """
+        writes = [(addr, util.get_bytes_memview(data)) for addr, data in writes]
+        if len(writes) < self.WRITE_MANY_MIN_BATCH:
+            for addr, data in writes:
+                self.cmdWriteMem(addr, data)
+            return
+        threshold = self.write_threshold
+        ctrl_size = sum(LEN_ADDR_HDR_SIZE + len(data) for _, data in writes if len(data) < threshold)
+        # the transfers take copies, so the buffer only has to last for retries
+        buf = self._write_many_buf
+        if len(buf) < ctrl_size:
+            buf = self._write_many_buf = bytearray(ctrl_size)
+        payload = memoryview(buf)
+        pos = 0
+        self._ctrl_sync()
+        queue = self.ctrl_queue()
+        submit = queue.submit
+        sent = []
+        trace = tracing(naeusb_logger)
+        ok = False
+        try:
+            for addr, data in writes:
+                dlen = len(data)
+                if trace:
+                    naeusb_logger.debug("FPGA_WRITE (many): bulk: {}, addr: {:08X}, dlen: {:08X}, data: {}"\
+                        .format("yes" if dlen >= threshold else "no", addr, dlen, bytes(data)))
+                if dlen >= threshold:
+                    self._write_many_check(queue, sent)
+                    self._cmd_writemem_bulk(addr, data)
+                    continue
+                start = pos
+                pos += LEN_ADDR_HDR_SIZE + dlen
+                _LEN_ADDR.pack_into(payload, start, dlen & 0xFFFFFFFF, addr & 0xFFFFFFFF)
+                payload[start + LEN_ADDR_HDR_SIZE:pos] = data
+                pload = payload[start:pos]
+                sent.append((submit(0x41, self.CMD_WRITEMEM_CTRL, 0, pload), pload))
+            ok = True
+        finally:
+            if not ok:
+                queue.wait()
+        self._write_many_check(queue, sent)
+
+    def _write_many_check(self, queue, sent):
+        """Wait for the write_many() control writes in sent. From the first one that
+        stalled on, sends them all again in order.
+        """
+        queue.wait()
+        if not queue._failed:
+            # the usual case, nothing to look through
+            sent.clear()
+            return
+        retry = None
+        for i, (future, pload) in enumerate(sent):
+            exc = future.exception()
+            if exc is not None and retry is None:
+                if not isinstance(exc, usb1.USBErrorPipe):
+                    sent.clear()
+                    raise exc
+                retry = [p for _, p in sent[i:]]
+        # the failures are all seen to now, so flush() doesn't raise them again
+        queue._failed = []
+        sent.clear()
+        if retry:
+            naeusb_logger.info("Attempting pipe error fix - typically safe to ignore")
+            queue.submit(0x41, 0x22, 0x11, b"")
+            for pload in retry:
+                queue.submit(0x41, self.CMD_WRITEMEM_CTRL, 0, pload)
+            queue.flush()
+
+    def set_transfer_thresholds(self, read : Optional[int]=None, write : Optional[int]=None):
+        """Set the sizes from which memory reads/writes use the bulk endpoint instead of the
+        control one. None leaves that direction alone. Clamped to what fits in a control
+        transfer.
+        """
+        if read is not None:
+            self.read_threshold = max(1, min(int(read), NAEUSB_CTRL_READ_MAX + 1))
+        if write is not None:
+            self.write_threshold = max(1, min(int(write), NAEUSB_CTRL_WRITE_MAX + 1))
+
+    def _load_transfer_thresholds(self):
+        # thresholds calibrated for this board before, otherwise the defaults
+        self.read_threshold = NAEUSB_CTRL_IO_THRESHOLD
+        self.write_threshold = NAEUSB_CTRL_IO_THRESHOLD
+        try:
+            entry = default_threshold_cache().get(self.sn)
+        except (OSError, ValueError) as e:
+            naeusb_logger.info("Could not load transfer thresholds: {}".format(e))
+            return
+        if entry and entry.get("pid") == self.pid:
+            naeusb_logger.debug("Using calibrated transfer thresholds {}".format(entry))
+            self.set_transfer_thresholds(entry.get("read"), entry.get("write"))
+
+    def calibrate_transfer_thresholds(self, addr : int, write : bool=False, sizes=None,
+                                      repeats : int=10, save : bool=True) -> Dict[str, int]:
+        """Time memory reads (and writes) of each size over both the control and bulk
+        endpoints, and from then on use bulk from the smallest size at which it was
+        faster. The result is saved for this board's serial number, and used again
+        whenever it connects.
+
+        Args:
+            addr (int): Address of an FPGA memory/scratch area that can be read (and
+                written) at any size up to max(sizes) without side effects.
+            write (bool): Also calibrate writes. Each size writes back what was read
+                from addr.
+            sizes (list, optional): Sizes to try, at most NAEUSB_CTRL_WRITE_MAX.
+                Defaults to CALIBRATION_SIZES.
+            repeats (int): Timings per size and endpoint; the median is used.
+            save (bool): Save the result to the threshold cache.
+
+        Returns:
+            {'read': threshold, 'write': threshold}
+        """
+        sizes = sorted(self.CALIBRATION_SIZES if sizes is None else sizes)
+        if not sizes or sizes[0] < 1 or sizes[-1] > NAEUSB_CTRL_WRITE_MAX:
+            raise ValueError("Calibration sizes must be between 1 and {}".format(NAEUSB_CTRL_WRITE_MAX))
+
+        def crossover(ctrl, bulk):
+            ctrl_times, bulk_times = [], []
+            for _ in range(repeats):
+                # interleaved, so drift affects both the same
+                t0 = time.perf_counter()
+                ctrl()
+                t1 = time.perf_counter()
+                bulk()
+                t2 = time.perf_counter()
+                ctrl_times.append(t1 - t0)
+                bulk_times.append(t2 - t1)
+            ctrl_times.sort()
+            bulk_times.sort()
+            return bulk_times[repeats // 2] < ctrl_times[repeats // 2]
+
+        def threshold(is_faster):
+            for size in sizes:
+                if is_faster(size):
+                    return size
+            return sizes[-1] + 1
+
+        result = {}
+        result["read"] = threshold(lambda n: crossover(lambda: self._cmd_readmem_ctrl(addr, n),
+                                                       lambda: self._cmd_readmem_bulk(addr, n)))
+        if write:
+            data = self._cmd_readmem_ctrl(addr, sizes[-1])
+            result["write"] = threshold(lambda n: crossover(lambda: self._cmd_writemem_ctrl(addr, data[:n]),
+                                                            lambda: self._cmd_writemem_bulk(addr, data[:n])))
+        else:
+            result["write"] = self.write_threshold
+        self.set_transfer_thresholds(result["read"], result["write"])
+        result = {"read": self.read_threshold, "write": self.write_threshold}
+        naeusb_logger.info("Calibrated transfer thresholds: {}".format(result))
+        if save:
+            default_threshold_cache().record(self.sn, self.pid, result["read"], result["write"])
+        return result
+
     def cmdWriteBulk(self, data : bytearray, timeout = None):
         """
         Write data directly to the bulk endpoint.
         :param data: Data to be written
         :return:
         """
-        naeusb_logger.debug("BULK WRITE: data = {}".format(data))
+        if tracing(naeusb_logger):
+            naeusb_logger.debug("BULK WRITE: data = {}".format(data))
         self._bulk_write(data, timeout)
 
     writeBulk = cmdWriteBulk
 
     def flushInput(self):
         """Dump all the crap left over"""
+        self.drain()
+
+    def drain(self, timeout : int=DRAIN_TIMEOUT_MS, max_bytes : int=DRAIN_MAX_BYTES) -> int:
+        """Throw away whatever is waiting on the bulk IN endpoint.
+
+        Reads with a reused async transfer until one comes back short, empty or
+        timed out, so draining an endpoint with nothing left on it costs at most
+        timeout ms rather than a full blocking read.
+
+        Returns:
+            Number of bytes thrown away, which is also added to drained_bytes.
+        """
+        handle = self.handle
+        if handle is None:
+            return 0
+        self._ctrl_sync()
+        if self._drain_transfer is None or self._drain_handle is not handle:
+            self._drain_close()
+            self._drain_transfer = handle.getTransfer()
+            self._drain_handle = handle
+            self._drain_buf = bytearray(self.DRAIN_CHUNK_SIZE)
+        transfer = self._drain_transfer
+        drained = 0
         try:
-            # TODO: This probably isn't needed, and causes slow-downs on Mac OS X.
-            self._bulk_read(1000, 0.010)
-        except:
-            pass
+            while drained < max_bytes:
+                transfer.setBulk(self.rep, self._drain_buf, timeout=timeout)
+                transfer.submit()
+                while True:
+                    since = self._events_generation()
+                    if not transfer.isSubmitted():
+                        break
+                    try:
+                        self._handle_events(timeout / 1000, since)
+                    except usb1.USBErrorInterrupted:
+                        pass
+                n = transfer.getActualLength()
+                drained += n
+                if transfer.getStatus() != usb1.TRANSFER_COMPLETED or n < len(self._drain_buf):
+                    break
+        except usb1.USBError as e:
+            naeusb_logger.info("Drain stopped: {}".format(e))
+        self.drained_bytes += drained
+        if drained:
+            naeusb_logger.debug("Drained {} bytes".format(drained))
+        return drained
+
+    def _drain_close(self):
+        if self._drain_transfer is not None:
+            try:
+                if self._drain_transfer.isSubmitted():
+                    self._drain_transfer.cancel()
+                else:
+                    self._drain_transfer.close()
+            except (usb1.USBError, ValueError):
+                pass
+        self._drain_transfer = None
+        self._drain_handle = None
 
     def read(self, dbuf : bytearray, timeout : int) -> bytearray:
         resp = self._bulk_read(dbuf, timeout)
-        naeusb_logger.debug("BULK READ: data = {}".format(dbuf))
+        if tracing(naeusb_logger):
+            naeusb_logger.debug("BULK READ: data = {}".format(dbuf))
         return resp
 
 class NAEUSB:
@@ -717,15 +1402,32 @@ class NAEUSB:
 
     stream = False
 
+    # Husky streaming: transfers kept in flight at once
+    stream_queue_depth = 16
+
     # TODO: make this better
     fwversion_latest = [0, 11]
-    def __init__(self):
+    def __init__(self, backend : Optional[NAEUSB_Backend]=None):
+        """
+        Args:
+            backend (NAEUSB_Backend, optional): Backend used to talk to the device. Defaults to
+                a new libusb NAEUSB_Backend. Pass a NAEUSB_SimBackend to run without hardware.
+        """
         self._usbdev = None
         self.handle=None
-        self.usbtx = NAEUSB_Backend()
+        if backend is None:
+            backend = NAEUSB_Backend()
+        self.usbtx = backend
         self.usbserializer = self.usbtx
         self._fw_ver = None
         self.streamModeCaptureStream = None
+        self._stream_pool = []
+        self._stream_pool_handle = None
+        self._stream_buffers = {}
+        self._stream_worker_thread = None
+        self._features = None
+        #: Bytes left on the endpoint after the last stream, thrown away by cmdReadStream()
+        self.stream_drained_bytes = 0
 
     def get_possible_devices(self, idProduct : List[int]) -> usb1.USBDevice:
         return self.usbtx.get_possible_devices(idProduct)
@@ -808,12 +1510,14 @@ class NAEUSB:
 
 
         self.snum=self.usbtx.sn
+        self._fw_ver = None
         fwverraw = self.readFwVersion()
+        self._features = FeatureSet(self.usbtx.pid, fwverraw)
         fwver = "{}.{}.{}".format(fwverraw[0], fwverraw[1], fwverraw[2])
         naeusb_logger.info('SAM3U Firmware version = {}'.format(fwver))
 
 
-        fw_latest : str = "0.0"
+        fw_latest : Optional[str] = "0.0"
 
         if self.usbtx.pid in NEWAE_PIDS:
             name = NEWAE_PIDS[self.usbtx.pid]['name'] # type: ignore
@@ -821,7 +1525,7 @@ class NAEUSB:
         else:
             name = "Unknown (PID = %04x)"%self.usbtx.pid
 
-        latest = fwver >= fw_latest
+        latest = fw_latest is None or parse_fw_version(fwverraw) >= parse_fw_version(fw_latest)
         if not latest:
             naeusb_logger.warning('Your firmware ({}) is outdated - latest is {}'.format(fwver, fw_latest) +
                              ' See https://chipwhisperer.readthedocs.io/en/latest/firmware.html for more information')
@@ -853,8 +1557,12 @@ class NAEUSB:
 
     def close(self):
         """Close USB connection."""
+        self._stream_finish()
+        self._stream_worker_stop()
+        self._stream_transfers_close()
         self.usbtx.close()
         self.snum = None
+        self._features = None
 
     def readFwVersion(self) -> bytearray:
         if self._fw_ver is None:
@@ -880,6 +1588,43 @@ class NAEUSB:
         # Vendor-specific, IN, interface control transfer
         return self.usbserializer.readCtrl(cmd, value, dlen)
 
+    def readCtrlInto(self, cmd : int, value : int, buf) -> int:
+        """
+        Read len(buf) bytes from the control endpoint into buf. Returns the number of bytes read.
+        """
+        return self.usbserializer.readCtrlInto(cmd, value, buf)
+
+    def sendCtrlAsync(self, cmd : int, value : int=0, data : bytearray=bytearray()) -> ControlFuture:
+        """
+        Queue a write to the control endpoint without waiting for it. See
+        NAEUSB_Backend.sendCtrlAsync().
+        """
+        return self.usbserializer.sendCtrlAsync(cmd, value, data)
+
+    def readCtrlAsync(self, cmd : int, value : int=0, dlen : int=0) -> ControlFuture:
+        """
+        Queue a read from the control endpoint. The future's result() is the data read.
+        """
+        return self.usbserializer.readCtrlAsync(cmd, value, dlen)
+
+    def flush(self):
+        """
+        Wait for all queued control transfers to finish, raising the first error.
+        """
+        self.usbserializer.flush()
+
+    def pipelined(self):
+        """
+        Context manager queueing control writes instead of waiting for each one::
+
+            with naeusb.pipelined():
+                naeusb.sendCtrl(...)
+                naeusb.sendCtrl(...)
+
+        See NAEUSB_Backend.pipelined().
+        """
+        return self.usbserializer.pipelined()
+
     def cmdReadMem(self, addr : int, dlen : int) -> bytearray:
         """
         Send command to read over external memory interface from FPGA. Automatically
@@ -888,6 +1633,14 @@ class NAEUSB:
 
         return self.usbserializer.cmdReadMem(addr, dlen)
 
+    def cmdReadMemInto(self, addr : int, buf) -> int:
+        """
+        Read len(buf) bytes over the external memory interface into buf (a bytearray,
+        memoryview, numpy array...), with no buffer of its own in between. Returns the
+        number of bytes read.
+        """
+        return self.usbserializer.cmdReadMemInto(addr, buf)
+
     def cmdWriteMem(self, addr : int, data : bytearray):
         """
         Send command to write memory over external memory interface to FPGA. Automatically
@@ -896,6 +1649,29 @@ class NAEUSB:
 
         return self.usbserializer.cmdWriteMem(addr, data)
 
+    def write_many(self, writes):
+        """
+        Write each (addr, data) in writes over the external memory interface, in order, with
+        the small (control transfer) writes kept in flight together. See NAEUSB_Backend.write_many().
+        """
+        return self.usbserializer.write_many(writes)
+
+    def calibrate_transfer_thresholds(self, addr : int, write : bool=False, sizes=None,
+                                      repeats : int=10, save : bool=True) -> Dict[str, int]:
+        """
+        Measure at which sizes memory reads (and writes) get faster over the bulk endpoint
+        than the control one, and use that from now on, and whenever this board connects
+        again. addr must be an FPGA scratch area that can be read (and written) without
+        side effects. See NAEUSB_Backend.calibrate_transfer_thresholds().
+        """
+        return self.usbserializer.calibrate_transfer_thresholds(addr, write, sizes, repeats, save)
+
+    def set_transfer_thresholds(self, read : Optional[int]=None, write : Optional[int]=None):
+        """
+        Set the sizes from which memory reads/writes use the bulk endpoint (48 by default).
+        """
+        self.usbserializer.set_transfer_thresholds(read, write)
+
     def writeBulkEP(self, data : bytearray, timeout = None):
         """
         Write directoly to the bulk endpoint.
@@ -908,24 +1684,113 @@ class NAEUSB:
         """Dump all the crap left over"""
         self.usbserializer.flushInput()
 
-    class StreamModeCaptureThreadHusky(Thread):
-        def __init__(self, serial, dlen, segment_size, dbuf_temp, timeout_ms=2000, is_husky=False):
+    class StreamJob:
+        """A streaming capture, run by the device's stream worker thread.
+
+        Keeps the part of the Thread interface the capture classes used to have:
+        start() queues the capture, join() waits for it to finish and is_alive()
+        is True until it has.
+
+        Attributes:
+            exception: The exception run() raised, if any.
+        """
+        def __init__(self, serial):
+            self.serial = serial
+            self.exception = None
+            self._started = False
+            self._finished = threading.Event()
+
+        def run(self):
+            raise NotImplementedError
+
+        def start(self):
+            if self._started:
+                raise RuntimeError("Stream captures can only be started once")
+            self._started = True
+            self.serial._stream_worker().submit(self)
+
+        def _execute(self):
+            try:
+                self.run()
+            except Exception as e:
+                self.exception = e
+                naeusb_logger.error("Streaming: capture failed: {}".format(e), exc_info=True)
+            finally:
+                self._finished.set()
+
+        def join(self, timeout : Optional[float]=None):
+            if self._started:
+                self._finished.wait(timeout)
+
+        def is_alive(self) -> bool:
+            return self._started and not self._finished.is_set()
+
+    class StreamWorker(Thread):
+        """Long lived thread that runs a device's StreamJobs one after another, so
+        back to back captures don't each pay for a new thread.
+        """
+        def __init__(self, serial):
+            Thread.__init__(self, name="NAEUSB stream worker", daemon=True)
+            self.serial = serial
+            self._jobs = queue.Queue()
+
+        def submit(self, job : "NAEUSB.StreamJob"):
+            self._jobs.put(job)
+
+        def shutdown(self):
+            """Stop once the queued jobs are done"""
+            self._jobs.put(None)
+            if self.is_alive() and self is not threading.current_thread():
+                self.join()
+
+        def run(self):
+            while True:
+                job = self._jobs.get()
+                if job is None:
+                    return
+                job._execute()
+
+    class StreamModeCaptureThreadHusky(StreamJob):
+        def __init__(self, serial, dlen, segment_size, dbuf_temp, timeout_ms=2000, is_husky=False, direct=True,
+                     queue_depth=None):
             """TODO UPDATE THIS DESC
             Reads from the FIFO in streaming mode. Requires the FPGA to be previously configured into
             streaming mode and then arm'd, otherwise this may return incorrect information.
 
+            At most queue_depth transfers are in flight at once; each is resubmitted for the next
+            segment as it completes, so memory use doesn't depend on the capture length. The
+            transfers come from serial's stream transfer pool and are reused by later captures.
+
             Args:
                 dlen: Number of samples to request.
                 dbuf_temp: Temporary data buffer, must be of size cmdReadStream_bufferSize(dlen) or bad things happen
                 timeout_ms: Timeout in ms to wait for stream to start, otherwise returns a zero-length buffer
                 is_husky: False for CW-Pro, True for CW-Husky
+                direct: If dbuf_temp is a writable buffer (bytearray, numpy uint8 array, memoryview...)
+                    of at least dlen bytes, have libusb receive each segment straight into its
+                    place in dbuf_temp instead of copying it there from the transfer's own buffer.
+                    Otherwise each segment is copied there with a single memoryview copy.
+                queue_depth: Number of transfers kept in flight, defaults to serial.stream_queue_depth
             Returns:
                 Tuple of (samples_per_block, total_bytes_rx)
             """
-            Thread.__init__(self)
+            NAEUSB.StreamJob.__init__(self, serial)
             self.dlen = dlen
             self.segment_size = segment_size
             self.dbuf_temp = dbuf_temp
+            self._dest = None
+            self._direct = False
+            try:
+                dest = memoryview(dbuf_temp).cast('B')
+                if dest.readonly or len(dest) < dlen:
+                    # too small buffers are extended as data arrives, as before
+                    dest.release()
+                else:
+                    self._dest = dest
+                    self._direct = direct
+            except (TypeError, ValueError):
+                # not a contiguous buffer, e.g. a list
+                pass
             # self.dbuf_temp.extend([0] * (dlen - len(self.dbuf_temp)))
             self.timeout_ms = timeout_ms
             self.serial = serial
@@ -933,94 +1798,158 @@ class NAEUSB:
             self.drx = 0
             self._is_husky = is_husky
             self.stop = False
+            self.queue_depth = queue_depth or serial.stream_queue_depth
+            self._to_submit = 0
+            self._next_offset = 0
+            self._error = None
+            # callbacks may run on the shared event thread, alongside run()
+            self._lock = threading.RLock()
+
+        def _setup(self, transfer : usb1.USBTransfer):
+            """Point transfer at the next segment: its place in dbuf_temp if receiving directly,
+            otherwise its own buffer. user_data is the offset it was set up for.
+            """
+            offset = self._next_offset
+            if self._direct and offset + self.segment_size <= len(self._dest):
+                # libusb fills this part of dbuf_temp
+                transfer.setBulk(usb1.ENDPOINT_IN | 0x05, \
+                    self._dest[offset:offset + self.segment_size], \
+                    callback=self.callback, user_data=offset)
+            else:
+                transfer.setBulk(usb1.ENDPOINT_IN | 0x05, \
+                    self.serial._stream_buffer(transfer, self.segment_size), \
+                    callback=self.callback, user_data=offset)
+            self._next_offset += self.segment_size
+
+        def _submit(self, transfer : usb1.USBTransfer):
+            self._setup(transfer)
+            transfer.submit()
 
         def run(self):
-            # basically just setup a bunch of async transfers, then handle them via callback
+            # keep a ring of async transfers going, resubmitting each from the callback
             naeusb_logger.info("Streaming: starting USB read")
-            transfer_list = []
-            unsubmitted_transfers = []
             self.drx = 0
+            self._next_offset = 0
+            self._error = None
             stream_start =  time.time()
+            num_transfers = int(self.dlen // self.segment_size)
+            if (self.dlen % self.segment_size) != 0:
+                num_transfers += 1
+            naeusb_logger.debug("Doing {} transfers".format(num_transfers))
+            naeusb_logger.debug("Calc'd from dlen = {} and segment_len = {}".format(self.dlen, self.segment_size))
+
+            ring = self.serial._stream_transfers(min(self.queue_depth, num_transfers))
+            self._to_submit = num_transfers
+            submitted = []
             try:
-                num_transfers = int(self.dlen // self.segment_size)
-                if (self.dlen % self.segment_size) != 0:
-                    num_transfers += 1
-                naeusb_logger.debug("Doing {} transfers".format(num_transfers))
-                naeusb_logger.debug("Calc'd from dlen = {} and segment_len = {}".format(self.dlen, self.segment_size))
-                for i in range(num_transfers):
-                    transfer = self.serial.usbtx.handle.getTransfer()
-                    transfer.setBulk(usb1.ENDPOINT_IN | 0x05, \
-                        self.segment_size, \
-                        callback=self.callback)
+                with self._lock:
+                    for transfer in ring:
+                        try:
+                            self._submit(transfer)
+                        except usb1.USBError as e:
+                            # e.g. ENOMEM, carry on with a shallower queue
+                            self._next_offset -= self.segment_size
+                            if not submitted:
+                                naeusb_logger.error("Libusb async transfer request failed with: {}".format(str(e)))
+                                raise
+                            naeusb_logger.info("Only {} stream transfers could be submitted: {}".format(len(submitted), str(e)))
+                            break
+                        submitted.append(transfer)
+                        self._to_submit -= 1
+
+                # handling events does the callbacks, which resubmit the transfers
+                usbtx = self.serial.usbtx
+                while True:
+                    since = usbtx._events_generation()
+                    if not any(x.isSubmitted() for x in submitted):
+                        break
                     try:
-                        transfer.submit()
-                        transfer_list.append(transfer)
-                    except usb1.USBError as e:
-                        # On Linux, trying to allocate for > ~10M samples seems to not work (ENOMEM)
-                        # Putting them in a list and attempting a resubmit later seems to fix things
-                        unsubmitted_transfers.append(transfer)
-                        naeusb_logger.info("Unsubmitted transfer, will try again later. Err = {}".format(str(e)))
-            except IOError as e:
-                raise
-
-            # basically poll all the transfers we've setup
-            start = time.time()
-            while any(x.isSubmitted() for x in transfer_list):
-                # handleEvents does the callbacks
-                try:
-                    self.serial.usbtx.usb_ctx.handleEvents()
+                        usbtx._handle_events(0.01, since)
+
+                        if self.stop:
+                            with self._lock:
+                                self.stop = False
+                                self._to_submit = 0
+                                for transfer in submitted:
+                                    if transfer.isSubmitted():
+                                        transfer.cancel()
+                    except usb1.USBErrorInterrupted:
+                        pass
+            finally:
+                self._release()
 
-                    if self.stop:
-                        self.stop = False
-                        for transfer in transfer_list:
-                            if transfer.isSubmitted():
-                                transfer.cancel()
-                except usb1.USBErrorInterrupted:
-                    pass
-                    
-                # try resubmitting transfers that failed earlier (likely due to enomem)
-                for transfer in unsubmitted_transfers:
-                    try:
-                        naeusb_logger.info("Attempting transfer resubmit")
-                        transfer.submit()
-                        unsubmitted_transfers.remove(transfer)
-                        transfer_list.append(transfer)
-                    except usb1.USBError as e:
-                        naeusb_logger.info("Still can't handle this: {}".format(str(e))) # this will probably still happen a lot before it works
-                        diff = (time.time() - start) * 1000
-                        if diff > self.timeout_ms: # if the capture has timed out
-                            naeusb_logger.error("Libusb async transfer request failed with: {}".format(str(e)))
-                            naeusb_logger.error("NOTE: If you're doing a long transfer, try increasing scope.adc.timeout")
-
-                            # cancel all submitted transfers to prevent pipe errors
-                            for transfer in transfer_list:
-                                if transfer.isSubmitted():
-                                    transfer.cancel()
-                            raise e
-                
             naeusb_logger.info("Streaming: Received %d bytes in time %.20f)" % (self.drx, time.time() - stream_start))
+            if self._error is not None:
+                naeusb_logger.error("NOTE: If you're doing a long transfer, try increasing scope.adc.timeout")
+                raise self._error
+
+        def _release(self):
+            """Drop the views of dbuf_temp, so it can be resized again"""
+            if self._dest is not None:
+                self.serial._stream_transfers_detach()
+                try:
+                    self._dest.release()
+                except BufferError:
+                    # still referenced by a transfer, freed when that's collected
+                    pass
+                self._dest = None
+
+        def _resubmit(self, transfer : usb1.USBTransfer):
+            try:
+                self._submit(transfer)
+            except usb1.USBError as e:
+                # remaining transfers drain, then run() raises this
+                naeusb_logger.error("Libusb async transfer request failed with: {}".format(str(e)))
+                self._error = e
+                self._to_submit = 0
 
         def callback(self, transfer : usb1.USBTransfer):
             """ Handle finished asynchronous bulk transfer"""
+            with self._lock:
+                if self._error is not None:
+                    return
+                try:
+                    self._callback(transfer)
+                except Exception as e:
+                    # stop resubmitting, so no pooled transfer is left in flight for the next
+                    # capture: the rest of the ring drains, then run() raises this
+                    self._error = e
+                    self._to_submit = 0
+
+        def _callback(self, transfer : usb1.USBTransfer):
             if transfer.getStatus() == usb1.TRANSFER_CANCELLED:
                 return
             if (self.drx >= self.dlen):
                 self.drx += transfer.getActualLength()
                 return
             if (transfer.getActualLength() == 0) and (self.drx < self.dlen):
-                transfer.submit()
+                self._resubmit(transfer)
                 naeusb_logger.info("Got 0 bytes back from stream with error {}".format(transfer.getStatus()))
                 return
 
-            self.dbuf_temp[self.drx:self.drx+transfer.getActualLength()] = array.array('B', transfer.getBuffer()[:transfer.getActualLength()])
-            self.drx += transfer.getActualLength()
+            dlen = transfer.getActualLength()
+            if self._dest is None:
+                self.dbuf_temp[self.drx:self.drx+dlen] = array.array('B', transfer.getBuffer()[:dlen])
+            elif not (self._direct and transfer.getUserData() == self.drx and \
+                      transfer.getUserData() + self.segment_size <= len(self._dest)):
+                # own buffer, or received into dbuf_temp but an earlier short segment moved
+                # where it belongs; either way a single copy into place. Transfers complete in
+                # the order they were submitted, so drx never passes a segment's offset and
+                # this can't overwrite one still in flight.
+                n = min(dlen, len(self._dest) - self.drx)
+                self._dest[self.drx:self.drx+n] = memoryview(transfer.getBuffer()).cast('B')[:n]
+            self.drx += dlen
             if transfer.getStatus() != usb1.TRANSFER_COMPLETED:
-                transfer.submit()
+                self._resubmit(transfer)
                 naeusb_logger.error("Stream failed with error {}, retrying".format(transfer.getStatus()))
                 return
-            naeusb_logger.debug("stream completed with {} bytes".format(transfer.getActualLength()))
+            if tracing(naeusb_logger):
+                naeusb_logger.debug("stream completed with {} bytes".format(transfer.getActualLength()))
+            if self._to_submit > 0:
+                self._to_submit -= 1
+                self._resubmit(transfer)
 
-    class StreamModeCaptureThreadPro(Thread):
+    class StreamModeCaptureThreadPro(StreamJob):
         def __init__(self, serial, dlen : int, dbuf_temp : bytearray, timeout_ms : int=2000):
             """
             Reads from the FIFO in streaming mode. Requires the FPGA to be previously configured into
@@ -1032,7 +1961,7 @@ class NAEUSB:
             Returns:
                 Tuple of (samples_per_block, total_bytes_rx)
             """
-            Thread.__init__(self)
+            NAEUSB.StreamJob.__init__(self, serial)
             self.dlen = dlen
             self.dbuf_temp = dbuf_temp
             self.timeout_ms = timeout_ms
@@ -1045,7 +1974,11 @@ class NAEUSB:
             start = time.time()
             try:
                 x = self.serial.usbtx.read(len(self.dbuf_temp), timeout=self.timeout_ms)
-                self.dbuf_temp[:] = array.array('B', x)[:]
+                if isinstance(self.dbuf_temp, (bytearray, list, array.array)):
+                    self.dbuf_temp[:] = array.array('B', x)[:]
+                else:
+                    # fixed size buffers (numpy arrays, mmaps) are filled from the start
+                    memoryview(self.dbuf_temp).cast('B')[:len(x)] = x
                 self.drx = len(x)
             except Exception as e:
                 naeusb_logger.warning('Streaming: USB stream read timed out')
@@ -1053,6 +1986,260 @@ class NAEUSB:
             naeusb_logger.debug("Streaming: Received %d bytes in time %.20f)" % (self.drx, diff))
             naeusb_logger.debug("Expected {}".format(len(self.dbuf_temp)))
 
+    def _stream_finish(self):
+        """Wait for the previous stream to finish, stopping it if it's a stream_chunks() one"""
+        if isinstance(self.streamModeCaptureStream, NAEUSB.StreamChunks):
+            self.streamModeCaptureStream.close()
+        elif self.streamModeCaptureStream:
+            self.streamModeCaptureStream.join()
+
+    def _stream_worker(self) -> "NAEUSB.StreamWorker":
+        """The device's stream worker, started on first use"""
+        if self._stream_worker_thread is None or not self._stream_worker_thread.is_alive():
+            self._stream_worker_thread = NAEUSB.StreamWorker(self)
+            self._stream_worker_thread.start()
+        return self._stream_worker_thread
+
+    def _stream_worker_stop(self):
+        if self._stream_worker_thread is not None:
+            self._stream_worker_thread.shutdown()
+            self._stream_worker_thread = None
+
+    def _stream_buffer(self, transfer : usb1.USBTransfer, size : int) -> bytearray:
+        """transfer's own receive buffer of size bytes, kept between captures"""
+        buf = self._stream_buffers.get(transfer)
+        if buf is None or len(buf) != size:
+            buf = self._stream_buffers[transfer] = bytearray(size)
+        return buf
+
+    def _stream_transfers(self, count : int) -> List[usb1.USBTransfer]:
+        """count transfers from the stream transfer pool, which is kept between captures"""
+        handle = self.usbtx.handle
+        if handle is not self._stream_pool_handle:
+            # reconnected, the old transfers belong to the old handle
+            self._stream_transfers_close()
+            self._stream_pool_handle = handle
+        while len(self._stream_pool) < count:
+            self._stream_pool.append(handle.getTransfer())
+        return self._stream_pool[:count]
+
+    def _stream_transfers_detach(self):
+        """Give pooled transfers their own buffers again, dropping any views of a capture buffer"""
+        for transfer in self._stream_pool:
+            if not transfer.isSubmitted() and transfer.getUserData() is not None:
+                transfer.setBuffer(self._stream_buffers.get(transfer, 0))
+                transfer.setUserData(None)
+
+    def _stream_transfers_close(self):
+        for transfer in self._stream_pool:
+            try:
+                if transfer.isSubmitted():
+                    transfer.cancel()
+                else:
+                    transfer.close()
+            except (usb1.USBError, ValueError):
+                pass
+        self._stream_pool = []
+        self._stream_pool_handle = None
+        self._stream_buffers = {}
+
+    class StreamChunks(Thread):
+        """Iterator over the data of a streaming capture as it arrives, from NAEUSB.stream_chunks().
+
+        Yields memoryviews of up to chunk_size bytes, each over its own buffer. A background
+        thread reads the stream into a queue. Once max_queued chunks are waiting to be consumed
+        or being received, it stops reading (for Husky, completed transfers aren't resubmitted
+        until there's room), leaving the data in the capture hardware's FIFO; if that
+        overflows, the stream ends early and overflow is set.
+
+        Attributes:
+            drx (int): Bytes received so far.
+            overflow (tuple): None, or (samples_left_to_stream, overflow_location,
+                unknown_overflow) from cmdReadStream_getStatus() if the stream ended early
+                because of an overflow.
+        """
+        def __init__(self, serial, dlen, chunk_size, max_queued, timeout_ms, is_husky, queue_depth):
+            Thread.__init__(self, daemon=True)
+            self.serial = serial
+            self.dlen = dlen
+            self.chunk_size = chunk_size
+            self.max_queued = max_queued
+            self.timeout_ms = timeout_ms
+            self._is_husky = is_husky
+            self.queue_depth = min(queue_depth or serial.stream_queue_depth, max_queued)
+            self.drx = 0
+            self.overflow = None
+            self.stop = False
+            self._queue = queue.Queue()
+            self._done = object()
+            self._error = None
+            self._finished = False
+
+            self._requested = 0
+            self._parked = []
+            self._last_data = 0
+            self._ended = False
+            self._in_flight = 0
+            # Husky callbacks may run on the shared event thread, alongside run()
+            self._lock = threading.RLock()
+
+        def __iter__(self):
+            return self
+
+        def __next__(self) -> memoryview:
+            if self._finished:
+                raise StopIteration
+            item = self._queue.get()
+            if item is self._done:
+                self._finished = True
+                self.join()
+                if self._error is not None:
+                    raise self._error
+                raise StopIteration
+            return item
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            self.close()
+
+        def close(self):
+            """Stop reading the stream and wait for the reader thread to finish"""
+            self.stop = True
+            if self.is_alive():
+                self.join()
+            self._finished = True
+
+        def _put(self, data):
+            self.drx += len(data)
+            self._queue.put(data)
+
+        def _want(self) -> int:
+            """Bytes still to request, or None for an unlimited stream"""
+            if self.dlen is None:
+                return None
+            return max(0, self.dlen - self._requested)
+
+        def run(self):
+            try:
+                if self._is_husky:
+                    self._run_husky()
+                else:
+                    self._run_pro()
+                if self.dlen is None or self.drx < self.dlen:
+                    self._check_overflow()
+            except Exception as e:
+                self._error = e
+            finally:
+                self._queue.put(self._done)
+
+        def _check_overflow(self):
+            if self.stop:
+                return
+            status = self.serial.cmdReadStream_getStatus()
+            if status[1] or status[2]:
+                self.overflow = status
+                naeusb_logger.warning("Streaming: overflow after {} bytes, status = {}".format(self.drx, status))
+
+        def _run_pro(self):
+            total = self.serial.cmdReadStream_bufferSize(self.dlen)
+            try:
+                while self.drx < total and not self.stop:
+                    while self._queue.qsize() >= self.max_queued and not self.stop:
+                        time.sleep(0.001)
+                    try:
+                        data = self.serial.usbtx.read(min(self.chunk_size, total - self.drx), timeout=self.timeout_ms)
+                    except usb1.USBErrorTimeout:
+                        naeusb_logger.warning('Streaming: USB stream read timed out')
+                        break
+                    self._put(memoryview(data))
+            finally:
+                # Ensure stream mode disabled
+                self.serial.sendCtrl(NAEUSB.CMD_MEMSTREAM, data=packuint32(0))
+            # Pro sends whole blocks, so dlen isn't a byte count
+            self.dlen = total
+
+        def _submit(self, transfer : usb1.USBTransfer):
+            want = self._want()
+            size = self.chunk_size if want is None else min(self.chunk_size, want)
+            transfer.setBulk(usb1.ENDPOINT_IN | 0x05, bytearray(size), callback=self._callback,
+                             timeout=self.timeout_ms)
+            self._requested += size
+            transfer.submit()
+            self._in_flight += 1
+
+        def _full(self) -> bool:
+            # chunks in flight count too, so at most max_queued buffers exist at once
+            return self._queue.qsize() + self._in_flight >= self.max_queued
+
+        def _can_submit(self) -> bool:
+            want = self._want()
+            return not (self.stop or self._ended) and (want is None or want > 0)
+
+        def _run_husky(self):
+            ring = self.serial._stream_transfers(self.queue_depth)
+            self._last_data = time.time()
+            try:
+                with self._lock:
+                    for transfer in ring:
+                        if not self._can_submit():
+                            break
+                        self._submit(transfer)
+                usbtx = self.serial.usbtx
+                while True:
+                    since = usbtx._events_generation()
+                    with self._lock:
+                        if self.stop or self._ended:
+                            for transfer in ring:
+                                if transfer.isSubmitted():
+                                    transfer.cancel()
+                            self._parked = []
+                        # resubmit transfers held back while the consumer was behind
+                        while self._parked and not self._full():
+                            transfer = self._parked.pop()
+                            if self._can_submit():
+                                self._submit(transfer)
+                        if not any(x.isSubmitted() for x in ring) and not self._parked:
+                            break
+                    try:
+                        usbtx._handle_events(0.001, since)
+                    except usb1.USBErrorInterrupted:
+                        pass
+            finally:
+                self.serial._stream_transfers_detach()
+
+        def _callback(self, transfer : usb1.USBTransfer):
+            with self._lock:
+                self._handle_transfer(transfer)
+
+        def _handle_transfer(self, transfer : usb1.USBTransfer):
+            self._in_flight -= 1
+            status = transfer.getStatus()
+            if status == usb1.TRANSFER_CANCELLED:
+                return
+            n = transfer.getActualLength()
+            data = transfer.getBuffer()
+            # whatever didn't arrive still needs requesting
+            self._requested -= len(data) - n
+            if n:
+                # the next submission gets a new buffer, so this one is the consumer's
+                self._put(memoryview(data)[:n])
+                self._last_data = time.time()
+            elif (time.time() - self._last_data) * 1000 >= self.timeout_ms:
+                # nothing for a whole timeout: finished, or overflowed
+                naeusb_logger.info("Streaming: no data for {} ms, stopping".format(self.timeout_ms))
+                self._ended = True
+                return
+            if status not in (usb1.TRANSFER_COMPLETED, usb1.TRANSFER_TIMED_OUT):
+                naeusb_logger.error("Stream failed with error {}, retrying".format(status))
+            if not self._can_submit():
+                return
+            if self._full():
+                self._parked.append(transfer)
+            else:
+                self._submit(transfer)
+
     def cmdReadStream_getStatus(self) -> Tuple[int, int, int]:
         """
         Gets the status of the streaming mode capture, tells you samples left to stream out along
@@ -1079,7 +2266,8 @@ class NAEUSB:
 
     def cmdReadStream_size_of_fpgablock(self) -> int:
         """ Asks the hardware how many BYTES are read in one go from FPGA, which indicates where the sync
-            bytes will be located. These sync bytes must be removed in post-processing. CW-pro only. """
+            bytes will be located. These sync bytes must be removed in post-processing, for example with
+            stream_decode.decode_pro_stream(). CW-pro only. """
         return 4096
 
     def cmdReadStream_bufferSize(self, dlen : int):
@@ -1098,10 +2286,21 @@ class NAEUSB:
 
 
     def initStreamModeCapture(self, dlen : int, dbuf_temp : bytearray, timeout_ms : int=1000,
-        is_husky : bool=False, segment_size : int=0):
+        is_husky : bool=False, segment_size : int=0, direct : bool=True, queue_depth : Optional[int]=None):
+        """Start a streaming capture into dbuf_temp.
+
+        For Husky, if dbuf_temp is a writable buffer of at least dlen bytes (for
+        example a numpy uint8 array), each USB transfer receives straight into
+        its part of dbuf_temp unless direct is False. dbuf_temp must not be
+        resized until cmdReadStream() returns. At most queue_depth
+        (stream_queue_depth by default) transfers of segment_size bytes are
+        in flight at once.
+
+        The capture runs on the device's stream worker thread, which is kept
+        along with its transfers and their buffers for the next capture.
+        """
         #Enter streaming mode for requested number of samples
-        if self.streamModeCaptureStream:
-            self.streamModeCaptureStream.join()
+        self._stream_finish()
         if is_husky:
             data=list(int.to_bytes(segment_size, length=4, byteorder='little')) + \
                 list(int.to_bytes(3, length=4, byteorder='little')) + list(int.to_bytes(dlen, length=4, byteorder="little"))
@@ -1109,12 +2308,16 @@ class NAEUSB:
             data = packuint32(dlen)
         self.sendCtrl(NAEUSB.CMD_MEMSTREAM, data=bytearray(data))
         if is_husky:
-            self.streamModeCaptureStream = NAEUSB.StreamModeCaptureThreadHusky(self, dlen, segment_size, dbuf_temp, timeout_ms, is_husky)
+            self.streamModeCaptureStream = NAEUSB.StreamModeCaptureThreadHusky(self, dlen, segment_size, dbuf_temp, timeout_ms, is_husky, direct,
+                                                                               queue_depth)
         else:
             self.streamModeCaptureStream = NAEUSB.StreamModeCaptureThreadPro(self, dlen, dbuf_temp, timeout_ms)
         self.streamModeCaptureStream.start()
 
     def cmdReadStream_isDone(self, is_husky : bool=False) -> bool:
+        if self.streamModeCaptureStream.exception is not None:
+            # failed; cmdReadStream() raises the error
+            return True
         if is_husky:
             return self.streamModeCaptureStream.drx >= self.streamModeCaptureStream.dlen
         else:
@@ -1125,23 +2328,86 @@ class NAEUSB:
         """
         Gets data acquired in streaming mode.
         initStreamModeCapture should be called first in order to make it work.
+
+        Raises:
+            Exception: Whatever the capture failed with, once the stream is cleaned up.
         """
         self.streamModeCaptureStream.join()
         # Flush input buffers in case anything was left
-        try:
-            #self.cmdReadMem(self.rep)
-            self.usbtx.read(4096, timeout=10)
-            self.usbtx.read(4096, timeout=10)
-            self.usbtx.read(4096, timeout=10)
-            self.usbtx.read(4096, timeout=10)
-        except:
-            pass
+        self.stream_drained_bytes = self.usbtx.drain()
 
         # Ensure stream mode disabled
         if not is_husky:
             self.sendCtrl(NAEUSB.CMD_MEMSTREAM, data=packuint32(0))
+        if self.streamModeCaptureStream.exception is not None:
+            raise self.streamModeCaptureStream.exception
         return self.streamModeCaptureStream.drx, self.streamModeCaptureStream.timeout
 
+    def stream_to_file(self, path : str, dlen : int, timeout_ms : int=1000, is_husky : bool=False,
+        segment_size : int=0, fsync : bool=False) -> Tuple[int, int]:
+        """Stream a capture straight into a memory mapped file instead of memory.
+
+        The file is preallocated to hold the whole capture (see StreamFileSink) and
+        a sidecar path + ".json" records the bytes received and the stream status.
+        Arguments are as initStreamModeCapture(); fsync waits for the data to reach
+        the disk before returning.
+
+        Returns:
+            (bytes received, timeout) as cmdReadStream()
+
+        Raises:
+            Exception: As cmdReadStream(), if the capture failed. No sidecar is written.
+        """
+        from .stream_sink import StreamFileSink
+        with StreamFileSink.for_capture(path, self, dlen, is_husky, fsync) as sink:
+            self.initStreamModeCapture(dlen, sink.buffer, timeout_ms, is_husky, segment_size)
+            self.streamModeCaptureStream.join()
+            status = self.cmdReadStream_getStatus()
+            drx, timeout = self.cmdReadStream(is_husky)
+            sink.finish(drx, status, dlen=dlen, is_husky=is_husky, timeout=timeout)
+        return drx, timeout
+
+    def stream_chunks(self, dlen : Optional[int], chunk_size : int=1 << 16, max_queued : int=64,
+        timeout_ms : int=1000, is_husky : bool=True, queue_depth : Optional[int]=None) -> "NAEUSB.StreamChunks":
+        """Start a streaming capture and iterate over its data as it arrives.
+
+        Unlike initStreamModeCapture()/cmdReadStream(), the capture doesn't have to fit
+        in memory: each chunk can be processed while the rest is still streaming::
+
+            with naeusb.stream_chunks(dlen, chunk_size=1 << 20) as chunks:
+                for data in chunks:
+                    process(np.frombuffer(data, dtype=np.uint8))
+            if chunks.overflow:
+                print("Capture overflowed")
+
+        Args:
+            dlen: For Husky, number of bytes to stream, or None to stream until the capture
+                stops, overflows or the iterator is closed. For CW-Pro, number of samples;
+                the data has the same block sync bytes as cmdReadStream().
+            chunk_size: Bytes per chunk (Husky segment size).
+            max_queued: Chunks allowed to wait for the consumer before reading is paused.
+            timeout_ms: The stream is considered finished after this long with no data.
+            is_husky: False for CW-Pro, True for CW-Husky
+            queue_depth: Husky transfers kept in flight, defaults to stream_queue_depth
+
+        Returns:
+            A StreamChunks iterator, also usable as a context manager to stop the stream early.
+        """
+        self._stream_finish()
+        if is_husky:
+            length = 0xFFFFFFFF if dlen is None else dlen
+            data=list(int.to_bytes(chunk_size, length=4, byteorder='little')) + \
+                list(int.to_bytes(3, length=4, byteorder='little')) + list(int.to_bytes(length, length=4, byteorder="little"))
+        else:
+            if dlen is None:
+                raise ValueError("CW-Pro streaming needs a length")
+            data = packuint32(dlen)
+        self.sendCtrl(NAEUSB.CMD_MEMSTREAM, data=bytearray(data))
+        self.streamModeCaptureStream = NAEUSB.StreamChunks(self, dlen, chunk_size, max_queued, timeout_ms,
+                                                           is_husky, queue_depth)
+        self.streamModeCaptureStream.start()
+        return self.streamModeCaptureStream
+
     # def readCDCSettings(self):
     #     try:
     #         data = self.readCtrl(self.CMD_FW_VERSION, dlen=3)
@@ -1164,24 +2430,34 @@ class NAEUSB:
     def read(self, dlen : int, timeout : int=2000) -> bytearray:
         return self.usbserializer.read(dlen, timeout)
 
+    @property
+    def features(self) -> FeatureSet:
+        """FeatureSet of the connected device, worked out when it was connected"""
+        if self._features is None:
+            self._features = FeatureSet(self.usbtx.device.getProductID(), self.readFwVersion())
+        return self._features
+
     def check_feature(self, feature, raise_exception=False) -> bool:
-        prod_id = self.usbtx.device.getProductID()
-        fw_ver_list = self.readFwVersion()
-        fw_ver_str = '{}.{}.{}'.format(fw_ver_list[0], fw_ver_list[1], fw_ver_list[2])
-        ret = _check_sam_feature(feature, fw_ver_str, prod_id)
+        features = self.features
+        if not features.known:
+            naeusb_logger.warning("Features for ProdID {:04X} not stored, skipping...".format(features.prod_id))
+            return False
+        if feature not in SAM_FW_FEATURES:
+            naeusb_logger.warning("Unknown feature {}".format(feature))
+            return False
+        ret = features[feature]
         if not ret:
             naeusb_logger.info("Feature {} not available".format(feature))
             if raise_exception:
-                raise CWFirmwareError("Feature {} not available. FW {} required (have {})".format(feature, SAM_FW_FEATURE_BY_DEVICE[prod_id][feature], fw_ver_str))
+                have = ".".join(str(x) for x in features.fw_version)
+                if features.required(feature) is None:
+                    raise CWFirmwareError("Feature {} not available on this device (FW {})".format(feature, have))
+                raise CWFirmwareError("Feature {} not available. FW {} required (have {})".format(feature,
+                    features.required(feature), have))
         return ret
 
     def feature_list(self):
-        feature_list = []
-        for feature in SAM_FW_FEATURES:
-            if self.check_feature(feature):
-                feature_list.append(feature)
-
-        return feature_list
+        return list(self.features)
 
 
 if __name__ == '__main__':
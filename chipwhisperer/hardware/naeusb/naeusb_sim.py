@@ -0,0 +1,732 @@
+#
+# Copyright (c) 2024, NewAE Technology Inc
+# All rights reserved.
+#
+#    This file is part of chipwhisperer.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+# ==========================================================================
+"""In-process simulation of a NAEUSB device.
+
+:class:`NAEUSB_SimBackend` is a drop-in replacement for :class:`NAEUSB_Backend` that
+talks to an emulated SAM3U instead of libusb. It implements enough of the vendor
+requests (firmware version, external memory reads/writes, USART, FPGA programming,
+streaming and the CDCE906 PLL) for everything above the backend to run unchanged::
+
+    from chipwhisperer.hardware.naeusb.naeusb import NAEUSB
+    from chipwhisperer.hardware.naeusb.naeusb_sim import NAEUSB_SimBackend
+
+    usb = NAEUSB(backend=NAEUSB_SimBackend(pid=0xC305))
+    usb.con(idProduct=[0xC305])
+
+    target = cw.target(None, cw.targets.CW305, slurp=False,
+                       backend=NAEUSB_SimBackend(pid=0xC305))
+
+Every transfer is charged against a simple link model (fixed per-transfer latency plus
+payload size over bandwidth). By default the modelled time is only accounted in
+:attr:`SimLinkModel.stats`, so wall-clock time measures host-side overhead only. Set
+``realtime=True`` to also sleep for the modelled time.
+"""
+import hashlib
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, List, Optional, Tuple
+
+import usb1  # type: ignore
+
+from .naeusb import NAEUSB_Backend, NEWAE_VID, NEWAE_PIDS, SAM_FW_FEATURE_BY_DEVICE, \
+    NAEUSB_CTRL_IO_MAX, LEN_ADDR_HDR_SIZE, unpackuint32, packuint32
+from ...logging import *
+
+SIM_PRODUCT_NAMES = {
+    0xACE0: "ChipWhisperer Nano",
+    0xACE2: "ChipWhisperer Lite",
+    0xACE3: "ChipWhisperer CW1200",
+    0xACE5: "ChipWhisperer Husky",
+    0xACE6: "ChipWhisperer Husky Plus",
+    0xC305: "ChipWhisperer CW305",
+    0xC310: "ChipWhisperer CW310",
+    0xC340: "ChipWhisperer CW340",
+}
+
+def _version_tuple(ver) -> Tuple[int, ...]:
+    return tuple(int(x) for x in str(ver).split('.'))
+
+def default_fw_version(pid : int) -> Tuple[int, int, int]:
+    """Newest firmware version known for pid, so that every feature is available."""
+    versions = [_version_tuple(v) for v in SAM_FW_FEATURE_BY_DEVICE.get(pid, {}).values()]
+    latest = NEWAE_PIDS.get(pid, {}).get('fwver')
+    if latest:
+        try:
+            versions.append(_version_tuple(latest))
+        except ValueError:
+            pass
+    if not versions:
+        return (1, 0, 0)
+    ver = max(versions) + (0, 0, 0)
+    return (ver[0], ver[1], ver[2])
+
+class SimLinkModel:
+    """Latency/bandwidth model of the USB link.
+
+    Each transfer costs ``latency + len(payload) / bandwidth`` seconds, except that
+    control transfers queued behind another one don't pay the latency again. The time is
+    accumulated in :attr:`stats` and, if realtime is set, actually waited for.
+
+    Args:
+        latency (float): Fixed cost of a transfer in seconds (round trip).
+        bandwidth (float, optional): Payload bandwidth in bytes/s. None for infinite.
+        realtime (bool): If True, sleep for the modelled time of each transfer.
+    """
+    def __init__(self, latency : float=0.0, bandwidth : Optional[float]=None, realtime : bool=False):
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.realtime = realtime
+        self.reset_stats()
+
+    def reset_stats(self):
+        """Zero all transfer counters."""
+        self.stats = {
+            'ctrl_out': 0, 'ctrl_out_bytes': 0,
+            'ctrl_in': 0, 'ctrl_in_bytes': 0,
+            'bulk_out': 0, 'bulk_out_bytes': 0,
+            'bulk_in': 0, 'bulk_in_bytes': 0,
+            'usb_time': 0.0,
+        }
+
+    def transfer_time(self, nbytes : int, queued : bool=False) -> float:
+        t = 0.0 if queued else self.latency
+        if self.bandwidth:
+            t += nbytes / self.bandwidth
+        return t
+
+    def account(self, kind : str, nbytes : int, extra_time : float=0.0, queued : bool=False):
+        """Charge one transfer of nbytes to counter kind ('ctrl_out', 'bulk_in', ...).
+        queued transfers were already waiting when the one before finished.
+        """
+        t = self.transfer_time(nbytes, queued) + extra_time
+        stats = self.stats
+        stats[kind] += 1
+        stats[kind + '_bytes'] += nbytes
+        stats['usb_time'] += t
+        if self.realtime and t > 0:
+            time.sleep(t)
+
+class _SimMemory:
+    """Sparse byte-addressed memory, used as the FPGA register file."""
+    PAGE_SIZE = 4096
+
+    def __init__(self):
+        self._pages : Dict[int, bytearray] = {}
+
+    def clear(self):
+        self._pages.clear()
+
+    def read(self, addr : int, dlen : int) -> bytearray:
+        out = bytearray(dlen)
+        pos = 0
+        while pos < dlen:
+            page, offset = divmod(addr + pos, self.PAGE_SIZE)
+            n = min(self.PAGE_SIZE - offset, dlen - pos)
+            data = self._pages.get(page)
+            if data is not None:
+                out[pos:pos+n] = data[offset:offset+n]
+            pos += n
+        return out
+
+    def write(self, addr : int, data):
+        data = memoryview(data).cast('B')
+        dlen = len(data)
+        pos = 0
+        while pos < dlen:
+            page, offset = divmod(addr + pos, self.PAGE_SIZE)
+            n = min(self.PAGE_SIZE - offset, dlen - pos)
+            buf = self._pages.get(page)
+            if buf is None:
+                buf = self._pages[page] = bytearray(self.PAGE_SIZE)
+            buf[offset:offset+n] = data[pos:pos+n]
+            pos += n
+
+def _default_stream_source(offset : int, dlen : int) -> bytes:
+    """Deterministic stream data: a byte counter that wraps at 256."""
+    start = offset & 0xFF
+    reps = (start + dlen) // 256 + 1
+    return (bytes(range(256)) * reps)[start:start+dlen]
+
+class SimNAEUSBDevice:
+    """Emulated NewAE USB device, standing in for both usb1.USBDevice and the SAM3U firmware.
+
+    Args:
+        pid (int): USB product ID to report.
+        serial_number (str): Serial number to report.
+        fw_version (tuple, optional): (major, minor, debug) firmware version. Defaults to the
+            newest version known for pid, so all features are enabled.
+        latency, bandwidth, realtime: Link model parameters, see :class:`SimLinkModel`.
+        usart_handler (callable, optional): Called as usart_handler(usart_num, data) for
+            every write to a USART. Whatever bytes it returns are queued on that USART's
+            receive FIFO. Defaults to a loopback.
+        stream_source (callable, optional): Called as stream_source(offset, dlen) to produce
+            streaming data. Defaults to a wrapping byte counter.
+        usart_rx_size (int): Size of each USART receive FIFO, excess data is dropped.
+        bus, address (int): Reported USB bus number and device address.
+    """
+    USART_RX_SIZE = 200
+
+    def __init__(self, pid : int=0xACE2, serial_number : str="SIM0000000000000000000000000000",
+                 fw_version : Optional[Tuple[int, int, int]]=None, latency : float=0.0,
+                 bandwidth : Optional[float]=None, realtime : bool=False,
+                 usart_handler : Optional[Callable[[int, bytes], Optional[bytes]]]=None,
+                 stream_source : Optional[Callable[[int, int], bytes]]=None,
+                 usart_rx_size : int=USART_RX_SIZE, bus : int=1, address : int=1):
+        self.pid = pid
+        self.serial_number = serial_number
+        self.product = SIM_PRODUCT_NAMES.get(pid, "NewAE Simulated Device")
+        self.bus = bus
+        self.address = address
+        if fw_version is None:
+            fw_version = default_fw_version(pid)
+        self.fw_version = tuple(fw_version)
+        self.link = SimLinkModel(latency, bandwidth, realtime)
+        self.usart_handler = usart_handler
+        self.stream_source = stream_source or _default_stream_source
+        self.usart_rx_size = usart_rx_size
+        self.build_date = "Simulated NAEUSB"
+        self._ctx = None
+
+        self.lock = threading.RLock()
+        self.mem = _SimMemory()
+        self.usart_rx : Dict[int, bytearray] = {}
+        self.usart_overflow = 0
+        self.usart_config : Dict[int, bytes] = {}
+        self.pll_regs = bytearray(27)
+        self._pll_read_val = 0
+        self.vccint = 1000
+
+        self.fpga_programmed = False
+        self.fpga_programming = False
+        self.fpga_prog_mode = 0
+        self.fpga_prog_bytes = 0
+        self._fpga_hash = None
+        self.fpga_bitstream_sha256 = None
+
+        self._bulk_in = bytearray()
+        self._bulk_out_pending : Optional[Tuple[int, int]] = None
+        self._stream_left = 0
+        self._stream_offset = 0
+        self._stream_segment = 0
+
+        # anything else is a mailbox: reads return the last data written for that request/value
+        self._mailbox : Dict[Tuple[int, int], bytes] = {}
+
+    def __repr__(self):
+        return "<SimNAEUSBDevice {:04X}:{:04X} {}>".format(NEWAE_VID, self.pid, self.serial_number)
+
+    # usb1.USBDevice interface
+    def getVendorID(self):
+        return NEWAE_VID
+
+    def getProductID(self):
+        return self.pid
+
+    def getSerialNumber(self):
+        return self.serial_number
+
+    def getProduct(self):
+        return self.product
+
+    def getManufacturer(self):
+        return "NewAE Technology Inc."
+
+    def getBusNumber(self):
+        return self.bus
+
+    def getDeviceAddress(self):
+        return self.address
+
+    def getPortNumber(self):
+        return self.address
+
+    def open(self):
+        return SimUSBDeviceHandle(self, self._ctx)
+
+    # firmware emulation
+    def ctrl_write(self, cmd : int, value : int, data):
+        """Handle a vendor OUT request."""
+        data = bytes(data)
+        if len(data) > NAEUSB_CTRL_IO_MAX:
+            raise usb1.USBErrorPipe()
+        with self.lock:
+            if cmd in (NAEUSB_Backend.CMD_READMEM_CTRL, NAEUSB_Backend.CMD_READMEM_BULK,
+                       NAEUSB_Backend.CMD_WRITEMEM_BULK):
+                dlen = unpackuint32(data[0:4])
+                addr = unpackuint32(data[4:8])
+                if cmd == NAEUSB_Backend.CMD_READMEM_CTRL:
+                    self._mailbox[(cmd, 0)] = bytes(self.mem.read(addr, dlen))
+                elif cmd == NAEUSB_Backend.CMD_READMEM_BULK:
+                    self._bulk_in += self.mem.read(addr, dlen)
+                else:
+                    self._bulk_out_pending = (addr, dlen)
+            elif cmd == NAEUSB_Backend.CMD_WRITEMEM_CTRL:
+                dlen = unpackuint32(data[0:4])
+                addr = unpackuint32(data[4:8])
+                self.mem.write(addr, data[LEN_ADDR_HDR_SIZE:LEN_ADDR_HDR_SIZE+dlen])
+            elif cmd == NAEUSB_Backend.CMD_MEMSTREAM:
+                self._stream_start(data)
+            elif cmd == 0x16: # FPGA program
+                self._fpga_program(value)
+            elif cmd == 0x1A: # USART data
+                self._usart_write(value >> 8, data)
+            elif cmd == 0x1B: # USART config
+                if (value & 0xFF) == 0x10:
+                    self.usart_config[value >> 8] = data
+                else:
+                    self._mailbox[(cmd, value)] = data
+            elif cmd == 0x30: # CDCE906
+                if data[0] == 0x01:
+                    self.pll_regs[data[1] % len(self.pll_regs)] = data[2]
+                else:
+                    self._pll_read_val = self.pll_regs[data[1] % len(self.pll_regs)]
+            elif cmd == 0x31 and self.pid == 0xC305: # VCC-INT
+                self.vccint = data[0] | (data[1] << 8)
+            else:
+                self._mailbox[(cmd, value)] = data
+
+    def ctrl_read(self, cmd : int, value : int, dlen : int) -> bytearray:
+        """Handle a vendor IN request."""
+        if dlen > NAEUSB_CTRL_IO_MAX:
+            raise usb1.USBErrorPipe()
+        with self.lock:
+            if cmd == 0x17: # FW version
+                resp = bytes(self.fw_version)
+            elif cmd == 0x40: # build date
+                resp = self.build_date.encode()
+            elif cmd == NAEUSB_Backend.CMD_READMEM_CTRL:
+                resp = self._mailbox.pop((cmd, 0), b'')
+            elif cmd == NAEUSB_Backend.CMD_MEMSTREAM:
+                resp = bytes([0]) + bytes(packuint32(self._stream_left)) + bytes(4)
+            elif cmd == 0x15: # FPGA status
+                resp = bytes([int(self.fpga_programmed), 1, 0, 0])
+            elif cmd == 0x1A: # USART data
+                fifo = self.usart_rx.setdefault(value >> 8, bytearray())
+                resp = bytes(fifo[:dlen])
+                del fifo[:dlen]
+            elif cmd == 0x1B and (value & 0xFF) == 0x14: # USART NUMWAIT
+                resp = bytes(packuint32(len(self.usart_rx.get(value >> 8, b''))))
+            elif cmd == 0x1B and (value & 0xFF) == 0x18: # USART NUMWAIT_TX
+                resp = bytes(4)
+            elif cmd == 0x30: # CDCE906
+                resp = bytes([2, self._pll_read_val])
+            elif cmd == 0x31 and self.pid == 0xC305: # VCC-INT
+                resp = bytes([2, self.vccint & 0xFF, self.vccint >> 8])
+            else:
+                resp = self._mailbox.get((cmd, value), b'')
+                resp = resp + bytes(max(0, dlen - len(resp)))
+            return bytearray(resp[:dlen])
+
+    def bulk_write(self, data):
+        """Handle data sent to the bulk OUT endpoint."""
+        with self.lock:
+            if self.fpga_programming:
+                self.fpga_prog_bytes += len(data)
+                self._fpga_hash.update(data)
+                self.fpga_programmed = True
+            elif self._bulk_out_pending:
+                addr, dlen = self._bulk_out_pending
+                self.mem.write(addr, memoryview(data)[:dlen])
+                self._bulk_out_pending = None
+
+    def bulk_read(self, dlen : int) -> bytes:
+        """Take up to dlen bytes waiting on the bulk IN endpoint."""
+        with self.lock:
+            if self._bulk_in:
+                resp = bytes(self._bulk_in[:dlen])
+                del self._bulk_in[:dlen]
+                return resp
+            if self._stream_left:
+                n = min(dlen, self._stream_left)
+                resp = self.stream_source(self._stream_offset, n)
+                self._stream_offset += n
+                self._stream_left -= n
+                return resp
+            return b''
+
+    def bulk_in_waiting(self) -> bool:
+        return bool(self._bulk_in) or bool(self._stream_left)
+
+    def _stream_start(self, data):
+        if len(data) >= 12:
+            # Husky: segment size, mode, length in bytes
+            self._stream_segment = unpackuint32(data[0:4])
+            self._stream_left = unpackuint32(data[8:12])
+        else:
+            # Pro: length in samples, 0 to stop. Sent as 3 samples per 4 bytes plus a
+            # sync byte per 4096 byte block, rounded up to whole blocks
+            dlen = unpackuint32(data[0:4])
+            nbytes = -(-dlen * 4 // 3)
+            nbytes += -(-nbytes // 4096)
+            self._stream_left = -(-nbytes // 4096) * 4096
+        self._stream_offset = 0
+
+    def _fpga_program(self, value):
+        op = value & 0x0F
+        if op == 0x00:
+            self.fpga_programmed = False
+            self.fpga_programming = False
+            self.fpga_prog_mode = value >> 8
+        elif op == 0x01:
+            self.fpga_programming = True
+            self.fpga_prog_bytes = 0
+            self._fpga_hash = hashlib.sha256()
+        elif op == 0x02:
+            if self.fpga_programming:
+                self.fpga_bitstream_sha256 = self._fpga_hash.hexdigest()
+            self.fpga_programming = False
+
+    def _usart_write(self, num, data):
+        if self.usart_handler is None:
+            resp = data
+        else:
+            resp = self.usart_handler(num, data)
+        if resp:
+            fifo = self.usart_rx.setdefault(num, bytearray())
+            space = max(0, self.usart_rx_size - len(fifo))
+            if len(resp) > space:
+                self.usart_overflow += len(resp) - space
+                naeusb_logger.warning("Simulated USART{} RX overflow, dropped {} bytes".format(num, len(resp) - space))
+            fifo += resp[:space]
+
+class SimUSBTransfer:
+    """Stand-in for usb1.USBTransfer, completed by SimUSBContext.handleEvents()."""
+    def __init__(self, handle):
+        self._handle = handle
+        self._endpoint = None
+        self._control = None
+        self._buffer = None
+        self._callback = None
+        self._user_data = None
+        self._timeout = 0
+        self._status = usb1.TRANSFER_COMPLETED
+        self._actual_length = 0
+        self._submitted = False
+        self._submit_time = 0.0
+        self._cancel = False
+
+    def setBulk(self, endpoint, buffer_or_len, callback=None, user_data=None, timeout=0):
+        if self._submitted:
+            raise ValueError('Cannot alter a submitted transfer')
+        self._endpoint = endpoint
+        self._control = None
+        self.setBuffer(buffer_or_len)
+        self._callback = callback
+        self._user_data = user_data
+        self._timeout = timeout
+
+    def setControl(self, request_type, request, value, index, buffer_or_len, callback=None, user_data=None,
+                   timeout=0):
+        if self._submitted:
+            raise ValueError('Cannot alter a submitted transfer')
+        # like usb1, the data is copied in (and the buffer is the data without the setup packet)
+        self._endpoint = request_type & usb1.ENDPOINT_IN
+        self._control = (request_type, request, value, index)
+        self._buffer = bytearray(buffer_or_len)
+        self._callback = callback
+        self._user_data = user_data
+        self._timeout = timeout
+
+    def setBuffer(self, buffer_or_len):
+        if self._submitted:
+            raise ValueError('Cannot alter a submitted transfer')
+        if isinstance(buffer_or_len, int):
+            buffer_or_len = bytearray(buffer_or_len)
+        self._buffer = buffer_or_len
+
+    def setCallback(self, callback):
+        self._callback = callback
+
+    def getBuffer(self):
+        return self._buffer
+
+    def getUserData(self):
+        return self._user_data
+
+    def setUserData(self, user_data):
+        self._user_data = user_data
+
+    def getStatus(self):
+        return self._status
+
+    def getActualLength(self):
+        return self._actual_length
+
+    def isSubmitted(self):
+        return self._submitted
+
+    def submit(self):
+        if self._submitted:
+            raise ValueError('Cannot submit a submitted transfer')
+        self._submitted = True
+        self._cancel = False
+        self._actual_length = 0
+        if self._control is None:
+            # control transfers always complete on the next pass, so never time out
+            self._submit_time = time.perf_counter()
+        self._handle._ctx._submit(self)
+
+    def cancel(self):
+        if not self._submitted:
+            raise usb1.USBErrorNotFound()
+        self._cancel = True
+
+    def close(self):
+        if self._submitted:
+            raise ValueError('Cannot close a submitted transfer')
+        self._callback = None
+        self._user_data = None
+        self._buffer = None
+
+    def _complete(self, status):
+        self._status = status
+        self._submitted = False
+        if self._callback:
+            self._callback(self)
+
+    def _process(self, now, allow_data=True, queued=False) -> bool:
+        """Try to complete the transfer. Returns True if it completed."""
+        dev = self._handle._dev
+        if self._cancel:
+            self._complete(usb1.TRANSFER_CANCELLED)
+            return True
+        if self._control is not None:
+            _, request, value, _ = self._control
+            buf = self._buffer
+            try:
+                if self._endpoint & usb1.ENDPOINT_IN:
+                    data = dev.ctrl_read(request, value, len(buf))
+                    n = len(data)
+                    buf[:n] = data
+                    self._actual_length = n
+                    dev.link.account('ctrl_in', n, 0.0, queued)
+                else:
+                    dev.ctrl_write(request, value, buf)
+                    n = self._actual_length = len(buf)
+                    dev.link.account('ctrl_out', n, 0.0, queued)
+            except usb1.USBErrorPipe:
+                self._complete(usb1.TRANSFER_STALL)
+                return True
+            self._complete(usb1.TRANSFER_COMPLETED)
+            return True
+        if not allow_data:
+            pass
+        elif self._endpoint & usb1.ENDPOINT_IN:
+            dlen = len(self._buffer)
+            if dev.bulk_in_waiting():
+                data = dev.bulk_read(dlen)
+                n = len(data)
+                memoryview(self._buffer).cast('B')[:n] = data
+                self._actual_length = n
+                dev.link.account('bulk_in', n)
+                self._complete(usb1.TRANSFER_COMPLETED)
+                return True
+        else:
+            data = memoryview(self._buffer).cast('B')
+            dev.bulk_write(data)
+            self._actual_length = len(data)
+            dev.link.account('bulk_out', len(data))
+            self._complete(usb1.TRANSFER_COMPLETED)
+            return True
+        if self._timeout and self._endpoint & usb1.ENDPOINT_IN and allow_data and not dev.link.realtime:
+            # nothing to send, so like bulkRead() charge the timeout to the model
+            # instead of waiting it out
+            dev.link.account('bulk_in', 0, self._timeout / 1000)
+            self._complete(usb1.TRANSFER_TIMED_OUT)
+            return True
+        if self._timeout and (now - self._submit_time) * 1000 >= self._timeout:
+            self._complete(usb1.TRANSFER_TIMED_OUT)
+            return True
+        return False
+
+class SimUSBDeviceHandle:
+    """Stand-in for usb1.USBDeviceHandle, forwarding requests to a SimNAEUSBDevice."""
+    def __init__(self, dev : SimNAEUSBDevice, ctx=None):
+        self._dev = dev
+        self._ctx = ctx
+
+    def getSerialNumber(self):
+        return self._dev.serial_number
+
+    def getProduct(self):
+        return self._dev.product
+
+    def claimInterface(self, interface):
+        pass
+
+    def releaseInterface(self, interface):
+        pass
+
+    def close(self):
+        pass
+
+    def getTransfer(self, iso_packets=0, short_is_error=False, add_zero_packet=False):
+        return SimUSBTransfer(self)
+
+    def controlWrite(self, request_type, request, value, index, data, timeout=0):
+        self._dev.ctrl_write(request, value, data)
+        self._dev.link.account('ctrl_out', len(data))
+        return len(data)
+
+    def controlRead(self, request_type, request, value, index, length, timeout=0):
+        data = self._dev.ctrl_read(request, value, length)
+        self._dev.link.account('ctrl_in', len(data))
+        return data
+
+    def bulkWrite(self, endpoint, data, timeout=0):
+        self._dev.bulk_write(data)
+        self._dev.link.account('bulk_out', len(data))
+        return len(data)
+
+    def bulkRead(self, endpoint, length, timeout=0):
+        data = self._dev.bulk_read(length)
+        if not data and length:
+            # nothing to send, real hardware would wait for the whole timeout
+            self._dev.link.account('bulk_in', 0, (timeout or 0) / 1000)
+            err = usb1.USBErrorTimeout()
+            err.received = bytearray()
+            raise err
+        self._dev.link.account('bulk_in', len(data))
+        return bytearray(data)
+
+    # the unbuffered calls under controlRead()/bulkRead(), which read into a ctypes
+    # buffer of the caller's
+    def _controlTransfer(self, request_type, request, value, index, data, length, timeout):
+        view = memoryview(data).cast('B')
+        if request_type & usb1.ENDPOINT_IN:
+            resp = self._dev.ctrl_read(request, value, length)
+            n = len(resp)
+            view[:n] = resp
+            self._dev.link.account('ctrl_in', n)
+            return n
+        self._dev.ctrl_write(request, value, bytearray(view[:length]))
+        self._dev.link.account('ctrl_out', length)
+        return length
+
+    def _bulkTransfer(self, endpoint, data, length, timeout):
+        view = memoryview(data).cast('B')
+        if not endpoint & usb1.ENDPOINT_IN:
+            self._dev.bulk_write(view[:length])
+            self._dev.link.account('bulk_out', length)
+            return length
+        resp = self._dev.bulk_read(length)
+        if not resp and length:
+            self._dev.link.account('bulk_in', 0, (timeout or 0) / 1000)
+            err = usb1.USBErrorTimeout()
+            err.transferred = 0
+            raise err
+        n = len(resp)
+        view[:n] = resp
+        self._dev.link.account('bulk_in', n)
+        return n
+
+class SimUSBContext:
+    """Stand-in for usb1.USBContext holding a fixed set of simulated devices."""
+    def __init__(self, devices : List[SimNAEUSBDevice]):
+        self.devices = devices
+        self._pending : deque = deque()
+        self._lock = threading.Lock()
+        for dev in devices:
+            dev._ctx = self
+
+    def open(self):
+        return self
+
+    def close(self):
+        pass
+
+    def getDeviceIterator(self, skip_on_error=False):
+        return iter(self.devices)
+
+    def getDeviceList(self, skip_on_error=False):
+        return list(self.devices)
+
+    def _submit(self, transfer : SimUSBTransfer):
+        with self._lock:
+            self._pending.append(transfer)
+
+    def handleEventsTimeout(self, tv=0):
+        """Complete whatever pending transfers can be completed, in submission order.
+
+        Bulk IN transfers complete in order, so once one of them is left waiting for data
+        the ones behind it can only be cancelled or time out. Sleeps for up to tv seconds
+        if nothing happened. Control transfers run back to back, so only the first of a
+        pass is charged the link latency.
+        """
+        now = time.perf_counter()
+        progress = False
+        in_blocked = False
+        ctrl_done = False
+        with self._lock:
+            pending = list(self._pending)
+        done = set()
+        endpoint_in = usb1.ENDPOINT_IN
+        for transfer in pending:
+            is_in = transfer._endpoint & endpoint_in
+            is_ctrl = transfer._control is not None
+            if not transfer._process(now, not (is_in and in_blocked), is_ctrl and ctrl_done):
+                if is_in:
+                    in_blocked = True
+                continue
+            ctrl_done = ctrl_done or is_ctrl
+            done.add(transfer)
+        if done:
+            with self._lock:
+                # drop the first entry of each: a callback may have resubmitted it since
+                remaining = deque()
+                for transfer in self._pending:
+                    if transfer in done:
+                        done.discard(transfer)
+                    else:
+                        remaining.append(transfer)
+                self._pending = remaining
+        elif tv:
+            time.sleep(tv)
+
+    def handleEvents(self):
+        self.handleEventsTimeout(0.001)
+
+class NAEUSB_SimBackend(NAEUSB_Backend):
+    """Simulated replacement for :class:`NAEUSB_Backend`.
+
+    All of the backend's logic (device discovery, ctrl/bulk dispatch, headers) runs
+    unchanged; only the libusb context, device and handle are replaced by simulated ones.
+
+    Args:
+        devices (list, optional): SimNAEUSBDevice objects to expose. If not given, a single
+            device is created from the remaining keyword arguments.
+        **kwargs: Passed to :class:`SimNAEUSBDevice`, e.g. pid, serial_number, latency,
+            bandwidth, realtime, usart_handler.
+    """
+    def __init__(self, devices : Optional[List[SimNAEUSBDevice]]=None, **kwargs):
+        if devices is None:
+            devices = [SimNAEUSBDevice(**kwargs)]
+        self._sim_devices = devices
+        super().__init__()
+
+    def _open_context(self):
+        return SimUSBContext(self._sim_devices)
+
+    @property
+    def sim(self) -> SimNAEUSBDevice:
+        """The simulated device currently opened (or the first one if none is)."""
+        if self.device is not None:
+            return self.device
+        return self.usb_ctx.devices[0]
@@ -24,10 +24,239 @@
 
 import math
 import time
+import os
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterable, Optional, Union
+
+from ...common.utils import util
+from ...logging import *
+
+try:
+    import numpy as np
+except:
+    np = None # type: ignore
+
+# CDCE906 divider ranges and VCO limits
+_PLL_N_MAX = 4095
+_PLL_M_MAX = 511
+_PLL_OUTDIV_MAX = 127
+_PLL_FVCO_MIN = 80E6
+_PLL_FVCO_MAX = 300E6
+
+CDCE906_NUM_REGS = 27
+# byte 24 holds the EEPROM busy flag, which the chip changes by itself
+_CDCE906_VOLATILE_REGS = frozenset([24])
+
+def _best_mul_div_np(freqdesired, freqsource, outdivs):
+    """calcMulDiv search over every outdiv and M at once with numpy"""
+    outdiv = np.array(outdivs, dtype=np.int64)[:, None]
+    M = np.arange(1, _PLL_M_MAX + 1, dtype=np.int64)[None, :]
+    fvco = freqdesired * outdiv
+    n_ideal = fvco * M / freqsource
+
+    # [floor, ceil] x outdiv x M
+    N = np.clip(np.stack((np.floor(n_ideal), np.ceil(n_ideal))), 1, _PLL_N_MAX).astype(np.int64)
+    actual = (freqsource * N) / M
+    err = np.abs(fvco - actual) / outdiv
+    err[(actual < _PLL_FVCO_MIN) | (actual > _PLL_FVCO_MAX)] = np.inf
+
+    lowerror = err.min()
+    if not np.isfinite(lowerror):
+        return (0, 0, 0)
+    _, d, m = np.nonzero(err == lowerror)
+    n = N[err == lowerror]
+    # ties go to the lowest outdiv, then N, then M
+    i = np.lexsort((m, n, d))[0]
+    return (int(n[i]), int(m[i]) + 1, int(outdivs[d[i]]))
+
+def _best_mul_div_py(freqdesired, freqsource, outdivs):
+    """calcMulDiv search without numpy, same result as _best_mul_div_np"""
+    best = None
+    for outdiv in outdivs:
+        fvco = freqdesired * outdiv
+        for M in range(1, _PLL_M_MAX + 1):
+            n_ideal = fvco * M / freqsource
+            for N in {math.floor(n_ideal), math.ceil(n_ideal)}:
+                N = min(max(N, 1), _PLL_N_MAX)
+                actual = (freqsource * N) / M
+                if actual < _PLL_FVCO_MIN or actual > _PLL_FVCO_MAX:
+                    continue
+                cand = (abs(fvco - actual) / outdiv, outdiv, N, M)
+                if best is None or cand < best:
+                    best = cand
+        if best is not None and best[0] == 0:
+            # exact, and any later outdiv would lose the tie
+            break
+    if best is None:
+        return (0, 0, 0)
+    return (best[2], best[3], best[1])
+
+class PLLSettingsCache:
+    """On-disk table of calcMulDiv results, keyed by reference frequency.
+
+    Stored as JSON in the chipwhisperer cache directory, so sweeps over the
+    same frequencies don't redo the divider search each time they're planned.
+
+    Args:
+        path (str, optional): JSON file to use. Defaults to
+            <cache dir>/pll_cdce906.json.
+    """
+    def __init__(self, path : Optional[str]=None):
+        self._path = path
+        self._table = None
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> str:
+        if self._path is None:
+            self._path = os.path.join(util.get_cache_dir(), "pll_cdce906.json")
+        return self._path
+
+    def _load(self):
+        if self._table is None:
+            try:
+                self._table = util.load_json(self.path, {})
+            except OSError:
+                self._table = {}
+        return self._table
+
+    def lookup(self, reffreq : float, freqs : Iterable[float], calc) -> list:
+        """(N, M, outdiv) for each of freqs, using calc(freq) for any that
+        aren't in the table yet and saving them.
+        """
+        with self._lock:
+            table = self._load().setdefault(repr(float(reffreq)), {})
+            settings = []
+            added = False
+            for freq in freqs:
+                key = repr(float(freq))
+                if key not in table:
+                    table[key] = list(calc(freq))
+                    added = True
+                settings.append(tuple(table[key]))
+            if added:
+                try:
+                    util.save_json_atomic(self.path, self._table)
+                except OSError as e:
+                    naeusb_logger.warning("Could not save PLL settings to {}: {}".format(self.path, e))
+            return settings
+
+_settings_cache = None
+
+def default_settings_cache() -> PLLSettingsCache:
+    global _settings_cache
+    if _settings_cache is None:
+        _settings_cache = PLLSettingsCache()
+    return _settings_cache
+
+class PLLSweep(object):
+    """Precomputed sequence of PLL output frequencies, from PLLCDCE906.plan_sweep().
+
+    Each step's divider settings are worked out up front and turned into
+    register images. The sweep remembers what it last wrote to each of its
+    registers, so applying a step only writes the registers that differ from
+    the one before, queued together in one PLLCDCE906.batch(), and the bits of
+    shared registers that the sweep doesn't own are only read once. This
+    assumes nothing else changes those registers mid-sweep; call reset() if it
+    does.
+
+    Iterating over the sweep applies each step in turn::
+
+        sweep = target.pll.plan_sweep(range(int(5E6), int(50E6), int(1E6)), 1)
+        for freq in sweep:
+            capture_at(freq)
+
+    Attributes:
+        freqs (list): Per step, {outnum: frequency}.
+        settings (list): Per step, {outnum: (N, M, outdiv)}.
+        registers (list): Per step, {address: (mask, value)} of the bits it sets.
+    """
+    def __init__(self, pll, freqs : Dict[int, list], settings : Dict[int, list]):
+        self._pll = pll
+        outnums = sorted(freqs)
+        nsteps = len(freqs[outnums[0]])
+        self.freqs = [{o: freqs[o][i] for o in outnums} for i in range(nsteps)]
+        self.settings = [{o: settings[o][i] for o in outnums} for i in range(nsteps)]
+        self.registers = [self._image(step) for step in self.settings]
+        # last value written to each register, as far as this sweep knows
+        self._regs = {}
+        self._started = False
+
+    def _image(self, step):
+        regs = {}
+        def setbits(addr, mask, value):
+            # registers can be shared, e.g. 6 holds PLL1's M/N high bits and the mode bits
+            old_mask, old_value = regs.get(addr, (0, 0))
+            regs[addr] = (old_mask | mask, (old_value & ~mask) | value)
+        for outnum, (N, M, outdiv) in step.items():
+            pllnum = self._pll.swap_340_pllnum(outnum)
+            offset = 3 * pllnum
+            # same layout as PLLCDCE906.pllwrite()
+            setbits(1 + offset, 0xFF, M & 0xFF)
+            setbits(2 + offset, 0xFF, N & 0xFF)
+            setbits(3 + offset, 0x1F, ((M & 0x100) >> 8) | ((N & 0xF00) >> 7))
+            setbits(13 + pllnum, 0xFF, outdiv & 0x7F)
+            pllbit = 7 - pllnum
+            mode = 1 << pllbit if (self._pll.reffreq * N) / M > 180E6 else 0
+            # High-speed mode (180-300 MHz)
+            setbits(6, 1 << pllbit, mode)
+        return regs
+
+    def __len__(self):
+        return len(self.freqs)
+
+    def __getitem__(self, i):
+        return self.freqs[i]
+
+    def __iter__(self):
+        for i in range(len(self)):
+            self.apply(i)
+            freqs = self.freqs[i]
+            yield next(iter(freqs.values())) if len(freqs) == 1 else freqs
+
+    def reset(self):
+        """Forget the register state (here and see PLLCDCE906.invalidate()), so
+        the next step applied reads and writes everything again"""
+        self._pll.invalidate()
+        self._regs = {}
+        self._started = False
+
+    def apply(self, i : int):
+        """Set the PLL outputs to step i"""
+        pll = self._pll
+        regs = self._regs
+        writes = []
+        for addr, (mask, value) in self.registers[i].items():
+            old = regs.get(addr)
+            if mask != 0xFF:
+                if old is None:
+                    old = pll.cdce906read(addr)
+                value |= old & ~mask
+            if value != old:
+                writes.append((addr, value))
+            regs[addr] = value
+        with pll.batch():
+            if pll.shadow:
+                for addr, value in writes:
+                    pll.cdce906write(addr, value)
+            else:
+                # batch() only holds writes with the shadow enabled
+                pll._cdce906write_many(writes)
+            if not self._started:
+                for outnum in self.freqs[i]:
+                    pll.outputUpdateOutputs(outnum)
+        self._started = True
 
 class PLLCDCE906(object):
 
-    def __init__(self, usb, ref_freq, board="CW305"):
+    def __init__(self, usb, ref_freq, board="CW305", shadow=True):
+        """
+        With shadow enabled, a host-side copy of the CDCE906 registers is kept:
+        reads are served from it after the first, and writes of a value a
+        register already holds are skipped. This assumes nothing but this
+        object writes to the chip; call invalidate() if something else did.
+        """
         self._usb = usb
         self.reffreq = ref_freq
         self._pll0source = 'PLL0'
@@ -35,6 +264,10 @@ class PLLCDCE906(object):
         self._pll1slew = '+0nS'
         self._pll2slew = '+0nS'
         self._board = board
+        self.shadow = shadow
+        self._shadow = [None] * CDCE906_NUM_REGS
+        self._pending = {}
+        self._batch_depth = 0
 
     def pll_outfreq_set(self, freq, outnum):
         """Set the output frequency of a PLL
@@ -51,8 +284,59 @@ class PLLCDCE906(object):
         if freq is None or (freq < 630E3) or (freq > 167E6):
             raise ValueError("Illegal clock frequency = %d" % freq)
         best = self.calcMulDiv(freq, self.reffreq)
-        self.pllwrite(outnum, N=best[0], M=best[1], outdiv=best[2])
-        self.outputUpdateOutputs(outnum)
+        with self.batch():
+            self.pllwrite(outnum, N=best[0], M=best[1], outdiv=best[2])
+            self.outputUpdateOutputs(outnum)
+
+    def plan_sweep(self, freqs : Union[Iterable[float], Dict[int, Iterable[float]]],
+                   outnum : Optional[int]=None, cache : Union[PLLSettingsCache, bool, None]=True) -> PLLSweep:
+        """Precompute the PLL settings for a sequence of output frequencies
+
+        Args:
+            freqs: Frequencies for output outnum (a list, range, array, ...), or
+                a dict of {outnum: frequencies} to step several outputs
+                together, in which case each output needs the same number of
+                frequencies.
+            outnum (int): The PLL the frequencies are for, if freqs isn't a dict.
+            cache: PLLSettingsCache to look divider settings up in, True for the
+                default one in the chipwhisperer cache directory, or None to
+                always calculate them.
+
+        Returns:
+            A PLLSweep, which sets each step in turn when iterated over.
+
+        Raises:
+            ValueError: A frequency is out of range, or the outputs have
+                different numbers of steps.
+        """
+        if not isinstance(freqs, dict):
+            if outnum is None:
+                raise ValueError("outnum is required unless freqs is a dict")
+            freqs = {outnum: freqs}
+        freqs = {o: [float(f) for f in fs] for o, fs in freqs.items()}
+        if not freqs:
+            raise ValueError("No frequencies to sweep")
+        if len(set(len(fs) for fs in freqs.values())) != 1:
+            raise ValueError("All outputs must have the same number of sweep steps")
+        for o, fs in freqs.items():
+            self.outnumToPin(o)
+            for f in fs:
+                if (f < 630E3) or (f > 167E6):
+                    raise ValueError("Illegal clock frequency = %d" % f)
+
+        if cache is True:
+            cache = default_settings_cache()
+        calc = lambda f: self.calcMulDiv(f, self.reffreq)
+        settings = {}
+        for o, fs in freqs.items():
+            if cache:
+                settings[o] = cache.lookup(self.reffreq, fs, calc)
+            else:
+                settings[o] = [calc(f) for f in fs]
+            for f, (N, M, outdiv) in zip(fs, settings[o]):
+                if M == 0:
+                    raise ValueError("No PLL settings for clock frequency = %d" % f)
+        return PLLSweep(self, freqs, settings)
 
     def outnumToPin(self, outnum):
         """Convert from PLL Number to actual output pin"""
@@ -219,6 +503,7 @@ class PLLCDCE906(object):
 
     def pll_writedefaults(self):
         """Save PLL settings to EEPROM, making them power-on defaults"""
+        self.sync()
         # Set bit high to enable write
         data = self.cdce906read(26) & (~(1 << 7))
         self.cdce906write(26, data | (1 << 7))
@@ -231,8 +516,69 @@ class PLLCDCE906(object):
         self.cdce906write(26, data)
 
     def cdce906write(self, addr, data):
-        """ Write a byte to the CDCE906 External PLL Chip """
+        """ Write a byte to the CDCE906 External PLL Chip
 
+        With the shadow enabled, the write is skipped if the register already
+        holds data, and inside batch() it's held until the batch ends.
+        """
+        if not self.shadow or addr in _CDCE906_VOLATILE_REGS:
+            self._cdce906write(addr, data)
+            return
+        if self._batch_depth:
+            self._pending[addr] = data
+            return
+        if self._shadow[addr] != data:
+            self._cdce906write(addr, data)
+            self._shadow[addr] = data
+
+    def cdce906read(self, addr):
+        """ Read a byte from the CDCE906 External PLL Chip
+
+        With the shadow enabled, only the first read of each register goes
+        to the chip.
+        """
+        if not self.shadow or addr in _CDCE906_VOLATILE_REGS:
+            return self._cdce906read(addr)
+        if addr in self._pending:
+            return self._pending[addr]
+        if self._shadow[addr] is None:
+            self._shadow[addr] = self._cdce906read(addr)
+        return self._shadow[addr]
+
+    @contextmanager
+    def batch(self):
+        """Context manager holding register writes until the end of the block,
+        so a register written several times is only written to the chip once::
+
+            with target.pll.batch():
+                target.pll.pll_outfreq_set(10E6, 1)
+                target.pll.pll_outslew_set('+1nS', 1)
+
+        Needs the shadow enabled; otherwise writes go straight through.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.sync()
+
+    def sync(self):
+        """Write any register writes held by batch() to the chip"""
+        pending, self._pending = self._pending, {}
+        writes = [(addr, data) for addr, data in pending.items() if self._shadow[addr] != data]
+        self._cdce906write_many(writes)
+        for addr, data in writes:
+            self._shadow[addr] = data
+
+    def invalidate(self):
+        """Forget the shadow register values, so they're read from the chip
+        again. Writes held by batch() are kept.
+        """
+        self._shadow = [None] * CDCE906_NUM_REGS
+
+    def _cdce906write(self, addr, data):
         # print "Write %d = %x" % (addr, data)
         self._usb.sendCtrl(0x30, data=[0x01, addr, data])
         resp = self._usb.readCtrl(0x30, dlen=2)
@@ -243,8 +589,27 @@ class PLLCDCE906(object):
             if resp[0] != 2:
                 raise IOError("CDCE906 Write Error, response = %d" % resp[0])
 
-    def cdce906read(self, addr):
-        """ Read a byte from the CDCE906 External PLL Chip """
+    def _cdce906write_many(self, writes):
+        # Each write is followed by a read of its status, as in _cdce906write(), but
+        # they're all queued together so the whole lot costs about one USB round trip.
+        # From the first write that didn't go through, carry on one at a time (with
+        # _cdce906write()'s retry) so the registers are still written in order.
+        if len(writes) < 2:
+            for addr, data in writes:
+                self._cdce906write(addr, data)
+            return
+        status = []
+        for addr, data in writes:
+            self._usb.sendCtrlAsync(0x30, data=[0x01, addr, data])
+            status.append(self._usb.readCtrlAsync(0x30, dlen=2))
+        self._usb.flush()
+        for i, resp in enumerate(status):
+            if resp.result()[0] != 2:
+                for addr, data in writes[i:]:
+                    self._cdce906write(addr, data)
+                break
+
+    def _cdce906read(self, addr):
         self._usb.sendCtrl(0x30, data=[0x00, addr, 0])
         resp = self._usb.readCtrl(0x30, dlen=2)
         if resp[0] != 2:
@@ -262,17 +627,18 @@ class PLLCDCE906(object):
         # Y1 = P1
         # Y2,Y3,Y5 = disabled
         # Y4 = P2
-        self.outputUpdateOutputs(0)
-        self.outputUpdateOutputs(1)
-        self.outputUpdateOutputs(2)
+        with self.batch():
+            self.outputUpdateOutputs(0)
+            self.outputUpdateOutputs(1)
+            self.outputUpdateOutputs(2)
 
-        self.cdce906setoutput(2, 0, enabled=False)
-        self.cdce906setoutput(3, 0, enabled=False)
-        self.cdce906setoutput(5, 0, enabled=False)
+            self.cdce906setoutput(2, 0, enabled=False)
+            self.cdce906setoutput(3, 0, enabled=False)
+            self.cdce906setoutput(5, 0, enabled=False)
 
-        self.cdce906write(9, (1 << 5) | (self.cdce906read(9) & 0x1F))  # PLL 1
-        self.cdce906write(10, (2 << 5) | (self.cdce906read(10) & 0x1F))  # PLL2 not SSC
-        self.cdce906write(11, 4 | (self.cdce906read(11) & 0xF8))  # PLL 3
+            self.cdce906write(9, (1 << 5) | (self.cdce906read(9) & 0x1F))  # PLL 1
+            self.cdce906write(10, (2 << 5) | (self.cdce906read(10) & 0x1F))  # PLL2 not SSC
+            self.cdce906write(11, 4 | (self.cdce906read(11) & 0xF8))  # PLL 3
 
     def cdce906setoutput(self, outpin, divsource, slewrate='+0nS', enabled=True, inverted=False):
         """Setup the outputs for the PLL chip"""
@@ -311,29 +677,27 @@ class PLLCDCE906(object):
             return True
 
     def calcMulDiv(self, freqdesired, freqsource):
-        """Calculate Multiply & Divide settings for PLL based on input frequency"""
-
-        lowerror = 1E99
-        best = (0, 0, 0)
+        """Calculate Multiply & Divide settings for PLL based on input frequency
+
+        Returns the (N, M, outdiv) whose output frequency is closest to
+        freqdesired with the VCO in range (80-300MHz). The output error for a
+        given outdiv and M is smallest at the N nearest freqdesired * outdiv * M
+        / freqsource, so only those two N values are checked rather than every
+        N. Ties go to the lowest outdiv, then N, then M, which matches the
+        first exact match the old exhaustive search returned.
+        """
 
         # Figured out divider settings to put fvco in range 80-300
-        maxoutdiv = int(math.floor(300E6 / freqdesired))
-        minoutdiv = int(math.ceil(80E6 / freqdesired))
-        maxoutdiv = min(maxoutdiv, 127)
-
-        # If finds an exact match, this is very fast... if not this
-        # can take a little while to calculate
-        for outdiv in range(minoutdiv, maxoutdiv + 1):
-            fvco = freqdesired * outdiv
-            for N in range(1, 4096):
-                for M in range(1, 512):
-                    err = abs(fvco - ((freqsource * N) / M))
-                    if err < lowerror:
-                        lowerror = err / outdiv
-                        best = (N, M, outdiv)
-                        if lowerror == 0:
-                            return best
-        return best
+        maxoutdiv = int(math.floor(_PLL_FVCO_MAX / freqdesired))
+        minoutdiv = int(math.ceil(_PLL_FVCO_MIN / freqdesired))
+        maxoutdiv = min(maxoutdiv, _PLL_OUTDIV_MAX)
+        outdivs = range(minoutdiv, maxoutdiv + 1)
+        if len(outdivs) == 0:
+            return (0, 0, 0)
+
+        if np is not None:
+            return _best_mul_div_np(freqdesired, freqsource, outdivs)
+        return _best_mul_div_py(freqdesired, freqsource, outdivs)
 
     def swap_340_pllnum(self, pllnum):
         # handles the fact that PLL2 and PLL1 are swapped on CW340
@@ -350,33 +714,34 @@ class PLLCDCE906(object):
         pllnum = self.swap_340_pllnum(pllnum)
         offset = 3 * pllnum
 
-        self.cdce906write(1 + offset, M & 0xFF)
-        self.cdce906write(2 + offset, N & 0xFF)
-        base = self.cdce906read(3 + offset)
-        base = base & 0xE0  # Mask out lower bits
-        base |= (M & (0x100)) >> 8
-        base |= (N & (0xF00)) >> 7
-        self.cdce906write(3 + offset, base)
-        self.cdce906write(13 + pllnum, outdiv & 0x7F)
-
-        # Set PLL Mode (high-speed or regular)
-        fvco = (self.reffreq * float(N)) / float(M)
-        if fvco < 80E6 or fvco > 300E6:
-            raise IOError("Fvco set to $d, out of range" % fvco)
-
-        data = self.cdce906read(6)
-        if pllnum == 0:
-            pllbit = 7
-        elif pllnum == 1:
-            pllbit = 6
-        elif pllnum == 2:
-            pllbit = 5
-
-        data &= ~(1 << pllbit)
-        if fvco > 180E6:
-            # High-speed mode (180-300 MHz)
-            data |= 1 << pllbit
-        self.cdce906write(6, data)
+        with self.batch():
+            self.cdce906write(1 + offset, M & 0xFF)
+            self.cdce906write(2 + offset, N & 0xFF)
+            base = self.cdce906read(3 + offset)
+            base = base & 0xE0  # Mask out lower bits
+            base |= (M & (0x100)) >> 8
+            base |= (N & (0xF00)) >> 7
+            self.cdce906write(3 + offset, base)
+            self.cdce906write(13 + pllnum, outdiv & 0x7F)
+
+            # Set PLL Mode (high-speed or regular)
+            fvco = (self.reffreq * float(N)) / float(M)
+            if fvco < 80E6 or fvco > 300E6:
+                raise IOError("Fvco set to $d, out of range" % fvco)
+
+            data = self.cdce906read(6)
+            if pllnum == 0:
+                pllbit = 7
+            elif pllnum == 1:
+                pllbit = 6
+            elif pllnum == 2:
+                pllbit = 5
+
+            data &= ~(1 << pllbit)
+            if fvco > 180E6:
+                # High-speed mode (180-300 MHz)
+                data |= 1 << pllbit
+            self.cdce906write(6, data)
 
     def pllread(self, pllnum):
         """Read N/M/output divisors from PLL chip"""
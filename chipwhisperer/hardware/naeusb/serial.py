@@ -201,7 +201,7 @@ class USART(object):
         """
         Get number of bytes in tx buffer
         """
-        if self._usb.check_feature("TX_IN_WAITING"):
+        if self._usb.features.TX_IN_WAITING:
             data = self._usartRxCmd(self.USART_CMD_NUMWAIT_TX, dlen=4)
             return data[0]
 
@@ -210,17 +210,34 @@ class USART(object):
         Read data from input buffer, if 'dlen' is 0 everything present is read. If timeout is non-zero
         system will block for a while until data is present in buffer.
         """
-        if timeout == 0:
-            timeout = self.timeout
-
         waiting = self.inWaiting()
 
         if dlen < 1:
             dlen = waiting
 
         resp = bytearray(dlen)
+        with memoryview(resp) as view:
+            pos = self._readinto(view, timeout, waiting)
+
+        # print("read: " + str(resp))
+        if pos == dlen:
+            return resp
+        else:
+            return resp[:pos]
+
+    def readinto(self, buf, timeout=0):
+        """
+        Read into buf (a bytearray, memoryview, numpy array...) until it's full, like
+        read(len(buf)) but without allocating a new buffer. Returns the number of bytes read.
+        """
+        return self._readinto(util.get_writable_memview(buf), timeout, self.inWaiting())
+
+    def _readinto(self, view, timeout, waiting):
+        if timeout == 0:
+            timeout = self.timeout
+
+        dlen = len(view)
         pos = 0
-        end = 0
         while dlen > 0:
             if waiting > 0:
                 rlen = self._max_read
@@ -228,12 +245,9 @@ class USART(object):
                     rlen = waiting
                 if dlen < rlen:
                     rlen = dlen
-                newdata = self._usb.readCtrl(self.CMD_USART0_DATA, (self._usart_num << 8), rlen)
-                rlen = len(newdata)
-                end += rlen
+                rlen = self._usb.readCtrlInto(self.CMD_USART0_DATA, (self._usart_num << 8), view[pos:pos + rlen])
                 dlen -= rlen
-                resp[pos:end] = newdata
-                pos = end
+                pos += rlen
 
             if timeout <= 0:
                 break
@@ -244,11 +258,7 @@ class USART(object):
 
             waiting = self.inWaiting()
 
-        # print("read: " + str(resp))
-        if dlen == 0:
-            return resp
-        else:
-            return resp[:pos]
+        return pos
 
 
     def _usartTxCmd(self, cmd, data=[]):
@@ -284,18 +294,18 @@ class USART(object):
     @property
     def xonxoff(self):
         # TODO: check version to make sure fw has this
-        if self._usb.check_feature("XON_XOFF"):
+        if self._usb.features.XON_XOFF:
             return self._usartRxCmd(self.USART_CMD_XONXOFF)[0] & 0x01
         return None
     
     @xonxoff.setter
     def xonxoff(self, enable):
-        if self._usb.check_feature("XON_XOFF"):
+        if self._usb.features.XON_XOFF:
             enable = 1 if enable else 0
             self._usartTxCmd(self.USART_CMD_XONXOFF, [enable])
 
     @property
     def currently_xoff(self):
-        if self._usb.check_feature("XON_XOFF"):
+        if self._usb.features.XON_XOFF:
             return self._usartRxCmd(self.USART_CMD_XONXOFF)[0] & 0x02
         return None
\ No newline at end of file
@@ -153,6 +153,37 @@ class SPI(object):
         
         return readdata
     
+    def transfer_into(self, data, rx, start=True, stop=True):
+        """Like transfer(), but the data read back goes into rx (a bytearray, memoryview,
+        numpy array...) instead of a new list. rx must hold at least len(data) bytes.
+
+        Returns:
+            The number of bytes read.
+        """
+        rx = util.get_writable_memview(rx)
+        dlen = len(data)
+        if dlen == 0:
+            raise ValueError("Length of input data must be > 0")
+        if len(rx) < dlen:
+            raise ValueError("rx holds {} bytes, but {} are being transferred".format(len(rx), dlen))
+
+        if start:
+            self.set_cs(False)
+
+        pos = 0
+        received = 0
+        while pos < dlen:
+            n = min(64, dlen - pos)
+            self.sendCtrl(self.CMD_SPI, self.SPI_CMD_DATA, data[pos:pos + n])
+            # Read already happened on HW side, this just reads back from buffer
+            received += self._usb.readCtrlInto(self.CMD_SPI, self.SPI_CMD_DATA, rx[pos:pos + n])
+            pos += n
+
+        if stop:
+            self.set_cs(True)
+
+        return received
+
     def transfer_max64(self, data, writeonly=False):
         """Transfers up to 64 bytes, normally internal function as no CS control!
         """
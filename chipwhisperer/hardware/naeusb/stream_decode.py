@@ -0,0 +1,200 @@
+#
+# Copyright (c) 2024, NewAE Technology Inc
+# All rights reserved.
+#
+#    This file is part of chipwhisperer.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+# ==========================================================================
+"""Decoding of CW-Pro stream mode data.
+
+The CW-Pro streams its samples in 4096 byte FPGA blocks, each starting with a
+sync byte (see NAEUSB.cmdReadStream_size_of_fpgablock()). The rest of each
+block is packed samples, three 10 bit samples per 32 bit big endian word::
+
+    bits 31:30  unused
+    bits 29:20  sample n
+    bits 19:10  sample n+1
+    bits  9:0   sample n+2
+
+Words carry on across block boundaries, and the last block is padded out to
+a whole block. :class:`ProStreamDecoder` strips and checks the sync bytes and
+unpacks the samples with numpy, either all at once::
+
+    samples = decode_pro_stream(buf, dlen)
+
+or a chunk at a time, as the data arrives::
+
+    decoder = ProStreamDecoder(dlen, dtype=np.float32)
+    for chunk in naeusb.stream_chunks(dlen, is_husky=False):
+        process(decoder.feed(chunk))
+
+numpy is an optional dependency of chipwhisperer (``pip install chipwhisperer[numpy]``),
+but this module needs it: ProStreamDecoder raises ImportError without it.
+"""
+from typing import Optional
+
+from ...logging import *
+
+try:
+    import numpy as np
+except:
+    np = None # type: ignore
+
+STREAM_BLOCK_SIZE = 4096
+STREAM_SYNC_BYTE = 0xAC
+SAMPLE_BITS = 10
+
+class ProStreamDecoder:
+    """Incremental CW-Pro stream decoder. Requires numpy.
+
+    Args:
+        dlen (int, optional): Samples in the capture. Anything past them is
+            padding and is dropped. If None, every complete word is decoded.
+        dtype: np.uint16 for raw ADC codes, or np.float32/np.float64 for
+            samples scaled to [-0.5, 0.5), as the OpenADC reports them.
+        sync (int, optional): Expected sync byte, or None not to check them.
+        block_size (int): FPGA block size, from cmdReadStream_size_of_fpgablock().
+        strict (bool): Raise IOError on a bad sync byte instead of logging a warning.
+    """
+    def __init__(self, dlen : Optional[int]=None, dtype=None, sync : Optional[int]=STREAM_SYNC_BYTE,
+                 block_size : int=STREAM_BLOCK_SIZE, strict : bool=False):
+        if np is None:
+            raise ImportError("numpy is required to decode CW-Pro stream data")
+        self.dlen = dlen
+        self.dtype = np.dtype(np.uint16 if dtype is None else dtype)
+        if self.dtype.kind not in "uif":
+            raise ValueError("Can't decode samples to {}".format(self.dtype))
+        self.sync = sync
+        self.block_size = block_size
+        self.strict = strict
+
+        #: Stream bytes fed so far
+        self.offset = 0
+        #: Samples returned so far
+        self.samples = 0
+        #: Stream offsets of sync bytes that didn't match
+        self.sync_errors = []
+        self._carry = np.zeros(0, dtype=np.uint8)
+
+    @property
+    def done(self) -> bool:
+        """True once all dlen samples have been returned"""
+        return self.dlen is not None and self.samples >= self.dlen
+
+    def reset(self):
+        """Start again at the beginning of a new stream"""
+        self.offset = 0
+        self.samples = 0
+        self.sync_errors = []
+        self._carry = np.zeros(0, dtype=np.uint8)
+
+    def _strip(self, raw):
+        # payload of raw, with the carried over bytes in front, in one copy
+        bs = self.block_size
+        n = len(raw)
+        first = (-self.offset) % bs
+        head = min(first, n)
+        nsync = 0 if n <= first else (n - first - 1) // bs + 1
+        if nsync and self.sync is not None:
+            bad = np.flatnonzero(raw[first::bs] != self.sync)
+            if len(bad):
+                self._sync_error(self.offset + first + bad * bs, raw[first + bad[0] * bs])
+
+        nc = len(self._carry)
+        payload = np.empty(nc + n - nsync, dtype=np.uint8)
+        payload[:nc] = self._carry
+        payload[nc:nc + head] = raw[:head]
+        pos = nc + head
+        whole = max(0, (n - head) // bs)
+        if whole:
+            blocks = raw[head:head + whole * bs].reshape(whole, bs)
+            payload[pos:pos + whole * (bs - 1)].reshape(whole, bs - 1)[:] = blocks[:, 1:]
+            pos += whole * (bs - 1)
+        tail = raw[head + whole * bs + 1:]
+        payload[pos:] = tail
+        return payload
+
+    def _sync_error(self, offsets, value):
+        self.sync_errors.extend(int(x) for x in offsets)
+        msg = "Stream sync byte at offset {} was {:#04x}, expected {:#04x} ({} bad in this chunk)".format(
+            int(offsets[0]), int(value), self.sync, len(offsets))
+        if self.strict:
+            raise IOError(msg)
+        naeusb_logger.warning(msg)
+
+    def feed(self, data) -> "np.ndarray":
+        """Decode the next piece of the stream.
+
+        Args:
+            data: Bytes-like object or uint8 array, continuing from the last call.
+
+        Returns:
+            Array of the samples completed by data. May be empty.
+        """
+        raw = np.frombuffer(data, dtype=np.uint8) if not isinstance(data, np.ndarray) else data.view(np.uint8).ravel()
+        if self.done or len(raw) == 0:
+            self.offset += len(raw)
+            return np.zeros(0, dtype=self.dtype)
+        payload = self._strip(raw)
+        self.offset += len(raw)
+
+        nwords = len(payload) // 4
+        self._carry = payload[nwords * 4:].copy()
+        nsamples = nwords * 3
+        if self.dlen is not None:
+            nsamples = min(nsamples, self.dlen - self.samples)
+            nwords = -(-nsamples // 3)
+        words = payload[:nwords * 4].view(">u4")
+
+        out = np.empty((nwords, 3), dtype=self.dtype)
+        mask = (1 << SAMPLE_BITS) - 1
+        out[:, 0] = (words >> (2 * SAMPLE_BITS)) & mask
+        out[:, 1] = (words >> SAMPLE_BITS) & mask
+        out[:, 2] = words & mask
+        out = out.reshape(-1)[:nsamples]
+        if self.dtype.kind == "f":
+            out *= 1.0 / (1 << SAMPLE_BITS)
+            out -= 0.5
+        self.samples += nsamples
+        return out
+
+def decode_pro_stream(buf, dlen : Optional[int]=None, dtype=None, sync : Optional[int]=STREAM_SYNC_BYTE,
+                      block_size : int=STREAM_BLOCK_SIZE, strict : bool=False) -> "np.ndarray":
+    """Decode a whole CW-Pro stream capture, such as the buffer given to
+    initStreamModeCapture(). See :class:`ProStreamDecoder` for the arguments.
+    """
+    return ProStreamDecoder(dlen, dtype, sync, block_size, strict).feed(buf)
+
+def encode_pro_stream(samples, sync : int=STREAM_SYNC_BYTE, block_size : int=STREAM_BLOCK_SIZE) -> bytearray:
+    """Pack 10 bit samples the way the CW-Pro streams them, padded to whole
+    blocks. The inverse of decode_pro_stream(), for simulation and testing.
+    """
+    if np is None:
+        raise ImportError("numpy is required to encode CW-Pro stream data")
+    samples = np.asarray(samples, dtype=np.uint32) & ((1 << SAMPLE_BITS) - 1)
+    nwords = -(-len(samples) // 3)
+    padded = np.zeros(nwords * 3, dtype=np.uint32)
+    padded[:len(samples)] = samples
+    padded = padded.reshape(-1, 3)
+    words = (padded[:, 0] << (2 * SAMPLE_BITS)) | (padded[:, 1] << SAMPLE_BITS) | padded[:, 2]
+    payload = words.astype(">u4").view(np.uint8)
+
+    per_block = block_size - 1
+    nblocks = max(1, -(-len(payload) // per_block))
+    body = np.zeros(nblocks * per_block, dtype=np.uint8)
+    body[:len(payload)] = payload
+    out = np.empty((nblocks, block_size), dtype=np.uint8)
+    out[:, 0] = sync
+    out[:, 1:] = body.reshape(nblocks, per_block)
+    return bytearray(out.tobytes())
@@ -0,0 +1,161 @@
+#
+# Copyright (c) 2024, NewAE Technology Inc
+# All rights reserved.
+#
+#    This file is part of chipwhisperer.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+# ==========================================================================
+"""Memory mapped files as streaming capture destinations.
+
+A :class:`StreamFileSink` is a preallocated file mapped into memory, whose
+buffer can be passed to NAEUSB.initStreamModeCapture() in place of a
+bytearray. Husky streams are received straight into the mapping, so a capture
+is only bounded by disk space and doesn't need copying again to be saved::
+
+    with StreamFileSink.for_capture("trace.bin", naeusb, dlen, is_husky=True) as sink:
+        naeusb.initStreamModeCapture(dlen, sink.buffer, is_husky=True, segment_size=segment_size)
+        drx, timeout = naeusb.cmdReadStream(is_husky=True)
+        sink.finish(drx, naeusb.cmdReadStream_getStatus())
+
+or just naeusb.stream_to_file("trace.bin", dlen, ...). finish() writes the
+capture's details next to the data, as trace.bin.json.
+"""
+import errno
+import mmap
+import os
+import time
+from typing import Optional, Tuple
+
+from ...common.utils import util
+from ...logging import *
+
+try:
+    import numpy as np
+except:
+    np = None # type: ignore
+
+SIDECAR_SUFFIX = ".json"
+
+class StreamFileSink:
+    """Preallocated, memory mapped file to stream a capture into.
+
+    Args:
+        path (str): File to create (or overwrite).
+        nbytes (int): Size of the file, i.e. the most the capture can write.
+        fsync (bool): If True, finish() waits for the data to reach the disk.
+    """
+    def __init__(self, path : str, nbytes : int, fsync : bool=False):
+        if nbytes <= 0:
+            raise ValueError("Stream file size must be positive, not {}".format(nbytes))
+        self.path = path
+        self.nbytes = nbytes
+        self.fsync = fsync
+        self._f = open(path, "w+b")
+        try:
+            self._allocate(nbytes)
+            self._mmap = mmap.mmap(self._f.fileno(), nbytes, access=mmap.ACCESS_WRITE)
+        except:
+            self._f.close()
+            raise
+        self.buffer = self._mmap
+
+    def _allocate(self, nbytes):
+        # reserve the blocks where possible: a write to a mapped page the filesystem
+        # can't back kills the process instead of raising an error
+        if hasattr(os, "posix_fallocate"):
+            try:
+                os.posix_fallocate(self._f.fileno(), 0, nbytes)
+                return
+            except OSError as e:
+                if e.errno not in (errno.EOPNOTSUPP, errno.EINVAL):
+                    # ENOSPC and friends: nowhere to put the capture
+                    raise IOError("Could not allocate {} bytes for {}: {}".format(nbytes, self.path, e))
+                # filesystem can't preallocate, fall back to a sparse file
+        self._f.truncate(nbytes)
+
+    @classmethod
+    def for_capture(cls, path : str, naeusb, dlen : int, is_husky : bool=False, fsync : bool=False) -> "StreamFileSink":
+        """Sink sized for a dlen capture: dlen bytes for Husky, cmdReadStream_bufferSize(dlen)
+        for CW-Pro.
+        """
+        nbytes = dlen if is_husky else naeusb.cmdReadStream_bufferSize(dlen)
+        return cls(path, nbytes, fsync)
+
+    @property
+    def array(self):
+        """The file as a numpy uint8 array, without copying. Requires numpy."""
+        if np is None:
+            raise ImportError("numpy is required for StreamFileSink.array")
+        return np.frombuffer(self._mmap, dtype=np.uint8)
+
+    def finish(self, drx : Optional[int]=None, status : Optional[Tuple[int, int, bool]]=None, **info):
+        """Flush the data to the file and write the sidecar JSON.
+
+        Args:
+            drx (int, optional): Bytes received, as returned by cmdReadStream().
+            status (tuple, optional): cmdReadStream_getStatus() after the capture.
+            **info: Anything else to record in the sidecar.
+        """
+        self._mmap.flush()
+        if self.fsync:
+            os.fsync(self._f.fileno())
+        meta = {
+            "data_file": os.path.basename(self.path),
+            "file_bytes": self.nbytes,
+            "bytes_received": drx,
+            "time": time.time(),
+        }
+        if status is not None:
+            meta["samples_left_to_stream"] = status[0]
+            meta["overflow_location"] = status[1]
+            meta["unknown_overflow"] = bool(status[2])
+        meta.update(info)
+        util.save_json_atomic(self.path + SIDECAR_SUFFIX, meta)
+        return meta
+
+    def close(self):
+        """Unmap and close the file. Any numpy arrays from array must be gone by then."""
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                naeusb_logger.warning("{} is still in use, it'll be closed when no longer referenced".format(self.path))
+            self._mmap = None
+            self.buffer = None
+        if self._f is not None:
+            self._f.close()
+            self._f = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+def load_stream_file(path : str):
+    """Read back a capture saved by a StreamFileSink: (data, sidecar dict).
+
+    data is a read-only numpy memmap of the bytes received if numpy is
+    available, otherwise the bytes themselves.
+    """
+    meta = util.load_json(path + SIDECAR_SUFFIX, {})
+    nbytes = os.path.getsize(path)
+    if meta.get("bytes_received") is not None:
+        nbytes = min(nbytes, meta["bytes_received"])
+    if np is not None:
+        if nbytes == 0:
+            return np.zeros(0, dtype=np.uint8), meta
+        return np.memmap(path, dtype=np.uint8, mode="r", shape=(nbytes,)), meta
+    with open(path, "rb") as f:
+        return f.read(nbytes), meta
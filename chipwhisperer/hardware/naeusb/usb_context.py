@@ -0,0 +1,169 @@
+#
+# Copyright (c) 2024, NewAE Technology Inc
+# All rights reserved.
+#
+#    This file is part of chipwhisperer.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+# ==========================================================================
+"""Process-wide libusb context.
+
+Every NAEUSB_Backend uses the one usb1.USBContext from :func:`shared_usb_context`
+instead of opening its own. While any device is open, a single daemon thread
+handles libusb events for all of them, so it's the one running the callbacks of
+every async transfer (stream captures, queued control transfers and so on) for
+every board. Code waiting on a transfer notes :attr:`SharedUSBContext.generation`,
+checks the transfer, and if it isn't done calls :meth:`SharedUSBContext.handle_events`
+with that generation, which then waits for the event thread to handle events rather
+than handling them itself.
+
+Synchronous transfers are unaffected: libusb lets them wait alongside the event
+thread.
+"""
+import os
+import threading
+from typing import Optional
+
+import usb1  # type: ignore
+
+from ...logging import *
+
+class SharedUSBContext:
+    """A libusb context shared by every device in the process, and its event thread.
+
+    The context is opened on first use and kept until the process exits. The event
+    thread runs while at least one device is open (see device_opened()), and can be
+    turned off with use_event_thread = False, in which case waiting code handles
+    events itself, as before.
+    """
+    #: Longest the event thread blocks in libusb at once, in seconds. Only matters for
+    #: stopping it if libusb can't interrupt the event handler.
+    EVENT_TIMEOUT = 0.1
+
+    def __init__(self):
+        self.use_event_thread = True
+        self._lock = threading.Lock()
+        self._ctx = None
+        self._devices = 0
+        self._thread = None
+        self._stop = None
+        self._handled = threading.Condition()
+        # passes of the event thread, so waiters can tell if they missed one
+        self._generation = 0
+
+    @property
+    def context(self) -> usb1.USBContext:
+        """The shared usb1.USBContext, opened on first use"""
+        with self._lock:
+            if self._ctx is None:
+                ctx = usb1.USBContext()
+                ctx.open()
+                self._ctx = ctx
+            return self._ctx
+
+    @property
+    def generation(self) -> int:
+        """Count of event handling passes by the event thread. Read it before checking
+        a transfer, and pass it to handle_events() to wait for the pass after it.
+        """
+        return self._generation
+
+    @property
+    def event_thread_running(self) -> bool:
+        return self._thread is not None
+
+    def device_opened(self):
+        """Note a device was opened, starting the event thread for the first one"""
+        ctx = self.context
+        with self._lock:
+            self._devices += 1
+            if self._thread is None and self.use_event_thread:
+                # each thread gets its own stop flag, so a new one can start while an
+                # old one is still finishing
+                self._stop = threading.Event()
+                self._thread = threading.Thread(target=self._run, args=(ctx, self._stop),
+                                                name="libusb events", daemon=True)
+                self._thread.start()
+
+    def device_closed(self):
+        """Note a device was closed, stopping the event thread after the last one"""
+        with self._lock:
+            self._devices = max(0, self._devices - 1)
+            if self._devices or self._thread is None:
+                return
+            thread, stop = self._thread, self._stop
+            self._thread = self._stop = None
+        stop.set()
+        try:
+            self._ctx.interruptEventHandler()
+        except (AttributeError, usb1.USBError):
+            # libusb too old to interrupt it, the thread notices within EVENT_TIMEOUT
+            pass
+        if thread is not threading.current_thread():
+            thread.join()
+
+    def _run(self, ctx, stop):
+        while not stop.is_set():
+            try:
+                ctx.handleEventsTimeout(self.EVENT_TIMEOUT)
+            except usb1.USBErrorInterrupted:
+                pass
+            except Exception as e:
+                # a callback raised; the transfer's owner sees it as a stalled transfer
+                naeusb_logger.error("Error handling USB events: {}".format(e), exc_info=True)
+            with self._handled:
+                self._generation += 1
+                self._handled.notify_all()
+
+    def handle_events(self, timeout : float, since : Optional[int]=None):
+        """Give libusb up to timeout seconds to complete transfers.
+
+        With the event thread running, waits until it has handled events since
+        generation since (or for timeout); otherwise handles them on this thread.
+        Callers check their transfers afterwards and call again if they're not done.
+
+        Args:
+            timeout (float): Longest to wait, in seconds.
+            since (int): generation read before the caller last checked its transfers,
+                so a pass that finished one in between isn't waited for again. By
+                default, waits for the next pass.
+        """
+        thread = self._thread
+        if thread is None or thread is threading.current_thread():
+            self.context.handleEventsTimeout(timeout)
+            return
+        with self._handled:
+            if since is None:
+                since = self._generation
+            self._handled.wait_for(lambda: self._generation != since, timeout)
+
+_shared = None
+_shared_lock = threading.Lock()
+
+def shared_usb_context() -> SharedUSBContext:
+    """The process's SharedUSBContext"""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = SharedUSBContext()
+        return _shared
+
+def _after_fork():
+    # libusb contexts don't survive fork(), and the event thread isn't copied, so a
+    # child starts from scratch
+    global _shared, _shared_lock
+    _shared = None
+    _shared_lock = threading.Lock()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork)
@@ -1,10 +1,12 @@
 import logging
+import logging.handlers
 import os
 import tempfile
+import threading as _threading
+import atexit as _atexit
+import queue as _queue
 
 
-log_dir =  tempfile.mkdtemp(prefix='chipwhisperer')
-
 logging.basicConfig(level=logging.WARNING)
 cw_formatter = logging.Formatter("(%(name)s %(levelname)s|File %(filename)s:%(lineno)d) %(message)s")
 
@@ -24,25 +26,145 @@ chipwhisperer_loggers = [
     logging.getLogger("ChipWhisperer Glitch")
 
 ]
+
+# Log files: records are queued by each logger's LazyFileHandler and written by a single
+# listener thread, so logging never waits on the disk. Nothing is created until the first
+# record that reaches a file (or get_log_dir() is called).
+_log_dir = None
+_file_logging = True
+_file_queue = None
+_file_listener = None
+_file_lock = _threading.Lock()
+_opened_files = set()
+
+def get_log_dir():
+    """Temporary directory holding the log files (under chipwhisperer/logs), created on first use"""
+    global _log_dir
+    with _file_lock:
+        if _log_dir is None:
+            _log_dir = tempfile.mkdtemp(prefix='chipwhisperer')
+        os.makedirs(os.path.join(_log_dir, "chipwhisperer/logs"), exist_ok=True)
+        return _log_dir
+
+def __getattr__(name):
+    # log_dir used to be created on import
+    if name == "log_dir":
+        return get_log_dir()
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+class _LogFileRouter(logging.Handler):
+    """Runs on the listener thread: writes each record to its logger's file, opening it
+    the first time that logger logs anything. Each file is started afresh (mode 'w', as
+    before) by the process's first record for it and appended to after that.
+    """
+    def __init__(self):
+        super().__init__()
+        self._files = {}
+
+    def emit(self, record):
+        handler = self._files.get(record.name)
+        if handler is None:
+            try:
+                path = os.path.join(get_log_dir(), "chipwhisperer/logs", record.name + ".log")
+                handler = logging.FileHandler(path, mode='a' if path in _opened_files else 'w')
+                _opened_files.add(path)
+            except OSError:
+                self.handleError(record)
+                return
+            handler.setFormatter(cw_formatter)
+            self._files[record.name] = handler
+        handler.handle(record)
+
+    def close(self):
+        for handler in self._files.values():
+            handler.close()
+        self._files = {}
+        super().close()
+
+def _file_log_queue():
+    global _file_queue, _file_listener
+    with _file_lock:
+        if _file_listener is None:
+            _file_queue = _queue.SimpleQueue()
+            _file_listener = logging.handlers.QueueListener(_file_queue, _LogFileRouter())
+            _file_listener.start()
+        return _file_queue
+
+def flush_log_files():
+    """Wait for everything logged so far to be written, and close the log files.
+    They're reopened by the next record.
+    """
+    global _file_queue, _file_listener
+    with _file_lock:
+        listener, _file_listener, _file_queue = _file_listener, None, None
+    if listener is not None:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+def set_file_logging(enabled):
+    """Turn writing the log files on (the default) or off"""
+    global _file_logging
+    _file_logging = bool(enabled)
+    if not enabled:
+        flush_log_files()
+
+def _after_fork():
+    # the listener thread isn't copied into a forked child, so start again, with its own
+    # files, if it logs anything
+    global _log_dir, _file_queue, _file_listener, _file_lock, _opened_files
+    _log_dir = None
+    _file_queue = None
+    _file_listener = None
+    _file_lock = _threading.Lock()
+    _opened_files = set()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork)
+_atexit.register(flush_log_files)
+
+class LazyFileHandler(logging.handlers.QueueHandler):
+    """Sends records to the log file listener, which is started by the first record"""
+    def __init__(self):
+        super().__init__(None)
+
+    def emit(self, record):
+        # checked before prepare(), which formats the record on the logging thread
+        if _file_logging:
+            super().emit(record)
+
+    def enqueue(self, record):
+        if _file_logging:
+            _file_log_queue().put_nowait(record)
+
 for logger in chipwhisperer_loggers:
     logger.setLevel(logging.WARNING)
     strmhndlr = logging.StreamHandler()
     strmhndlr.setLevel(logging.DEBUG)
     strmhndlr.setFormatter(cw_formatter)
-   
-    try:
-        os.makedirs(os.path.join(log_dir, "chipwhisperer/logs"), exist_ok=True)
-    except FileExistsError:
-        pass
-    
-    filehndlr = logging.FileHandler(os.path.join(log_dir, "chipwhisperer/logs", logger.name + ".log"), mode='w')
-    filehndlr.setFormatter(cw_formatter)
+
+    filehndlr = LazyFileHandler()
     logger.propagate = False
 
     logger.handlers = [strmhndlr, filehndlr]
 
 naeusb_logger.handlers[1].setLevel(logging.INFO) # only log info for this one, as files get big quickly
 
+#: Master switch for the debug traces on the USB and serial hot paths. If False they're
+#: skipped without checking the logger levels at all. See set_hot_path_tracing().
+hot_path_tracing = True
+
+def set_hot_path_tracing(enabled):
+    """Turn the debug traces of every USB/serial transfer on or off, whatever the log levels"""
+    global hot_path_tracing
+    hot_path_tracing = bool(enabled)
+
+def tracing(logger) -> bool:
+    """True if logger would emit debug messages. Hot paths check this before building a
+    trace message, so formatting the data transferred costs nothing when debug is off.
+    """
+    return hot_path_tracing and logger.isEnabledFor(logging.DEBUG)
+
 def set_all_log_levels(level):
     for logger in chipwhisperer_loggers:
         logger.handlers[0].setLevel(level)
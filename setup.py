@@ -15,13 +15,19 @@ setup(
     author_email='sales@newae.com',
     license='apache',
     url='https://www.chipwhisperer.com',
-    packages=find_packages('.'),
+    packages=find_packages('.', exclude=['benchmarks', 'benchmarks.*']),
     package_dir={'': '.'},
+    package_data={'chipwhisperer.hardware.firmware': ['*.cwfw']},
     install_requires=[
         'pyserial',
         'libusb1',
         'Cython',
     ],
+    # numpy is optional: without it the PLL divider search falls back to plain Python,
+    # and the CW-Pro stream decoder isn't available
+    extras_require={
+        'numpy': ['numpy'],
+    },
     project_urls={
         'Documentation': 'https://chipwhisperer.readthedocs.io',
         'Source': 'https://github.com/newaetech/chipwhisperer-minimal',
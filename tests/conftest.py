@@ -0,0 +1,45 @@
+"""Fixtures for running the host side against the simulated NAEUSB backend, without hardware."""
+import pytest
+
+from chipwhisperer.hardware.naeusb import bitstream_cache, naeusb, pll_cdce906
+from chipwhisperer.hardware.naeusb.naeusb import NAEUSB
+from chipwhisperer.hardware.naeusb.naeusb_sim import NAEUSB_SimBackend
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Keeps the host-side caches out of the user's cache directory"""
+    path = tmp_path / "cache"
+    monkeypatch.setenv("CW_CACHE_DIR", str(path))
+    monkeypatch.setattr(bitstream_cache, "_fingerprints", None)
+    monkeypatch.setattr(bitstream_cache, "_transform_cache", None)
+    monkeypatch.setattr(pll_cdce906, "_settings_cache", None)
+    monkeypatch.setattr(naeusb, "_threshold_cache", None)
+    return path
+
+
+@pytest.fixture
+def sim_naeusb():
+    """Function connecting a NAEUSB to a new simulated device, returning (usb, sim).
+
+    Takes the product ID and any SimNAEUSBDevice arguments. Everything it connected is
+    closed at the end of the test.
+    """
+    opened = []
+
+    def connect(pid=0xACE2, **kwargs):
+        backend = NAEUSB_SimBackend(pid=pid, **kwargs)
+        usb = NAEUSB(backend=backend)
+        usb.con(idProduct=[pid])
+        opened.append(usb)
+        return usb, backend.sim
+
+    yield connect
+    for usb in opened:
+        usb.close()
+
+
+@pytest.fixture
+def sim_cw305(sim_naeusb):
+    """(usb, sim) for a simulated CW305"""
+    return sim_naeusb(pid=0xC305)
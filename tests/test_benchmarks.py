@@ -0,0 +1,66 @@
+"""Smoke tests for the benchmark suite: every benchmark sets up and runs once on the simulator."""
+import json
+
+import pytest
+
+from benchmarks import harness
+from benchmarks import __main__ as bench_main
+
+
+@pytest.mark.parametrize("bench", harness.select(), ids=lambda b: b.name)
+def test_benchmark_runs(bench):
+    ret = bench.func(**bench.params)
+    fn = ret[0] if isinstance(ret, tuple) else ret
+    fn()
+
+
+def test_run_one(monkeypatch):
+    bench = harness.select(["naeusb.*"])[0]
+    result = harness.run_one(bench, repeat=2, min_time=0.0)
+    assert result['repeat'] == 2
+    assert result['number'] >= 1
+    assert result['min'] <= result['median']
+    assert 'usb_time' in result and 'transfers' in result
+
+
+def test_select():
+    names = [b.name for b in harness.BENCHMARKS]
+    assert len(names) == len(set(names))
+    assert all(not b.slow for b in harness.select())
+    assert len(harness.select(include_slow=True)) == len(harness.BENCHMARKS)
+    assert harness.select(["no-such-benchmark"]) == []
+
+
+def test_compare():
+    baseline = {'a': {'median': 1.0}, 'b': {'median': 1.0}, 'c': {'median': 1.0}, 'gone': {'median': 1.0}}
+    current = {'a': {'median': 1.05}, 'b': {'median': 1.5}, 'c': {'median': 0.5}, 'new': {'median': 1.0}}
+    status = {r[0]: r[4] for r in harness.compare(baseline, current, threshold=0.10)}
+    assert status == {'a': 'same', 'b': 'regression', 'c': 'improvement', 'gone': 'missing', 'new': 'new'}
+
+
+def test_save_load(tmp_path):
+    path = str(tmp_path / "results.json")
+    harness.save(path, {'a': {'median': 1.0}})
+    assert harness.load(path) == {'a': {'median': 1.0}}
+
+    with open(path, 'w') as f:
+        json.dump({'version': harness.RESULTS_FORMAT_VERSION + 1, 'results': {}}, f)
+    with pytest.raises(ValueError):
+        harness.load(path)
+
+
+def test_main_regression(tmp_path, capsys):
+    name = harness.select()[0].name
+    path = str(tmp_path / "baseline.json")
+    # a baseline nothing can beat by 10%
+    harness.save(path, {name: {'median': 1e-12}})
+    assert bench_main.main(['-k', name, '--repeat', '1', '--min-time', '0', '--baseline', path]) == 0
+    assert bench_main.main(['-k', name, '--repeat', '1', '--min-time', '0', '--baseline', path,
+                            '--fail-on-regression']) == 1
+    assert "REGRESSION" in capsys.readouterr().out
+
+
+def test_main_list(capsys):
+    assert bench_main.main(['--list']) == 0
+    assert len(capsys.readouterr().out.splitlines()) == len(harness.select())
+    assert bench_main.main(['-k', 'no-such-benchmark']) == 1
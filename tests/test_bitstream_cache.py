@@ -0,0 +1,152 @@
+import io
+import hashlib
+import json
+import os
+import time
+
+import pytest
+
+from chipwhisperer.hardware.firmware.fwstore import default_store
+from chipwhisperer.hardware.naeusb.bitstream_cache import BitstreamFingerprints, TransformedBitstreamCache, \
+    bitstream_sha256, default_fingerprints
+
+DATA = bytes(range(256)) * 40
+
+
+def test_bitstream_sha256(tmp_path):
+    digest = hashlib.sha256(DATA).hexdigest()
+    path = tmp_path / "design.bit"
+    path.write_bytes(DATA)
+    assert bitstream_sha256(str(path)) == digest
+    assert bitstream_sha256(path) == digest
+    assert bitstream_sha256(DATA) == digest
+    assert bitstream_sha256(bytearray(DATA)) == digest
+    assert bitstream_sha256(io.BytesIO(DATA)) == digest
+
+    with open(path, "rb") as f:
+        # from where the file is, as that's what would be programmed
+        f.seek(100)
+        assert bitstream_sha256(f) == hashlib.sha256(DATA[100:]).hexdigest()
+        assert f.tell() == 100
+
+    blob = default_store().open("cw305", "SAM3U_CW305.bin")
+    assert bitstream_sha256(blob) == blob.sha256 == hashlib.sha256(blob.getbuffer()).hexdigest()
+
+
+def test_fingerprints(tmp_path):
+    path = str(tmp_path / "fingerprints.json")
+    fp = BitstreamFingerprints(path)
+    assert fp.get("SN1") is None
+
+    fp.record("SN1", None, "aa")
+    fp.record("SN1", "100t", "bb", "01020304")
+    fp.record("SN2", None, "cc")
+    assert fp.get("SN1")["sha256"] == "aa"
+    assert fp.get("SN1")["buildtime"] is None
+    assert fp.get("SN1", "100t")["buildtime"] == "01020304"
+
+    fp.record_buildtime("SN1", None, "05060708")
+    assert fp.get("SN1")["buildtime"] == "05060708"
+    # nothing recorded for it, so nothing to attach the build time to
+    fp.record_buildtime("SN3", None, "05060708")
+    assert fp.get("SN3") is None
+
+    # shared through the file
+    assert BitstreamFingerprints(path).get("SN1", "100t")["sha256"] == "bb"
+    with open(path) as f:
+        assert sorted(json.load(f)) == ["SN1/100t", "SN1/default", "SN2/default"]
+
+    fp.forget("SN1")
+    assert fp.get("SN1") is None
+    assert fp.get("SN1", "100t") is not None
+
+
+def test_forget_board(tmp_path):
+    fp = BitstreamFingerprints(str(tmp_path / "fingerprints.json"))
+    fp.record("SN1", None, "aa")
+    fp.record("SN1", "100t", "bb")
+    fp.record("SN10", None, "cc")
+    fp.forget_board("SN1")
+    assert fp.get("SN1") is None
+    assert fp.get("SN1", "100t") is None
+    assert fp.get("SN10")["sha256"] == "cc"
+
+
+def test_unusable_cache_dir(tmp_path):
+    # a file where the cache directory should be
+    blocker = tmp_path / "blocker"
+    blocker.write_text("")
+    fp = BitstreamFingerprints(str(blocker / "fingerprints.json"))
+    fp.record("SN1", None, "aa")
+    assert fp.get("SN1") is None
+    fp.forget_board("SN1")
+
+
+def test_default_fingerprints(cache_dir):
+    fp = default_fingerprints()
+    assert fp is default_fingerprints()
+    fp.record("SN1", None, "aa")
+    assert (cache_dir / "fpga_fingerprints.json").exists()
+
+
+def test_transform_cache_entries(tmp_path):
+    cache = TransformedBitstreamCache(str(tmp_path / "bitstreams"))
+    key = cache.key("ab" * 32, 1, 0x7C, 32)
+    assert cache.open(key) is None
+    entry = cache.writer(key)
+    entry.write(b"12345")
+    entry.write(b"678")
+    # not visible until committed
+    assert cache.open(key) is None
+    entry.commit()
+    with cache.open(key) as f:
+        assert f.read() == b"12345678"
+    assert [os.path.basename(e[0]) for e in cache.entries()] == [key + ".bin"]
+
+    entry = cache.writer(cache.key("cd" * 32, 1, 0x7C, 32))
+    entry.write(b"abc")
+    entry.abort()
+    assert len(cache.entries()) == 1
+    assert sorted(os.listdir(cache.path)) == [key + ".bin"]
+
+    cache.clear()
+    assert cache.entries() == []
+
+
+def test_transform_cache_eviction(tmp_path):
+    cache = TransformedBitstreamCache(str(tmp_path / "bitstreams"), max_size=250)
+    keys = [cache.key("{:064x}".format(i), 1, 0x7C, 32) for i in range(4)]
+
+    def add(key):
+        entry = cache.writer(key)
+        entry.write(bytes(100))
+        entry.commit()
+
+    now = time.time()
+    add(keys[0])
+    add(keys[1])
+    os.utime(cache._entry_path(keys[0]), (now - 20, now - 20))
+    os.utime(cache._entry_path(keys[1]), (now - 10, now - 10))
+    # a hit makes keys[0] the most recently used
+    cache.open(keys[0]).close()
+    add(keys[2])
+    remaining = {os.path.basename(e[0])[:-4] for e in cache.entries()}
+    assert remaining == {keys[0], keys[2]}
+
+    # too big to ever fit
+    entry = cache.writer(keys[3])
+    entry.write(bytes(300))
+    entry.commit()
+    assert cache.open(keys[3]) is None
+    assert not [name for name in os.listdir(cache.path) if name.endswith(".tmp")]
+
+
+def test_transform_cache_unusable_dir(tmp_path):
+    blocker = tmp_path / "blocker"
+    blocker.write_text("")
+    cache = TransformedBitstreamCache(str(blocker / "bitstreams"))
+    key = cache.key("ab" * 32, 1, 0x7C, 32)
+    with pytest.raises(OSError):
+        cache.path
+    assert cache.open(key) is None
+    assert cache.entries() == []
@@ -0,0 +1,111 @@
+import pytest
+import usb1
+
+# not handled by the simulated device, so a mailbox: reads return what was last written
+CMD = 0x60
+
+
+def stall_writes(sim, values):
+    """Makes writes of CMD with the given values stall"""
+    ctrl_write = sim.ctrl_write
+    def stalling(cmd, value, data):
+        if cmd == CMD and value in values:
+            raise usb1.USBErrorPipe()
+        return ctrl_write(cmd, value, data)
+    sim.ctrl_write = stalling
+
+
+def test_futures(sim_naeusb):
+    usb, sim = sim_naeusb()
+    writes = [usb.sendCtrlAsync(CMD, i, bytes([i, i])) for i in range(40)]
+    reads = [usb.readCtrlAsync(CMD, i, 2) for i in range(40)]
+    assert [f.result() for f in reads] == [bytearray([i, i]) for i in range(40)]
+    assert all(f.done() and f.result() is None for f in writes)
+    usb.flush()
+
+
+def test_in_order(sim_naeusb):
+    # queued reads see the writes queued before them, not after
+    usb, sim = sim_naeusb()
+    usb.sendCtrlAsync(CMD, 0, b"\x01")
+    first = usb.readCtrlAsync(CMD, 0, 1)
+    usb.sendCtrlAsync(CMD, 0, b"\x02")
+    second = usb.readCtrlAsync(CMD, 0, 1)
+    assert first.result() == bytearray(b"\x01")
+    assert second.result() == bytearray(b"\x02")
+
+
+def test_sync_waits_for_queue(sim_naeusb):
+    usb, sim = sim_naeusb()
+    for i in range(20):
+        usb.sendCtrlAsync(CMD, 0, bytes([i]))
+    assert usb.readCtrl(CMD, 0, 1) == bytearray([19])
+
+
+def test_error(sim_naeusb):
+    usb, sim = sim_naeusb()
+    stall_writes(sim, {1})
+    futures = [usb.sendCtrlAsync(CMD, i, b"\x01") for i in range(3)]
+    with pytest.raises(usb1.USBErrorPipe):
+        futures[1].result()
+    assert futures[0].exception() is None
+    assert futures[2].exception() is None
+    # already reported through the future
+    usb.flush()
+
+
+def test_error_flush(sim_naeusb):
+    usb, sim = sim_naeusb()
+    stall_writes(sim, {1, 2})
+    for i in range(4):
+        usb.sendCtrlAsync(CMD, i, b"\x01")
+    with pytest.raises(usb1.USBErrorPipe):
+        usb.flush()
+    # once
+    usb.flush()
+
+
+def test_error_next_transfer(sim_naeusb):
+    # or the next synchronous transfer raises it
+    usb, sim = sim_naeusb()
+    stall_writes(sim, {1})
+    usb.sendCtrlAsync(CMD, 1, b"\x01")
+    with pytest.raises(usb1.USBErrorPipe):
+        usb.readCtrl(CMD, 0, 1)
+    usb.readCtrl(CMD, 0, 1)
+
+
+def test_pipelined(sim_naeusb):
+    usb, sim = sim_naeusb(latency=0.0005)
+    sim.link.reset_stats()
+    for i in range(32):
+        usb.sendCtrl(CMD, i, b"\x01")
+    sync_time = sim.link.stats['usb_time']
+
+    sim.link.reset_stats()
+    with usb.pipelined():
+        for i in range(32):
+            usb.sendCtrl(CMD, i, b"\x02")
+    assert sim.link.stats['usb_time'] < sync_time / 4
+    assert usb.readCtrl(CMD, 31, 1) == bytearray(b"\x02")
+
+
+def test_pipelined_error(sim_naeusb):
+    usb, sim = sim_naeusb()
+    stall_writes(sim, {3})
+    with pytest.raises(usb1.USBErrorPipe):
+        with usb.pipelined():
+            for i in range(8):
+                usb.sendCtrl(CMD, i, b"\x01")
+    # everything else still went out
+    assert usb.readCtrl(CMD, 7, 1) == bytearray(b"\x01")
+
+
+def test_pipelined_exception(sim_naeusb):
+    # an exception in the block isn't replaced by a queued write's
+    usb, sim = sim_naeusb()
+    stall_writes(sim, {0})
+    with pytest.raises(KeyError):
+        with usb.pipelined():
+            usb.sendCtrl(CMD, 0, b"\x01")
+            raise KeyError()
@@ -0,0 +1,122 @@
+import pytest
+
+import chipwhisperer as cw
+from chipwhisperer.hardware.naeusb.bitstream_cache import bitstream_sha256, default_fingerprints
+from chipwhisperer.hardware.naeusb.naeusb_sim import NAEUSB_SimBackend, SimNAEUSBDevice
+
+REG_BUILDTIME = 0x10
+BUILDTIME = b"\x01\x02\x03\x04"
+
+
+def fpga_addr(reg):
+    # CW305 register addresses, as the simulated memory sees them
+    return reg << 7
+
+
+@pytest.fixture
+def board(tmp_path):
+    """A simulated CW305 with a REG_BUILDTIME, and a bitstream and defines file for it"""
+    bsfile = tmp_path / "design.bit"
+    bsfile.write_bytes(b"\xff" * 0x7C + bytes(range(256)) * 64)
+    defines = tmp_path / "defines.v"
+    defines.write_text("`define REG_BUILDTIME 'h{:x}\n".format(REG_BUILDTIME))
+    dev = SimNAEUSBDevice(pid=0xC305)
+    dev.mem.write(fpga_addr(REG_BUILDTIME), BUILDTIME)
+    targets = []
+
+    def connect(**kwargs):
+        """Connect a CW305 target to the board, returning (target, programmed)"""
+        kwargs.setdefault("defines_files", [str(defines)])
+        dev.fpga_bitstream_sha256 = None
+        target = cw.target(None, cw.targets.CW305, bsfile=str(bsfile),
+                           backend=NAEUSB_SimBackend(devices=[dev]), **kwargs)
+        targets.append(target)
+        return target, dev.fpga_bitstream_sha256 is not None
+
+    connect.dev = dev
+    connect.bsfile = bsfile
+    yield connect
+    for target in targets:
+        target.dis()
+
+
+def test_force_always_programs(board):
+    target, programmed = board(force=True)
+    assert programmed
+    entry = default_fingerprints().get(target._naeusb.snum)
+    assert entry["sha256"] == bitstream_sha256(board.bsfile)
+    assert entry["buildtime"] == BUILDTIME.hex()
+    target, programmed = board(force=True)
+    assert programmed
+
+
+def test_if_changed_skips_matching_bitstream(board):
+    board(force=True)
+    target, programmed = board(force='if_changed')
+    assert not programmed
+
+
+def test_if_changed_programs_other_bitstream(board, tmp_path):
+    board(force=True)
+    other = tmp_path / "other.bit"
+    other.write_bytes(b"\xff" * 0x7C + bytes(100))
+    board.dev.fpga_bitstream_sha256 = None
+    target = cw.target(None, cw.targets.CW305, bsfile=str(other), force='if_changed', slurp=False,
+                       backend=NAEUSB_SimBackend(devices=[board.dev]))
+    target.dis()
+    assert board.dev.fpga_bitstream_sha256 is not None
+
+
+def test_if_changed_checks_buildtime(board):
+    board(force=True)
+    board.dev.mem.write(fpga_addr(REG_BUILDTIME), b"\x09\x09\x09\x09")
+    target, programmed = board(force='if_changed')
+    assert programmed
+    assert default_fingerprints().get(target._naeusb.snum)["buildtime"] == "09090909"
+
+
+def test_if_changed_needs_reg_buildtime(board):
+    board(force=True)
+    target, programmed = board(force='if_changed', slurp=False)
+    assert programmed
+    # and without a build time on record it's programmed again next time too
+    target, programmed = board(force='if_changed', slurp=False)
+    assert programmed
+
+
+def test_if_changed_programs_unprogrammed_fpga(board):
+    board(force=True)
+    board.dev.fpga_programmed = False
+    target, programmed = board(force='if_changed')
+    assert programmed
+
+
+def test_fpga_program_forgets_fingerprint(board):
+    target, _ = board(force=True)
+    assert default_fingerprints().get(target._naeusb.snum) is not None
+    target.fpga.eraseFPGA()
+    assert default_fingerprints().get(target._naeusb.snum) is None
+
+
+def test_fpga_write_many(board):
+    target, _ = board(force=True)
+    writes = [(reg, bytes([reg]) * 4) for reg in range(0x20, 0x28)]
+    target.fpga_write_many(writes)
+    for reg, data in writes:
+        assert board.dev.mem.read(fpga_addr(reg), 4) == data
+    with pytest.raises(ValueError):
+        target.fpga_write_many([(0x20, b"\x01"), (0x21, b"")])
+
+
+def test_load_key_and_input(board, tmp_path):
+    defines = tmp_path / "crypt.v"
+    defines.write_text("`define REG_BUILDTIME 'h{:x}\n`define REG_CRYPT_KEY 'h0a\n"
+                       "`define REG_CRYPT_TEXTIN 'h06\n".format(REG_BUILDTIME))
+    target, _ = board(force=True, defines_files=[str(defines)])
+    key = bytearray(range(16))
+    text = bytearray(range(100, 116))
+    target.load_key_and_input(key, text)
+    assert target.key == key and target.input == text
+    # as loadEncryptionKey() then loadInput() write them
+    assert board.dev.mem.read(fpga_addr(0x0a), 16) == key[::-1]
+    assert board.dev.mem.read(fpga_addr(0x06), 16) == text[::-1]
@@ -0,0 +1,95 @@
+import logging
+
+import pytest
+
+from chipwhisperer.hardware.naeusb.naeusb import (CWFirmwareError, FeatureSet, SAM_FW_FEATURES,
+                                                  SAM_FW_FEATURE_BY_DEVICE, _check_sam_feature,
+                                                  parse_fw_version)
+
+
+def test_parse_fw_version():
+    assert parse_fw_version("0.66.0") == (0, 66, 0)
+    assert parse_fw_version("1.2") == (1, 2, 0)
+    assert parse_fw_version([0, 62, 1]) == (0, 62, 1)
+    assert parse_fw_version((1, 0)) == (1, 0, 0)
+    # compared as numbers, not strings
+    assert parse_fw_version("0.100.0") > parse_fw_version("0.66.0")
+
+
+def versions(prod_id):
+    """Firmware versions either side of every version a feature of prod_id needs"""
+    out = {(0, 0, 0), (99, 0, 0)}
+    for required in SAM_FW_FEATURE_BY_DEVICE[prod_id].values():
+        major, minor, debug = parse_fw_version(required)
+        out |= {(major, minor, debug), (major, minor + 1, 0), (major, max(minor - 1, 0), 0)}
+    return sorted(out)
+
+
+@pytest.mark.parametrize("prod_id", sorted(SAM_FW_FEATURE_BY_DEVICE))
+def test_feature_set(prod_id):
+    # the same answers as checking each feature's version
+    for fw in versions(prod_id):
+        features = FeatureSet(prod_id, fw)
+        assert features.known
+        for i, feature in enumerate(SAM_FW_FEATURES):
+            expected = _check_sam_feature(feature, ".".join(map(str, fw)), prod_id)
+            assert getattr(features, feature) is expected
+            assert features[feature] is expected
+            assert (feature in features) is expected
+            assert bool(features.bitmap & (1 << i)) is expected
+        assert list(features) == [f for f in SAM_FW_FEATURES if features[f]]
+
+
+def test_feature_set_unknown():
+    features = FeatureSet(0xC521, (1, 0, 0))
+    assert not features.known
+    assert features.bitmap == 0
+    assert list(features) == []
+    assert features.required("CDC") is None
+    assert "NOT_A_FEATURE" not in features
+    with pytest.raises(ValueError):
+        features["NOT_A_FEATURE"]
+
+
+def test_feature_set_read_only():
+    features = FeatureSet(0xACE2, (0, 64, 0))
+    with pytest.raises(AttributeError):
+        features.CDC = True
+
+
+def test_check_feature(sim_naeusb):
+    usb, sim = sim_naeusb(pid=0xACE2)
+    assert usb.check_feature("CDC")
+    assert usb.feature_list() == list(usb.features)
+    assert "CDC" in usb.feature_list()
+
+
+def test_check_feature_old_firmware(sim_naeusb):
+    required = SAM_FW_FEATURE_BY_DEVICE[0xACE2]["CDC"]
+    major, minor, debug = parse_fw_version(required)
+    usb, sim = sim_naeusb(pid=0xACE2, fw_version=(major, minor - 1, 0))
+    assert not usb.check_feature("CDC")
+    with pytest.raises(CWFirmwareError, match=required):
+        usb.check_feature("CDC", raise_exception=True)
+
+
+def test_check_feature_never_available(sim_naeusb):
+    usb, sim = sim_naeusb(pid=0xACE2)
+    missing = next(f for f in SAM_FW_FEATURES if f not in SAM_FW_FEATURE_BY_DEVICE[0xACE2])
+    assert not usb.check_feature(missing)
+    with pytest.raises(CWFirmwareError, match="on this device"):
+        usb.check_feature(missing, raise_exception=True)
+
+
+def test_check_feature_unknown(sim_naeusb, caplog):
+    usb, sim = sim_naeusb(pid=0xACE2)
+    with caplog.at_level(logging.WARNING, logger="ChipWhisperer NAEUSB"):
+        assert usb.check_feature("NOT_A_FEATURE") is False
+    assert "Unknown feature" in caplog.text
+
+
+def test_check_feature_unknown_device(sim_naeusb, caplog):
+    usb, sim = sim_naeusb(pid=0xC521)
+    with caplog.at_level(logging.WARNING, logger="ChipWhisperer NAEUSB"):
+        assert usb.check_feature("CDC") is False
+    assert "not stored" in caplog.text
@@ -0,0 +1,174 @@
+import hashlib
+import io
+import os
+import threading
+
+import pytest
+
+from chipwhisperer.hardware.firmware.fwstore import FirmwareStore, write_store
+from chipwhisperer.hardware.naeusb import fpga as fpga_module
+from chipwhisperer.hardware.naeusb.bitstream_cache import default_transform_cache
+from chipwhisperer.hardware.naeusb.fpga import FPGA
+
+# a few chunks' worth, not a whole number of them
+DATA = bytes((i * 37 + (i >> 8)) & 0xFF for i in range(2 * FPGA.PROG_CHUNK_SIZE + 1000))
+
+
+def sent(data, starting_offset=0x7C, bitorder=FPGA.BITORDER_DEFAULT):
+    """What the FPGA should receive for data, worked out as the old download code did"""
+    out = bytearray(data + b"\xff" * 32)[starting_offset:]
+    if bitorder != FPGA.BITORDER_DEFAULT:
+        out = bytearray(int("{:08b}".format(b)[::-1], 2) for b in out)
+    if bitorder == FPGA.BITORDER_REVERSE16:
+        out[0::2], out[1::2] = out[1::2], out[0::2]
+    return bytes(out)
+
+
+class ReadOnly(io.RawIOBase):
+    """File-like object that can only be read, like a pipe"""
+    def __init__(self, data):
+        self._f = io.BytesIO(data)
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        return self._f.readinto(b)
+
+
+@pytest.fixture
+def fpga(sim_cw305):
+    usb, sim = sim_cw305
+    chunks = []
+    write = usb.writeBulkEP
+    def record(data, *args, **kwargs):
+        chunks.append(len(data))
+        return write(data, *args, **kwargs)
+    usb.writeBulkEP = record
+    fpga = FPGA(usb)
+    fpga.sim = sim
+    fpga.chunks = chunks
+    return fpga
+
+
+def program(fpga, bitstream, **kwargs):
+    fpga.sim.fpga_bitstream_sha256 = None
+    assert fpga.FPGAProgram(bitstream, **kwargs)
+    return fpga.sim.fpga_bitstream_sha256
+
+
+@pytest.mark.parametrize("source", ["bytes", "bytearray", "memoryview", "BytesIO", "file", "read only"])
+def test_sources(fpga, tmp_path, source):
+    path = tmp_path / "design.bit"
+    path.write_bytes(DATA)
+    bitstream = {
+        "bytes": lambda: DATA,
+        "bytearray": lambda: bytearray(DATA),
+        "memoryview": lambda: memoryview(DATA),
+        "BytesIO": lambda: io.BytesIO(DATA),
+        "file": lambda: open(path, "rb"),
+        "read only": lambda: ReadOnly(DATA),
+    }[source]()
+    assert program(fpga, bitstream) == hashlib.sha256(sent(DATA)).hexdigest()
+    assert sum(fpga.chunks) == len(sent(DATA))
+    assert all(n == FPGA.PROG_CHUNK_SIZE for n in fpga.chunks[:-1])
+    if hasattr(bitstream, "closed"):
+        assert bitstream.closed
+
+
+def test_store_blob(fpga, tmp_path):
+    path = str(tmp_path / "test.cwfw")
+    write_store(path, {"test": {"fwver": [1, 0], "items": {"design.bit": DATA}}})
+    blob = FirmwareStore(path).open("test", "design.bit")
+    assert program(fpga, blob) == hashlib.sha256(sent(DATA)).hexdigest()
+
+
+def test_starting_offset(fpga):
+    assert program(fpga, DATA, starting_offset=0) == hashlib.sha256(sent(DATA, 0)).hexdigest()
+
+
+def test_short_bitstream(fpga):
+    data = DATA[:0x7C + 10]
+    assert program(fpga, data) == hashlib.sha256(sent(data)).hexdigest()
+    assert fpga.chunks == [10 + 32]
+
+
+@pytest.mark.parametrize("bitorder", [FPGA.BITORDER_REVERSE, FPGA.BITORDER_REVERSE16])
+def test_parallel_modes(fpga, bitorder):
+    expected = hashlib.sha256(sent(DATA, bitorder=bitorder)).hexdigest()
+    assert program(fpga, DATA, prog_mode=bitorder) == expected
+    assert program(fpga, io.BytesIO(DATA), prog_mode=bitorder) == expected
+
+
+def test_prefetch_closed_early():
+    # the worker has to give up on its last put once the consumer stops
+    exhausted = threading.Event()
+    def items():
+        yield from range(2)
+        exhausted.set()
+    chunks = fpga_module._prefetch(items(), depth=1)
+    assert next(chunks) == 0
+    assert exhausted.wait(5)
+    closer = threading.Thread(target=chunks.close, daemon=True)
+    closer.start()
+    closer.join(5)
+    assert not closer.is_alive()
+
+
+@pytest.fixture
+def transforms(monkeypatch):
+    """Counts the chunks bit reversed for the parallel modes"""
+    count = [0]
+    transform = fpga_module._transform_bitorder
+    def counted(chunk, bitorder):
+        count[0] += 1
+        return transform(chunk, bitorder)
+    monkeypatch.setattr(fpga_module, "_transform_bitorder", counted)
+    return count
+
+
+@pytest.mark.parametrize("bitorder", [FPGA.BITORDER_REVERSE, FPGA.BITORDER_REVERSE16])
+def test_transform_cache(fpga, transforms, bitorder):
+    cache = default_transform_cache()
+    expected = hashlib.sha256(sent(DATA, bitorder=bitorder)).hexdigest()
+    assert program(fpga, DATA, prog_mode=bitorder) == expected
+    assert transforms[0] == 3
+    assert len(cache.entries()) == 1
+
+    # sent from the cache, without transforming it again
+    assert program(fpga, io.BytesIO(DATA), prog_mode=bitorder) == expected
+    assert transforms[0] == 3
+    assert len(cache.entries()) == 1
+
+    # a different starting offset is a different entry
+    assert program(fpga, DATA, prog_mode=bitorder, starting_offset=0) == \
+        hashlib.sha256(sent(DATA, 0, bitorder)).hexdigest()
+    assert len(cache.entries()) == 2
+
+
+def test_transform_cache_serial_mode(fpga, transforms):
+    program(fpga, DATA)
+    assert transforms[0] == 0
+    assert default_transform_cache().entries() == []
+
+
+def test_transform_cache_disabled(sim_cw305, transforms):
+    usb, sim = sim_cw305
+    fpga = FPGA(usb, transform_cache=None)
+    for _ in range(2):
+        assert fpga.FPGAProgram(DATA, prog_mode=FPGA.BITORDER_REVERSE)
+        assert sim.fpga_bitstream_sha256 == hashlib.sha256(sent(DATA, bitorder=FPGA.BITORDER_REVERSE)).hexdigest()
+    assert transforms[0] == 6
+    assert default_transform_cache().entries() == []
+
+
+def test_transform_cache_corrupt_entry_not_kept(fpga, transforms, monkeypatch):
+    # an error part way through leaves nothing behind in the cache
+    def fail(data, *args, **kwargs):
+        raise IOError("unplugged")
+    monkeypatch.setattr(fpga._usb, "writeBulkEP", fail)
+    with pytest.raises(IOError):
+        fpga.FPGAProgram(DATA, prog_mode=FPGA.BITORDER_REVERSE)
+    cache = default_transform_cache()
+    assert cache.entries() == []
+    assert os.listdir(cache.path) == []
@@ -0,0 +1,96 @@
+import hashlib
+
+import pytest
+
+from chipwhisperer.hardware.firmware import fwstore
+from chipwhisperer.hardware.firmware.fwstore import FirmwareStore, default_store, read_modules, write_store
+
+# SHA-256 of the images in the generated base64 modules the store replaced
+BUNDLED_SHA256 = {
+    ("cw305", "SAM3U_CW305.bin"): "54e12f2687d9dceacc9dbb49aecb04307e3208871eed3d814357d47ceb3bcf78",
+    ("cwlite", "SAM3U_CW1173.bin"): "8fd414cb1199b32c717b81614e59ae05adc325cf208f8b902f1f95900e610fe3",
+    ("cwnano", "SAM3U_CWNANO.bin"): "81dcfe47ab267c7d953ed5d0ca9f27cdebf4d5d996b9d1b89b462c700bd5120f",
+}
+
+MODULES = {
+    "a": {"fwver": [1, 2], "items": {"one.bin": b"\x01" * 100, "empty.bin": b""}},
+    "b": {"fwver": None, "items": {"two.bit": bytes(range(256)) * 3}},
+}
+
+
+def test_bundled_store():
+    store = default_store()
+    assert store.verify()
+    for (module, name), digest in BUNDLED_SHA256.items():
+        assert store.sha256(module, name) == digest
+        assert hashlib.sha256(store.get(module, name)).hexdigest() == digest
+        assert store.find_sha256(digest) == (module, name)
+    assert store.fwver("cw305") == (0, 11)
+    assert store.fwver("nope") is None
+
+
+def test_round_trip(tmp_path):
+    path = str(tmp_path / "test.cwfw")
+    write_store(path, MODULES)
+    store = FirmwareStore(path)
+    assert store.verify()
+    assert read_modules(path) == MODULES
+    assert store.fwver("a") == (1, 2)
+    assert store.fwver("b") is None
+    assert sorted(store.names("a")) == ["empty.bin", "one.bin"]
+    for module, info in MODULES.items():
+        for name, data in info["items"].items():
+            assert store.get(module, name) == data
+            assert store.getsome(module, name, filelike=False) == data
+            assert store.get(module, name).obj is store.get(module, name).obj
+            # blobs are aligned within the file
+            assert store.modules[module]["items"][name]["offset"] % fwstore.STORE_ALIGN == 0
+    with pytest.raises(KeyError):
+        store.get("a", "missing.bin")
+
+
+def test_verify_detects_corruption(tmp_path):
+    path = str(tmp_path / "test.cwfw")
+    write_store(path, MODULES)
+    offset = FirmwareStore(path).modules["b"]["items"]["two.bit"]["offset"]
+    with open(path, "r+b") as f:
+        f.seek(offset + 10)
+        f.write(b"\xff")
+    assert not FirmwareStore(path).verify()
+
+
+def test_not_a_store(tmp_path):
+    path = tmp_path / "junk.cwfw"
+    path.write_bytes(b"\x00" * 64)
+    with pytest.raises(IOError):
+        FirmwareStore(str(path))
+
+
+def test_blob_reader(tmp_path):
+    path = str(tmp_path / "test.cwfw")
+    write_store(path, MODULES)
+    data = MODULES["b"]["items"]["two.bit"]
+    f = FirmwareStore(path).open("b", "two.bit")
+    assert len(f) == len(data)
+    assert f.getbuffer() == data
+    assert f.read(10) == data[:10]
+    assert f.tell() == 10
+    buf = bytearray(20)
+    assert f.readinto(buf) == 20
+    assert buf == data[10:30]
+    f.seek(-5, 2)
+    assert f.read() == data[-5:]
+    assert f.read() == b""
+    f.seek(0)
+    assert f.read() == data
+
+
+def test_main_adds_module(tmp_path):
+    path = str(tmp_path / "test.cwfw")
+    write_store(path, MODULES)
+    blob = tmp_path / "new.bin"
+    blob.write_bytes(b"new firmware")
+    fwstore.main(["c", "3.4", str(blob), "--store", path])
+    modules = read_modules(path)
+    assert modules["c"] == {"fwver": [3, 4], "items": {"new.bin": b"new firmware"}}
+    assert modules["a"] == MODULES["a"]
@@ -0,0 +1,130 @@
+import importlib
+import logging
+
+import pytest
+
+from chipwhisperer.logging import naeusb_logger, tracing
+
+# chipwhisperer's "from .logging import *" leaves the attribute as the standard logging module
+cwlogging = importlib.import_module("chipwhisperer.logging")
+
+
+@pytest.fixture
+def log_level():
+    """Function setting naeusb_logger's level for the test"""
+    level = naeusb_logger.level
+    yield naeusb_logger.setLevel
+    naeusb_logger.setLevel(level)
+
+
+@pytest.fixture
+def debug_calls(monkeypatch):
+    """Messages naeusb_logger.debug() was called with"""
+    calls = []
+    monkeypatch.setattr(naeusb_logger, "debug", lambda msg, *args, **kwargs: calls.append(msg))
+    return calls
+
+
+def test_tracing(log_level, monkeypatch):
+    log_level(logging.WARNING)
+    assert not tracing(naeusb_logger)
+    log_level(logging.DEBUG)
+    assert tracing(naeusb_logger)
+    monkeypatch.setattr(cwlogging, "hot_path_tracing", True)
+    cwlogging.set_hot_path_tracing(False)
+    assert not tracing(naeusb_logger)
+    cwlogging.set_hot_path_tracing(True)
+    assert tracing(naeusb_logger)
+
+
+def test_hot_path(sim_naeusb, log_level, debug_calls, monkeypatch):
+    usb, sim = sim_naeusb()
+    log_level(logging.DEBUG)
+    usb.cmdReadMem(0x100, 64)
+    assert any("FPGA_READ" in msg for msg in debug_calls)
+
+    # nothing is even formatted with debug off
+    del debug_calls[:]
+    log_level(logging.INFO)
+    usb.cmdReadMem(0x100, 64)
+    usb.cmdWriteMem(0x100, bytearray(64))
+    assert debug_calls == []
+
+    # or with the traces switched off
+    monkeypatch.setattr(cwlogging, "hot_path_tracing", False)
+    log_level(logging.DEBUG)
+    usb.cmdReadMem(0x100, 64)
+    usb.cmdWriteMem(0x100, bytearray(64))
+    assert debug_calls == []
+
+
+def test_exported():
+    import chipwhisperer as cw
+    assert cw.set_hot_path_tracing is cwlogging.set_hot_path_tracing
+
+
+@pytest.fixture
+def log_files(tmp_path, monkeypatch):
+    """Directory the log files go to for the test"""
+    cwlogging.flush_log_files()
+    monkeypatch.setattr(cwlogging, "_log_dir", str(tmp_path))
+    monkeypatch.setattr(cwlogging, "_opened_files", set())
+    monkeypatch.setattr(cwlogging, "_file_logging", True)
+    yield tmp_path / "chipwhisperer" / "logs"
+    cwlogging.flush_log_files()
+
+
+class Message:
+    """Log message counting how often it's formatted"""
+    def __init__(self):
+        self.formatted = 0
+
+    def __str__(self):
+        self.formatted += 1
+        return "counted message"
+
+
+def file_record(msg):
+    return logging.LogRecord(naeusb_logger.name, logging.WARNING, __file__, 1, msg, None, None)
+
+
+def test_no_files_on_import():
+    import subprocess
+    import sys
+    code = "import sys, chipwhisperer; assert sys.modules['chipwhisperer.logging']._log_dir is None"
+    subprocess.check_call([sys.executable, "-c", code])
+
+
+def test_file_logging(log_files):
+    naeusb_logger.warning("written to the file")
+    cwlogging.flush_log_files()
+    text = (log_files / (naeusb_logger.name + ".log")).read_text()
+    assert "written to the file" in text
+
+    # reopened and appended to by the next record
+    naeusb_logger.warning("and this too")
+    cwlogging.flush_log_files()
+    text = (log_files / (naeusb_logger.name + ".log")).read_text()
+    assert "written to the file" in text
+    assert "and this too" in text
+
+
+def test_file_logging_off(log_files, monkeypatch):
+    cwlogging.set_file_logging(False)
+    msg = Message()
+    naeusb_logger.handlers[1].handle(file_record(msg))
+    cwlogging.flush_log_files()
+    assert msg.formatted == 0
+    assert not log_files.exists()
+
+    cwlogging.set_file_logging(True)
+    msg = Message()
+    naeusb_logger.handlers[1].handle(file_record(msg))
+    cwlogging.flush_log_files()
+    assert msg.formatted == 1
+    assert "counted message" in (log_files / (naeusb_logger.name + ".log")).read_text()
+
+
+def test_log_dir(log_files):
+    assert cwlogging.log_dir == cwlogging.get_log_dir()
+    assert log_files.is_dir()
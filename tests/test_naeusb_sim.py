@@ -0,0 +1,59 @@
+import pytest
+
+from chipwhisperer.hardware.naeusb.naeusb import NAEUSB
+from chipwhisperer.hardware.naeusb.naeusb_sim import NAEUSB_SimBackend, SimNAEUSBDevice
+from chipwhisperer.hardware.naeusb.serial import USART
+
+
+def test_fw_version(sim_naeusb):
+    usb, sim = sim_naeusb(fw_version=(0, 64, 0))
+    assert tuple(usb.readFwVersion()[:3]) == (0, 64, 0)
+
+
+@pytest.mark.parametrize("dlen", [4, 48, 1000, 5000])
+def test_mem_round_trip(sim_naeusb, dlen):
+    usb, sim = sim_naeusb()
+    data = bytes((i * 7) & 0xFF for i in range(dlen))
+    usb.cmdWriteMem(0x1000, data)
+    assert bytes(sim.mem.read(0x1000, dlen)) == data
+    assert bytes(usb.cmdReadMem(0x1000, dlen)) == data
+
+
+def test_usart_loopback(sim_naeusb):
+    usb, sim = sim_naeusb()
+    usart = USART(usb)
+    usart.init(38400)
+    usart.write(b"hello")
+    assert usart.inWaiting() == 5
+    assert bytes(usart.read(5)) == b"hello"
+
+
+def test_usart_handler(sim_naeusb):
+    usb, sim = sim_naeusb(usart_handler=lambda num, data: data.upper())
+    usart = USART(usb)
+    usart.init()
+    usart.write(b"abc")
+    assert bytes(usart.read(3)) == b"ABC"
+
+
+def test_link_model(sim_naeusb):
+    usb, sim = sim_naeusb(latency=1E-3, bandwidth=1E6)
+    sim.link.reset_stats()
+    usb.cmdWriteMem(0x10, bytes(8))
+    stats = sim.link.stats
+    assert stats['ctrl_out'] == 1
+    assert stats['usb_time'] >= 1E-3
+
+
+def test_select_by_serial_number():
+    devices = [SimNAEUSBDevice(pid=0xACE2, serial_number="SIM{}".format(i), address=i + 1)
+               for i in range(2)]
+    usb = NAEUSB(backend=NAEUSB_SimBackend(devices=devices))
+    try:
+        usb.con(idProduct=[0xACE2], serial_number="SIM1")
+        assert usb.usbtx.sim is devices[1]
+        usb.cmdWriteMem(0x20, b"\x55")
+        assert bytes(devices[1].mem.read(0x20, 1)) == b"\x55"
+        assert bytes(devices[0].mem.read(0x20, 1)) == b"\x00"
+    finally:
+        usb.close()
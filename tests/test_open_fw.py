@@ -0,0 +1,39 @@
+import subprocess
+import sys
+
+import pytest
+
+from chipwhisperer.hardware.firmware import open_fw
+from chipwhisperer.hardware.firmware import cw305 as fw_cw305
+
+
+def test_fwver():
+    assert open_fw.fwver("cw305") == "{}.{}.0".format(*fw_cw305.fwver)
+    assert open_fw.fwver("cw310") == open_fw.fwver("cwbergen")
+    assert open_fw.fwver("nope") is None
+
+
+def test_blobs():
+    expected = fw_cw305.getsome("SAM3U_CW305.bin", filelike=False)
+    assert len(expected) > 0
+    assert open_fw.mcufw("cw305", filelike=False) == expected
+    assert open_fw.mcufw("cw305").read() == expected
+    assert open_fw.getsome_generator("cw305")("SAM3U_CW305.bin", filelike=False) == expected
+
+
+def test_unknown_hw_type():
+    with pytest.raises(ValueError):
+        open_fw.getsome_generator("nope")
+    with pytest.raises(ValueError):
+        open_fw.mcufw("nope")
+
+
+def test_blob_modules_not_imported():
+    # in a fresh interpreter, as any other test may already have loaded them
+    code = ("import sys, chipwhisperer\n"
+            "from chipwhisperer.hardware.firmware.open_fw import fwver\n"
+            "fwver('cwhusky'); fwver('cwlite')\n"
+            "fw = 'chipwhisperer.hardware.firmware.'\n"
+            "print([m for m in sys.modules if m in (fw + 'cwhusky', fw + 'cwlite', fw + 'cw1200', fw + 'cwnano')])\n")
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert out.strip() == "[]"
@@ -0,0 +1,312 @@
+import math
+import random
+
+import pytest
+
+from chipwhisperer.hardware.naeusb import pll_cdce906
+from chipwhisperer.hardware.naeusb.pll_cdce906 import PLLCDCE906
+
+REF_FREQ = 12E6
+
+
+def old_calc_mul_div(freqdesired, freqsource):
+    """The exhaustive search calcMulDiv used to do, which returned the first exact match"""
+    maxoutdiv = min(int(math.floor(300E6 / freqdesired)), 127)
+    minoutdiv = int(math.ceil(80E6 / freqdesired))
+    for outdiv in range(minoutdiv, maxoutdiv + 1):
+        fvco = freqdesired * outdiv
+        for N in range(1, 4096):
+            for M in range(1, 512):
+                if fvco == (freqsource * N) / M:
+                    return (N, M, outdiv)
+    return None
+
+
+def output_error(freqdesired, freqsource, settings):
+    N, M, outdiv = settings
+    return abs(freqdesired - freqsource * N / M / outdiv)
+
+
+@pytest.fixture
+def pll(sim_cw305):
+    usb, sim = sim_cw305
+    return PLLCDCE906(usb, REF_FREQ)
+
+
+@pytest.mark.parametrize("freq", [1E6, 5E6, 7.5E6, 10E6, 12E6, 25E6, 33E6, 48E6, 100E6, 150E6])
+def test_exact_frequencies(pll, freq):
+    assert pll.calcMulDiv(freq, REF_FREQ) == old_calc_mul_div(freq, REF_FREQ)
+
+
+@pytest.mark.parametrize("freq", [7.3728E6, 33.333E6, 49.152E6, 123.4567E6])
+def test_best_error(pll, freq):
+    np = pytest.importorskip("numpy")
+    N, M, outdiv = pll.calcMulDiv(freq, REF_FREQ)
+    assert 80E6 <= REF_FREQ * N / M <= 300E6
+    # every N and M for every usable outdiv
+    n = np.arange(1, 4096, dtype=np.float64)[:, None]
+    m = np.arange(1, 512, dtype=np.float64)[None, :]
+    fvco = REF_FREQ * n / m
+    best = np.inf
+    for d in range(int(math.ceil(80E6 / freq)), min(int(300E6 / freq), 127) + 1):
+        err = np.abs(freq - fvco / d)
+        err[(fvco < 80E6) | (fvco > 300E6)] = np.inf
+        best = min(best, err.min())
+    assert output_error(freq, REF_FREQ, (N, M, outdiv)) == pytest.approx(best, rel=1E-9, abs=1E-6)
+
+
+def test_without_numpy(pll, monkeypatch):
+    pytest.importorskip("numpy")
+    rng = random.Random(1)
+    freqs = [rng.uniform(0.7E6, 160E6) for _ in range(100)] + [10E6, 7.3728E6]
+    expected = [pll.calcMulDiv(f, REF_FREQ) for f in freqs]
+    monkeypatch.setattr(pll_cdce906, "np", None)
+    assert [pll.calcMulDiv(f, REF_FREQ) for f in freqs] == expected
+
+
+def test_out_of_range(pll):
+    assert pll.calcMulDiv(400E6, REF_FREQ) == (0, 0, 0)
+
+
+# includes frequencies needing N > 255, whose high bits share register 6 with the mode bits
+SWEEP = {1: [1E6 + i * 3.3E6 for i in range(40)], 2: [2E6 + i * 3.3E6 for i in range(40)]}
+
+
+@pytest.fixture
+def plls(sim_naeusb):
+    """Two PLLs on separate simulated CW305s, set up the same way, as (pll, sim) pairs"""
+    pairs = []
+    for _ in range(2):
+        usb, sim = sim_naeusb(pid=0xC305)
+        pll = PLLCDCE906(usb, REF_FREQ)
+        pll.cdce906init()
+        pairs.append((pll, sim))
+    return pairs
+
+
+@pytest.mark.parametrize("outnums", [(1,), (2,), (1, 2)])
+def test_sweep_matches_outfreq_set(plls, outnums):
+    (pll, sim), (ref, ref_sim) = plls
+    sweep = pll.plan_sweep({o: SWEEP[o] for o in outnums}, cache=None)
+    for i, step in enumerate(sweep):
+        for o in outnums:
+            ref.pll_outfreq_set(SWEEP[o][i], o)
+        assert sim.pll_regs == ref_sim.pll_regs, "step {}".format(i)
+        if len(outnums) == 1:
+            assert step == SWEEP[outnums[0]][i]
+        else:
+            assert step == {o: SWEEP[o][i] for o in outnums}
+
+
+def test_sweep_steps(pll):
+    sweep = pll.plan_sweep(range(int(5E6), int(10E6), int(1E6)), 1, cache=None)
+    assert len(sweep) == 5
+    assert sweep[2] == {1: 7E6}
+    assert sweep.settings[2] == {1: pll.calcMulDiv(7E6, REF_FREQ)}
+    sweep.apply(3)
+    assert pll.pllread(1) == pll.calcMulDiv(8E6, REF_FREQ)
+
+
+def test_plan_sweep_errors(pll):
+    with pytest.raises(ValueError):
+        pll.plan_sweep([10E6])
+    with pytest.raises(ValueError):
+        pll.plan_sweep({1: [10E6, 20E6], 2: [10E6]})
+    with pytest.raises(ValueError):
+        pll.plan_sweep([10E6, 200E6], 1)
+    with pytest.raises(ValueError):
+        pll.plan_sweep([10E6], 3)
+    with pytest.raises(ValueError):
+        pll.plan_sweep({})
+
+
+def test_settings_cache(tmp_path):
+    path = str(tmp_path / "pll.json")
+    calls = []
+    def calc(freq):
+        calls.append(freq)
+        return (int(freq), 1, 2)
+    cache = pll_cdce906.PLLSettingsCache(path)
+    assert cache.lookup(12E6, [1E6, 2E6], calc) == [(1000000, 1, 2), (2000000, 1, 2)]
+    assert cache.lookup(12E6, [2E6, 3E6], calc) == [(2000000, 1, 2), (3000000, 1, 2)]
+    assert calls == [1E6, 2E6, 3E6]
+    # saved for next time, per reference frequency
+    cache = pll_cdce906.PLLSettingsCache(path)
+    assert cache.lookup(12E6, [3E6], calc) == [(3000000, 1, 2)]
+    assert calls == [1E6, 2E6, 3E6]
+    cache.lookup(10E6, [3E6], calc)
+    assert calls == [1E6, 2E6, 3E6, 3E6]
+
+
+def test_settings_cache_unusable_dir(tmp_path):
+    blocker = tmp_path / "blocker"
+    blocker.write_text("")
+    cache = pll_cdce906.PLLSettingsCache(str(blocker / "pll.json"))
+    assert cache.lookup(12E6, [1E6], lambda f: (1, 2, 3)) == [(1, 2, 3)]
+
+
+def test_plan_sweep_cache(pll, cache_dir, monkeypatch):
+    calls = []
+    calc = pll.calcMulDiv
+    def counted(freq, ref):
+        calls.append(freq)
+        return calc(freq, ref)
+    monkeypatch.setattr(pll, "calcMulDiv", counted)
+    freqs = [5E6 + i * 1E6 for i in range(10)]
+    first = pll.plan_sweep(freqs, 1)
+    assert len(calls) == 10
+    second = pll.plan_sweep(freqs, 1)
+    assert len(calls) == 10
+    assert second.settings == first.settings
+    assert (cache_dir / "pll_cdce906.json").exists()
+
+
+def chip_log(sim):
+    """List that gets ('r', addr) or ('w', addr, data) for each CDCE906 access the device sees"""
+    log = []
+    ctrl_write = sim.ctrl_write
+    def logged(cmd, value, data):
+        if cmd == 0x30:
+            data = bytes(data)
+            log.append(('w', data[1], data[2]) if data[0] == 0x01 else ('r', data[1]))
+        return ctrl_write(cmd, value, data)
+    sim.ctrl_write = logged
+    return log
+
+
+def accesses(log, kind):
+    return [entry for entry in log if entry[0] == kind]
+
+
+@pytest.mark.parametrize("shadow", [True, False])
+def test_shadow_reads_and_writes(sim_cw305, shadow):
+    usb, sim = sim_cw305
+    pll = PLLCDCE906(usb, REF_FREQ, shadow=shadow)
+    log = chip_log(sim)
+    sim.pll_regs[5] = 0x42
+    assert pll.cdce906read(5) == 0x42
+    assert pll.cdce906read(5) == 0x42
+    pll.cdce906write(5, 0x43)
+    pll.cdce906write(5, 0x43)
+    assert pll.cdce906read(5) == 0x43
+    assert sim.pll_regs[5] == 0x43
+    if shadow:
+        assert log == [('r', 5), ('w', 5, 0x43)]
+    else:
+        assert log == [('r', 5), ('r', 5), ('w', 5, 0x43), ('w', 5, 0x43), ('r', 5)]
+
+
+def test_shadow_volatile_register(sim_cw305):
+    usb, sim = sim_cw305
+    pll = PLLCDCE906(usb, REF_FREQ)
+    log = chip_log(sim)
+    sim.pll_regs[24] = 0x80
+    assert pll.cdce906read(24) == 0x80
+    sim.pll_regs[24] = 0x00
+    assert pll.cdce906read(24) == 0x00
+    assert log == [('r', 24), ('r', 24)]
+
+
+def test_invalidate(sim_cw305):
+    usb, sim = sim_cw305
+    pll = PLLCDCE906(usb, REF_FREQ)
+    pll.cdce906read(5)
+    sim.pll_regs[5] = 0x99
+    assert pll.cdce906read(5) != 0x99
+    pll.invalidate()
+    assert pll.cdce906read(5) == 0x99
+
+
+def test_batch(sim_cw305):
+    usb, sim = sim_cw305
+    pll = PLLCDCE906(usb, REF_FREQ)
+    pll.cdce906read(5)
+    pll.cdce906read(6)
+    log = chip_log(sim)
+    with pll.batch():
+        pll.cdce906write(5, 1)
+        with pll.batch():
+            pll.cdce906write(5, 2)
+            pll.cdce906write(6, 3)
+        assert log == []
+        assert pll.cdce906read(5) == 2
+        pll.cdce906write(5, 4)
+    assert sorted(accesses(log, 'w')) == [('w', 5, 4), ('w', 6, 3)]
+    assert accesses(log, 'r') == []
+    assert sim.pll_regs[5] == 4 and sim.pll_regs[6] == 3
+
+
+def test_batch_failed_write(sim_cw305):
+    # from the first write the chip didn't take, the rest are written again one at a time
+    usb, sim = sim_cw305
+    pll = PLLCDCE906(usb, REF_FREQ)
+    for addr in range(1, 6):
+        pll.cdce906read(addr)
+    log = chip_log(sim)
+    statuses = [0]
+    ctrl_read = sim.ctrl_read
+    def failing(cmd, value, dlen):
+        resp = ctrl_read(cmd, value, dlen)
+        if cmd == 0x30:
+            statuses[0] += 1
+            if statuses[0] == 3:
+                return bytes([1]) + bytes(resp[1:])
+        return resp
+    sim.ctrl_read = failing
+    with pll.batch():
+        for addr in range(1, 6):
+            pll.cdce906write(addr, 0x10 + addr)
+    writes = accesses(log, 'w')
+    assert writes == [('w', a, 0x10 + a) for a in range(1, 6)] + [('w', a, 0x10 + a) for a in range(3, 6)]
+    assert sim.pll_regs[1:6] == bytes(0x10 + a for a in range(1, 6))
+
+@pytest.mark.parametrize("freq", [7.3728E6, 25E6, 100E6])
+def test_outfreq_set_with_and_without_shadow(sim_naeusb, freq):
+    regs = []
+    for shadow in (True, False):
+        usb, sim = sim_naeusb(pid=0xC305)
+        pll = PLLCDCE906(usb, REF_FREQ, shadow=shadow)
+        pll.cdce906init()
+        pll.pll_outfreq_set(10E6, 1)
+        pll.pll_outfreq_set(freq, 1)
+        pll.pll_outfreq_set(freq, 2)
+        regs.append(bytes(sim.pll_regs))
+    assert regs[0] == regs[1]
+
+
+@pytest.mark.parametrize("shadow", [True, False])
+def test_sweep_register_traffic(sim_cw305, shadow):
+    usb, sim = sim_cw305
+    pll = PLLCDCE906(usb, REF_FREQ, shadow=shadow)
+    pll.cdce906init()
+    sweep = pll.plan_sweep({1: SWEEP[1][:10]}, cache=None)
+    log = chip_log(sim)
+    list(sweep)
+    del log[:]
+    list(sweep)
+    # only what changes from one step to the next, starting from the last step
+    changed = sum(1 for i in range(len(sweep))
+                  for addr, (mask, value) in sweep.registers[i].items()
+                  if sweep.registers[i - 1][addr] != (mask, value))
+    assert accesses(log, 'r') == []
+    assert len(accesses(log, 'w')) == changed
+
+    # reset() goes back to the chip for the shared registers
+    sweep.reset()
+    del log[:]
+    sweep.apply(0)
+    assert accesses(log, 'r')
+
+
+def test_sweep_same_writes_with_and_without_shadow(sim_naeusb):
+    writes = []
+    for shadow in (True, False):
+        usb, sim = sim_naeusb(pid=0xC305)
+        pll = PLLCDCE906(usb, REF_FREQ, shadow=shadow)
+        pll.cdce906init()
+        sweep = pll.plan_sweep({1: SWEEP[1], 2: SWEEP[2]}, cache=None)
+        list(sweep)
+        log = chip_log(sim)
+        list(sweep)
+        writes.append(sorted(accesses(log, 'w')))
+    assert writes[0] == writes[1]
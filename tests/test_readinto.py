@@ -0,0 +1,140 @@
+import threading
+
+import pytest
+
+from chipwhisperer.common.utils import util
+from chipwhisperer.common.utils.util import BufferPool
+from chipwhisperer.hardware.naeusb.naeusb import NAEUSB_CTRL_IO_THRESHOLD
+from chipwhisperer.hardware.naeusb.serial import USART
+from chipwhisperer.hardware.naeusb.spi import SPI
+
+
+def pattern(n):
+    return bytes((i * 7 + 3) & 0xFF for i in range(n))
+
+
+@pytest.mark.parametrize("dlen", [1, NAEUSB_CTRL_IO_THRESHOLD - 1, NAEUSB_CTRL_IO_THRESHOLD, 5000])
+def test_cmd_read_mem_into(sim_naeusb, dlen):
+    # over the control and the bulk endpoints
+    usb, sim = sim_naeusb()
+    sim.mem.write(0x2000, pattern(dlen))
+    buf = bytearray(dlen)
+    assert usb.cmdReadMemInto(0x2000, buf) == dlen
+    assert buf == pattern(dlen)
+    assert buf == usb.cmdReadMem(0x2000, dlen)
+
+
+def test_cmd_read_mem_into_views(sim_naeusb):
+    usb, sim = sim_naeusb()
+    sim.mem.write(0x2000, pattern(100))
+    backing = bytearray(120)
+    assert usb.cmdReadMemInto(0x2000, memoryview(backing)[10:110]) == 100
+    assert backing[10:110] == pattern(100)
+    assert backing[:10] == bytes(10) and backing[110:] == bytes(10)
+
+    np = pytest.importorskip("numpy")
+    arr = np.zeros(25, dtype=np.uint32)
+    usb.cmdReadMemInto(0x2000, arr)
+    assert arr.tobytes() == pattern(100)
+
+
+def test_cmd_read_mem_into_bad_buffers(sim_naeusb):
+    usb, sim = sim_naeusb()
+    with pytest.raises(TypeError):
+        usb.cmdReadMemInto(0x2000, bytes(10))
+    with pytest.raises(TypeError):
+        usb.cmdReadMemInto(0x2000, memoryview(bytearray(20))[::2])
+
+
+def test_read_ctrl_into(sim_naeusb):
+    usb, sim = sim_naeusb()
+    usb.sendCtrl(0x60, 0, b"abcd")
+    buf = bytearray(4)
+    assert usb.readCtrlInto(0x60, 0, buf) == 4
+    assert buf == b"abcd"
+
+
+def test_usart_readinto(sim_naeusb):
+    usb, sim = sim_naeusb()
+    usart = USART(usb)
+    usart.init()
+    usart.write(b"hello world")
+    buf = bytearray(5)
+    assert usart.readinto(buf) == 5
+    assert buf == b"hello"
+    assert bytes(usart.read(6)) == b" world"
+    # only what's there
+    buf = bytearray(5)
+    assert usart.readinto(buf) == 0
+
+
+def test_spi_transfer_into(sim_naeusb):
+    # the simulated device reads back what was sent
+    usb, sim = sim_naeusb()
+    spi = SPI(usb)
+    data = list(pattern(150))
+    rx = bytearray(150)
+    assert spi.transfer_into(data, rx) == 150
+    assert list(rx) == spi.transfer(data)
+    with pytest.raises(ValueError):
+        spi.transfer_into(data, bytearray(10))
+    with pytest.raises(ValueError):
+        spi.transfer_into([], rx)
+
+
+def test_buffer_pool():
+    pool = BufferPool(max_free=2, max_size=1024)
+    buf = pool.acquire(100)
+    assert len(buf) == 128
+    pool.release(buf)
+    assert pool.acquire(70) is buf
+    assert pool.acquire(10) is not buf
+    assert len(pool.acquire(1)) == BufferPool.MIN_SIZE
+
+    # too big, or of an odd size, isn't kept
+    big = pool.acquire(2000)
+    pool.release(big)
+    assert pool.acquire(2000) is not big
+    odd = bytearray(100)
+    pool.release(odd)
+    assert pool.acquire(100) is not odd
+
+    # at most max_free per size
+    bufs = [pool.acquire(64) for _ in range(4)]
+    for b in bufs:
+        pool.release(b)
+    assert len(pool._free[64]) == 2
+
+
+def test_buffer_pool_buffer():
+    pool = BufferPool()
+    with pool.buffer(10) as view:
+        assert len(view) == 10
+        view[:] = b"0123456789"
+        buf = view.obj
+    assert pool.acquire(10) is buf
+
+    # not reused while something still has a view of it
+    with pool.buffer(10) as view:
+        kept = view[:5]
+        buf = view.obj
+    assert pool.acquire(10) is not buf
+    del kept
+
+
+def test_buffer_pool_threads():
+    pool = BufferPool()
+    def work():
+        for _ in range(1000):
+            with pool.buffer(32) as view:
+                view[0] = 1
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(pool._free[64]) <= pool.max_free
+
+
+def test_shared_pool():
+    assert isinstance(util.buffer_pool, BufferPool)
@@ -0,0 +1,309 @@
+import threading
+import time
+
+import pytest
+import usb1
+
+from chipwhisperer.hardware.naeusb.naeusb_sim import _default_stream_source
+
+HUSKY = 0xACE5
+PRO = 0xACE3
+SEGMENT = 1 << 14
+
+
+def husky_stream(usb, dlen, buf, **kwargs):
+    usb.initStreamModeCapture(dlen, buf, is_husky=True, segment_size=SEGMENT, **kwargs)
+    return usb.cmdReadStream(is_husky=True)
+
+
+@pytest.mark.parametrize("dlen", [SEGMENT, 5 * SEGMENT, 5 * SEGMENT + 100])
+@pytest.mark.parametrize("direct", [True, False])
+def test_husky_bytearray(sim_naeusb, dlen, direct):
+    usb, sim = sim_naeusb(pid=HUSKY)
+    buf = bytearray(dlen)
+    drx, timeout = husky_stream(usb, dlen, buf, direct=direct)
+    assert drx == dlen
+    assert not timeout
+    assert buf == _default_stream_source(0, dlen)
+    # no views of it left behind
+    buf.extend(b"\x00")
+
+
+def test_husky_numpy(sim_naeusb):
+    np = pytest.importorskip("numpy")
+    usb, sim = sim_naeusb(pid=HUSKY)
+    dlen = 3 * SEGMENT
+    buf = np.zeros(dlen, dtype=np.uint8)
+    husky_stream(usb, dlen, buf)
+    assert buf.tobytes() == _default_stream_source(0, dlen)
+
+
+def test_husky_memoryview(sim_naeusb):
+    usb, sim = sim_naeusb(pid=HUSKY)
+    dlen = 3 * SEGMENT
+    backing = bytearray(dlen + 10)
+    husky_stream(usb, dlen, memoryview(backing)[10:])
+    assert backing[10:] == _default_stream_source(0, dlen)
+    assert backing[:10] == bytes(10)
+
+
+def test_husky_small_buffer(sim_naeusb):
+    # grown as the data arrives, as it always was
+    usb, sim = sim_naeusb(pid=HUSKY)
+    dlen = 3 * SEGMENT
+    buf = bytearray()
+    husky_stream(usb, dlen, buf)
+    assert buf == _default_stream_source(0, dlen)
+
+
+def test_husky_repeated(sim_naeusb):
+    usb, sim = sim_naeusb(pid=HUSKY)
+    dlen = 4 * SEGMENT
+    for _ in range(3):
+        buf = bytearray(dlen)
+        assert husky_stream(usb, dlen, buf)[0] == dlen
+        assert buf == _default_stream_source(0, dlen)
+
+
+def test_pro(sim_naeusb):
+    usb, sim = sim_naeusb(pid=PRO)
+    dlen = 10000
+    nbytes = usb.cmdReadStream_bufferSize(dlen)
+    buf = bytearray(nbytes)
+    usb.initStreamModeCapture(dlen, buf, is_husky=False)
+    drx, timeout = usb.cmdReadStream(is_husky=False)
+    assert drx == nbytes
+    assert buf == _default_stream_source(0, nbytes)
+
+
+def track_stream_transfers(sim, limit=None):
+    """Records the stream transfers (bulk IN, SEGMENT bytes) submitted to the simulated
+    device, and the most that were in flight at once. With limit, submitting more than
+    that fails."""
+    ctx = sim._ctx
+    seen = []
+    in_flight = [0]
+    submit = ctx._submit
+    def is_stream(transfer):
+        # drain() reads with a transfer of its own, of another size
+        if getattr(transfer, '_control', None) is not None:
+            return False
+        return transfer._endpoint & 0x80 and len(transfer._buffer) == SEGMENT
+    def tracked(transfer):
+        if is_stream(transfer):
+            pending = len({t for t in ctx._pending if t._submitted and t is not transfer and is_stream(t)})
+            if limit is not None and pending >= limit:
+                raise usb1.USBErrorNoMem()
+            in_flight[0] = max(in_flight[0], pending + 1)
+            if transfer not in seen:
+                seen.append(transfer)
+        return submit(transfer)
+    ctx._submit = tracked
+    return seen, in_flight
+
+
+@pytest.mark.parametrize("depth", [1, 3, 16])
+def test_husky_transfer_ring(sim_naeusb, depth):
+    usb, sim = sim_naeusb(pid=HUSKY)
+    seen, in_flight = track_stream_transfers(sim)
+    dlen = 40 * SEGMENT + 7
+    buf = bytearray(dlen)
+    assert husky_stream(usb, dlen, buf, queue_depth=depth)[0] == dlen
+    assert buf == _default_stream_source(0, dlen)
+    assert len(seen) == depth
+    assert in_flight[0] == depth
+
+    # and the same transfers are used again
+    first = list(seen)
+    buf = bytearray(dlen)
+    husky_stream(usb, dlen, buf, queue_depth=depth)
+    assert buf == _default_stream_source(0, dlen)
+    assert seen == first
+
+
+def test_husky_default_depth(sim_naeusb):
+    usb, sim = sim_naeusb(pid=HUSKY)
+    seen, in_flight = track_stream_transfers(sim)
+    dlen = 2 * usb.stream_queue_depth * SEGMENT
+    husky_stream(usb, dlen, bytearray(dlen))
+    assert in_flight[0] == usb.stream_queue_depth
+
+
+def test_husky_shallower_queue(sim_naeusb):
+    # carries on with what could be submitted
+    usb, sim = sim_naeusb(pid=HUSKY)
+    seen, in_flight = track_stream_transfers(sim, limit=2)
+    dlen = 20 * SEGMENT
+    buf = bytearray(dlen)
+    assert husky_stream(usb, dlen, buf, queue_depth=8)[0] == dlen
+    assert buf == _default_stream_source(0, dlen)
+    assert in_flight[0] == 2
+
+
+def test_chunks_husky(sim_naeusb):
+    usb, sim = sim_naeusb(pid=HUSKY)
+    dlen = 10 * SEGMENT + 123
+    with usb.stream_chunks(dlen, chunk_size=4 * SEGMENT) as chunks:
+        data = list(chunks)
+    assert all(isinstance(c, memoryview) and len(c) <= 4 * SEGMENT for c in data)
+    assert b"".join(data) == _default_stream_source(0, dlen)
+    assert chunks.drx == dlen
+    assert chunks.overflow is None
+
+
+def test_chunks_pro(sim_naeusb):
+    usb, sim = sim_naeusb(pid=PRO)
+    dlen = 20000
+    nbytes = usb.cmdReadStream_bufferSize(dlen)
+    with usb.stream_chunks(dlen, chunk_size=4096, is_husky=False) as chunks:
+        data = b"".join(chunks)
+    assert data == _default_stream_source(0, nbytes)
+    assert chunks.drx == nbytes
+
+
+def test_chunks_pro_needs_length(sim_naeusb):
+    usb, sim = sim_naeusb(pid=PRO)
+    with pytest.raises(ValueError):
+        usb.stream_chunks(None, is_husky=False)
+
+
+def test_chunks_backpressure(sim_naeusb):
+    # a consumer that falls behind leaves the rest of the data on the device
+    usb, sim = sim_naeusb(pid=HUSKY)
+    dlen = 64 * SEGMENT
+    with usb.stream_chunks(dlen, chunk_size=SEGMENT, max_queued=4) as chunks:
+        it = iter(chunks)
+        received = [next(it)]
+        time.sleep(0.2)
+        assert chunks.drx <= 5 * SEGMENT
+        assert sim._stream_offset <= 5 * SEGMENT
+        received.extend(it)
+    assert b"".join(received) == _default_stream_source(0, dlen)
+
+
+def test_chunks_close_early(sim_naeusb):
+    usb, sim = sim_naeusb(pid=HUSKY)
+    with usb.stream_chunks(None, chunk_size=SEGMENT) as chunks:
+        received = [c for c, _ in zip(chunks, range(5))]
+    assert not chunks.is_alive()
+    assert list(chunks) == []
+    assert b"".join(received) == _default_stream_source(0, 5 * SEGMENT)
+
+    # the device can be used again
+    dlen = 3 * SEGMENT
+    buf = bytearray(dlen)
+    assert husky_stream(usb, dlen, buf)[0] == dlen
+    assert buf == _default_stream_source(0, dlen)
+
+
+def test_chunks_closed_by_next_capture(sim_naeusb):
+    usb, sim = sim_naeusb(pid=HUSKY)
+    chunks = usb.stream_chunks(None, chunk_size=SEGMENT)
+    next(chunks)
+    dlen = 3 * SEGMENT
+    buf = bytearray(dlen)
+    assert husky_stream(usb, dlen, buf)[0] == dlen
+    assert not chunks.is_alive()
+    assert buf == _default_stream_source(0, dlen)
+
+
+def test_chunks_unlimited_ends_when_quiet(sim_naeusb):
+    usb, sim = sim_naeusb(pid=HUSKY)
+    with usb.stream_chunks(None, chunk_size=SEGMENT, timeout_ms=50) as chunks:
+        received = 0
+        for c in chunks:
+            received += len(c)
+            if received == 3 * SEGMENT:
+                # the capture stops
+                sim._stream_left = 0
+    assert received >= 3 * SEGMENT
+    assert chunks.overflow is None
+
+
+def test_stream_worker(sim_naeusb):
+    usb, sim = sim_naeusb(pid=HUSKY)
+    dlen = 3 * SEGMENT
+    husky_stream(usb, dlen, bytearray(dlen))
+    worker = usb._stream_worker_thread
+    threads = threading.active_count()
+    for _ in range(5):
+        buf = bytearray(dlen)
+        husky_stream(usb, dlen, buf)
+        assert buf == _default_stream_source(0, dlen)
+    assert usb._stream_worker_thread is worker
+    assert worker.is_alive()
+    assert threading.active_count() == threads
+
+    usb.close()
+    assert not worker.is_alive()
+
+
+def test_stream_job_once(sim_naeusb):
+    usb, sim = sim_naeusb(pid=HUSKY)
+    dlen = SEGMENT
+    husky_stream(usb, dlen, bytearray(dlen))
+    job = usb.streamModeCaptureStream
+    assert not job.is_alive()
+    with pytest.raises(RuntimeError):
+        job.start()
+
+
+def test_stream_failure(sim_naeusb):
+    # a read only buffer can't take the data, which fails in the transfer callback
+    usb, sim = sim_naeusb(pid=HUSKY)
+    dlen = 3 * SEGMENT
+    with pytest.raises(TypeError):
+        husky_stream(usb, dlen, bytes(dlen), queue_depth=3)
+
+    # the worker carries on with the next capture
+    buf = bytearray(dlen)
+    assert husky_stream(usb, dlen, buf, queue_depth=3)[0] == dlen
+    assert buf == _default_stream_source(0, dlen)
+
+
+def test_drain(sim_naeusb):
+    usb, sim = sim_naeusb(pid=HUSKY)
+    backend = usb.usbtx
+    sim._bulk_in += bytes(10000)
+    assert backend.drain() == 10000
+    assert not sim.bulk_in_waiting()
+    assert backend.drain() == 0
+    assert backend.drained_bytes == 10000
+
+
+def test_drain_max_bytes(sim_naeusb):
+    usb, sim = sim_naeusb(pid=HUSKY)
+    backend = usb.usbtx
+    sim._bulk_in += bytes(5 * backend.DRAIN_CHUNK_SIZE)
+    assert backend.drain(max_bytes=2 * backend.DRAIN_CHUNK_SIZE) == 2 * backend.DRAIN_CHUNK_SIZE
+    assert len(sim._bulk_in) == 3 * backend.DRAIN_CHUNK_SIZE
+
+
+def test_drain_empty(sim_naeusb):
+    # one read, costing no more than its timeout
+    usb, sim = sim_naeusb(pid=HUSKY)
+    sim.link.reset_stats()
+    assert usb.usbtx.drain(timeout=2) == 0
+    assert sim.link.stats['bulk_in'] == 1
+    assert sim.link.stats['usb_time'] <= 0.002 + 1e-6
+
+
+def test_flush_input(sim_naeusb):
+    usb, sim = sim_naeusb(pid=HUSKY)
+    sim._bulk_in += bytes(3000)
+    usb.flushInput()
+    assert not sim.bulk_in_waiting()
+
+
+def test_stream_drained_bytes(sim_naeusb):
+    # whatever the device sends past the capture is thrown away
+    usb, sim = sim_naeusb(pid=HUSKY)
+    dlen = 2 * SEGMENT
+    buf = bytearray(dlen)
+    usb.initStreamModeCapture(dlen, buf, is_husky=True, segment_size=SEGMENT)
+    usb.streamModeCaptureStream.join()
+    sim._bulk_in += bytes(100)
+    assert usb.cmdReadStream(is_husky=True)[0] == dlen
+    assert usb.stream_drained_bytes == 100
+    assert not sim.bulk_in_waiting()
+    assert buf == _default_stream_source(0, dlen)
@@ -0,0 +1,114 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from chipwhisperer.hardware.naeusb import stream_decode
+from chipwhisperer.hardware.naeusb.stream_decode import (ProStreamDecoder, decode_pro_stream,
+                                                         encode_pro_stream, STREAM_BLOCK_SIZE)
+
+PRO = 0xACE3
+
+
+def reference_decode(buf, dlen, block_size=STREAM_BLOCK_SIZE):
+    # byte at a time: drop each block's sync byte, then three samples per big endian word
+    payload = bytearray(b for i, b in enumerate(buf) if i % block_size)
+    samples = []
+    for i in range(0, len(payload) - 3, 4):
+        word = int.from_bytes(payload[i:i + 4], "big")
+        samples += [(word >> 20) & 0x3FF, (word >> 10) & 0x3FF, word & 0x3FF]
+    return samples[:dlen]
+
+
+@pytest.fixture
+def samples():
+    return np.random.RandomState(0).randint(0, 1024, size=10000).astype(np.uint16)
+
+
+def test_round_trip(samples):
+    buf = encode_pro_stream(samples)
+    assert len(buf) % STREAM_BLOCK_SIZE == 0
+    assert buf[::STREAM_BLOCK_SIZE] == bytes([0xAC]) * (len(buf) // STREAM_BLOCK_SIZE)
+    out = decode_pro_stream(buf, len(samples))
+    assert out.dtype == np.uint16
+    assert np.array_equal(out, samples)
+    assert list(out) == reference_decode(buf, len(samples))
+
+
+@pytest.mark.parametrize("n", [1, 2, 3, 4, 3 * 1023, 3 * 1024 + 1])
+def test_lengths(n):
+    samples = np.arange(n) % 1024
+    assert np.array_equal(decode_pro_stream(encode_pro_stream(samples), n), samples)
+
+
+def test_float(samples):
+    out = decode_pro_stream(encode_pro_stream(samples), len(samples), dtype=np.float32)
+    assert out.dtype == np.float32
+    assert np.allclose(out, samples / 1024.0 - 0.5)
+    assert out.min() >= -0.5 and out.max() < 0.5
+
+
+@pytest.mark.parametrize("chunk", [1, 7, 4095, 4096, 4097, 10000])
+def test_chunked(samples, chunk):
+    buf = bytes(encode_pro_stream(samples))
+    decoder = ProStreamDecoder(len(samples))
+    parts = [decoder.feed(buf[i:i + chunk]) for i in range(0, len(buf), chunk)]
+    assert np.array_equal(np.concatenate(parts), samples)
+    assert decoder.done
+    assert decoder.samples == len(samples)
+    assert decoder.offset == len(buf)
+    assert decoder.sync_errors == []
+
+
+def test_without_dlen(samples):
+    # every complete word, padding included
+    buf = encode_pro_stream(samples)
+    out = decode_pro_stream(buf)
+    assert np.array_equal(out[:len(samples)], samples)
+    assert not out[len(samples):].any()
+
+
+def test_reset(samples):
+    buf = bytes(encode_pro_stream(samples))
+    decoder = ProStreamDecoder(len(samples))
+    decoder.feed(buf[:5000])
+    decoder.reset()
+    assert np.array_equal(decoder.feed(buf), samples)
+
+
+def test_bad_sync(samples, caplog):
+    buf = encode_pro_stream(samples)
+    buf[STREAM_BLOCK_SIZE] = 0x00
+    decoder = ProStreamDecoder(len(samples))
+    out = decoder.feed(buf)
+    assert decoder.sync_errors == [STREAM_BLOCK_SIZE]
+    assert "sync byte" in caplog.text
+    # the sync byte is still dropped
+    assert np.array_equal(out, samples)
+
+    with pytest.raises(IOError):
+        decode_pro_stream(buf, len(samples), strict=True)
+    assert np.array_equal(decode_pro_stream(buf, len(samples), sync=None, strict=True), samples)
+
+
+def test_bad_dtype():
+    with pytest.raises(ValueError):
+        ProStreamDecoder(dtype=np.complex64)
+
+
+def test_without_numpy(monkeypatch):
+    monkeypatch.setattr(stream_decode, "np", None)
+    with pytest.raises(ImportError):
+        ProStreamDecoder()
+    with pytest.raises(ImportError):
+        encode_pro_stream([1, 2, 3])
+
+
+def test_stream_chunks(sim_naeusb, samples):
+    buf = bytes(encode_pro_stream(samples))
+    def source(offset, dlen):
+        return buf[offset:offset + dlen].ljust(dlen, b"\x00")
+    usb, sim = sim_naeusb(pid=PRO, stream_source=source)
+    decoder = ProStreamDecoder(len(samples))
+    with usb.stream_chunks(len(samples), chunk_size=1000, is_husky=False) as chunks:
+        out = np.concatenate([decoder.feed(c) for c in chunks])
+    assert np.array_equal(out, samples)
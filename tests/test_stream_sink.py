@@ -0,0 +1,99 @@
+import json
+import os
+
+import pytest
+
+from chipwhisperer.hardware.naeusb import stream_sink
+from chipwhisperer.hardware.naeusb.naeusb_sim import _default_stream_source
+from chipwhisperer.hardware.naeusb.stream_sink import StreamFileSink, load_stream_file
+
+HUSKY = 0xACE5
+PRO = 0xACE3
+SEGMENT = 1 << 14
+
+
+def sidecar(path):
+    with open(str(path) + ".json") as f:
+        return json.load(f)
+
+
+def test_stream_to_file_husky(sim_naeusb, tmp_path):
+    usb, sim = sim_naeusb(pid=HUSKY)
+    path = str(tmp_path / "trace.bin")
+    dlen = 5 * SEGMENT + 100
+    drx, timeout = usb.stream_to_file(path, dlen, is_husky=True, segment_size=SEGMENT)
+    assert drx == dlen
+    assert not timeout
+    with open(path, "rb") as f:
+        assert f.read() == _default_stream_source(0, dlen)
+    meta = sidecar(path)
+    assert meta["data_file"] == "trace.bin"
+    assert meta["file_bytes"] == dlen
+    assert meta["bytes_received"] == dlen
+    assert meta["dlen"] == dlen
+    assert meta["is_husky"] is True
+    assert meta["overflow_location"] == 0
+    assert meta["unknown_overflow"] is False
+
+
+def test_stream_to_file_pro(sim_naeusb, tmp_path):
+    usb, sim = sim_naeusb(pid=PRO)
+    path = str(tmp_path / "trace.bin")
+    dlen = 20000
+    nbytes = usb.cmdReadStream_bufferSize(dlen)
+    drx, timeout = usb.stream_to_file(path, dlen)
+    assert drx == nbytes
+    with open(path, "rb") as f:
+        assert f.read() == _default_stream_source(0, nbytes)
+    assert sidecar(path)["bytes_received"] == nbytes
+
+
+def test_sink(tmp_path):
+    path = str(tmp_path / "trace.bin")
+    with StreamFileSink(path, 1000) as sink:
+        assert os.path.getsize(path) == 1000
+        sink.buffer[:4] = b"abcd"
+        meta = sink.finish(4, (0, 0, 0), note="hello")
+    assert meta["note"] == "hello"
+    assert sidecar(path) == meta
+    assert sink.buffer is None
+
+    # only what was received is read back
+    data, meta = load_stream_file(path)
+    assert bytes(data) == b"abcd"
+    assert meta["note"] == "hello"
+
+
+def test_sink_array(tmp_path):
+    np = pytest.importorskip("numpy")
+    with StreamFileSink(str(tmp_path / "trace.bin"), 16) as sink:
+        arr = sink.array
+        sink.buffer[0] = 7
+        assert arr.dtype == np.uint8
+        assert arr[0] == 7
+        del arr
+
+
+def test_sink_size(tmp_path):
+    with pytest.raises(ValueError):
+        StreamFileSink(str(tmp_path / "trace.bin"), 0)
+
+
+def test_load_without_sidecar(tmp_path):
+    path = tmp_path / "trace.bin"
+    path.write_bytes(b"0123456789")
+    data, meta = load_stream_file(str(path))
+    assert bytes(data) == b"0123456789"
+    assert meta == {}
+
+
+def test_load_without_numpy(tmp_path, monkeypatch):
+    monkeypatch.setattr(stream_sink, "np", None)
+    path = str(tmp_path / "trace.bin")
+    with StreamFileSink(path, 100) as sink:
+        sink.buffer[:3] = b"xyz"
+        sink.finish(3)
+        with pytest.raises(ImportError):
+            sink.array
+    data, meta = load_stream_file(path)
+    assert data == b"xyz"
@@ -0,0 +1,113 @@
+import time
+
+import pytest
+
+from chipwhisperer.hardware.naeusb.naeusb import (NAEUSB_CTRL_IO_THRESHOLD, NAEUSB_CTRL_READ_MAX,
+                                                  NAEUSB_CTRL_WRITE_MAX, default_threshold_cache)
+
+
+def endpoints(sim, access):
+    """(control, bulk) transfers the data of access() took"""
+    sim.link.reset_stats()
+    access()
+    stats = sim.link.stats
+    return stats['ctrl_in'], stats['bulk_in'] + stats['bulk_out']
+
+
+def test_defaults(sim_naeusb):
+    usb, sim = sim_naeusb()
+    backend = usb.usbtx
+    assert backend.read_threshold == NAEUSB_CTRL_IO_THRESHOLD
+    assert backend.write_threshold == NAEUSB_CTRL_IO_THRESHOLD
+    assert endpoints(sim, lambda: usb.cmdReadMem(0, NAEUSB_CTRL_IO_THRESHOLD - 1)) == (1, 0)
+    assert endpoints(sim, lambda: usb.cmdReadMem(0, NAEUSB_CTRL_IO_THRESHOLD)) == (0, 1)
+
+
+def test_set_thresholds(sim_naeusb):
+    usb, sim = sim_naeusb()
+    usb.set_transfer_thresholds(read=16)
+    assert usb.usbtx.write_threshold == NAEUSB_CTRL_IO_THRESHOLD
+    assert endpoints(sim, lambda: usb.cmdReadMem(0, 15)) == (1, 0)
+    assert endpoints(sim, lambda: usb.cmdReadMem(0, 16)) == (0, 1)
+    usb.set_transfer_thresholds(write=8)
+    assert usb.usbtx.read_threshold == 16
+    assert endpoints(sim, lambda: usb.cmdWriteMem(0, bytes(8)))[1] == 1
+    assert sim.mem.read(0, 8) == bytes(8)
+
+
+def test_set_thresholds_clamped(sim_naeusb):
+    # to what fits in a control transfer
+    usb, sim = sim_naeusb()
+    usb.set_transfer_thresholds(1000, 1000)
+    assert usb.usbtx.read_threshold == NAEUSB_CTRL_READ_MAX + 1
+    assert usb.usbtx.write_threshold == NAEUSB_CTRL_WRITE_MAX + 1
+    data = bytes(range(NAEUSB_CTRL_WRITE_MAX))
+    usb.cmdWriteMem(0, data)
+    assert usb.cmdReadMem(0, len(data)) == data
+    usb.set_transfer_thresholds(0, -5)
+    assert usb.usbtx.read_threshold == 1
+    assert usb.usbtx.write_threshold == 1
+
+
+@pytest.fixture
+def slow_ctrl(monkeypatch):
+    """Function making a backend's control reads take 10 us a byte, and bulk reads 400 us"""
+    def patch(backend):
+        monkeypatch.setattr(backend, "_cmd_readmem_ctrl", lambda addr, n: time.sleep(n * 1E-5))
+        monkeypatch.setattr(backend, "_cmd_readmem_bulk", lambda addr, n: time.sleep(4E-4))
+    return patch
+
+
+def test_calibrate(sim_naeusb, slow_ctrl):
+    usb, sim = sim_naeusb()
+    slow_ctrl(usb.usbtx)
+    result = usb.calibrate_transfer_thresholds(0, sizes=[8, 16, 64, 120], repeats=5)
+    assert result == {"read": 64, "write": NAEUSB_CTRL_IO_THRESHOLD}
+    assert usb.usbtx.read_threshold == 64
+    entry = default_threshold_cache().get(usb.snum)
+    assert entry["read"] == 64 and entry["pid"] == 0xACE2
+
+    # used again when the board connects
+    usb2, sim2 = sim_naeusb()
+    assert usb2.usbtx.read_threshold == 64
+    # but not by another kind of board with the same serial number
+    usb3, sim3 = sim_naeusb(pid=0xACE5)
+    assert usb3.usbtx.read_threshold == NAEUSB_CTRL_IO_THRESHOLD
+
+
+def test_calibrate_never_faster(sim_naeusb, monkeypatch):
+    usb, sim = sim_naeusb()
+    monkeypatch.setattr(usb.usbtx, "_cmd_readmem_bulk", lambda addr, n: time.sleep(1E-3))
+    result = usb.calibrate_transfer_thresholds(0, sizes=[8, 16], repeats=3, save=False)
+    assert result["read"] == 17
+    assert default_threshold_cache().get(usb.snum) is None
+
+
+def test_calibrate_writes(sim_naeusb):
+    # leave the scratch area as it was
+    usb, sim = sim_naeusb()
+    data = bytes(range(NAEUSB_CTRL_WRITE_MAX))
+    sim.mem.write(0x100, data)
+    result = usb.calibrate_transfer_thresholds(0x100, write=True, repeats=3)
+    assert 1 <= result["read"] <= NAEUSB_CTRL_READ_MAX + 1
+    assert 1 <= result["write"] <= NAEUSB_CTRL_WRITE_MAX + 1
+    assert sim.mem.read(0x100, len(data)) == data
+
+
+def test_calibrate_sizes(sim_naeusb):
+    usb, sim = sim_naeusb()
+    for sizes in ([], [0, 8], [8, NAEUSB_CTRL_WRITE_MAX + 1]):
+        with pytest.raises(ValueError):
+            usb.calibrate_transfer_thresholds(0, sizes=sizes)
+
+
+def test_unusable_cache_dir(sim_naeusb, tmp_path, monkeypatch, slow_ctrl):
+    path = tmp_path / "file"
+    path.write_text("")
+    monkeypatch.setenv("CW_CACHE_DIR", str(path))
+    usb, sim = sim_naeusb()
+    assert usb.usbtx.read_threshold == NAEUSB_CTRL_IO_THRESHOLD
+    slow_ctrl(usb.usbtx)
+    result = usb.calibrate_transfer_thresholds(0, sizes=[8, 16, 64, 120], repeats=5)
+    assert result["read"] == 64
+    assert usb.usbtx.read_threshold == 64
@@ -0,0 +1,129 @@
+import threading
+import time
+
+import pytest
+
+from chipwhisperer.hardware.naeusb.naeusb import NAEUSB
+from chipwhisperer.hardware.naeusb.naeusb_sim import (NAEUSB_SimBackend, SimNAEUSBDevice, SimUSBContext,
+                                                      _default_stream_source)
+from chipwhisperer.hardware.naeusb.usb_context import SharedUSBContext, shared_usb_context
+
+HUSKY = 0xACE5
+SEGMENT = 1 << 14
+
+
+class SharedSimBackend(NAEUSB_SimBackend):
+    """Simulated backend using a SharedUSBContext, and so its event thread, like the real one"""
+    def __init__(self, shared, devices):
+        self._shared = shared
+        super().__init__(devices=devices)
+
+    def _open_context(self):
+        self._events = self._shared
+        return self._shared.context
+
+
+@pytest.fixture
+def shared():
+    """A SharedUSBContext over simulated devices, function taking the devices' serial
+    numbers and returning a connected NAEUSB for each"""
+    context = SharedUSBContext()
+    context.EVENT_TIMEOUT = 0.001
+    opened = []
+
+    def connect(*serial_numbers):
+        devices = [SimNAEUSBDevice(pid=HUSKY, serial_number=sn, address=i + 1)
+                   for i, sn in enumerate(serial_numbers)]
+        context._ctx = SimUSBContext(devices)
+        usbs = []
+        for sn in serial_numbers:
+            usb = NAEUSB(backend=SharedSimBackend(context, devices))
+            usb.con(idProduct=[HUSKY], serial_number=sn)
+            opened.append(usb)
+            usbs.append(usb)
+        return usbs
+
+    context.connect = connect
+    yield context
+    for usb in opened:
+        usb.close()
+
+
+def husky_stream(usb, dlen):
+    buf = bytearray(dlen)
+    usb.initStreamModeCapture(dlen, buf, is_husky=True, segment_size=SEGMENT)
+    assert usb.cmdReadStream(is_husky=True)[0] == dlen
+    return buf
+
+
+def test_event_thread(shared):
+    usb, = shared.connect("SIM0")
+    assert shared.event_thread_running
+    for i in range(20):
+        usb.sendCtrlAsync(0x60, i, bytes([i]))
+    futures = [usb.readCtrlAsync(0x60, i, 1) for i in range(20)]
+    assert [f.result() for f in futures] == [bytearray([i]) for i in range(20)]
+    assert husky_stream(usb, 5 * SEGMENT) == _default_stream_source(0, 5 * SEGMENT)
+    usb.write_many([(i, bytes([i])) for i in range(10)])
+    assert usb.cmdReadMem(0, 10) == bytes(range(10))
+
+    thread = shared._thread
+    usb.close()
+    assert not shared.event_thread_running
+    assert not thread.is_alive()
+
+
+def test_devices_share_event_thread(shared):
+    usb0, usb1 = shared.connect("SIM0", "SIM1")
+    thread = shared._thread
+    assert [t.name for t in threading.enumerate()].count("libusb events") == 1
+
+    errors = []
+    def writes(usb, value):
+        try:
+            for _ in range(20):
+                usb.write_many([(i, bytes([value])) for i in range(8)])
+        except Exception as e:
+            errors.append(e)
+    workers = [threading.Thread(target=writes, args=(usb0, 1))]
+    for t in workers:
+        t.start()
+    buf = husky_stream(usb1, 20 * SEGMENT)
+    for t in workers:
+        t.join()
+    assert errors == []
+    assert buf == _default_stream_source(0, 20 * SEGMENT)
+    assert usb0.usbtx.sim.mem.read(0, 8) == bytes([1]) * 8
+    assert usb1.usbtx.sim.mem.read(0, 8) == bytes(8)
+
+    # runs until the last device closes
+    usb0.close()
+    assert shared._thread is thread and thread.is_alive()
+    usb1.close()
+    assert not thread.is_alive()
+
+
+def test_without_event_thread(shared):
+    shared.use_event_thread = False
+    usb, = shared.connect("SIM0")
+    assert not shared.event_thread_running
+    assert husky_stream(usb, 3 * SEGMENT) == _default_stream_source(0, 3 * SEGMENT)
+    usb.sendCtrlAsync(0x60, 0, b"\x05")
+    future = usb.readCtrlAsync(0x60, 0, 1)
+    usb.flush()
+    assert future.done() and future.result() == bytearray(b"\x05")
+
+
+def test_handle_events_missed_pass(shared):
+    # a pass that happened since the caller looked isn't waited for again
+    usb, = shared.connect("SIM0")
+    since = shared.generation
+    while shared.generation == since:
+        time.sleep(0.001)
+    start = time.perf_counter()
+    shared.handle_events(5.0, since)
+    assert time.perf_counter() - start < 1.0
+
+
+def test_shared_usb_context():
+    assert shared_usb_context() is shared_usb_context()
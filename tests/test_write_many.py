@@ -0,0 +1,92 @@
+import pytest
+import usb1
+
+from chipwhisperer.hardware.naeusb.naeusb import NAEUSB_Backend, NAEUSB_CTRL_IO_THRESHOLD
+
+
+def log_writes(sim):
+    """(addr, data) of every write to the simulated memory, in order"""
+    log = []
+    write = sim.mem.write
+    def logged(addr, data):
+        log.append((addr, bytes(data)))
+        return write(addr, data)
+    sim.mem.write = logged
+    return log
+
+
+def count_async_ctrl(sim):
+    """Number of control transfers submitted asynchronously"""
+    count = [0]
+    ctx = sim._ctx
+    submit = ctx._submit
+    def counted(transfer):
+        if transfer._control is not None:
+            count[0] += 1
+        return submit(transfer)
+    ctx._submit = counted
+    return count
+
+
+def stall_writes(sim, stalls, error=usb1.USBErrorPipe):
+    """Makes the given (0 based) memory control writes raise error, once each"""
+    n = [0]
+    ctrl_write = sim.ctrl_write
+    def stalling(cmd, value, data):
+        if cmd == NAEUSB_Backend.CMD_WRITEMEM_CTRL:
+            n[0] += 1
+            if n[0] - 1 in stalls:
+                raise error()
+        return ctrl_write(cmd, value, data)
+    sim.ctrl_write = stalling
+
+
+def test_write_many(sim_naeusb):
+    usb, sim = sim_naeusb()
+    # small writes, and ones big enough for the bulk endpoint in between
+    writes = [(0x100 * i, bytes([i]) * (NAEUSB_CTRL_IO_THRESHOLD + 10 if i % 5 == 3 else 4)) for i in range(20)]
+    log = log_writes(sim)
+    usb.write_many(writes)
+    assert log == writes
+    for addr, data in writes:
+        assert sim.mem.read(addr, len(data)) == data
+
+
+def test_write_many_same_address(sim_naeusb):
+    usb, sim = sim_naeusb()
+    usb.write_many([(0x40, bytes([i])) for i in range(32)])
+    assert sim.mem.read(0x40, 1) == bytes([31])
+
+
+def test_write_many_short_runs(sim_naeusb):
+    usb, sim = sim_naeusb()
+    count = count_async_ctrl(sim)
+    n = usb.usbtx.WRITE_MANY_MIN_BATCH
+    usb.write_many([(i, b"\x01") for i in range(n - 1)])
+    assert count[0] == 0
+    usb.write_many([(i, b"\x02") for i in range(n)])
+    assert count[0] == n
+    assert sim.mem.read(0, n) == b"\x02" * n
+
+
+def test_write_many_stall(sim_naeusb):
+    # the stalled write and everything queued after it are sent again, in order
+    usb, sim = sim_naeusb()
+    stall_writes(sim, {2})
+    log = log_writes(sim)
+    writes = [(0x40, bytes([i])) for i in range(8)]
+    usb.write_many(writes)
+    assert sim.mem.read(0x40, 1) == bytes([7])
+    assert log[:2] == writes[:2]
+    assert log[-6:] == writes[2:]
+
+
+def test_write_many_error(sim_naeusb):
+    usb, sim = sim_naeusb()
+    stall_writes(sim, {1}, usb1.USBErrorIO)
+    with pytest.raises(usb1.USBErrorIO):
+        usb.write_many([(i, b"\x01") for i in range(8)])
+
+    # nothing is left behind to fail the next transfer
+    usb.cmdWriteMem(0x10, b"\x05")
+    assert usb.cmdReadMem(0x10, 1) == bytearray(b"\x05")